@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Benchmark per-row decode cost of full Card models versus projected slim rows.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and times fetching and decoding search-result pages
+three ways: ``SELECT *`` into a full ``Card`` (the old path), the
+``CardSummaryRow`` projection, and the projection converted to the
+``CardSummary`` response the search tool returns. Also times printings lists
+(``Card`` versus ``PrintingRow``).
+
+Usage:
+    uv run python benchmarks/bench_card_rows.py [--cards 20000] [--runs 5] [--seed 0]
+        [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import CardSummaryRow, PrintingRow, UnifiedDatabase, select_columns
+from mtg_core.tools.cards import _card_to_summary
+
+
+def _time(
+    conn: sqlite3.Connection, query: str, decode: Callable[[Any], object], runs: int
+) -> tuple[float, int]:
+    """Median microseconds per row for fetching and decoding ``query``."""
+    samples = []
+    rows = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        decoded = [decode(row) for row in conn.execute(query)]
+        samples.append(time.perf_counter() - start)
+        rows = len(decoded)
+    return statistics.median(samples) / max(rows, 1) * 1e6, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.cards, args.seed)
+
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        db = UnifiedDatabase(cast(Any, None))
+        limit = f"LIMIT {args.cards}"
+
+        full, rows = _time(conn, f"SELECT * FROM cards {limit}", db._row_to_card, args.runs)
+        summary_query = f"SELECT {select_columns(CardSummaryRow)} FROM cards {limit}"
+        slim, _ = _time(conn, summary_query, CardSummaryRow._make, args.runs)
+        slim_summary, _ = _time(
+            conn, summary_query, lambda r: _card_to_summary(CardSummaryRow._make(r)), args.runs
+        )
+        full_summary, _ = _time(
+            conn,
+            f"SELECT * FROM cards {limit}",
+            lambda r: _card_to_summary(db._row_to_card(r)),
+            args.runs,
+        )
+        printing_query = f"SELECT {select_columns(PrintingRow)} FROM cards {limit}"
+        printing, _ = _time(conn, printing_query, PrintingRow._make, args.runs)
+        conn.close()
+
+    print(f"rows decoded             {rows:>10,}")
+    print(f"SELECT * -> Card         {full:10.2f} us/row")
+    print(f"summary row              {slim:10.2f} us/row  ({full / slim:5.1f}x)")
+    print(f"printing row             {printing:10.2f} us/row  ({full / printing:5.1f}x)")
+    print(f"Card -> CardSummary      {full_summary:10.2f} us/row")
+    print(
+        f"row  -> CardSummary      {slim_summary:10.2f} us/row  "
+        f"({full_summary / slim_summary:5.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
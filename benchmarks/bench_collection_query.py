@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""Benchmark the collection list: full load plus Python filtering versus one SQL window.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and a temporary user database holding
+``--collection`` cards, then times showing a filtered, sorted list two ways:
+CollectionManager.get_collection() for every card followed by filtering and
+sorting in Python, as the collection screen did on open and on every filter
+change, and CollectionManager.query_collection() for the first window of the
+list, filtered and sorted in SQL.
+
+Usage:
+    uv run python benchmarks/bench_collection_query.py [--collection 10000] [--runs 10]
+        [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import (
+    CollectionFilter,
+    UnifiedDatabase,
+    UserDatabase,
+)
+from mtg_core.data.database.cache import CardCache
+from mtg_spellbook.collection_manager import CollectionManager
+
+
+async def _run(path: Path, user_path: Path, size: int, runs: int) -> tuple[list[float], ...]:
+    filters = CollectionFilter(card_type="instant", color="R")
+
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute("SELECT name FROM oracle_cards LIMIT ?", (size,)) as cursor:
+            names = [row[0] async for row in cursor]
+
+        user = UserDatabase(user_path)
+        await user.connect()
+        await user.attach_card_database(path)
+        try:
+            await user.conn.executemany(
+                "INSERT INTO collection_cards (card_name, quantity) VALUES (?, ?)",
+                [(name, 1 + i % 4) for i, name in enumerate(names)],
+            )
+            await user.conn.commit()
+
+            # Fresh cache per run so both paths pay for their card lookups
+            full_times = []
+            for _ in range(runs):
+                manager = CollectionManager(user, UnifiedDatabase(conn, cache=CardCache()))
+                start = time.perf_counter()
+                cards, _ = await manager.get_collection(page_size=len(names))
+                shown = [
+                    c
+                    for c in cards
+                    if c.card is not None
+                    and "instant" in (c.card.type or "").lower()
+                    and "R" in (c.card.colors or [])
+                ]
+                shown.sort(key=lambda c: c.card_name.lower())
+                full_times.append(time.perf_counter() - start)
+
+            window_times = []
+            for _ in range(runs):
+                manager = CollectionManager(user, UnifiedDatabase(conn, cache=CardCache()))
+                start = time.perf_counter()
+                await manager.count_collection(filters)
+                await manager.query_collection(filters, "name", limit=100)
+                window_times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return full_times, window_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collection", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.collection, args.seed)
+        full_times, window_times = asyncio.run(
+            _run(path, Path(tmp) / "user.sqlite", args.collection, args.runs)
+        )
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"collection         {args.collection:>8} cards, {args.runs} runs")
+    print(f"full load + filter {ms(full_times)}")
+    print(f"SQL window         {ms(window_times)}")
+
+
+if __name__ == "__main__":
+    main()
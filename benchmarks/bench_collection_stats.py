@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Benchmark collection stats after an edit: full rebuild versus write-through update.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and a temporary user database holding
+``--collection`` cards, then times quantity edits two ways: the edit followed
+by a full CollectionStatsIndex.reload(), the pass over every card the
+collection screen made after each change, and the edit alone, which
+CollectionManager writes through to the loaded index.
+
+Usage:
+    uv run python benchmarks/bench_collection_stats.py [--collection 10000] [--edits 50]
+        [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase, UserDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_spellbook.collection_manager import CollectionManager
+
+
+async def _run(path: Path, user_path: Path, size: int, edits: int) -> tuple[list[float], ...]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute("SELECT name FROM oracle_cards LIMIT ?", (size,)) as cursor:
+            names = [row[0] async for row in cursor]
+
+        user = UserDatabase(user_path)
+        await user.connect()
+        try:
+            await user.conn.executemany(
+                "INSERT INTO collection_cards (card_name, quantity) VALUES (?, ?)",
+                [(name, 1 + i % 4) for i, name in enumerate(names)],
+            )
+            await user.conn.commit()
+            manager = CollectionManager(user, UnifiedDatabase(conn, cache=CardCache()))
+            await manager.stats.ensure_loaded()
+
+            rebuild_times = []
+            for i in range(edits):
+                start = time.perf_counter()
+                await manager.set_quantity(names[i % len(names)], 1 + i % 4)
+                await manager.stats.reload()
+                rebuild_times.append(time.perf_counter() - start)
+
+            write_through_times = []
+            for i in range(edits):
+                start = time.perf_counter()
+                await manager.set_quantity(names[i % len(names)], 1 + i % 4)
+                write_through_times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return rebuild_times, write_through_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collection", type=int, default=10000)
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.collection, args.seed)
+        rebuild_times, write_through_times = asyncio.run(
+            _run(path, Path(tmp) / "user.sqlite", args.collection, args.edits)
+        )
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"collection         {args.collection:>8} cards, {args.edits} edits")
+    print(f"edit + rebuild     {ms(rebuild_times)}")
+    print(f"edit write-through {ms(write_through_times)}")
+
+
+if __name__ == "__main__":
+    main()
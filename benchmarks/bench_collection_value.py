@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Benchmark collection valuation: per-open price lookups versus the price snapshot.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and a temporary user database holding
+``--collection`` cards, half of them with a printing, then times valuing the
+collection on open two ways: looking up every card's price (what the collection
+screen did on each open once its cache expired) and reopening a
+CollectionValuation from its snapshot. Also times quantity edits with the value
+kept current.
+
+Usage:
+    uv run python benchmarks/bench_collection_value.py [--collection 5000] [--opens 5]
+        [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase, UserDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_spellbook.collection_manager import CollectionManager
+from mtg_spellbook.collection_value import CollectionValuation
+
+
+async def _lookup_all(db: UnifiedDatabase, manager: CollectionManager) -> float:
+    """Price every card as the collection screen did, returning the total in USD."""
+    entries = manager.stats.entries()
+    by_printing = await db.get_prices_by_set_and_numbers(
+        [(e.set_code, e.collector_number) for e in entries if e.set_code and e.collector_number]
+    )
+    by_name = await db.get_prices_by_names(
+        [e.card_name for e in entries if not (e.set_code and e.collector_number)]
+    )
+    total = 0
+    for e in entries:
+        if e.set_code and e.collector_number:
+            usd, foil = by_printing.get((e.set_code.upper(), e.collector_number), (None, None))
+        else:
+            usd, foil = by_name.get(e.card_name.lower(), (None, None))
+        total += e.quantity * (usd or 0) + e.foil_quantity * (foil or usd or 0)
+    return total / 100
+
+
+async def _run(
+    path: Path, tmp: Path, size: int, opens: int
+) -> tuple[list[float], list[float], list[float]]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute(
+            "SELECT name, set_code, collector_number FROM cards GROUP BY name LIMIT ?", (size,)
+        ) as cursor:
+            printings = [(row[0], row[1], row[2]) async for row in cursor]
+
+        user = UserDatabase(tmp / "user.sqlite")
+        await user.connect()
+        try:
+            await user.conn.executemany(
+                "INSERT INTO collection_cards"
+                " (card_name, quantity, foil_quantity, set_code, collector_number)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (name, 1 + i % 4, i % 3, *((set_code, number) if i % 2 else (None, None)))
+                    for i, (name, set_code, number) in enumerate(printings)
+                ],
+            )
+            await user.conn.commit()
+            db = UnifiedDatabase(conn, cache=CardCache())
+            snapshot = tmp / "prices.json"
+            manager = CollectionManager(user, db, cache_path=snapshot)
+            await manager.valuation.ensure_loaded()  # Writes the snapshot
+
+            lookup_times = []
+            for _ in range(opens):
+                start = time.perf_counter()
+                total = await _lookup_all(db, manager)
+                lookup_times.append(time.perf_counter() - start)
+            assert abs(total - manager.valuation.total) < 0.01
+
+            edit_times = []
+            for i in range(opens):
+                start = time.perf_counter()
+                await manager.set_quantity(printings[i][0], 2 + i % 3)
+                manager.valuation.value()
+                edit_times.append(time.perf_counter() - start)
+
+            snapshot_times = []
+            for _ in range(opens):
+                # On the loaded stats index: stats are loaded on open either way
+                valuation = CollectionValuation(manager.stats, db, snapshot)
+                start = time.perf_counter()
+                await valuation.ensure_loaded()
+                valuation.value()
+                snapshot_times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return lookup_times, snapshot_times, edit_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collection", type=int, default=5000)
+    parser.add_argument("--opens", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.collection, args.seed)
+        lookup_times, snapshot_times, edit_times = asyncio.run(
+            _run(path, Path(tmp), args.collection, args.opens)
+        )
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"collection          {args.collection:>8} cards, {args.opens} opens")
+    print(f"open: look up all   {ms(lookup_times)}")
+    print(f"open: snapshot      {ms(snapshot_times)}")
+    print(f"edit + value        {ms(edit_times)}")
+
+
+if __name__ == "__main__":
+    main()
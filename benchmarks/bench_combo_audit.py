@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""Benchmark auditing many decks for complete and near combos.
+
+Builds a synthetic Commander Spellbook combos.sqlite (or uses ``--db``) and a
+batch of decks drawing from a skewed card pool, so staples appear in most decks
+and sit in long posting lists, as in real data. Compares one
+find_missing_pieces() call per deck, using the per-deck algorithm the detector
+had before batching, against a single find_missing_pieces_bulk() pass. Also
+reports the worst event-loop stall while the async batch runs, and
+ComboDatabase.find_combos_in_deck per deck against find_combos_in_decks.
+
+Usage:
+    uv run python benchmarks/bench_combo_audit.py [--decks 1000] [--combos 30000] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from mtg_core.data.database.combos import ComboDatabase
+from mtg_core.tools.recommendations.spellbook_combos import (
+    SpellbookComboDetector,
+    SpellbookComboMatch,
+)
+
+
+def _pool(size: int) -> list[str]:
+    return [f"Card {i:05d}" for i in range(size)]
+
+
+def _pick(pool: list[str], rng: random.Random, staple_share: float) -> str:
+    """Pick a staple (skewed towards the first few hundred cards) or any card."""
+    if rng.random() < staple_share:
+        return pool[min(int((rng.paretovariate(1.1) - 1) * 50), len(pool) - 1)]
+    return rng.choice(pool)
+
+
+def _build_spellbook_db(path: Path, pool: list[str], count: int, rng: random.Random) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE combos (id TEXT PRIMARY KEY, card_names TEXT, description TEXT,"
+            " bracket_tag TEXT, popularity INTEGER, identity TEXT, produces TEXT)"
+        )
+        rows = []
+        for i in range(count):
+            cards = {_pick(pool, rng, 0.1) for _ in range(rng.randint(2, 4))}
+            rows.append(
+                (
+                    f"combo-{i}",
+                    json.dumps(sorted(cards)),
+                    rng.choice("CPSR"),
+                    rng.randint(0, 100_000),
+                )
+            )
+        conn.executemany("INSERT INTO combos VALUES (?, ?, '', ?, ?, '', '[]')", rows)
+    conn.close()
+
+
+def _decks(pool: list[str], count: int, size: int, rng: random.Random) -> list[list[str]]:
+    decks = []
+    for _ in range(count):
+        deck: set[str] = set()
+        while len(deck) < size:
+            deck.add(_pick(pool, rng, 0.4))
+        decks.append(sorted(deck))
+    return decks
+
+
+def _per_deck(
+    detector: SpellbookComboDetector, deck_cards: list[str], max_missing: int
+) -> list[SpellbookComboMatch]:
+    """The per-deck algorithm: intersect every candidate combo with the deck."""
+    deck_lower = {card.lower() for card in deck_cards}
+    candidate_ids: set[str] = set()
+    for card in deck_lower:
+        candidate_ids.update(detector._card_to_combos.get(card, ()))
+    results = []
+    for combo_id in candidate_ids:
+        combo = detector._combos[combo_id]
+        combo_cards_lower = {c.lower() for c in combo.card_names}
+        present = combo_cards_lower & deck_lower
+        missing = combo_cards_lower - deck_lower
+        if len(missing) > max_missing or not present:
+            continue
+        results.append(
+            SpellbookComboMatch(
+                combo=combo,
+                present_cards=[c for c in combo.card_names if c.lower() in present],
+                missing_cards=[c for c in combo.card_names if c.lower() in missing],
+                completion_ratio=len(present) / len(combo.card_names),
+            )
+        )
+    results.sort(key=lambda x: (-x.combo.popularity, -x.completion_ratio))
+    return results
+
+
+async def _loop_stall(
+    detector: SpellbookComboDetector, decks: list[list[str]], max_missing: int
+) -> float:
+    """Worst gap between 1 ms event-loop ticks while the async batch runs."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal worst
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst = max(worst, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await detector.find_missing_pieces_bulk_async(decks, max_missing=max_missing)
+    done.set()
+    await task
+    return worst
+
+
+async def _combo_db_timings(
+    path: Path, pool: list[str], decks: list[list[str]], rng: random.Random
+) -> tuple[float, float]:
+    db = ComboDatabase(path)
+    await db.connect()
+    try:
+        for i in range(2000):
+            cards = {_pick(pool, rng, 0.1) for _ in range(rng.randint(2, 3))}
+            await db.add_combo(f"combo-{i}", "infinite", "", [(c, "Piece") for c in cards])
+        start = time.perf_counter()
+        for deck in decks:
+            await db.find_combos_in_deck(deck)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        await db.find_combos_in_decks(decks)
+        return loop, time.perf_counter() - start
+    finally:
+        await db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", type=int, default=1000)
+    parser.add_argument("--deck-size", type=int, default=100)
+    parser.add_argument("--combos", type=int, default=30_000)
+    parser.add_argument("--pool", type=int, default=20_000)
+    parser.add_argument("--max-missing", type=int, default=2)
+    parser.add_argument("--db", type=Path, help="Real combos.sqlite (card pool taken from it)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = _pool(args.pool)
+        if args.db:
+            db_path = args.db
+        else:
+            db_path = Path(tmp) / "combos.sqlite"
+            _build_spellbook_db(db_path, pool, args.combos, rng)
+
+        detector = SpellbookComboDetector(db_path=db_path)
+        start = time.perf_counter()
+        detector.initialize()
+        load = time.perf_counter() - start
+        if args.db:
+            # Real names, most-combo'd cards first so the skew picks staples
+            pool = sorted(detector._card_to_combos, key=lambda c: -len(detector._card_to_combos[c]))
+        decks = _decks(pool, args.decks, args.deck_size, rng)
+
+        start = time.perf_counter()
+        per_deck = [_per_deck(detector, deck, args.max_missing) for deck in decks]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = detector.find_missing_pieces_bulk(decks, max_missing=args.max_missing)
+        bulk_time = time.perf_counter() - start
+
+        same = [sorted(m.combo.id for m in r) for r in per_deck] == [
+            sorted(m.combo.id for m in matches) for matches, _ in bulk
+        ]
+        stall = asyncio.run(_loop_stall(detector, decks, args.max_missing))
+        db_loop, db_bulk = asyncio.run(
+            _combo_db_timings(Path(tmp) / "combo_db.sqlite", pool, decks, rng)
+        )
+
+    matches = sum(len(r) for r in per_deck)
+    print(f"combos             {detector.combo_count:>8,} (loaded in {load * 1000:,.0f} ms)")
+    print(f"decks              {len(decks):>8,} x {args.deck_size} cards, {matches:,} matches")
+    print(f"per-deck loop      {loop_time * 1000:10.1f} ms")
+    print(f"bulk               {bulk_time * 1000:10.1f} ms")
+    print(f"speedup            {loop_time / max(bulk_time, 1e-9):10.1f}x   (same results: {same})")
+    print(f"async loop stall   {stall * 1000:10.1f} ms (worst tick gap)")
+    print(f"ComboDatabase loop {db_loop * 1000:10.1f} ms")
+    print(f"ComboDatabase bulk {db_bulk * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
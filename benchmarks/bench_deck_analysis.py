@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Benchmark per-edit latency of the incremental deck analyzer.
+
+Builds a synthetic deck of unique cards with realistic rules text, then compares
+re-analyzing from scratch (a fresh DeckAnalyzer per edit, which is what the deck
+panels used to do) against applying the edit as a delta. Edits alternate between
+quantity changes and adding/removing a card, the latter being the expensive case
+(synergy pairing and combo posting lists). Pass ``--combos`` to include Commander
+Spellbook combo tracking when resources/combos.sqlite is available.
+
+Usage:
+    uv run python benchmarks/bench_deck_analysis.py [--cards 100] [--edits 500] [--combos]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from dataclasses import dataclass
+
+from mtg_core.data.models.card import Card
+from mtg_core.tools.deck_analysis import DeckAnalyzer
+
+_TEXTS = [
+    "Flying. When this creature enters the battlefield, draw a card.",
+    "Whenever another creature you control dies, each opponent loses 1 life.",
+    "Sacrifice a creature: Scry 1.",
+    "Destroy target creature. Its controller gains 3 life.",
+    "Create two 1/1 white Soldier creature tokens.",
+    "Put a +1/+1 counter on target creature. Proliferate.",
+    "Return target creature card from your graveyard to the battlefield.",
+    "{T}: Add one mana of any color.",
+    "Search your library for a basic land card, put it onto the battlefield tapped.",
+    "Whenever you cast an instant or sorcery spell, this creature gets +1/+0.",
+    "Counter target spell unless its controller pays {3}.",
+    "Landfall — Whenever a land enters the battlefield under your control, gain 2 life.",
+    "Equipped creature gets +2/+2 and has trample. Equip {2}",
+    "Deathtouch, lifelink",
+    "Exile target creature, then return it to the battlefield under its owner's control.",
+]
+_TYPES = [
+    ("Creature — Human Soldier", ["Flying"]),
+    ("Creature — Zombie", ["Deathtouch"]),
+    ("Instant", []),
+    ("Sorcery", []),
+    ("Enchantment", []),
+    ("Artifact — Equipment", []),
+    ("Creature — Elf Druid", ["Trample"]),
+]
+
+
+@dataclass
+class _Row:
+    card_name: str
+    quantity: int
+    card: Card | None
+
+
+def _card(i: int, rng: random.Random) -> Card:
+    type_line, keywords = rng.choice(_TYPES)
+    cmc = rng.randint(1, 6)
+    color = "WUBRG"[i % 5]
+    return Card(
+        name=f"Card {i:03d}",
+        type=type_line,
+        manaCost=f"{{{cmc - 1}}}{{{color}}}" if cmc > 1 else f"{{{color}}}",
+        manaValue=cmc,
+        text=" ".join(rng.sample(_TEXTS, 2)),
+        keywords=keywords,
+        rarity=rng.choice(["common", "uncommon", "rare", "mythic"]),
+    )
+
+
+def _deck(count: int, rng: random.Random) -> list[_Row]:
+    lands = [
+        _Row(
+            name,
+            count // 10,
+            Card(name=name, type=f"Basic Land — {name}", text=f"{{T}}: Add {{{symbol}}}."),
+        )
+        for name, symbol in (("Plains", "W"), ("Island", "U"), ("Forest", "G"))
+    ]
+    spells = [_Row(f"Card {i:03d}", 1, _card(i, rng)) for i in range(count - 3)]
+    return lands + spells
+
+
+def _analyzer(use_combos: bool) -> DeckAnalyzer:
+    detector = None
+    if use_combos:
+        from mtg_core.tools.recommendations.spellbook_combos import get_spellbook_detector
+
+        detector = get_spellbook_detector()
+        if detector.combo_count == 0:
+            print("combos.sqlite not found; running without combos")
+            detector = None
+    return DeckAnalyzer(combo_detector=detector)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=500)
+    parser.add_argument("--combos", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    deck = _deck(args.cards, rng)
+    spare = [_Row(f"Spare {i}", 1, _card(10_000 + i, rng)) for i in range(20)]
+
+    analyzer = _analyzer(args.combos)
+    start = time.perf_counter()
+    analyzer.sync(deck)
+    cold_load = time.perf_counter() - start
+
+    # Full recompute per edit: a fresh analyzer (cold caches) over the edited deck
+    full: list[float] = []
+    for _ in range(min(args.edits, 50)):
+        fresh = DeckAnalyzer(combo_detector=analyzer.combo_detector)
+        start = time.perf_counter()
+        fresh.sync(deck)
+        full.append(time.perf_counter() - start)
+
+    qty_edits: list[float] = []
+    card_edits: list[float] = []
+    for i in range(args.edits):
+        if i % 2 == 0:
+            row = rng.choice(deck)
+            quantity = analyzer.quantities[row.card_name] + rng.choice((1, -1)) or 2
+            start = time.perf_counter()
+            analyzer.set_quantity(row.card_name, quantity, row.card)
+            qty_edits.append(time.perf_counter() - start)
+        else:
+            row = rng.choice(spare)
+            present = row.card_name in analyzer.quantities
+            start = time.perf_counter()
+            if present:
+                analyzer.remove(row.card_name)
+            else:
+                analyzer.add(row.card_name, 1, row.card)
+            card_edits.append(time.perf_counter() - start)
+
+    # Sync of an edited copy: the panels' path (diff + delta)
+    edited = [_Row(r.card_name, r.quantity, r.card) for r in deck]
+    syncs: list[float] = []
+    for _ in range(min(args.edits, 200)):
+        row = rng.choice(edited)
+        row.quantity = 1 if row.quantity > 1 else 2
+        start = time.perf_counter()
+        analyzer.sync(edited)
+        syncs.append(time.perf_counter() - start)
+
+    def ms(values: list[float]) -> str:
+        return (
+            f"median {statistics.median(values) * 1000:8.3f} ms   max {max(values) * 1000:8.3f} ms"
+        )
+
+    print(f"deck               {args.cards:>5} cards ({len(analyzer.quantities)} unique)")
+    print(f"cold load          {cold_load * 1000:8.3f} ms")
+    print(f"full recompute     {ms(full)}")
+    print(f"quantity delta     {ms(qty_edits)}")
+    print(f"add/remove card    {ms(card_edits)}")
+    print(f"sync edited deck   {ms(syncs)}")
+    speedup = statistics.median(full) / max(statistics.median(card_edits), 1e-9)
+    print(f"speedup (add/remove vs full) {speedup:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmark creating a deck from a card list: one add_card() per card versus one batch.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and a temporary user database, then creates decks
+of ``--deck-size`` cards two ways: DeckManager.create_deck() followed by
+add_card() for every card, as the collection screen's deck suggestions did, and
+DeckManager.create_deck_with_cards(), which resolves all names in one lookup
+and inserts them in one transaction.
+
+Usage:
+    uv run python benchmarks/bench_deck_bulk_add.py [--deck-size 100] [--decks 20]
+        [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase, UserDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_spellbook.deck_manager import DeckManager
+
+
+async def _run(path: Path, user_path: Path, deck_size: int, decks: int) -> tuple[list[float], ...]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute("SELECT name FROM oracle_cards LIMIT ?", (deck_size,)) as cursor:
+            names = [row[0] async for row in cursor]
+
+        user = UserDatabase(user_path)
+        await user.connect()
+        try:
+            # Fresh cache per deck so both paths pay for their name lookups
+            per_card_times = []
+            for i in range(decks):
+                manager = DeckManager(user, UnifiedDatabase(conn, cache=CardCache()))
+                start = time.perf_counter()
+                deck_id = await manager.create_deck(f"Per card {i}")
+                for name in names:
+                    await manager.add_card(deck_id, name, 1)
+                per_card_times.append(time.perf_counter() - start)
+
+            bulk_times = []
+            for i in range(decks):
+                manager = DeckManager(user, UnifiedDatabase(conn, cache=CardCache()))
+                start = time.perf_counter()
+                await manager.create_deck_with_cards(
+                    f"Bulk {i}", [(name, 1, False) for name in names]
+                )
+                bulk_times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return per_card_times, bulk_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deck-size", type=int, default=100)
+    parser.add_argument("--decks", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, max(args.deck_size, 1000), args.seed)
+        per_card_times, bulk_times = asyncio.run(
+            _run(path, Path(tmp) / "user.sqlite", args.deck_size, args.decks)
+        )
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"deck size          {args.deck_size:>8} cards, {args.decks} decks")
+    print(f"add_card per card  {ms(per_card_times)}")
+    print(f"one batch          {ms(bulk_times)}")
+
+
+if __name__ == "__main__":
+    main()
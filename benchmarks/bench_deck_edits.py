@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Benchmark deck edits: write plus full deck reload versus delta-applied changes.
+
+Builds a deterministic synthetic mtg.sqlite (see synthetic.py; or uses an
+existing one with ``--db``) and a temporary user database holding one deck,
+then times quantity changes on that deck two ways: the write followed by
+DeckManager.get_deck(), as the deck screens did after every keypress, and the
+write alone, whose returned DeckChange patches the loaded deck in place.
+
+Usage:
+    uv run python benchmarks/bench_deck_edits.py [--deck-size 100] [--edits 200]
+        [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase, UserDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_spellbook.deck_manager import DeckManager
+
+
+async def _run(path: Path, user_path: Path, deck_size: int, edits: int) -> tuple[list[float], ...]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute("SELECT name FROM oracle_cards LIMIT ?", (deck_size,)) as cursor:
+            names = [row[0] async for row in cursor]
+
+        user = UserDatabase(user_path)
+        await user.connect()
+        try:
+            manager = DeckManager(user, UnifiedDatabase(conn, cache=CardCache()))
+            deck_id = await manager.create_deck("Bench")
+            for name in names:
+                await manager.add_card(deck_id, name, 1)
+            deck = await manager.get_deck(deck_id)
+            assert deck is not None
+
+            reload_times = []
+            for i in range(edits):
+                start = time.perf_counter()
+                await manager.set_quantity(deck_id, names[i % len(names)], 1 + i % 4)
+                await manager.get_deck(deck_id)
+                reload_times.append(time.perf_counter() - start)
+
+            delta_times = []
+            for i in range(edits):
+                start = time.perf_counter()
+                change = await manager.set_quantity(deck_id, names[i % len(names)], 1 + i % 4)
+                deck.apply_change(change)
+                delta_times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return reload_times, delta_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deck-size", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, max(args.deck_size, 1000), args.seed)
+        reload_times, delta_times = asyncio.run(
+            _run(path, Path(tmp) / "user.sqlite", args.deck_size, args.edits)
+        )
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"deck size          {args.deck_size:>8} cards, {args.edits} edits")
+    print(f"write + reload     {ms(reload_times)}")
+    print(f"write + delta      {ms(delta_times)}")
+
+
+if __name__ == "__main__":
+    main()
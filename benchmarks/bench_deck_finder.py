@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Benchmark Commander deck suggestions over a large collection.
+
+Builds a synthetic collection with a few hundred legendary creatures and times
+DeckFinder.find_commander_decks(), which encodes the collection once and builds
+one suggestion per legend. Also reports how soon the first suggestions stream
+out of iter_commander_decks(), which is what the TUI shows while the rest are
+still being built, and the cost of Standard suggestions over the same cards.
+
+Usage:
+    uv run python benchmarks/bench_deck_finder.py [--cards 15000] [--legends 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from mtg_core.tools.recommendations.deck_finder import CardData, DeckFinder
+
+COLORS = ["W", "U", "B", "R", "G"]
+TYPES = [
+    "Creature — Elf Warrior",
+    "Creature — Goblin",
+    "Creature — Zombie Wizard",
+    "Artifact Creature — Golem",
+    "Instant",
+    "Sorcery",
+    "Artifact",
+    "Artifact — Equipment",
+    "Enchantment — Aura",
+    "Enchantment",
+    "Land",
+]
+TEXTS = [
+    "Destroy target creature.",
+    "Draw a card.",
+    "Create a 1/1 white Soldier creature token.",
+    "{T}: Add {G}.",
+    "Whenever a creature you control dies, you gain 1 life.",
+    "Put a +1/+1 counter on target creature. Proliferate.",
+    "Flying",
+    "Sacrifice a creature: Draw a card.",
+    "Equipped creature gets +2/+2. Equip {2}",
+    "Exile target artifact or enchantment.",
+    "Each player mills three cards.",
+    "Counter target spell.",
+    "Trample, haste",
+    "",
+]
+
+
+def _identity(rng: random.Random) -> list[str]:
+    return rng.sample(COLORS, rng.choice([0, 1, 1, 1, 2, 2, 3]))
+
+
+def _collection(count: int, legends: int, rng: random.Random) -> list[CardData]:
+    cards = [
+        CardData(
+            name=f"Legend {i}",
+            type_line="Legendary Creature — Elf Wizard",
+            text=" ".join(rng.sample(TEXTS, 2)),
+            color_identity=rng.sample(COLORS, rng.randint(1, 3)),
+        )
+        for i in range(legends)
+    ]
+    for i in range(count - legends):
+        identity = _identity(rng)
+        cards.append(
+            CardData(
+                name=f"Card {i}",
+                type_line=rng.choice(TYPES),
+                colors=identity or None,
+                text=" ".join(rng.sample(TEXTS, 2)),
+                color_identity=identity or None,
+            )
+        )
+    rng.shuffle(cards)
+    return cards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=15_000)
+    parser.add_argument("--legends", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    cards = _collection(args.cards, args.legends, random.Random(args.seed))
+    finder = DeckFinder()
+
+    full: list[float] = []
+    first: list[float] = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        suggestions = finder.find_commander_decks(set(), cards, min_completion=0.1, limit=20)
+        full.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        stream = finder.iter_commander_decks(cards, min_completion=0.1)
+        # Tribal/theme suggestions come first; time the first commander deck
+        next(s for s in stream if s.name.endswith(" Commander"))
+        first.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    standard = finder.find_standard_decks(set(), cards, limit=20)
+    standard_time = time.perf_counter() - start
+
+    best = statistics.median(full)
+    print(f"collection         {len(cards):>8,} cards, {args.legends} legends")
+    print(f"commander decks    {best * 1000:10.1f} ms (median of {args.runs})")
+    print(f"per legend         {best / args.legends * 1000:10.2f} ms")
+    print(f"first commander    {statistics.median(first) * 1000:10.1f} ms")
+    print(f"standard decks     {standard_time * 1000:10.1f} ms ({len(standard)} suggestions)")
+    if suggestions:
+        print(f"top suggestion     {suggestions[0].name} ({suggestions[0].completion_pct:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+"""Benchmark the database, synergy, recommendation, cache and import hot paths.
+
+Builds a deterministic synthetic mtg.sqlite and combos.sqlite (see
+synthetic.py; reused across runs with ``--data-dir``) and times:
+
+- search_cards with name, color/type/mana value, rules text and keyword filters
+- get_cards_by_names for 100 and 1,000 names (at most the pool) with a cold card cache
+- find_synergies, bypassing the result cache
+- SpellbookComboDetector loading combos, and find_missing_pieces for a 100-card deck
+- HybridRecommender.initialize and recommend_for_deck (as the recommendations screen calls it)
+- set_cached/get_cached of a synergy result
+- CollectionManager.import_from_text into an empty collection
+
+Prints median and max per benchmark. ``--json`` writes the results with the
+dataset size, seed and git commit; ``--baseline`` compares medians with an
+earlier ``--json`` file and exits with status 1 if any slowed by more than
+``--threshold`` percent.
+
+Usage:
+    uv run python benchmarks/bench_hot_paths.py [--cards 20000] [--combos 20000] [--repeat 10]
+        [--only PREFIX] [--json PATH] [--baseline PATH] [--threshold 25] [--data-dir DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import aiosqlite
+from synthetic import card_names, ensure_databases
+
+from mtg_core.cache import get_cached, set_cached
+from mtg_core.data.database import UnifiedDatabase, UserDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_core.data.models.inputs import SearchCardsInput
+from mtg_core.data.models.responses import FindSynergiesResult
+from mtg_core.tools.recommendations.hybrid import HybridRecommender
+from mtg_core.tools.recommendations.spellbook_combos import (
+    SpellbookComboDetector,
+    get_spellbook_detector,
+)
+from mtg_core.tools.synergy import find_synergies
+from mtg_spellbook.collection_manager import CollectionManager
+
+SEARCHES = {
+    "name": SearchCardsInput(name="ka"),
+    "colors_type": SearchCardsInput(colors=["R"], type="Creature", cmc_max=3),
+    "text": SearchCardsInput(text="draw a card", format_legal="commander"),
+    "keywords": SearchCardsInput(keywords=["Flying"], sort_by="cmc", page=3),
+}
+
+
+@dataclass
+class Context:
+    """What every benchmark gets: the synthetic data and a warm database."""
+
+    conn: aiosqlite.Connection
+    cache: CardCache
+    db: UnifiedDatabase
+    names: list[str]
+    mtg_path: Path
+    combos_path: Path
+    tmp: Path
+    repeat: int
+
+
+Benchmark = Callable[[Context], Awaitable[list[float]]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+def _deck(names: list[str], size: int, seed: int) -> list[str]:
+    """A deck of staples (the first names) and random picks, as combos skew to staples."""
+    rng = random.Random(seed)
+    picks = min(size - size // 4, len(names))
+    return sorted({*names[: size // 4], *rng.sample(names, picks)})
+
+
+for _key, _filters in SEARCHES.items():
+
+    @benchmark(f"search_cards.{_key}")
+    async def _search(ctx: Context, filters: SearchCardsInput = _filters) -> list[float]:
+        await ctx.db.search_cards(filters)  # Untimed, to load the pages it reads
+        times = []
+        for _ in range(ctx.repeat):
+            start = time.perf_counter()
+            await ctx.db.search_cards(filters)
+            times.append(time.perf_counter() - start)
+        return times
+
+
+for _count in (100, 1000):
+
+    @benchmark(f"get_cards_by_names.{_count}")
+    async def _by_names(ctx: Context, count: int = _count) -> list[float]:
+        times = []
+        for i in range(ctx.repeat):
+            names = random.Random(i).sample(ctx.names, min(count, len(ctx.names)))
+            await ctx.cache.clear()
+            start = time.perf_counter()
+            await ctx.db.get_cards_by_names(names)
+            times.append(time.perf_counter() - start)
+        return times
+
+
+async def _synergy_sources(ctx: Context, count: int) -> list[str]:
+    """Cards with keywords or triggers, so every synergy pass has terms to search."""
+    async with ctx.conn.execute(
+        "SELECT name FROM oracle_cards WHERE keywords != '[]' OR oracle_text LIKE '%Whenever%'"
+        " ORDER BY name LIMIT ?",
+        (count,),
+    ) as cursor:
+        return [row[0] async for row in cursor]
+
+
+@benchmark("find_synergies")
+async def _synergies(ctx: Context) -> list[float]:
+    times = []
+    for name in await _synergy_sources(ctx, ctx.repeat):
+        start = time.perf_counter()
+        await find_synergies(ctx.db, name, use_cache=False)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("spellbook.initialize")
+async def _spellbook_initialize(ctx: Context) -> list[float]:
+    times = []
+    for _ in range(ctx.repeat):
+        detector = SpellbookComboDetector(ctx.combos_path)
+        start = time.perf_counter()
+        detector.initialize()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("spellbook.find_missing_pieces")
+async def _missing_pieces(ctx: Context) -> list[float]:
+    detector = SpellbookComboDetector(ctx.combos_path)
+    detector.initialize()
+    times = []
+    for i in range(ctx.repeat):
+        deck = _deck(ctx.names, 100, i)
+        start = time.perf_counter()
+        detector.find_missing_pieces(deck)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("hybrid.initialize")
+async def _hybrid_initialize(ctx: Context) -> list[float]:
+    get_spellbook_detector()  # Process-wide and loaded once; timed by spellbook.initialize
+    times = []
+    for _ in range(ctx.repeat):
+        start = time.perf_counter()
+        await HybridRecommender().initialize(ctx.db)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("hybrid.recommend_for_deck")
+async def _recommend(ctx: Context) -> list[float]:
+    recommender = HybridRecommender()
+    await recommender.initialize(ctx.db)
+    times = []
+    for i in range(ctx.repeat):
+        deck = [{"name": name, "quantity": 1} for name in _deck(ctx.names, 60, i)]
+        start = time.perf_counter()
+        recommender.recommend_for_deck(deck, n=100, explain=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("cache.set_cached")
+async def _set_cached(ctx: Context) -> list[float]:
+    [name] = await _synergy_sources(ctx, 1)
+    result = await find_synergies(ctx.db, name, use_cache=False)
+    times = []
+    for i in range(ctx.repeat * 20):
+        start = time.perf_counter()
+        set_cached("bench", f"set-{i}", result)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("cache.get_cached")
+async def _get_cached(ctx: Context) -> list[float]:
+    [name] = await _synergy_sources(ctx, 1)
+    result = await find_synergies(ctx.db, name, use_cache=False)
+    keys = [f"get-{i}" for i in range(20)]
+    for key in keys:
+        set_cached("bench", key, result)
+    times = []
+    for i in range(ctx.repeat * 20):
+        start = time.perf_counter()
+        get_cached("bench", keys[i % len(keys)], FindSynergiesResult)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("collection.import_from_text")
+async def _import(ctx: Context) -> list[float]:
+    async with ctx.conn.execute(
+        "SELECT set_code, collector_number FROM cards ORDER BY id LIMIT 250"
+    ) as cursor:
+        printings = [f"{row[0].upper()} {row[1]}" async for row in cursor]
+    lines = [f"{1 + i % 4} {name}" for i, name in enumerate(ctx.names[:250])]
+    text = "\n".join([*lines, *printings])
+
+    times = []
+    for i in range(ctx.repeat):
+        user = UserDatabase(ctx.tmp / f"user-{i}.sqlite")
+        await user.connect()
+        await user.attach_card_database(ctx.mtg_path)
+        try:
+            manager = CollectionManager(user, ctx.db)
+            start = time.perf_counter()
+            await manager.import_from_text(text)
+            times.append(time.perf_counter() - start)
+        finally:
+            await user.close()
+    return times
+
+
+async def _run(
+    mtg_path: Path, combos_path: Path, tmp: Path, names: list[str], repeat: int, only: str | None
+) -> dict[str, list[float]]:
+    async with aiosqlite.connect(mtg_path) as conn:
+        conn.row_factory = aiosqlite.Row
+        cache = CardCache()
+        db = UnifiedDatabase(conn, cache=cache)
+        await db.get_database_stats()  # Warm the per-connection indexes
+        ctx = Context(conn, cache, db, names, mtg_path, combos_path, tmp, repeat)
+        results = {}
+        for name, function in BENCHMARKS.items():
+            if only is None or name.startswith(only):
+                results[name] = await function(ctx)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _summary(values: list[float]) -> dict[str, float | int]:
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 3),
+        "mean_ms": round(statistics.mean(values) * 1000, 3),
+        "max_ms": round(max(values) * 1000, 3),
+        "samples": len(values),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=20000)
+    parser.add_argument("--combos", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--only", help="Run only benchmarks whose name starts with this")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    parser.add_argument("--baseline", type=Path, help="Earlier --json results to compare with")
+    parser.add_argument("--threshold", type=float, default=25.0, help="Allowed slowdown in %%")
+    parser.add_argument("--data-dir", type=Path, help="Keep the synthetic databases here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or Path(tmp) / "data"
+        start = time.perf_counter()
+        mtg_path, combos_path = ensure_databases(data_dir, args.cards, args.combos, args.seed)
+        print(f"data               {args.cards} cards, {args.combos} combos, seed {args.seed}")
+        print(f"data ready         {time.perf_counter() - start:8.2f} s")
+
+        # Point every settings-based lookup (combos.sqlite, the data cache) at
+        # the synthetic data before anything reads the settings
+        os.environ["MTG_DB_PATH"] = str(mtg_path)
+        os.environ["COMBO_DB_PATH"] = str(combos_path)
+        os.environ["DATA_CACHE_DIR"] = str(Path(tmp) / "cache")
+        os.environ["USER_DB_PATH"] = str(Path(tmp) / "user.sqlite")
+
+        results = asyncio.run(
+            _run(mtg_path, combos_path, Path(tmp), card_names(args.cards), args.repeat, args.only)
+        )
+
+    summaries = {name: _summary(values) for name, values in results.items()}
+    for name, summary in summaries.items():
+        print(f"{name:<32} {summary['median_ms']:10.2f} ms median {summary['max_ms']:10.2f} ms max")
+
+    if args.json:
+        report = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "data": {"cards": args.cards, "combos": args.combos, "seed": args.seed},
+            "repeat": args.repeat,
+            "results": summaries,
+        }
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"wrote              {args.json}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["data"] != {"cards": args.cards, "combos": args.combos, "seed": args.seed}:
+            print(f"baseline data {baseline['data']} differs; medians are not comparable")
+            sys.exit(2)
+        regressed = []
+        for name, summary in summaries.items():
+            before = baseline["results"].get(name)
+            if before is None:
+                continue
+            change = (summary["median_ms"] / before["median_ms"] - 1) * 100
+            flag = "REGRESSED" if change > args.threshold else ""
+            print(
+                f"{name:<32} {before['median_ms']:10.2f} -> {summary['median_ms']:10.2f} ms {change:+7.1f}% {flag}"
+            )
+            if flag:
+                regressed.append(name)
+        if regressed:
+            print(
+                f"{len(regressed)} regressed beyond {args.threshold:.0f}%: {', '.join(regressed)}"
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Benchmark the art navigator image disk cache with 10k cached images.
+
+Measures populate time, concurrent read throughput (the printings grid loads
+thumbnails through ``asyncio.to_thread``), and the cost of incremental eviction.
+
+Usage:
+    uv run python benchmarks/bench_image_cache.py [--images 10000] [--threads 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from mtg_spellbook.widgets.art_navigator.disk_cache import ImageDiskCache
+
+
+def _url(i: int) -> str:
+    return f"https://cards.scryfall.io/large/front/{i:06d}.jpg"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--reads", type=int, default=20_000)
+    args = parser.parse_args()
+
+    img = Image.new("RGB", (24, 34), color=(90, 60, 30))
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ImageDiskCache(Path(tmp), max_bytes=1024 * 1024 * 1024)
+
+        start = time.perf_counter()
+        for i in range(args.images):
+            cache.put(_url(i), img)
+        populate = time.perf_counter() - start
+        print(f"populate      {args.images:>7,} images  {populate * 1000:9.1f} ms")
+
+        urls = [_url(rng.randrange(args.images)) for _ in range(args.reads)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            hits = sum(1 for img in pool.map(cache.get, urls) if img is not None)
+        reads = time.perf_counter() - start
+        print(
+            f"read          {args.reads:>7,} hits    {reads * 1000:9.1f} ms"
+            f"  ({args.reads / reads:,.0f}/s, {args.threads} threads, {hits:,} hits)"
+        )
+
+        start = time.perf_counter()
+        cache.flush()
+        print(f"flush access times            {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+        stats = cache.stats()
+        start = time.perf_counter()
+        cache.max_bytes = stats["bytes"] // 2
+        cache.put(_url(args.images), img)
+        evict = time.perf_counter() - start
+        print(
+            f"evict to 50%  {stats['files'] - cache.stats()['files']:>7,} files   "
+            f"{evict * 1000:9.1f} ms"
+        )
+
+        start = time.perf_counter()
+        print(f"stats         {cache.stats()}  {(time.perf_counter() - start) * 1e6:.0f} us")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Benchmark TUI page-flip latency for search results.
+
+Builds a deterministic synthetic mtg.sqlite with rulings (see synthetic.py; or
+uses an existing one with ``--db``) and times loading 25-card result pages
+three ways: one get_card() per summary with separate legalities and rulings
+queries (the old path), one get_cards_by_uuids() batch per page, and flipping
+to a page PaginationState already prefetched while the previous page was on
+screen.
+
+Usage:
+    uv run python benchmarks/bench_page_flip.py [--cards 20000] [--pages 40] [--seed 0]
+        [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+from synthetic import build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_core.data.models.responses import CardDetail, CardSummary
+from mtg_core.tools import cards as card_tools
+from mtg_spellbook.pagination import PaginationState
+
+PAGE_SIZE = 25
+
+
+async def _per_card(db: UnifiedDatabase, summaries: list[Any]) -> list[CardDetail]:
+    """The old path: three queries per card, no cache."""
+    details = []
+    for summary in summaries:
+        async with db._execute("SELECT * FROM cards WHERE id = ?", (summary.uuid,)) as cursor:
+            row = await cursor.fetchone()
+        assert row is not None
+        card = db._row_to_card(row)
+        card.legalities = await db._get_legalities(row["id"])
+        card.rulings = await db._get_rulings(row["oracle_id"])
+        details.append(card_tools._card_to_detail(card))
+    return details
+
+
+async def _run(path: Path, pages: int) -> tuple[list[float], list[float], list[float]]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute(
+            "SELECT id, name FROM cards ORDER BY random() LIMIT ?", (pages * PAGE_SIZE,)
+        ) as cursor:
+            summaries = [CardSummary(uuid=row[0], name=row[1]) async for row in cursor]
+
+        db = UnifiedDatabase(conn, cache=CardCache(max_size=0))
+        per_card = []
+        for page in range(pages):
+            items = summaries[page * PAGE_SIZE : (page + 1) * PAGE_SIZE]
+            start = time.perf_counter()
+            await _per_card(db, items)
+            per_card.append(time.perf_counter() - start)
+
+        async def load(items: list[Any], _start: int) -> list[CardDetail]:
+            by_uuid = await card_tools.get_cards_by_uuids(db, [item.uuid for item in items])
+            return [by_uuid[item.uuid] for item in items if item.uuid in by_uuid]
+
+        db = UnifiedDatabase(conn, cache=CardCache())
+        state = PaginationState.from_summaries(summaries, page_size=PAGE_SIZE)
+        bulk = []
+        for page in range(1, pages + 1):
+            start = time.perf_counter()
+            await state.load_page(page, load)
+            bulk.append(time.perf_counter() - start)
+
+        db = UnifiedDatabase(conn, cache=CardCache())
+        state = PaginationState.from_summaries(summaries, page_size=PAGE_SIZE)
+        await state.load_page(1, load)
+        prefetched = []
+        for page in range(2, pages + 1):
+            await state.prefetch(page, load)  # While the previous page is being read
+            start = time.perf_counter()
+            await state.load_page(page, load)
+            prefetched.append(time.perf_counter() - start)
+    return per_card, bulk, prefetched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=20_000)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.cards, args.seed)
+        per_card, bulk, prefetched = asyncio.run(_run(path, args.pages))
+
+    def ms(values: list[float]) -> str:
+        median = statistics.median(values) * 1000
+        worst = max(values) * 1000
+        return f"{median:8.2f} ms median {worst:8.2f} ms max"
+
+    print(f"pages              {args.pages:>8} x {PAGE_SIZE} cards")
+    print(f"per-card queries   {ms(per_card)}")
+    print(f"bulk by uuid       {ms(bulk)}")
+    print(f"prefetched flip    {ms(prefetched)}")
+
+
+if __name__ == "__main__":
+    main()
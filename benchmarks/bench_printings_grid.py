@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmark time-to-first-paint of the art navigator filmstrip for a 500-printing card.
+
+Runs the printings grid headless with the app stylesheet, times ``load_printings``
+through the first completed refresh, then times a full scroll across the strip.
+Thumbnails are not fetched (printings have no image URLs), so this measures the
+widget and layout cost only.
+
+Usage:
+    uv run python benchmarks/bench_printings_grid.py [--printings 500] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from textual.app import App
+
+from mtg_core.data.models.responses import PrintingInfo
+from mtg_spellbook.styles import APP_CSS
+from mtg_spellbook.widgets.art_navigator.grid import PrintingsGrid
+from mtg_spellbook.widgets.art_navigator.shop_card import ShopCard
+
+
+class _BenchApp(App[None]):
+    CSS = APP_CSS
+
+
+def _printings(count: int) -> list[PrintingInfo]:
+    rarities = ["common", "uncommon", "rare", "mythic"]
+    return [
+        PrintingInfo(
+            uuid=f"uuid-{i}",
+            set_code=f"s{i % 300:03d}",
+            collector_number=str(i),
+            rarity=rarities[i % len(rarities)],
+            price_usd=(i * 37 % 5000) / 100,
+        )
+        for i in range(count)
+    ]
+
+
+async def _run(count: int) -> tuple[float, float, int]:
+    printings = _printings(count)
+    grid = PrintingsGrid(classes="printings-filmstrip")
+
+    async with _BenchApp().run_test(size=(160, 40)) as pilot:
+        await pilot.app.mount(grid)
+        await pilot.pause()
+
+        start = time.perf_counter()
+        await grid.load_printings("Benchmark Card", printings)
+        await pilot.pause()
+        first_paint = time.perf_counter() - start
+        mounted = len(grid.query(ShopCard))
+
+        start = time.perf_counter()
+        for _ in range(count - 1):
+            grid.navigate("right")
+        await pilot.pause()
+        traverse = time.perf_counter() - start
+
+    return first_paint, traverse, mounted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--printings", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [asyncio.run(_run(args.printings)) for _ in range(args.runs)]
+    first_paint = [r[0] for r in results]
+    traverse = [r[1] for r in results]
+
+    print(f"printings          {args.printings:>7,}   tiles mounted {results[0][2]}")
+    print(
+        f"first paint        median {statistics.median(first_paint) * 1000:8.1f} ms"
+        f"   min {min(first_paint) * 1000:8.1f} ms"
+    )
+    print(
+        f"navigate to end    median {statistics.median(traverse) * 1000:8.1f} ms"
+        f"   ({statistics.median(traverse) / max(args.printings - 1, 1) * 1e6:.0f} us/step)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""Benchmark the set browser: opening a set and searching the set list.
+
+Builds a deterministic synthetic mtg.sqlite, which has the set index and
+``SET_SIZE`` printings per set (see synthetic.py; or uses an existing one with
+``--db``), and times opening a set two ways: a card search filtered by set plus
+rarity/type counts in Python (what SetsScreen did, getting only the first page)
+and the index's set stats plus its first card batch and full card stream. Also
+times filtering the set list per keystroke: a ``LIKE`` query on the sets table
+versus the in-memory prefix match.
+
+Usage:
+    uv run python benchmarks/bench_set_browser.py [--cards 60000] [--seed 0] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import aiosqlite
+from synthetic import SET_SIZE, build_mtg_db
+
+from mtg_core.data.database import UnifiedDatabase
+from mtg_core.data.database.cache import CardCache
+from mtg_core.data.models.inputs import SearchCardsInput
+from mtg_core.tools import sets
+from mtg_spellbook.screens.sets import SetsScreen, _search_tokens
+
+KEYSTROKES = ["d", "dr", "dra", "drak", "drake"]
+
+
+async def _search_open(db: UnifiedDatabase, code: str) -> None:
+    """Open a set as SetsScreen did: a filtered search page, counted in Python."""
+    await db.get_set(code)
+    rows, _total = await db.search_card_rows(SearchCardsInput(set_code=code))
+    Counter((row.rarity or "").lower() for row in rows)
+    Counter((row.type or "").split()[0] for row in rows if row.type)
+
+
+async def _run(
+    path: Path,
+) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
+    async with aiosqlite.connect(path) as conn:
+        conn.row_factory = aiosqlite.Row
+        db = UnifiedDatabase(conn, cache=CardCache())
+        codes = [s.code for s in (await db.get_all_sets())[:20]]
+
+        search_times = []
+        for code in codes:
+            start = time.perf_counter()
+            await _search_open(db, code)
+            search_times.append(time.perf_counter() - start)
+
+        first_batch_times = []
+        full_times = []
+        for code in codes:
+            start = time.perf_counter()
+            await db.get_set_stats(code)
+            batches = db.get_set_cards(code)
+            await anext(batches)
+            first_batch_times.append(time.perf_counter() - start)
+            async for _rows in batches:
+                pass
+            full_times.append(time.perf_counter() - start)
+
+        like_times = []
+        for query in KEYSTROKES:
+            start = time.perf_counter()
+            async with conn.execute(
+                "SELECT * FROM sets WHERE name LIKE ? OR code LIKE ? ORDER BY release_date DESC",
+                (f"%{query}%", f"%{query}%"),
+            ) as cursor:
+                await cursor.fetchall()
+            like_times.append(time.perf_counter() - start)
+
+        screen = SetsScreen(db=None)
+        screen._search_index = [
+            (s, _search_tokens(s)) for s in (await sets.get_sets(db, name=None)).sets
+        ]
+        prefix_times = []
+        for query in KEYSTROKES:
+            start = time.perf_counter()
+            screen._filter_sets(query)
+            prefix_times.append(time.perf_counter() - start)
+    return search_times, first_batch_times, full_times, like_times, prefix_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=60_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", type=Path, help="Existing mtg.sqlite to read instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db
+        if path is None:
+            path = Path(tmp) / "bench.sqlite"
+            build_mtg_db(path, args.cards, args.seed)
+        search, first_batch, full, like, prefix = asyncio.run(_run(path))
+
+    def ms(values: list[float]) -> str:
+        return f"{statistics.median(values) * 1000:8.2f} ms median {max(values) * 1000:8.2f} ms max"
+
+    print(f"cards               {args.cards:>8}, {SET_SIZE} printings per set")
+    print(f"open: search page   {ms(search)}")
+    print(f"open: first batch   {ms(first_batch)}")
+    print(f"open: all cards     {ms(full)}")
+    print(f"filter: LIKE        {ms(like)}")
+    print(f"filter: prefix      {ms(prefix)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Benchmark rules-text pattern families: per-pattern searches versus TextMatcher.
+
+Runs each family the detectors use (synergy themes, recommendation synergy
+keywords, deck-analysis themes and deck roles) over a card pool, once with the
+one-``re.search``-per-pattern loop the detectors used before and once through a
+compiled TextMatcher, and checks both find the same tags for every card. The
+pool is the oracle text of every card in an mtg.sqlite given with ``--db``, or
+synthetic texts assembled from rules-text fragments.
+
+Usage:
+    uv run python benchmarks/bench_text_match.py [--cards 30000] [--runs 3] [--db PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sqlite3
+import statistics
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+
+from mtg_core.tools.deck import INTERACTION_PATTERNS, RAMP_PATTERNS
+from mtg_core.tools.deck_analysis import THEME_PATTERNS
+from mtg_core.tools.recommendations.features import SYNERGY_KEYWORDS
+from mtg_core.tools.synergy.constants import THEME_INDICATORS
+from mtg_core.utils.text_match import TextMatcher
+
+FRAGMENTS = [
+    "Flying",
+    "Trample, haste",
+    "Destroy target creature.",
+    "Counter target spell.",
+    "Draw a card.",
+    "{T}: Add {G}.",
+    "Create a 1/1 white Soldier creature token.",
+    "Whenever a creature you control dies, you gain 1 life.",
+    "Put a +1/+1 counter on target creature. Proliferate.",
+    "Sacrifice an artifact: Scry 1.",
+    "Return target creature card from your graveyard to the battlefield.",
+    "Each player mills three cards.",
+    "Exile target artifact or enchantment.",
+    "Search your library for a basic land card, put it onto the battlefield tapped.",
+    "Whenever you cast an instant or sorcery spell, copy it.",
+    "When this creature enters, target opponent discards a card.",
+    "Equipped creature gets +2/+2. Equip {2}",
+    "Other Elves you control get +1/+1.",
+]
+
+
+def _synthetic(count: int, rng: random.Random) -> list[str]:
+    return [" ".join(rng.sample(FRAGMENTS, rng.randint(1, 4))) for _ in range(count)]
+
+
+def _from_db(path: Path) -> list[str]:
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT oracle_text FROM cards WHERE oracle_text IS NOT NULL")
+        texts = [text for (text,) in rows]
+    conn.close()
+    return texts
+
+
+def _legacy(patterns: Mapping[str, Iterable[str]], literal: bool) -> Callable[[str], list[str]]:
+    """One search per pattern, as the detectors did before TextMatcher."""
+    families = {tag: list(found) for tag, found in patterns.items()}
+
+    def search(pattern: str, text: str) -> bool:
+        if literal:
+            return pattern in text.lower()
+        try:
+            return re.search(pattern, text, re.IGNORECASE) is not None
+        except re.error:
+            return pattern.lower() in text.lower()
+
+    return lambda text: [
+        tag for tag, found in families.items() if any(search(p, text) for p in found)
+    ]
+
+
+def _time(
+    func: Callable[[str], list[str]], texts: list[str], runs: int
+) -> tuple[float, list[list[str]]]:
+    times = []
+    results: list[list[str]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = [func(text) for text in texts]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=30_000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--db", type=Path, help="Real mtg.sqlite (uses every card's oracle text)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    texts = _from_db(args.db) if args.db else _synthetic(args.cards, random.Random(args.seed))
+    families: list[tuple[str, Mapping[str, Iterable[str]], bool]] = [
+        ("synergy themes", THEME_INDICATORS, False),
+        ("synergy keywords", SYNERGY_KEYWORDS, False),
+        ("analysis themes", {t: [p] for t, p in THEME_PATTERNS.items()}, False),
+        ("deck roles", {"interaction": INTERACTION_PATTERNS, "ramp": RAMP_PATTERNS}, True),
+    ]
+
+    print(f"card texts         {len(texts):>8,}")
+    for name, patterns, literal in families:
+        matcher = TextMatcher(patterns, literal=literal)
+        legacy_time, legacy = _time(_legacy(patterns, literal), texts, args.runs)
+        matcher_time, matched = _time(matcher.find, texts, args.runs)
+        print(
+            f"{name:<18} {legacy_time * 1000:9.1f} ms -> {matcher_time * 1000:8.1f} ms"
+            f"  {legacy_time / max(matcher_time, 1e-9):5.1f}x  (same tags: {legacy == matched})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+"""Deterministic synthetic mtg.sqlite and combos.sqlite for the benchmarks.
+
+``build_mtg_db`` writes Scryfall-style cards and rulings and an MTGJson set
+list for a seeded card pool, then runs them through the real ingest
+(create_mtg_db.build_unified_db), so the database has every derived table and
+index a downloaded one has. ``build_combos_db`` writes a Commander Spellbook
+combos.sqlite with download_spellbook's schema over the same card names, with
+staples appearing in many combos as in real data. The same size and seed
+always give the same cards and combos.
+
+Usage:
+    uv run python benchmarks/synthetic.py OUT_DIR [--cards 20000] [--combos 20000] [--seed 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from mtg_core.scripts import create_mtg_db
+from mtg_core.scripts.download_spellbook import create_database
+
+SYLLABLES = ["ka", "ro", "mi", "th", "el", "va", "dor", "ith", "un", "ga", "sel", "mor"]
+SYLLABLES += ["ae", "bri", "cul", "dra", "fen", "hal", "ix", "jor", "lum", "nes", "os", "pyr"]
+NOUNS = ["Drake", "Archivist", "Pact", "Bolt", "Sentinel", "Rites", "Familiar", "Colossus"]
+NOUNS += ["Growth", "Revenant", "Charm", "Oath", "Vanguard", "Harvest", "Idol", "Tyrant"]
+COLORS = ["W", "U", "B", "R", "G"]
+SUBTYPES = ["Elf", "Goblin", "Zombie", "Human", "Wizard", "Dragon", "Soldier", "Vampire"]
+SUBTYPES += ["Merfolk", "Angel", "Spirit", "Beast"]
+KEYWORDS = ["Flying", "Trample", "Lifelink", "Deathtouch", "Haste", "Vigilance", "Reach"]
+KEYWORDS += ["Flash", "Menace", "First strike"]
+ARTISTS = ["Rebecca Guay", "Terese Nielsen", "John Avon", "Seb McKinnon", "Kev Walker"]
+RARITIES = ["common", "common", "common", "uncommon", "uncommon", "rare", "mythic"]
+FORMATS = ["standard", "pioneer", "modern", "legacy", "vintage", "commander", "pauper"]
+
+# (type line, weight); creature lines get a subtype appended
+TYPES = [
+    ("Creature", 40),
+    ("Legendary Creature", 4),
+    ("Instant", 12),
+    ("Sorcery", 12),
+    ("Enchantment", 8),
+    ("Artifact", 8),
+    ("Land", 10),
+    ("Artifact Creature", 3),
+    ("Legendary Planeswalker", 2),
+]
+
+# Rules text built from the patterns synergy detection and TF-IDF key on
+PHRASES = [
+    "When {name} enters, draw a card.",
+    "Whenever another creature you control dies, each opponent loses 1 life.",
+    "Sacrifice a creature: Add {{B}}.",
+    "Create a 1/1 white Soldier creature token.",
+    "Whenever you gain life, put a +1/+1 counter on target creature.",
+    "Put a +1/+1 counter on each creature you control.",
+    "Proliferate.",
+    "{name} deals 3 damage to any target.",
+    "Destroy target creature an opponent controls.",
+    "Counter target spell.",
+    "Search your library for a basic land card, put it onto the battlefield tapped.",
+    "Whenever {name} deals combat damage to a player, draw a card.",
+    "Return target creature card from your graveyard to your hand.",
+    "Creatures you control get +1/+1 until end of turn.",
+    "You gain 3 life.",
+    "Exile target artifact or enchantment.",
+    "Whenever you cast an instant or sorcery spell, scry 1.",
+    "At the beginning of your end step, create a Treasure token.",
+    "Other {subtype} creatures you control get +1/+1.",
+    "Target creature fights another target creature.",
+]
+
+SET_SIZE = 250
+
+
+def _word(index: int) -> str:
+    """A made-up word for an index (distinct indexes give distinct words)."""
+    parts = []
+    while True:
+        index, digit = divmod(index, len(SYLLABLES))
+        parts.append(SYLLABLES[digit])
+        if index == 0 and len(parts) >= 2:
+            break
+    return "".join(parts).capitalize()
+
+
+def card_names(count: int) -> list[str]:
+    """The first ``count`` card names of the pool, unique and stable across seeds."""
+    return [f"{_word(i)} {NOUNS[i % len(NOUNS)]}" for i in range(count)]
+
+
+def _set_code(index: int) -> str:
+    letters = ""
+    index += 26 * 26  # Three letters
+    while index:
+        index, digit = divmod(index, 26)
+        letters = chr(ord("a") + digit) + letters
+    return letters
+
+
+def _mana_cost(cmc: int, colors: list[str]) -> str:
+    colored = [colors[i % len(colors)] for i in range(min(cmc, 2))] if colors else []
+    generic = cmc - len(colored)
+    return ("{" + str(generic) + "}" if generic else "") + "".join(f"{{{c}}}" for c in colored)
+
+
+def _card(index: int, name: str, rng: random.Random) -> dict[str, Any]:
+    """One card's oracle fields (printings add set, number, rarity and prices)."""
+    type_line = rng.choices([t for t, _ in TYPES], [w for _, w in TYPES])[0]
+    colors = [] if type_line == "Land" else sorted(rng.sample(COLORS, rng.choice([0, 1, 1, 1, 2])))
+    subtype = rng.choice(SUBTYPES)
+    if "Creature" in type_line:
+        type_line += f" — {subtype}"
+    cmc = 0 if type_line == "Land" else rng.randint(1, 7)
+    keywords = (
+        sorted(rng.sample(KEYWORDS, rng.choice([0, 0, 1, 2]))) if "Creature" in type_line else []
+    )
+    text = [", ".join(keywords)] if keywords else []
+    text += [
+        phrase.format(name=name, subtype=subtype)
+        for phrase in rng.sample(PHRASES, rng.randint(1, 3))
+    ]
+    if type_line == "Land":
+        text = [f"{{T}}: Add {{{rng.choice(COLORS)}}}."]
+    card: dict[str, Any] = {
+        "oracle_id": f"oracle-{index:06d}",
+        "name": name,
+        "layout": "normal",
+        "mana_cost": _mana_cost(cmc, colors) if cmc else "",
+        "cmc": float(cmc),
+        "colors": colors,
+        "color_identity": colors,
+        "type_line": type_line,
+        "oracle_text": "\n".join(text),
+        "keywords": keywords,
+        "artist": rng.choice(ARTISTS),
+        "legalities": {
+            fmt: "legal"
+            if fmt in ("legacy", "vintage", "commander") or rng.random() < 0.4
+            else "not_legal"
+            for fmt in FORMATS
+        },
+    }
+    if "Creature" in type_line:
+        card["power"] = str(rng.randint(0, 6))
+        card["toughness"] = str(rng.randint(1, 6))
+    if "Planeswalker" in type_line:
+        card["loyalty"] = str(rng.randint(2, 6))
+    return card
+
+
+def generate(
+    count: int, seed: int = 0
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Generate ``count`` cards with one to three printings each.
+
+    Returns:
+        Scryfall card printings, MTGJson set list entries and Scryfall rulings
+    """
+    rng = random.Random(seed)
+    names = card_names(count)
+    ranks = list(range(1, count + 1))
+    rng.shuffle(ranks)
+
+    printings: list[dict[str, Any]] = []
+    rulings: list[dict[str, Any]] = []
+    for index, name in enumerate(names):
+        card = _card(index, name, rng)
+        card["edhrec_rank"] = ranks[index]
+        for _ in range(rng.choice([1, 1, 1, 2, 2, 3])):
+            printings.append(dict(card))
+        if rng.random() < 0.2:
+            rulings.append(
+                {
+                    "oracle_id": card["oracle_id"],
+                    "source": "wotc",
+                    "published_at": "2020-01-01",
+                    "comment": f"{name} can target itself.",
+                }
+            )
+
+    # Deal printings into sets in order so each set has a spread of cards
+    rng.shuffle(printings)
+    sets: list[dict[str, Any]] = []
+    for number, card in enumerate(printings):
+        set_index, collector_number = divmod(number, SET_SIZE)
+        if collector_number == 0:
+            year = 1995 + set_index % 30
+            sets.append(
+                {
+                    "code": _set_code(set_index).upper(),
+                    "name": f"{_word(set_index + 7)} {NOUNS[set_index % len(NOUNS)]}s",
+                    "type": rng.choice(["expansion", "expansion", "core", "commander"]),
+                    "releaseDate": f"{year}-{1 + set_index % 12:02d}-01",
+                    "baseSetSize": SET_SIZE,
+                    "totalSetSize": SET_SIZE,
+                }
+            )
+        usd = round(rng.paretovariate(1.5) * 0.1, 2)
+        card.update(
+            {
+                "id": f"card-{number:07d}",
+                "set": _set_code(set_index),
+                "set_name": sets[-1]["name"],
+                "released_at": sets[-1]["releaseDate"],
+                "collector_number": str(collector_number + 1),
+                "rarity": rng.choice(RARITIES),
+                "prices": {"usd": f"{usd:.2f}", "usd_foil": f"{usd * 2:.2f}"},
+                "finishes": ["nonfoil", "foil"],
+            }
+        )
+    return printings, sets, rulings
+
+
+def build_mtg_db(path: Path, count: int, seed: int = 0) -> None:
+    """Build a synthetic mtg.sqlite with ``count`` distinct cards through the real ingest."""
+    printings, sets, rulings = generate(count, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = Path(tmp)
+        for file_name, data in [
+            ("cards.json", printings),
+            ("sets.json", {"data": sets}),
+            ("rulings.json", rulings),
+        ]:
+            (sources / file_name).write_text(json.dumps(data))
+        create_mtg_db.console.quiet = True
+        try:
+            create_mtg_db.build_unified_db(
+                path,
+                sources / "cards.json",
+                sources / "sets.json",
+                sources / "rulings.json",
+                scryfall_updated_at=f"synthetic-{count}-{seed}",
+            )
+        finally:
+            create_mtg_db.console.quiet = False
+
+
+def _pick(names: list[str], rng: random.Random, staple_share: float) -> str:
+    """Pick a staple (skewed towards the first few hundred names) or any name."""
+    if rng.random() < staple_share:
+        return names[min(int((rng.paretovariate(1.1) - 1) * 50), len(names) - 1)]
+    return rng.choice(names)
+
+
+def build_combos_db(path: Path, names: list[str], count: int, seed: int = 0) -> None:
+    """Build a synthetic Commander Spellbook combos.sqlite of ``count`` combos over ``names``."""
+    rng = random.Random(seed)
+    path.unlink(missing_ok=True)
+    conn = create_database(path)
+    try:
+        combos = []
+        combo_cards = []
+        for i in range(count):
+            cards = sorted({_pick(names, rng, 0.3) for _ in range(rng.randint(2, 4))})
+            combo_id = f"{i}-{len(cards)}"
+            combos.append(
+                (
+                    combo_id,
+                    "".join(sorted(rng.sample(COLORS, rng.randint(1, 3)))),
+                    "",
+                    rng.randint(2, 10),
+                    rng.choice("CPSR"),
+                    int(rng.paretovariate(1.2) * 100),
+                    " ".join(f"Activate {card}." for card in cards),
+                    json.dumps(cards),
+                    json.dumps([rng.choice(["Infinite mana", "Infinite damage", "Win the game"])]),
+                    "OK",
+                )
+            )
+            combo_cards += [(combo_id, card, '["B"]') for card in cards]
+        conn.executemany("INSERT INTO combos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", combos)
+        conn.executemany(
+            "INSERT INTO combo_cards (combo_id, card_name, zone_locations) VALUES (?, ?, ?)",
+            combo_cards,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def ensure_databases(data_dir: Path, cards: int, combos: int, seed: int = 0) -> tuple[Path, Path]:
+    """Build (or reuse from an earlier run) the card and combo databases for a size and seed.
+
+    Returns:
+        Paths of mtg.sqlite and combos.sqlite
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    mtg_path = data_dir / f"mtg-{cards}-s{seed}.sqlite"
+    combos_path = data_dir / f"combos-{combos}-{cards}-s{seed}.sqlite"
+    if not mtg_path.exists():
+        partial = mtg_path.with_suffix(".partial")
+        build_mtg_db(partial, cards, seed)
+        partial.replace(mtg_path)
+    if not combos_path.exists():
+        partial = combos_path.with_suffix(".partial")
+        build_combos_db(partial, card_names(cards), combos, seed)
+        partial.replace(combos_path)
+    return mtg_path, combos_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--cards", type=int, default=20000)
+    parser.add_argument("--combos", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mtg_path, combos_path = ensure_databases(args.out_dir, args.cards, args.combos, args.seed)
+    with sqlite3.connect(mtg_path) as conn:
+        printings = conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+    conn.close()
+    print(f"mtg.sqlite    {mtg_path} ({args.cards} cards, {printings} printings)")
+    print(f"combos.sqlite {combos_path} ({args.combos} combos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,11 @@ def _get_default_combo_db_path() -> Path:
     return Path.home() / ".mtg-spellbook" / "combos.sqlite"
 
 
+def _get_default_daemon_socket_path() -> Path:
+    """Get default path to the card lookup daemon's socket."""
+    return Path.home() / ".mtg-spellbook" / "daemon.sock"
+
+
 def _get_default_image_cache_path() -> Path:
     """Get default path to image cache directory."""
     return Path.home() / ".cache" / "mtg-spellbook" / "images"
@@ -83,6 +88,10 @@ class Settings(BaseSettings):
         default=3600,
         description="Cache TTL in seconds",
     )
+    cache_max_mb: int = Field(
+        default=64,
+        description="Approximate memory budget for cached cards, printings and sets in MB",
+    )
 
     # Query performance logging
     log_slow_queries: bool = Field(
@@ -100,6 +109,16 @@ class Settings(BaseSettings):
         description="Maximum concurrent database operations (semaphore limit)",
     )
 
+    # Card lookup daemon (mtg-daemon serve)
+    use_daemon: bool = Field(
+        default=True,
+        description="Attach to the card lookup daemon when it is running, else open in-process",
+    )
+    daemon_socket_path: Path = Field(
+        default_factory=_get_default_daemon_socket_path,
+        description="Unix socket the card lookup daemon listens on",
+    )
+
     # Image cache settings
     image_cache_dir: Path = Field(
         default_factory=_get_default_image_cache_path,
@@ -0,0 +1,30 @@
+"""Optional card lookup daemon shared by the TUI and MCP server.
+
+``mtg-daemon serve`` keeps one warm UnifiedDatabase, HybridRecommender and
+SpellbookComboDetector for every frontend on the box. DatabaseManager attaches
+to it when its socket exists (and points the recommender and combo detector
+singletons at the daemon's) and otherwise opens the card database in-process
+as before.
+"""
+
+from __future__ import annotations
+
+from .client import (
+    RemoteComboDetector,
+    RemoteDatabase,
+    RemoteIndex,
+    RemoteRecommender,
+    connect_daemon,
+)
+from .server import CardDaemon
+from .stats import LatencyHistogram
+
+__all__ = [
+    "CardDaemon",
+    "LatencyHistogram",
+    "RemoteComboDetector",
+    "RemoteDatabase",
+    "RemoteIndex",
+    "RemoteRecommender",
+    "connect_daemon",
+]
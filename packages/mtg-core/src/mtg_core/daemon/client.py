@@ -0,0 +1,449 @@
+"""Client side of the card lookup daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import itertools
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ..tools.recommendations.hybrid import HybridRecommender
+from ..tools.recommendations.spellbook_combos import SpellbookComboDetector
+from .protocol import (
+    COMBOS,
+    DATABASE,
+    METHODS,
+    PROTOCOL_VERSION,
+    RECOMMENDER,
+    STREAM_METHODS,
+    TARGET_METHODS,
+    TARGET_PROPERTIES,
+    Kind,
+    decode,
+    decode_error,
+    encode,
+    is_same_user,
+    read_frame,
+    recv_frame,
+    send_frame,
+    write_frame,
+)
+from .stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from ..data.database.unified import UnifiedDatabase
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for a daemon to answer the handshake before running in-process
+CONNECT_TIMEOUT = 2.0
+
+
+class RemoteDatabase:
+    """Stand-in for UnifiedDatabase that forwards every call to the card daemon.
+
+    Has the same async methods (and async generator methods) as UnifiedDatabase;
+    calls may run concurrently over the one connection. Round trips are recorded
+    per method in ``latency``.
+
+    If the daemon goes away (stopped or restarted), the next call reattaches to
+    a daemon serving the same database, or else opens ``fallback`` and runs that
+    call and every later one in-process. Without a fallback it raises
+    ConnectionError.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        fallback: Callable[[], Awaitable[UnifiedDatabase]] | None = None,
+    ):
+        self.socket_path = socket_path
+        self.db_path: Path | None = None
+        self._fallback = fallback
+        self._local: UnifiedDatabase | None = None
+        self._recovering = asyncio.Lock()
+        self._generation = 0
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future[tuple[Kind, bytes]]] = {}
+        self.latency: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._attach(reader, writer)
+
+    @classmethod
+    async def connect(
+        cls,
+        socket_path: Path,
+        fallback: Callable[[], Awaitable[UnifiedDatabase]] | None = None,
+    ) -> tuple[RemoteDatabase, Path]:
+        """Connect and handshake.
+
+        Returns:
+            The client and the path of the card database the daemon serves.
+
+        Raises:
+            PermissionError: The process listening on the socket runs as
+                another user.
+        """
+        reader, writer = await _open_connection(socket_path)
+        remote = cls(socket_path, reader, writer, fallback)
+        try:
+            remote.db_path = await remote._handshake()
+        except BaseException:
+            await remote.close()
+            raise
+        return remote, remote.db_path
+
+    @property
+    def attached(self) -> bool:
+        """Whether calls go to the daemon (False once running in-process)."""
+        return self._local is None
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name in STREAM_METHODS:
+
+            async def stream(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                for batch in await self.call(name, *args, **kwargs):
+                    yield batch
+
+            return stream
+        if name in METHODS:
+
+            async def call(*args: Any, **kwargs: Any) -> Any:
+                return await self.call(name, *args, **kwargs)
+
+            return call
+        raise AttributeError(name)
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a UnifiedDatabase method on the daemon.
+
+        An async generator method returns the list of batches it yielded.
+        """
+        start = time.perf_counter()
+        generation = self._generation
+        try:
+            try:
+                return await self._call(method, args, kwargs)
+            except ConnectionError:
+                await self._recover(generation)
+                return await self._call(method, args, kwargs)
+        finally:
+            self.latency[method].record(time.perf_counter() - start)
+
+    async def daemon_stats(self) -> dict[str, LatencyHistogram]:
+        """The daemon's per-method service time histograms (all clients)."""
+        stats: dict[str, LatencyHistogram] = await self._request(Kind.STATS, encode(None))
+        return stats
+
+    async def close(self) -> None:
+        """Close the connection (a fallback database is left to its owner)."""
+        self._read_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._read_task
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+    def _attach(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._read_task = asyncio.create_task(self._read_replies())
+        self._generation += 1
+
+    async def _handshake(self) -> Path:
+        _version, db_path = await self._request(Kind.HELLO, encode(PROTOCOL_VERSION))
+        return Path(db_path)
+
+    async def _call(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        if self._local is None:
+            return await self._request(Kind.CALL, encode((DATABASE, method, args, kwargs)))
+        if method not in METHODS:
+            raise AttributeError(f"UnifiedDatabase has no method {method!r}")
+        function: Any = getattr(self._local, method)
+        if method in STREAM_METHODS:
+            return [batch async for batch in function(*args, **kwargs)]
+        return await function(*args, **kwargs)
+
+    async def _recover(self, generation: int) -> None:
+        """Reattach after the connection dropped, or switch to the fallback.
+
+        ``generation`` is the connection the failed call used; when another
+        call has already recovered from losing it, there is nothing to do.
+        """
+        async with self._recovering:
+            if self._local is not None or self._generation != generation:
+                return
+            await self.close()
+            try:
+                reader, writer = await asyncio.wait_for(
+                    _open_connection(self.socket_path), CONNECT_TIMEOUT
+                )
+                self._attach(reader, writer)
+                served = await asyncio.wait_for(self._handshake(), CONNECT_TIMEOUT)
+                if self.db_path is not None and served.resolve() != self.db_path.resolve():
+                    raise ValueError(f"daemon now serves {served}")
+            except (OSError, TimeoutError, ValueError) as e:
+                await self.close()
+                if self._fallback is None:
+                    raise ConnectionError(f"Card daemon at {self.socket_path} lost: {e}") from e
+                logger.warning(
+                    "Card daemon at %s lost (%s); running in-process", self.socket_path, e
+                )
+                self._local = await self._fallback()
+            else:
+                logger.info("Reattached to card daemon at %s", self.socket_path)
+
+    async def _request(self, kind: Kind, payload: bytes) -> Any:
+        if self._read_task.done():
+            raise ConnectionError("Card daemon connection closed")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            write_frame(self._writer, request_id, kind, payload)
+            await self._writer.drain()
+            reply_kind, reply = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if reply_kind == Kind.ERROR:
+            raise decode_error(reply)
+        return decode(reply)
+
+    async def _read_replies(self) -> None:
+        error: Exception = ConnectionError("Card daemon connection closed")
+        try:
+            while True:
+                request_id, kind, payload = await read_frame(self._reader)
+                future = self._pending.get(request_id)
+                if future is not None and not future.done():
+                    future.set_result((kind, payload))
+        except ValueError as e:
+            error = e
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+class RemoteIndex:
+    """Blocking stand-in for an object the card daemon owns.
+
+    Has the same public methods and properties as the object it stands in for,
+    answered by the daemon over a blocking connection of its own, so callers
+    keep their synchronous API from the event loop or worker threads alike (one
+    call at a time). Never call it from the thread running the daemon itself.
+
+    If the daemon goes away, a call reconnects to a restarted one serving the
+    same card database, or else builds the object in-process with ``fallback``
+    and uses that from then on.
+    """
+
+    target: ClassVar[str]
+    stands_in_for: ClassVar[type]
+
+    def __init__(self, socket_path: Path, db_path: Path, fallback: Callable[[], Any]):
+        self.socket_path = socket_path
+        self.db_path = db_path
+        self._fallback = fallback
+        self._local: Any = None
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.latency: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+
+    @property
+    def attached(self) -> bool:
+        """Whether calls go to the daemon (False once running in-process)."""
+        return self._local is None
+
+    def __getattr__(self, name: str) -> Any:
+        if name in TARGET_PROPERTIES[self.target]:
+            return self.call(name)
+        if name not in TARGET_METHODS[self.target]:
+            raise AttributeError(name)
+        if inspect.iscoroutinefunction(getattr(self.stands_in_for, name)):
+
+            async def call(*args: Any, **kwargs: Any) -> Any:
+                return await asyncio.to_thread(self.call, name, *args, **kwargs)
+
+            return call
+        return functools.partial(self.call, name)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a method, or read a property, of the daemon's object."""
+        if self._local is None:
+            start = time.perf_counter()
+            try:
+                return self._remote_call(name, args, kwargs)
+            except ConnectionError:
+                pass  # Switched to the in-process fallback
+            finally:
+                self.latency[name].record(time.perf_counter() - start)
+        value = getattr(self._local, name)
+        return value(*args, **kwargs) if name in TARGET_METHODS[self.target] else value
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+    def _remote_call(self, name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Call the daemon, reconnecting once.
+
+        Raises:
+            ConnectionError: The daemon is gone; later calls run in-process.
+        """
+        payload = encode((self.target, name, args, kwargs))
+        with self._lock:
+            if self._local is not None:
+                raise ConnectionError("Card daemon lost; running in-process")
+            for _attempt in range(2):
+                try:
+                    kind, reply = self._request(payload)
+                    break
+                except OSError as e:
+                    self._disconnect()
+                    error = e
+            else:
+                logger.warning(
+                    "Card daemon at %s lost (%s); building the %s in-process",
+                    self.socket_path,
+                    error,
+                    self.target,
+                )
+                self._local = self._fallback()
+                raise ConnectionError(f"Card daemon at {self.socket_path} lost") from error
+        if kind == Kind.ERROR:
+            raise decode_error(reply)
+        return decode(reply)
+
+    def _request(self, payload: bytes) -> tuple[Kind, bytes]:
+        sock = self._connect()
+        send_frame(sock, next(self._ids), Kind.CALL, payload)
+        _request_id, kind, reply = recv_frame(sock)
+        return kind, reply
+
+    def _connect(self) -> socket.socket:
+        """The connection, opened and handshaken on first use."""
+        if self._sock is not None:
+            return self._sock
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(self.socket_path))
+            if not is_same_user(sock):
+                raise PermissionError(f"{self.socket_path} is served by another user")
+            send_frame(sock, next(self._ids), Kind.HELLO, encode(PROTOCOL_VERSION))
+            _request_id, kind, reply = recv_frame(sock)
+            if kind == Kind.ERROR:
+                raise ConnectionRefusedError(str(decode_error(reply)))
+            _version, served = decode(reply)
+            if Path(served).resolve() != self.db_path.resolve():
+                raise ConnectionRefusedError(f"Card daemon now serves {served}")
+            sock.settimeout(None)  # Calls may wait for the daemon to build the index
+        except BaseException:
+            sock.close()
+            raise
+        self._sock = sock
+        return sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class RemoteRecommender(RemoteIndex):
+    """HybridRecommender served by the card daemon, which builds it once for everyone."""
+
+    target = RECOMMENDER
+    stands_in_for = HybridRecommender
+
+    def __init__(self, socket_path: Path, db_path: Path):
+        super().__init__(socket_path, db_path, HybridRecommender)
+
+    async def initialize(self, db: UnifiedDatabase) -> float:
+        """Wait until the daemon's recommender is built and return its build time.
+
+        Once running in-process, builds the fallback recommender from ``db``.
+        """
+        if self._local is None:
+            with contextlib.suppress(ConnectionError):
+                init_time: float = await asyncio.to_thread(self._remote_call, "initialize", (), {})
+                return init_time
+        return float(await self._local.initialize(db))
+
+
+def _local_combo_detector() -> SpellbookComboDetector:
+    detector = SpellbookComboDetector()
+    detector.initialize()
+    return detector
+
+
+class RemoteComboDetector(RemoteIndex):
+    """SpellbookComboDetector served by the card daemon, sharing its combo index."""
+
+    target = COMBOS
+    stands_in_for = SpellbookComboDetector
+
+    def __init__(self, socket_path: Path, db_path: Path):
+        super().__init__(socket_path, db_path, _local_combo_detector)
+
+
+async def _open_connection(
+    socket_path: Path,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to the socket, refusing a listener that runs as another user."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    if not is_same_user(writer):
+        writer.close()
+        raise PermissionError(f"{socket_path} is served by another user")
+    return reader, writer
+
+
+async def connect_daemon(
+    socket_path: Path,
+    mtg_db_path: Path,
+    fallback: Callable[[], Awaitable[UnifiedDatabase]] | None = None,
+) -> RemoteDatabase | None:
+    """Attach to the card daemon, or None to run in-process.
+
+    None when no daemon listens on socket_path, the socket belongs to another
+    user, the daemon does not answer in time, it speaks another protocol
+    version or it serves a different card database. ``fallback`` opens the
+    in-process database the client switches to if the daemon goes away later.
+    """
+    try:
+        owner = socket_path.stat().st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        logger.warning("Card daemon socket %s belongs to another user; ignoring it", socket_path)
+        return None
+    try:
+        remote, served = await asyncio.wait_for(
+            RemoteDatabase.connect(socket_path, fallback), CONNECT_TIMEOUT
+        )
+    except (OSError, TimeoutError, ValueError) as e:
+        logger.info("Card daemon at %s unavailable (%s); running in-process", socket_path, e)
+        return None
+    if served.resolve() != mtg_db_path.resolve():
+        logger.warning("Card daemon serves %s, not %s; running in-process", served, mtg_db_path)
+        await remote.close()
+        return None
+    logger.info("Attached to card daemon at %s", socket_path)
+    return remote
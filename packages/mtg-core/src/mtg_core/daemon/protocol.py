@@ -0,0 +1,250 @@
+"""Wire format between the card lookup daemon and its clients.
+
+Every message is one frame: a 9-byte header (request id, kind, payload
+length; network byte order) followed by a pickled payload. Requests name a
+target (the ``UnifiedDatabase``, ``HybridRecommender`` or
+``SpellbookComboDetector`` the daemon owns) and one of its public methods or
+properties with the call's arguments, so a client can stand in for each
+without a schema per call; results come back as the same models and rows the
+method returns in-process.
+
+Payloads are unpickled with an allowlist: only builtin containers and scalars,
+builtin exceptions and the models, rows and errors defined in ``mtg_core`` can
+be rebuilt, so a frame cannot name an arbitrary callable to run. Both ends also
+check that the other end of the socket runs as the same user before decoding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import dataclasses
+import inspect
+import io
+import os
+import pickle
+import socket
+import struct
+import sys
+from enum import IntEnum
+from typing import Any
+
+from pydantic import BaseModel
+
+from ..data.database.unified import UnifiedDatabase
+from ..tools.recommendations.hybrid import HybridRecommender
+from ..tools.recommendations.spellbook_combos import SpellbookComboDetector
+
+PROTOCOL_VERSION = 2
+
+HEADER = struct.Struct("!IBI")
+
+# struct ucred: pid, uid, gid
+_PEERCRED = struct.Struct("3i")
+
+# Largest payload either end will read (a full set stream is a few MB)
+MAX_PAYLOAD = 256 * 1024 * 1024
+
+
+class Kind(IntEnum):
+    """What a frame carries."""
+
+    HELLO = 1  # Request: PROTOCOL_VERSION. Reply: RESULT (version, card database path)
+    CALL = 2  # Request: (target, method, args, kwargs)
+    STATS = 3  # Request: None. Reply: RESULT {method: LatencyHistogram}
+    RESULT = 4  # Reply: the method's return value
+    STREAM = 5  # Reply: every batch an async generator method yielded
+    ERROR = 6  # Reply: (exception type, args, attributes)
+
+
+def _is_public(name: str) -> bool:
+    return not name.startswith("_")
+
+
+# Methods a client may call: UnifiedDatabase's public coroutines and async generators
+METHODS = frozenset(
+    name
+    for name, member in inspect.getmembers(UnifiedDatabase, inspect.isfunction)
+    if _is_public(name)
+    and (inspect.iscoroutinefunction(member) or inspect.isasyncgenfunction(member))
+)
+STREAM_METHODS = frozenset(
+    name for name in METHODS if inspect.isasyncgenfunction(getattr(UnifiedDatabase, name))
+)
+
+# What a CALL is for
+DATABASE = "database"
+RECOMMENDER = "recommender"
+COMBOS = "combos"
+
+
+def _public_methods(cls: type) -> frozenset[str]:
+    return frozenset(
+        name for name, _ in inspect.getmembers(cls, inspect.isfunction) if _is_public(name)
+    )
+
+
+def _public_properties(cls: type) -> frozenset[str]:
+    return frozenset(
+        name
+        for name, _ in inspect.getmembers(cls, lambda member: isinstance(member, property))
+        if _is_public(name)
+    )
+
+
+# Methods and properties a client may call on each target
+TARGET_METHODS = {
+    DATABASE: METHODS,
+    RECOMMENDER: _public_methods(HybridRecommender),
+    COMBOS: _public_methods(SpellbookComboDetector),
+}
+TARGET_PROPERTIES = {
+    DATABASE: frozenset[str](),
+    RECOMMENDER: _public_properties(HybridRecommender),
+    COMBOS: _public_properties(SpellbookComboDetector),
+}
+
+
+def _wire_class(module: str, name: str) -> type | None:
+    """The class a payload may reference by module and name, or None if not allowed.
+
+    Only classes from modules already imported are considered, so decoding never
+    imports anything either.
+    """
+    if module == "builtins":
+        cls = getattr(builtins, name, None)
+        if cls in (set, frozenset) or (isinstance(cls, type) and issubclass(cls, Exception)):
+            return cls
+        return None
+    if module.split(".", 1)[0] != "mtg_core" or module not in sys.modules:
+        return None
+    cls = getattr(sys.modules[module], name, None)
+    if not isinstance(cls, type) or cls.__module__ != module:
+        return None
+    if (
+        issubclass(cls, (BaseModel, Exception))
+        or dataclasses.is_dataclass(cls)
+        or (issubclass(cls, tuple) and hasattr(cls, "_fields"))
+    ):
+        return cls
+    return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        cls = _wire_class(module, name)
+        if cls is None:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a payload")
+        return cls
+
+
+def encode(value: Any) -> bytes:
+    """Serialize a payload."""
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode(payload: bytes) -> Any:
+    """Deserialize a payload.
+
+    Raises:
+        ValueError: The payload references a class outside the allowlist or is
+            not a valid pickle.
+    """
+    try:
+        return _Unpickler(io.BytesIO(payload)).load()
+    except (pickle.UnpicklingError, EOFError) as e:
+        raise ValueError(f"Malformed payload: {e}") from e
+
+
+def encode_error(exc: BaseException) -> bytes:
+    """Serialize an exception so the client re-raises the same type.
+
+    Sent as (type, args, attributes) rather than the exception itself: MTGError
+    subclasses build their message in ``__init__``, so unpickling would call it
+    again on the finished message. Exception types the other end may not
+    rebuild are sent as RuntimeError.
+    """
+    exc_type = type(exc)
+    if _wire_class(exc_type.__module__, exc_type.__qualname__) is exc_type:
+        try:
+            return encode((exc_type, exc.args, dict(vars(exc))))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pass
+    return encode((RuntimeError, (f"{exc_type.__name__}: {exc}",), {}))
+
+
+def decode_error(payload: bytes) -> BaseException:
+    """Rebuild an exception sent with encode_error()."""
+    exc_type, args, attributes = decode(payload)
+    exc: BaseException = exc_type.__new__(exc_type)
+    exc.args = args
+    vars(exc).update(attributes)
+    return exc
+
+
+def peer_uid(connection: asyncio.StreamWriter | socket.socket) -> int | None:
+    """The user id of the process at the other end of a Unix socket.
+
+    None where the platform does not report peer credentials (SO_PEERCRED).
+    """
+    if isinstance(connection, socket.socket):
+        sock: Any = connection
+    else:
+        sock = connection.get_extra_info("socket")
+    if sock is None or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEERCRED.size)
+    _pid, uid, _gid = _PEERCRED.unpack(creds)
+    return int(uid)
+
+
+def is_same_user(connection: asyncio.StreamWriter | socket.socket) -> bool:
+    """Whether the other end of the socket runs as this process's user."""
+    uid = peer_uid(connection)
+    return uid is None or uid == os.getuid()
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, Kind, bytes]:
+    """Read one frame.
+
+    Raises:
+        asyncio.IncompleteReadError: The other end closed the connection.
+        ValueError: The frame is not one this protocol sends.
+    """
+    request_id, kind, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if length > MAX_PAYLOAD:
+        raise ValueError(f"Frame of {length} bytes exceeds {MAX_PAYLOAD}")
+    return request_id, Kind(kind), await reader.readexactly(length)
+
+
+def write_frame(writer: asyncio.StreamWriter, request_id: int, kind: Kind, payload: bytes) -> None:
+    """Queue one frame on writer (a single write, so concurrent replies never interleave)."""
+    writer.write(HEADER.pack(request_id, kind, len(payload)) + payload)
+
+
+def send_frame(sock: socket.socket, request_id: int, kind: Kind, payload: bytes) -> None:
+    """Send one frame on a blocking socket."""
+    sock.sendall(HEADER.pack(request_id, kind, len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> tuple[int, Kind, bytes]:
+    """Read one frame from a blocking socket.
+
+    Raises:
+        ConnectionError: The other end closed the connection.
+        ValueError: The frame is not one this protocol sends.
+    """
+    request_id, kind, length = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    if length > MAX_PAYLOAD:
+        raise ValueError(f"Frame of {length} bytes exceeds {MAX_PAYLOAD}")
+    return request_id, Kind(kind), _recv_exactly(sock, length)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(min(size - len(buffer), 1 << 20))
+        if not chunk:
+            raise ConnectionError("Card daemon connection closed")
+        buffer += chunk
+    return bytes(buffer)
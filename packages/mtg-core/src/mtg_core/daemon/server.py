@@ -0,0 +1,249 @@
+"""Card lookup daemon: one warm database and recommender shared by every frontend on the box."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import os
+import socket
+import stat
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from ..config import Settings, get_settings
+from ..data.database.manager import DatabaseManager
+from ..tools.recommendations.hybrid import HybridRecommender
+from ..tools.recommendations.spellbook_combos import SpellbookComboDetector
+from .protocol import (
+    COMBOS,
+    DATABASE,
+    PROTOCOL_VERSION,
+    RECOMMENDER,
+    STREAM_METHODS,
+    TARGET_METHODS,
+    TARGET_PROPERTIES,
+    Kind,
+    decode,
+    encode,
+    encode_error,
+    is_same_user,
+    read_frame,
+    write_frame,
+)
+from .stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CardDaemon:
+    """Answer card lookups from TUIs and MCP servers over a Unix socket.
+
+    Owns the connection, card cache and the per-connection indexes UnifiedDatabase
+    builds (set list, oracle and set index flags), plus the HybridRecommender
+    (TF-IDF matrix, card features) and SpellbookComboDetector (combo index), so
+    attached processes skip building them and share one copy. The recommender
+    and detector are built in the background after start(); calls to them wait
+    for it. Each connection may have many requests in flight; replies carry the
+    request id and can arrive out of order.
+    """
+
+    def __init__(self, settings: Settings | None = None, socket_path: Path | None = None):
+        self._settings = settings or get_settings()
+        self.socket_path = socket_path or self._settings.daemon_socket_path
+        self._manager = DatabaseManager(self._settings, attach_daemon=False)
+        self._server: asyncio.Server | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._clients: set[asyncio.StreamWriter] = set()
+        # Built in the background after start(), each on its own so one failing spares the other
+        self._indexes: dict[str, asyncio.Task[Any]] = {}
+        self.latency: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+
+    async def start(self) -> None:
+        """Open and warm the database, then listen on the socket.
+
+        Raises:
+            RuntimeError: Another daemon is already listening on the socket, or
+                its directory is not private to this user.
+        """
+        self._make_private_dir()
+        if await self._socket_in_use():
+            raise RuntimeError(f"A card daemon is already listening on {self.socket_path}")
+        self.socket_path.unlink(missing_ok=True)  # Left behind by a daemon that died
+
+        await self._manager.start()
+        db = self._manager.db
+        start = time.perf_counter()
+        await db.get_database_stats()
+        await db.get_all_sets()
+        await db.has_oracle_cards()
+        await db.has_set_index()
+        logger.info("Card database warmed in %.2fs", time.perf_counter() - start)
+        combos = asyncio.create_task(self._build_combos())
+        self._indexes = {
+            COMBOS: combos,
+            RECOMMENDER: asyncio.create_task(self._build_recommender(combos)),
+        }
+
+        self._server = await asyncio.start_unix_server(self._handle, sock=self._bind())
+        logger.info("Card daemon listening on %s", self.socket_path)
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            raise RuntimeError("CardDaemon not started. Call start() first.")
+        await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        """Stop listening, drop clients and close the database."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+        for task in list(self._tasks):
+            task.cancel()
+        for index in self._indexes.values():
+            index.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await index
+        self._indexes = {}
+        await self._manager.stop()
+
+    async def _build_combos(self) -> SpellbookComboDetector:
+        """Load the combo index every attached process shares."""
+        start = time.perf_counter()
+        combos = SpellbookComboDetector(self._settings.combo_db_path)
+        await asyncio.to_thread(combos.initialize)
+        logger.info("Combo detector built in %.2fs", time.perf_counter() - start)
+        return combos
+
+    async def _build_recommender(
+        self, combos: asyncio.Task[SpellbookComboDetector]
+    ) -> HybridRecommender:
+        """Build the recommender every attached process shares (on the shared combo index)."""
+        recommender = HybridRecommender(_spellbook_detector=await combos)
+        init_time = await recommender.initialize(self._manager.db)
+        logger.info("Recommender built in %.2fs", init_time)
+        return recommender
+
+    def _make_private_dir(self) -> None:
+        """Create the socket's directory owner-only, or check an existing one is ours."""
+        directory = self.socket_path.parent
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = directory.stat()
+        if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise RuntimeError(f"{directory} must be owned by this user and not writable by others")
+
+    def _bind(self) -> socket.socket:
+        """Bind the listening socket owner-only from the start.
+
+        Binding under a restrictive umask means there is no window in which
+        another user can connect before the permissions are tightened.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous = os.umask(0o177)
+        try:
+            sock.bind(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(previous)
+        return sock
+
+    async def _socket_in_use(self) -> bool:
+        if not self.socket_path.exists():
+            return False
+        try:
+            _reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection until it closes."""
+        if not is_same_user(writer):
+            logger.warning("Refusing card daemon client running as another user")
+            writer.close()
+            return
+        self._clients.add(writer)
+        try:
+            while True:
+                request_id, kind, payload = await read_frame(reader)
+                task = asyncio.create_task(self._reply(writer, request_id, kind, payload))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError:
+            logger.warning("Dropping client that sent a malformed frame", exc_info=True)
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _reply(
+        self, writer: asyncio.StreamWriter, request_id: int, kind: Kind, payload: bytes
+    ) -> None:
+        try:
+            reply_kind, reply = await self._answer(kind, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            reply_kind, reply = Kind.ERROR, encode_error(e)
+        if not writer.is_closing():
+            write_frame(writer, request_id, reply_kind, reply)
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+
+    async def _answer(self, kind: Kind, payload: bytes) -> tuple[Kind, bytes]:
+        if kind == Kind.HELLO:
+            if decode(payload) != PROTOCOL_VERSION:
+                raise ValueError(f"Card daemon speaks protocol {PROTOCOL_VERSION}")
+            return Kind.RESULT, encode((PROTOCOL_VERSION, str(self._settings.mtg_db_path)))
+        if kind == Kind.STATS:
+            return Kind.RESULT, encode(dict(self.latency))
+        if kind != Kind.CALL:
+            raise ValueError(f"Unexpected {kind.name} request")
+
+        target, method, args, kwargs = decode(payload)
+        if target not in TARGET_METHODS or not (
+            method in TARGET_METHODS[target] or method in TARGET_PROPERTIES[target]
+        ):
+            raise AttributeError(f"Card daemon {target!r} has no method {method!r}")
+        name = method if target == DATABASE else f"{target}.{method}"
+        start = time.perf_counter()
+        try:
+            return await self._call(target, method, args, kwargs)
+        finally:
+            self.latency[name].record(time.perf_counter() - start)
+
+    async def _call(
+        self, target: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Kind, bytes]:
+        if target == DATABASE:
+            function: Any = getattr(self._manager.db, method)
+            if method in STREAM_METHODS:
+                return Kind.STREAM, encode([batch async for batch in function(*args, **kwargs)])
+            return Kind.RESULT, encode(await function(*args, **kwargs))
+
+        if target not in self._indexes:
+            raise RuntimeError("CardDaemon not started. Call start() first.")
+        owner = await asyncio.shield(self._indexes[target])
+        if method in TARGET_PROPERTIES[target]:
+            return Kind.RESULT, encode(getattr(owner, method))
+        if target == RECOMMENDER and method == "initialize":
+            # Already built from the daemon's own database; report how long that took
+            args, kwargs = (self._manager.db,), {}
+        result = getattr(owner, method)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return Kind.RESULT, encode(result)
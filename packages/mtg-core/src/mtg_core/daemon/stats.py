@@ -0,0 +1,41 @@
+"""Per-request latency histograms for the card lookup daemon."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+# Bucket i counts requests that took under 2**i microseconds (the last is open-ended)
+BUCKET_COUNT = 28
+
+
+@dataclass
+class LatencyHistogram:
+    """Request latencies in power-of-two microsecond buckets."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * BUCKET_COUNT)
+    count: int = 0
+    total_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Count one request."""
+        micros = int(seconds * 1_000_000)
+        self.buckets[min(micros.bit_length(), BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound in seconds of the bucket holding this fraction of requests."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target:
+                return (1 << i) / 1_000_000
+        return (1 << (BUCKET_COUNT - 1)) / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total_seconds / self.count if self.count else 0.0
@@ -11,6 +11,7 @@ from .constants import (
 )
 from .fts import check_fts_available, get_fts_columns, prepare_fts_query, search_cards_fts
 from .manager import DatabaseManager, create_database
+from .meta import data_fingerprint, read_meta, write_build_meta
 from .migrations import (
     enable_wal_mode,
     ensure_artist_stats_cache,
@@ -18,10 +19,15 @@ from .migrations import (
     is_artist_cache_populated,
     refresh_artist_stats_cache,
 )
+from .oracle import build_oracle_cards, check_oracle_cards_available
 from .query import QueryBuilder
+from .rows import CardSummaryRow, PriceRow, PrintingRow, select_columns
+from .set_index import build_set_index, check_set_index_available
 from .unified import UnifiedDatabase
 from .user import (
     CollectionCardRow,
+    CollectionCursor,
+    CollectionFilter,
     CollectionHistoryRow,
     DeckCardRow,
     DeckRow,
@@ -37,7 +43,10 @@ __all__ = [
     "BaseDatabase",
     "CacheEntry",
     "CardCache",
+    "CardSummaryRow",
     "CollectionCardRow",
+    "CollectionCursor",
+    "CollectionFilter",
     "CollectionHistoryRow",
     "ComboCardRow",
     "ComboDatabase",
@@ -46,17 +55,27 @@ __all__ = [
     "DeckCardRow",
     "DeckRow",
     "DeckSummary",
+    "PriceRow",
+    "PrintingRow",
     "QueryBuilder",
     "UnifiedDatabase",
     "UserDatabase",
+    "build_oracle_cards",
+    "build_set_index",
     "check_fts_available",
+    "check_oracle_cards_available",
+    "check_set_index_available",
     "create_database",
+    "data_fingerprint",
     "enable_wal_mode",
     "ensure_artist_stats_cache",
     "get_cached_artist_for_spotlight",
     "get_fts_columns",
     "is_artist_cache_populated",
     "prepare_fts_query",
+    "read_meta",
     "refresh_artist_stats_cache",
     "search_cards_fts",
+    "select_columns",
+    "write_build_meta",
 ]
@@ -1,95 +1,163 @@
-"""Async-safe LRU cache with TTL support for cards."""
+"""LRU cache with TTL expiry and a memory budget for cards and related lookups."""
 
 from __future__ import annotations
 
-import asyncio
+import sys
 import time
 from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import Any
 
-if TYPE_CHECKING:
-    from ..models import Card
+from pydantic import BaseModel
 
+# Rough CPython object sizes used by estimate_size()
+_OBJECT_OVERHEAD = 56
+_STR_OVERHEAD = 49
+_SCALAR_SIZE = 28
+_POINTER_SIZE = 8
 
-@dataclass
+
+def estimate_size(value: object) -> int:
+    """Approximate the memory held by a cached value, in bytes.
+
+    Walks pydantic models, containers and strings instead of pickling, so sizing
+    a Card costs a fraction of decoding its row.
+    """
+    if value is None or isinstance(value, int | float | bool):
+        return _SCALAR_SIZE
+    if isinstance(value, str):
+        return _STR_OVERHEAD + len(value)
+    if isinstance(value, BaseModel):
+        return _OBJECT_OVERHEAD + sum(estimate_size(v) for v in value.__dict__.values())
+    if isinstance(value, dict):
+        return _OBJECT_OVERHEAD + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, list | tuple | set | frozenset):
+        return (
+            _OBJECT_OVERHEAD
+            + _POINTER_SIZE * len(value)
+            + sum(estimate_size(item) for item in value)
+        )
+    return sys.getsizeof(value)
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry with timestamp for TTL tracking."""
+    """Cache entry with timestamp for TTL tracking and its estimated size."""
 
-    card: Card
+    value: Any
     timestamp: float
+    size: int = 0
 
 
 @dataclass
 class CardCache:
-    """Async-safe LRU cache with TTL expiration for cards.
-
-    Uses OrderedDict for O(1) LRU operations and tracks entry timestamps
-    for TTL-based expiration.
+    """LRU cache with TTL expiration and an optional memory budget.
+
+    Holds cards (``name:...`` keys) and other per-card lookups such as printings
+    lists (``printings:...``) and sets (``set:...``). Operations never await, so
+    they are atomic on the event loop without a lock; use get_many()/set_many()
+    to look up a whole deck in one call. The async get()/set() wrappers remain
+    for existing callers.
+
+    Entries are kept twice in insertion-ordered dicts: ``_cache`` in LRU order
+    (moved on read) and ``_writes`` in write order. With a single TTL the write
+    order is also the expiry order, so expired entries are popped from the front
+    of ``_writes`` in amortized O(1) instead of scanning the cache on every insert.
     """
 
     _cache: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
     max_size: int = 1000
     ttl_seconds: int = 3600
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-
-    async def get(self, key: str) -> Card | None:
-        """Get a card from cache, returning None if expired or missing."""
-        async with self._lock:
-            if key not in self._cache:
-                return None
-
-            entry = self._cache[key]
-
-            # Check TTL expiration
-            if self._is_expired(entry):
-                del self._cache[key]
-                return None
-
-            # Move to end (most recently used) - O(1)
-            self._cache.move_to_end(key)
-            return entry.card
-
-    async def set(self, key: str, card: Card) -> None:
-        """Add a card to cache with current timestamp."""
-        async with self._lock:
-            now = time.monotonic()
+    max_bytes: int | None = None
+    _writes: OrderedDict[str, float] = field(default_factory=OrderedDict)
+    _bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def get_nowait(self, key: str) -> Any | None:
+        """Get a cached value, returning None if expired or missing."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if self._is_expired(entry):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        # Move to end (most recently used) - O(1)
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the cached values for ``keys``; missing and expired keys are left out."""
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self.get_nowait(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_nowait(self, key: str, value: Any) -> None:
+        """Add a value to the cache with the current timestamp."""
+        now = time.monotonic()
+        self._expire(now)
+        self._store(key, value, now)
+        self._evict_over_budget()
 
-            if key in self._cache:
-                # Update existing entry
-                self._cache[key] = CacheEntry(card=card, timestamp=now)
-                self._cache.move_to_end(key)
-            else:
-                # Evict expired entries first (lazy cleanup)
-                self._evict_expired()
+    def set_many(self, items: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> None:
+        """Add several values at once (expiry and eviction run once for the batch)."""
+        now = time.monotonic()
+        self._expire(now)
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            self._store(key, value, now)
+        self._evict_over_budget()
 
-                # Evict LRU if at capacity
-                if len(self._cache) >= self.max_size:
-                    self._cache.popitem(last=False)
+    async def get(self, key: str) -> Any | None:
+        """Get a value from cache, returning None if expired or missing."""
+        return self.get_nowait(key)
 
-                self._cache[key] = CacheEntry(card=card, timestamp=now)
+    async def set(self, key: str, value: Any) -> None:
+        """Add a value to cache with current timestamp."""
+        self.set_nowait(key, value)
 
     async def clear(self) -> None:
         """Clear the cache."""
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
+        self._writes.clear()
+        self._bytes = 0
 
     async def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
-        async with self._lock:
-            return self._evict_expired()
+        return self._expire(time.monotonic())
 
     async def stats(self) -> dict[str, int]:
         """Get cache statistics."""
-        async with self._lock:
-            now = time.monotonic()
-            expired_count = sum(1 for entry in self._cache.values() if self._is_expired(entry, now))
-            return {
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "ttl_seconds": self.ttl_seconds,
-                "expired_pending": expired_count,
-            }
+        deadline = time.monotonic() - self.ttl_seconds
+        expired_count = 0
+        for timestamp in self._writes.values():
+            if timestamp >= deadline:
+                break
+            expired_count += 1
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "expired_pending": expired_count,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes or 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
 
     def _is_expired(self, entry: CacheEntry, now: float | None = None) -> bool:
         """Check if a cache entry has expired."""
@@ -97,10 +165,37 @@ class CardCache:
             now = time.monotonic()
         return (now - entry.timestamp) > self.ttl_seconds
 
-    def _evict_expired(self) -> int:
-        """Remove expired entries. Must be called with lock held."""
-        now = time.monotonic()
-        expired_keys = [key for key, entry in self._cache.items() if self._is_expired(entry, now)]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+    def _store(self, key: str, value: Any, now: float) -> None:
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        if key in self._cache:
+            self._remove(key)
+        self._cache[key] = CacheEntry(value=value, timestamp=now, size=size)
+        self._writes[key] = now
+        self._bytes += size
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        del self._writes[key]
+        self._bytes -= entry.size
+
+    def _expire(self, now: float) -> int:
+        """Pop entries from the oldest write until one is still fresh."""
+        deadline = now - self.ttl_seconds
+        removed = 0
+        while self._writes:
+            key, timestamp = next(iter(self._writes.items()))
+            if timestamp >= deadline:
+                break
+            self._remove(key)
+            removed += 1
+        self.expirations += removed
+        return removed
+
+    def _evict_over_budget(self) -> None:
+        """Evict least recently used entries until within max_size and max_bytes."""
+        while len(self._cache) > self.max_size or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and self._cache
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self.evictions += 1
@@ -270,33 +270,47 @@ class ComboDatabase:
             Tuple of (complete_combos, potential_combos_with_missing)
             where potential_combos_with_missing is (combo, cards, missing_card_names)
         """
-        if not deck_card_names:
-            return [], []
+        return (await self.find_combos_in_decks([deck_card_names]))[0]
+
+    async def find_combos_in_decks(
+        self, decks: Sequence[Sequence[str]]
+    ) -> list[
+        tuple[
+            list[tuple[ComboRow, list[ComboCardRow]]],
+            list[tuple[ComboRow, list[ComboCardRow], list[str]]],
+        ]
+    ]:
+        """Find complete and potential combos in each of many decks.
 
-        deck_names_lower = {name.lower() for name in deck_card_names}
+        One query loads every combo touching any deck's cards; decks are then
+        bucketed by card and matched against the combos' posting lists in a
+        worker thread, so auditing many decks keeps the event loop free.
 
-        # Build parameterized query for deck card names
-        placeholders = ",".join("?" * len(deck_names_lower))
-        deck_names_list = list(deck_names_lower)
+        Returns:
+            Per deck, in order, what find_combos_in_deck() returns for it
+        """
+        deck_sets = [{name.lower() for name in deck} for deck in decks]
+        all_names = set().union(*deck_sets)
+        if not all_names:
+            return [([], []) for _ in decks]
 
-        # Find combos that have at least one card in the deck
-        # This filters at the SQL level instead of loading all combos
-        query = f"""
+        # Names go in as one JSON parameter: no SQL variable limit however many decks
+        query = """
             SELECT c.id, c.combo_type, c.description, c.colors,
                    cc.card_name, cc.card_name_lower, cc.role, cc.position
             FROM combos c
             JOIN combo_cards cc ON c.id = cc.combo_id
             WHERE c.id IN (
                 SELECT DISTINCT combo_id FROM combo_cards
-                WHERE card_name_lower IN ({placeholders})
+                WHERE card_name_lower IN (SELECT value FROM json_each(?))
             )
             ORDER BY c.id, cc.position
         """
 
-        async with self.conn.execute(query, deck_names_list) as cursor:
+        async with self._execute(query, (json.dumps(sorted(all_names)),)) as cursor:
             rows = await cursor.fetchall()
 
-        # Group rows by combo and track card presence
+        # Group rows by combo
         combos_data: dict[str, tuple[ComboRow, list[ComboCardRow]]] = {}
         for row in rows:
             combo_id = row["id"]
@@ -319,22 +333,7 @@ class ComboDatabase:
                 )
             )
 
-        # Categorize combos as complete or potential
-        complete: list[tuple[ComboRow, list[ComboCardRow]]] = []
-        potential: list[tuple[ComboRow, list[ComboCardRow], list[str]]] = []
-
-        for combo, cards in combos_data.values():
-            combo_card_names = {c.card_name.lower() for c in cards}
-            present = combo_card_names & deck_names_lower
-            missing = combo_card_names - deck_names_lower
-
-            if not missing:
-                complete.append((combo, cards))
-            elif len(missing) <= 2 and len(present) >= 1:
-                missing_names = [c.card_name for c in cards if c.card_name.lower() in missing]
-                potential.append((combo, cards, missing_names))
-
-        return complete, potential
+        return await asyncio.to_thread(_categorize_decks, deck_sets, combos_data)
 
     async def get_all_combos(self) -> list[tuple[ComboRow, list[ComboCardRow]]]:
         """Get all combos with their cards."""
@@ -437,3 +436,53 @@ class ComboDatabase:
         await self.conn.execute("DELETE FROM combo_cards")
         await self.conn.execute("DELETE FROM combos")
         await self.conn.commit()
+
+
+def _categorize_decks(
+    deck_sets: list[set[str]],
+    combos_data: dict[str, tuple[ComboRow, list[ComboCardRow]]],
+) -> list[
+    tuple[
+        list[tuple[ComboRow, list[ComboCardRow]]],
+        list[tuple[ComboRow, list[ComboCardRow], list[str]]],
+    ]
+]:
+    """Split each deck's combos into complete and potential (missing at most 2)."""
+    combo_cards: dict[str, frozenset[str]] = {}
+    postings: dict[str, list[str]] = {}
+    for combo_id, (_combo, cards) in combos_data.items():
+        names = frozenset(c.card_name.lower() for c in cards)
+        combo_cards[combo_id] = names
+        for name in names:
+            postings.setdefault(name, []).append(combo_id)
+
+    decks_by_card: dict[str, list[int]] = {}
+    for index, deck_lower in enumerate(deck_sets):
+        for name in deck_lower:
+            if name in postings:
+                decks_by_card.setdefault(name, []).append(index)
+
+    # One pass over the posting lists: combo_id -> present count, per deck
+    present_counts: list[dict[str, int]] = [{} for _ in deck_sets]
+    for name, deck_indexes in decks_by_card.items():
+        for index in deck_indexes:
+            counts = present_counts[index]
+            for combo_id in postings[name]:
+                counts[combo_id] = counts.get(combo_id, 0) + 1
+
+    results = []
+    for deck_lower, counts in zip(deck_sets, present_counts, strict=True):
+        complete: list[tuple[ComboRow, list[ComboCardRow]]] = []
+        potential: list[tuple[ComboRow, list[ComboCardRow], list[str]]] = []
+        for combo_id in sorted(counts):  # Combo id order, as the query returns them
+            combo, cards = combos_data[combo_id]
+            missing_count = len(combo_cards[combo_id]) - counts[combo_id]
+            if missing_count == 0:
+                complete.append((combo, cards))
+            elif missing_count <= 2:
+                missing_names = [
+                    c.card_name for c in cards if c.card_name.lower() not in deck_lower
+                ]
+                potential.append((combo, cards, missing_names))
+        results.append((complete, potential))
+    return results
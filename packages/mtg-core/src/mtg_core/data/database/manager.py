@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import aiosqlite
 
@@ -17,18 +17,27 @@ from .user import UserDatabase
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from ...daemon.client import RemoteComboDetector, RemoteDatabase, RemoteRecommender
+
 logger = logging.getLogger(__name__)
 
 
 class DatabaseManager:
     """Manages database lifecycle for the MCP server."""
 
-    def __init__(self, settings: Settings | None = None):
+    def __init__(self, settings: Settings | None = None, *, attach_daemon: bool = True):
         self._settings = settings or get_settings()
+        self._attach_daemon = attach_daemon and self._settings.use_daemon
         self._conn: aiosqlite.Connection | None = None
+        self._remote: RemoteDatabase | None = None
+        self._remote_indexes: tuple[RemoteRecommender, RemoteComboDetector] | None = None
         self._db: UnifiedDatabase | None = None
         self._user: UserDatabase | None = None
-        self._cache = CardCache(max_size=self._settings.cache_max_size)
+        self._cache = CardCache(
+            max_size=self._settings.cache_max_size,
+            ttl_seconds=self._settings.cache_ttl_seconds,
+            max_bytes=self._settings.cache_max_mb * 1024 * 1024,
+        )
 
     @property
     def db(self) -> UnifiedDatabase:
@@ -53,22 +62,25 @@ class DatabaseManager:
 
         max_conn = self._settings.db_max_connections
 
-        self._conn = await aiosqlite.connect(db_path)
-        self._conn.row_factory = aiosqlite.Row
+        # Share the card daemon's warm database when one is running
+        if self._attach_daemon:
+            from ...daemon.client import connect_daemon
 
-        # Set performance pragmas (WAL mode set during database creation)
-        await self._conn.execute("PRAGMA cache_size = -64000")  # 64MB
-        await self._conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
-        await self._conn.execute("PRAGMA busy_timeout = 5000")  # 5 seconds
-        await self._conn.execute("PRAGMA temp_store = MEMORY")
+            self._remote = await connect_daemon(
+                self._settings.daemon_socket_path, db_path, fallback=self._open_local
+            )
 
-        self._db = UnifiedDatabase(self._conn, self._cache, max_connections=max_conn)
-        logger.info("Unified MTG database loaded from %s", db_path)
+        if self._remote is not None:
+            self._db = cast(UnifiedDatabase, self._remote)
+            self._share_daemon_indexes()
+        else:
+            self._db = await self._open_local()
 
         # User database (always created, stores decks/collections)
         user_db = UserDatabase(self._settings.user_db_path, max_connections=max_conn)
         try:
             await user_db.connect()
+            await user_db.attach_card_database(db_path)
             self._user = user_db
         except (aiosqlite.Error, OSError):
             logger.exception("Failed to open user database at %s", self._settings.user_db_path)
@@ -84,6 +96,44 @@ class DatabaseManager:
         # is managed by SpellbookComboDetector which uses a different schema
         # (Commander Spellbook format downloaded from GitHub releases).
 
+    def _share_daemon_indexes(self) -> None:
+        """Point the recommender and combo detector singletons at the daemon's copies."""
+        from ...daemon.client import RemoteComboDetector, RemoteRecommender
+        from ...tools.recommendations import HybridRecommender, set_hybrid_recommender
+        from ...tools.recommendations.spellbook_combos import (
+            SpellbookComboDetector,
+            set_spellbook_detector,
+        )
+
+        socket_path = self._settings.daemon_socket_path
+        recommender = RemoteRecommender(socket_path, self._settings.mtg_db_path)
+        combos = RemoteComboDetector(socket_path, self._settings.mtg_db_path)
+        set_hybrid_recommender(cast(HybridRecommender, recommender))
+        set_spellbook_detector(cast(SpellbookComboDetector, combos))
+        self._remote_indexes = recommender, combos
+
+    async def _open_local(self) -> UnifiedDatabase:
+        """Open the card database in-process.
+
+        Also the daemon client's fallback, so a frontend whose daemon goes away
+        keeps working on its own connection (closed by stop()).
+        """
+        db_path = self._settings.mtg_db_path
+        self._conn = await aiosqlite.connect(db_path)
+        self._conn.row_factory = aiosqlite.Row
+
+        # Set performance pragmas (WAL mode set during database creation)
+        await self._conn.execute("PRAGMA cache_size = -64000")  # 64MB
+        await self._conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+        await self._conn.execute("PRAGMA busy_timeout = 5000")  # 5 seconds
+        await self._conn.execute("PRAGMA temp_store = MEMORY")
+
+        db = UnifiedDatabase(
+            self._conn, self._cache, max_connections=self._settings.db_max_connections
+        )
+        logger.info("Unified MTG database loaded from %s", db_path)
+        return db
+
     async def start_user_db(self) -> UserDatabase:
         """Explicitly start user database. Used by apps that need deck management."""
         if self._user is None:
@@ -92,10 +142,35 @@ class DatabaseManager:
                 max_connections=self._settings.db_max_connections,
             )
             await self._user.connect()
+            await self._user.attach_card_database(self._settings.mtg_db_path)
         return self._user
 
+    @property
+    def remote(self) -> RemoteDatabase | None:
+        """The card daemon client when attached to one, else None (in-process).
+
+        Stays set if the daemon later goes away and the client falls back to an
+        in-process database (see ``RemoteDatabase.attached``).
+        """
+        return self._remote
+
     async def stop(self) -> None:
         """Close the database connections."""
+        if self._remote_indexes is not None:
+            from ...tools.recommendations import set_hybrid_recommender
+            from ...tools.recommendations.spellbook_combos import set_spellbook_detector
+
+            set_hybrid_recommender(None)
+            set_spellbook_detector(None)
+            for index in self._remote_indexes:
+                index.close()
+            self._remote_indexes = None
+
+        if self._remote is not None:
+            await self._remote.close()
+            self._remote = None
+            self._db = None
+
         if self._conn:
             # Save reference to thread before closing
             conn_thread = self._conn if hasattr(self._conn, "join") else None
@@ -0,0 +1,98 @@
+"""Build-time metadata in the ``meta`` table.
+
+Counts are taken once when the database is built, so reading database stats is
+a single small-table read instead of ``COUNT(*)``/``COUNT(DISTINCT name)`` scans
+over ~100k printings on every cold start. The build also records a data-version
+fingerprint that disk caches (printings, synergies, artists) key on, so their
+entries are not reused across database rebuilds, and the sorted keyword list the
+TUI's autocomplete needs (otherwise a JSON parse of every distinct keywords cell).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+DATA_VERSION_KEY = "data_version"
+KEYWORDS_KEY = "keywords"
+
+# meta key -> query counting it at build time
+_COUNT_QUERIES = {
+    "card_count": "SELECT COUNT(*) FROM cards",
+    "unique_card_count": "SELECT COUNT(DISTINCT name) FROM cards",
+    "set_count": "SELECT COUNT(*) FROM sets",
+    "ruling_count": "SELECT COUNT(*) FROM rulings",
+    "oracle_card_count": "SELECT COUNT(*) FROM oracle_cards",
+}
+
+
+def data_fingerprint(meta: Mapping[str, str]) -> str:
+    """Fingerprint a build from its metadata (everything but the fingerprint itself)."""
+    digest = hashlib.sha256()
+    for key in sorted(meta):
+        if key != DATA_VERSION_KEY:
+            digest.update(f"{key}={meta[key]}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def write_build_meta(
+    cursor: sqlite3.Cursor,
+    schema_version: int,
+    scryfall_updated_at: str | None = None,
+) -> dict[str, str]:
+    """Record counts, build info and the data version in the meta table.
+
+    Run last, after every table is populated.
+
+    Returns:
+        The metadata written.
+    """
+    meta = {
+        "schema_version": str(schema_version),
+        "created_at": datetime.now().isoformat(),
+    }
+    if scryfall_updated_at:
+        meta["scryfall_updated_at"] = scryfall_updated_at
+    for key, query in _COUNT_QUERIES.items():
+        try:
+            cursor.execute(query)
+        except sqlite3.OperationalError:
+            continue  # Table not built (e.g. oracle_cards)
+        row = cursor.fetchone()
+        meta[key] = str(row[0] if row else 0)
+    meta[KEYWORDS_KEY] = json.dumps(sorted(_collect_keywords(cursor)))
+    meta[DATA_VERSION_KEY] = data_fingerprint(meta)
+
+    cursor.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+    return meta
+
+
+def _collect_keywords(cursor: sqlite3.Cursor) -> set[str]:
+    keywords: set[str] = set()
+    cursor.execute(
+        "SELECT DISTINCT keywords FROM cards WHERE keywords IS NOT NULL AND keywords != ''"
+    )
+    for (value,) in cursor.fetchall():
+        try:
+            parsed = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if isinstance(parsed, list):
+            keywords.update(k for k in parsed if isinstance(k, str))
+    return keywords
+
+
+async def read_meta(db: aiosqlite.Connection) -> dict[str, str]:
+    """Read the whole meta table (a few rows)."""
+    try:
+        async with db.execute("SELECT key, value FROM meta") as cursor:
+            return {row[0]: row[1] for row in await cursor.fetchall()}
+    except Exception:
+        return {}
@@ -0,0 +1,86 @@
+"""Canonical one-row-per-card table built at ingest.
+
+The ``cards`` table holds one row per printing, so name-level queries used to
+dedupe ~100k printings at query time (``GROUP BY name``, ``ORDER BY
+release_date DESC LIMIT 1``). ``oracle_cards`` materializes one row per card name:
+the canonical printing's columns plus aggregates over all printings.
+
+The canonical printing is the newest one that is neither a promo nor digital
+only, which is what name lookups have always returned; a card that only exists
+as such extras keeps its newest extra, so ``EXCLUDE_EXTRAS`` filters it exactly
+as it did against ``cards``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+ORACLE_CARDS_TABLE = "oracle_cards"
+
+_BUILD_SQL = """
+    CREATE TABLE oracle_cards AS
+    SELECT c.*, stats.printing_count, stats.min_price_usd
+    FROM cards c
+    JOIN (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY name
+            ORDER BY (is_promo = 1 OR is_digital_only = 1), release_date DESC, set_code, id
+        ) AS rn
+        FROM cards
+    ) ranked ON ranked.id = c.id AND ranked.rn = 1
+    JOIN (
+        SELECT name, COUNT(*) AS printing_count, MIN(price_usd) AS min_price_usd
+        FROM cards
+        GROUP BY name
+    ) stats ON stats.name = c.name
+"""
+
+_INDEXES = [
+    "CREATE UNIQUE INDEX idx_oracle_cards_name ON oracle_cards(name)",
+    "CREATE INDEX idx_oracle_cards_name_nocase ON oracle_cards(name COLLATE NOCASE)",
+    "CREATE INDEX idx_oracle_cards_oracle_id ON oracle_cards(oracle_id)",
+    "CREATE INDEX idx_oracle_cards_edhrec ON oracle_cards(edhrec_rank)",
+    "CREATE INDEX idx_oracle_cards_cmc ON oracle_cards(cmc)",
+    (
+        "CREATE INDEX idx_oracle_cards_commander ON oracle_cards(legal_commander)"
+        " WHERE legal_commander = 1"
+    ),
+    # Name searches also match flavor names (SpongeBob -> Jodah), which are per printing
+    (
+        "CREATE INDEX IF NOT EXISTS idx_cards_flavor_name ON cards(flavor_name, name)"
+        " WHERE flavor_name IS NOT NULL"
+    ),
+]
+
+
+def build_oracle_cards(cursor: sqlite3.Cursor) -> int:
+    """(Re)build the oracle_cards table from cards.
+
+    Run after cards (and EDHREC ranks) are imported.
+
+    Returns:
+        Number of oracle cards.
+    """
+    cursor.execute("DROP TABLE IF EXISTS oracle_cards")
+    cursor.execute(_BUILD_SQL)
+    for statement in _INDEXES:
+        cursor.execute(statement)
+    cursor.execute("SELECT COUNT(*) FROM oracle_cards")
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+async def check_oracle_cards_available(db: aiosqlite.Connection) -> bool:
+    """Check if the oracle_cards table exists (databases built before it do not have it)."""
+    try:
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+            (ORACLE_CARDS_TABLE,),
+        ) as cursor:
+            return await cursor.fetchone() is not None
+    except Exception:
+        return False
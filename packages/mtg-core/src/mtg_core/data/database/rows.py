@@ -0,0 +1,189 @@
+"""Slim, projection-specific card rows.
+
+Building a full ``Card`` decodes every column of a ``cards`` row and validates ~50
+fields, which dominates the cost of search pages, set listings and printings
+lists that only display a handful of them. The row types here are NamedTuples
+whose fields are the columns a use case needs, selected with ``select_columns()``
+and decoded positionally without validation. Field names follow the ``Card``
+attribute names (``uuid``, ``type``, ``number``, ...) so rows can stand in for
+cards in display code. JSON array columns stay as raw strings until their
+property is read, and ``to_card()`` upgrades a row to a ``Card`` on demand
+(fields outside the projection are left at their defaults; use
+``UnifiedDatabase.get_card_by_uuid`` for the complete record).
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any, NamedTuple, Protocol
+
+from ..models import Card
+
+# Row fields whose column has a different name in the cards table
+_FIELD_COLUMNS = {
+    "uuid": "id",
+    "type": "type_line",
+    "text": "oracle_text",
+    "flavor": "flavor_text",
+    "number": "collector_number",
+    "colors_json": "colors",
+    "color_identity_json": "color_identity",
+    "keywords_json": "keywords",
+}
+
+
+class _RowType(Protocol):
+    _fields: tuple[str, ...]
+
+
+@lru_cache(maxsize=64)
+def select_columns(row_type: type[_RowType], alias: str = "") -> str:
+    """Build the SELECT list for a row type, aliasing columns to its field names.
+
+    Args:
+        row_type: One of the row NamedTuples in this module.
+        alias: Optional table alias to qualify the columns with (e.g. "c").
+    """
+    prefix = f"{alias}." if alias else ""
+    parts = []
+    for field in row_type._fields:
+        column = _FIELD_COLUMNS.get(field, field)
+        parts.append(f"{prefix}{column}" if column == field else f"{prefix}{column} AS {field}")
+    return ", ".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _json_list(value: str | None) -> tuple[str, ...]:
+    """Parse a JSON array column (cached: a few hundred distinct values cover most rows)."""
+    if not value:
+        return ()
+    try:
+        parsed = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return ()
+    return tuple(parsed) if isinstance(parsed, list) else ()
+
+
+def _dollars(cents: int | None) -> float | None:
+    return cents / 100 if cents is not None else None
+
+
+def _to_card(row: tuple[Any, ...], fields: tuple[str, ...]) -> Card:
+    data: dict[str, Any] = {}
+    for field, value in zip(fields, row, strict=True):
+        if field.endswith("_json"):
+            data[field.removesuffix("_json")] = list(_json_list(value))
+        else:
+            data[field] = value
+    return Card.model_validate(data)
+
+
+class CardSummaryRow(NamedTuple):
+    """Columns for search results and card listings (everything a ``CardSummary`` shows)."""
+
+    uuid: str
+    name: str
+    flavor_name: str | None
+    mana_cost: str | None
+    cmc: float | None
+    type: str | None
+    colors_json: str | None
+    color_identity_json: str | None
+    rarity: str | None
+    set_code: str | None
+    number: str | None
+    keywords_json: str | None
+    power: str | None
+    toughness: str | None
+    image_normal: str | None
+    image_small: str | None
+    price_usd: int | None
+    purchase_tcgplayer: str | None
+
+    @property
+    def colors(self) -> list[str]:
+        return list(_json_list(self.colors_json))
+
+    @property
+    def color_identity(self) -> list[str]:
+        return list(_json_list(self.color_identity_json))
+
+    @property
+    def keywords(self) -> list[str]:
+        return list(_json_list(self.keywords_json))
+
+    def get_price_usd(self) -> float | None:
+        """Get USD price as float dollars."""
+        return _dollars(self.price_usd)
+
+    def to_card(self) -> Card:
+        """Upgrade to a Card carrying the projected fields."""
+        return _to_card(self, self._fields)
+
+
+class PriceRow(NamedTuple):
+    """Columns for price listings."""
+
+    uuid: str
+    name: str
+    set_code: str | None
+    number: str | None
+    rarity: str | None
+    image_small: str | None
+    price_usd: int | None
+    price_usd_foil: int | None
+
+    def get_price_usd(self) -> float | None:
+        """Get USD price as float dollars."""
+        return _dollars(self.price_usd)
+
+    def get_price_usd_foil(self) -> float | None:
+        """Get USD foil price as float dollars."""
+        return _dollars(self.price_usd_foil)
+
+    def to_card(self) -> Card:
+        """Upgrade to a Card carrying the projected fields."""
+        return _to_card(self, self._fields)
+
+
+class PrintingRow(NamedTuple):
+    """Columns for printings lists (everything a ``PrintingInfo`` shows)."""
+
+    uuid: str
+    name: str
+    set_code: str | None
+    set_name: str | None
+    number: str | None
+    rarity: str | None
+    release_date: str | None
+    artist: str | None
+    flavor: str | None
+    illustration_id: str | None
+    mana_cost: str | None
+    type: str | None
+    text: str | None
+    power: str | None
+    toughness: str | None
+    loyalty: str | None
+    image_normal: str | None
+    image_art_crop: str | None
+    price_usd: int | None
+    price_usd_foil: int | None
+    price_eur: int | None
+
+    def get_price_usd(self) -> float | None:
+        """Get USD price as float dollars."""
+        return _dollars(self.price_usd)
+
+    def get_price_usd_foil(self) -> float | None:
+        """Get USD foil price as float dollars."""
+        return _dollars(self.price_usd_foil)
+
+    def get_price_eur(self) -> float | None:
+        """Get EUR price as float."""
+        return _dollars(self.price_eur)
+
+    def to_card(self) -> Card:
+        """Upgrade to a Card carrying the projected fields."""
+        return _to_card(self, self._fields)
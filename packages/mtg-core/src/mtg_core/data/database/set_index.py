@@ -0,0 +1,206 @@
+"""Per-set contents index built at ingest.
+
+Opening a set used to run a card search filtered by set (a ``COUNT`` plus a
+``GROUP BY name`` page, one printing per name) and tally rarities and types in
+Python over the page it got back. ``set_cards`` orders every printing of a set
+by collector number (by numeric prefix: ★1 < 1 < 1a < 2 < 10) as
+``(set_code, position)`` keys, so a set's cards stream in order as keyset pages.
+``set_stats`` holds one row per set: rarity/type/color histograms, the most
+common keywords, the average mana value of non-land cards and the USD value of
+one of each printing.
+
+Set codes are stored lowercase, as Scryfall writes them.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+SET_CARDS_TABLE = "set_cards"
+
+# Collector number order: numeric prefix (0 without one), then shorter (1 < 1a), then text
+COLLECTOR_ORDER = (
+    "CAST(collector_number AS INTEGER), length(collector_number), collector_number, id"
+)
+
+# Primary card types, in the order a type line is matched against them
+PRIMARY_TYPES = (
+    "Creature",
+    "Instant",
+    "Sorcery",
+    "Artifact",
+    "Enchantment",
+    "Planeswalker",
+    "Battle",
+    "Land",
+)
+
+# Keywords kept per set, most common first
+MAX_MECHANICS = 20
+
+# cards columns a SetTally reads, in add() argument order
+TALLY_COLUMNS = "name, rarity, type_line, colors, keywords, cmc, price_usd, price_usd_foil"
+
+_BUILD_SQL = [
+    "DROP TABLE IF EXISTS set_cards",
+    "DROP TABLE IF EXISTS set_stats",
+    """
+    CREATE TABLE set_cards (
+        set_code TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        id TEXT NOT NULL,
+        PRIMARY KEY (set_code, position)
+    ) WITHOUT ROWID
+    """,
+    f"""
+    INSERT INTO set_cards (set_code, position, id)
+    SELECT lower(set_code), ROW_NUMBER() OVER (
+        PARTITION BY lower(set_code) ORDER BY {COLLECTOR_ORDER}
+    ), id
+    FROM cards
+    """,
+    """
+    CREATE TABLE set_stats (
+        set_code TEXT PRIMARY KEY,
+        card_count INTEGER NOT NULL,
+        unique_cards INTEGER NOT NULL,
+        rarities TEXT NOT NULL,
+        types TEXT NOT NULL,
+        colors TEXT NOT NULL,
+        mechanics TEXT NOT NULL,
+        avg_cmc REAL,
+        value_usd INTEGER NOT NULL,
+        value_usd_foil INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+]
+
+
+def _json_list(value: str | None) -> list[str]:
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
+@dataclass
+class SetTally:
+    """Counts over a set's printings (what a set_stats row holds)."""
+
+    card_count: int = 0
+    names: set[str] = field(default_factory=set)
+    rarities: Counter[str] = field(default_factory=Counter)
+    types: Counter[str] = field(default_factory=Counter)
+    colors: Counter[str] = field(default_factory=Counter)  # "C" for colorless
+    keywords: Counter[str] = field(default_factory=Counter)
+    cmc_total: float = 0.0
+    cmc_count: int = 0  # Non-land printings with a mana value
+    value_usd: int = 0  # Cents
+    value_usd_foil: int = 0  # Cents; foil price, else the regular price
+
+    def add(
+        self,
+        name: str,
+        rarity: str | None,
+        type_line: str | None,
+        colors: str | None,
+        keywords: str | None,
+        cmc: float | None,
+        price_usd: int | None,
+        price_usd_foil: int | None,
+    ) -> None:
+        """Count one printing (a row of TALLY_COLUMNS)."""
+        self.card_count += 1
+        self.names.add(name)
+        if rarity:
+            self.rarities[rarity.lower()] += 1
+        type_line = type_line or ""
+        self.types[next((t for t in PRIMARY_TYPES if t in type_line), "Other")] += 1
+        for color in _json_list(colors) or ["C"]:
+            self.colors[color] += 1
+        for keyword in _json_list(keywords):
+            self.keywords[keyword] += 1
+        if cmc is not None and "Land" not in type_line:
+            self.cmc_total += cmc
+            self.cmc_count += 1
+        self.value_usd += price_usd or 0
+        self.value_usd_foil += price_usd_foil or price_usd or 0
+
+    @property
+    def avg_cmc(self) -> float | None:
+        """Average mana value of non-land printings."""
+        return round(self.cmc_total / self.cmc_count, 2) if self.cmc_count else None
+
+    @property
+    def mechanics(self) -> list[str]:
+        """The most common keywords, most common first."""
+        return [keyword for keyword, _ in self.keywords.most_common(MAX_MECHANICS)]
+
+    def to_row(self, set_code: str) -> tuple[Any, ...]:
+        """The set_stats row for this tally."""
+        return (
+            set_code,
+            self.card_count,
+            len(self.names),
+            json.dumps(dict(self.rarities)),
+            json.dumps(dict(self.types)),
+            json.dumps(dict(self.colors)),
+            json.dumps(self.mechanics),
+            self.avg_cmc,
+            self.value_usd,
+            self.value_usd_foil,
+        )
+
+
+def tally_sets(rows: Iterable[Sequence[Any]]) -> dict[str, SetTally]:
+    """Tally (set_code, *TALLY_COLUMNS) rows per lowercase set code."""
+    tallies: dict[str, SetTally] = {}
+    for set_code, *columns in rows:
+        key = set_code.lower()
+        tally = tallies.get(key)
+        if tally is None:
+            tally = tallies[key] = SetTally()
+        tally.add(*columns)
+    return tallies
+
+
+def build_set_index(cursor: sqlite3.Cursor) -> int:
+    """(Re)build the set_cards and set_stats tables from cards.
+
+    Run after cards are imported.
+
+    Returns:
+        Number of sets indexed.
+    """
+    for statement in _BUILD_SQL:
+        cursor.execute(statement)
+    cursor.execute(f"SELECT set_code, {TALLY_COLUMNS} FROM cards")
+    tallies = tally_sets(cursor)
+    cursor.executemany(
+        "INSERT INTO set_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [tally.to_row(set_code) for set_code, tally in tallies.items()],
+    )
+    return len(tallies)
+
+
+async def check_set_index_available(db: aiosqlite.Connection) -> bool:
+    """Check if the set_cards table exists (databases built before it do not have it)."""
+    try:
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+            (SET_CARDS_TABLE,),
+        ) as cursor:
+            return await cursor.fetchone() is not None
+    except Exception:
+        return False
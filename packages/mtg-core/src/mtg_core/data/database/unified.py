@@ -15,11 +15,17 @@ import aiosqlite
 
 from ...exceptions import CardNotFoundError, SetNotFoundError
 from ..models import Card, CardLegality, CardRuling, Set
-from ..models.responses import ArtistSummary
+from ..models.responses import ArtistSummary, SetStats
 from .base import BaseDatabase
 from .cache import CardCache
+from .meta import DATA_VERSION_KEY, KEYWORDS_KEY, data_fingerprint, read_meta
+from .oracle import check_oracle_cards_available
+from .rows import CardSummaryRow, PriceRow, PrintingRow, select_columns
+from .set_index import COLLECTOR_ORDER, TALLY_COLUMNS, check_set_index_available, tally_sets
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from ..models.inputs import SearchCardsInput
 
 logger = logging.getLogger(__name__)
@@ -28,6 +34,9 @@ logger = logging.getLogger(__name__)
 EXCLUDE_EXTRAS = "is_promo = 0 AND is_digital_only = 0"
 EXCLUDE_TOKENS = "is_token = 0"
 
+# Rows per batch streamed by get_set_cards()
+SET_CARDS_BATCH_SIZE = 200
+
 
 class UnifiedDatabase(BaseDatabase):
     """Unified database access for MTG cards, images, prices, and rulings.
@@ -45,6 +54,11 @@ class UnifiedDatabase(BaseDatabase):
         super().__init__(db, max_connections)
         self._cache = cache or CardCache()
         self._fts_available: bool | None = None
+        self._oracle_available: bool | None = None
+        self._synergy_terms: frozenset[str] | None = None
+        self._meta: dict[str, str] | None = None
+        self._set_index_available: bool | None = None
+        self._sets: list[Set] | None = None
 
     @staticmethod
     def _parse_json_list(value: str | None) -> list[str] | None:
@@ -129,55 +143,160 @@ class UnifiedDatabase(BaseDatabase):
             icon_svg_uri=row["icon_svg_uri"],
         )
 
+    async def has_oracle_cards(self) -> bool:
+        """Whether the database has the one-row-per-card oracle_cards table.
+
+        Databases built before it existed fall back to deduping printings per query.
+        """
+        if self._oracle_available is None:
+            self._oracle_available = await check_oracle_cards_available(self._db)
+        return self._oracle_available
+
+    async def get_indexed_synergy_terms(self) -> frozenset[str]:
+        """Get the synergy terms indexed in card_synergy_terms at build time.
+
+        Empty for databases built before the index (or without oracle_cards).
+        """
+        if self._synergy_terms is None:
+            terms: frozenset[str] = frozenset()
+            if await self.has_oracle_cards():
+                try:
+                    async with self._execute("SELECT pattern FROM synergy_terms") as cursor:
+                        terms = frozenset(row[0] for row in await cursor.fetchall())
+                except aiosqlite.OperationalError:
+                    pass  # Built before the synergy index
+            self._synergy_terms = terms
+        return self._synergy_terms
+
+    async def find_cards_by_synergy_terms(
+        self,
+        terms: list[tuple[str, int]],
+        filters: SearchCardsInput,
+    ) -> dict[str, list[Card]]:
+        """Find the cards matching each indexed synergy term.
+
+        Args:
+            terms: (pattern, limit) pairs; patterns must be indexed terms.
+            filters: Card-level filters (color identity, format) for the matches.
+
+        Returns:
+            Pattern -> up to ``limit`` matching cards (tokens excluded), most
+            played (EDHREC rank) first.
+        """
+        if not terms:
+            return {}
+        where_clause, filter_params, _ = self._search_clauses(filters, oracle=True)
+        # One LIMITed index walk per term, in rank order, stopping at its limit
+        term_query = f"""
+            SELECT * FROM (
+                SELECT ? AS synergy_pattern, o.*
+                FROM card_synergy_terms t
+                JOIN (
+                    SELECT * FROM oracle_cards WHERE {where_clause} AND {EXCLUDE_TOKENS}
+                ) o ON o.oracle_id = t.oracle_id
+                WHERE t.term_id = (SELECT term_id FROM synergy_terms WHERE pattern = ?)
+                ORDER BY t.sort_rank
+                LIMIT ?
+            )
+        """
+        query = " UNION ALL ".join([term_query] * len(terms))
+        params: list[Any] = []
+        for pattern, limit in terms:
+            params.extend([pattern, *filter_params, pattern, limit])
+
+        found: dict[str, list[Card]] = {}
+        async with self._execute(query, params) as cursor:
+            async for row in cursor:
+                found.setdefault(row["synergy_pattern"], []).append(self._row_to_card(row))
+        return found
+
     async def get_card_by_name(self, name: str, include_extras: bool = True) -> Card:
         """Get a card by exact name. Returns most recent non-promo printing.
 
         Raises CardNotFoundError if not found.
         """
         cache_key = f"name:{name.lower()}:extras={include_extras}"
-        cached = await self._cache.get(cache_key)
+        cached = self._cache.get_nowait(cache_key)
         if cached:
-            return cached
+            return cast(Card, cached)
 
-        async with self._execute(
-            f"""
-            SELECT * FROM cards
-            WHERE name COLLATE NOCASE = ?
-            AND {EXCLUDE_EXTRAS}
-            ORDER BY release_date DESC
-            LIMIT 1
-            """,
-            (name,),
-        ) as cursor:
+        if await self.has_oracle_cards():
+            query = f"""
+                SELECT * FROM oracle_cards
+                WHERE name COLLATE NOCASE = ?
+                AND {EXCLUDE_EXTRAS}
+                LIMIT 1
+            """
+        else:
+            query = f"""
+                SELECT * FROM cards
+                WHERE name COLLATE NOCASE = ?
+                AND {EXCLUDE_EXTRAS}
+                ORDER BY release_date DESC
+                LIMIT 1
+            """
+
+        async with self._execute(query, (name,)) as cursor:
             row = await cursor.fetchone()
-            if row:
-                card = self._row_to_card(row)
-                if include_extras:
-                    card.legalities = await self._get_legalities(row["id"])
-                    card.rulings = await self._get_rulings(row["oracle_id"])
-                await self._cache.set(cache_key, card)
-                return card
+        if not row:
+            raise CardNotFoundError(name)
 
-        raise CardNotFoundError(name)
+        # Outside the query: nested queries would wait on a slot this one holds
+        card = self._row_to_card(row)
+        if include_extras:
+            card.legalities = await self._get_legalities(row["id"])
+            card.rulings = await self._get_rulings(row["oracle_id"])
+        self._cache.set_nowait(cache_key, card)
+        return card
 
     async def get_card_by_uuid(self, uuid: str, include_extras: bool = True) -> Card:
         """Get a card by Scryfall UUID.
 
         Raises CardNotFoundError if not found.
         """
+        cards = await self.get_cards_by_uuids([uuid], include_extras=include_extras)
+        if uuid in cards:
+            return cards[uuid]
+        raise CardNotFoundError(uuid)
+
+    async def get_cards_by_uuids(
+        self,
+        uuids: list[str],
+        include_extras: bool = True,
+    ) -> dict[str, Card]:
+        """Batch get_card_by_uuid().
+
+        Uncached printings are fetched in one query, with the rulings for all of
+        them in one more, instead of three queries per card.
+
+        Returns dict mapping uuid -> Card for the printings found.
+        """
+        if not uuids:
+            return {}
+
+        keys = {uuid: f"uuid:{uuid}:extras={include_extras}" for uuid in uuids}
+        cached = self._cache.get_many(keys.values())
+        results: dict[str, Card] = {
+            uuid: cached[key] for uuid, key in keys.items() if key in cached
+        }
+        to_fetch = [uuid for uuid in keys if uuid not in results]
+        if not to_fetch:
+            return results
+
         async with self._execute(
-            "SELECT * FROM cards WHERE id = ?",
-            (uuid,),
+            "SELECT * FROM cards WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(to_fetch),),
         ) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                card = self._row_to_card(row)
-                if include_extras:
-                    card.legalities = await self._get_legalities(row["id"])
-                    card.rulings = await self._get_rulings(row["oracle_id"])
-                return card
-
-        raise CardNotFoundError(uuid)
+            rows = list(await cursor.fetchall())
+
+        if include_extras:
+            cards = await self._rows_to_cards_with_extras(rows)
+        else:
+            cards = [self._row_to_card(row) for row in rows]
+        fetched = {row["id"]: card for row, card in zip(rows, cards, strict=True)}
+        self._cache.set_many({keys[uuid]: card for uuid, card in fetched.items()})
+        results.update(fetched)
+        return results
 
     async def get_card_by_set_and_number(self, set_code: str, collector_number: str) -> Card | None:
         """Look up a card by set code and collector number.
@@ -200,6 +319,70 @@ class UnifiedDatabase(BaseDatabase):
                 return self._row_to_card(row)
         return None
 
+    async def _join_printings(
+        self, printings: list[tuple[str, str]], columns: str
+    ) -> dict[tuple[str, str], aiosqlite.Row]:
+        """Look up many (set_code, collector_number) pairs in one indexed pass.
+
+        The keys are passed as a single JSON parameter and joined via json_each()
+        against idx_cards_set_number, so there is no per-statement variable limit
+        to batch around and no OR chain for the planner to scan. Set codes are
+        stored lowercase (as Scryfall ships them); collector numbers also match
+        with leading zeros stripped, preferring an exact match.
+
+        Returns:
+            Dict mapping (set_code.upper(), collector_number) as given -> row
+        """
+        keys = []
+        for set_code, collector_number in dict.fromkeys(printings):
+            keys.append([set_code.lower(), collector_number, collector_number.lstrip("0") or "0"])
+
+        query = f"""
+            WITH keys AS (
+                SELECT key AS idx,
+                       json_extract(value, '$[0]') AS set_code,
+                       json_extract(value, '$[1]') AS number,
+                       json_extract(value, '$[2]') AS normalized
+                FROM json_each(?)
+            )
+            SELECT keys.idx AS key_idx, {columns}
+            FROM keys
+            JOIN cards c ON c.set_code = keys.set_code
+                AND c.collector_number IN (keys.number, keys.normalized)
+            ORDER BY keys.idx, c.collector_number != keys.number
+        """
+        results: dict[tuple[str, str], aiosqlite.Row] = {}
+        async with self._execute(query, (json.dumps(keys),)) as cursor:
+            async for row in cursor:
+                set_code, number, _ = keys[row["key_idx"]]
+                results.setdefault((set_code.upper(), number), row)
+        return results
+
+    async def get_cards_by_set_and_numbers(
+        self, printings: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], Card]:
+        """Batch get_card_by_set_and_number().
+
+        Returns dict mapping (set_code.upper(), collector_number) -> Card for the
+        printings found. Works for tokens too.
+        """
+        if not printings:
+            return {}
+        rows = await self._join_printings(printings, "c.*")
+        return {key: self._row_to_card(row) for key, row in rows.items()}
+
+    async def get_printing_rows_by_set_and_numbers(
+        self, printings: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], PrintingRow]:
+        """Batch lookup of printings list rows by (set_code, collector_number) pairs.
+
+        Returns dict mapping (set_code.upper(), collector_number) -> PrintingRow.
+        """
+        if not printings:
+            return {}
+        rows = await self._join_printings(printings, select_columns(PrintingRow, "c"))
+        return {key: PrintingRow._make(tuple(row)[1:]) for key, row in rows.items()}
+
     async def get_prices_by_set_and_numbers(
         self, printings: list[tuple[str, str]]
     ) -> dict[tuple[str, str], tuple[int | None, int | None]]:
@@ -209,39 +392,12 @@ class UnifiedDatabase(BaseDatabase):
         Prices are in cents (divide by 100 for dollars).
 
         Much faster than get_cards_by_set_and_numbers() for price-only needs
-        since it only fetches 4 columns instead of 40+.
+        since it only fetches 2 columns instead of 40+.
         """
         if not printings:
             return {}
-
-        results: dict[tuple[str, str], tuple[int | None, int | None]] = {}
-        batch_size = 200
-
-        for i in range(0, len(printings), batch_size):
-            batch = printings[i : i + batch_size]
-
-            conditions = []
-            params: list[str] = []
-            for set_code, collector_number in batch:
-                normalized = collector_number.lstrip("0") or "0"
-                conditions.append(
-                    "(UPPER(set_code) = ? AND (collector_number = ? OR collector_number = ?))"
-                )
-                params.extend([set_code.upper(), collector_number, normalized])
-
-            query = f"""
-                SELECT set_code, collector_number, price_usd, price_usd_foil
-                FROM cards
-                WHERE {" OR ".join(conditions)}
-            """
-
-            async with self._execute(query, tuple(params)) as cursor:
-                async for row in cursor:
-                    if row[0] and row[1]:
-                        key = (row[0].upper(), row[1])
-                        results[key] = (row[2], row[3])
-
-        return results
+        rows = await self._join_printings(printings, "c.price_usd, c.price_usd_foil")
+        return {key: (row[1], row[2]) for key, row in rows.items()}
 
     async def get_prices_by_names(
         self, names: list[str]
@@ -279,6 +435,11 @@ class UnifiedDatabase(BaseDatabase):
 
     async def get_all_printings(self, name: str) -> list[Card]:
         """Get all printings of a card by name (across all sets)."""
+        cache_key = f"printings:{name.lower()}"
+        cached = self._cache.get_nowait(cache_key)
+        if cached is not None:
+            return list(cached)
+
         printings: list[Card] = []
         async with self._execute(
             """
@@ -290,13 +451,31 @@ class UnifiedDatabase(BaseDatabase):
         ) as cursor:
             async for row in cursor:
                 printings.append(self._row_to_card(row))
-        return printings
+        self._cache.set_nowait(cache_key, printings)
+        return list(printings)
+
+    async def get_printing_rows(self, name: str) -> list[PrintingRow]:
+        """Get all printings of a card as slim rows, in get_all_printings() order."""
+        async with self._execute(
+            f"""
+            SELECT {select_columns(PrintingRow)} FROM cards
+            WHERE name COLLATE NOCASE = ?
+            ORDER BY release_date DESC, set_code
+            """,
+            (name,),
+        ) as cursor:
+            return [PrintingRow._make(row) for row in await cursor.fetchall()]
 
     async def get_unique_artworks(self, name: str) -> list[Card]:
         """Get all unique artworks for a card (one per illustration_id).
 
         Uses art_priority to prefer borderless > full_art > regular.
         """
+        cache_key = f"artworks:{name.lower()}"
+        cached = self._cache.get_nowait(cache_key)
+        if cached is not None:
+            return list(cached)
+
         artworks: list[Card] = []
         async with self._execute(
             """
@@ -315,13 +494,17 @@ class UnifiedDatabase(BaseDatabase):
         ) as cursor:
             async for row in cursor:
                 artworks.append(self._row_to_card(row))
-        return artworks
+        self._cache.set_nowait(cache_key, artworks)
+        return list(artworks)
 
-    async def search_cards(self, filters: SearchCardsInput) -> tuple[list[Card], int]:
-        """Search for cards matching the given filters.
+    @staticmethod
+    def _search_clauses(
+        filters: SearchCardsInput, oracle: bool = False
+    ) -> tuple[str, list[Any], str]:
+        """Build the WHERE clause, its params and the ORDER BY for a card search.
 
-        Returns:
-            Tuple of (cards on this page, total matching count)
+        With ``oracle`` the clause targets oracle_cards, whose flavor_name is only
+        the canonical printing's, so flavor names are matched against cards.
         """
         conditions: list[str] = [EXCLUDE_EXTRAS]
         # Note: Tokens are included in searches. They are excluded from recommendations/synergy.
@@ -329,7 +512,16 @@ class UnifiedDatabase(BaseDatabase):
 
         if filters.name:
             # Search both name and flavor_name (e.g., SpongeBob → Jodah, the Unifier)
-            conditions.append("(name COLLATE NOCASE LIKE ? OR flavor_name COLLATE NOCASE LIKE ?)")
+            if oracle:
+                conditions.append(
+                    "(name COLLATE NOCASE LIKE ? OR name IN ("
+                    "SELECT name FROM cards WHERE flavor_name IS NOT NULL"
+                    " AND flavor_name COLLATE NOCASE LIKE ?))"
+                )
+            else:
+                conditions.append(
+                    "(name COLLATE NOCASE LIKE ? OR flavor_name COLLATE NOCASE LIKE ?)"
+                )
             params.append(f"%{filters.name}%")
             params.append(f"%{filters.name}%")
 
@@ -394,17 +586,6 @@ class UnifiedDatabase(BaseDatabase):
 
         where_clause = " AND ".join(conditions)
 
-        # Get total count
-        count_query = f"""
-            SELECT COUNT(*) FROM (
-                SELECT DISTINCT name FROM cards WHERE {where_clause}
-            )
-        """
-        async with self._execute(count_query, params) as cursor:
-            row = await cursor.fetchone()
-            total_count = row[0] if row else 0
-
-        # Build ORDER BY
         order_direction = "DESC" if filters.sort_order == "desc" else "ASC"
         sort_map = {
             "name": "name",
@@ -413,24 +594,130 @@ class UnifiedDatabase(BaseDatabase):
             "price": "price_usd",
         }
         sort_col = sort_map.get(filters.sort_by or "name", "name")
+        return where_clause, params, f"{sort_col} {order_direction}"
 
-        # Get paginated results (one per card name)
-        query = f"""
-            SELECT * FROM cards
-            WHERE {where_clause}
-            GROUP BY name
-            ORDER BY {sort_col} {order_direction}
-            LIMIT ? OFFSET ?
+    @staticmethod
+    def _is_oracle_search(filters: SearchCardsInput) -> bool:
+        """Whether a search only filters on card-level fields (not per-printing ones)."""
+        return not (filters.set_code or filters.rarity or filters.artist)
+
+    async def _search_page(
+        self, filters: SearchCardsInput, columns: str
+    ) -> tuple[list[aiosqlite.Row], int, dict[str, str]]:
+        """Run a card search.
+
+        Uses oracle_cards when the filters are card-level, otherwise dedupes
+        matching printings by name.
+
+        Returns:
+            Tuple of (page's raw rows, total match count, name -> flavor name for
+            rows matched by a flavor name that is not their canonical printing's)
         """
+        oracle = self._is_oracle_search(filters) and await self.has_oracle_cards()
+        where_clause, params, order_by = self._search_clauses(filters, oracle=oracle)
+
+        # Get total count
+        if oracle:
+            count_query = f"SELECT COUNT(*) FROM oracle_cards WHERE {where_clause}"
+        else:
+            count_query = f"""
+                SELECT COUNT(*) FROM (
+                    SELECT DISTINCT name FROM cards WHERE {where_clause}
+                )
+            """
+        async with self._execute(count_query, params) as cursor:
+            row = await cursor.fetchone()
+            total_count = row[0] if row else 0
+
+        # Get paginated results (one per card name)
+        if oracle:
+            query = f"""
+                SELECT {columns} FROM oracle_cards
+                WHERE {where_clause}
+                ORDER BY {order_by}
+                LIMIT ? OFFSET ?
+            """
+        else:
+            query = f"""
+                SELECT {columns} FROM cards
+                WHERE {where_clause}
+                GROUP BY name
+                ORDER BY {order_by}
+                LIMIT ? OFFSET ?
+            """
         page_params = [*params, filters.page_size, (filters.page - 1) * filters.page_size]
 
-        cards: list[Card] = []
         async with self._execute(query, page_params) as cursor:
+            rows = list(await cursor.fetchall())
+
+        flavor_names: dict[str, str] = {}
+        if oracle and filters.name and rows:
+            flavor_names = await self._matching_flavor_names(
+                filters.name, [row["name"] for row in rows]
+            )
+        return rows, total_count, flavor_names
+
+    async def _matching_flavor_names(self, search: str, names: list[str]) -> dict[str, str]:
+        """Map names that don't contain ``search`` to a flavor name of theirs that does."""
+        needle = search.lower()
+        candidates = [name for name in names if needle not in name.lower()]
+        if not candidates:
+            return {}
+        placeholders = ",".join("?" * len(candidates))
+        flavor_names: dict[str, str] = {}
+        async with self._execute(
+            f"""
+            SELECT name, flavor_name FROM cards
+            WHERE flavor_name IS NOT NULL AND flavor_name COLLATE NOCASE LIKE ?
+            AND name IN ({placeholders})
+            """,
+            [f"%{search}%", *candidates],
+        ) as cursor:
             async for row in cursor:
-                cards.append(self._row_to_card(row))
+                flavor_names.setdefault(row[0], row[1])
+        return flavor_names
 
+    async def search_cards(self, filters: SearchCardsInput) -> tuple[list[Card], int]:
+        """Search for cards matching the given filters.
+
+        Returns:
+            Tuple of (cards on this page, total matching count)
+        """
+        rows, total_count, flavor_names = await self._search_page(filters, "*")
+        cards = [self._row_to_card(row) for row in rows]
+        for card in cards:
+            if card.name in flavor_names:
+                card.flavor_name = flavor_names[card.name]
         return cards, total_count
 
+    async def search_card_rows(self, filters: SearchCardsInput) -> tuple[list[CardSummaryRow], int]:
+        """Search like search_cards(), fetching only the columns of a search result.
+
+        Returns:
+            Tuple of (summary rows on this page, total matching count)
+        """
+        rows, total_count, flavor_names = await self._search_page(
+            filters, select_columns(CardSummaryRow)
+        )
+        results = [CardSummaryRow._make(row) for row in rows]
+        if flavor_names:
+            results = [
+                r._replace(flavor_name=flavor_names[r.name]) if r.name in flavor_names else r
+                for r in results
+            ]
+        return results, total_count
+
+    @staticmethod
+    def _parse_legalities(value: str | None) -> list[CardLegality]:
+        """Parse a legalities JSON object into CardLegality entries."""
+        if not value:
+            return []
+        return [
+            CardLegality(format=fmt, legality=status)
+            for fmt, status in json.loads(value).items()
+            if status  # Skip null/empty values
+        ]
+
     async def _get_legalities(self, card_id: str) -> list[CardLegality]:
         """Get format legalities for a card from JSON."""
         async with self._execute(
@@ -438,15 +725,9 @@ class UnifiedDatabase(BaseDatabase):
             (card_id,),
         ) as cursor:
             row = await cursor.fetchone()
-            if not row or not row["legalities"]:
+            if not row:
                 return []
-
-            legalities_dict = json.loads(row["legalities"])
-            return [
-                CardLegality(format=fmt, legality=status)
-                for fmt, status in legalities_dict.items()
-                if status  # Skip null/empty values
-            ]
+            return self._parse_legalities(row["legalities"])
 
     async def _get_rulings(self, oracle_id: str) -> list[CardRuling]:
         """Get rulings for a card by oracle_id."""
@@ -461,6 +742,36 @@ class UnifiedDatabase(BaseDatabase):
                 )
         return rulings
 
+    async def _get_rulings_many(self, oracle_ids: list[str]) -> dict[str, list[CardRuling]]:
+        """Get rulings for many cards in one query, keyed by oracle_id."""
+        rulings: dict[str, list[CardRuling]] = {}
+        if not oracle_ids:
+            return rulings
+        async with self._execute(
+            """
+            SELECT oracle_id, published_at, comment FROM rulings
+            WHERE oracle_id IN (SELECT value FROM json_each(?))
+            ORDER BY published_at DESC
+            """,
+            (json.dumps(list(dict.fromkeys(oracle_ids))),),
+        ) as cursor:
+            async for row in cursor:
+                rulings.setdefault(row["oracle_id"], []).append(
+                    CardRuling(date=row["published_at"] or "", text=row["comment"] or "")
+                )
+        return rulings
+
+    async def _rows_to_cards_with_extras(self, rows: list[aiosqlite.Row]) -> list[Card]:
+        """Convert card rows to Cards with legalities (from the row) and rulings."""
+        rulings = await self._get_rulings_many([row["oracle_id"] for row in rows])
+        cards = []
+        for row in rows:
+            card = self._row_to_card(row)
+            card.legalities = self._parse_legalities(row["legalities"])
+            card.rulings = rulings.get(row["oracle_id"], [])
+            cards.append(card)
+        return cards
+
     async def get_card_rulings(self, name: str) -> list[CardRuling]:
         """Get rulings for a card by name."""
         async with self._execute(
@@ -483,15 +794,22 @@ class UnifiedDatabase(BaseDatabase):
                 return {}
             return cast(dict[str, str], json.loads(row["legalities"]))
 
+    async def _all_sets(self) -> list[Set]:
+        """Every set, newest first.
+
+        Read once per connection: the database is rebuilt as a new file, never in place.
+        """
+        if self._sets is None:
+            async with self._execute("SELECT * FROM sets ORDER BY release_date DESC") as cursor:
+                self._sets = [self._row_to_set(row) for row in await cursor.fetchall()]
+        return self._sets
+
     async def get_set(self, code: str) -> Set:
         """Get a set by its code. Raises SetNotFoundError if not found."""
-        async with self._execute(
-            "SELECT * FROM sets WHERE code COLLATE NOCASE = ?",
-            (code,),
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return self._row_to_set(row)
+        code_lower = code.lower()
+        for card_set in await self._all_sets():
+            if card_set.code.lower() == code_lower:
+                return card_set
         raise SetNotFoundError(code)
 
     async def get_all_sets(
@@ -500,72 +818,159 @@ class UnifiedDatabase(BaseDatabase):
         include_online_only: bool = True,
     ) -> list[Set]:
         """Get all sets, optionally filtered by type."""
-        conditions: list[str] = []
-        params: list[Any] = []
-
+        sets = await self._all_sets()
         if set_type:
-            conditions.append("set_type COLLATE NOCASE = ?")
-            params.append(set_type)
-
+            type_lower = set_type.lower()
+            sets = [s for s in sets if s.type is not None and s.type.lower() == type_lower]
         if not include_online_only:
-            conditions.append("(is_online_only IS NULL OR is_online_only = 0)")
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        sets: list[Set] = []
-        async with self._execute(
-            f"""
-            SELECT * FROM sets
-            WHERE {where_clause}
-            ORDER BY release_date DESC
-            """,
-            params,
-        ) as cursor:
-            async for row in cursor:
-                sets.append(self._row_to_set(row))
-        return sets
+            sets = [s for s in sets if not s.is_online_only]
+        return list(sets)
 
     async def search_sets(self, name: str) -> list[Set]:
         """Search sets by name."""
-        sets: list[Set] = []
-        async with self._execute(
-            """
-            SELECT * FROM sets
-            WHERE name LIKE ?
-            ORDER BY release_date DESC
-            """,
-            (f"%{name}%",),
-        ) as cursor:
-            async for row in cursor:
-                sets.append(self._row_to_set(row))
-        return sets
+        name_lower = name.lower()
+        return [s for s in await self._all_sets() if name_lower in s.name.lower()]
 
-    async def get_database_stats(self) -> dict[str, Any]:
-        """Get database statistics."""
-        stats: dict[str, Any] = {}
+    async def has_set_index(self) -> bool:
+        """Whether the database has the set_cards/set_stats index built at ingest.
 
-        async with self._execute("SELECT COUNT(*) FROM cards") as cursor:
-            row = await cursor.fetchone()
-            stats["total_cards"] = row[0] if row else 0
+        Databases built before it fall back to querying cards per set.
+        """
+        if self._set_index_available is None:
+            self._set_index_available = await check_set_index_available(self._db)
+        return self._set_index_available
 
-        async with self._execute("SELECT COUNT(DISTINCT name) FROM cards") as cursor:
-            row = await cursor.fetchone()
-            stats["unique_cards"] = row[0] if row else 0
+    async def get_set_cards(
+        self, code: str, batch_size: int = SET_CARDS_BATCH_SIZE
+    ) -> AsyncIterator[list[CardSummaryRow]]:
+        """Stream every printing in a set, in collector number order.
 
-        async with self._execute("SELECT COUNT(*) FROM sets") as cursor:
-            row = await cursor.fetchone()
-            stats["total_sets"] = row[0] if row else 0
+        Yields:
+            Batches of up to batch_size rows; none for an unknown or empty set.
+        """
+        if not await self.has_set_index():
+            async with self._execute(
+                f"""
+                SELECT {select_columns(CardSummaryRow)} FROM cards
+                WHERE set_code COLLATE NOCASE = ?
+                ORDER BY {COLLECTOR_ORDER}
+                """,
+                (code,),
+            ) as cursor:
+                rows = [CardSummaryRow._make(row) for row in await cursor.fetchall()]
+            for i in range(0, len(rows), batch_size):
+                yield rows[i : i + batch_size]
+            return
+
+        # Keyset pages, so no query stays open while the caller handles a batch
+        position = 0
+        while True:
+            async with self._execute(
+                f"""
+                SELECT s.position, {select_columns(CardSummaryRow, "c")}
+                FROM set_cards s
+                JOIN cards c ON c.id = s.id
+                WHERE s.set_code = ? AND s.position > ?
+                ORDER BY s.position
+                LIMIT ?
+                """,
+                (code.lower(), position, batch_size),
+            ) as cursor:
+                page = list(await cursor.fetchall())
+            if not page:
+                return
+            position = page[-1][0]
+            yield [CardSummaryRow._make(tuple(row)[1:]) for row in page]
+            if len(page) < batch_size:
+                return
+
+    async def get_set_stats(self, code: str) -> SetStats:
+        """Get a set's rarity/type/color histograms, mechanics and value.
+
+        An unknown set has total_cards 0.
+        """
+        if await self.has_set_index():
+            async with self._execute(
+                "SELECT * FROM set_stats WHERE set_code = ?", (code.lower(),)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return SetStats(set_code=code, total_cards=0)
+            return SetStats(
+                set_code=code,
+                total_cards=row["card_count"],
+                unique_cards=row["unique_cards"],
+                rarity_distribution=json.loads(row["rarities"]),
+                type_distribution=json.loads(row["types"]),
+                color_distribution=json.loads(row["colors"]),
+                mechanics=json.loads(row["mechanics"]),
+                avg_cmc=row["avg_cmc"],
+                total_value_usd=row["value_usd"] / 100,
+                total_value_usd_foil=row["value_usd_foil"] / 100,
+            )
 
-        async with self._execute("SELECT value FROM meta WHERE key = 'created_at'") as cursor:
-            row = await cursor.fetchone()
-            if row:
-                stats["created_at"] = row[0]
+        async with self._execute(
+            f"SELECT set_code, {TALLY_COLUMNS} FROM cards WHERE set_code COLLATE NOCASE = ?",
+            (code,),
+        ) as cursor:
+            tally = tally_sets(await cursor.fetchall()).get(code.lower())
+        if tally is None:
+            return SetStats(set_code=code, total_cards=0)
+        return SetStats(
+            set_code=code,
+            total_cards=tally.card_count,
+            unique_cards=len(tally.names),
+            rarity_distribution=dict(tally.rarities),
+            type_distribution=dict(tally.types),
+            color_distribution=dict(tally.colors),
+            mechanics=tally.mechanics,
+            avg_cmc=tally.avg_cmc,
+            total_value_usd=tally.value_usd / 100,
+            total_value_usd_foil=tally.value_usd_foil / 100,
+        )
 
-        async with self._execute("SELECT value FROM meta WHERE key = 'schema_version'") as cursor:
-            row = await cursor.fetchone()
-            if row:
-                stats["schema_version"] = row[0]
+    async def get_meta(self) -> dict[str, str]:
+        """Get the build metadata (counts, build time, data version).
 
+        Read once per connection: the database is rebuilt as a new file, never in place.
+        """
+        if self._meta is None:
+            meta = await read_meta(self._db)
+            # Databases built before counts were recorded: count once
+            for key, query in (
+                ("card_count", "SELECT COUNT(*) FROM cards"),
+                ("unique_card_count", "SELECT COUNT(DISTINCT name) FROM cards"),
+                ("set_count", "SELECT COUNT(*) FROM sets"),
+            ):
+                if key not in meta:
+                    async with self._execute(query) as cursor:
+                        row = await cursor.fetchone()
+                        meta[key] = str(row[0] if row else 0)
+            meta.setdefault(DATA_VERSION_KEY, data_fingerprint(meta))
+            self._meta = meta
+        return self._meta
+
+    async def get_data_version(self) -> str:
+        """Get the fingerprint of this database build, for keying derived caches."""
+        return (await self.get_meta())[DATA_VERSION_KEY]
+
+    async def get_database_stats(self) -> dict[str, Any]:
+        """Get database statistics (recorded at build time)."""
+        meta = await self.get_meta()
+        stats: dict[str, Any] = {
+            "total_cards": int(meta["card_count"]),
+            "unique_cards": int(meta["unique_card_count"]),
+            "total_sets": int(meta["set_count"]),
+            "data_version": meta[DATA_VERSION_KEY],
+        }
+        if "ruling_count" in meta:
+            stats["total_rulings"] = int(meta["ruling_count"])
+        for key in ("created_at", "schema_version"):
+            if key in meta:
+                stats[key] = meta[key]
+        data_date = meta.get("scryfall_updated_at") or meta.get("created_at")
+        if data_date:
+            stats["data_date"] = data_date[:10]
         return stats
 
     async def get_random_card(self) -> Card:
@@ -619,11 +1024,11 @@ class UnifiedDatabase(BaseDatabase):
         results: dict[str, Card] = {}
         names_to_fetch: list[str] = []
 
-        for name in names:
-            cache_key = f"name:{name.lower()}:extras={include_extras}"
-            cached = await self._cache.get(cache_key)
-            if cached:
-                results[name.lower()] = cached
+        keys = {name: f"name:{name.lower()}:extras={include_extras}" for name in names}
+        cached = self._cache.get_many(keys.values())
+        for name, cache_key in keys.items():
+            if cache_key in cached:
+                results[name.lower()] = cached[cache_key]
             else:
                 names_to_fetch.append(name)
 
@@ -631,11 +1036,17 @@ class UnifiedDatabase(BaseDatabase):
             return results
 
         placeholders = ",".join("?" * len(names_to_fetch))
-        query = f"""
-            SELECT * FROM cards
-            WHERE name IN ({placeholders}) AND {EXCLUDE_EXTRAS}
-            ORDER BY release_date DESC
-        """
+        if await self.has_oracle_cards():
+            query = f"""
+                SELECT * FROM oracle_cards
+                WHERE name IN ({placeholders}) AND {EXCLUDE_EXTRAS}
+            """
+        else:
+            query = f"""
+                SELECT * FROM cards
+                WHERE name IN ({placeholders}) AND {EXCLUDE_EXTRAS}
+                ORDER BY release_date DESC
+            """
 
         name_to_row: dict[str, aiosqlite.Row] = {}
         async with self._execute(query, names_to_fetch) as cursor:
@@ -644,14 +1055,17 @@ class UnifiedDatabase(BaseDatabase):
                 if name_lower not in name_to_row:
                     name_to_row[name_lower] = row
 
-        for name_lower, row in name_to_row.items():
-            card = self._row_to_card(row)
-            if include_extras:
-                card.legalities = await self._get_legalities(row["id"])
-                card.rulings = await self._get_rulings(row["oracle_id"])
-            cache_key = f"name:{name_lower}:extras={include_extras}"
-            await self._cache.set(cache_key, card)
+        rows = list(name_to_row.values())
+        if include_extras:
+            cards = await self._rows_to_cards_with_extras(rows)
+        else:
+            cards = [self._row_to_card(row) for row in rows]
+
+        fetched: dict[str, Card] = {}
+        for name_lower, card in zip(name_to_row, cards, strict=True):
+            fetched[f"name:{name_lower}:extras={include_extras}"] = card
             results[name_lower] = card
+        self._cache.set_many(fetched)
 
         return results
 
@@ -661,8 +1075,11 @@ class UnifiedDatabase(BaseDatabase):
         max_price: float | None = None,
         page: int = 1,
         page_size: int = 25,
-    ) -> list[Card]:
-        """Search cards by price range (prices in USD)."""
+    ) -> list[PriceRow]:
+        """Search cards by price range (prices in USD).
+
+        Returns slim price rows; call ``to_card()`` on a row for a Card.
+        """
         conditions = ["price_usd IS NOT NULL", EXCLUDE_EXTRAS]
         params: list[Any] = []
 
@@ -676,25 +1093,27 @@ class UnifiedDatabase(BaseDatabase):
         where_clause = " AND ".join(conditions)
         offset = (page - 1) * page_size
 
-        cards: list[Card] = []
         async with self._execute(
             f"""
-            SELECT * FROM cards
+            SELECT {select_columns(PriceRow)} FROM cards
             WHERE {where_clause}
             ORDER BY price_usd DESC
             LIMIT ? OFFSET ?
             """,
             [*params, page_size, offset],
         ) as cursor:
-            async for row in cursor:
-                cards.append(self._row_to_card(row))
-        return cards
+            return [PriceRow._make(row) for row in await cursor.fetchall()]
 
     async def get_all_keywords(self) -> set[str]:
         """Get all unique keywords from the cards table.
 
-        Keywords are stored as JSON arrays in the database.
+        Read from the list recorded in meta at build time; older databases fall
+        back to parsing the keywords JSON arrays in the cards table.
         """
+        recorded = (await self.get_meta()).get(KEYWORDS_KEY)
+        if recorded is not None:
+            return set(self._parse_json_list(recorded) or [])
+
         keywords: set[str] = set()
         async with self._execute(
             "SELECT DISTINCT keywords FROM cards WHERE keywords IS NOT NULL AND keywords != ''"
@@ -706,6 +1125,44 @@ class UnifiedDatabase(BaseDatabase):
                         keywords.update(keyword_list)
         return keywords
 
+    async def get_recommendation_cards(self) -> list[dict[str, Any]]:
+        """Get one row per card name with the fields the TF-IDF recommender indexes.
+
+        Ordered by EDHREC rank; promos, tokens and split/double-faced names are left out.
+        """
+        # oracle_cards already holds one canonical row per name; older databases
+        # dedupe the printings here instead
+        oracle = await self.has_oracle_cards()
+        query = f"""
+            SELECT
+                c.name,
+                c.id AS uuid,
+                c.type_line AS type,
+                c.oracle_text AS text,
+                c.mana_cost AS manaCost,
+                c.colors,
+                c.color_identity AS colorIdentity,
+                c.type_line AS types,
+                -- subtypes extracted from type_line by _build_document
+                c.type_line AS subtypes,
+                c.keywords,
+                c.power,
+                c.toughness,
+                c.cmc AS manaValue,
+                c.edhrec_rank AS edhrecRank
+            FROM {"oracle_cards" if oracle else "cards"} c
+            WHERE (c.is_promo IS NULL OR c.is_promo = 0)
+              AND c.is_token = 0
+              AND c.name NOT LIKE '%//%'
+            {"" if oracle else "GROUP BY c.name"}
+            ORDER BY c.edhrec_rank ASC NULLS LAST
+        """
+        cards: list[dict[str, Any]] = []
+        async with self._execute(query) as cursor:
+            async for row in cursor:
+                cards.append(dict(row))
+        return cards
+
     async def get_random_artist_for_spotlight(self, min_cards: int = 20) -> ArtistSummary | None:
         """Get a random artist for the dashboard spotlight.
 
@@ -794,7 +1251,16 @@ class UnifiedDatabase(BaseDatabase):
         Returns:
             List of unique cards by this artist, sorted by release date (newest first).
         """
-        cards: list[Card] = []
+        rows = await self._artist_rows(artist, "*")
+        return [self._row_to_card(row) for row in rows]
+
+    async def get_artist_card_rows(self, artist: str) -> list[CardSummaryRow]:
+        """Get the cards of get_cards_by_artist() as slim summary rows."""
+        rows = await self._artist_rows(artist, select_columns(CardSummaryRow))
+        return [CardSummaryRow._make(row) for row in rows]
+
+    async def _artist_rows(self, artist: str, columns: str) -> list[aiosqlite.Row]:
+        """Select the newest printing of each card by an artist."""
         # Match exact name, or collaborative works in any position (case-insensitive):
         # - "Artist & Other" (first)
         # - "Other & Artist" (last)
@@ -815,16 +1281,14 @@ class UnifiedDatabase(BaseDatabase):
                 WHERE (LOWER(artist) = ? OR LOWER(artist) LIKE ? OR LOWER(artist) LIKE ? OR LOWER(artist) LIKE ?)
                     AND {EXCLUDE_EXTRAS}
             )
-            SELECT *
+            SELECT {columns}
             FROM artist_cards
             WHERE rn = 1
             ORDER BY release_date DESC, name
             """,
             (artist_lower, artist_first, artist_last, artist_middle),
         ) as cursor:
-            async for row in cursor:
-                cards.append(self._row_to_card(row))
-        return cards
+            return list(await cursor.fetchall())
 
     async def get_all_artists(self, min_cards: int = 1) -> list[ArtistSummary]:
         """Get all artists with their card counts.
@@ -17,7 +17,7 @@ import aiosqlite
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
-SCHEMA_VERSION = 4
+SCHEMA_VERSION = 5
 
 SCHEMA_SQL = """
 -- Schema version tracking
@@ -72,21 +72,31 @@ BEGIN
     UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
 END;
 
+-- Decks whose card writes are being batched by add_cards(): the card triggers
+-- skip them and the batch updates the deck timestamp once. Rows only exist
+-- inside the batch's transaction.
+CREATE TABLE IF NOT EXISTS deck_batch_writes (
+    deck_id INTEGER PRIMARY KEY
+);
+
 -- Trigger to update deck timestamp when cards change
 CREATE TRIGGER IF NOT EXISTS update_deck_on_card_change
 AFTER INSERT ON deck_cards
+WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = NEW.deck_id)
 BEGIN
     UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.deck_id;
 END;
 
 CREATE TRIGGER IF NOT EXISTS update_deck_on_card_update
 AFTER UPDATE ON deck_cards
+WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = NEW.deck_id)
 BEGIN
     UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.deck_id;
 END;
 
 CREATE TRIGGER IF NOT EXISTS update_deck_on_card_delete
 AFTER DELETE ON deck_cards
+WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = OLD.deck_id)
 BEGIN
     UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.deck_id;
 END;
@@ -105,6 +115,9 @@ CREATE TABLE IF NOT EXISTS collection_cards (
 
 CREATE INDEX IF NOT EXISTS idx_collection_card ON collection_cards(card_name);
 CREATE INDEX IF NOT EXISTS idx_collection_added ON collection_cards(added_at DESC);
+-- Name-sorted keyset pages in query_collection()
+CREATE INDEX IF NOT EXISTS idx_collection_card_nocase
+    ON collection_cards(card_name COLLATE NOCASE, card_name);
 
 -- Trigger to update updated_at on collection changes
 CREATE TRIGGER IF NOT EXISTS update_collection_timestamp
@@ -184,6 +197,43 @@ class CollectionHistoryRow:
     created_at: datetime
 
 
+@dataclass
+class CollectionFilter:
+    """Filters for UserDatabase.query_collection(); unset fields match every card."""
+
+    search: str = ""  # Substring of the card name or type line
+    card_type: str | None = None  # Substring of the type line, e.g. "creature"
+    color: str | None = None  # W/U/B/R/G, "C" for colorless or "M" for multicolored
+    availability: str | None = None  # "available" (copies not in decks) or "in_decks"
+
+
+# Keyset position in query_collection() results: (sort key, card name) of the last row
+CollectionCursor = tuple[Any, str]
+
+# Schema name of the card database when attached to the user database
+CARD_DB_SCHEMA = "card_db"
+
+# query_collection() sort keys, all ascending; descending orders negate the value
+_COLLECTION_SORT_KEYS = {
+    "name": "cc.card_name COLLATE NOCASE",
+    "cmc": "COALESCE(o.cmc, 999.0)",
+    "type": "lower(COALESCE(o.type_line, 'zzz'))",
+    "qty": "-(cc.quantity + cc.foil_quantity)",
+    "price": "-COALESCE({price}, 0)",
+}
+
+# Type buckets for collection facet counts, first match wins
+_COLLECTION_TYPES = (
+    "creature",
+    "instant",
+    "sorcery",
+    "artifact",
+    "enchantment",
+    "planeswalker",
+    "land",
+)
+
+
 class UserDatabase:
     """SQLite database for user data (decks, collections, etc.)."""
 
@@ -191,6 +241,8 @@ class UserDatabase:
         self.db_path = db_path
         self._conn: aiosqlite.Connection | None = None
         self._semaphore = asyncio.Semaphore(max_connections)
+        # Card attribute join for collection queries, set by attach_card_database()
+        self._card_join: str | None = None
 
     @property
     def conn(self) -> aiosqlite.Connection:
@@ -218,6 +270,41 @@ class UserDatabase:
         await self._create_schema()
         logger.info("User database connected at %s", self.db_path)
 
+    async def attach_card_database(self, path: Path) -> bool:
+        """Attach the MTG card database read-only for collection queries.
+
+        query_collection() filters and sorts collection cards by attributes of
+        their card (type, colors, mana value, price) joined from it. Without it
+        those attributes are unknown. Returns False if it could not be attached.
+        """
+        try:
+            await self.conn.execute(
+                f"ATTACH DATABASE ? AS {CARD_DB_SCHEMA}",
+                (f"{path.resolve().as_uri()}?mode=ro",),
+            )
+            async with self.conn.execute(
+                f"SELECT name FROM {CARD_DB_SCHEMA}.sqlite_master"
+                " WHERE type = 'table' AND name IN ('cards', 'oracle_cards')"
+            ) as cursor:
+                tables = {row["name"] async for row in cursor}
+        except sqlite3.Error as e:
+            logger.warning("Could not attach card database %s: %s", path, e)
+            return False
+
+        if "oracle_cards" in tables:
+            self._card_join = f"LEFT JOIN {CARD_DB_SCHEMA}.oracle_cards o ON o.name = cc.card_name"
+        elif "cards" in tables:
+            self._card_join = (
+                f"LEFT JOIN {CARD_DB_SCHEMA}.cards o ON o.id = ("
+                f"SELECT id FROM {CARD_DB_SCHEMA}.cards WHERE name = cc.card_name"
+                " ORDER BY release_date DESC LIMIT 1)"
+            )
+        else:
+            logger.warning("Card database %s has no cards table", path)
+            await self.conn.execute(f"DETACH DATABASE {CARD_DB_SCHEMA}")
+            return False
+        return True
+
     async def close(self) -> None:
         """Close the database connection."""
         if self._conn:
@@ -316,6 +403,37 @@ class UserDatabase:
             """)
             logger.info("Migration 3 -> 4 complete")
 
+        if from_version < 5:
+            # Migration 4 -> 5: Let batched card writes skip the per-row deck timestamp triggers
+            logger.info("Running migration 4 -> 5: Adding deck_batch_writes table")
+            await self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS deck_batch_writes (
+                    deck_id INTEGER PRIMARY KEY
+                );
+                DROP TRIGGER IF EXISTS update_deck_on_card_change;
+                DROP TRIGGER IF EXISTS update_deck_on_card_update;
+                DROP TRIGGER IF EXISTS update_deck_on_card_delete;
+                CREATE TRIGGER update_deck_on_card_change
+                AFTER INSERT ON deck_cards
+                WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = NEW.deck_id)
+                BEGIN
+                    UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.deck_id;
+                END;
+                CREATE TRIGGER update_deck_on_card_update
+                AFTER UPDATE ON deck_cards
+                WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = NEW.deck_id)
+                BEGIN
+                    UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.deck_id;
+                END;
+                CREATE TRIGGER update_deck_on_card_delete
+                AFTER DELETE ON deck_cards
+                WHEN NOT EXISTS (SELECT 1 FROM deck_batch_writes WHERE deck_id = OLD.deck_id)
+                BEGIN
+                    UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.deck_id;
+                END;
+            """)
+            logger.info("Migration 4 -> 5 complete")
+
     # ─────────────────────────────────────────────────────────────────────────
     # Deck CRUD
     # ─────────────────────────────────────────────────────────────────────────
@@ -439,9 +557,12 @@ class UserDatabase:
         is_commander: bool = False,
         set_code: str | None = None,
         collector_number: str | None = None,
-    ) -> None:
-        """Add a card to a deck. If card exists, increases quantity and updates printing."""
-        await self.conn.execute(
+    ) -> DeckCardRow:
+        """Add a card to a deck. If card exists, increases quantity and updates printing.
+
+        Returns the card's row on that board after the add.
+        """
+        async with self.conn.execute(
             """
             INSERT INTO deck_cards (deck_id, card_name, quantity, is_sideboard, is_commander, set_code, collector_number)
             VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -450,6 +571,7 @@ class UserDatabase:
                 quantity = quantity + excluded.quantity,
                 set_code = COALESCE(excluded.set_code, set_code),
                 collector_number = COALESCE(excluded.collector_number, collector_number)
+            RETURNING *
             """,
             (
                 deck_id,
@@ -460,8 +582,62 @@ class UserDatabase:
                 set_code,
                 collector_number,
             ),
-        )
+        ) as cursor:
+            row = await cursor.fetchone()
         await self.conn.commit()
+        assert row is not None  # An upsert always returns its row
+        return self._row_to_deck_card(row)
+
+    async def add_cards(
+        self,
+        deck_id: int,
+        cards: Sequence[tuple[str, int, bool]],
+    ) -> list[DeckCardRow]:
+        """Add many (card_name, quantity, sideboard) entries to a deck in one transaction.
+
+        Each entry adds like add_card(); repeated entries are merged first. The
+        per-row deck timestamp triggers are skipped and the deck's updated_at is
+        set once. Returns the resulting row for each distinct card and board.
+        """
+        merged: dict[tuple[str, bool], int] = {}
+        for card_name, quantity, sideboard in cards:
+            key = (card_name, sideboard)
+            merged[key] = merged.get(key, 0) + quantity
+        if not merged:
+            return []
+
+        try:
+            await self.conn.execute(
+                "INSERT OR IGNORE INTO deck_batch_writes (deck_id) VALUES (?)", (deck_id,)
+            )
+            await self.conn.executemany(
+                """
+                INSERT INTO deck_cards (deck_id, card_name, quantity, is_sideboard)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (deck_id, card_name, is_sideboard)
+                DO UPDATE SET quantity = quantity + excluded.quantity
+                """,
+                [
+                    (deck_id, card_name, quantity, int(sideboard))
+                    for (card_name, sideboard), quantity in merged.items()
+                ],
+            )
+            await self.conn.execute("DELETE FROM deck_batch_writes WHERE deck_id = ?", (deck_id,))
+            await self.conn.execute(
+                "UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = ?", (deck_id,)
+            )
+            async with self.conn.execute(
+                "SELECT * FROM deck_cards WHERE deck_id = ?", (deck_id,)
+            ) as cursor:
+                rows = {
+                    (row["card_name"], bool(row["is_sideboard"])): self._row_to_deck_card(row)
+                    async for row in cursor
+                }
+            await self.conn.commit()
+        except BaseException:
+            await self.conn.rollback()
+            raise
+        return [rows[key] for key in merged]
 
     async def remove_card(self, deck_id: int, card_name: str, sideboard: bool = False) -> bool:
         """Remove a card entirely from a deck."""
@@ -478,109 +654,89 @@ class UserDatabase:
 
     async def set_quantity(
         self, deck_id: int, card_name: str, quantity: int, sideboard: bool = False
-    ) -> None:
-        """Set the quantity of a card. If quantity is 0, removes the card."""
+    ) -> DeckCardRow | None:
+        """Set the quantity of a card. If quantity is 0, removes the card.
+
+        Returns the updated row, or None if the card was removed or is not on that board.
+        """
         if quantity <= 0:
             await self.remove_card(deck_id, card_name, sideboard)
-            return
+            return None
 
-        await self.conn.execute(
+        async with self.conn.execute(
             """
             UPDATE deck_cards
             SET quantity = ?
             WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
+            RETURNING *
             """,
             (quantity, deck_id, card_name, int(sideboard)),
-        )
+        ) as cursor:
+            row = await cursor.fetchone()
         await self.conn.commit()
+        return self._row_to_deck_card(row) if row else None
 
-    async def move_to_sideboard(self, deck_id: int, card_name: str) -> None:
-        """Move a card from mainboard to sideboard."""
-        # Check if already in sideboard
-        async with self.conn.execute(
-            """
-            SELECT quantity FROM deck_cards
-            WHERE deck_id = ? AND card_name = ? AND is_sideboard = 1
-            """,
-            (deck_id, card_name),
-        ) as cursor:
-            existing = await cursor.fetchone()
+    async def move_to_sideboard(self, deck_id: int, card_name: str) -> DeckCardRow | None:
+        """Move a card from mainboard to sideboard.
 
-        if existing:
-            # Merge quantities
-            await self.conn.execute(
-                """
-                UPDATE deck_cards
-                SET quantity = quantity + (
-                    SELECT quantity FROM deck_cards
-                    WHERE deck_id = ? AND card_name = ? AND is_sideboard = 0
-                )
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 1
-                """,
-                (deck_id, card_name, deck_id, card_name),
-            )
-            await self.conn.execute(
-                """
-                DELETE FROM deck_cards
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 0
-                """,
-                (deck_id, card_name),
-            )
-        else:
-            # Just flip the flag
-            await self.conn.execute(
-                """
-                UPDATE deck_cards
-                SET is_sideboard = 1
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 0
-                """,
-                (deck_id, card_name),
-            )
-        await self.conn.commit()
+        Returns the card's sideboard row, or None if it was not on the mainboard.
+        """
+        return await self._move_card(deck_id, card_name, to_sideboard=True)
 
-    async def move_to_mainboard(self, deck_id: int, card_name: str) -> None:
-        """Move a card from sideboard to mainboard."""
-        # Check if already in mainboard
+    async def move_to_mainboard(self, deck_id: int, card_name: str) -> DeckCardRow | None:
+        """Move a card from sideboard to mainboard.
+
+        Returns the card's mainboard row, or None if it was not on the sideboard.
+        """
+        return await self._move_card(deck_id, card_name, to_sideboard=False)
+
+    async def _move_card(
+        self, deck_id: int, card_name: str, to_sideboard: bool
+    ) -> DeckCardRow | None:
+        """Move all copies of a card to the other board, merging with any there."""
+        target, source = int(to_sideboard), int(not to_sideboard)
+
+        # Merge into an existing row on the target board
         async with self.conn.execute(
             """
-            SELECT quantity FROM deck_cards
-            WHERE deck_id = ? AND card_name = ? AND is_sideboard = 0
+            UPDATE deck_cards
+            SET quantity = quantity + (
+                SELECT quantity FROM deck_cards
+                WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
+            )
+            WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
+            AND EXISTS (
+                SELECT 1 FROM deck_cards
+                WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
+            )
+            RETURNING *
             """,
-            (deck_id, card_name),
+            (deck_id, card_name, source, deck_id, card_name, target, deck_id, card_name, source),
         ) as cursor:
-            existing = await cursor.fetchone()
+            row = await cursor.fetchone()
 
-        if existing:
-            # Merge quantities
-            await self.conn.execute(
-                """
-                UPDATE deck_cards
-                SET quantity = quantity + (
-                    SELECT quantity FROM deck_cards
-                    WHERE deck_id = ? AND card_name = ? AND is_sideboard = 1
-                )
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 0
-                """,
-                (deck_id, card_name, deck_id, card_name),
-            )
+        if row:
             await self.conn.execute(
                 """
                 DELETE FROM deck_cards
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 1
+                WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
                 """,
-                (deck_id, card_name),
+                (deck_id, card_name, source),
             )
         else:
-            # Just flip the flag
-            await self.conn.execute(
+            # Nothing to merge with: just flip the flag
+            async with self.conn.execute(
                 """
                 UPDATE deck_cards
-                SET is_sideboard = 0
-                WHERE deck_id = ? AND card_name = ? AND is_sideboard = 1
+                SET is_sideboard = ?
+                WHERE deck_id = ? AND card_name = ? AND is_sideboard = ?
+                RETURNING *
                 """,
-                (deck_id, card_name),
-            )
+                (target, deck_id, card_name, source),
+            ) as cursor:
+                row = await cursor.fetchone()
         await self.conn.commit()
+        return self._row_to_deck_card(row) if row else None
 
     # ─────────────────────────────────────────────────────────────────────────
     # Queries
@@ -597,20 +753,22 @@ class UserDatabase:
             (deck_id,),
         ) as cursor:
             rows = await cursor.fetchall()
-            return [
-                DeckCardRow(
-                    id=row["id"],
-                    deck_id=row["deck_id"],
-                    card_name=row["card_name"],
-                    quantity=row["quantity"],
-                    is_sideboard=bool(row["is_sideboard"]),
-                    is_commander=bool(row["is_commander"]),
-                    set_code=row["set_code"],
-                    collector_number=row["collector_number"],
-                    added_at=datetime.fromisoformat(row["added_at"]),
-                )
-                for row in rows
-            ]
+            return [self._row_to_deck_card(row) for row in rows]
+
+    @staticmethod
+    def _row_to_deck_card(row: aiosqlite.Row) -> DeckCardRow:
+        """Convert a deck_cards row to a DeckCardRow."""
+        return DeckCardRow(
+            id=row["id"],
+            deck_id=row["deck_id"],
+            card_name=row["card_name"],
+            quantity=row["quantity"],
+            is_sideboard=bool(row["is_sideboard"]),
+            is_commander=bool(row["is_commander"]),
+            set_code=row["set_code"],
+            collector_number=row["collector_number"],
+            added_at=datetime.fromisoformat(row["added_at"]),
+        )
 
     async def find_decks_with_card(self, card_name: str) -> list[DeckSummary]:
         """Find all decks containing a specific card."""
@@ -909,6 +1067,179 @@ class UserDatabase:
                 for row in rows
             ]
 
+    def _collection_from(self) -> str:
+        """FROM clause joining collection cards with card attributes (o) and deck use (d)."""
+        card_join = self._card_join or (
+            "LEFT JOIN (SELECT NULL AS name, NULL AS type_line, NULL AS colors,"
+            " NULL AS cmc, NULL AS price_usd) o ON 0"
+        )
+        return f"""
+            FROM collection_cards cc
+            {card_join}
+            LEFT JOIN (
+                SELECT card_name, SUM(quantity) AS in_decks FROM deck_cards GROUP BY card_name
+            ) d ON d.card_name = cc.card_name
+        """
+
+    def _collection_price(self) -> str:
+        """Price in cents of a collection card: its printing's if set, else the card's."""
+        if self._card_join is None:
+            return "NULL"
+        printing = f"""
+            SELECT p.price_usd FROM {CARD_DB_SCHEMA}.cards p
+            WHERE p.set_code = lower(cc.set_code) AND p.collector_number = {{number}}
+            LIMIT 1
+        """
+        # Collector numbers also match with leading zeros stripped, preferring an exact match
+        exact = printing.format(number="cc.collector_number")
+        stripped = printing.format(number="ltrim(cc.collector_number, '0')")
+        return f"""(CASE WHEN cc.set_code IS NOT NULL AND cc.collector_number IS NOT NULL
+            THEN COALESCE(({exact}), ({stripped}))
+            ELSE o.price_usd END)"""
+
+    @staticmethod
+    def _collection_where(filters: CollectionFilter) -> tuple[list[str], list[Any]]:
+        """SQL conditions and parameters for a collection filter."""
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        def like(value: str) -> str:
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return f"%{escaped}%"
+
+        if filters.search:
+            conditions.append("(cc.card_name LIKE ? ESCAPE '\\' OR o.type_line LIKE ? ESCAPE '\\')")
+            params += [like(filters.search), like(filters.search)]
+        if filters.card_type:
+            conditions.append("o.type_line LIKE ? ESCAPE '\\'")
+            params.append(like(filters.card_type))
+        if filters.color == "M":
+            conditions.append("json_array_length(o.colors) > 1")
+        elif filters.color == "C":
+            conditions.append("o.name IS NOT NULL AND COALESCE(json_array_length(o.colors), 0) = 0")
+        elif filters.color:
+            conditions.append("o.colors LIKE ?")
+            params.append(f'%"{filters.color}"%')
+        if filters.availability == "available":
+            conditions.append("cc.quantity + cc.foil_quantity > COALESCE(d.in_decks, 0)")
+        elif filters.availability == "in_decks":
+            conditions.append("d.in_decks > 0")
+        return conditions, params
+
+    async def query_collection(
+        self,
+        filters: CollectionFilter | None = None,
+        sort: str = "name",
+        after: CollectionCursor | None = None,
+        limit: int = 100,
+    ) -> tuple[list[CollectionCardRow], CollectionCursor | None]:
+        """Get one keyset page of filtered, sorted collection cards.
+
+        Sorts are "name", "cmc" and "type" (ascending) and "qty" and "price"
+        (descending), with the card name breaking ties. Pass the returned
+        cursor as ``after`` for the next page; it is None on the last page.
+        Pages stay consistent under edits between fetches, unlike OFFSET.
+
+        Returns (rows, cursor).
+        """
+        if sort not in _COLLECTION_SORT_KEYS:
+            raise ValueError(f"Unknown collection sort: {sort}")
+        sort_key = _COLLECTION_SORT_KEYS[sort].format(price=self._collection_price())
+        conditions, params = self._collection_where(filters or CollectionFilter())
+        if after is not None:
+            conditions.append(f"({sort_key}, cc.card_name) > (?, ?)")
+            params += list(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self._execute(
+            f"""
+            SELECT cc.*, {sort_key} AS sort_key
+            {self._collection_from()}
+            {where}
+            ORDER BY {sort_key}, cc.card_name
+            LIMIT ?
+            """,
+            [*params, limit + 1],
+        ) as cursor:
+            rows = list(await cursor.fetchall())
+
+        page = [
+            CollectionCardRow(
+                id=row["id"],
+                card_name=row["card_name"],
+                quantity=row["quantity"],
+                foil_quantity=row["foil_quantity"],
+                set_code=row["set_code"],
+                collector_number=row["collector_number"],
+                added_at=datetime.fromisoformat(row["added_at"]),
+                updated_at=datetime.fromisoformat(row["updated_at"]),
+            )
+            for row in rows[:limit]
+        ]
+        if len(rows) <= limit:
+            return page, None
+        last = rows[limit - 1]
+        return page, (last["sort_key"], last["card_name"])
+
+    async def count_collection(self, filters: CollectionFilter | None = None) -> int:
+        """Count the collection cards matching a filter."""
+        conditions, params = self._collection_where(filters or CollectionFilter())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        async with self._execute(
+            f"SELECT COUNT(*) {self._collection_from()} {where}", params
+        ) as cursor:
+            row = await cursor.fetchone()
+            return int(row[0]) if row else 0
+
+    async def get_collection_facets(self) -> dict[str, dict[str, int]]:
+        """Count collection cards per type, color and availability bucket, in one pass.
+
+        Returns {"type": {...}, "color": {...}, "availability": {...}}; each has
+        an "all" count. Types take the first of creature, instant, sorcery,
+        artifact, enchantment, planeswalker and land the type line contains;
+        colors are W/U/B/R/G, "C" colorless and "M" multicolored.
+        """
+        type_bucket = " ".join(
+            f"WHEN o.type_line LIKE '%{name}%' THEN '{name}'" for name in _COLLECTION_TYPES
+        )
+        async with self._execute(
+            f"""
+            SELECT
+                CASE {type_bucket} END AS type_bucket,
+                CASE
+                    WHEN o.name IS NULL THEN NULL
+                    WHEN COALESCE(json_array_length(o.colors), 0) = 0 THEN 'C'
+                    WHEN json_array_length(o.colors) > 1 THEN 'M'
+                    ELSE json_extract(o.colors, '$[0]')
+                END AS color_bucket,
+                cc.quantity + cc.foil_quantity > COALESCE(d.in_decks, 0) AS available,
+                COALESCE(d.in_decks, 0) > 0 AS in_decks,
+                COUNT(*) AS count
+            {self._collection_from()}
+            GROUP BY 1, 2, 3, 4
+            """
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        total = sum(row["count"] for row in rows)
+        types = dict.fromkeys(_COLLECTION_TYPES, 0)
+        colors = dict.fromkeys(["W", "U", "B", "R", "G", "C", "M"], 0)
+        availability = {"all": total, "available": 0, "in_decks": 0}
+        for row in rows:
+            if row["type_bucket"] in types:
+                types[row["type_bucket"]] += row["count"]
+            if row["color_bucket"] in colors:
+                colors[row["color_bucket"]] += row["count"]
+            if row["available"]:
+                availability["available"] += row["count"]
+            if row["in_decks"]:
+                availability["in_decks"] += row["count"]
+        return {
+            "type": {"all": total, **types},
+            "color": {"all": total, **colors},
+            "availability": availability,
+        }
+
     async def get_collection_count(self) -> int:
         """Get total number of unique cards in collection."""
         async with self.conn.execute("SELECT COUNT(*) as count FROM collection_cards") as cursor:
@@ -937,6 +1268,21 @@ class UserDatabase:
             row = await cursor.fetchone()
             return row["total"] if row else 0
 
+    async def get_collection_totals(self) -> tuple[int, int, int]:
+        """Get (unique cards, total cards, foil cards) in the collection in one query."""
+        async with self.conn.execute(
+            """
+            SELECT COUNT(*) as unique_cards,
+                   COALESCE(SUM(quantity + foil_quantity), 0) as total,
+                   COALESCE(SUM(foil_quantity), 0) as foils
+            FROM collection_cards
+            """
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return 0, 0, 0
+        return row["unique_cards"], row["total"], row["foils"]
+
     async def get_card_deck_usage(self, card_name: str) -> list[tuple[str, int]]:
         """Get all decks that use a card and how many copies.
 
@@ -1002,6 +1348,20 @@ class UserDatabase:
 
         return result
 
+    async def get_deck_card_quantities(self) -> list[tuple[int, str, bool, int]]:
+        """Get the quantity of every card in every deck in a single query.
+
+        Returns list of (deck_id, card_name, is_sideboard, quantity) tuples.
+        """
+        async with self.conn.execute(
+            "SELECT deck_id, card_name, is_sideboard, quantity FROM deck_cards"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [
+            (row["deck_id"], row["card_name"], bool(row["is_sideboard"]), row["quantity"])
+            for row in rows
+        ]
+
     # ─────────────────────────────────────────────────────────────────────────
     # Collection History
     # ─────────────────────────────────────────────────────────────────────────
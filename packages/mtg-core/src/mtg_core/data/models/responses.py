@@ -511,14 +511,18 @@ class ArtistCardsResult(BaseModel):
 
 
 class SetStats(BaseModel):
-    """Set statistics for display."""
+    """Set statistics for display. Counts are per printing."""
 
     set_code: str
     total_cards: int
+    unique_cards: int | None = None
     rarity_distribution: dict[str, int] = Field(default_factory=dict)
+    type_distribution: dict[str, int] = Field(default_factory=dict)
     color_distribution: dict[str, int] = Field(default_factory=dict)
     mechanics: list[str] = Field(default_factory=list)
     avg_cmc: float | None = None
+    total_value_usd: float | None = None  # One of each printing
+    total_value_usd_foil: float | None = None
 
 
 class BlockSummary(BaseModel):
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Run the card lookup daemon shared by Spellbook TUIs and MCP servers.
+
+Keeps one warm card database (connection, card cache, set list and index
+flags), deck recommender and combo detector, and answers calls to them over a
+Unix socket. Frontends attach automatically while it runs and build their own
+in-process when it does not.
+
+Usage:
+    uv run mtg-daemon serve [--socket PATH]
+    uv run mtg-daemon stats [--socket PATH]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import signal
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from mtg_core.config import get_settings
+from mtg_core.daemon import CardDaemon, RemoteDatabase
+
+console = Console()
+app = typer.Typer(help="Card lookup daemon shared by Spellbook and MCP servers")
+
+SocketOption = Annotated[
+    Path | None,
+    typer.Option("--socket", "-s", help="Unix socket path (default: DAEMON_SOCKET_PATH)"),
+]
+
+
+@app.command()
+def serve(socket: SocketOption = None) -> None:
+    """Serve the card database until interrupted."""
+    settings = get_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format="%(levelname)s:%(name)s:%(message)s",
+    )
+
+    async def _serve() -> None:
+        daemon = CardDaemon(settings, socket)
+        try:
+            await daemon.start()
+        except (FileNotFoundError, RuntimeError) as e:
+            console.print(f"[red]{e}[/]")
+            raise typer.Exit(1) from e
+
+        serving = asyncio.create_task(daemon.serve_forever())
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, serving.cancel)
+        console.print(
+            f"[green]OK[/] Serving {settings.mtg_db_path} on [cyan]{daemon.socket_path}[/]"
+        )
+        try:
+            with contextlib.suppress(asyncio.CancelledError):
+                await serving
+        finally:
+            await daemon.stop()
+            console.print("Card daemon stopped")
+
+    asyncio.run(_serve())
+
+
+@app.command()
+def stats(socket: SocketOption = None) -> None:
+    """Show the running daemon's per-method latency histograms."""
+    socket_path = socket or get_settings().daemon_socket_path
+
+    async def _stats() -> None:
+        try:
+            remote, db_path = await RemoteDatabase.connect(socket_path)
+        except OSError as e:
+            console.print(f"[red]No card daemon on {socket_path}: {e}[/]")
+            raise typer.Exit(1) from e
+        try:
+            histograms = await remote.daemon_stats()
+        finally:
+            await remote.close()
+
+        table = Table(title=f"Card daemon ({db_path})")
+        table.add_column("Method", style="cyan")
+        table.add_column("Requests", justify="right")
+        table.add_column("Mean ms", justify="right")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p99 ms", justify="right")
+        for method, histogram in sorted(histograms.items(), key=lambda item: -item[1].count):
+            table.add_row(
+                method,
+                f"{histogram.count:,}",
+                f"{histogram.mean * 1000:.2f}",
+                f"<{histogram.percentile(0.5) * 1000:.2f}",
+                f"<{histogram.percentile(0.99) * 1000:.2f}",
+            )
+        console.print(table)
+
+    asyncio.run(_stats())
+
+
+if __name__ == "__main__":
+    app()
@@ -20,7 +20,6 @@ import json
 import sqlite3
 import tempfile
 from collections.abc import Generator, Iterator
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -39,6 +38,11 @@ from rich.progress import (
     TransferSpeedColumn,
 )
 
+from mtg_core.data.database.meta import write_build_meta
+from mtg_core.data.database.oracle import build_oracle_cards
+from mtg_core.data.database.set_index import build_set_index
+from mtg_core.tools.synergy.index import build_synergy_terms
+
 if TYPE_CHECKING:
     pass
 
@@ -50,7 +54,7 @@ MTGJSON_ALLPRINTINGS_URL = "https://mtgjson.com/api/v5/AllPrintings.json.gz"
 MTGJSON_SETLIST_URL = "https://mtgjson.com/api/v5/SetList.json"
 
 # Schema version for migrations
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 3
 
 # Batch sizes for bulk operations
 CARD_BATCH_SIZE = 5000
@@ -478,6 +482,40 @@ def card_to_tuple(card: dict[str, Any]) -> tuple[Any, ...]:
     )
 
 
+# Bulk insert for card_to_tuple() rows
+CARD_INSERT_SQL = """
+    INSERT OR REPLACE INTO cards (
+        id, oracle_id, name,
+        layout, flavor_name, mana_cost, cmc, colors, color_identity,
+        type_line, oracle_text, flavor_text,
+        power, toughness, loyalty, defense, keywords,
+        set_code, set_name, rarity, collector_number, artist, release_date,
+        is_token, is_promo, is_digital_only, edhrec_rank,
+        image_small, image_normal, image_large, image_png,
+        image_art_crop, image_border_crop,
+        price_usd, price_usd_foil, price_eur, price_eur_foil,
+        purchase_tcgplayer, purchase_cardmarket, purchase_cardhoarder,
+        link_edhrec, link_gatherer,
+        illustration_id, highres_image, border_color, frame,
+        full_art, art_priority, finishes, legalities
+    ) VALUES (
+        ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?
+    )
+"""
+
+
 def stream_cards(cards_json: Path) -> Iterator[dict[str, Any]]:
     """Stream cards from JSON file using ijson for memory efficiency."""
     with cards_json.open("rb") as f:
@@ -508,39 +546,6 @@ def import_cards(cursor: sqlite3.Cursor, cards_json: Path) -> int:
 
     console.print(f"[dim]Importing {total:,} cards in batches of {CARD_BATCH_SIZE:,}...[/]")
 
-    # SQL for bulk insert
-    insert_sql = """
-        INSERT OR REPLACE INTO cards (
-            id, oracle_id, name,
-            layout, flavor_name, mana_cost, cmc, colors, color_identity,
-            type_line, oracle_text, flavor_text,
-            power, toughness, loyalty, defense, keywords,
-            set_code, set_name, rarity, collector_number, artist, release_date,
-            is_token, is_promo, is_digital_only, edhrec_rank,
-            image_small, image_normal, image_large, image_png,
-            image_art_crop, image_border_crop,
-            price_usd, price_usd_foil, price_eur, price_eur_foil,
-            purchase_tcgplayer, purchase_cardmarket, purchase_cardhoarder,
-            link_edhrec, link_gatherer,
-            illustration_id, highres_image, border_color, frame,
-            full_art, art_priority, finishes, legalities
-        ) VALUES (
-            ?, ?, ?,
-            ?, ?, ?, ?, ?, ?,
-            ?, ?, ?,
-            ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?,
-            ?, ?, ?, ?,
-            ?, ?,
-            ?, ?, ?, ?,
-            ?, ?, ?,
-            ?, ?,
-            ?, ?, ?, ?,
-            ?, ?, ?, ?
-        )
-    """
-
     imported = 0
     with Progress(
         SpinnerColumn(),
@@ -555,7 +560,7 @@ def import_cards(cursor: sqlite3.Cursor, cards_json: Path) -> int:
         # Stream and batch insert
         for batch in batched(stream_cards(cards_json), CARD_BATCH_SIZE):
             tuples = [card_to_tuple(card) for card in batch]
-            cursor.executemany(insert_sql, tuples)
+            cursor.executemany(CARD_INSERT_SQL, tuples)
             imported += len(batch)
             progress.update(task, completed=imported)
 
@@ -711,6 +716,7 @@ def build_unified_db(
     sets_json: Path,
     rulings_json: Path,
     mtgjson_path: Path | None = None,
+    scryfall_updated_at: str | None = None,
 ) -> None:
     """Build the unified database from downloaded files."""
     console.print(f"\n[bold]Building unified database: {output_path}[/]\n")
@@ -741,7 +747,7 @@ def build_unified_db(
 
         # Import sets first (needed for set_name denormalization)
         cursor.execute("BEGIN IMMEDIATE")
-        set_count = import_sets(cursor, sets_json)
+        import_sets(cursor, sets_json)
         cursor.execute("COMMIT")
 
         # Import cards
@@ -751,7 +757,7 @@ def build_unified_db(
 
         # Import rulings
         cursor.execute("BEGIN IMMEDIATE")
-        ruling_count = import_rulings(cursor, rulings_json)
+        import_rulings(cursor, rulings_json)
         cursor.execute("COMMIT")
 
         # Supplement EDHREC ranks from MTGJson AllPrintings
@@ -760,6 +766,24 @@ def build_unified_db(
             supplement_edhrec_ranks(cursor, mtgjson_path)
             cursor.execute("COMMIT")
 
+        # Materialize one canonical row per card for name-level queries
+        cursor.execute("BEGIN IMMEDIATE")
+        oracle_count = build_oracle_cards(cursor)
+        cursor.execute("COMMIT")
+        console.print(f"[green]OK[/] Built {oracle_count:,} oracle cards")
+
+        # Evaluate the synergy rule terms against every card (find_synergies)
+        cursor.execute("BEGIN IMMEDIATE")
+        synergy_count = build_synergy_terms(cursor)
+        cursor.execute("COMMIT")
+        console.print(f"[green]OK[/] Indexed {synergy_count:,} synergy term matches")
+
+        # Order each set's cards and tally its stats for the set browser
+        cursor.execute("BEGIN IMMEDIATE")
+        set_count = build_set_index(cursor)
+        cursor.execute("COMMIT")
+        console.print(f"[green]OK[/] Indexed {set_count:,} sets")
+
         # Create indexes
         cursor.execute("BEGIN IMMEDIATE")
         create_indexes(cursor)
@@ -770,29 +794,11 @@ def build_unified_db(
         create_fts_index(cursor, card_count)
         cursor.execute("COMMIT")
 
-        # Insert metadata
+        # Insert metadata (counts and data version, read by get_database_stats)
         cursor.execute("BEGIN IMMEDIATE")
-        cursor.execute(
-            "INSERT INTO meta (key, value) VALUES (?, ?)",
-            ("schema_version", str(SCHEMA_VERSION)),
-        )
-        cursor.execute(
-            "INSERT INTO meta (key, value) VALUES (?, ?)",
-            ("created_at", datetime.now().isoformat()),
-        )
-        cursor.execute(
-            "INSERT INTO meta (key, value) VALUES (?, ?)",
-            ("card_count", str(card_count)),
-        )
-        cursor.execute(
-            "INSERT INTO meta (key, value) VALUES (?, ?)",
-            ("set_count", str(set_count)),
-        )
-        cursor.execute(
-            "INSERT INTO meta (key, value) VALUES (?, ?)",
-            ("ruling_count", str(ruling_count)),
-        )
+        meta = write_build_meta(cursor, SCHEMA_VERSION, scryfall_updated_at)
         cursor.execute("COMMIT")
+        console.print(f"[green]OK[/] Data version {meta['data_version']}")
 
         # Switch to production settings for the final database
         console.print("[dim]Finalizing database with production settings...[/]")
@@ -889,7 +895,9 @@ def main(
 
         # Build unified database
         output_path = output_dir / "mtg.sqlite"
-        build_unified_db(output_path, cards_json, sets_json, rulings_json, mtgjson_path)
+        build_unified_db(
+            output_path, cards_json, sets_json, rulings_json, mtgjson_path, cards_updated
+        )
 
     console.print("\n[bold green]Done![/] Unified database ready to use.")
     console.print("\n[dim]Set environment variable:[/]")
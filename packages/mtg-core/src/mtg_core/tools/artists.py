@@ -33,34 +33,35 @@ async def get_artist_cards(
     """
     cache_key = artist_name.lower()
 
-    # Check cache first
+    # Check cache first (keyed on the data version, like printings)
     if use_cache:
+        cache_key = f"{await db.get_data_version()}|{cache_key}"
         cached = get_cached(_ARTIST_CACHE_NS, cache_key, ArtistCardsResult, _ARTIST_TTL_DAYS)
         if cached is not None:
             return cached
 
     # Fetch from database
-    cards = await db.get_cards_by_artist(artist_name)
+    rows = await db.get_artist_card_rows(artist_name)
 
     # Convert to CardSummary for caching (smaller than full Card objects)
     summaries = [
         CardSummary(
-            uuid=card.uuid,
-            name=card.name,
-            flavor_name=card.flavor_name,
-            mana_cost=card.mana_cost,
-            cmc=card.cmc,
-            type=card.type,
-            colors=card.colors or [],
-            color_identity=card.color_identity or [],
-            rarity=card.rarity,
-            set_code=card.set_code,
-            collector_number=card.number,
-            keywords=card.keywords or [],
-            power=card.power,
-            toughness=card.toughness,
+            uuid=row.uuid,
+            name=row.name,
+            flavor_name=row.flavor_name,
+            mana_cost=row.mana_cost,
+            cmc=row.cmc,
+            type=row.type,
+            colors=row.colors,
+            color_identity=row.color_identity,
+            rarity=row.rarity,
+            set_code=row.set_code,
+            collector_number=row.number,
+            keywords=row.keywords,
+            power=row.power,
+            toughness=row.toughness,
         )
-        for card in cards
+        for row in rows
     ]
 
     result = ArtistCardsResult(
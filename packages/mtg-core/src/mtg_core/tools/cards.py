@@ -21,7 +21,7 @@ from mtg_core.data.models import (
 from mtg_core.exceptions import ValidationError
 
 if TYPE_CHECKING:
-    from mtg_core.data.database import UnifiedDatabase
+    from mtg_core.data.database import CardSummaryRow, UnifiedDatabase
 
 
 async def search_cards(
@@ -37,8 +37,8 @@ async def search_cards(
     Returns:
         SearchResult with matching cards
     """
-    cards, total_count = await db.search_cards(filters)
-    results = [_card_to_summary(card) for card in cards]
+    rows, total_count = await db.search_card_rows(filters)
+    results = [_card_to_summary(row) for row in rows]
 
     return SearchResult(
         cards=results,
@@ -66,6 +66,32 @@ async def get_card(
     return _card_to_detail(card)
 
 
+async def get_cards_by_uuids(
+    db: UnifiedDatabase,
+    uuids: list[str],
+) -> dict[str, CardDetail]:
+    """Get detailed information about many printings at once.
+
+    Returns:
+        Dict mapping uuid -> CardDetail for the printings found
+    """
+    cards = await db.get_cards_by_uuids(uuids)
+    return {uuid: _card_to_detail(card) for uuid, card in cards.items()}
+
+
+async def get_cards_by_names(
+    db: UnifiedDatabase,
+    names: list[str],
+) -> dict[str, CardDetail]:
+    """Get detailed information about many cards at once, by name.
+
+    Returns:
+        Dict mapping lowercased name -> CardDetail for the cards found
+    """
+    cards = await db.get_cards_by_names(names, include_extras=True)
+    return {name: _card_to_detail(card) for name, card in cards.items()}
+
+
 async def get_card_rulings(
     db: UnifiedDatabase,
     name: str,
@@ -118,8 +144,8 @@ async def get_random_card(
     return _card_to_detail(card)
 
 
-def _card_to_summary(card: Card) -> CardSummary:
-    """Convert a Card to a summary response."""
+def _card_to_summary(card: Card | CardSummaryRow) -> CardSummary:
+    """Convert a Card (or a slim search row) to a summary response."""
     return CardSummary(
         uuid=card.uuid,
         name=card.name,
@@ -20,6 +20,7 @@ from ..data.models.responses import (
 )
 from ..exceptions import CardNotFoundError
 from ..utils.mana import COLOR_ORDER, COLORS, parse_mana_cost
+from ..utils.text_match import TextMatcher
 
 if TYPE_CHECKING:
     from ..data.database import UnifiedDatabase
@@ -87,6 +88,11 @@ RAMP_PATTERNS = frozenset(
 )
 
 
+_ROLE_MATCHER = TextMatcher(
+    {"interaction": INTERACTION_PATTERNS, "ramp": RAMP_PATTERNS}, literal=True
+)
+
+
 async def _get_card_price(db: UnifiedDatabase, card_name: str) -> float | None:
     """Get USD price for a card, or None if unavailable."""
     try:
@@ -438,13 +444,11 @@ async def analyze_deck_composition(
         if "Sorcery" in card_types:
             sorceries += quantity
 
-        # Detect interaction (heuristic)
-        card_text = (card.text or "").lower()
-        if any(pattern in card_text for pattern in INTERACTION_PATTERNS):
+        # Detect interaction and ramp (heuristic)
+        roles = _ROLE_MATCHER.find(card.text or "")
+        if "interaction" in roles:
             interaction += quantity
-
-        # Detect ramp (heuristic)
-        if any(pattern in card_text for pattern in RAMP_PATTERNS):
+        if "ramp" in roles:
             ramp_count += quantity
 
     # Build type breakdown with percentages
@@ -0,0 +1,744 @@
+"""Incremental deck analysis.
+
+``DeckAnalyzer`` keeps running aggregates for a deck (mana curve, color pips,
+type counts, keyword/theme/tribe counts, heuristic role counts, combo hits,
+synergy pairs, 17Lands tiers and price totals) and updates them from
+add/remove/quantity deltas. Each card is profiled once (type line, pips, regex
+themes, synergy terms); an edit only touches the aggregates of the card that
+changed, the combos on that card's posting list and the synergy pairs that
+card takes part in.
+
+Views subscribe to an analyzer and read its aggregates after each change::
+
+    analyzer = DeckAnalyzer(combo_detector=get_spellbook_detector())
+    analyzer.subscribe(lambda a: print(a.card_count, a.avg_cmc))
+    analyzer.sync(deck.mainboard)          # full load (or diff against current)
+    analyzer.add("Lightning Bolt", 1, card)  # O(affected)
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+from ..utils.text_match import TextMatcher, compile_pattern
+from .synergy.constants import ABILITY_SYNERGIES, KEYWORD_SYNERGIES
+
+if TYPE_CHECKING:
+    from ..data.models.card import Card
+    from .recommendations.spellbook_combos import SpellbookComboDetector, SpellbookComboMatch
+
+FlagRule = Callable[["Card"], bool]
+Listener = Callable[["DeckAnalyzer"], None]
+
+# Type line classes, in the priority used to pick a card's primary type
+TYPE_PRIORITY = (
+    "Creature",
+    "Instant",
+    "Sorcery",
+    "Artifact",
+    "Enchantment",
+    "Planeswalker",
+    "Land",
+)
+
+PIP_COLORS = ("W", "U", "B", "R", "G", "C")
+
+# Curve buckets run 0..CURVE_MAX, with CURVE_MAX holding everything above
+CURVE_MAX = 7
+
+# Deck themes detected from rules text
+THEME_PATTERNS: dict[str, str] = {
+    "Tokens": r"create.*token|token.*creature|populate",
+    "Graveyard": r"graveyard|return.*from.*graveyard|mill|flashback|unearth",
+    "Counters": r"\+1/\+1 counter|proliferate|counter.*creature",
+    "Sacrifice": r"sacrifice|when.*dies|whenever.*dies|aristocrat",
+    "Lifegain": r"gain.*life|lifelink|whenever you gain life",
+    "Artifacts": r"artifact.*enters|for each artifact|metalcraft|affinity",
+    "Enchantments": r"enchantment.*enters|constellation|whenever.*enchantment",
+    "Spellslinger": r"whenever you cast.*instant|whenever you cast.*sorcery|prowess|magecraft",
+    "Blink": r"exile.*return|flicker|enters the battlefield",
+    "Landfall": r"land.*enters|landfall|play.*additional land",
+    "Reanimator": r"return.*graveyard.*battlefield|reanimate|unearth",
+    "Voltron": r"equipment|aura|attach|equipped creature|enchanted creature",
+}
+_THEME_MATCHER = TextMatcher({theme: [pattern] for theme, pattern in THEME_PATTERNS.items()})
+
+# Rules text that makes a card want the terms in ABILITY_SYNERGIES
+_ABILITY_MATCHER = TextMatcher.from_patterns(ABILITY_SYNERGIES)
+
+# Subtypes that are not tribes
+_NON_TRIBES = frozenset({"Legendary", "Token", "Basic"})
+
+# 17Lands pairs below this lift are noise
+MIN_SYNERGY_LIFT = 0.02
+
+# Synergy pair sources, in display order
+_GAMEPLAY_PAIR = 0
+_PATTERN_PAIR = 1
+
+
+def text_rule(
+    *phrases: str,
+    patterns: Iterable[str] = (),
+    nonland_only: bool = False,
+) -> FlagRule:
+    """Build a flag rule matching lowercase rules text.
+
+    Args:
+        phrases: Substrings, any of which flags the card
+        patterns: Regular expressions, any of which flags the card
+        nonland_only: Never flag lands
+    """
+    compiled = [re.compile(p) for p in patterns]
+
+    def rule(card: Card) -> bool:
+        if nonland_only and "Land" in (card.type or ""):
+            return False
+        text = (card.text or "").lower()
+        if not text:
+            return False
+        return any(p in text for p in phrases) or any(r.search(text) for r in compiled)
+
+    return rule
+
+
+# Deck health roles counted by default
+DEFAULT_FLAG_RULES: dict[str, FlagRule] = {
+    "interaction": text_rule(
+        "destroy", "exile", "counter", "damage", "return", "-1/-1", "sacrifice"
+    ),
+    "draw": text_rule("draw", "scry", "look at"),
+    "ramp": text_rule("add {", "add one mana", "search your library for a", "mana of any"),
+}
+
+
+class DeckEntry(Protocol):
+    """A deck row: anything with a name, a quantity and optional card data."""
+
+    card_name: str
+    quantity: int
+    card: Card | None
+
+
+@dataclass(frozen=True, slots=True)
+class CardProfile:
+    """Everything the analyzer needs from one card, computed once."""
+
+    name: str
+    known: bool  # False when the deck row has no card data
+    is_land: bool = False
+    cmc: float = 0.0
+    types: frozenset[str] = frozenset()
+    primary_type: str | None = None
+    pips: tuple[tuple[str, int], ...] = ()
+    keywords: tuple[str, ...] = ()
+    tribes: tuple[str, ...] = ()
+    themes: tuple[str, ...] = ()
+    flags: tuple[str, ...] = ()
+    rarity: str | None = None
+    text: str = ""  # Lowercase rules text
+    synergy_terms: tuple[tuple[re.Pattern[str], str], ...] = ()
+
+    @property
+    def curve_bucket(self) -> int | None:
+        """Mana curve bucket, or None for lands and cards without data."""
+        if not self.known or self.is_land:
+            return None
+        return min(CURVE_MAX, int(self.cmc))
+
+
+def profile_card(
+    name: str,
+    card: Card | None,
+    flag_rules: Mapping[str, FlagRule] = DEFAULT_FLAG_RULES,
+) -> CardProfile:
+    """Extract the per-card features the analyzer aggregates."""
+    if card is None:
+        return CardProfile(name=name, known=False)
+
+    type_line = card.type or ""
+    types = frozenset(t for t in TYPE_PRIORITY if t in type_line)
+    primary_type = next((t for t in TYPE_PRIORITY if t in types), None)
+    if primary_type is None and type_line:
+        primary_type = "Other"
+
+    mana_cost = card.mana_cost or ""
+    pips = tuple(
+        (color, count) for color in PIP_COLORS if (count := mana_cost.count(f"{{{color}}}")) > 0
+    )
+
+    tribes: tuple[str, ...] = ()
+    if "Creature" in type_line and "—" in type_line:
+        tribes = tuple(
+            subtype
+            for subtype in type_line.split("—")[1].strip().split()
+            if subtype not in _NON_TRIBES
+        )
+
+    text = (card.text or "").lower()
+    keywords = tuple(card.keywords or ())
+    themes = tuple(_THEME_MATCHER.find(text))
+
+    synergy_terms: list[tuple[re.Pattern[str], str]] = []
+    if text:
+        for pattern in _ABILITY_MATCHER.find(text):
+            synergy_terms.extend(
+                (compile_pattern(term), reason) for term, reason in ABILITY_SYNERGIES[pattern]
+            )
+        for keyword in keywords:
+            for term, reason in KEYWORD_SYNERGIES.get(keyword, ()):
+                synergy_terms.append((compile_pattern(term), f"{keyword}: {reason}"))
+
+    return CardProfile(
+        name=name,
+        known=True,
+        is_land="Land" in type_line,
+        cmc=card.cmc or 0.0,
+        types=types,
+        primary_type=primary_type,
+        pips=pips,
+        keywords=keywords,
+        tribes=tribes,
+        themes=themes,
+        flags=tuple(flag for flag, rule in flag_rules.items() if rule(card)),
+        rarity=card.rarity,
+        text=text,
+        synergy_terms=tuple(synergy_terms),
+    )
+
+
+def _bump(counter: Counter[Any], key: Any, delta: int) -> None:
+    """Add to a counter, dropping keys that reach zero."""
+    value = counter[key] + delta
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+class DeckAnalyzer:
+    """Deck statistics maintained incrementally from card deltas.
+
+    Not thread-safe: callers that edit from worker threads must serialize
+    access themselves.
+    """
+
+    def __init__(
+        self,
+        *,
+        flag_rules: Mapping[str, FlagRule] | None = None,
+        combo_detector: SpellbookComboDetector | None = None,
+        limited_stats: Any | None = None,
+        combo_max_missing: int = 2,
+        combo_min_present: int = 1,
+    ) -> None:
+        """Create an empty analyzer.
+
+        Args:
+            flag_rules: Named card classifiers to count (defaults to
+                interaction/draw/ramp)
+            combo_detector: Commander Spellbook detector for combo tracking
+            limited_stats: 17Lands stats source with ``get_card_stats`` and
+                ``get_synergy_pairs``; may be swapped between edits
+            combo_max_missing: Track combos missing at most this many pieces
+            combo_min_present: Track combos with at least this many pieces
+        """
+        self.flag_rules = dict(DEFAULT_FLAG_RULES if flag_rules is None else flag_rules)
+        self.combo_detector = combo_detector
+        self.limited_stats = limited_stats
+        self.combo_max_missing = combo_max_missing
+        self.combo_min_present = combo_min_present
+
+        self._listeners: list[Listener] = []
+        self._batch_depth = 0
+        self._dirty = False
+
+        # Caches that survive clear(): per-card work is done once per name
+        self._profiles: dict[str, CardProfile] = {}
+        self._postings: dict[str, frozenset[str]] = {}
+        self._combo_sizes: dict[str, int] = {}
+        self._combo_scores: dict[str, float] = {}
+        self._tiers: dict[str, tuple[str | None, float | None]] = {}
+        self._gameplay_pairs: dict[str, tuple[tuple[str, str, str], ...]] = {}
+
+        self._owned: Collection[str] = frozenset()
+        self._prices: Mapping[str, float] = {}
+        self._commander: str | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Zero every aggregate."""
+        self._quantities: dict[str, int] = {}
+        self.card_count = 0
+        self.land_count = 0
+        self.spell_count = 0
+        self._spell_cmc = 0.0
+        self._curve: Counter[int] = Counter()
+        self._pips: Counter[str] = Counter()
+        self._types: Counter[str] = Counter()
+        self._primary_types: Counter[str] = Counter()
+        self._keywords: Counter[str] = Counter()
+        self._tribes: Counter[str] = Counter()
+        self._themes: Counter[str] = Counter()
+        self._flags: Counter[str] = Counter()
+        self._tier_counts: Counter[str] = Counter()
+        self.owned_count = 0
+        self.needed_count = 0
+        self.total_price = 0.0
+
+        # Combos: lowercase name -> presence refs (deck + commander),
+        # combo id -> pieces present, and the combos within reach
+        self._combo_refs: Counter[str] = Counter()
+        self._combo_hits: dict[str, int] = {}
+        self._near_combos: set[str] = set()
+
+        # Synergy pairs keyed by sorted name pair -> (source, seq, card1, card2, reason)
+        self._pairs: dict[tuple[str, str], tuple[int, int, str, str, str]] = {}
+        self._pairs_by_card: dict[str, set[tuple[str, str]]] = {}
+        self._pair_seq = 0
+        self._text_cards: dict[str, CardProfile] = {}
+        self._gameplay_incoming: dict[str, list[tuple[str, str, str]]] = {}
+
+        if self._commander:
+            self._combo_ref(self._commander, 1)
+
+    # -- Subscriptions --------------------------------------------------------
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Call ``listener(analyzer)`` after every change; returns an unsubscribe function."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    @contextmanager
+    def batch(self) -> Iterator[DeckAnalyzer]:
+        """Group edits so listeners are notified once at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._notify()
+
+    def _changed(self) -> None:
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._notify()
+
+    def _notify(self) -> None:
+        self._dirty = False
+        for listener in list(self._listeners):
+            listener(self)
+
+    # -- Edits ------------------------------------------------------------------
+
+    def add(self, card_name: str, quantity: int = 1, card: Card | None = None) -> None:
+        """Add copies of a card."""
+        self.set_quantity(card_name, self._quantities.get(card_name, 0) + quantity, card)
+
+    def remove(self, card_name: str, quantity: int | None = None) -> None:
+        """Remove copies of a card (all copies when ``quantity`` is None)."""
+        current = self._quantities.get(card_name, 0)
+        self.set_quantity(card_name, 0 if quantity is None else current - quantity)
+
+    def set_quantity(self, card_name: str, quantity: int, card: Card | None = None) -> None:
+        """Set a card's quantity, applying only the difference."""
+        if self._set(card_name, quantity, card):
+            self._changed()
+
+    def sync(self, entries: Iterable[DeckEntry]) -> None:
+        """Bring the analyzer in line with a deck listing.
+
+        Rows are diffed against the current quantities, so syncing an edited
+        copy of the same deck only re-analyzes the cards that changed.
+        """
+        target: dict[str, tuple[int, Card | None]] = {}
+        for entry in entries:
+            quantity, card = target.get(entry.card_name, (0, None))
+            target[entry.card_name] = (quantity + entry.quantity, card or entry.card)
+
+        with self.batch():
+            changed = False
+            for name in [n for n in self._quantities if n not in target]:
+                changed |= self._set(name, 0, None)
+            for name, (quantity, card) in target.items():
+                changed |= self._set(name, quantity, card)
+            if changed:
+                self._changed()
+
+    def clear(self) -> None:
+        """Remove every card (per-card caches are kept)."""
+        had_cards = bool(self._quantities)
+        self._reset()
+        if had_cards:
+            self._changed()
+
+    def set_commander(self, card_name: str | None) -> None:
+        """Set the commander, which counts as present for combo detection."""
+        if card_name == self._commander:
+            return
+        if self._commander:
+            self._combo_ref(self._commander, -1)
+        self._commander = card_name
+        if card_name:
+            self._combo_ref(card_name, 1)
+        self._changed()
+
+    def set_owned(self, card_names: Collection[str] | None) -> None:
+        """Set the names the user owns and recount owned/needed."""
+        owned = card_names if card_names is not None else frozenset()
+        if owned is self._owned or owned == self._owned:
+            return
+        self._owned = owned
+        self.owned_count = self.needed_count = 0
+        for name, quantity in self._quantities.items():
+            if self._profiles[name].known:
+                if name in owned:
+                    self.owned_count += quantity
+                else:
+                    self.needed_count += quantity
+        self._changed()
+
+    def set_prices(self, prices: Mapping[str, float] | None) -> None:
+        """Set per-card prices (USD) and recompute the deck total."""
+        prices = prices if prices is not None else {}
+        if prices is self._prices or prices == self._prices:
+            return
+        self._prices = prices
+        self.total_price = sum(
+            price * quantity
+            for name, quantity in self._quantities.items()
+            if self._profiles[name].known and (price := prices.get(name, 0)) > 0
+        )
+        self._changed()
+
+    def _set(self, name: str, quantity: int, card: Card | None) -> bool:
+        """Apply one quantity change; returns whether anything changed."""
+        old = self._quantities.get(name, 0)
+        new = max(0, quantity)
+        if new == old:
+            return False
+
+        profile = self._profiles.get(name)
+        if profile is None or (old == 0 and not profile.known and card is not None):
+            profile = profile_card(name, card, self.flag_rules)
+            self._profiles[name] = profile
+
+        delta = new - old
+        self.card_count += delta
+        if new:
+            self._quantities[name] = new
+        else:
+            del self._quantities[name]
+
+        if profile.known:
+            self._apply_profile(profile, delta)
+        tier = self._tier_for(name)[0]
+        if tier:
+            _bump(self._tier_counts, tier, delta)
+
+        if old == 0:
+            self._enter(profile)
+        elif new == 0:
+            self._leave(profile)
+        return True
+
+    def _apply_profile(self, p: CardProfile, delta: int) -> None:
+        """Add ``delta`` copies of a profiled card to the running counts."""
+        if p.is_land:
+            self.land_count += delta
+        else:
+            self.spell_count += delta
+            self._spell_cmc += p.cmc * delta
+            _bump(self._curve, p.curve_bucket, delta)
+        for t in p.types:
+            _bump(self._types, t, delta)
+        if p.primary_type:
+            _bump(self._primary_types, p.primary_type, delta)
+        for color, count in p.pips:
+            _bump(self._pips, color, count * delta)
+        for keyword in p.keywords:
+            _bump(self._keywords, keyword, delta)
+        for tribe in p.tribes:
+            _bump(self._tribes, tribe, delta)
+        for theme in p.themes:
+            _bump(self._themes, theme, delta)
+        for flag in p.flags:
+            _bump(self._flags, flag, delta)
+
+        if p.name in self._owned:
+            self.owned_count += delta
+        else:
+            self.needed_count += delta
+        price = self._prices.get(p.name, 0)
+        if price > 0:
+            self.total_price += price * delta
+
+    def _enter(self, p: CardProfile) -> None:
+        """A card joined the deck: update combos and pair it with the others."""
+        self._combo_ref(p.name, 1)
+
+        for card1, card2, reason in self._gameplay_incoming.get(p.name, ()):
+            self._add_pair(card1, card2, reason, _GAMEPLAY_PAIR)
+        for pair in self._gameplay_pairs_for(p.name):
+            card2 = pair[1]
+            self._gameplay_incoming.setdefault(card2, []).append(pair)
+            if card2 in self._quantities:
+                self._add_pair(*pair, _GAMEPLAY_PAIR)
+
+        if not p.text:
+            return
+        for other in self._text_cards.values():
+            for term, reason in p.synergy_terms:
+                if term.search(other.text):
+                    self._add_pair(p.name, other.name, reason, _PATTERN_PAIR)
+                    break
+            for term, reason in other.synergy_terms:
+                if term.search(p.text):
+                    self._add_pair(other.name, p.name, reason, _PATTERN_PAIR)
+                    break
+        self._text_cards[p.name] = p
+
+    def _leave(self, p: CardProfile) -> None:
+        """A card left the deck: drop its combo hits and synergy pairs."""
+        self._combo_ref(p.name, -1)
+        self._text_cards.pop(p.name, None)
+        for key in self._pairs_by_card.pop(p.name, set()):
+            self._pairs.pop(key, None)
+            other = key[0] if key[1] == p.name else key[1]
+            self._pairs_by_card.get(other, set()).discard(key)
+        for pair in self._gameplay_pairs_for(p.name):
+            incoming = self._gameplay_incoming.get(pair[1])
+            if incoming and pair in incoming:
+                incoming.remove(pair)
+
+    # -- Combos -----------------------------------------------------------------
+
+    def _combo_ref(self, name: str, delta: int) -> None:
+        """Track presence of a name and update hit counts on its posting list."""
+        detector = self.combo_detector
+        if detector is None:
+            return
+        key = name.lower()
+        old = self._combo_refs[key]
+        _bump(self._combo_refs, key, delta)
+        if (old > 0) == (self._combo_refs[key] > 0):
+            return
+
+        step = 1 if old == 0 else -1
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = self._postings[key] = detector.combo_ids_for_card(key)
+        for combo_id in postings:
+            hits = self._combo_hits.get(combo_id, 0) + step
+            if hits:
+                self._combo_hits[combo_id] = hits
+            else:
+                del self._combo_hits[combo_id]
+
+            size = self._combo_sizes.get(combo_id)
+            if size is None:
+                combo = detector.get_combo(combo_id)
+                size = len({c.lower() for c in combo.card_names}) if combo else 0
+                self._combo_sizes[combo_id] = size
+            if hits >= self.combo_min_present and size - hits <= self.combo_max_missing:
+                self._near_combos.add(combo_id)
+            else:
+                self._near_combos.discard(combo_id)
+
+    def combo_score(self, combo_id: str) -> float:
+        """Detector score for a combo (cached)."""
+        score = self._combo_scores.get(combo_id)
+        if score is None:
+            combo = self.combo_detector.get_combo(combo_id) if self.combo_detector else None
+            score = (
+                self.combo_detector.get_combo_score(combo) if combo and self.combo_detector else 0.0
+            )
+            self._combo_scores[combo_id] = score
+        return score
+
+    def combos(self, limit: int = 10) -> list[SpellbookComboMatch]:
+        """Complete and near-complete combos, fewest missing pieces first, then by score."""
+        detector = self.combo_detector
+        if detector is None or not self._near_combos:
+            return []
+
+        from .recommendations.spellbook_combos import SpellbookComboMatch
+
+        matches: list[tuple[int, float, SpellbookComboMatch]] = []
+        for combo_id in self._near_combos:
+            combo = detector.get_combo(combo_id)
+            if combo is None:
+                continue
+            present = [c for c in combo.card_names if c.lower() in self._combo_refs]
+            missing = [c for c in combo.card_names if c.lower() not in self._combo_refs]
+            match = SpellbookComboMatch(
+                combo=combo,
+                present_cards=present,
+                missing_cards=missing,
+                completion_ratio=len(present) / len(combo.card_names),
+            )
+            matches.append((match.missing_count, -self.combo_score(combo_id), match))
+        return [m for *_, m in heapq.nsmallest(limit, matches, key=lambda t: (t[0], t[1]))]
+
+    # -- Synergy pairs ----------------------------------------------------------
+
+    def _add_pair(self, card1: str, card2: str, reason: str, source: int) -> None:
+        if card1 == card2:
+            return
+        key = (min(card1, card2), max(card1, card2))
+        if key in self._pairs:
+            return
+        self._pairs[key] = (source, self._pair_seq, card1, card2, reason)
+        self._pair_seq += 1
+        self._pairs_by_card.setdefault(card1, set()).add(key)
+        self._pairs_by_card.setdefault(card2, set()).add(key)
+
+    def _gameplay_pairs_for(self, name: str) -> tuple[tuple[str, str, str], ...]:
+        """17Lands pairs for a card with enough lift (looked up once)."""
+        cached = self._gameplay_pairs.get(name)
+        if cached is not None:
+            return cached
+        if self.limited_stats is None:
+            return ()
+        try:
+            found = self.limited_stats.get_synergy_pairs(name)
+        except Exception:
+            found = []
+        pairs = tuple(
+            (p.card_a, p.card_b, f"Gameplay: +{int(p.synergy_lift * 100)}% WR together")
+            for p in found
+            if p.synergy_lift and p.synergy_lift > MIN_SYNERGY_LIFT
+        )
+        self._gameplay_pairs[name] = pairs
+        return pairs
+
+    def synergy_pairs(self, limit: int = 12) -> list[tuple[str, str, str]]:
+        """Synergy pairs as (card1, card2, reason), 17Lands pairs first."""
+        ordered = heapq.nsmallest(limit, self._pairs.values())
+        return [(card1, card2, reason) for _, _, card1, card2, reason in ordered]
+
+    # -- 17Lands --------------------------------------------------------------
+
+    def _tier_for(self, name: str) -> tuple[str | None, float | None]:
+        """17Lands tier and GIH win rate for a card (looked up once)."""
+        cached = self._tiers.get(name)
+        if cached is not None:
+            return cached
+        if self.limited_stats is None:
+            return None, None
+        try:
+            stats = self.limited_stats.get_card_stats(name)
+        except Exception:
+            stats = None
+        tier = (
+            (stats.tier.upper() if stats and stats.tier else None),
+            (stats.gih_wr if stats else None),
+        )
+        self._tiers[name] = tier
+        return tier
+
+    @property
+    def tier_counts(self) -> dict[str, int]:
+        """Copies per 17Lands tier."""
+        return dict(self._tier_counts)
+
+    def top_tier_cards(self, limit: int = 5) -> list[tuple[str, str, float | None]]:
+        """S/A-tier cards as (name, tier, gih_wr), in deck order."""
+        top: list[tuple[str, str, float | None]] = []
+        for name in self._quantities:
+            tier, gih_wr = self._tiers.get(name, (None, None))
+            if tier in ("S", "A"):
+                top.append((name, tier, gih_wr))
+                if len(top) >= limit:
+                    break
+        return top
+
+    # -- Read access ------------------------------------------------------------
+
+    @property
+    def quantities(self) -> Mapping[str, int]:
+        """Card name -> quantity for every card in the deck."""
+        return self._quantities
+
+    def profile(self, card_name: str) -> CardProfile | None:
+        """The cached profile of a card, if it has been seen."""
+        return self._profiles.get(card_name)
+
+    @property
+    def avg_cmc(self) -> float:
+        """Average mana value of non-land cards."""
+        return self._spell_cmc / self.spell_count if self.spell_count > 0 else 0.0
+
+    @property
+    def curve(self) -> dict[int, int]:
+        """Non-land copies per mana value bucket."""
+        return dict(self._curve)
+
+    @property
+    def pips(self) -> dict[str, int]:
+        """Colored mana symbols in mana costs, weighted by quantity."""
+        return dict(self._pips)
+
+    def type_count(self, type_name: str) -> int:
+        """Copies whose type line contains ``type_name`` (a TYPE_PRIORITY entry)."""
+        return self._types.get(type_name, 0)
+
+    @property
+    def primary_types(self) -> dict[str, int]:
+        """Copies per primary type (first match in TYPE_PRIORITY, else "Other")."""
+        return dict(self._primary_types)
+
+    def flag_count(self, flag: str) -> int:
+        """Copies matching a flag rule."""
+        return self._flags.get(flag, 0)
+
+    @property
+    def keywords(self) -> dict[str, int]:
+        """Copies per keyword ability."""
+        return dict(self._keywords)
+
+    def top_keywords(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Most common keywords."""
+        return self._keywords.most_common(limit)
+
+    def dominant_themes(self, limit: int = 4, min_count: int = 4) -> list[tuple[str, int]]:
+        """Most common themes with at least ``min_count`` copies."""
+        return [(t, n) for t, n in self._themes.most_common(limit) if n >= min_count]
+
+    def dominant_tribe(self, min_count: int = 8) -> str | None:
+        """Most common creature type, if it has at least ``min_count`` copies."""
+        if not self._tribes:
+            return None
+        tribe, count = self._tribes.most_common(1)[0]
+        return tribe if count >= min_count else None
+
+    def card_rarities(self) -> dict[str, str]:
+        """Rarity of each card in the deck that has one."""
+        rarities: dict[str, str] = {}
+        for name in self._quantities:
+            rarity = self._profiles[name].rarity
+            if rarity:
+                rarities[name] = rarity
+        return rarities
+
+    def expensive_cards(self, limit: int = 5) -> list[tuple[str, float]]:
+        """Highest-priced cards in the deck as (name, unit price)."""
+        priced = (
+            (name, price)
+            for name in self._quantities
+            if self._profiles[name].known and (price := self._prices.get(name, 0)) > 0
+        )
+        return heapq.nlargest(limit, priced, key=lambda item: item[1])
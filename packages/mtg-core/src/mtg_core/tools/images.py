@@ -22,7 +22,7 @@ from ..data.models import (
 from ..exceptions import CardNotFoundError, ValidationError
 
 if TYPE_CHECKING:
-    from ..data.database import UnifiedDatabase
+    from ..data.database import PrintingRow, UnifiedDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +68,13 @@ async def get_card_printings(
     # Check cache first
     cache_key = name
     if use_cache:
+        # Keyed on the data version so a rebuilt database never serves stale entries
+        cache_key = f"{await db.get_data_version()}|{name}"
         cached = get_cached(_PRINTINGS_CACHE_NS, cache_key, PrintingsResponse, _PRINTINGS_TTL_DAYS)
         if cached is not None:
             return cached
 
-    printings = await db.get_all_printings(name)
+    printings = await db.get_printing_rows(name)
 
     if not printings:
         raise CardNotFoundError(name)
@@ -187,8 +189,8 @@ def _card_to_image_response(card: Card) -> CardImageResponse:
     )
 
 
-def _card_to_printing_info(card: Card) -> PrintingInfo:
-    """Convert a Card to PrintingInfo."""
+def _card_to_printing_info(card: Card | PrintingRow) -> PrintingInfo:
+    """Convert a Card (or a slim printing row) to PrintingInfo."""
     return PrintingInfo(
         uuid=card.uuid,
         set_code=card.set_code,
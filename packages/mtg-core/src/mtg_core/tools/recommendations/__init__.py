@@ -9,6 +9,7 @@ from .hybrid import (
     SynergyScorer,
     get_hybrid_recommender,
     initialize_hybrid_recommender,
+    set_hybrid_recommender,
 )
 from .limited_stats import (
     LimitedCardStats,
@@ -45,4 +46,5 @@ __all__ = [
     "get_recommender",
     "initialize_hybrid_recommender",
     "initialize_recommender",
+    "set_hybrid_recommender",
 ]
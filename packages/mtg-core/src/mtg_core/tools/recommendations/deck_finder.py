@@ -2,16 +2,27 @@
 
 Analyzes a user's collection to suggest deck archetypes they can build
 for Commander and Standard formats.
+
+The collection is encoded once into arrays (EncodedCollection): color identity
+bitmasks, type codes, a theme keyword matrix and the commander-independent part
+of each card's score. Each candidate deck is then a color-mask filter, one
+matrix-vector product for its theme score and a top-k pick per card type,
+instead of rescoring and sorting every card for every commander.
 """
 
 from __future__ import annotations
 
 import logging
+import re
 from collections import Counter
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from mtg_core.data.database import UnifiedDatabase
 
 logger = logging.getLogger(__name__)
@@ -187,84 +198,242 @@ TRIBAL_TYPES: list[str] = [
     "Treefolk",
 ]
 
+# Card types in DECK_TARGETS, indexed by EncodedCollection.type_codes
+CARD_TYPES: tuple[str, ...] = (
+    "land",
+    "creature",
+    "spell",
+    "artifact",
+    "enchantment",
+    "planeswalker",
+    "other",
+)
+_LAND = CARD_TYPES.index("land")
+
+# Every theme keyword, in THEME_KEYWORDS order; a keyword listed under two
+# themes ("equipment", "aura") scores for each
+_THEME_KEYWORD_LIST: list[str] = [
+    kw.lower() for keywords in THEME_KEYWORDS.values() for kw in keywords
+]
 
-class DeckFinder:
-    """Recommend deck archetypes based on collection."""
+_REMOVAL_PATTERN = re.compile("destroy|exile|counter target|deal.*damage")
+_RAMP_SYMBOLS = ("{w}", "{u}", "{b}", "{r}", "{g}", "mana")
+_BASIC_LAND_BY_COLOR = {
+    "W": "Plains",
+    "U": "Island",
+    "B": "Swamp",
+    "R": "Mountain",
+    "G": "Forest",
+}
 
-    def __init__(self, db: UnifiedDatabase | None = None) -> None:
-        self._db = db
-        self._initialized = False
+# Scores are kept in tenths of a point so ties compare exactly
+_ARCHETYPE_BONUS = 20
+_THEME_BONUS = 15
+
+
+def _base_score(card: CardData, card_type: str) -> int:
+    """Score a card's general value, in tenths, before deck-specific bonuses.
+
+    Lands score 0; they are picked by the land pass, not by score.
+    """
+    if card_type == "land":
+        return 0
+
+    score = 10
+    text = (card.text or "").lower()
+    # Removal/interaction
+    if _REMOVAL_PATTERN.search(text):
+        score += 10
+    # Card advantage
+    if "draw" in text and "card" in text:
+        score += 10
+    # Ramp (non-land cards that produce mana)
+    if "add" in text and any(symbol in text for symbol in _RAMP_SYMBOLS):
+        score += 8
+    # Legendary cards are potential sub-commanders
+    if card.type_line and "legendary" in card.type_line.lower():
+        score += 5
+    if card_type == "planeswalker":
+        score += 10
+    # Creatures get a boost to ensure we have enough for combat
+    if card_type == "creature":
+        score += 3
+    return score
 
-    async def initialize(self, db: UnifiedDatabase) -> None:
-        """Initialize with card data from database."""
-        self._db = db
-        self._initialized = True
 
-    def _score_card_for_deck(
-        self,
-        card: CardData,
-        archetype: str | None,
-        _commander_text: str | None,
-        theme_keywords: list[str],
-    ) -> float:
-        """Score a card's fit for a specific deck.
-
-        Higher scores = better fit.
-        Lands are scored separately (they go through Pass 1, not scoring).
-        """
-        # Lands don't need scoring - they're handled in Pass 1
-        if card.is_land():
-            return 0.0
+@dataclass
+class EncodedCollection:
+    """A collection encoded into per-card arrays for vectorized deck building.
+
+    Row ``i`` of every array describes ``cards[i]``.
+    """
+
+    cards: list[CardData]
+    texts: list[str]  # Lowercased rules text
+    name_ids: NDArray[np.int32]  # Equal for cards with the same name
+    color_masks: NDArray[np.int64]  # Color identity bitmask, see color_mask()
+    type_codes: NDArray[np.int8]  # Index into CARD_TYPES
+    type_members: list[NDArray[np.intp]]  # Card indices of each type code, ascending
+    theme_ids: NDArray[np.intp]  # Row of theme_sets with the card's theme keywords
+    theme_sets: NDArray[np.int32]  # (distinct keyword sets x theme keywords) 0/1
+    base_scores: NDArray[np.int32]  # _base_score() in tenths
+    color_bits: dict[str, int] = field(default_factory=dict)
+    _archetype_hits: dict[str, NDArray[np.bool_]] = field(default_factory=dict)
+
+    @classmethod
+    def from_cards(cls, cards: list[CardData]) -> EncodedCollection:
+        """Encode a collection. This is the only pass over every card's text."""
+        import numpy as np
+
+        color_bits: dict[str, int] = {}
+        name_ids: dict[str, int] = {}
+        texts: list[str] = []
+        masks: list[int] = []
+        codes: list[int] = []
+        base_scores: list[int] = []
+        # Theme keyword bitsets; most cards share one of a few hundred
+        theme_bits: dict[int, int] = {}
+        theme_ids: list[int] = []
+        for card in cards:
+            text = (card.text or "").lower()
+            card_type = card.get_card_type()
+            texts.append(text)
+            masks.append(_color_mask(card.get_color_identity(), color_bits))
+            codes.append(CARD_TYPES.index(card_type))
+            base_scores.append(_base_score(card, card_type))
+            name_ids.setdefault(card.name, len(name_ids))
+            bits = sum(1 << k for k, kw in enumerate(_THEME_KEYWORD_LIST) if kw in text)
+            theme_ids.append(theme_bits.setdefault(bits, len(theme_bits)))
+
+        theme_sets = np.array(
+            [[bits >> k & 1 for k in range(len(_THEME_KEYWORD_LIST))] for bits in theme_bits],
+            dtype=np.int32,
+        ).reshape(len(theme_bits), len(_THEME_KEYWORD_LIST))
+        type_codes = np.array(codes, dtype=np.int8)
+        return cls(
+            cards=cards,
+            texts=texts,
+            name_ids=np.array([name_ids[card.name] for card in cards], dtype=np.int32),
+            color_masks=np.array(masks, dtype=np.int64),
+            type_codes=type_codes,
+            type_members=[np.flatnonzero(type_codes == code) for code in range(len(CARD_TYPES))],
+            theme_ids=np.array(theme_ids, dtype=np.intp),
+            theme_sets=theme_sets,
+            base_scores=np.array(base_scores, dtype=np.int32),
+            color_bits=color_bits,
+        )
 
-        score = 1.0  # Base score
+    def __len__(self) -> int:
+        return len(self.cards)
 
-        card_text = (card.text or "").lower()
-        card_type = card.get_card_type()
+    def color_mask(self, colors: Iterable[str]) -> int:
+        """Bitmask of colors, in the same bit layout as color_masks."""
+        return _color_mask(colors, self.color_bits)
 
-        # Synergy with archetype keywords
-        if archetype:
-            archetype_lower = archetype.lower()
-            # Check if card supports the archetype
-            if archetype_lower in card_text:
-                score += 2.0
-
-        # Synergy with theme keywords from commander
-        for keyword in theme_keywords:
-            if keyword.lower() in card_text:
-                score += 1.5
-
-        # Bonus for removal/interaction
-        removal_keywords = ["destroy", "exile", "counter target", "deal.*damage"]
-        import re
+    def mask_colors(self, mask: int) -> set[str]:
+        """The colors set in a bitmask."""
+        return {color for color, bit in self.color_bits.items() if mask & bit}
+
+    def fits_identity(self, colors: Iterable[str]) -> NDArray[np.bool_]:
+        """Cards that are colorless or within a color identity.
+
+        An empty identity accepts every card.
+        """
+        import numpy as np
+
+        mask = self.color_mask(colors)
+        if not mask:
+            return np.ones(len(self), dtype=bool)
+        fits: NDArray[np.bool_] = (self.color_masks & ~mask) == 0
+        return fits
 
-        for keyword in removal_keywords:
-            if re.search(keyword, card_text):
-                score += 1.0
-                break
+    def scores(self, archetype: str | None, commander: CardData | None) -> NDArray[np.int32]:
+        """Score every card's fit for a deck, in tenths (higher is better).
 
-        # Bonus for card advantage
-        if "draw" in card_text and "card" in card_text:
-            score += 1.0
+        Adds to each card's base score +2 if its text names the archetype and
+        +1.5 for each theme keyword it shares with the commander's text.
+        Land scores are meaningless; lands are picked by the land pass.
+        """
+        import numpy as np
 
-        # Bonus for ramp (non-land cards that produce mana)
-        if "add" in card_text and any(
-            c in card_text for c in ["{w}", "{u}", "{b}", "{r}", "{g}", "mana"]
-        ):
-            score += 0.8
+        scores = self.base_scores.copy()
+        if archetype:
+            scores += _ARCHETYPE_BONUS * self._archetype_mask(archetype)
+        if commander and commander.text:
+            commander_text = commander.text.lower()
+            weights = np.array(
+                [_THEME_BONUS * (kw in commander_text) for kw in _THEME_KEYWORD_LIST],
+                dtype=np.int32,
+            )
+            scores += (self.theme_sets @ weights)[self.theme_ids]
+        return scores
+
+    def _archetype_mask(self, archetype: str) -> NDArray[np.bool_]:
+        """Cards whose text names an archetype, cached per archetype."""
+        import numpy as np
+
+        hits = self._archetype_hits.get(archetype)
+        if hits is None:
+            needle = archetype.lower()
+            hits = np.fromiter((needle in text for text in self.texts), bool, len(self.texts))
+            self._archetype_hits[archetype] = hits
+        return hits
+
+
+def _color_mask(colors: Iterable[str], color_bits: dict[str, int]) -> int:
+    mask = 0
+    for color in colors:
+        bit = color_bits.get(color)
+        if bit is None:
+            bit = color_bits[color] = 1 << len(color_bits)
+        mask |= bit
+    return mask
+
+
+def _basic_lands(deck_colors: set[str], count: int) -> list[str]:
+    """Basic lands to make up ``count`` lands, spread evenly across colors."""
+    colors_list = [color for color in _BASIC_LAND_BY_COLOR if color in deck_colors]
+    if not colors_list:
+        colors_list = ["R"]  # Default to Mountain for colorless
+
+    lands_per_color = max(1, count // len(colors_list))
+    lands: list[str] = []
+    for color in colors_list:
+        lands.extend([_BASIC_LAND_BY_COLOR[color]] * min(lands_per_color, count - len(lands)))
+    # Fill remaining with first color's basic
+    lands.extend([_BASIC_LAND_BY_COLOR[colors_list[0]]] * (count - len(lands)))
+    return lands
+
+
+def rank_suggestions(suggestions: Iterable[DeckSuggestion], limit: int) -> list[DeckSuggestion]:
+    """Order suggestions by completion, keeping one per commander.
+
+    Used on the finished list, and on partial lists while suggestions are
+    still streaming from DeckFinder.iter_commander_decks().
+    """
+    ordered = sorted(suggestions, key=lambda s: (-s.completion_pct, s.name))
+    seen_commanders: set[str] = set()
+    unique_suggestions: list[DeckSuggestion] = []
+    for s in ordered:
+        if s.commander and s.commander not in seen_commanders:
+            seen_commanders.add(s.commander)
+            unique_suggestions.append(s)
+        elif not s.commander:
+            unique_suggestions.append(s)
+    return unique_suggestions[:limit]
 
-        # Legendary creatures get a small boost (potential sub-commanders)
-        if card.type_line and "legendary" in card.type_line.lower():
-            score += 0.5
 
-        # Planeswalkers are generally valuable
-        if card_type == "planeswalker":
-            score += 1.0
+class DeckFinder:
+    """Recommend deck archetypes based on collection."""
 
-        # Creatures get a boost to ensure we have enough for combat
-        if card_type == "creature":
-            score += 0.3
+    def __init__(self, db: UnifiedDatabase | None = None) -> None:
+        self._db = db
+        self._initialized = False
 
-        return score
+    async def initialize(self, db: UnifiedDatabase) -> None:
+        """Initialize with card data from database."""
+        self._db = db
+        self._initialized = True
 
     def _select_best_cards(
         self,
@@ -274,124 +443,130 @@ class DeckFinder:
         commander: CardData | None = None,
     ) -> tuple[list[str], list[str]]:
         """Select the best cards for a deck, respecting type balance and deck size."""
-        targets = DECK_TARGETS.get(deck_format, DECK_TARGETS["commander"])
-        total = targets["total"]
-        max_cards = total if isinstance(total, int) else 99
+        encoded = EncodedCollection.from_cards(cards)
+        eligible = encoded.fits_identity(commander.get_color_identity() if commander else [])
+        return self._select_encoded(encoded, eligible, deck_format, archetype, commander)
 
-        # Extract theme keywords from commander
-        theme_keywords: list[str] = []
-        commander_text = None
-        if commander and commander.text:
-            commander_text = commander.text.lower()
-            # Extract relevant keywords
-            for _theme, keywords in THEME_KEYWORDS.items():
-                for kw in keywords:
-                    if kw.lower() in commander_text:
-                        theme_keywords.append(kw)
-
-        # Score all cards
-        scored_cards: list[tuple[float, CardData]] = []
-        for card in cards:
-            score = self._score_card_for_deck(card, archetype, commander_text, theme_keywords)
-            scored_cards.append((score, card))
-
-        # Sort by score descending
-        scored_cards.sort(key=lambda x: -x[0])
+    def _select_encoded(
+        self,
+        encoded: EncodedCollection,
+        eligible: NDArray[np.bool_],
+        deck_format: str,
+        archetype: str | None = None,
+        commander: CardData | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Select the best eligible cards of an encoded collection for a deck.
 
-        # Get commander's color identity for filtering
-        commander_identity = set(commander.get_color_identity()) if commander else set()
+        Returns (owned cards, basic lands to add).
+        """
+        import numpy as np
 
-        # Filter cards by color identity first
-        valid_cards: list[tuple[float, CardData]] = []
-        for score, card in scored_cards:
-            if commander_identity:
-                card_identity = set(card.get_color_identity())
-                if card_identity and not card_identity.issubset(commander_identity):
-                    continue
-            valid_cards.append((score, card))
+        targets = DECK_TARGETS.get(deck_format, DECK_TARGETS["commander"])
+        total = targets["total"]
+        max_cards = total if isinstance(total, int) else 99
 
-        # Two-pass selection: first ensure minimums, then fill with best cards
-        type_counts: Counter[str] = Counter()
         owned_cards: list[str] = []
-        missing_cards: list[str] = []  # Cards we need to add (like basic lands)
         selected_names: set[str] = set()
 
-        # Pass 1: Ensure minimum lands (critical for playable decks)
+        # Pass 1: Ensure minimum lands (critical for playable decks), in collection order
         land_min = 22 if deck_format == "standard" else 35
-        land_cards = [(s, c) for s, c in valid_cards if c.get_card_type() == "land"]
-
-        # Add owned lands first
-        for _score, card in land_cards[:land_min]:
-            if card.name not in selected_names:
-                owned_cards.append(card.name)
-                selected_names.add(card.name)
-                type_counts["land"] += 1
+        is_land = encoded.type_codes == _LAND
+        for i in np.flatnonzero(eligible & is_land)[:land_min]:
+            name = encoded.cards[i].name
+            if name not in selected_names:
+                owned_cards.append(name)
+                selected_names.add(name)
 
         # If we don't have enough lands, add basic lands (always available)
-        if type_counts["land"] < land_min:
+        missing_cards: list[str] = []
+        if len(owned_cards) < land_min:
             # Get deck colors from commander or from card color identities
-            deck_colors: set[str] = set()
-            if commander_identity:
-                deck_colors = commander_identity
-            else:
+            deck_colors = set(commander.get_color_identity()) if commander else set()
+            if not deck_colors:
                 # Derive from non-land cards in the deck
-                for _score, card in valid_cards:
-                    if card.get_card_type() != "land":
-                        deck_colors.update(card.get_color_identity())
-
-            # Map colors to basic lands
-            color_to_basic = {
-                "W": "Plains",
-                "U": "Island",
-                "B": "Swamp",
-                "R": "Mountain",
-                "G": "Forest",
-            }
-
-            # Add basic lands evenly distributed across colors
-            colors_list = [c for c in deck_colors if c in color_to_basic]
-            if not colors_list:
-                colors_list = ["R"]  # Default to Mountain for colorless
-
-            lands_needed = land_min - type_counts["land"]
-            lands_per_color = max(1, lands_needed // len(colors_list))
-
-            for color in colors_list:
-                basic_name = color_to_basic[color]
-                for _ in range(lands_per_color):
-                    if type_counts["land"] >= land_min:
-                        break
-                    missing_cards.append(basic_name)
-                    type_counts["land"] += 1
-
-            # Fill remaining with first color's basic
-            while type_counts["land"] < land_min:
-                missing_cards.append(color_to_basic[colors_list[0]])
-                type_counts["land"] += 1
+                non_land_mask = np.bitwise_or.reduce(encoded.color_masks[eligible & ~is_land])
+                deck_colors = encoded.mask_colors(int(non_land_mask))
+            missing_cards = _basic_lands(deck_colors, land_min - len(owned_cards))
 
         # Pass 2: Fill remaining slots with highest-scoring NON-LAND cards
-        # Lands are fully handled in Pass 1 - we don't want any more lands
-        non_land_cards = [(s, c) for s, c in valid_cards if not c.is_land()]
-
-        total_selected = len(owned_cards) + len(missing_cards)
-        for _score, card in non_land_cards:
-            if total_selected >= max_cards:
-                break
-            if card.name in selected_names:
-                continue
-
-            card_type = card.get_card_type()
-            type_limit = targets.get(card_type, (0, 10))  # Default max of 10 for unknown types
-            max_of_type = type_limit[1] if isinstance(type_limit, tuple) else 10
-
-            if type_counts[card_type] < max_of_type:
-                owned_cards.append(card.name)
-                selected_names.add(card.name)
-                type_counts[card_type] += 1
-                total_selected += 1
+        slots = max_cards - len(owned_cards) - len(missing_cards)
+        if slots > 0:
+            scores = encoded.scores(archetype, commander)
+            picked = self._top_cards(
+                encoded, scores, eligible & ~is_land, targets, slots, selected_names
+            )
+            owned_cards.extend(encoded.cards[i].name for i in picked)
 
         return (owned_cards, missing_cards)
 
+    def _top_cards(
+        self,
+        encoded: EncodedCollection,
+        scores: NDArray[np.int32],
+        pool: NDArray[np.bool_],
+        targets: dict[str, int | tuple[int, int]],
+        slots: int,
+        selected_names: set[str],
+    ) -> list[int]:
+        """Pick up to ``slots`` of the highest-scoring cards in ``pool``.
+
+        Walks cards best first (ties in collection order), skipping names
+        already selected and types at their DECK_TARGETS maximum. Only each
+        type's top-k cards are partitioned out and sorted; k grows when
+        duplicate names use up a type's candidates before its maximum.
+        """
+        import numpy as np
+
+        caps: dict[int, int] = {}
+        for code, card_type in enumerate(CARD_TYPES):
+            if code != _LAND:
+                type_limit = targets.get(card_type, (0, 10))  # Default max of 10
+                caps[code] = type_limit[1] if isinstance(type_limit, tuple) else 10
+        members = {
+            code: encoded.type_members[code][pool[encoded.type_members[code]]] for code in caps
+        }
+        depth = {code: min(cap, slots) + 8 for code, cap in caps.items()}
+
+        while True:
+            candidates: list[NDArray[np.intp]] = []
+            unvisited: dict[int, int] = {}  # Truncated types: candidates not yet walked
+            for code, indices in members.items():
+                if len(indices) > depth[code]:
+                    cut = len(indices) - depth[code]
+                    indices = indices[scores[indices] >= np.partition(scores[indices], cut)[cut]]
+                    unvisited[code] = len(indices)
+                candidates.append(indices)
+            merged = np.concatenate(candidates)
+            order = merged[np.lexsort((merged, -scores[merged]))]
+
+            picked: list[int] = []
+            names = set(selected_names)
+            type_counts: Counter[int] = Counter()
+            for i in order.tolist():
+                if len(picked) >= slots:
+                    break
+                code = int(encoded.type_codes[i])
+                if code in unvisited:
+                    unvisited[code] -= 1
+                name = encoded.cards[i].name
+                if name in names or type_counts[code] >= caps[code]:
+                    continue
+                picked.append(i)
+                names.add(name)
+                type_counts[code] += 1
+
+            # A truncated type that ran out of candidates below its maximum
+            # may have skipped cards worth taking: look deeper
+            short = [
+                code
+                for code, left in unvisited.items()
+                if left == 0 and type_counts[code] < caps[code]
+            ]
+            if not short:
+                return picked
+            for code in short:
+                depth[code] *= 4
+
     def find_commander_decks(
         self,
         _collection_cards: set[str],
@@ -410,69 +585,59 @@ class DeckFinder:
         Returns:
             List of deck suggestions sorted by relevance
         """
-        suggestions: list[DeckSuggestion] = []
-
         if not card_data:
             # Without card data, we can't do much analysis
-            return suggestions
+            return []
+        return rank_suggestions(self.iter_commander_decks(card_data, min_completion), limit)
 
-        # Find potential commanders (legendary creatures)
-        potential_commanders: list[CardData] = []
-        for card in card_data:
-            if card.type_line and self._is_valid_commander(card.type_line):
-                potential_commanders.append(card)
+    def iter_commander_decks(
+        self,
+        card_data: list[CardData],
+        min_completion: float = 0.0,
+    ) -> Iterator[DeckSuggestion]:
+        """Yield Commander deck suggestions as they are built, unranked.
 
-        if not potential_commanders:
+        Tribal and theme suggestions come first, then one per potential
+        commander. Any prefix can be ordered with rank_suggestions(), so a UI
+        can show results while the rest are still being built.
+
+        Args:
+            card_data: The collection's cards
+            min_completion: Minimum completion for commander suggestions
+        """
+        # Find potential commanders (legendary creatures)
+        commander_indices = [
+            i
+            for i, card in enumerate(card_data)
+            if card.type_line and self._is_valid_commander(card.type_line)
+        ]
+        if not commander_indices:
             # No legendary creatures found
-            return suggestions
+            return
+        potential_commanders = [card_data[i] for i in commander_indices]
 
-        # Analyze collection for tribal themes
+        # Analyze collection for tribal and mechanic themes, and colors
         tribal_counts = self._count_tribal_types(card_data)
-
-        # Analyze collection for mechanic themes
         theme_counts = self._count_themes(card_data)
-
-        # Analyze colors in collection
         color_counts = self._count_colors(card_data)
 
-        # Generate suggestions for each potential commander
-        for commander in potential_commanders:
-            suggestion = self._create_commander_suggestion(
-                commander,
-                card_data,
-                tribal_counts,
-                theme_counts,
-                color_counts,
-            )
-            if suggestion and suggestion.completion_pct >= min_completion:
-                suggestions.append(suggestion)
-
-        # Also add tribal-based suggestions if strong tribal presence
-        tribal_suggestions = self._create_tribal_suggestions(
+        # Tribal-based suggestions if strong tribal presence
+        yield from self._create_tribal_suggestions(
             potential_commanders, card_data, tribal_counts, color_counts
         )
-        suggestions.extend(tribal_suggestions)
-
-        # Also add theme-based suggestions
-        theme_suggestions = self._create_theme_suggestions(
+        # Theme-based suggestions
+        yield from self._create_theme_suggestions(
             potential_commanders, card_data, theme_counts, color_counts
         )
-        suggestions.extend(theme_suggestions)
-
-        # Sort by completion/relevance and deduplicate
-        suggestions.sort(key=lambda s: (-s.completion_pct, s.name))
 
-        # Remove duplicates (same commander)
-        seen_commanders: set[str] = set()
-        unique_suggestions: list[DeckSuggestion] = []
-        for s in suggestions:
-            if s.commander and s.commander not in seen_commanders:
-                seen_commanders.add(s.commander)
-                unique_suggestions.append(s)
-            elif not s.commander:
-                unique_suggestions.append(s)
-
-        return unique_suggestions[:limit]
+        # A suggestion for each potential commander, all from one encoding
+        encoded = EncodedCollection.from_cards(card_data)
+        for index in commander_indices:
+            suggestion = self._create_commander_suggestion(
+                encoded, index, tribal_counts, theme_counts
+            )
+            if suggestion and suggestion.completion_pct >= min_completion:
+                yield suggestion
 
     def _is_valid_commander(self, type_line: str) -> bool:
         """Check if a card can be a commander."""
@@ -533,43 +698,34 @@ class DeckFinder:
 
     def _create_commander_suggestion(
         self,
-        commander: CardData,
-        all_cards: list[CardData],
+        encoded: EncodedCollection,
+        index: int,
         tribal_counts: Counter[str],
         theme_counts: Counter[str],
-        _color_counts: Counter[str],
     ) -> DeckSuggestion | None:
-        """Create a deck suggestion around a specific commander."""
+        """Create a deck suggestion around the commander at ``encoded.cards[index]``."""
+        commander = encoded.cards[index]
         commander_colors = self._get_commander_colors(commander)
 
-        # Get cards that fit this commander's colors (as CardData objects)
-        fitting_card_data: list[CardData] = []
-        for card in all_cards:
-            # Skip the commander itself
-            if card.name == commander.name:
-                continue
-            # Use color identity for proper filtering (important for lands!)
-            card_identity = card.get_color_identity()
-            # If commander has no color identity data, accept all cards
-            # Otherwise check color identity matching
-            if not commander_colors:
-                fitting_card_data.append(card)
-            elif not card_identity:
-                # Truly colorless cards fit any commander
-                fitting_card_data.append(card)
-            elif all(c in commander_colors for c in card_identity):
-                fitting_card_data.append(card)
+        # Cards within the commander's color identity (colorless cards fit any
+        # commander, and a commander without identity data accepts all cards),
+        # skipping the commander itself
+        eligible = encoded.fits_identity(commander_colors) & (
+            encoded.name_ids != encoded.name_ids[index]
+        )
+        fitting_count = int(eligible.sum())
 
         # Need at least some cards to make a suggestion
-        if len(fitting_card_data) < 10:
+        if fitting_count < 10:
             return None
 
         # Detect archetype based on commander's text and type
         archetype = self._detect_commander_archetype(commander, tribal_counts, theme_counts)
 
         # Select the best cards using scoring
-        owned_cards, missing_cards = self._select_best_cards(
-            fitting_card_data,
+        owned_cards, missing_cards = self._select_encoded(
+            encoded,
+            eligible,
             deck_format="commander",
             archetype=archetype,
             commander=commander,
@@ -581,7 +737,7 @@ class DeckFinder:
 
         reasons: list[str] = []
         reasons.append("You own this legendary creature")
-        reasons.append(f"{len(fitting_card_data)} cards in these colors")
+        reasons.append(f"{fitting_count} cards in these colors")
 
         if archetype:
             reasons.append(f"Potential strategy: {archetype}")
@@ -770,6 +926,7 @@ class DeckFinder:
 
         # Count colors
         color_counts = self._count_colors(card_data)
+        encoded: EncodedCollection | None = None
 
         # Generate color-based suggestions
         color_combos = [
@@ -799,17 +956,16 @@ class DeckFinder:
             if card_count < min_cards:
                 continue
 
-            # Get cards that fit (as CardData) - use color identity for lands
-            fitting_card_data: list[CardData] = []
-            for card in card_data:
-                card_identity = card.get_color_identity()
-                # Card fits if colorless or its identity is subset of deck colors
-                if not card_identity or set(card_identity).issubset(set(colors)):
-                    fitting_card_data.append(card)
+            # Cards that fit: colorless or identity within the deck colors
+            # (use color identity for lands)
+            if encoded is None:
+                encoded = EncodedCollection.from_cards(card_data)
+            eligible = encoded.fits_identity(colors)
 
             # Select best cards for a 60-card Standard deck
-            owned_cards, missing_cards = self._select_best_cards(
-                fitting_card_data,
+            owned_cards, missing_cards = self._select_encoded(
+                encoded,
+                eligible,
                 deck_format="standard",
                 archetype=archetype,
             )
@@ -819,7 +975,7 @@ class DeckFinder:
 
             if completion >= min_completion:
                 reasons = [
-                    f"{len(fitting_card_data)} cards in these colors",
+                    f"{int(eligible.sum())} cards in these colors",
                     f"Strategy: {archetype}",
                 ]
                 if missing_cards:
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
-from numpy.typing import NDArray
+from ...utils.text_match import TextMatcher
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 # Keywords that indicate mechanical synergies (not just abilities)
 SYNERGY_KEYWORDS = {
@@ -48,6 +51,8 @@ SYNERGY_KEYWORDS = {
     "tribal_synergy": ["share a creature type", "choose a creature type"],
 }
 
+_SYNERGY_MATCHER = TextMatcher(SYNERGY_KEYWORDS)
+
 # Common keyword abilities to track
 KEYWORD_ABILITIES = [
     "flying",
@@ -155,6 +160,8 @@ class CardFeatures:
         else:
             vec.append(0.5)  # Unknown
 
+        import numpy as np
+
         return np.array(vec, dtype=np.float64)
 
 
@@ -317,13 +324,7 @@ class CardEncoder:
 
     def _detect_synergy_themes(self, oracle_text: str) -> set[str]:
         """Detect synergy themes from oracle text."""
-        themes: set[str] = set()
-        for theme, patterns in SYNERGY_KEYWORDS.items():
-            for pattern in patterns:
-                if re.search(pattern, oracle_text, re.IGNORECASE):
-                    themes.add(theme)
-                    break
-        return themes
+        return set(_SYNERGY_MATCHER.find(oracle_text))
 
 
 class DeckEncoder:
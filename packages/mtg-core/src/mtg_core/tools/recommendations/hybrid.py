@@ -533,9 +533,10 @@ class HybridRecommender:
         # Store card data for feature encoding
         self._card_data = self._tfidf._card_data
 
-        # Initialize Commander Spellbook combo detector (73K+ combos)
+        # Initialize Commander Spellbook combo detector (73K+ combos), unless one was given
         try:
-            self._spellbook_detector = get_spellbook_detector()
+            if self._spellbook_detector is None:
+                self._spellbook_detector = get_spellbook_detector()
             if self._spellbook_detector.is_available:
                 logger.info(
                     f"Loaded {self._spellbook_detector.combo_count:,} combos from Commander Spellbook"
@@ -1112,6 +1113,15 @@ def get_hybrid_recommender() -> HybridRecommender:
     return _hybrid_recommender
 
 
+def set_hybrid_recommender(recommender: HybridRecommender | None) -> None:
+    """Replace the global hybrid recommender (None: create a new one on next use).
+
+    DatabaseManager installs the card daemon's recommender here while attached.
+    """
+    global _hybrid_recommender
+    _hybrid_recommender = recommender
+
+
 async def initialize_hybrid_recommender(db: UnifiedDatabase) -> float:
     """Initialize the global hybrid recommender."""
     recommender = get_hybrid_recommender()
@@ -6,14 +6,20 @@ detecting missing combo pieces in decks.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Decks matched together by find_missing_pieces_bulk()
+_BULK_CHUNK_SIZE = 256
+
 
 @dataclass
 class SpellbookCombo:
@@ -89,6 +95,10 @@ class SpellbookComboDetector:
         self._card_to_combos: dict[str, set[str]] = {}
         # Combo data: combo_id -> SpellbookCombo
         self._combos: dict[str, SpellbookCombo] = {}
+        # combo_id -> lowered card names (computed once instead of per deck)
+        self._combo_cards_lower: dict[str, frozenset[str]] = {}
+        # combo_id -> (name, lowered name) per distinct card, to split matches without lower()
+        self._combo_card_pairs: dict[str, tuple[tuple[str, str], ...]] = {}
 
         self._initialized = False
         self._combo_count = 0
@@ -161,10 +171,15 @@ class SpellbookComboDetector:
             )
 
             self._combos[combo_id] = combo
+            pairs: dict[str, str] = {}
+            for name in card_names:
+                pairs.setdefault(name.lower(), name)
+            self._combo_card_pairs[combo_id] = tuple((name, lower) for lower, name in pairs.items())
+            cards_lower = frozenset(pairs)
+            self._combo_cards_lower[combo_id] = cards_lower
 
             # Build inverted index
-            for card_name in card_names:
-                card_lower = card_name.lower()
+            for card_lower in cards_lower:
                 if card_lower not in self._card_to_combos:
                     self._card_to_combos[card_lower] = set()
                 self._card_to_combos[card_lower].add(combo_id)
@@ -190,56 +205,164 @@ class SpellbookComboDetector:
         Returns:
             Tuple of (combo matches, missing_card -> combo_ids it completes)
         """
+        return self.find_missing_pieces_bulk(
+            [deck_cards],
+            max_missing=max_missing,
+            bracket_filter=bracket_filter,
+            min_present=min_present,
+        )[0]
+
+    def find_missing_pieces_bulk(
+        self,
+        decks: Sequence[Iterable[str]],
+        max_missing: int = 2,
+        bracket_filter: str | None = None,
+        min_present: int = 1,
+        limit: int | None = None,
+    ) -> list[tuple[list[SpellbookComboMatch], dict[str, list[str]]]]:
+        """Find combos each of many decks is close to completing.
+
+        Decks are bucketed by card, so each card's posting list is read once for
+        every deck containing it, and a combo's present count is tallied from
+        the postings. Only combos within ``max_missing`` are then materialized,
+        instead of intersecting every candidate combo with every deck.
+
+        Args:
+            decks: Card names of each deck
+            max_missing: Maximum number of missing pieces to consider
+            bracket_filter: Only include combos of this bracket (C/P/S/R)
+            min_present: Minimum cards from combo that must be present
+            limit: Keep only each deck's first ``limit`` matches (and the
+                missing pieces of those), building no others
+
+        Returns:
+            Per deck, in order, what find_missing_pieces() returns for it
+        """
         if not self._initialized:
             self.initialize()
 
         if not self._initialized:
-            return [], {}
+            return [([], {}) for _ in decks]
+
+        results: list[tuple[list[SpellbookComboMatch], dict[str, list[str]]]] = []
+        deck_sets = [{card.lower() for card in deck} for deck in decks]
+        # Chunked so per-deck counters stay bounded however many decks are audited
+        for start in range(0, len(deck_sets), _BULK_CHUNK_SIZE):
+            results.extend(
+                self._match_chunk(
+                    deck_sets[start : start + _BULK_CHUNK_SIZE],
+                    max_missing,
+                    bracket_filter,
+                    min_present,
+                    limit,
+                )
+            )
+        return results
 
-        deck_lower = {card.lower() for card in deck_cards}
+    def _match_chunk(
+        self,
+        deck_sets: list[set[str]],
+        max_missing: int,
+        bracket_filter: str | None,
+        min_present: int,
+        limit: int | None,
+    ) -> list[tuple[list[SpellbookComboMatch], dict[str, list[str]]]]:
+        """Match a chunk of (lowered) decks in one pass over the posting lists."""
+        decks_by_card: dict[str, list[int]] = {}
+        for index, deck_lower in enumerate(deck_sets):
+            for card in deck_lower:
+                decks_by_card.setdefault(card, []).append(index)
+
+        # Single pass over the posting lists: combo_id -> present count, per deck
+        present_counts: list[Counter[str]] = [Counter() for _ in deck_sets]
+        for card, deck_indexes in decks_by_card.items():
+            combo_ids = self._card_to_combos.get(card)
+            if not combo_ids:
+                continue
+            for index in deck_indexes:
+                present_counts[index].update(combo_ids)
 
-        # Find combos that share cards with the deck
-        candidate_combo_ids: set[str] = set()
-        for card in deck_lower:
-            if card in self._card_to_combos:
-                candidate_combo_ids.update(self._card_to_combos[card])
+        return [
+            self._collect_matches(
+                deck_lower, counts, max_missing, bracket_filter, min_present, limit
+            )
+            for deck_lower, counts in zip(deck_sets, present_counts, strict=True)
+        ]
 
-        results: list[SpellbookComboMatch] = []
-        missing_to_combos: dict[str, list[str]] = {}
+    async def find_missing_pieces_bulk_async(
+        self,
+        decks: Sequence[Iterable[str]],
+        max_missing: int = 2,
+        bracket_filter: str | None = None,
+        min_present: int = 1,
+    ) -> list[tuple[list[SpellbookComboMatch], dict[str, list[str]]]]:
+        """Run find_missing_pieces_bulk() in a worker thread, keeping the event loop free."""
+        # Copy the decks so the caller can keep mutating theirs meanwhile
+        snapshot = [list(deck) for deck in decks]
+        return await asyncio.to_thread(
+            self.find_missing_pieces_bulk, snapshot, max_missing, bracket_filter, min_present
+        )
+
+    def _collect_matches(
+        self,
+        deck_lower: set[str],
+        present_counts: Mapping[str, int],
+        max_missing: int,
+        bracket_filter: str | None,
+        min_present: int,
+        limit: int | None = None,
+    ) -> tuple[list[SpellbookComboMatch], dict[str, list[str]]]:
+        """Build one deck's matches from its per-combo present counts.
+
+        Combos that pass the filters are ranked as plain tuples first, so match
+        objects (which a bulk audit keeps millions of) are built only for the
+        ones returned.
+        """
+        candidates: list[tuple[int, float, str]] = []
+        for combo_id, present_count in present_counts.items():
+            combo_cards_lower = self._combo_cards_lower[combo_id]
+
+            # Check constraints (before touching the combo's cards)
+            if len(combo_cards_lower) - present_count > max_missing:
+                continue
+            if present_count < min_present:
+                continue
 
-        for combo_id in candidate_combo_ids:
             combo = self._combos[combo_id]
 
             # Apply bracket filter
             if bracket_filter and combo.bracket_tag != bracket_filter:
                 continue
 
-            combo_cards_lower = {c.lower() for c in combo.card_names}
-            present = combo_cards_lower & deck_lower
-            missing = combo_cards_lower - deck_lower
+            candidates.append((-combo.popularity, -present_count / len(combo.card_names), combo_id))
 
-            # Check constraints
-            if len(missing) > max_missing:
-                continue
-            if len(present) < min_present:
-                continue
+        # Sort by popularity (most popular first), then completion ratio; stable,
+        # so ties keep posting-list order
+        candidates.sort(key=lambda candidate: candidate[:2])
+        if limit is not None:
+            del candidates[limit:]
 
-            match = SpellbookComboMatch(
-                combo=combo,
-                present_cards=[c for c in combo.card_names if c.lower() in present],
-                missing_cards=[c for c in combo.card_names if c.lower() in missing],
-                completion_ratio=len(present) / len(combo.card_names),
+        results: list[SpellbookComboMatch] = []
+        missing_to_combos: dict[str, list[str]] = {}
+        for _popularity, ratio, combo_id in candidates:
+            present_cards: list[str] = []
+            missing_cards: list[str] = []
+            for name, lower in self._combo_card_pairs[combo_id]:
+                if lower in deck_lower:
+                    present_cards.append(name)
+                else:
+                    missing_cards.append(name)
+                    # Track which cards complete which combos
+                    missing_to_combos.setdefault(lower, []).append(combo_id)
+
+            results.append(
+                SpellbookComboMatch(
+                    combo=self._combos[combo_id],
+                    present_cards=present_cards,
+                    missing_cards=missing_cards,
+                    completion_ratio=-ratio,
+                )
             )
-            results.append(match)
-
-            # Track which cards complete which combos
-            for card in missing:
-                if card not in missing_to_combos:
-                    missing_to_combos[card] = []
-                missing_to_combos[card].append(combo_id)
-
-        # Sort by popularity (most popular first), then completion ratio
-        results.sort(key=lambda x: (-x.combo.popularity, -x.completion_ratio))
         return results, missing_to_combos
 
     def find_combos_for_card(
@@ -278,6 +401,16 @@ class SpellbookComboDetector:
         combos.sort(key=lambda x: -x.popularity)
         return combos[:limit]
 
+    def combo_ids_for_card(self, card_name: str) -> frozenset[str]:
+        """Get the IDs of every combo containing a card (its posting list).
+
+        Unlike find_combos_for_card this does no filtering or sorting, so it is
+        cheap enough to call on every deck edit.
+        """
+        if not self._initialized:
+            self.initialize()
+        return frozenset(self._card_to_combos.get(card_name.lower(), ()))
+
     def get_bracket_score(self, bracket_tag: str) -> float:
         """Score combo by bracket (power level).
 
@@ -311,12 +444,26 @@ class SpellbookComboDetector:
         Returns:
             List of combo matches sorted by popularity
         """
-        matches, _ = self.find_missing_pieces(
-            deck_cards,
+        return self.find_combos_bulk([deck_cards], max_missing=max_missing, limit=limit)[0]
+
+    def find_combos_bulk(
+        self,
+        decks: Sequence[Iterable[str]],
+        max_missing: int = 0,
+        limit: int = 10,
+    ) -> list[list[SpellbookComboMatch]]:
+        """Find complete (or nearly complete) combos in each of many decks.
+
+        Returns:
+            Per deck, in order, what find_combos() returns for it
+        """
+        results = self.find_missing_pieces_bulk(
+            decks,
             max_missing=max_missing,
             min_present=2,  # At least 2 cards from combo must be present
+            limit=limit,
         )
-        return matches[:limit]
+        return [matches for matches, _ in results]
 
     def get_combo_score(self, combo: SpellbookCombo) -> float:
         """Calculate a combined score for a combo (0-100).
@@ -382,3 +529,12 @@ def get_spellbook_detector() -> SpellbookComboDetector:
         _spellbook_detector = SpellbookComboDetector()
         _spellbook_detector.initialize()
     return _spellbook_detector
+
+
+def set_spellbook_detector(detector: SpellbookComboDetector | None) -> None:
+    """Replace the global spellbook combo detector (None: create a new one on next use).
+
+    DatabaseManager installs the card daemon's detector here while attached.
+    """
+    global _spellbook_detector
+    _spellbook_detector = detector
@@ -8,13 +8,13 @@ import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-import numpy as np
-from numpy.typing import NDArray
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
+# numpy and sklearn (~1s with scipy/pandas) are imported where they are used, so
+# importing this module (and the TUI screens that reference it) stays cheap
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
     from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import TfidfVectorizer
 
     from mtg_core.data.database import UnifiedDatabase
 
@@ -80,6 +80,8 @@ class CardRecommender:
             self._name_to_idx[name] = idx
 
         # Fit TF-IDF vectorizer
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         self._vectorizer = TfidfVectorizer(
             max_features=10000,
             stop_words="english",
@@ -97,35 +99,7 @@ class CardRecommender:
 
     async def _fetch_unique_cards(self, db: UnifiedDatabase) -> list[dict[str, Any]]:
         """Fetch unique cards from database (one printing per card name)."""
-        query = """
-            SELECT
-                c.name,
-                c.id AS uuid,
-                c.type_line AS type,
-                c.oracle_text AS text,
-                c.mana_cost AS manaCost,
-                c.colors,
-                c.color_identity AS colorIdentity,
-                c.type_line AS types,
-                -- subtypes extracted from type_line by _build_document
-                c.type_line AS subtypes,
-                c.keywords,
-                c.power,
-                c.toughness,
-                c.cmc AS manaValue,
-                c.edhrec_rank AS edhrecRank
-            FROM cards c
-            WHERE (c.is_promo IS NULL OR c.is_promo = 0)
-              AND c.is_token = 0
-              AND c.name NOT LIKE '%//%'
-            GROUP BY c.name
-            ORDER BY c.edhrec_rank ASC NULLS LAST
-        """
-        cards: list[dict[str, Any]] = []
-        async with db._execute(query) as cursor:
-            async for row in cursor:
-                cards.append(dict(row))
-        return cards
+        return await db.get_recommendation_cards()
 
     def _build_document(self, card: dict[str, Any]) -> str:
         """Build a text document from card features for TF-IDF."""
@@ -247,6 +221,9 @@ class CardRecommender:
         card_vector = self._tfidf_matrix[idx : idx + 1]
 
         # Compute similarities
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+
         similarities = cosine_similarity(card_vector, self._tfidf_matrix).flatten()
 
         # Get top N indices (excluding self if requested)
@@ -295,6 +272,9 @@ class CardRecommender:
         text_vector = self._vectorizer.transform([text])
 
         # Compute similarities
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+
         similarities = cosine_similarity(text_vector, self._tfidf_matrix).flatten()
 
         # Get top N indices
@@ -362,6 +342,9 @@ class CardRecommender:
         centroid = card_vectors.mean(axis=0)
 
         # Convert to 2D array for cosine_similarity
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+
         centroid_2d: NDArray[np.float64] = np.asarray(centroid)
 
         # Compute similarities
@@ -15,6 +15,7 @@ from .detection import (
     find_combos_for_card,
     find_combos_in_deck,
 )
+from .index import SynergyTerm, build_synergy_terms, search_synergy_terms
 from .scoring import (
     calculate_synergy_score,
     card_has_pattern,
@@ -31,6 +32,8 @@ __all__ = [
     "SYNERGY_BASE_SCORES",
     "THEME_INDICATORS",
     "TYPE_SYNERGIES",
+    "SynergyTerm",
+    "build_synergy_terms",
     "calculate_synergy_score",
     "card_has_pattern",
     "combo_to_model",
@@ -43,5 +46,6 @@ __all__ = [
     "find_synergies",
     "normalize_card_name",
     "search_synergies",
+    "search_synergy_terms",
     "suggest_cards",
 ]
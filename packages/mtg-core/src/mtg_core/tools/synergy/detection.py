@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING, Any
 
 from ...data.database.combos import ComboCardRow, ComboDatabase, ComboRow
 from ...data.models.responses import Combo, ComboCard
+from ...utils.text_match import TextMatcher
 from .constants import KNOWN_COMBOS, THEME_INDICATORS
 from .scoring import normalize_card_name
 
 if TYPE_CHECKING:
     from ...data.models.card import Card
 
+_THEME_MATCHER = TextMatcher(THEME_INDICATORS)
+
 
 def detect_themes(cards: list[Card]) -> list[str]:
     """Detect deck themes from card texts."""
@@ -21,18 +23,8 @@ def detect_themes(cards: list[Card]) -> list[str]:
     for card in cards:
         if not card.text:
             continue
-
-        card_text_lower = card.text.lower()
-        for theme, patterns in THEME_INDICATORS.items():
-            for pattern in patterns:
-                try:
-                    if re.search(pattern, card_text_lower, re.IGNORECASE):
-                        theme_scores[theme] += 1
-                        break
-                except re.error:
-                    if pattern.lower() in card_text_lower:
-                        theme_scores[theme] += 1
-                        break
+        for theme in _THEME_MATCHER.find(card.text):
+            theme_scores[theme] += 1
 
     subtype_counts: dict[str, int] = {}
     for card in cards:
@@ -0,0 +1,192 @@
+"""Ingest-time index of synergy rule terms.
+
+``KEYWORD_SYNERGIES``, ``ABILITY_SYNERGIES`` and ``TYPE_SYNERGIES`` map what a
+card has to the terms that synergize with it. Searching those terms at query
+time meant one ``oracle_text LIKE '%term%'`` scan per term, and the regex-like
+terms ("can block.*flying", "unearth|escape") were matched literally, so they
+cost a scan and found almost nothing.
+
+Instead the terms are compiled once and evaluated against every oracle card at
+ingest, recording matches in ``card_synergy_terms(term_id, sort_rank, oracle_id)``
+clustered in EDHREC rank order. find_synergies then answers each pass with one
+query of indexed joins (UnifiedDatabase.find_cards_by_synergy_terms) that read
+only each term's top-ranked matches.
+
+Terms are matched as case-insensitive regexes against the rules text.
+Capitalized terms name cards ("Doubling Season", "Sword of", "Urza") and also
+match card names starting with them.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from ...data.models.inputs import SearchCardsInput
+from ...data.models.responses import SynergyResult, SynergyType
+from .constants import ABILITY_SYNERGIES, KEYWORD_SYNERGIES, TYPE_SYNERGIES
+from .scoring import create_synergy_result, normalize_card_name
+from .search import search_synergies
+
+if TYPE_CHECKING:
+    from ...data.database import UnifiedDatabase
+    from ...data.models.card import Card
+
+_REGEX_CHARS = frozenset(".*+?|()[]{}^$\\")
+
+_SCHEMA = [
+    "DROP TABLE IF EXISTS card_synergy_terms",
+    "DROP TABLE IF EXISTS synergy_terms",
+    "CREATE TABLE synergy_terms (term_id INTEGER PRIMARY KEY, pattern TEXT NOT NULL UNIQUE)",
+    # Clustered by term in EDHREC order, so a term's top matches are an index walk
+    (
+        "CREATE TABLE card_synergy_terms ("
+        " term_id INTEGER NOT NULL, sort_rank INTEGER NOT NULL, oracle_id TEXT NOT NULL,"
+        " PRIMARY KEY (term_id, sort_rank, oracle_id)) WITHOUT ROWID"
+    ),
+]
+_UNRANKED = 1 << 30
+
+
+class SynergyTerm(NamedTuple):
+    """A term to find synergistic cards by, with the reason it synergizes."""
+
+    pattern: str
+    reason: str
+    synergy_type: SynergyType
+    page_size: int
+
+
+def rule_patterns() -> list[str]:
+    """All distinct terms in the synergy rule tables, in a stable order."""
+    patterns: set[str] = set()
+    for table in (KEYWORD_SYNERGIES, ABILITY_SYNERGIES, TYPE_SYNERGIES):
+        for terms in table.values():
+            patterns.update(pattern for pattern, _reason in terms)
+    return sorted(patterns)
+
+
+@lru_cache(maxsize=256)
+def compile_term(pattern: str) -> Callable[[str, str], bool]:
+    """Compile a term into a ``match(name, lowercased_oracle_text)`` predicate.
+
+    Plain terms are substring checks, like the LIKE search they replace.
+    """
+    if _REGEX_CHARS.isdisjoint(pattern):
+        needle = pattern.lower()
+
+        def match_text(_name: str, text: str) -> bool:
+            return needle in text
+    else:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+
+        def match_text(_name: str, text: str) -> bool:
+            return regex.search(text) is not None
+
+    if not pattern[:1].isupper():
+        return match_text
+
+    name_regex = re.compile(rf"{re.escape(pattern)}\b", re.IGNORECASE)
+
+    def match_name_or_text(name: str, text: str) -> bool:
+        return name_regex.match(name) is not None or match_text(name, text)
+
+    return match_name_or_text
+
+
+def build_synergy_terms(cursor: sqlite3.Cursor) -> int:
+    """(Re)build synergy_terms and card_synergy_terms from oracle_cards.
+
+    Run after build_oracle_cards().
+
+    Returns:
+        Number of (card, term) matches recorded.
+    """
+    for statement in _SCHEMA:
+        cursor.execute(statement)
+
+    patterns = rule_patterns()
+    cursor.executemany(
+        "INSERT INTO synergy_terms (term_id, pattern) VALUES (?, ?)", enumerate(patterns)
+    )
+    matchers = [(term_id, compile_term(pattern)) for term_id, pattern in enumerate(patterns)]
+
+    cursor.execute(
+        "SELECT oracle_id, name, LOWER(COALESCE(oracle_text, '')), COALESCE(edhrec_rank, ?)"
+        " FROM oracle_cards",
+        (_UNRANKED,),
+    )
+    rows = cursor.fetchall()
+    matches = [
+        (term_id, rank, oracle_id)
+        for oracle_id, name, text, rank in rows
+        for term_id, match in matchers
+        if match(name, text)
+    ]
+    cursor.executemany(
+        "INSERT OR IGNORE INTO card_synergy_terms (term_id, sort_rank, oracle_id) VALUES (?, ?, ?)",
+        matches,
+    )
+    return len(matches)
+
+
+async def search_synergy_terms(
+    db: UnifiedDatabase,
+    source_card: Card,
+    terms: Iterable[SynergyTerm],
+    seen_names: set[str],
+    color_identity: list[str] | None,
+    format_legal: str | None,
+) -> list[SynergyResult]:
+    """Find cards matching synergy terms, in term order.
+
+    Indexed terms are answered by one query; terms the database has no index
+    for (older databases, or terms added since it was built) fall back to
+    search_synergies().
+    """
+    terms = list(terms)
+    indexed = await db.get_indexed_synergy_terms()
+    limits: dict[str, int] = {}
+    for term in terms:
+        if term.pattern in indexed:
+            limits[term.pattern] = max(limits.get(term.pattern, 0), term.page_size)
+    found: dict[str, list[Card]] = {}
+    if limits:
+        found = await db.find_cards_by_synergy_terms(
+            list(limits.items()),
+            SearchCardsInput(
+                color_identity=color_identity,  # type: ignore[arg-type]
+                format_legal=format_legal,  # type: ignore[arg-type]
+            ),
+        )
+
+    results: list[SynergyResult] = []
+    for term in terms:
+        if term.pattern not in indexed:
+            results.extend(
+                await search_synergies(
+                    db,
+                    source_card,
+                    [(term.pattern, term.reason)],
+                    term.synergy_type,
+                    seen_names,
+                    color_identity,
+                    format_legal,
+                    page_size=term.page_size,
+                )
+            )
+            continue
+        for card in found.get(term.pattern, []):
+            normalized = normalize_card_name(card.name)
+            if normalized not in seen_names:
+                seen_names.add(normalized)
+                results.append(
+                    create_synergy_result(card, source_card, term.synergy_type, term.reason)
+                )
+    return results
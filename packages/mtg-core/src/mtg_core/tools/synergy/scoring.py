@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 from ...data.models.responses import SynergyResult, SynergyType
+from ...utils.text_match import compile_pattern
 from .constants import SYNERGY_BASE_SCORES
 
 if TYPE_CHECKING:
@@ -21,10 +21,7 @@ def card_has_pattern(card: Card, pattern: str) -> bool:
     """Check if card text matches a pattern (case-insensitive)."""
     if not card.text:
         return False
-    try:
-        return bool(re.search(pattern, card.text, re.IGNORECASE))
-    except re.error:
-        return pattern.lower() in card.text.lower()
+    return compile_pattern(pattern).search(card.text) is not None
 
 
 def calculate_synergy_score(
@@ -28,6 +28,7 @@ from .detection import (
     find_combos_in_deck,
     find_combos_in_deck_db,
 )
+from .index import SynergyTerm, search_synergy_terms
 from .scoring import (
     calculate_synergy_score,
     card_has_pattern,
@@ -57,10 +58,16 @@ async def find_synergies(
     *,
     use_cache: bool = True,
 ) -> FindSynergiesResult:
-    """Find cards that synergize with a given card."""
+    """Find cards that synergize with a given card.
+
+    Keyword, ability and type terms are answered from the ingest-time
+    card_synergy_terms index when the database has it (see synergy.index).
+    """
     # Check cache first
     cache_key = _synergy_cache_key(card_name, max_results, format_legal)
     if use_cache:
+        # Keyed on the data version, like printings
+        cache_key = f"{await db.get_data_version()}|{cache_key}"
         cached = get_cached(
             _SYNERGIES_CACHE_NS, cache_key, FindSynergiesResult, _SYNERGIES_TTL_DAYS
         )
@@ -76,21 +83,16 @@ async def find_synergies(
     color_identity = source_card.color_identity or None
 
     # Pass 1: Keyword synergies
-    if source_card.keywords:
-        for keyword in source_card.keywords:
-            if keyword in KEYWORD_SYNERGIES:
-                terms = [(t, f"{keyword}: {r}") for t, r in KEYWORD_SYNERGIES[keyword]]
-                synergies.extend(
-                    await search_synergies(
-                        db,
-                        source_card,
-                        terms,
-                        "keyword",
-                        seen_names,
-                        color_identity,
-                        format_legal,
-                    )
-                )
+    keyword_terms = [
+        SynergyTerm(t, f"{keyword}: {r}", "keyword", 10)
+        for keyword in source_card.keywords or []
+        for t, r in KEYWORD_SYNERGIES.get(keyword, [])
+    ]
+    synergies.extend(
+        await search_synergy_terms(
+            db, source_card, keyword_terms, seen_names, color_identity, format_legal
+        )
+    )
 
     # Pass 2: Tribal synergies
     skip_subtypes = {"human", "warrior", "wizard", "soldier", "cleric"}
@@ -116,39 +118,30 @@ async def find_synergies(
             )
 
     # Pass 3: Ability text synergies
-    if source_card.text:
-        for pattern, search_terms in ABILITY_SYNERGIES.items():
-            if card_has_pattern(source_card, pattern):
-                synergies.extend(
-                    await search_synergies(
-                        db,
-                        source_card,
-                        search_terms,
-                        "ability",
-                        seen_names,
-                        color_identity,
-                        format_legal,
-                        page_size=8,
-                    )
-                )
+    ability_terms = [
+        SynergyTerm(t, r, "ability", 8)
+        for pattern, search_terms in ABILITY_SYNERGIES.items()
+        if source_card.text and card_has_pattern(source_card, pattern)
+        for t, r in search_terms
+    ]
+    synergies.extend(
+        await search_synergy_terms(
+            db, source_card, ability_terms, seen_names, color_identity, format_legal
+        )
+    )
 
-    # Pass 4: Type synergies
-    if source_card.types:
-        for card_type in source_card.types:
-            if card_type in TYPE_SYNERGIES:
-                terms = [(t, f"{card_type}: {r}") for t, r in TYPE_SYNERGIES[card_type]]
-                synergies.extend(
-                    await search_synergies(
-                        db,
-                        source_card,
-                        terms,
-                        "theme",
-                        seen_names,
-                        color_identity,
-                        format_legal,
-                        page_size=8,
-                    )
-                )
+    # Pass 4: Type synergies (card types are not stored per card, so read the type line)
+    card_types = source_card.types or (source_card.type or "").split("—")[0].split()
+    type_terms = [
+        SynergyTerm(t, f"{card_type}: {r}", "theme", 8)
+        for card_type in card_types
+        for t, r in TYPE_SYNERGIES.get(card_type, [])
+    ]
+    synergies.extend(
+        await search_synergy_terms(
+            db, source_card, type_terms, seen_names, color_identity, format_legal
+        )
+    )
 
     synergies.sort(key=lambda s: s.score, reverse=True)
     synergies = synergies[:max_results]
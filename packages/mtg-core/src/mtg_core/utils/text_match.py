@@ -0,0 +1,118 @@
+"""Matching families of rules-text patterns against card text.
+
+Theme, synergy and role detection all ask the same question: which of these
+tagged patterns occur in this card's text? Asking it one ``re.search`` per
+pattern meant a regex cache lookup (or a compile) and a scan of the text for
+every pattern, for every card.
+
+TextMatcher compiles a whole family once and answers with one call per text:
+
+- Literal patterns, the large majority, are substring checks against the
+  lowercased text, each literal checked once however many tags share it.
+  CPython's substring search measured about three times faster here than one
+  alternation regex tried at every position (which finds overlapping matches
+  the way an Aho-Corasick automaton would).
+- Regular expressions are joined into one alternation per tag, searched only
+  when no literal already matched the tag.
+
+Matching is case-insensitive. Patterns that are not valid regular expressions
+("+1/+1 counter") match literally, as the per-pattern searches did.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+
+_REGEX_CHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+def is_literal(pattern: str) -> bool:
+    """Whether a pattern matches only itself as a regular expression."""
+    if _REGEX_CHARS.isdisjoint(pattern):
+        return True
+    try:
+        re.compile(pattern)
+    except re.error:
+        return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a rules-text pattern, case-insensitive.
+
+    Patterns that are not valid regular expressions match literally.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return re.compile(re.escape(pattern), re.IGNORECASE)
+
+
+class TextMatcher:
+    """Finds which tags have a pattern occurring in a text.
+
+    Example:
+        >>> matcher = TextMatcher({"tokens": ["create.*token", "populate"]})
+        >>> matcher.find("Populate.")
+        ['tokens']
+    """
+
+    def __init__(self, patterns: Mapping[str, Iterable[str]], *, literal: bool = False) -> None:
+        """Compile a pattern family.
+
+        Args:
+            patterns: Patterns per tag; a tag matches when any of its patterns does
+            literal: Treat every pattern as a plain substring
+        """
+        self.tags: tuple[str, ...] = tuple(patterns)
+        literal_tags: dict[str, set[int]] = {}
+        regexes: dict[int, list[str]] = {}
+        for index, tag in enumerate(self.tags):
+            for pattern in patterns[tag]:
+                if literal or is_literal(pattern):
+                    literal_tags.setdefault(pattern.lower(), set()).add(index)
+                else:
+                    regexes.setdefault(index, []).append(f"(?:{pattern})")
+
+        self._literals: list[tuple[str, frozenset[int]]] = [
+            (lit, frozenset(indices)) for lit, indices in literal_tags.items()
+        ]
+        self._regexes: list[tuple[int, re.Pattern[str]]] = [
+            (index, re.compile("|".join(parts), re.IGNORECASE))
+            for index, parts in sorted(regexes.items())
+        ]
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str], *, literal: bool = False) -> TextMatcher:
+        """A matcher whose tags are the patterns themselves."""
+        return cls({pattern: (pattern,) for pattern in patterns}, literal=literal)
+
+    def find(self, text: str) -> list[str]:
+        """Tags with a pattern occurring in ``text``, in the order they were given."""
+        found = self._find(text)
+        return [self.tags[index] for index in sorted(found)]
+
+    def search(self, text: str) -> bool:
+        """Whether any pattern occurs in ``text``."""
+        if not text:
+            return False
+        lowered = text.lower()
+        return any(lit in lowered for lit, _tags in self._literals) or any(
+            regex.search(text) for _index, regex in self._regexes
+        )
+
+    def _find(self, text: str) -> set[int]:
+        found: set[int] = set()
+        if not text:
+            return found
+        lowered = text.lower()
+        for lit, tags in self._literals:
+            if lit in lowered:
+                found |= tags
+        for index, regex in self._regexes:
+            if index not in found and regex.search(text):
+                found.add(index)
+        return found
@@ -2,10 +2,90 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
 import pytest
 
+from mtg_core.data.database import UnifiedDatabase
+from mtg_core.scripts.create_mtg_db import CARD_INSERT_SQL, card_to_tuple, create_schema
+
+CardDbBuilder = Callable[..., Path]
+
 
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
     """Configure pytest-asyncio to use asyncio backend."""
     return "asyncio"
+
+
+def scryfall_card(
+    name: str, set_code: str = "tst", number: str = "1", **overrides: Any
+) -> dict[str, Any]:
+    """A Scryfall bulk-data card: a red instant unless ``overrides`` say otherwise.
+
+    The card's id is ``"<set_code>-<number>"``; keyword arguments replace or
+    add any other Scryfall field.
+    """
+    colors = overrides.get("colors", ["R"])
+    return {
+        "id": f"{set_code}-{number}",
+        "oracle_id": f"oracle-{name}",
+        "name": name,
+        "layout": "normal",
+        "mana_cost": "{R}",
+        "cmc": 1.0,
+        "colors": colors,
+        "color_identity": colors,
+        "type_line": "Instant",
+        "oracle_text": f"{name} deals 3 damage to any target.",
+        "keywords": [],
+        "set": set_code,
+        "set_name": f"Set {set_code.upper()}",
+        "rarity": "common",
+        "collector_number": number,
+        "artist": "Christopher Rush",
+        "released_at": "2020-01-01",
+        "prices": {"usd": None},
+        "legalities": {},
+        **overrides,
+    }
+
+
+@pytest.fixture
+def build_card_db(tmp_path: Path) -> CardDbBuilder:
+    """Build a card database in ``tmp_path`` from Scryfall card dicts.
+
+    Call it as ``build_card_db(cards, *steps, name="mtg.sqlite")``; each step
+    is called with the cursor after the cards are inserted (ingest-time index
+    builders, or extra rows a test needs). Returns the database path.
+    """
+
+    def build(
+        cards: Iterable[dict[str, Any]],
+        *steps: Callable[[sqlite3.Cursor], object],
+        name: str = "mtg.sqlite",
+    ) -> Path:
+        path = tmp_path / name
+        with sqlite3.connect(path) as conn:
+            cursor = conn.cursor()
+            create_schema(cursor)
+            cursor.executemany(CARD_INSERT_SQL, [card_to_tuple(card) for card in cards])
+            for step in steps:
+                step(cursor)
+        conn.close()
+        return path
+
+    return build
+
+
+@asynccontextmanager
+async def open_card_db(path: Path) -> AsyncIterator[UnifiedDatabase]:
+    """Open a built card database as a UnifiedDatabase."""
+    async with aiosqlite.connect(path) as connection:
+        connection.row_factory = aiosqlite.Row
+        yield UnifiedDatabase(connection)
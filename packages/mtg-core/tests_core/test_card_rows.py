@@ -0,0 +1,165 @@
+"""Tests for projection-specific card rows."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from mtg_core.data.database import (
+    CardSummaryRow,
+    PriceRow,
+    PrintingRow,
+    UnifiedDatabase,
+    select_columns,
+)
+from mtg_core.data.models import SearchCardsInput
+from mtg_core.tools.cards import _card_to_summary
+from mtg_core.tools.images import _card_to_printing_info
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+# Printing fields the projected rows carry beyond the shared factory's defaults
+_PRINTING: dict[str, Any] = {
+    "artist": "Mark Poole",
+    "purchase_uris": {"tcgplayer": "https://tcg"},
+    "finishes": ["nonfoil", "foil"],
+    "legalities": {"modern": "legal"},
+}
+
+
+def _prices(usd: str) -> dict[str, str | None]:
+    return {"usd": usd, "usd_foil": None, "eur": "1.00"}
+
+
+def _image(set_code: str, number: str) -> dict[str, str]:
+    return {"small": f"https://img/{set_code}/{number}/s.jpg"}
+
+
+CARDS = [
+    scryfall_card(
+        "Lightning Bolt",
+        "lea",
+        "161",
+        released_at="1993-08-05",
+        prices=_prices("450.00"),
+        image_uris=_image("lea", "161"),
+        **_PRINTING,
+    ),
+    scryfall_card(
+        "Lightning Bolt",
+        "m11",
+        "149",
+        released_at="2010-07-16",
+        prices=_prices("2.50"),
+        image_uris=_image("m11", "149"),
+        **_PRINTING,
+    ),
+    scryfall_card(
+        "Shock",
+        "m19",
+        "156",
+        released_at="2018-07-13",
+        prices=_prices("0.10"),
+        image_uris=_image("m19", "156"),
+        **_PRINTING,
+    ),
+    scryfall_card(
+        "Counterspell",
+        "lea",
+        "54",
+        released_at="1993-08-05",
+        prices=_prices("120.00"),
+        image_uris=_image("lea", "54"),
+        colors=["U"],
+        keywords=["Counter"],
+        **{**_PRINTING, "artist": "Mark Poole & Jeff A. Menges"},
+    ),
+]
+
+
+@pytest.fixture
+async def db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(build_card_db(CARDS)) as database:
+        yield database
+
+
+class TestSelectColumns:
+    """Tests for projection SELECT lists."""
+
+    def test_aliases_renamed_columns(self) -> None:
+        columns = select_columns(PriceRow)
+        assert columns.startswith("id AS uuid, name, set_code, collector_number AS number")
+
+    def test_table_alias(self) -> None:
+        assert select_columns(PriceRow, "c").startswith("c.id AS uuid, c.name")
+
+
+class TestRowQueries:
+    """Slim rows carry the same displayed data as full cards."""
+
+    async def test_search_rows_match_full_search(self, db: UnifiedDatabase) -> None:
+        filters = SearchCardsInput(colors=["R"], sort_by="name")
+        cards, total = await db.search_cards(filters)
+        rows, row_total = await db.search_card_rows(filters)
+
+        assert row_total == total == 2
+        assert all(isinstance(row, CardSummaryRow) for row in rows)
+        assert [_card_to_summary(r) for r in rows] == [_card_to_summary(c) for c in cards]
+
+    async def test_printing_rows_match_printings(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_all_printings("lightning bolt")
+        rows = await db.get_printing_rows("lightning bolt")
+
+        assert [r.set_code for r in rows] == ["m11", "lea"]
+        assert [_card_to_printing_info(r) for r in rows] == [
+            _card_to_printing_info(c) for c in cards
+        ]
+        assert rows[0].set_name == "Set M11"
+
+    async def test_artist_rows_match_artist_cards(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_cards_by_artist("Mark Poole")
+        rows = await db.get_artist_card_rows("Mark Poole")
+
+        assert [r.name for r in rows] == [c.name for c in cards]
+        assert "Counterspell" in {r.name for r in rows}
+        assert rows[0].keywords == cards[0].keywords
+
+    async def test_price_search_returns_price_rows(self, db: UnifiedDatabase) -> None:
+        rows = await db.search_by_price(min_price=1.0)
+
+        assert all(isinstance(row, PriceRow) for row in rows)
+        assert [r.price_usd for r in rows] == [45000, 12000, 250]
+        assert rows[0].get_price_usd() == 450.0
+
+
+class TestRowDecoding:
+    """Tests for lazy JSON fields and upgrading to Card."""
+
+    def _row(self, **overrides: Any) -> CardSummaryRow:
+        values: dict[str, Any] = dict.fromkeys(CardSummaryRow._fields)
+        values.update(uuid="id-1", name="Lightning Bolt", **overrides)
+        return CardSummaryRow(**values)
+
+    def test_json_fields_parse_on_access(self) -> None:
+        row = self._row(colors_json='["R"]', keywords_json="not json")
+        assert row.colors == ["R"]
+        assert row.keywords == []
+        assert row.color_identity == []
+
+    def test_to_card(self) -> None:
+        row = self._row(type="Instant", number="161", colors_json='["R"]', price_usd=250)
+        card = row.to_card()
+
+        assert card.uuid == "id-1"
+        assert card.type == "Instant"
+        assert card.number == "161"
+        assert card.colors == ["R"]
+        assert card.get_price_usd() == 2.5
+
+    def test_printing_row_to_card(self) -> None:
+        values: dict[str, Any] = dict.fromkeys(PrintingRow._fields)
+        values.update(uuid="id-2", name="Shock", text="Shock deals 2 damage.", flavor="Zap")
+        card = PrintingRow(**values).to_card()
+        assert (card.text, card.flavor) == ("Shock deals 2 damage.", "Zap")
@@ -0,0 +1,226 @@
+"""Tests for SQL-side collection filtering, sorting and keyset paging."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from mtg_core.data.database import CollectionFilter, UserDatabase, build_oracle_cards
+
+from .conftest import CardDbBuilder, scryfall_card
+
+CARDS = [
+    scryfall_card("Lightning Bolt", "m11", "1", prices={"usd": "1.00"}),
+    scryfall_card("Lightning Bolt", "lea", "161", prices={"usd": "9.00"}),
+    scryfall_card(
+        "Llanowar Elves",
+        "m11",
+        "2",
+        type_line="Creature — Elf Druid",
+        colors=["G"],
+        prices={"usd": "0.20"},
+    ),
+    scryfall_card("Sol Ring", "m11", "3", type_line="Artifact", colors=[], prices={"usd": "2.00"}),
+    scryfall_card(
+        "Lightning Helix", "m11", "4", colors=["R", "W"], cmc=2.0, prices={"usd": "0.50"}
+    ),
+    scryfall_card("Forest", "m11", "5", type_line="Basic Land — Forest", colors=[], cmc=0.0),
+]
+
+
+async def _fill_collection(db: UserDatabase) -> None:
+    await db.add_to_collection(
+        "Lightning Bolt", quantity=4, set_code="LEA", collector_number="0161"
+    )
+    await db.add_to_collection("Llanowar Elves", quantity=1)
+    await db.add_to_collection("Sol Ring", quantity=1, foil_quantity=1)
+    await db.add_to_collection("Lightning Helix", quantity=3)
+    await db.add_to_collection("Forest", quantity=20)
+    await db.add_to_collection("Unknown_100%", quantity=1)
+    deck_id = await db.create_deck("Elves")
+    await db.add_card(deck_id, "Llanowar Elves", quantity=1)
+    await db.add_card(deck_id, "Forest", quantity=12)
+
+
+@pytest.fixture
+async def db(tmp_path: Path, build_card_db: CardDbBuilder) -> AsyncIterator[UserDatabase]:
+    card_db_path = build_card_db(CARDS, build_oracle_cards)
+    user_db = UserDatabase(tmp_path / "user.sqlite")
+    await user_db.connect()
+    assert await user_db.attach_card_database(card_db_path)
+    await _fill_collection(user_db)
+    yield user_db
+    await user_db.close()
+
+
+async def _all_names(
+    db: UserDatabase, filters: CollectionFilter | None = None, sort: str = "name"
+) -> list[str]:
+    """Walk every keyset page, two cards at a time."""
+    rows, cursor = await db.query_collection(filters, sort, limit=2)
+    names = [row.card_name for row in rows]
+    while cursor is not None:
+        rows, cursor = await db.query_collection(filters, sort, after=cursor, limit=2)
+        names += [row.card_name for row in rows]
+    return names
+
+
+class TestCollectionQuery:
+    """Collection pages come filtered and sorted from SQL."""
+
+    @pytest.mark.parametrize(
+        ("sort", "expected"),
+        [
+            (
+                "name",
+                [
+                    "Forest",
+                    "Lightning Bolt",
+                    "Lightning Helix",
+                    "Llanowar Elves",
+                    "Sol Ring",
+                    "Unknown_100%",
+                ],
+            ),
+            (
+                "cmc",
+                [
+                    "Forest",
+                    "Lightning Bolt",
+                    "Llanowar Elves",
+                    "Sol Ring",
+                    "Lightning Helix",
+                    "Unknown_100%",
+                ],
+            ),
+            (
+                "qty",
+                [
+                    "Forest",
+                    "Lightning Bolt",
+                    "Lightning Helix",
+                    "Sol Ring",
+                    "Llanowar Elves",
+                    "Unknown_100%",
+                ],
+            ),
+            (
+                "price",
+                [
+                    "Lightning Bolt",  # The LEA printing it is stored as
+                    "Sol Ring",
+                    "Lightning Helix",
+                    "Llanowar Elves",
+                    "Forest",
+                    "Unknown_100%",
+                ],
+            ),
+        ],
+    )
+    async def test_sorted_pages(self, db: UserDatabase, sort: str, expected: list[str]) -> None:
+        assert await _all_names(db, sort=sort) == expected
+
+    async def test_unknown_sort(self, db: UserDatabase) -> None:
+        with pytest.raises(ValueError, match="Unknown collection sort"):
+            await db.query_collection(sort="rarity")
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            (CollectionFilter(search="light"), ["Lightning Bolt", "Lightning Helix"]),
+            (CollectionFilter(search="elf"), ["Llanowar Elves"]),  # Matches the type line
+            (CollectionFilter(search="_100%"), ["Unknown_100%"]),  # LIKE wildcards are literal
+            (CollectionFilter(card_type="instant"), ["Lightning Bolt", "Lightning Helix"]),
+            (CollectionFilter(color="R"), ["Lightning Bolt", "Lightning Helix"]),
+            (CollectionFilter(color="M"), ["Lightning Helix"]),
+            (CollectionFilter(color="C"), ["Forest", "Sol Ring"]),
+            (CollectionFilter(availability="in_decks"), ["Forest", "Llanowar Elves"]),
+            (CollectionFilter(card_type="land", availability="available"), ["Forest"]),
+        ],
+    )
+    async def test_filters(
+        self, db: UserDatabase, filters: CollectionFilter, expected: list[str]
+    ) -> None:
+        assert await _all_names(db, filters) == expected
+        assert await db.count_collection(filters) == len(expected)
+
+    async def test_available_excludes_cards_all_in_decks(self, db: UserDatabase) -> None:
+        names = await _all_names(db, CollectionFilter(availability="available"))
+        assert "Llanowar Elves" not in names
+        assert len(names) == 5
+
+    async def test_pages_continue_after_edits(self, db: UserDatabase) -> None:
+        """A keyset cursor resumes after the last row seen, even if rows before it change."""
+        rows, cursor = await db.query_collection(limit=2)
+        assert [row.card_name for row in rows] == ["Forest", "Lightning Bolt"]
+
+        await db.remove_from_collection("Forest")
+        await db.add_to_collection("Abrade", quantity=1)
+        rows, _ = await db.query_collection(after=cursor, limit=2)
+
+        assert [row.card_name for row in rows] == ["Lightning Helix", "Llanowar Elves"]
+
+    async def test_facets(self, db: UserDatabase) -> None:
+        facets = await db.get_collection_facets()
+
+        assert facets["type"] == {
+            "all": 6,
+            "creature": 1,
+            "instant": 2,
+            "sorcery": 0,
+            "artifact": 1,
+            "enchantment": 0,
+            "planeswalker": 0,
+            "land": 1,
+        }
+        assert facets["color"] == {
+            "all": 6,
+            "W": 0,
+            "U": 0,
+            "B": 0,
+            "R": 1,
+            "G": 1,
+            "C": 2,
+            "M": 1,
+        }
+        assert facets["availability"] == {"all": 6, "available": 5, "in_decks": 2}
+
+
+class TestCardDatabaseAttach:
+    """Collection queries with other card database shapes, or none."""
+
+    async def test_without_oracle_cards(self, tmp_path: Path, build_card_db: CardDbBuilder) -> None:
+        card_db_path = build_card_db(CARDS)
+        db = UserDatabase(tmp_path / "user.sqlite")
+        await db.connect()
+        try:
+            assert await db.attach_card_database(card_db_path)
+            await _fill_collection(db)
+
+            assert await _all_names(db, CollectionFilter(color="R"), sort="cmc") == [
+                "Lightning Bolt",
+                "Lightning Helix",
+            ]
+        finally:
+            await db.close()
+
+    async def test_without_card_database(self, tmp_path: Path) -> None:
+        db = UserDatabase(tmp_path / "user.sqlite")
+        await db.connect()
+        try:
+            assert not await db.attach_card_database(tmp_path / "missing.sqlite")
+            await _fill_collection(db)
+
+            assert len(await _all_names(db, sort="price")) == 6
+            assert await _all_names(db, CollectionFilter(search="elves")) == ["Llanowar Elves"]
+            assert await db.count_collection(CollectionFilter(card_type="instant")) == 0
+            assert (await db.get_collection_facets())["type"]["all"] == 6
+        finally:
+            await db.close()
+
+    async def test_card_database_is_read_only(self, db: UserDatabase) -> None:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await db.conn.execute("DELETE FROM card_db.cards")
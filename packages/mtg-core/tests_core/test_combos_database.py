@@ -497,6 +497,35 @@ class TestFindCombosInDeck:
         assert len(potential) == 0  # No cards present
 
 
+class TestFindCombosInDecks:
+    """Tests for finding combos in many decks at once."""
+
+    async def test_matches_per_deck_calls(self, temp_db: ComboDatabase) -> None:
+        """Batch results should equal one find_combos_in_deck call per deck."""
+        await temp_db.add_combo("combo-1", "win", "Combo 1", [("A", "P"), ("B", "P")])
+        await temp_db.add_combo("combo-2", "value", "Combo 2", [("B", "P"), ("C", "P"), ("D", "P")])
+        await temp_db.add_combo("combo-3", "win", "Combo 3", [("E", "P"), ("F", "P")])
+
+        decks = [["A", "B"], ["b", "C"], ["E"], [], ["X"], ["A", "B", "C", "D"]]
+        batch = await temp_db.find_combos_in_decks(decks)
+
+        assert len(batch) == len(decks)
+        for deck, result in zip(decks, batch, strict=True):
+            assert result == await temp_db.find_combos_in_deck(deck)
+
+        complete, potential = batch[5]
+        assert [c[0].id for c in complete] == ["combo-1", "combo-2"]
+        assert potential == []
+        assert [(combo.id, missing) for combo, _, missing in batch[1][1]] == [
+            ("combo-1", ["A"]),
+            ("combo-2", ["D"]),
+        ]
+
+    async def test_no_decks(self, temp_db: ComboDatabase) -> None:
+        """An empty batch returns no results."""
+        assert await temp_db.find_combos_in_decks([]) == []
+
+
 class TestGetAllCombos:
     """Tests for retrieving all combos."""
 
@@ -0,0 +1,343 @@
+"""Tests for the card lookup daemon and DatabaseManager attaching to it."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import shutil
+import sqlite3
+import stat
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mtg_core.config import Settings
+from mtg_core.daemon import CardDaemon, LatencyHistogram, RemoteDatabase, connect_daemon
+from mtg_core.daemon.protocol import decode, decode_error, encode, encode_error
+from mtg_core.data.database import DatabaseManager, UnifiedDatabase, build_set_index
+from mtg_core.data.models import SearchCardsInput
+from mtg_core.exceptions import CardNotFoundError
+from mtg_core.tools.recommendations import HybridRecommender, get_hybrid_recommender
+from mtg_core.tools.recommendations.spellbook_combos import (
+    SpellbookComboDetector,
+    get_spellbook_detector,
+)
+
+from .conftest import CardDbBuilder, scryfall_card
+
+CARDS = [
+    scryfall_card("Lightning Bolt", "m11", "146", prices={"usd": "1.00"}),
+    scryfall_card("Shock", "m19", "156", prices={"usd": "1.00"}),
+    scryfall_card("Lava Spike", "m19", "150", prices={"usd": "1.00"}),
+    scryfall_card(
+        "Grizzly Bears",
+        "m19",
+        "170",
+        type_line="Creature — Bear",
+        colors=["G"],
+        oracle_text="Trample. When this creature enters, you gain 2 life.",
+    ),
+    scryfall_card(
+        "Kavu Climber",
+        "m19",
+        "171",
+        type_line="Creature — Kavu",
+        colors=["G"],
+        oracle_text="Trample. When this creature enters, draw a card.",
+    ),
+]
+
+
+def _add_set(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(
+        "INSERT INTO sets (code, name, set_type, release_date)"
+        " VALUES ('m19', 'Core Set 2019', 'core', '2018-07-13')"
+    )
+
+
+def _build_combo_db(path: Path) -> Path:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE combos (id TEXT PRIMARY KEY, card_names TEXT, description TEXT,"
+            " bracket_tag TEXT, popularity INTEGER, identity TEXT, produces TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO combos VALUES ('1-2', '[\"Lightning Bolt\", \"Shock\"]',"
+            " 'Burn them out.', 'C', 10, 'R', '[\"Win the game\"]')"
+        )
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def settings(tmp_path: Path, build_card_db: CardDbBuilder) -> Settings:
+    return Settings(
+        mtg_db_path=build_card_db(CARDS, _add_set, build_set_index),
+        user_db_path=tmp_path / "user.sqlite",
+        combo_db_path=_build_combo_db(tmp_path / "combos.sqlite"),
+        daemon_socket_path=tmp_path / "daemon.sock",
+    )
+
+
+@pytest.fixture
+async def attached(
+    daemon: CardDaemon,  # noqa: ARG001
+    settings: Settings,
+) -> AsyncIterator[DatabaseManager]:
+    """A DatabaseManager attached to the daemon."""
+    manager = DatabaseManager(settings)
+    await manager.start()
+    assert manager.remote is not None
+    yield manager
+    await manager.stop()
+
+
+@pytest.fixture
+async def daemon(settings: Settings) -> AsyncIterator[CardDaemon]:
+    card_daemon = CardDaemon(settings)
+    await card_daemon.start()
+    yield card_daemon
+    await card_daemon.stop()
+
+
+@pytest.fixture
+async def remote(daemon: CardDaemon, settings: Settings) -> AsyncIterator[RemoteDatabase]:
+    client = await connect_daemon(daemon.socket_path, settings.mtg_db_path)
+    assert client is not None
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+async def local(settings: Settings) -> AsyncIterator[UnifiedDatabase]:
+    manager = DatabaseManager(settings, attach_daemon=False)
+    await manager.start()
+    yield manager.db
+    await manager.stop()
+
+
+class TestRemoteDatabase:
+    """Calls through the daemon return what UnifiedDatabase returns in-process."""
+
+    async def test_calls_match_in_process(
+        self, remote: RemoteDatabase, local: UnifiedDatabase
+    ) -> None:
+        db: Any = remote
+        assert await db.get_card_by_name("lightning bolt") == await local.get_card_by_name(
+            "lightning bolt"
+        )
+        filters = SearchCardsInput(colors=["R"])
+        assert await db.search_card_rows(filters) == await local.search_card_rows(filters)
+        assert await db.get_set("M19") == await local.get_set("M19")
+        assert await db.get_set_stats("m19") == await local.get_set_stats("m19")
+        assert [b async for b in db.get_set_cards("m19", batch_size=1)] == [
+            b async for b in local.get_set_cards("m19", batch_size=1)
+        ]
+
+    async def test_errors_reraise(self, remote: RemoteDatabase) -> None:
+        db: Any = remote
+        with pytest.raises(CardNotFoundError) as excinfo:
+            await db.get_card_by_name("Not A Card")
+        assert str(excinfo.value) == "Card not found: Not A Card"
+        assert excinfo.value.identifier == "Not A Card"
+
+        with pytest.raises(AttributeError):
+            db.not_a_method  # noqa: B018
+        with pytest.raises(AttributeError):
+            await remote.call("_execute", "SELECT 1")
+
+    async def test_concurrent_requests(self, remote: RemoteDatabase) -> None:
+        db: Any = remote
+        names = ["Lightning Bolt", "Shock", "Lava Spike"] * 10
+        cards = await asyncio.gather(*(db.get_card_by_name(name) for name in names))
+        assert [card.name for card in cards] == names
+
+    async def test_latency_histograms(self, remote: RemoteDatabase) -> None:
+        db: Any = remote
+        for _ in range(5):
+            await db.get_card_by_name("Shock")
+        assert remote.latency["get_card_by_name"].count == 5
+        stats = await remote.daemon_stats()
+        assert stats["get_card_by_name"].count == 5
+
+
+class TestAttach:
+    """DatabaseManager attaches to a running daemon and falls back without one."""
+
+    @pytest.mark.usefixtures("daemon")
+    async def test_attaches_to_daemon(self, settings: Settings) -> None:
+        manager = DatabaseManager(settings)
+        await manager.start()
+        try:
+            assert manager.remote is not None
+            card = await manager.db.get_card_by_name("Shock")
+            assert card.name == "Shock"
+        finally:
+            await manager.stop()
+
+    async def test_falls_back_in_process(self, settings: Settings) -> None:
+        manager = DatabaseManager(settings)
+        await manager.start()
+        try:
+            assert manager.remote is None
+            assert isinstance(manager.db, UnifiedDatabase)
+        finally:
+            await manager.stop()
+
+    async def test_falls_back_when_daemon_stops(self, settings: Settings) -> None:
+        card_daemon = CardDaemon(settings)
+        await card_daemon.start()
+        manager = DatabaseManager(settings)
+        await manager.start()
+        try:
+            assert manager.remote is not None
+            await card_daemon.stop()
+
+            card = await manager.db.get_card_by_name("Shock")
+            assert card.name == "Shock"
+            assert not manager.remote.attached
+        finally:
+            await manager.stop()
+
+    async def test_reattaches_to_restarted_daemon(self, settings: Settings) -> None:
+        card_daemon = CardDaemon(settings)
+        await card_daemon.start()
+        manager = DatabaseManager(settings)
+        await manager.start()
+        try:
+            assert manager.remote is not None
+            await card_daemon.stop()
+            card_daemon = CardDaemon(settings)
+            await card_daemon.start()
+
+            card = await manager.db.get_card_by_name("Shock")
+            assert card.name == "Shock"
+            assert manager.remote.attached
+            assert card_daemon.latency["get_card_by_name"].count == 1
+        finally:
+            await manager.stop()
+            await card_daemon.stop()
+
+    async def test_other_database_falls_back(
+        self, daemon: CardDaemon, settings: Settings, tmp_path: Path
+    ) -> None:
+        other = tmp_path / "other.sqlite"
+        shutil.copy(settings.mtg_db_path, other)
+        assert await connect_daemon(daemon.socket_path, other) is None
+
+    @pytest.mark.usefixtures("daemon")
+    async def test_second_daemon_refused(self, settings: Settings) -> None:
+        with pytest.raises(RuntimeError):
+            await CardDaemon(settings).start()
+
+
+class TestSharedIndexes:
+    """The recommender and combo detector are built once, in the daemon.
+
+    The blocking stand-ins run in a thread here, since the daemon shares the
+    test's event loop.
+    """
+
+    @pytest.mark.usefixtures("attached")
+    async def test_combo_detector_served(self, daemon: CardDaemon, settings: Settings) -> None:
+        detector: Any = get_spellbook_detector()
+        local = SpellbookComboDetector(settings.combo_db_path)
+        local.initialize()
+
+        assert await asyncio.to_thread(lambda: detector.combo_count) == 1
+        assert await asyncio.to_thread(
+            detector.find_missing_pieces, ["Lightning Bolt"], max_missing=1
+        ) == local.find_missing_pieces(["Lightning Bolt"], max_missing=1)
+        assert await asyncio.to_thread(detector.get_combo, "1-2") == local.get_combo("1-2")
+        assert daemon.latency["combos.find_missing_pieces"].count == 1
+
+    async def test_recommender_served(
+        self, daemon: CardDaemon, attached: DatabaseManager, settings: Settings
+    ) -> None:
+        recommender: Any = get_hybrid_recommender()
+        await recommender.initialize(attached.db)
+        local = HybridRecommender(
+            _spellbook_detector=SpellbookComboDetector(settings.combo_db_path)
+        )
+        await local.initialize(attached.db)
+
+        deck = [{"name": "Shock", "type_line": "Instant", "colors": ["R"]}]
+        recommendations = await asyncio.to_thread(recommender.recommend_for_deck, deck, n=2)
+        assert recommendations == local.recommend_for_deck(deck, n=2)
+        assert await asyncio.to_thread(lambda: recommender.card_count) == local.card_count
+        assert daemon.latency["recommender.recommend_for_deck"].count == 1
+
+    @pytest.mark.usefixtures("attached")
+    async def test_private_members_refused(self) -> None:
+        detector: Any = get_spellbook_detector()
+        with pytest.raises(AttributeError):
+            await asyncio.to_thread(detector.call, "_load_combos")
+
+    async def test_fall_back_in_process(
+        self, daemon: CardDaemon, attached: DatabaseManager
+    ) -> None:
+        recommender: Any = get_hybrid_recommender()
+        detector: Any = get_spellbook_detector()
+        assert await asyncio.to_thread(lambda: recommender.is_initialized) is True
+        await daemon.stop()
+
+        assert await asyncio.to_thread(lambda: recommender.is_initialized) is False
+        assert not recommender.attached
+        await recommender.initialize(attached.db)
+        assert recommender.is_initialized
+        await asyncio.to_thread(detector.find_missing_pieces, ["Shock"])
+        assert not detector.attached
+
+    async def test_released_on_stop(self, attached: DatabaseManager) -> None:
+        await attached.stop()
+        assert isinstance(get_spellbook_detector(), SpellbookComboDetector)
+
+
+class TestSocketSecurity:
+    """Only this user can reach the daemon, and payloads cannot run code."""
+
+    async def test_socket_and_directory_private(self, settings: Settings) -> None:
+        card_daemon = CardDaemon(
+            settings, socket_path=settings.daemon_socket_path.parent / "run" / "daemon.sock"
+        )
+        await card_daemon.start()
+        try:
+            assert stat.S_IMODE(card_daemon.socket_path.stat().st_mode) == 0o600
+            assert stat.S_IMODE(card_daemon.socket_path.parent.stat().st_mode) == 0o700
+        finally:
+            await card_daemon.stop()
+
+    async def test_refuses_shared_directory(self, settings: Settings, tmp_path: Path) -> None:
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        os.chmod(shared, 0o777)
+        with pytest.raises(RuntimeError):
+            await CardDaemon(settings, socket_path=shared / "daemon.sock").start()
+
+    def test_decode_refuses_arbitrary_callables(self) -> None:
+        payload = pickle.dumps((os.getpid, ()))
+        with pytest.raises(ValueError):
+            decode(payload)
+
+    def test_models_and_rows_round_trip(self) -> None:
+        filters = SearchCardsInput(colors=["R"])
+        value = {("M19", "156"): (100, None), "filters": filters, "tags": frozenset({"a"})}
+        assert decode(encode(value)) == value
+
+    def test_unlisted_error_sent_as_runtime_error(self) -> None:
+        error = decode_error(encode_error(sqlite3.OperationalError("locked")))
+        assert type(error) is RuntimeError
+        assert str(error) == "OperationalError: locked"
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    for micros in (3, 3, 3, 900, 70_000):
+        histogram.record(micros / 1_000_000)
+    assert histogram.count == 5
+    assert histogram.percentile(0.5) == 4 / 1_000_000
+    assert histogram.percentile(0.8) == 1024 / 1_000_000
+    assert histogram.percentile(1.0) == 131_072 / 1_000_000
@@ -0,0 +1,107 @@
+"""Tests for build-time metadata and get_database_stats."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mtg_core.data.database import UnifiedDatabase, data_fingerprint, write_build_meta
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+CARDS = [
+    scryfall_card("Lightning Bolt", "lea"),
+    scryfall_card("Lightning Bolt", "m11"),
+    scryfall_card("Shock", "m19", "1"),
+    scryfall_card("Grizzly Bears", "m19", "2", keywords=["Trample", "Haste"]),
+    scryfall_card("Hill Giant", "m19", "3", keywords=["Trample"]),
+]
+
+
+def _add_set(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("INSERT INTO sets (code, name) VALUES ('lea', 'Alpha')")
+
+
+def _write_meta(cursor: sqlite3.Cursor) -> None:
+    write_build_meta(cursor, 2, "2025-01-10T09:00:00+00:00")
+
+
+def _legacy_meta(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("INSERT INTO meta VALUES ('created_at', '2024-06-01T12:00:00')")
+
+
+@pytest.fixture
+async def db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(build_card_db(CARDS, _add_set, _write_meta)) as database:
+        yield database
+
+
+@pytest.fixture
+async def legacy_db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    """A database whose meta table predates recorded counts."""
+    path = build_card_db(CARDS, _add_set, _legacy_meta, name="legacy.sqlite")
+    async with open_card_db(path) as database:
+        yield database
+
+
+class TestWriteBuildMeta:
+    """Tests for recording build metadata."""
+
+    def test_records_counts_and_version(self, build_card_db: CardDbBuilder) -> None:
+        path = build_card_db(CARDS, _add_set, _write_meta)
+        with sqlite3.connect(path) as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        conn.close()
+
+        assert meta["card_count"] == "5"
+        assert meta["unique_card_count"] == "4"
+        assert meta["keywords"] == '["Haste", "Trample"]'
+        assert meta["set_count"] == "1"
+        assert "oracle_card_count" not in meta  # oracle_cards not built here
+        assert meta["data_version"] == data_fingerprint(meta)
+
+    def test_fingerprint_changes_with_data(self) -> None:
+        meta = {"card_count": "3", "scryfall_updated_at": "2025-01-10"}
+        assert data_fingerprint(meta) == data_fingerprint({**meta, "data_version": "x"})
+        assert data_fingerprint(meta) != data_fingerprint({**meta, "card_count": "4"})
+
+
+class TestDatabaseStats:
+    """get_database_stats reads the recorded metadata."""
+
+    async def test_stats_from_meta(self, db: UnifiedDatabase) -> None:
+        stats = await db.get_database_stats()
+
+        assert stats["total_cards"] == 5
+        assert stats["unique_cards"] == 4
+        assert stats["total_sets"] == 1
+        assert stats["schema_version"] == "2"
+        assert stats["data_date"] == "2025-01-10"
+        assert stats["data_version"] == await db.get_data_version()
+
+    async def test_stats_read_meta_only(self, db: UnifiedDatabase) -> None:
+        await db.get_database_stats()
+        # Counts come from meta, so they don't track later changes to cards
+        await db._db.execute("DELETE FROM cards")
+        db._meta = None
+        assert (await db.get_database_stats())["total_cards"] == 5
+
+    async def test_legacy_database_counts_once(self, legacy_db: UnifiedDatabase) -> None:
+        stats = await legacy_db.get_database_stats()
+
+        assert (stats["total_cards"], stats["unique_cards"], stats["total_sets"]) == (5, 4, 1)
+        assert stats["data_date"] == "2024-06-01"
+        assert len(stats["data_version"]) == 16
+
+
+class TestKeywords:
+    """get_all_keywords uses the list recorded at build time."""
+
+    async def test_keywords_from_meta(self, db: UnifiedDatabase) -> None:
+        await db._db.execute("DELETE FROM cards")
+        assert await db.get_all_keywords() == {"Haste", "Trample"}
+
+    async def test_legacy_database_scans_cards(self, legacy_db: UnifiedDatabase) -> None:
+        assert await legacy_db.get_all_keywords() == {"Haste", "Trample"}
@@ -20,7 +20,7 @@ import pytest
 
 from mtg_core.config import Settings
 from mtg_core.data.database import UnifiedDatabase, create_database
-from mtg_core.data.database.cache import CacheEntry, CardCache
+from mtg_core.data.database.cache import CacheEntry, CardCache, estimate_size
 from mtg_core.data.database.constants import VALID_FORMATS
 from mtg_core.data.database.fts import (
     check_fts_available,
@@ -280,11 +280,63 @@ class TestCardCache:
         after = time.monotonic()
 
         # Access internal cache to check timestamp
-        async with cache._lock:
-            entry = cache._cache.get("key")
-            assert entry is not None
-            assert isinstance(entry, CacheEntry)
-            assert before <= entry.timestamp <= after
+        entry = cache._cache.get("key")
+        assert entry is not None
+        assert isinstance(entry, CacheEntry)
+        assert before <= entry.timestamp <= after
+
+    async def test_get_many_and_set_many(self, sample_card: Card) -> None:
+        """Batch operations return hits only and count hits and misses."""
+        cache = CardCache(max_size=10, ttl_seconds=3600)
+        cache.set_many({"bolt": sample_card, "other": Card(name="Other", uuid="uuid-2")})
+
+        found = cache.get_many(["bolt", "missing", "other"])
+
+        assert set(found) == {"bolt", "other"}
+        stats = await cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+    async def test_set_many_evicts_lru_once(self) -> None:
+        """A batch larger than the free space evicts the least recently used entries."""
+        cache = CardCache(max_size=3, ttl_seconds=3600)
+        cache.set_many((f"key{i}", Card(name=f"Card {i}", uuid=f"uuid-{i}")) for i in range(5))
+
+        assert list(cache._cache) == ["key2", "key3", "key4"]
+        assert cache.evictions == 2
+
+    async def test_byte_budget(self, sample_card: Card) -> None:
+        """Entries are evicted once their estimated size exceeds max_bytes."""
+        size = estimate_size(sample_card)
+        cache = CardCache(max_size=100, ttl_seconds=3600, max_bytes=size * 2)
+
+        for i in range(3):
+            cache.set_nowait(f"key{i}", sample_card)
+
+        stats = await cache.stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] == size * 2
+        assert cache.get_nowait("key0") is None
+
+    async def test_expiry_pops_oldest_writes(self) -> None:
+        """Expired entries are removed from the write-ordered front only."""
+        cache = CardCache(max_size=10, ttl_seconds=3600)
+        card = Card(name="Card", uuid="uuid")
+        cache.set_nowait("old", card)
+        cache.set_nowait("new", card)
+        cache._cache["old"].timestamp -= 7200
+        cache._writes["old"] -= 7200
+
+        assert await cache.cleanup_expired() == 1
+        assert list(cache._cache) == ["new"]
+        assert cache.expirations == 1
+
+    def test_estimate_size_grows_with_content(self) -> None:
+        """Longer text makes a larger estimate."""
+        short = Card(name="Card", uuid="uuid", text="Draw a card.")
+        long = Card(name="Card", uuid="uuid", text="Draw a card. " * 50)
+        assert estimate_size(long) - estimate_size(short) == len(long.text or "") - len(
+            short.text or ""
+        )
 
 
 class TestQueryBuilder:
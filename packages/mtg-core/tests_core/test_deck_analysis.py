@@ -0,0 +1,347 @@
+"""Tests for the incremental deck analyzer."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from mtg_core.data.models.card import Card
+from mtg_core.tools.deck_analysis import DeckAnalyzer, profile_card, text_rule
+from mtg_core.tools.recommendations.spellbook_combos import SpellbookCombo
+
+
+def _card(
+    name: str,
+    type_line: str,
+    *,
+    mana_cost: str | None = None,
+    cmc: float = 0,
+    text: str | None = None,
+    keywords: list[str] | None = None,
+    rarity: str = "common",
+) -> Card:
+    return Card(
+        name=name,
+        type=type_line,
+        manaCost=mana_cost,
+        manaValue=cmc,
+        text=text,
+        keywords=keywords or [],
+        rarity=rarity,
+    )
+
+
+CARDS = {
+    "Forest": _card("Forest", "Basic Land — Forest", text="{T}: Add {G}."),
+    "Llanowar Elves": _card(
+        "Llanowar Elves", "Creature — Elf Druid", mana_cost="{G}", cmc=1, text="{T}: Add {G}."
+    ),
+    "Lightning Bolt": _card(
+        "Lightning Bolt",
+        "Instant",
+        mana_cost="{R}",
+        cmc=1,
+        text="Lightning Bolt deals 3 damage to any target.",
+    ),
+    "Serra Angel": _card(
+        "Serra Angel",
+        "Creature — Angel",
+        mana_cost="{3}{W}{W}",
+        cmc=5,
+        text="Flying, vigilance",
+        keywords=["Flying", "Vigilance"],
+        rarity="uncommon",
+    ),
+    "Giant Spider": _card(
+        "Giant Spider",
+        "Creature — Spider",
+        mana_cost="{3}{G}",
+        cmc=4,
+        text="Reach",
+        keywords=["Reach"],
+    ),
+    "Blood Artist": _card(
+        "Blood Artist",
+        "Creature — Vampire",
+        mana_cost="{1}{B}",
+        cmc=2,
+        text="Whenever Blood Artist or another creature dies, target player loses 1 life.",
+        rarity="uncommon",
+    ),
+    "Viscera Seer": _card(
+        "Viscera Seer",
+        "Creature — Vampire Wizard",
+        mana_cost="{B}",
+        cmc=1,
+        text="Sacrifice a creature: Scry 1.",
+    ),
+    "Emrakul": _card(
+        "Emrakul",
+        "Legendary Creature — Eldrazi",
+        mana_cost="{15}",
+        cmc=15,
+        text="Flying, protection from spells",
+        keywords=["Flying"],
+        rarity="mythic",
+    ),
+}
+
+
+@dataclass
+class Row:
+    card_name: str
+    quantity: int
+    card: Card | None
+
+
+class FakeDetector:
+    """Combo detector exposing just the posting-list API."""
+
+    def __init__(self, combos: list[SpellbookCombo]) -> None:
+        self._combos = {c.id: c for c in combos}
+        self.posting_calls = 0
+
+    def combo_ids_for_card(self, card_name: str) -> frozenset[str]:
+        self.posting_calls += 1
+        return frozenset(
+            c.id
+            for c in self._combos.values()
+            if card_name.lower() in {n.lower() for n in c.card_names}
+        )
+
+    def get_combo(self, combo_id: str) -> SpellbookCombo | None:
+        return self._combos.get(combo_id)
+
+    def get_combo_score(self, combo: SpellbookCombo) -> float:
+        return float(combo.popularity)
+
+
+def _combo(combo_id: str, *cards: str, popularity: int = 1) -> SpellbookCombo:
+    return SpellbookCombo(
+        id=combo_id,
+        card_names=list(cards),
+        description="",
+        bracket_tag="C",
+        popularity=popularity,
+        identity="",
+        produces=[],
+    )
+
+
+def _aggregates(a: DeckAnalyzer) -> dict[str, object]:
+    return {
+        "count": a.card_count,
+        "lands": a.land_count,
+        "avg": round(a.avg_cmc, 6),
+        "curve": a.curve,
+        "pips": a.pips,
+        "types": a.primary_types,
+        "creatures": a.type_count("Creature"),
+        "keywords": a.keywords,
+        "themes": a.dominant_themes(limit=20, min_count=1),
+        "interaction": a.flag_count("interaction"),
+        "draw": a.flag_count("draw"),
+        "ramp": a.flag_count("ramp"),
+        "owned": (a.owned_count, a.needed_count),
+        "price": round(a.total_price, 6),
+        "pairs": {frozenset(p[:2]) for p in a.synergy_pairs(limit=1000)},
+        "combos": sorted(m.combo.id for m in a.combos(limit=1000)),
+    }
+
+
+class TestProfile:
+    """Tests for per-card profiles."""
+
+    def test_land_profile(self) -> None:
+        p = profile_card("Forest", CARDS["Forest"])
+        assert p.is_land
+        assert p.curve_bucket is None
+        assert p.primary_type == "Land"
+        assert "ramp" in p.flags
+
+    def test_spell_profile(self) -> None:
+        p = profile_card("Emrakul", CARDS["Emrakul"])
+        assert p.curve_bucket == 7
+        assert p.tribes == ("Eldrazi",)
+        assert p.keywords == ("Flying",)
+        assert any(reason.startswith("Flying:") for _, reason in p.synergy_terms)
+
+    def test_unknown_card(self) -> None:
+        p = profile_card("Mystery", None)
+        assert not p.known
+        assert p.curve_bucket is None
+
+    def test_text_rule(self) -> None:
+        rule = text_rule("draw a card", patterns=[r"deals\s+\d+\s+damage"], nonland_only=True)
+        assert rule(CARDS["Lightning Bolt"])
+        assert not rule(CARDS["Forest"])
+
+
+class TestDeckAnalyzer:
+    """Tests for incremental aggregates."""
+
+    def test_counts(self) -> None:
+        a = DeckAnalyzer()
+        a.add("Forest", 10, CARDS["Forest"])
+        a.add("Lightning Bolt", 4, CARDS["Lightning Bolt"])
+        a.add("Serra Angel", 2, CARDS["Serra Angel"])
+
+        assert a.card_count == 16
+        assert a.land_count == 10
+        assert a.curve == {1: 4, 5: 2}
+        assert a.avg_cmc == pytest.approx((4 * 1 + 2 * 5) / 6)
+        assert a.pips == {"R": 4, "W": 4}
+        assert a.primary_types == {"Land": 10, "Instant": 4, "Creature": 2}
+        assert a.keywords == {"Flying": 2, "Vigilance": 2}
+
+        a.remove("Serra Angel")
+        assert a.card_count == 14
+        assert "Flying" not in a.keywords
+        assert a.curve == {1: 4}
+
+    def test_unknown_cards_only_count(self) -> None:
+        a = DeckAnalyzer()
+        a.add("Mystery", 3)
+        assert a.card_count == 3
+        assert a.spell_count == 0
+        assert a.needed_count == 0
+
+    def test_incremental_matches_full_load(self) -> None:
+        """Random edits end in the same state as loading the final deck."""
+        detector = FakeDetector(
+            [
+                _combo("c1", "Blood Artist", "Viscera Seer", popularity=10),
+                _combo("c2", "Blood Artist", "Viscera Seer", "Emrakul", popularity=5),
+                _combo("c3", "Lightning Bolt", "Serra Angel", "Forest", "Emrakul"),
+            ]
+        )
+        prices = {"Emrakul": 30.0, "Serra Angel": 0.25, "Lightning Bolt": 1.5}
+        owned = {"Forest", "Lightning Bolt"}
+        rng = random.Random(7)
+        names = list(CARDS)
+
+        incremental = DeckAnalyzer(combo_detector=detector)  # type: ignore[arg-type]
+        incremental.set_prices(prices)
+        incremental.set_owned(owned)
+        for _ in range(300):
+            name = rng.choice(names)
+            incremental.set_quantity(name, rng.randint(0, 4), CARDS[name])
+
+        full = DeckAnalyzer(combo_detector=detector)  # type: ignore[arg-type]
+        full.set_prices(prices)
+        full.set_owned(owned)
+        full.sync(Row(n, q, CARDS[n]) for n, q in incremental.quantities.items())
+
+        assert _aggregates(incremental) == _aggregates(full)
+
+    def test_sync_applies_only_differences(self) -> None:
+        a = DeckAnalyzer()
+        deck = [Row(n, 2, c) for n, c in CARDS.items()]
+        a.sync(deck)
+        notified: list[int] = []
+        a.subscribe(lambda an: notified.append(an.card_count))
+
+        a.sync(deck)
+        assert notified == []
+
+        deck[0] = Row("Forest", 5, CARDS["Forest"])
+        a.sync(deck[:-1])
+        assert notified == [a.card_count]
+        assert a.quantities["Forest"] == 5
+        assert "Emrakul" not in a.quantities
+
+    def test_sync_merges_duplicate_rows(self) -> None:
+        a = DeckAnalyzer()
+        a.sync([Row("Forest", 1, CARDS["Forest"]) for _ in range(12)])
+        assert a.land_count == 12
+
+    def test_batch_notifies_once(self) -> None:
+        a = DeckAnalyzer()
+        notified: list[int] = []
+        unsubscribe = a.subscribe(lambda an: notified.append(an.card_count))
+        with a.batch():
+            a.add("Forest", 1, CARDS["Forest"])
+            a.add("Lightning Bolt", 1, CARDS["Lightning Bolt"])
+        assert notified == [2]
+
+        unsubscribe()
+        a.add("Forest")
+        assert notified == [2]
+
+    def test_synergy_pairs_follow_edits(self) -> None:
+        a = DeckAnalyzer()
+        a.add("Serra Angel", 1, CARDS["Serra Angel"])
+        a.add("Giant Spider", 1, CARDS["Giant Spider"])
+        pairs = a.synergy_pairs()
+        assert len(pairs) == 1
+        assert {pairs[0][0], pairs[0][1]} == {"Serra Angel", "Giant Spider"}
+
+        a.remove("Giant Spider")
+        assert a.synergy_pairs() == []
+
+    def test_combo_posting_lists_are_cached(self) -> None:
+        detector = FakeDetector([_combo("c1", "Blood Artist", "Viscera Seer")])
+        a = DeckAnalyzer(combo_detector=detector)  # type: ignore[arg-type]
+
+        a.add("Blood Artist", 1, CARDS["Blood Artist"])
+        combos = a.combos()
+        assert [m.missing_cards for m in combos] == [["Viscera Seer"]]
+
+        a.add("Viscera Seer", 1, CARDS["Viscera Seer"])
+        assert a.combos()[0].is_complete
+
+        a.set_quantity("Blood Artist", 0)
+        a.add("Blood Artist", 1, CARDS["Blood Artist"])
+        assert detector.posting_calls == 2
+
+    def test_commander_counts_for_combos(self) -> None:
+        detector = FakeDetector([_combo("c1", "Blood Artist", "Viscera Seer")])
+        a = DeckAnalyzer(combo_detector=detector)  # type: ignore[arg-type]
+        a.set_commander("Viscera Seer")
+        a.add("Blood Artist", 1, CARDS["Blood Artist"])
+        assert a.combos()[0].is_complete
+        assert a.card_count == 1
+
+    def test_prices_and_ownership(self) -> None:
+        a = DeckAnalyzer()
+        a.add("Emrakul", 1, CARDS["Emrakul"])
+        a.add("Lightning Bolt", 4, CARDS["Lightning Bolt"])
+        a.set_prices({"Emrakul": 30.0, "Lightning Bolt": 1.5})
+        a.set_owned({"Lightning Bolt"})
+
+        assert a.total_price == pytest.approx(36.0)
+        assert a.expensive_cards(1) == [("Emrakul", 30.0)]
+        assert (a.owned_count, a.needed_count) == (4, 1)
+
+        a.remove("Lightning Bolt", 2)
+        assert a.total_price == pytest.approx(33.0)
+        assert (a.owned_count, a.needed_count) == (2, 1)
+
+    def test_limited_stats_looked_up_once(self) -> None:
+        @dataclass
+        class Stats:
+            tier: str
+            gih_wr: float
+
+        class FakeLimited:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def get_card_stats(self, card_name: str) -> Stats | None:
+                self.calls += 1
+                return Stats("A", 0.6) if card_name == "Lightning Bolt" else None
+
+            def get_synergy_pairs(self, card_name: str) -> list[object]:  # noqa: ARG002
+                return []
+
+        limited = FakeLimited()
+        a = DeckAnalyzer(limited_stats=limited)
+        a.add("Lightning Bolt", 2, CARDS["Lightning Bolt"])
+        a.add("Lightning Bolt", 1)
+        a.add("Forest", 1, CARDS["Forest"])
+
+        assert a.tier_counts == {"A": 3}
+        assert a.top_tier_cards() == [("Lightning Bolt", "A", 0.6)]
+        assert limited.calls == 2
@@ -0,0 +1,128 @@
+"""Tests for collection-based deck suggestions."""
+
+from __future__ import annotations
+
+from mtg_core.tools.recommendations.deck_finder import (
+    CardData,
+    DeckFinder,
+    EncodedCollection,
+    rank_suggestions,
+)
+
+
+def _creature(name: str, colors: list[str] | None = None, text: str = "") -> CardData:
+    return CardData(
+        name=name, type_line="Creature — Elf", colors=colors, color_identity=colors, text=text
+    )
+
+
+def _collection() -> list[CardData]:
+    return [
+        CardData(
+            name="Ezuri, Renegade Leader",
+            type_line="Legendary Creature — Elf Warrior",
+            color_identity=["G"],
+            text="Whenever another Elf enters, create a token.",
+        ),
+        *[_creature(f"Elf {i}", ["G"]) for i in range(12)],
+        _creature("Token Maker", ["G"], "Create two 1/1 green Elf creature tokens."),
+        _creature("Blue Elf", ["U"]),
+        CardData(name="Sol Ring", type_line="Artifact", text="{T}: Add {C}{C}."),
+        CardData(name="Forest", type_line="Basic Land — Forest"),
+        CardData(name="Island", type_line="Basic Land — Island", color_identity=["U"]),
+    ]
+
+
+class TestEncodedCollection:
+    """Tests for the array encoding of a collection."""
+
+    def test_fits_identity(self) -> None:
+        cards = _collection()
+        encoded = EncodedCollection.from_cards(cards)
+
+        fits = encoded.fits_identity(["G"])
+        names = {card.name for card, fit in zip(cards, fits, strict=True) if fit}
+        assert "Sol Ring" in names  # Colorless fits any identity
+        assert "Forest" in names
+        assert "Blue Elf" not in names
+        assert "Island" not in names
+        assert encoded.fits_identity([]).all()
+
+    def test_scores_archetype_and_commander_themes(self) -> None:
+        cards = _collection()
+        encoded = EncodedCollection.from_cards(cards)
+        commander = cards[0]
+        plain = cards.index(_creature("Elf 0", ["G"]))
+        maker = [card.name for card in cards].index("Token Maker")
+
+        base = encoded.scores(None, None)
+        assert base[plain] == 13  # 1 + 0.3 for a creature, in tenths
+
+        scores = encoded.scores("Tokens", commander)
+        assert scores[plain] == base[plain]
+        # Names the archetype (+2) and shares "create" and "token" with the commander (+1.5 each)
+        assert scores[maker] == base[maker] + 20 + 15 + 15
+
+
+class TestFindCommanderDecks:
+    """Tests for DeckFinder.find_commander_decks."""
+
+    def test_builds_deck_within_commander_identity(self) -> None:
+        suggestions = DeckFinder().iter_commander_decks(_collection())
+
+        ezuri = next(s for s in suggestions if s.name == "Ezuri, Renegade Leader Commander")
+        assert ezuri.key_cards_owned[0] == "Forest"
+        assert "Token Maker" in ezuri.key_cards_owned
+        assert "Sol Ring" in ezuri.key_cards_owned
+        assert "Blue Elf" not in ezuri.key_cards_owned
+        assert "Ezuri, Renegade Leader" not in ezuri.key_cards_owned
+        assert ezuri.key_cards_missing == ["Forest"] * 34
+        assert "15 cards in these colors" in ezuri.reasons
+
+    def test_best_cards_first_within_type_maximum(self) -> None:
+        commander = CardData(
+            name="Krenko", type_line="Legendary Creature — Goblin", color_identity=["R"]
+        )
+        # Duplicate names use up candidates without taking creature slots
+        copies = [_creature("Goblin Bombardment", ["R"], "Destroy target creature.")] * 50
+        creatures = [_creature(f"Goblin {i}", ["R"]) for i in range(60)]
+        spells = [
+            CardData(name=f"Shock {i}", type_line="Instant", color_identity=["R"]) for i in range(5)
+        ]
+
+        suggestions = DeckFinder().find_commander_decks(
+            set(), [commander, *copies, *creatures, *spells]
+        )
+
+        deck = suggestions[0].key_cards_owned
+        assert deck[0] == "Goblin Bombardment"  # Highest score
+        assert deck[1:35] == [f"Goblin {i}" for i in range(34)]  # Ties in collection order
+        assert deck[35:] == [f"Shock {i}" for i in range(5)]
+
+    def test_skips_commanders_with_few_cards(self) -> None:
+        cards = [
+            CardData(name="Lonely Legend", type_line="Legendary Creature — Human"),
+            *[_creature(f"Elf {i}") for i in range(5)],
+        ]
+        assert DeckFinder().find_commander_decks(set(), cards) == []
+
+    def test_iter_matches_ranked_results(self) -> None:
+        finder = DeckFinder()
+        cards = _collection()
+
+        streamed = list(finder.iter_commander_decks(cards))
+
+        assert rank_suggestions(streamed, 10) == finder.find_commander_decks(set(), cards)
+
+
+class TestFindStandardDecks:
+    """Tests for DeckFinder.find_standard_decks."""
+
+    def test_mono_color_deck(self) -> None:
+        cards = [_creature(f"Elf {i}", ["G"]) for i in range(25)]
+
+        suggestions = DeckFinder().find_standard_decks(set(), cards)
+
+        assert [s.name for s in suggestions] == ["Mono-Green Stompy"]
+        assert suggestions[0].key_cards_owned == [f"Elf {i}" for i in range(25)]
+        assert suggestions[0].key_cards_missing == ["Forest"] * 22
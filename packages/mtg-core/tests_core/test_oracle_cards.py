@@ -0,0 +1,137 @@
+"""Tests for the canonical one-row-per-card oracle_cards table."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mtg_core.data.database import UnifiedDatabase, build_oracle_cards
+from mtg_core.data.models import SearchCardsInput
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+_LEGAL = {"legalities": {"modern": "legal", "commander": "legal"}}
+_FIVE_COLOR = ["W", "U", "B", "R", "G"]
+
+CARDS = [
+    scryfall_card(
+        "Lightning Bolt", "lea", released_at="1993-08-05", prices={"usd": "450.00"}, **_LEGAL
+    ),
+    scryfall_card(
+        "Lightning Bolt", "m11", released_at="2010-07-16", prices={"usd": "2.50"}, **_LEGAL
+    ),
+    # Newer, but a promo: not the canonical printing
+    scryfall_card(
+        "Lightning Bolt",
+        "plst",
+        released_at="2023-01-01",
+        prices={"usd": "1.00"},
+        promo=True,
+        **_LEGAL,
+    ),
+    scryfall_card("Shock", "m19", released_at="2018-07-13", prices={"usd": "0.10"}, **_LEGAL),
+    # Only exists as a digital printing, so it stays filtered out
+    scryfall_card(
+        "Lightning Helix Online", "prm", released_at="2015-01-01", digital=True, **_LEGAL
+    ),
+    scryfall_card(
+        "Jodah, the Unifier", "dmu", released_at="2022-09-09", colors=_FIVE_COLOR, **_LEGAL
+    ),
+    scryfall_card(
+        "Jodah, the Unifier",
+        "sld",
+        released_at="2023-05-01",
+        colors=_FIVE_COLOR,
+        flavor_name="SpongeBob SquarePants",
+        **_LEGAL,
+    ),
+]
+
+
+@pytest.fixture
+async def db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(build_card_db(CARDS, build_oracle_cards)) as database:
+        yield database
+
+
+@pytest.fixture
+async def legacy_db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    """A database built before oracle_cards existed."""
+    async with open_card_db(build_card_db(CARDS, name="legacy.sqlite")) as database:
+        yield database
+
+
+class TestBuildOracleCards:
+    """Tests for materializing oracle_cards."""
+
+    def test_one_row_per_name(self, build_card_db: CardDbBuilder) -> None:
+        path = build_card_db(CARDS)
+        with sqlite3.connect(path) as conn:
+            assert build_oracle_cards(conn.cursor()) == 4
+            # Rebuilding replaces the table
+            assert build_oracle_cards(conn.cursor()) == 4
+        conn.close()
+
+    def test_aggregates_over_printings(self, build_card_db: CardDbBuilder) -> None:
+        path = build_card_db(CARDS, build_oracle_cards)
+        with sqlite3.connect(path) as conn:
+            row = conn.execute(
+                "SELECT set_code, printing_count, min_price_usd FROM oracle_cards"
+                " WHERE name = 'Lightning Bolt'"
+            ).fetchone()
+        conn.close()
+        assert row == ("m11", 3, 100)
+
+
+class TestOracleQueries:
+    """Name-level lookups read oracle_cards and match the per-printing fallback."""
+
+    async def test_has_oracle_cards(self, db: UnifiedDatabase, legacy_db: UnifiedDatabase) -> None:
+        assert await db.has_oracle_cards()
+        assert not await legacy_db.has_oracle_cards()
+
+    async def test_card_by_name_is_canonical_printing(self, db: UnifiedDatabase) -> None:
+        card = await db.get_card_by_name("lightning bolt")
+        assert card.set_code == "m11"
+        assert card.uuid == "m11-1"
+
+    async def test_cards_by_names(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_cards_by_names(["Lightning Bolt", "Shock", "Lightning Helix Online"])
+        assert {name: card.set_code for name, card in cards.items()} == {
+            "lightning bolt": "m11",
+            "shock": "m19",
+        }
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            SearchCardsInput(colors=["R"], sort_by="name"),
+            SearchCardsInput(name="bolt"),
+            SearchCardsInput(name="spongebob"),
+            SearchCardsInput(set_code="lea"),
+            SearchCardsInput(type="Instant", sort_by="name", page_size=2, page=2),
+        ],
+    )
+    async def test_search_matches_fallback(
+        self, db: UnifiedDatabase, legacy_db: UnifiedDatabase, filters: SearchCardsInput
+    ) -> None:
+        cards, total = await db.search_cards(filters)
+        legacy_cards, legacy_total = await legacy_db.search_cards(filters)
+
+        assert total == legacy_total
+        assert [c.name for c in cards] == [c.name for c in legacy_cards]
+
+    async def test_flavor_name_search(self, db: UnifiedDatabase) -> None:
+        cards, total = await db.search_cards(SearchCardsInput(name="SpongeBob"))
+        rows, row_total = await db.search_card_rows(SearchCardsInput(name="SpongeBob"))
+
+        assert total == row_total == 1
+        assert cards[0].name == rows[0].name == "Jodah, the Unifier"
+        assert cards[0].flavor_name == rows[0].flavor_name == "SpongeBob SquarePants"
+
+    async def test_printing_filters_search_printings(self, db: UnifiedDatabase) -> None:
+        cards, total = await db.search_cards(SearchCardsInput(set_code="lea"))
+        assert total == 1
+        assert cards[0].set_code == "lea"
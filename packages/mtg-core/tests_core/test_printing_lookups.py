@@ -0,0 +1,112 @@
+"""Tests for bulk printing lookups by (set_code, collector_number) and by uuid."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mtg_core.data.database import UnifiedDatabase
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+_LEGALITIES = {"legalities": {"modern": "legal", "standard": "not_legal"}}
+
+CARDS = [
+    scryfall_card(
+        "Lightning Bolt", "m11", "149", prices={"usd": "2.50", "usd_foil": "9.99"}, **_LEGALITIES
+    ),
+    scryfall_card("Shock", "m19", "156", prices={"usd": "0.10", "usd_foil": "9.99"}, **_LEGALITIES),
+    scryfall_card("Opt", "fin", "12", prices={"usd": "0.05", "usd_foil": "9.99"}, **_LEGALITIES),
+    scryfall_card(
+        "Treasure", "tfin", "0012", prices={"usd": None, "usd_foil": "9.99"}, **_LEGALITIES
+    ),
+]
+
+
+def _add_rulings(cursor: sqlite3.Cursor) -> None:
+    cursor.executemany(
+        "INSERT INTO rulings (oracle_id, published_at, comment) VALUES (?, ?, ?)",
+        [
+            ("oracle-Lightning Bolt", "2004-10-04", "Older ruling."),
+            ("oracle-Lightning Bolt", "2020-06-23", "Newer ruling."),
+            ("oracle-Shock", "2018-07-13", "Shock ruling."),
+        ],
+    )
+
+
+@pytest.fixture
+async def db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(build_card_db(CARDS, _add_rulings)) as database:
+        yield database
+
+
+class TestBulkPrintingLookups:
+    """Bulk lookups key results by the printing as requested."""
+
+    async def test_prices(self, db: UnifiedDatabase) -> None:
+        prices = await db.get_prices_by_set_and_numbers(
+            [("M11", "149"), ("m19", "156"), ("M11", "149"), ("XXX", "1")]
+        )
+        assert prices == {("M11", "149"): (250, 999), ("M19", "156"): (10, 999)}
+
+    async def test_leading_zeros(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_cards_by_set_and_numbers(
+            [("FIN", "0012"), ("tfin", "0012"), ("tfin", "12")]
+        )
+        assert {key: card.name for key, card in cards.items()} == {
+            ("FIN", "0012"): "Opt",
+            ("TFIN", "0012"): "Treasure",
+        }
+
+    async def test_printing_rows(self, db: UnifiedDatabase) -> None:
+        rows = await db.get_printing_rows_by_set_and_numbers([("m11", "149")])
+        row = rows[("M11", "149")]
+        assert (row.name, row.set_name, row.number) == ("Lightning Bolt", "Set M11", "149")
+
+    async def test_many_keys(self, db: UnifiedDatabase) -> None:
+        # No SQL variable limit: thousands of keys go in one statement
+        keys = [("m19", str(n)) for n in range(5000)]
+        prices = await db.get_prices_by_set_and_numbers(keys)
+        assert list(prices) == [("M19", "156")]
+
+    async def test_empty(self, db: UnifiedDatabase) -> None:
+        assert await db.get_cards_by_set_and_numbers([]) == {}
+
+
+class TestBulkUuidLookups:
+    """get_cards_by_uuids fetches many printings and their extras in a batch."""
+
+    async def test_cards_with_extras(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_cards_by_uuids(["m11-149", "m19-156", "missing"])
+
+        assert set(cards) == {"m11-149", "m19-156"}
+        bolt = cards["m11-149"]
+        assert bolt.name == "Lightning Bolt"
+        assert [(entry.format, entry.legality) for entry in bolt.legalities or []] == [
+            ("modern", "legal"),
+            ("standard", "not_legal"),
+        ]
+        assert [r.text for r in bolt.rulings or []] == ["Newer ruling.", "Older ruling."]
+        assert [r.text for r in cards["m19-156"].rulings or []] == ["Shock ruling."]
+
+    async def test_without_extras(self, db: UnifiedDatabase) -> None:
+        cards = await db.get_cards_by_uuids(["fin-12"], include_extras=False)
+        assert cards["fin-12"].legalities is None
+        assert cards["fin-12"].rulings is None
+
+    async def test_cached(self, db: UnifiedDatabase) -> None:
+        first = await db.get_cards_by_uuids(["m11-149"])
+        again = await db.get_cards_by_uuids(["m11-149", "m19-156"])
+
+        assert again["m11-149"] is first["m11-149"]
+        assert await db.get_card_by_uuid("m19-156") is again["m19-156"]
+
+    async def test_matches_single_lookup(self, db: UnifiedDatabase) -> None:
+        card = await db.get_card_by_uuid("m11-149")
+        assert card.rulings == await db._get_rulings("oracle-Lightning Bolt")
+        assert card.legalities == await db._get_legalities("m11-149")
+
+    async def test_empty(self, db: UnifiedDatabase) -> None:
+        assert await db.get_cards_by_uuids([]) == {}
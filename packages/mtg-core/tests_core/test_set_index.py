@@ -0,0 +1,115 @@
+"""Tests for the set_cards/set_stats set contents index."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mtg_core.data.database import UnifiedDatabase, build_set_index
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+
+def _prices(usd: str, usd_foil: str | None = None) -> dict[str, str | None]:
+    return {"usd": usd, "usd_foil": usd_foil}
+
+
+CARDS = [
+    scryfall_card("Shock", "m19", "10", prices=_prices("0.10")),
+    scryfall_card("Lightning Bolt", "m19", "2", rarity="uncommon", prices=_prices("2.50", "9.00")),
+    scryfall_card(
+        "Serra Angel",
+        "m19",
+        "1a",
+        rarity="rare",
+        type_line="Creature — Angel",
+        cmc=5.0,
+        colors=["W"],
+        keywords=["Flying", "Vigilance"],
+        prices=_prices("0.40"),
+    ),
+    scryfall_card(
+        "Mountain",
+        "m19",
+        "1",
+        type_line="Basic Land — Mountain",
+        cmc=0.0,
+        colors=[],
+        prices=_prices("0.05"),
+    ),
+    scryfall_card("Shock", "m19", "★1", rarity="mythic", prices=_prices("5.00")),
+    scryfall_card("Sol Ring", "c21", "3", type_line="Artifact", colors=[], prices=_prices("1.00")),
+]
+
+
+@pytest.fixture
+async def db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(build_card_db(CARDS, build_set_index)) as database:
+        yield database
+
+
+@pytest.fixture
+async def legacy_db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    """A database built before the set index existed."""
+    async with open_card_db(build_card_db(CARDS, name="legacy.sqlite")) as database:
+        yield database
+
+
+async def _numbers(db: UnifiedDatabase, code: str, batch_size: int) -> list[list[str | None]]:
+    return [[row.number for row in rows] async for rows in db.get_set_cards(code, batch_size)]
+
+
+class TestBuildSetIndex:
+    """Tests for building set_cards and set_stats."""
+
+    def test_one_stats_row_per_set(self, build_card_db: CardDbBuilder) -> None:
+        path = build_card_db(CARDS)
+        with sqlite3.connect(path) as conn:
+            assert build_set_index(conn.cursor()) == 2
+            # Rebuilding replaces the tables
+            assert build_set_index(conn.cursor()) == 2
+            assert conn.execute("SELECT COUNT(*) FROM set_cards").fetchone() == (len(CARDS),)
+        conn.close()
+
+
+class TestSetQueries:
+    """Set cards and stats read the index and match the per-set fallback."""
+
+    async def test_has_set_index(self, db: UnifiedDatabase, legacy_db: UnifiedDatabase) -> None:
+        assert await db.has_set_index()
+        assert not await legacy_db.has_set_index()
+
+    async def test_cards_in_collector_number_order(
+        self, db: UnifiedDatabase, legacy_db: UnifiedDatabase
+    ) -> None:
+        expected = [["★1", "1"], ["1a", "2"], ["10"]]
+        assert await _numbers(db, "M19", batch_size=2) == expected
+        assert await _numbers(legacy_db, "M19", batch_size=2) == expected
+        assert await _numbers(db, "m19", batch_size=5) == [["★1", "1", "1a", "2", "10"]]
+
+    async def test_unknown_set(self, db: UnifiedDatabase) -> None:
+        assert await _numbers(db, "xxx", batch_size=2) == []
+        stats = await db.get_set_stats("xxx")
+        assert stats.total_cards == 0
+
+    async def test_stats(self, db: UnifiedDatabase) -> None:
+        stats = await db.get_set_stats("M19")
+        assert stats.set_code == "M19"
+        assert stats.total_cards == 5
+        assert stats.unique_cards == 4
+        assert stats.rarity_distribution == {"common": 2, "uncommon": 1, "rare": 1, "mythic": 1}
+        assert stats.type_distribution == {"Instant": 3, "Creature": 1, "Land": 1}
+        assert stats.color_distribution == {"R": 3, "W": 1, "C": 1}
+        assert stats.mechanics == ["Flying", "Vigilance"]
+        assert stats.avg_cmc == pytest.approx(2.0)  # (1 + 1 + 5 + 1) / 4, Mountain excluded
+        assert stats.total_value_usd == pytest.approx(8.05)
+        # Foil price where there is one, else the regular price
+        assert stats.total_value_usd_foil == pytest.approx(14.55)
+
+    async def test_stats_match_fallback(
+        self, db: UnifiedDatabase, legacy_db: UnifiedDatabase
+    ) -> None:
+        for code in ("m19", "C21"):
+            assert await db.get_set_stats(code) == await legacy_db.get_set_stats(code)
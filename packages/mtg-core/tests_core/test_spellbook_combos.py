@@ -0,0 +1,115 @@
+"""Tests for Commander Spellbook combo detection, single deck and bulk."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from mtg_core.tools.recommendations.spellbook_combos import (
+    SpellbookComboDetector,
+    SpellbookComboMatch,
+)
+
+COMBOS = [
+    # id, cards, bracket, popularity
+    ("twin", ["Splinter Twin", "Deceiver Exarch"], "R", 900),
+    ("oracle", ["Thassa's Oracle", "Demonic Consultation"], "R", 800),
+    ("kiki", ["Kiki-Jiki, Mirror Breaker", "Zealous Conscripts"], "S", 500),
+    ("triple", ["Basalt Monolith", "Rings of Brighthearth", "Power Artifact"], "C", 100),
+]
+
+
+@pytest.fixture
+def detector(tmp_path: Path) -> SpellbookComboDetector:
+    path = tmp_path / "combos.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE combos (id TEXT PRIMARY KEY, card_names TEXT, description TEXT,"
+            " bracket_tag TEXT, popularity INTEGER, identity TEXT, produces TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO combos VALUES (?, ?, '', ?, ?, '', '[]')",
+            [(cid, json.dumps(cards), bracket, pop) for cid, cards, bracket, pop in COMBOS],
+        )
+    conn.close()
+    detector = SpellbookComboDetector(db_path=path)
+    assert detector.initialize()
+    return detector
+
+
+DECKS = [
+    ["Splinter Twin", "deceiver exarch", "Thassa's Oracle"],
+    ["Basalt Monolith"],
+    ["Basalt Monolith", "Rings of Brighthearth", "Kiki-Jiki, Mirror Breaker"],
+    [],
+    ["Island"],
+]
+
+
+def _summary(
+    result: tuple[list[SpellbookComboMatch], dict[str, list[str]]],
+) -> tuple[list[tuple[str, list[str]]], dict[str, list[str]]]:
+    matches, missing_to_combos = result
+    return [(m.combo.id, m.missing_cards) for m in matches], missing_to_combos
+
+
+class TestFindMissingPiecesBulk:
+    """find_missing_pieces_bulk returns the single-deck result for every deck."""
+
+    def test_per_deck_results(self, detector: SpellbookComboDetector) -> None:
+        results = detector.find_missing_pieces_bulk(DECKS, max_missing=2)
+
+        assert [_summary(r) for r in results] == [
+            (
+                [("twin", []), ("oracle", ["Demonic Consultation"])],
+                {"demonic consultation": ["oracle"]},
+            ),
+            (
+                [("triple", ["Rings of Brighthearth", "Power Artifact"])],
+                {"rings of brighthearth": ["triple"], "power artifact": ["triple"]},
+            ),
+            (
+                [("kiki", ["Zealous Conscripts"]), ("triple", ["Power Artifact"])],
+                {"zealous conscripts": ["kiki"], "power artifact": ["triple"]},
+            ),
+            ([], {}),
+            ([], {}),
+        ]
+
+    def test_filters(self, detector: SpellbookComboDetector) -> None:
+        results = detector.find_missing_pieces_bulk(
+            DECKS, max_missing=1, bracket_filter="R", min_present=1
+        )
+        assert [[m.combo.id for m in matches] for matches, _ in results] == [
+            ["twin", "oracle"],
+            [],
+            [],
+            [],
+            [],
+        ]
+
+    def test_single_deck_and_find_combos(self, detector: SpellbookComboDetector) -> None:
+        matches, _ = detector.find_missing_pieces(DECKS[2], max_missing=1)
+        assert [m.combo.id for m in matches] == ["kiki", "triple"]
+
+        assert [[m.combo.id for m in deck] for deck in detector.find_combos_bulk(DECKS)] == [
+            ["twin"],
+            [],
+            [],
+            [],
+            [],
+        ]
+        assert [m.combo.id for m in detector.find_combos(DECKS[0])] == ["twin"]
+
+    async def test_async_runs_in_thread(self, detector: SpellbookComboDetector) -> None:
+        results = await detector.find_missing_pieces_bulk_async(DECKS)
+        assert [_summary(r) for r in results] == [
+            _summary(r) for r in detector.find_missing_pieces_bulk(DECKS)
+        ]
+
+    def test_unavailable_database(self, tmp_path: Path) -> None:
+        detector = SpellbookComboDetector(db_path=tmp_path / "missing.sqlite")
+        assert detector.find_missing_pieces_bulk(DECKS) == [([], {})] * len(DECKS)
@@ -0,0 +1,148 @@
+"""Regression tests for the ingest-time synergy term index.
+
+Each scenario runs find_synergies against the same cards twice: on a database
+without card_synergy_terms (the per-term LIKE search it replaces) and on one
+with it. The indexed results must keep every legacy match and add the ones the
+literal LIKE search missed (regex terms, card-name terms).
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from mtg_core.data.database import UnifiedDatabase, build_oracle_cards
+from mtg_core.data.models.inputs import SearchCardsInput
+from mtg_core.tools.synergy import find_synergies
+from mtg_core.tools.synergy.index import build_synergy_terms, compile_term, rule_patterns
+
+from .conftest import CardDbBuilder, open_card_db, scryfall_card
+
+
+def _card(name: str, type_line: str, text: str, **overrides: Any) -> dict[str, Any]:
+    """A colorless card whose collector number is its name."""
+    fields = {"colors": [], "mana_cost": None, "type_line": type_line, "oracle_text": text}
+    return scryfall_card(name, "tst", name, **{**fields, **overrides})
+
+
+CARDS = [
+    # Sources
+    _card("Sky Knight", "Creature — Angel", "Flying, vigilance", keywords=["Flying"]),
+    _card(
+        "Squad Leader",
+        "Creature — Kithkin",
+        "When this creature enters the battlefield, create a 1/1 white Soldier creature token.",
+    ),
+    _card("Mana Rock", "Artifact", "{T}: Add {C}{C}."),
+    # Literal terms: found by both
+    _card("Giant Spider", "Creature — Spider", "Reach", keywords=["Reach"]),
+    _card(
+        "Rootborn Defenses",
+        "Instant",
+        "Populate. Creatures you control gain indestructible until end of turn.",
+        edhrec_rank=500,
+    ),
+    _card("Frogmite", "Artifact Creature — Frog", "Affinity for artifacts"),
+    # Regex terms: missed by LIKE '%can block.*flying%'
+    _card("Aerial Sentry", "Creature — Soldier", "This creature can block creatures with flying."),
+    _card(
+        "Sea Trickster",
+        "Creature — Merfolk",
+        "When this creature enters, return target creature to its owner's hand.",
+    ),
+    # Card-name terms: no card's text names them
+    _card(
+        "Doubling Season",
+        "Enchantment",
+        "If an effect would create tokens, it creates twice that many.",
+    ),
+    _card("Urza, Lord High Artificer", "Legendary Creature — Human Artificer", "Artifacts matter."),
+    # Filtered out
+    _card(
+        "Populous Token", "Token Creature — Elemental", "Populate.", layout="token", edhrec_rank=1
+    ),
+    _card("Blue Populate", "Sorcery", "Populate.", colors=["U"]),
+]
+
+
+@pytest.fixture
+async def indexed_db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    path = build_card_db(CARDS, build_oracle_cards, build_synergy_terms, name="indexed.sqlite")
+    async with open_card_db(path) as database:
+        yield database
+
+
+@pytest.fixture
+async def legacy_db(build_card_db: CardDbBuilder) -> AsyncIterator[UnifiedDatabase]:
+    async with open_card_db(
+        build_card_db(CARDS, build_oracle_cards, name="legacy.sqlite")
+    ) as database:
+        yield database
+
+
+async def _synergies(db: UnifiedDatabase, card_name: str) -> dict[str, str]:
+    result = await find_synergies(db, card_name, max_results=50, use_cache=False)
+    return {s.name: s.synergy_type for s in result.synergies}
+
+
+class TestCompileTerm:
+    """Terms compile to regex, substring or card-name predicates."""
+
+    def test_regex_term(self) -> None:
+        match = compile_term("can block.*flying")
+        assert match("x", "this creature can block creatures with flying.")
+        assert not match("x", "can block.\nflying")  # Not across ability lines
+
+    def test_name_term(self) -> None:
+        match = compile_term("Sword of")
+        assert match("Sword of Fire and Ice", "")
+        assert not match("Swordsmith", "")
+
+    def test_every_rule_term_compiles(self) -> None:
+        for pattern in rule_patterns():
+            compile_term(pattern)("Card", "text")
+
+
+class TestSynergyIndexRegression:
+    """Indexed find_synergies against the per-term LIKE search."""
+
+    @pytest.mark.parametrize(
+        ("card_name", "added"),
+        [
+            ("Sky Knight", {"Aerial Sentry"}),
+            ("Squad Leader", {"Doubling Season", "Sea Trickster"}),
+            ("Mana Rock", {"Urza, Lord High Artificer"}),
+        ],
+    )
+    async def test_keeps_legacy_matches_and_adds_missed(
+        self,
+        legacy_db: UnifiedDatabase,
+        indexed_db: UnifiedDatabase,
+        card_name: str,
+        added: set[str],
+    ) -> None:
+        legacy = await _synergies(legacy_db, card_name)
+        indexed = await _synergies(indexed_db, card_name)
+        legacy.pop("Populous Token", None)  # The LIKE search returned tokens too
+
+        assert legacy.items() <= indexed.items()
+        assert added <= indexed.keys() - legacy.keys()
+
+    async def test_excludes_tokens(self, indexed_db: UnifiedDatabase) -> None:
+        synergies = await _synergies(indexed_db, "Squad Leader")
+        assert "Rootborn Defenses" in synergies
+        assert "Populous Token" not in synergies
+
+    async def test_ranked_by_edhrec_and_filtered(self, indexed_db: UnifiedDatabase) -> None:
+        found = await indexed_db.find_cards_by_synergy_terms([("populate", 1)], SearchCardsInput())
+        assert [card.name for card in found["populate"]] == ["Rootborn Defenses"]
+
+        found = await indexed_db.find_cards_by_synergy_terms(
+            [("populate", 5)], SearchCardsInput(color_identity=["U"])
+        )
+        assert [card.name for card in found["populate"]] == ["Blue Populate"]
+
+    async def test_unindexed_database_reports_no_terms(self, legacy_db: UnifiedDatabase) -> None:
+        assert await legacy_db.get_indexed_synergy_terms() == frozenset()
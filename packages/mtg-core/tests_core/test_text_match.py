@@ -0,0 +1,103 @@
+"""Tests for multi-pattern rules-text matching."""
+
+from __future__ import annotations
+
+import re
+
+from mtg_core.tools.synergy.constants import THEME_INDICATORS
+from mtg_core.utils.text_match import TextMatcher, compile_pattern, is_literal
+
+
+class TestIsLiteral:
+    """Tests for is_literal."""
+
+    def test_plain_text(self) -> None:
+        assert is_literal("enters the battlefield")
+
+    def test_regex(self) -> None:
+        assert not is_literal("create.*token")
+
+    def test_invalid_regex_is_literal(self) -> None:
+        assert is_literal("+1/+1 counter")
+
+
+class TestCompilePattern:
+    """Tests for compile_pattern."""
+
+    def test_case_insensitive(self) -> None:
+        assert compile_pattern("draw a card").search("Draw A Card.")
+
+    def test_invalid_regex_matches_literally(self) -> None:
+        pattern = compile_pattern("+1/+1 counter")
+        assert pattern.search("Put a +1/+1 counter on it.")
+        assert not pattern.search("Put a -1/-1 counter on it.")
+
+
+class TestTextMatcher:
+    """Tests for TextMatcher."""
+
+    def test_tags_in_given_order(self) -> None:
+        matcher = TextMatcher({"tokens": ["token"], "draw": ["draw"], "life": ["gain.*life"]})
+
+        assert matcher.find("You gain 1 life. Draw a card. Create a token.") == [
+            "tokens",
+            "draw",
+            "life",
+        ]
+
+    def test_shared_literal_matches_every_tag(self) -> None:
+        matcher = TextMatcher({"a": ["sacrifice"], "b": ["sacrifice", "dies"]})
+
+        assert matcher.find("Sacrifice a creature.") == ["a", "b"]
+
+    def test_overlapping_literals(self) -> None:
+        matcher = TextMatcher({"counters": ["+1/+1 counter"], "proliferate": ["counter"]})
+
+        assert matcher.find("Put a +1/+1 counter on it.") == ["counters", "proliferate"]
+        assert matcher.find("Counter target spell.") == ["proliferate"]
+
+    def test_regex_alternation(self) -> None:
+        matcher = TextMatcher({"tokens": ["create.*token", "populate"]})
+
+        assert matcher.find("Create two 1/1 tokens.") == ["tokens"]
+        assert matcher.find("POPULATE") == ["tokens"]
+        assert matcher.find("Draw a card.") == []
+
+    def test_literal_mode_ignores_regex_syntax(self) -> None:
+        matcher = TextMatcher({"ramp": ["add {"]}, literal=True)
+
+        assert matcher.find("{T}: Add {G}.") == ["ramp"]
+        assert not matcher.search("Add one mana.")
+
+    def test_from_patterns(self) -> None:
+        matcher = TextMatcher.from_patterns(["flying", "haste"])
+
+        assert matcher.tags == ("flying", "haste")
+        assert matcher.find("Haste") == ["haste"]
+
+    def test_empty_text(self) -> None:
+        matcher = TextMatcher({"draw": ["draw"]})
+
+        assert matcher.find("") == []
+        assert not matcher.search("")
+
+    def test_matches_per_pattern_search(self) -> None:
+        matcher = TextMatcher(THEME_INDICATORS)
+        texts = [
+            "Whenever a creature you control dies, create a 1/1 black Zombie creature token.",
+            "Put a +1/+1 counter on each creature you control. Proliferate.",
+            "Sacrifice an artifact: Draw a card.",
+            "Return target creature card from your graveyard to the battlefield.",
+            "Flying",
+        ]
+
+        for text in texts:
+            expected = [
+                theme
+                for theme, patterns in THEME_INDICATORS.items()
+                if any(
+                    re.search(re.escape(p) if is_literal(p) else p, text, re.IGNORECASE)
+                    for p in patterns
+                )
+            ]
+            assert matcher.find(text) == expected
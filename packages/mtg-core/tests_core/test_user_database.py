@@ -85,7 +85,7 @@ class TestDatabaseConnection:
         async with db.conn.execute("SELECT version FROM schema_version") as cursor:
             row = await cursor.fetchone()
             assert row is not None
-            assert row["version"] == 4
+            assert row["version"] == 5
 
     async def test_foreign_keys_enabled(self, db: UserDatabase) -> None:
         """Foreign keys should be enabled."""
@@ -465,6 +465,88 @@ class TestDeckCards:
         assert cards[0].is_sideboard is False
         assert cards[0].quantity == 5
 
+    async def test_add_card_returns_row(self, db_with_deck: tuple[UserDatabase, int]) -> None:
+        """Adding a card returns its row after the upsert."""
+        db, deck_id = db_with_deck
+
+        await db.add_card(deck_id, "Lightning Bolt", quantity=2, set_code="LEA")
+        row = await db.add_card(deck_id, "Lightning Bolt", quantity=1)
+
+        assert row.deck_id == deck_id
+        assert row.card_name == "Lightning Bolt"
+        assert row.quantity == 3
+        assert row.is_sideboard is False
+        assert row.set_code == "LEA"
+        assert row == (await db.get_deck_cards(deck_id))[0]
+
+    async def test_set_quantity_returns_row(self, db_with_deck: tuple[UserDatabase, int]) -> None:
+        """Setting a quantity returns the updated row, or None when nothing remains."""
+        db, deck_id = db_with_deck
+
+        await db.add_card(deck_id, "Lightning Bolt", quantity=2)
+        row = await db.set_quantity(deck_id, "Lightning Bolt", quantity=4)
+        assert row is not None
+        assert row.quantity == 4
+
+        assert await db.set_quantity(deck_id, "Counterspell", quantity=2) is None
+        assert await db.set_quantity(deck_id, "Lightning Bolt", quantity=0) is None
+
+    async def test_move_returns_target_row(self, db_with_deck: tuple[UserDatabase, int]) -> None:
+        """Moving a card returns its row on the target board."""
+        db, deck_id = db_with_deck
+
+        await db.add_card(deck_id, "Lightning Bolt", quantity=4)
+        await db.add_card(deck_id, "Lightning Bolt", quantity=1, sideboard=True)
+
+        row = await db.move_to_sideboard(deck_id, "Lightning Bolt")
+        assert row is not None
+        assert (row.is_sideboard, row.quantity) == (True, 5)
+
+        row = await db.move_to_mainboard(deck_id, "Lightning Bolt")
+        assert row is not None
+        assert (row.is_sideboard, row.quantity) == (False, 5)
+        assert await db.get_deck_cards(deck_id) == [row]
+
+    async def test_move_card_not_on_source_board(
+        self, db_with_deck: tuple[UserDatabase, int]
+    ) -> None:
+        """Moving a card that is not on the source board leaves the deck unchanged."""
+        db, deck_id = db_with_deck
+
+        await db.add_card(deck_id, "Lightning Bolt", quantity=2, sideboard=True)
+
+        assert await db.move_to_sideboard(deck_id, "Lightning Bolt") is None
+        cards = await db.get_deck_cards(deck_id)
+        assert [(c.is_sideboard, c.quantity) for c in cards] == [(True, 2)]
+
+    async def test_add_cards_batch(self, db_with_deck: tuple[UserDatabase, int]) -> None:
+        """Adding many cards merges repeats and adds to cards already in the deck."""
+        db, deck_id = db_with_deck
+
+        await db.add_card(deck_id, "Lightning Bolt", quantity=2)
+        rows = await db.add_cards(
+            deck_id,
+            [
+                ("Lightning Bolt", 1, False),
+                ("Counterspell", 2, False),
+                ("Lightning Bolt", 1, False),
+                ("Counterspell", 1, True),
+            ],
+        )
+
+        assert [(r.card_name, r.is_sideboard, r.quantity) for r in rows] == [
+            ("Lightning Bolt", False, 4),
+            ("Counterspell", False, 2),
+            ("Counterspell", True, 1),
+        ]
+        cards = await db.get_deck_cards(deck_id)
+        assert sorted((c.card_name, c.is_sideboard, c.quantity) for c in cards) == [
+            ("Counterspell", False, 2),
+            ("Counterspell", True, 1),
+            ("Lightning Bolt", False, 4),
+        ]
+        assert await db.add_cards(deck_id, []) == []
+
     async def test_get_deck_cards_ordered(self, db_with_deck: tuple[UserDatabase, int]) -> None:
         """Get deck cards should be ordered by sideboard then name."""
         db, deck_id = db_with_deck
@@ -802,6 +884,14 @@ class TestCollectionOperations:
         foil_total = await db_with_collection.get_collection_foil_total()
         assert foil_total == 3
 
+    async def test_get_collection_totals(self, db_with_collection: UserDatabase) -> None:
+        """Get unique, total and foil counts together."""
+        assert await db_with_collection.get_collection_totals() == (3, 12, 3)
+
+    async def test_get_collection_totals_empty(self, db: UserDatabase) -> None:
+        """Empty collection totals are zero."""
+        assert await db.get_collection_totals() == (0, 0, 0)
+
 
 class TestCollectionDeckUsage:
     """Tests for collection and deck usage queries."""
@@ -877,6 +967,21 @@ class TestCollectionDeckUsage:
         usage = await db.get_cards_deck_usage_batch([])
         assert usage == {}
 
+    async def test_get_deck_card_quantities(self, db: UserDatabase) -> None:
+        """Get every deck card row in one query."""
+        deck1_id = await db.create_deck(name="Deck 1")
+        deck2_id = await db.create_deck(name="Deck 2")
+        await db.add_card(deck1_id, "Lightning Bolt", quantity=4)
+        await db.add_card(deck1_id, "Lightning Bolt", quantity=1, sideboard=True)
+        await db.add_card(deck2_id, "Sol Ring", quantity=1)
+
+        quantities = await db.get_deck_card_quantities()
+        assert sorted(quantities) == [
+            (deck1_id, "Lightning Bolt", False, 4),
+            (deck1_id, "Lightning Bolt", True, 1),
+            (deck2_id, "Sol Ring", False, 1),
+        ]
+
 
 class TestCollectionHistory:
     """Tests for collection history."""
@@ -961,7 +1066,7 @@ class TestMigrations:
             # Verify schema version is current
             async with db.conn.execute("SELECT version FROM schema_version") as cursor:
                 row = await cursor.fetchone()
-                assert row["version"] == 4
+                assert row["version"] == 5
 
             await db.close()
 
@@ -1017,7 +1122,7 @@ class TestMigrations:
             # Verify schema version is current
             async with db.conn.execute("SELECT version FROM schema_version") as cursor:
                 row = await cursor.fetchone()
-                assert row["version"] == 4
+                assert row["version"] == 5
 
             # Verify migration added columns
             exists = await db._column_exists("deck_cards", "set_code")
@@ -1025,6 +1130,39 @@ class TestMigrations:
 
             await db.close()
 
+    async def test_migration_from_version_4_recreates_card_triggers(self) -> None:
+        """Migrating from version 4 replaces the per-row deck timestamp triggers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = UserDatabase(db_path)
+            await db.connect()
+            await db.conn.executescript("""
+                DROP TABLE deck_batch_writes;
+                DROP TRIGGER update_deck_on_card_change;
+                CREATE TRIGGER update_deck_on_card_change
+                AFTER INSERT ON deck_cards
+                BEGIN
+                    UPDATE decks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.deck_id;
+                END;
+                UPDATE schema_version SET version = 4;
+            """)
+            await db.close()
+
+            db = UserDatabase(db_path)
+            await db.connect()
+            async with db.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'update_deck_on_card_change'"
+            ) as cursor:
+                row = await cursor.fetchone()
+            assert row is not None
+            assert "deck_batch_writes" in row["sql"]
+
+            deck_id = await db.create_deck("Test Deck")
+            rows = await db.add_cards(deck_id, [("Lightning Bolt", 4, False)])
+            assert [r.quantity for r in rows] == [4]
+
+            await db.close()
+
 
 class TestConcurrency:
     """Tests for concurrency and connection pooling."""
@@ -1132,6 +1270,44 @@ class TestTriggers:
         assert updated is not None
         assert updated.updated_at > original.updated_at
 
+    async def test_deck_updated_at_once_for_card_batch(
+        self, db_with_deck: tuple[UserDatabase, int]
+    ) -> None:
+        """A batch of cards updates the deck's updated_at once, not once per card."""
+        db, deck_id = db_with_deck
+        await db.conn.executescript("""
+            CREATE TEMP TABLE deck_updates (deck_id INTEGER);
+            CREATE TEMP TRIGGER log_deck_update AFTER UPDATE ON decks
+            BEGIN
+                INSERT INTO deck_updates VALUES (NEW.id);
+            END;
+        """)
+
+        async def count_updates() -> int:
+            async with db.conn.execute("SELECT COUNT(*) FROM deck_updates") as cursor:
+                row = await cursor.fetchone()
+            assert row is not None
+            count: int = row[0]
+            await db.conn.execute("DELETE FROM deck_updates")
+            return count
+
+        original = await db.get_deck(deck_id)
+        await asyncio.sleep(1.1)  # SQLite CURRENT_TIMESTAMP has second precision
+        await db.add_card(deck_id, "Shock", quantity=1)
+        single = await count_updates()
+        await db.add_cards(deck_id, [(f"Card {i}", 1, i % 2 == 0) for i in range(20)])
+        batch = await count_updates()
+        updated = await db.get_deck(deck_id)
+
+        assert batch == single
+        assert original is not None
+        assert updated is not None
+        assert updated.updated_at > original.updated_at
+        async with db.conn.execute("SELECT COUNT(*) FROM deck_batch_writes") as cursor:
+            row = await cursor.fetchone()
+        assert row is not None
+        assert row[0] == 0
+
     async def test_collection_updated_at_trigger(self, db: UserDatabase) -> None:
         """Updating collection card should update updated_at."""
         await db.add_to_collection("Lightning Bolt", quantity=4)
@@ -13,18 +13,31 @@ def _print_status(msg: str) -> None:
     print(f"\r  {msg:<40}", end="", flush=True)
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Run the MTG Spellbook TUI."""
-    # Show loading progress before heavy imports (sklearn takes ~10s on first run)
+    import argparse
+
+    from mtg_spellbook.startup import startup_profiler
+
+    parser = argparse.ArgumentParser(prog="mtg-spellbook", description=__doc__)
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Quit once startup completes and print an import and stage timing breakdown",
+    )
+    args = parser.parse_args(argv)
+    if args.profile_startup:
+        startup_profiler.enable()
+
+    # Show loading progress before the UI imports. The recommendation engine
+    # (sklearn/scipy) is no longer imported here: it loads on first use.
     print()  # Start with newline for spacing
 
-    _print_status("Loading card analysis engine, this may take a minute...")
-    import mtg_core.tools.recommendations  # noqa: F401 - sklearn lives here
-
     _print_status("Loading UI framework...")
-    import textual  # noqa: F401
+    startup_profiler.import_module("textual")
 
     _print_status("Initializing app...")
+    startup_profiler.import_module("mtg_spellbook.app")
     from mtg_spellbook.app import MTGSpellbook
     from mtg_spellbook.splash import run_splash_if_needed
 
@@ -32,7 +45,9 @@ def main() -> None:
     print("\r" + " " * 45 + "\r", end="", flush=True)
 
     # Show splash screen and setup databases if needed
-    if not run_splash_if_needed():
+    with startup_profiler.stage("splash (data freshness check)"):
+        ready = run_splash_if_needed()
+    if not ready:
         # Setup failed or was cancelled
         return
 
@@ -40,6 +55,9 @@ def main() -> None:
     app = MTGSpellbook()
     app.run()
 
+    if startup_profiler.enabled:
+        print(startup_profiler.report())
+
 
 def get_app_class() -> type[MTGSpellbookType]:
     """Get the MTGSpellbook class (for external imports)."""
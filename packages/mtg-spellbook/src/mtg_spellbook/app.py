@@ -13,7 +13,7 @@ from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Footer, Label, ListItem, ListView, Static
+from textual.widgets import Footer, Static
 
 from mtg_core.exceptions import CardNotFoundError
 from mtg_spellbook.context import DatabaseContext
@@ -37,6 +37,7 @@ from .deck import (
 )
 from .pagination import PaginationState
 from .recommendations import AddCardToDeck
+from .startup import startup_profiler
 from .styles import APP_CSS
 from .ui.theme import ui_colors
 from .widgets import (
@@ -50,8 +51,9 @@ from .widgets import (
     SynergyPanelClosed,
     SynergySelected,
     ViewArtwork,
+    VirtualList,
 )
-from .widgets.art_navigator.image_loader import close_http_client
+from .widgets.art_navigator.image_loader import close_disk_cache, close_http_client
 from .widgets.art_navigator.messages import ArtistSelected as ArtNavigatorArtistSelected
 from .widgets.artist_browser import ArtistBrowserClosed
 from .widgets.artist_browser import ArtistSelected as ArtistBrowserArtistSelected
@@ -210,31 +212,20 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
         yield Footer()
 
     async def on_mount(self) -> None:
-        """Initialize database connections."""
+        """Initialize database connections.
+
+        Only what the dashboard needs is awaited here (the connection and the
+        build-time stats); deck and collection managers and keywords load in
+        _load_secondary_data() after the dashboard is shown.
+        """
         # Use dark mode for our custom styling
         self.dark = True
 
-        self._db = await self._ctx.get_db()
-        self._deck_manager = await self._ctx.get_deck_manager()
-        self._collection_manager = await self._ctx.get_collection_manager()
-
-        # Load keywords from database and set on card panels
-        keywords = await self._ctx.get_keywords()
-        for panel in self.query(CardPanel):
-            panel.set_keywords(keywords)
+        with startup_profiler.stage("open database"):
+            self._db = await self._ctx.get_db()
 
-        # Initialize deck editor with deck manager
-        if self._deck_manager:
-            deck_editor = self.query_one("#deck-editor", DeckEditorPanel)
-            deck_editor.set_deck_manager(self._deck_manager)
-
-        # Initialize collection panel with collection manager
-        if self._collection_manager:
-            collection_panel = self.query_one("#collection-panel", CollectionListPanel)
-            collection_panel.set_manager(self._collection_manager)
-
-        # Get stats
-        stats = await self._db.get_database_stats()
+        with startup_profiler.stage("database stats"):
+            stats = await self._db.get_database_stats()
         self._card_count = stats.get("unique_cards", 0)
         self._set_count = stats.get("total_sets", 0)
 
@@ -266,6 +257,38 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
 
         # Disable card actions initially (no card selected)
         self._update_menu_card_state()
+        startup_profiler.mark("dashboard ready")
+
+        self._load_secondary_data()
+
+    @work(group="startup")
+    async def _load_secondary_data(self) -> None:
+        """Load managers and keywords once the dashboard is usable."""
+        with startup_profiler.stage("deck manager"):
+            self._deck_manager = await self._ctx.get_deck_manager()
+        with startup_profiler.stage("collection manager"):
+            self._collection_manager = await self._ctx.get_collection_manager()
+
+        # Load keywords from database and set on card panels
+        with startup_profiler.stage("keywords"):
+            keywords = await self._ctx.get_keywords()
+        for panel in self.query(CardPanel):
+            panel.set_keywords(keywords)
+
+        # Initialize deck editor with deck manager
+        if self._deck_manager:
+            deck_editor = self.query_one("#deck-editor", DeckEditorPanel)
+            deck_editor.set_deck_manager(self._deck_manager)
+
+        # Initialize collection panel with collection manager
+        if self._collection_manager:
+            collection_panel = self.query_one("#collection-panel", CollectionListPanel)
+            collection_panel.set_manager(self._collection_manager)
+
+        startup_profiler.mark("secondary data loaded")
+        if startup_profiler.enabled:
+            self.exit()
+            return
 
         # Pre-initialize expensive resources in background
         self._preinit_combo_detector()
@@ -305,15 +328,16 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
         with contextlib.suppress(TimeoutError, Exception):
             await asyncio.wait_for(close_http_client(), timeout=0.5)
 
+        with contextlib.suppress(TimeoutError, Exception):
+            await asyncio.wait_for(asyncio.to_thread(close_disk_cache), timeout=0.5)
+
     async def action_quit(self) -> None:
         """Quit the application cleanly."""
         self.exit()
 
     def _show_message(self, message: str) -> None:
         """Show a message in the results area."""
-        results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-        results_list.append(ListItem(Label(message)))
+        self.query_one("#results-list", ResultsList).show_lines([message])
 
     def _update_menu_card_state(self) -> None:
         """Update menu item enabled state based on current card."""
@@ -331,11 +355,13 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
         self._collapse_menu()
         return super().push_screen(*args, **kwargs)
 
-    @on(ListView.Highlighted, "#results-list")
-    def on_result_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#results-list")
+    def on_result_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Update card panel when navigating results."""
-        if event.item and self._current_results:
-            index = event.list_view.index or 0
+        if not event.virtual_list.is_attached:
+            return  # Posted just before the app shut down
+        if self._current_results:
+            index = event.index
             if 0 <= index < len(self._current_results):
                 card = self._current_results[index]
                 self._current_card = card
@@ -353,10 +379,10 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
         """Load extras for highlighted card."""
         await self._load_card_extras(card)
 
-    @on(ListView.Selected, "#results-list")
-    def on_result_selected(self, _event: ListView.Selected) -> None:
+    @on(VirtualList.Selected, "#results-list")
+    def on_result_selected(self, _event: VirtualList.Selected) -> None:
         """Handle result selection - card panel auto-updates via highlight."""
-        pass  # Card panel updates via ListView.Highlighted event
+        pass  # Card panel updates via VirtualList.Highlighted event
 
     def action_focus_input(self) -> None:
         """Focus the search input."""
@@ -597,7 +623,7 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
             # Refresh collection panel if visible
             if self._collection_panel_visible:
                 collection_panel = self.query_one("#collection-panel", CollectionListPanel)
-                collection_panel.refresh_collection()
+                collection_panel.upsert_card(result.card.name if result.card else card_name)
         else:
             self.notify(result.error or "Failed to add card", severity="error")
 
@@ -797,13 +823,10 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
         self, deck: DeckWithCards, card_info: dict[str, dict[str, object]]
     ) -> None:
         """Update results list with deck cards."""
-        from textual.widgets import Label, ListItem
-
         from .formatting import prettify_mana
         from .widgets import ResultsList
 
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
 
         # Sort: commanders first, then mainboard, then sideboard
         def sort_key(card: CardDetail) -> tuple[int, int, str]:
@@ -814,6 +837,7 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
 
         sorted_cards = sorted(self._current_results, key=sort_key)
 
+        lines: list[str] = []
         for card in sorted_cards:
             info = card_info.get(card.name, {})
             qty = info.get("quantity", 1)
@@ -833,7 +857,9 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
             if mana:
                 line += f"  {mana}"
 
-            results_list.append(ListItem(Label(line)))
+            lines.append(line)
+
+        results_list.show(lines, row_height=1)
 
         # Update header with deck name and card count
         self._update_results_header(
@@ -842,7 +868,6 @@ class MTGSpellbook(CommandHandlersMixin, App[None]):  # type: ignore[misc]
 
         if sorted_cards:
             results_list.focus()
-            results_list.index = 0
 
     @on(DeckCreated)
     def on_deck_created_message(self, _event: DeckCreated) -> None:
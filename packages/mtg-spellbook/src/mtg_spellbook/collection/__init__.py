@@ -1,7 +1,7 @@
 """Collection management UI components."""
 
 from .full_screen import FullCollectionScreen
-from .list_panel import CollectionCardItem, CollectionListPanel
+from .list_panel import CollectionListPanel, format_collection_row
 from .messages import (
     CardAddedToCollection,
     CardRemovedFromCollection,
@@ -22,7 +22,6 @@ __all__ = [
     "AddToCollectionResult",
     "CardAddedToCollection",
     "CardRemovedFromCollection",
-    "CollectionCardItem",
     "CollectionCardSelected",
     "CollectionListPanel",
     "CollectionQuantityChanged",
@@ -31,4 +30,5 @@ __all__ = [
     "FullCollectionScreen",
     "ImportCollectionModal",
     "PrintingSelectionModal",
+    "format_collection_row",
 ]
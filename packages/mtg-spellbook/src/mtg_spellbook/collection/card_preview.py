@@ -13,7 +13,7 @@ from textual.widgets import Static
 from ..formatting import prettify_mana
 from ..ui.theme import get_price_color, rarity_colors, ui_colors
 from ..widgets.art_navigator import HAS_IMAGE_SUPPORT, TImage
-from ..widgets.art_navigator.image_loader import load_image_from_url
+from ..widgets.art_navigator.image_loader import ImageTier, load_card_image
 
 if TYPE_CHECKING:
     from mtg_core.data.database import UnifiedDatabase
@@ -416,7 +416,7 @@ class CollectionCardPreview(Vertical):
 
         try:
             img_widget = self.query_one("#ccp-image", TImage)
-            await load_image_from_url(image_url, img_widget, use_large=True)
+            await load_card_image(image_url, img_widget, tier=ImageTier.LARGE)
         except NoMatches:
             pass
 
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import contextlib
+import time
 from dataclasses import dataclass
 from typing import ClassVar
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.css.query import NoMatches
 from textual.widgets import Button, ListItem, ListView, Static
+from textual.worker import get_current_worker
 
 from mtg_core.tools.recommendations.deck_finder import DeckSuggestion
 
@@ -155,6 +157,10 @@ class DeckSuggestionsScreen(BaseScreen[CreateDeckResult | None]):
     }
     """
 
+    # Suggestions shown, and how often the list refreshes while they stream in
+    SUGGESTION_LIMIT: ClassVar[int] = 20
+    PROGRESS_INTERVAL: ClassVar[float] = 0.25
+
     def __init__(self, card_info_list: list[CollectionCardInfo]) -> None:
         super().__init__()
         self._card_info_list = card_info_list
@@ -162,6 +168,7 @@ class DeckSuggestionsScreen(BaseScreen[CreateDeckResult | None]):
         self._current_format = "commander"
         self._suggestions: list[DeckSuggestion] = []
         self._selected_suggestion: DeckSuggestion | None = None
+        self._loading = False
 
     def compose_content(self) -> ComposeResult:
         yield Static(
@@ -189,9 +196,27 @@ class DeckSuggestionsScreen(BaseScreen[CreateDeckResult | None]):
             pass
 
     def _load_suggestions(self) -> None:
-        """Load deck suggestions for current format."""
-        from mtg_core.tools.recommendations.deck_finder import CardData, get_deck_finder
+        """Load deck suggestions for current format in the background."""
+        self._loading = True
+        self._suggestions = []
+        self._populate_list()
+        self._find_suggestions(self._current_format)
+
+    @work(exclusive=True, group="deck_suggestions", thread=True)
+    def _find_suggestions(self, fmt: str) -> None:
+        """Build suggestions in a thread, showing the best so far as they arrive.
+
+        Commander suggestions are built one commander at a time, so the list
+        refreshes every PROGRESS_INTERVAL seconds instead of waiting for all
+        the legends in a large collection.
+        """
+        from mtg_core.tools.recommendations.deck_finder import (
+            CardData,
+            get_deck_finder,
+            rank_suggestions,
+        )
 
+        worker = get_current_worker()
         finder = get_deck_finder()
 
         # Convert card info to CardData
@@ -207,32 +232,58 @@ class DeckSuggestionsScreen(BaseScreen[CreateDeckResult | None]):
             for c in self._card_info_list
         ]
 
-        self._suggestions = finder.find_buildable_decks(
-            self._collection_cards,
-            format=self._current_format,
-            card_data=card_data,
-            min_completion=0.1,
-            limit=20,
-        )
+        if fmt != "commander":
+            suggestions = finder.find_buildable_decks(
+                self._collection_cards,
+                format=fmt,
+                card_data=card_data,
+                min_completion=0.1,
+                limit=self.SUGGESTION_LIMIT,
+            )
+            self.app.call_from_thread(self._show_suggestions, fmt, suggestions, True)
+            return
 
+        found: list[DeckSuggestion] = []
+        last_update = time.monotonic()
+        for suggestion in finder.iter_commander_decks(card_data, min_completion=0.1):
+            if worker.is_cancelled:
+                return
+            found.append(suggestion)
+            if time.monotonic() - last_update >= self.PROGRESS_INTERVAL:
+                partial = rank_suggestions(found, self.SUGGESTION_LIMIT)
+                self.app.call_from_thread(self._show_suggestions, fmt, partial, False)
+                last_update = time.monotonic()
+
+        suggestions = rank_suggestions(found, self.SUGGESTION_LIMIT)
+        self.app.call_from_thread(self._show_suggestions, fmt, suggestions, True)
+
+    def _show_suggestions(self, fmt: str, suggestions: list[DeckSuggestion], done: bool) -> None:
+        """Show suggestions from the worker, unless the format changed since."""
+        if fmt != self._current_format:
+            return
+        if not done and suggestions == self._suggestions:
+            return
+        self._loading = not done
+        self._suggestions = suggestions
         self._populate_list()
 
     def _populate_list(self) -> None:
-        """Populate the suggestions list."""
+        """Populate the suggestions list, keeping the highlighted suggestion."""
         try:
             list_view = self.query_one("#suggestions-list", ListView)
             # Clear existing items
             list_view.clear()
 
             if not self._suggestions:
-                list_view.append(
-                    ListItem(
-                        Static(
-                            f"[{ui_colors.TEXT_DIM}]No {self._current_format} decks found.\n\n"
-                            "Add more legendary creatures or tribal cards![/]",
-                            id="empty-state",
-                        )
+                if self._loading:
+                    message = f"Finding {self._current_format} decks..."
+                else:
+                    message = (
+                        f"No {self._current_format} decks found.\n\n"
+                        "Add more legendary creatures or tribal cards!"
                     )
+                list_view.append(
+                    ListItem(Static(f"[{ui_colors.TEXT_DIM}]{message}[/]", id="empty-state"))
                 )
                 self._selected_suggestion = None
                 return
@@ -245,9 +296,12 @@ class DeckSuggestionsScreen(BaseScreen[CreateDeckResult | None]):
             # Force refresh
             list_view.refresh(layout=True)
 
-            if self._suggestions:
-                list_view.index = 0
-                self._selected_suggestion = self._suggestions[0]
+            # Keep the highlight on the same suggestion as the list refreshes
+            index = 0
+            if self._selected_suggestion in self._suggestions:
+                index = self._suggestions.index(self._selected_suggestion)
+            list_view.index = index
+            self._selected_suggestion = self._suggestions[index]
 
         except Exception as e:
             self.notify(f"ERROR populating list: {e}", severity="error", timeout=10)
@@ -14,11 +14,15 @@ from textual.containers import Horizontal, Vertical
 from textual.css.query import NoMatches
 from textual.events import Key
 from textual.reactive import reactive
-from textual.widgets import Input, ListItem, ListView, Static
+from textual.widgets import Input, Static
+
+from mtg_core.data.database import CollectionFilter
 
 from ..deck.messages import AddToDeckRequested
 from ..screens import BaseScreen
 from ..ui.theme import ui_colors
+from ..widgets.card_result_item import format_card_result
+from ..widgets.virtual_list import VirtualList
 from .card_preview import CollectionCardPreview
 from .deck_suggestions_screen import (
     CollectionCardInfo,
@@ -37,16 +41,19 @@ from .modals import (
 from .stats_panel import CollectionStatsPanel
 
 if TYPE_CHECKING:
-    from mtg_core.data.database import UnifiedDatabase
+    from mtg_core.data.database import CollectionCursor, UnifiedDatabase
 
     from ..collection_manager import CollectionCardWithData, CollectionManager
 
 # Debounce delay for search input (milliseconds)
 SEARCH_DEBOUNCE_MS = 150
 
+# Cards fetched per list window; more load as the cursor nears the end
+LIST_PAGE_SIZE = 100
+
 
 class SortOrder(Enum):
-    """Sort order options for collection."""
+    """Sort order options for collection (values are CollectionManager sort keys)."""
 
     NAME_ASC = "name"
     CMC_ASC = "cmc"
@@ -78,58 +85,35 @@ class CollectionCardAdapter:
         self.flavor_name = card.flavor_name if card else None
 
 
-class CollectionCardItem(ListItem):
-    """A card in the collection list.
-
-    Uses shared CardResultFormatter for consistent styling with search results,
-    with collection-specific availability info appended.
-    """
-
-    DEFAULT_CSS = """
-    CollectionCardItem {
-        height: auto;
-        min-height: 4;
-    }
+def format_collection_card(card: CollectionCardWithData) -> str:
+    """Format a collection card as a three-line list row.
 
-    CollectionCardItem Static {
-        width: 100%;
-    }
+    Uses the shared card result format for consistent styling with search
+    results, with collection-specific availability info appended.
     """
+    total = card.total_owned
+    avail = card.available
 
-    def __init__(self, card: CollectionCardWithData, id: str | None = None) -> None:
-        super().__init__(id=id)
-        self.card_data = card
-
-    def compose(self) -> ComposeResult:
-        yield Static(self._format_card())
-
-    def _format_card(self) -> str:
-        """Format the card using shared formatter + availability info."""
-        from ..widgets.card_result_item import CardResultFormatter
+    # Use shared formatter for base card display
+    base_format = format_card_result(CollectionCardAdapter(card))
 
-        card = self.card_data
-        total = card.total_owned
-        avail = card.available
-
-        # Use shared formatter for base card display
-        adapter = CollectionCardAdapter(card)
-        base_format = CardResultFormatter.format(adapter)
-
-        # Availability styling
-        if avail == total:
-            avail_color = "#7ec850"
-            avail_icon = "✓"
-        elif avail > 0:
-            avail_color = "#e6c84a"
-            avail_icon = "○"
-        else:
-            avail_color = "#666"
-            avail_icon = "●"
+    # Availability styling
+    if avail == total:
+        avail_color = "#7ec850"
+        avail_icon = "✓"
+    elif avail > 0:
+        avail_color = "#e6c84a"
+        avail_icon = "○"
+    else:
+        avail_color = "#666"
+        avail_icon = "●"
 
-        # Append availability line
-        avail_line = f"   [{avail_color}]{avail_icon}[/] [{ui_colors.GOLD}]{total}x[/] [dim]({avail} avail)[/]"
+    # Append availability line
+    avail_line = (
+        f"   [{avail_color}]{avail_icon}[/] [{ui_colors.GOLD}]{total}x[/] [dim]({avail} avail)[/]"
+    )
 
-        return f"{base_format}\n{avail_line}"
+    return f"{base_format}\n{avail_line}"
 
 
 class FullCollectionScreen(BaseScreen[None]):
@@ -156,6 +140,7 @@ class FullCollectionScreen(BaseScreen[None]):
         Binding("f", "cycle_sort", "Sort"),
         Binding("y", "show_synergies", "Synergy", show=True),
         Binding("ctrl+d", "show_deck_suggestions", "Suggest Decks", show=True),
+        Binding("ctrl+r", "rebuild_stats", "Rebuild Stats", show=False),
         # Navigation
         Binding("up,k", "nav_up", "Up", show=False),
         Binding("down,j", "nav_down", "Down", show=False),
@@ -204,7 +189,7 @@ class FullCollectionScreen(BaseScreen[None]):
         height: 100%;
         background: #0a0a14;
         border-right: solid #3d3d3d;
-        /* Grid layout so child ListView can use 1fr */
+        /* Grid layout so the card list can use 1fr */
         layout: grid;
         grid-size: 1;
         grid-rows: auto auto 1fr auto;
@@ -251,21 +236,13 @@ class FullCollectionScreen(BaseScreen[None]):
         scrollbar-color-hover: #e6c84a;
     }
 
-    #collection-list > ListItem {
+    #collection-list > .virtual-list--row {
         padding: 0 1;
-        height: auto;
-        border-bottom: solid #1a1a1a;
         background: #121212;
     }
 
-    #collection-list > ListItem:hover {
-        background: #1a1a2e;
-        border-left: solid #5a5a6e;
-    }
-
-    #collection-list > ListItem.-highlight {
+    #collection-list > .virtual-list--row-highlighted {
         background: #2a2a4e;
-        border-left: heavy #c9a227;
     }
 
     #collection-statusbar {
@@ -304,15 +281,15 @@ class FullCollectionScreen(BaseScreen[None]):
         super().__init__()
         self._manager = manager
         self._db = db
-        self._cards: list[CollectionCardWithData] = []
-        self._filtered_cards: list[CollectionCardWithData] = []
+        # The list loads filtered, sorted windows from SQL; the stats panel, prices
+        # and deck suggestions read the manager's collection stats index
+        self._list_cursor: CollectionCursor | None = None
+        self._list_generation = 0
         self._current_card: CollectionCardWithData | None = None
         self._type_counts: dict[str, int] = {}
         self._color_counts: dict[str, int] = {}
         self._avail_counts: dict[str, int] = {}
         self._search_debounce_task: asyncio.Task[None] | None = None
-        self._population_cancelled = False
-        self._prices: dict[str, tuple[float | None, float | None]] = {}
 
     def compose_content(self) -> ComposeResult:
         # Header
@@ -341,7 +318,12 @@ class FullCollectionScreen(BaseScreen[None]):
                     )
 
                 # Card list
-                yield ListView(id="collection-list")
+                yield VirtualList(
+                    format_collection_card,
+                    row_height=3,
+                    empty_text=f"[{ui_colors.TEXT_DIM}]No cards match filters[/]",
+                    id="collection-list",
+                )
 
                 # Status bar
                 yield Static(
@@ -424,342 +406,189 @@ class FullCollectionScreen(BaseScreen[None]):
     async def on_mount(self) -> None:
         """Load collection data on mount."""
         # Focus the list
-        try:
-            list_view = self.query_one("#collection-list", ListView)
-            list_view.focus()
-        except NoMatches:
-            pass
+        with contextlib.suppress(NoMatches):
+            self.query_one("#collection-list", VirtualList).focus()
 
         # Load collection
         self._load_collection()
 
     @work
-    async def _load_collection(self, *, reload_prices: bool = True) -> None:
-        """Load all collection cards.
-
-        Args:
-            reload_prices: If False, reuse existing price data instead of re-fetching.
-                          Use False for quantity changes and removals where prices don't change.
-        """
-        self._population_cancelled = False
-
-        # Get all cards
-        self._cards, _ = await self._manager.get_collection(page=1, page_size=10000)
-        self.total_count = len(self._cards)
+    async def _load_collection(self) -> None:
+        """Load the first list window, filter counts and the stats panel."""
+        stats = await self._manager.get_stats()
+        self.total_count = stats.unique_cards
 
-        # Calculate type counts
-        self._calculate_counts()
+        # The visible window first, then the stats index (loaded once per session)
+        await self._load_counts()
+        await self._load_list()
+        await self._manager.stats.ensure_loaded()
 
         # Update stats panel
-        stats = await self._manager.get_stats()
         try:
             stats_panel = self.query_one("#collection-stats", CollectionStatsPanel)
-            stats_panel.update_stats(stats, self._cards)
-
-            if reload_prices:
-                # Load price data fresh (in background to not block UI)
-                self._load_price_data()
-            elif self._prices:
-                # Reuse existing prices, just recalculate total value
-                stats_panel.update_value(self._prices, self._cards)
+            stats_panel.update_stats(self._manager.stats.aggregates)
+            if self._manager.valuation.loaded:
+                stats_panel.update_value(self._manager.valuation.value())
         except NoMatches:
             pass
 
-        # Apply filtering
-        self._filter_cards()
-
-        # Populate list
-        await self._populate_list()
-
-        # Update UI
-        self._update_header()
-        self._update_type_index()
-        self._update_color_index()
+        # Prices for cards not priced yet (in background to not block UI)
+        self._load_price_data()
         self._update_statusbar()
 
-    @staticmethod
-    def _price_key(card_name: str, set_code: str | None, collector_number: str | None) -> str:
-        """Generate a unique key for price lookup.
-
-        Uses set_code/collector_number when available for specific printing prices.
-        """
-        if set_code and collector_number:
-            return f"{card_name}|{set_code.upper()}|{collector_number}"
-        return card_name
-
     @work(exclusive=True, group="price_data")
     async def _load_price_data(self) -> None:
-        """Load price data for all collection cards.
-
-        Uses optimized price-only queries that fetch just 4 columns instead of 40+.
-        Cards with specific printings use get_prices_by_set_and_numbers(),
-        cards without use get_prices_by_names().
+        """Value the collection, looking up prices only for cards not priced yet.
 
-        Prices are cached in the CollectionManager for 5 minutes to avoid
-        repeated database queries when reopening the collection screen.
+        Prices are kept in the manager's valuation, which snapshots them to disk
+        for the card database version, so reopening the collection does not query
+        them again.
         """
-        if not self._cards:
-            return
-
-        # Check for cached prices first
-        cached = self._manager.get_cached_prices()
-        if cached:
-            self._prices = cached
-            # Update stats panel with cached prices
-            try:
-                stats_panel = self.query_one("#collection-stats", CollectionStatsPanel)
-                stats_panel.update_value(cached, self._cards)
-            except NoMatches:
-                pass
-            return
-
-        # Build price dict: price_key -> (usd_price, usd_foil_price)
-        price_data: dict[str, tuple[float | None, float | None]] = {}
-
-        # Separate cards with specific printings from those without
-        printings_to_fetch: list[tuple[str, str]] = []
-        cards_with_printing: list[CollectionCardWithData] = []
-        cards_without_printing: list[CollectionCardWithData] = []
-
-        for card_data in self._cards:
-            if card_data.set_code and card_data.collector_number:
-                cards_with_printing.append(card_data)
-                printings_to_fetch.append((card_data.set_code, card_data.collector_number))
-            else:
-                cards_without_printing.append(card_data)
-
-        # Fetch prices only (not full card objects) - much faster
-        if printings_to_fetch:
-            prices_by_printing = await self._db.get_prices_by_set_and_numbers(printings_to_fetch)
-
-            for card_data in cards_with_printing:
-                assert card_data.set_code is not None
-                assert card_data.collector_number is not None
-                lookup_key = (card_data.set_code.upper(), card_data.collector_number)
-                price_tuple = prices_by_printing.get(lookup_key)
-                if price_tuple:
-                    key = self._price_key(
-                        card_data.card_name, card_data.set_code, card_data.collector_number
-                    )
-                    price_usd = price_tuple[0] / 100.0 if price_tuple[0] else None
-                    price_usd_foil = price_tuple[1] / 100.0 if price_tuple[1] else None
-                    price_data[key] = (price_usd, price_usd_foil)
-
-        # Fetch prices by name for cards without specific printings
-        if cards_without_printing:
-            card_names = [c.card_name for c in cards_without_printing]
-            prices_by_name = await self._db.get_prices_by_names(card_names)
-
-            for card_data in cards_without_printing:
-                price_tuple = prices_by_name.get(card_data.card_name.lower())
-                if price_tuple:
-                    key = self._price_key(
-                        card_data.card_name, card_data.set_code, card_data.collector_number
-                    )
-                    price_usd = price_tuple[0] / 100.0 if price_tuple[0] else None
-                    price_usd_foil = price_tuple[1] / 100.0 if price_tuple[1] else None
-                    price_data[key] = (price_usd, price_usd_foil)
-
-        # Store prices for sorting and cache for future opens
-        self._prices = price_data
-        self._manager.set_cached_prices(price_data)
-
-        # Update stats panel
+        valuation = self._manager.valuation
+        await valuation.ensure_loaded()
         try:
             stats_panel = self.query_one("#collection-stats", CollectionStatsPanel)
-            stats_panel.update_value(price_data, self._cards)
+            stats_panel.update_value(valuation.value())
         except NoMatches:
             pass
 
-    def _calculate_counts(self) -> None:
-        """Calculate type, color, and availability counts."""
-        self._type_counts = {
-            "all": len(self._cards),
-            "creature": 0,
-            "instant": 0,
-            "sorcery": 0,
-            "artifact": 0,
-            "enchantment": 0,
-            "planeswalker": 0,
-            "land": 0,
-        }
-        self._color_counts = {
-            "all": len(self._cards),
-            "W": 0,
-            "U": 0,
-            "B": 0,
-            "R": 0,
-            "G": 0,
-            "C": 0,
-            "M": 0,
-        }
-        self._avail_counts = {
-            "all": len(self._cards),
-            "available": 0,
-            "in_decks": 0,
-        }
-
-        for card in self._cards:
-            # Type counting
-            if card.card and card.card.type:
-                type_lower = card.card.type.lower()
-                if "creature" in type_lower:
-                    self._type_counts["creature"] += 1
-                elif "instant" in type_lower:
-                    self._type_counts["instant"] += 1
-                elif "sorcery" in type_lower:
-                    self._type_counts["sorcery"] += 1
-                elif "artifact" in type_lower:
-                    self._type_counts["artifact"] += 1
-                elif "enchantment" in type_lower:
-                    self._type_counts["enchantment"] += 1
-                elif "planeswalker" in type_lower:
-                    self._type_counts["planeswalker"] += 1
-                elif "land" in type_lower:
-                    self._type_counts["land"] += 1
-
-            # Color counting
-            if card.card:
-                colors = card.card.colors or []
-                if len(colors) > 1:
-                    self._color_counts["M"] += 1
-                elif len(colors) == 1:
-                    color = colors[0]
-                    if color in self._color_counts:
-                        self._color_counts[color] += 1
-                else:
-                    self._color_counts["C"] += 1
-
-            # Availability counting
-            if card.available > 0:
-                self._avail_counts["available"] += 1
-            if card.in_deck_count > 0:
-                self._avail_counts["in_decks"] += 1
-
-    def _filter_cards(self) -> None:
-        """Filter cards by type, color, availability, and search query."""
-        filtered = self._cards
-
-        # Apply type filter
-        if self.active_type != "all":
-            filtered = [
-                c
-                for c in filtered
-                if c.card and c.card.type and self.active_type in c.card.type.lower()
-            ]
+    async def _load_counts(self) -> None:
+        """Load type, color, and availability counts for the filter pills."""
+        facets = await self._manager.get_collection_facets()
+        self._type_counts = facets["type"]
+        self._color_counts = facets["color"]
+        self._avail_counts = facets["availability"]
+        self._update_type_index()
+        self._update_color_index()
 
-        # Apply color filter
-        if self.active_color != "all":
-            filtered = [c for c in filtered if self._card_matches_color(c)]
-
-        # Apply availability filter
-        if self.active_avail == "available":
-            filtered = [c for c in filtered if c.available > 0]
-        elif self.active_avail == "in_decks":
-            filtered = [c for c in filtered if c.in_deck_count > 0]
-
-        # Apply search filter
-        if self.search_query:
-            query_lower = self.search_query.lower()
-            filtered = [
-                c
-                for c in filtered
-                if query_lower in c.card_name.lower()
-                or (c.card and c.card.type and query_lower in c.card.type.lower())
-            ]
+    def _collection_filter(self) -> CollectionFilter:
+        """The active type, color, availability, and search filters."""
+        return CollectionFilter(
+            search=self.search_query,
+            card_type=None if self.active_type == "all" else self.active_type,
+            color=None if self.active_color == "all" else self.active_color,
+            availability=None if self.active_avail == "all" else self.active_avail,
+        )
 
-        self._filtered_cards = filtered
-        self.filtered_count = len(filtered)
+    async def _load_list(self, index: int | None = 0) -> None:
+        """Count the matching cards and show the first window of them."""
+        self._list_generation += 1
+        generation = self._list_generation
+        filters = self._collection_filter()
+        count = await self._manager.count_collection(filters)
+        cards, cursor = await self._manager.query_collection(
+            filters, self.current_sort.value, limit=LIST_PAGE_SIZE
+        )
+        if generation != self._list_generation:
+            return  # Filters changed while loading
 
-        # Apply sorting
-        self._sort_cards()
+        self._list_cursor = cursor
+        self.filtered_count = count
+        with contextlib.suppress(NoMatches):
+            list_view = self.query_one("#collection-list", VirtualList)
+            list_view.set_rows(cards, index=index, has_more=cursor is not None)
+        if not cards:
+            self._current_card = None
+        self._update_header()
 
-    def _card_matches_color(self, card_data: CollectionCardWithData) -> bool:
-        """Check if a card matches the active color filter."""
-        if not card_data.card:
+    async def _load_more(self) -> bool:
+        """Append the next list window. Returns False if there was none to add."""
+        cursor = self._list_cursor
+        if cursor is None:
             return False
+        generation = self._list_generation
+        cards, next_cursor = await self._manager.query_collection(
+            self._collection_filter(), self.current_sort.value, after=cursor, limit=LIST_PAGE_SIZE
+        )
+        if generation != self._list_generation or cursor != self._list_cursor:
+            return False  # List reloaded, or another load already appended this window
 
-        colors = card_data.card.colors or []
-        color_filter = self.active_color
-
-        if color_filter == "M":
-            return len(colors) > 1
-        elif color_filter == "C":
-            return len(colors) == 0
-        else:
-            return color_filter in colors
-
-    def _sort_cards(self) -> None:
-        """Sort filtered cards based on current sort order."""
-        if self.current_sort == SortOrder.NAME_ASC:
-            self._filtered_cards.sort(key=lambda c: c.card_name.lower())
-        elif self.current_sort == SortOrder.CMC_ASC:
-
-            def get_cmc(c: CollectionCardWithData) -> float:
-                if c.card and c.card.cmc is not None:
-                    return float(c.card.cmc)
-                return 999.0
-
-            self._filtered_cards.sort(key=get_cmc)
-        elif self.current_sort == SortOrder.TYPE_ASC:
-
-            def get_type(c: CollectionCardWithData) -> str:
-                if c.card and c.card.type:
-                    return str(c.card.type).lower()
-                return "zzz"
-
-            self._filtered_cards.sort(key=get_type)
-        elif self.current_sort == SortOrder.QTY_DESC:
-            self._filtered_cards.sort(key=lambda c: c.total_owned, reverse=True)
-        elif self.current_sort == SortOrder.PRICE_DESC:
-
-            def get_price(c: CollectionCardWithData) -> float:
-                key = self._price_key(c.card_name, c.set_code, c.collector_number)
-                price_tuple = self._prices.get(key)
-                if price_tuple and price_tuple[0]:
-                    return price_tuple[0]
-                return 0.0
-
-            self._filtered_cards.sort(key=get_price, reverse=True)
-
-    async def _populate_list(self) -> None:
-        """Populate the ListView with cards."""
+        self._list_cursor = next_cursor
         try:
-            list_view = self.query_one("#collection-list", ListView)
-            await list_view.clear()
+            list_view = self.query_one("#collection-list", VirtualList)
+        except NoMatches:
+            return False
+        list_view.append_rows(cards, has_more=next_cursor is not None)
+        return True
 
-            if not self._filtered_cards:
-                empty_item = ListItem(Static(f"[{ui_colors.TEXT_DIM}]No cards match filters[/]"))
-                await list_view.append(empty_item)
-                return
+    @work(exclusive=True, group="collection_list")
+    async def _reload_list(self) -> None:
+        """Reload the list after a filter, search, or sort change."""
+        await self._load_list()
+        self._update_type_index()
+        self._update_color_index()
+        self._update_statusbar()
 
-            # Add cards in batches to keep UI responsive
-            batch_size = 50
-            batch_count = 0
+    @on(VirtualList.MoreRowsNeeded, "#collection-list")
+    def on_more_rows_needed(self, _event: VirtualList.MoreRowsNeeded) -> None:
+        """Load the next window as the cursor nears the end of the loaded cards."""
+        self._load_more_rows()
 
-            for i, card in enumerate(self._filtered_cards):
-                if self._population_cancelled:
-                    return
+    @work(group="collection_more")
+    async def _load_more_rows(self) -> None:
+        await self._load_more()
 
-                item = CollectionCardItem(card, id=f"card-item-{i}")
-                await list_view.append(item)
-                batch_count += 1
+    async def _apply_card_change(self, card_name: str) -> None:
+        """Re-read one card and patch its row instead of reloading the collection.
 
-                if batch_count >= batch_size:
-                    batch_count = 0
-                    await asyncio.sleep(0)
+        The manager has already written the change through to its stats index.
+        """
+        updated = await self._manager.get_card(card_name)
+        stats = await self._manager.get_stats()
+        self.total_count = stats.unique_cards
+        await self._load_counts()
 
-            # Select first item
-            if list_view.children:
-                list_view.index = 0
-                # Show first card preview
-                if self._filtered_cards:
-                    self._current_card = self._filtered_cards[0]
-                    self._show_card_preview(self._filtered_cards[0])
+        try:
+            list_view = self.query_one("#collection-list", VirtualList)
+        except NoMatches:
+            return
+
+        # Re-query the loaded windows to find where the card sits now
+        self._list_generation += 1
+        filters = self._collection_filter()
+        self.filtered_count = await self._manager.count_collection(filters)
+        cards, cursor = await self._manager.query_collection(
+            filters,
+            self.current_sort.value,
+            limit=max(list_view.row_count, LIST_PAGE_SIZE),
+        )
+        self._list_cursor = cursor
+        old_row = list_view.find_index(lambda c: c.card_name == card_name)
+        new_row = next((i for i, c in enumerate(cards) if c.card_name == card_name), None)
+
+        if (
+            updated is not None
+            and old_row is not None
+            and old_row == new_row
+            and list_view.row_count == len(cards)
+        ):
+            # Same place in the list (e.g. a quantity edit): repaint just that row
+            list_view.update_row(old_row, cards[old_row])
+            list_view.has_more = cursor is not None
+            if self._current_card is not None and self._current_card.card_name == card_name:
+                self._current_card = cards[old_row]
+        elif (
+            updated is None
+            and old_row is not None
+            and new_row is None
+            and list_view.row_count == len(cards) + 1
+        ):
+            list_view.remove_row(old_row)
+            list_view.has_more = cursor is not None
+        else:
+            list_view.set_rows(cards, index=list_view.index or 0, has_more=cursor is not None)
 
+        try:
+            stats_panel = self.query_one("#collection-stats", CollectionStatsPanel)
+            if self._manager.stats.loaded:
+                stats_panel.update_stats(self._manager.stats.aggregates)
+                if self._manager.valuation.loaded:
+                    stats_panel.update_value(self._manager.valuation.value())
         except NoMatches:
             pass
 
+        self._update_header()
+
     @on(Input.Changed, "#collection-search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
         """Handle search input changes with debouncing."""
@@ -768,9 +597,6 @@ class FullCollectionScreen(BaseScreen[None]):
             self._search_debounce_task.cancel()
             self._search_debounce_task = None
 
-        # Cancel any ongoing population
-        self._population_cancelled = True
-
         # Schedule debounced search
         self._search_debounce_task = asyncio.create_task(self._debounced_search(event.value))
 
@@ -781,29 +607,20 @@ class FullCollectionScreen(BaseScreen[None]):
         except asyncio.CancelledError:
             return
 
-        self._population_cancelled = False
         self.search_query = query.strip()
-        self._filter_cards()
-        await self._populate_list()
-
-        if not self._population_cancelled:
-            self._update_header()
+        self._reload_list()
 
     @on(Input.Submitted, "#collection-search-input")
     def on_search_submitted(self, _event: Input.Submitted) -> None:
         """Focus list after search submit."""
-        try:
-            list_view = self.query_one("#collection-list", ListView)
-            list_view.focus()
-        except NoMatches:
-            pass
+        with contextlib.suppress(NoMatches):
+            self.query_one("#collection-list", VirtualList).focus()
 
-    @on(ListView.Highlighted, "#collection-list")
-    def on_card_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#collection-list")
+    def on_card_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Update preview when card is highlighted."""
-        if event.item and isinstance(event.item, CollectionCardItem):
-            self._current_card = event.item.card_data
-            self._show_card_preview(event.item.card_data)
+        self._current_card = event.row
+        self._show_card_preview(event.row)
 
     @work
     async def _show_card_preview(self, card_data: CollectionCardWithData) -> None:
@@ -832,9 +649,7 @@ class FullCollectionScreen(BaseScreen[None]):
             return
 
         self.active_type = type_filter
-        self._population_cancelled = True
-        self._filter_cards()
-        self._repopulate_list()
+        self._reload_list()
 
     def _set_color_filter(self, color_filter: str) -> None:
         """Set the active color filter."""
@@ -842,9 +657,7 @@ class FullCollectionScreen(BaseScreen[None]):
             return
 
         self.active_color = color_filter
-        self._population_cancelled = True
-        self._filter_cards()
-        self._repopulate_list()
+        self._reload_list()
 
     def _set_avail_filter(self, avail_filter: str) -> None:
         """Set the active availability filter."""
@@ -852,21 +665,7 @@ class FullCollectionScreen(BaseScreen[None]):
             return
 
         self.active_avail = avail_filter
-        self._population_cancelled = True
-        self._filter_cards()
-        self._repopulate_list()
-
-    @work(exclusive=True, group="populate_list")
-    async def _repopulate_list(self) -> None:
-        """Repopulate list after filter change."""
-        self._population_cancelled = False
-        await self._populate_list()
-
-        if not self._population_cancelled:
-            self._update_header()
-            self._update_type_index()
-            self._update_color_index()
-            self._update_statusbar()
+        self._reload_list()
 
     def on_key(self, event: Key) -> None:
         """Handle key presses for type, color, and availability filtering."""
@@ -958,13 +757,17 @@ class FullCollectionScreen(BaseScreen[None]):
 
     def action_show_deck_suggestions(self) -> None:
         """Show deck archetypes that can be built from collection."""
-        if not self._cards:
+        if not self._manager.stats.loaded:
+            self.notify("Collection is still loading", severity="warning", timeout=2)
+            return
+        cards = self._manager.stats.entries()
+        if not cards:
             self.notify("Add cards to your collection first", severity="warning", timeout=2)
             return
 
         # Build card info list with type/color/text data for analysis
         card_info_list: list[CollectionCardInfo] = []
-        for card_data in self._cards:
+        for card_data in sorted(cards, key=lambda c: c.card_name):
             card = card_data.card
             if card:
                 card_info_list.append(
@@ -1005,10 +808,19 @@ class FullCollectionScreen(BaseScreen[None]):
             self.notify("Deck manager not available", severity="error")
             return
 
-        # Create the deck
+        # Create the deck with owned cards and missing cards (basic lands, etc.)
+        # in one batch
         try:
-            deck_id = await deck_manager.create_deck(
+            from collections import Counter
+
+            owned = [(card_name, 1, False) for card_name in result.card_names]
+            missing = [
+                (card_name, qty, False)
+                for card_name, qty in Counter(result.cards_missing or []).items()
+            ]
+            deck_id, add_results = await deck_manager.create_deck_with_cards(
                 name=result.deck_name,
+                cards=owned + missing,
                 format=result.format_type,
                 commander=result.commander,
             )
@@ -1017,40 +829,12 @@ class FullCollectionScreen(BaseScreen[None]):
                 self.notify("Failed to create deck", severity="error")
                 return
 
-            # Add owned cards to the deck
-            added_count = 0
-            for card_name in result.card_names:
-                try:
-                    add_result = await deck_manager.add_card(
-                        deck_id=deck_id,
-                        card_name=card_name,
-                        quantity=1,
-                        sideboard=False,
-                    )
-                    if add_result.success:
-                        added_count += 1
-                except Exception:
-                    pass  # Skip cards that fail to add
-
-            # Add missing cards (basic lands, etc.) with counts
-            missing_count = 0
-            if result.cards_missing:
-                # Count duplicates in missing cards
-                from collections import Counter
-
-                missing_counts = Counter(result.cards_missing)
-                for card_name, qty in missing_counts.items():
-                    try:
-                        add_result = await deck_manager.add_card(
-                            deck_id=deck_id,
-                            card_name=card_name,
-                            quantity=qty,
-                            sideboard=False,
-                        )
-                        if add_result.success:
-                            missing_count += qty
-                    except Exception:
-                        pass
+            added_count = sum(1 for r in add_results[: len(owned)] if r.success)
+            missing_count = sum(
+                qty
+                for (_, qty, _), r in zip(missing, add_results[len(owned) :], strict=True)
+                if r.success
+            )
 
             total_added = added_count + missing_count
             msg = f"Created '{result.deck_name}' with {total_added} cards!"
@@ -1077,7 +861,7 @@ class FullCollectionScreen(BaseScreen[None]):
         """Toggle focus between search and list."""
         try:
             search_input = self.query_one("#collection-search-input", Input)
-            list_view = self.query_one("#collection-list", ListView)
+            list_view = self.query_one("#collection-list", VirtualList)
 
             if search_input.has_focus:
                 list_view.focus()
@@ -1101,13 +885,12 @@ class FullCollectionScreen(BaseScreen[None]):
         }
         self.notify(f"Sort: {sort_labels[self.current_sort]}", timeout=1)
 
-        self._sort_cards()
-        self._repopulate_list()
+        self._reload_list()
 
     def action_nav_up(self) -> None:
         """Navigate up in list."""
         try:
-            list_view = self.query_one("#collection-list", ListView)
+            list_view = self.query_one("#collection-list", VirtualList)
             list_view.action_cursor_up()
         except NoMatches:
             pass
@@ -1115,7 +898,7 @@ class FullCollectionScreen(BaseScreen[None]):
     def action_nav_down(self) -> None:
         """Navigate down in list."""
         try:
-            list_view = self.query_one("#collection-list", ListView)
+            list_view = self.query_one("#collection-list", VirtualList)
             list_view.action_cursor_down()
         except NoMatches:
             pass
@@ -1123,7 +906,7 @@ class FullCollectionScreen(BaseScreen[None]):
     def action_page_up(self) -> None:
         """Page up in the list."""
         try:
-            list_view = self.query_one("#collection-list", ListView)
+            list_view = self.query_one("#collection-list", VirtualList)
             list_view.action_page_up()
         except NoMatches:
             pass
@@ -1131,28 +914,27 @@ class FullCollectionScreen(BaseScreen[None]):
     def action_page_down(self) -> None:
         """Page down in the list."""
         try:
-            list_view = self.query_one("#collection-list", ListView)
+            list_view = self.query_one("#collection-list", VirtualList)
             list_view.action_page_down()
         except NoMatches:
             pass
 
     def action_first(self) -> None:
         """Go to first card."""
-        try:
-            list_view = self.query_one("#collection-list", ListView)
-            if list_view.children:
-                list_view.index = 0
-        except NoMatches:
-            pass
+        with contextlib.suppress(NoMatches):
+            self.query_one("#collection-list", VirtualList).action_first()
 
     def action_last_item(self) -> None:
         """Go to last card."""
-        try:
-            list_view = self.query_one("#collection-list", ListView)
-            if list_view.children:
-                list_view.index = len(list_view.children) - 1
-        except NoMatches:
+        self._jump_to_last()
+
+    @work(exclusive=True, group="collection_more")
+    async def _jump_to_last(self) -> None:
+        """Load the remaining list windows, then move to the last card."""
+        while await self._load_more():
             pass
+        with contextlib.suppress(NoMatches):
+            self.query_one("#collection-list", VirtualList).action_last()
 
     def action_add_card(self) -> None:
         """Open add card modal."""
@@ -1192,15 +974,14 @@ class FullCollectionScreen(BaseScreen[None]):
             collector_number=data.collector_number,
         )
         if result.success and result.card:
-            # Invalidate price cache since we added a new card
-            self._manager.invalidate_price_cache()
             # Show appropriate message based on input type
             if data.set_code and data.collector_number:
                 msg = f"Added {data.quantity}x {result.card.name} ({data.set_code.upper()} #{data.collector_number})"
             else:
                 msg = f"Added {data.quantity}x {result.card.name}"
             self.notify(msg)
-            self._load_collection()
+            await self._apply_card_change(result.card.name)
+            self._load_price_data()
         else:
             self.notify(result.error or "Failed to add card", severity="error")
 
@@ -1224,8 +1005,6 @@ class FullCollectionScreen(BaseScreen[None]):
         errors = result.errors
 
         if added > 0:
-            # Invalidate price cache since we added new cards
-            self._manager.invalidate_price_cache()
             msg = f"Imported {added} card{'s' if added != 1 else ''}"
             if errors:
                 msg += f" ({len(errors)} not found)"
@@ -1259,11 +1038,19 @@ class FullCollectionScreen(BaseScreen[None]):
         """Apply the selected printings to collection cards."""
         updated = await self._manager.apply_printing_selections(selections)
         if updated > 0:
-            # Invalidate price cache since different printings have different prices
-            self._manager.invalidate_price_cache()
             self.notify(f"Updated printings for {updated} card{'s' if updated != 1 else ''}")
             self._load_collection()
 
+    def action_rebuild_stats(self) -> None:
+        """Rebuild the collection statistics from the database."""
+        self._rebuild_stats()
+
+    @work(exclusive=True, group="collection_stats")
+    async def _rebuild_stats(self) -> None:
+        await self._manager.stats.reload()
+        self.notify("Rebuilt collection stats")
+        self._load_collection()
+
     def action_export_cards(self) -> None:
         """Open export modal."""
         self._do_export()
@@ -1299,5 +1086,5 @@ class FullCollectionScreen(BaseScreen[None]):
         removed = await self._manager.remove_card(card_name)
         if removed:
             self.notify(f"Removed {card_name}")
-            # Prices don't change on removal, just recalculate total
-            self._load_collection(reload_prices=False)
+            # Prices don't change on removal; the stats panel recalculates the total
+            await self._apply_card_change(card_name)
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import bisect
 from typing import TYPE_CHECKING, ClassVar
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Label, ListItem, ListView, Static
+from textual.widgets import Label, Static
 
 from ..ui.theme import ui_colors
+from ..widgets.virtual_list import VirtualList
 from .messages import CardRemovedFromCollection, CollectionCardSelected
 from .modals import AddToCollectionResult, ConfirmDeleteModal
 
@@ -18,88 +20,22 @@ if TYPE_CHECKING:
     from ..collection_manager import CollectionCardWithData, CollectionManager
 
 
-class CollectionCardItem(ListItem):
-    """A card in the collection list."""
+def format_collection_row(card: CollectionCardWithData) -> str:
+    """Format a collection card as a one-line list row."""
+    total = card.total_owned
+    avail = card.available
 
-    DEFAULT_CSS = """
-    CollectionCardItem {
-        height: 2;
-        padding: 0 1;
-        background: #121218;
-    }
-
-    CollectionCardItem:hover {
-        background: #1a1a2e;
-    }
-
-    CollectionCardItem.-highlight {
-        background: #2a2a4e;
-    }
-
-    CollectionCardItem .card-qty {
-        width: 4;
-        color: #e6c84a;
-    }
-
-    CollectionCardItem .card-name {
-        width: 1fr;
-    }
-
-    CollectionCardItem .card-mana {
-        width: auto;
-        min-width: 8;
-        text-align: right;
-        color: #888;
-    }
-
-    CollectionCardItem .card-avail {
-        width: 16;
-        text-align: right;
-    }
-
-    CollectionCardItem .avail-good {
-        color: #7ec850;
-    }
-
-    CollectionCardItem .avail-partial {
-        color: #e6c84a;
-    }
-
-    CollectionCardItem .avail-none {
-        color: #666;
-    }
-    """
-
-    def __init__(self, card: CollectionCardWithData) -> None:
-        super().__init__()
-        self.card_data = card
-
-    def compose(self) -> ComposeResult:
-        card = self.card_data
-        total = card.total_owned
-        avail = card.available
-
-        # Determine availability styling
-        if avail == total:
-            avail_class = "avail-good"
-            avail_text = f"[green]✓[/] {avail} avail"
-        elif avail > 0:
-            avail_class = "avail-partial"
-            avail_text = f"[yellow]○[/] {avail}/{total}"
-        else:
-            avail_class = "avail-none"
-            avail_text = f"[dim]● 0/{total}[/]"
+    # Availability styling
+    if avail == total:
+        avail_text = f"[#7ec850]✓ {avail} avail[/]"
+    elif avail > 0:
+        avail_text = f"[#e6c84a]○ {avail}/{total}[/]"
+    else:
+        avail_text = f"[#666]● 0/{total}[/]"
 
-        # Get mana cost
-        mana = ""
-        if card.card and card.card.mana_cost:
-            mana = card.card.mana_cost
+    mana = card.card.mana_cost if card.card and card.card.mana_cost else ""
 
-        with Horizontal():
-            yield Label(f"{total}x", classes="card-qty")
-            yield Label(card.card_name, classes="card-name")
-            yield Label(mana, classes="card-mana")
-            yield Label(avail_text, classes=f"card-avail {avail_class}")
+    return f"[#e6c84a]{total}x[/]  {card.card_name}  [#888]{mana}[/]  {avail_text}"
 
 
 class CollectionListPanel(Vertical):
@@ -143,13 +79,6 @@ class CollectionListPanel(Vertical):
         height: 1fr;
     }
 
-    #collection-empty {
-        width: 100%;
-        height: 100%;
-        content-align: center middle;
-        color: #666;
-    }
-
     #collection-footer {
         height: 1;
         dock: bottom;
@@ -161,7 +90,6 @@ class CollectionListPanel(Vertical):
     def __init__(self, *, id: str | None = None) -> None:
         super().__init__(id=id)
         self._manager: CollectionManager | None = None
-        self._cards: list[CollectionCardWithData] = []
         self._total_count = 0
         self._page = 1
         self._page_size = 100
@@ -172,7 +100,12 @@ class CollectionListPanel(Vertical):
 
         yield Static("", id="collection-stats")
 
-        yield ListView(id="collection-list")
+        yield VirtualList(
+            format_collection_row,
+            row_height=2,
+            empty_text="No cards in collection. Press [bold]+[/] to add cards.",
+            id="collection-list",
+        )
 
         yield Static(
             "[dim]+[/] Add  [dim]Del[/] Remove  [dim]Enter[/] View  [dim]Esc[/] Back",
@@ -183,20 +116,28 @@ class CollectionListPanel(Vertical):
         """Set the collection manager."""
         self._manager = manager
 
+    def _list(self) -> VirtualList[CollectionCardWithData]:
+        """The card list widget."""
+        return self.query_one("#collection-list", VirtualList)
+
     @work
     async def refresh_collection(self) -> None:
         """Refresh the collection list."""
         if self._manager is None:
             return
 
-        self._cards, self._total_count = await self._manager.get_collection(
+        cards, self._total_count = await self._manager.get_collection(
             page=self._page,
             page_size=self._page_size,
         )
+        await self._update_stats()
+        self._list().set_rows(cards)
 
+    async def _update_stats(self) -> None:
+        """Update the stats line from the collection manager."""
+        if self._manager is None:
+            return
         stats = await self._manager.get_stats()
-
-        # Update stats display
         stats_label = self.query_one("#collection-stats", Static)
         stats_label.update(
             f"[dim]Unique:[/] [{ui_colors.GOLD}]{stats.unique_cards}[/]  "
@@ -204,44 +145,42 @@ class CollectionListPanel(Vertical):
             f"[dim]Foils:[/] [{ui_colors.GOLD}]{stats.total_foils}[/]"
         )
 
-        # Update list
-        list_view = self.query_one("#collection-list", ListView)
-        await list_view.clear()
-
-        if not self._cards:
-            # Show empty state
-            list_view.display = False
-            empty = self.query("#collection-empty")
-            if not empty:
-                await self.mount(
-                    Static(
-                        "[dim]No cards in collection.\nPress [bold]+[/] to add cards.[/]",
-                        id="collection-empty",
-                    ),
-                    after=self.query_one("#collection-stats"),
-                )
-        else:
-            list_view.display = True
-            empty = self.query("#collection-empty")
-            if empty:
-                await empty.first().remove()
+    @work
+    async def upsert_card(self, card_name: str) -> None:
+        """Re-read one card and update its row in place instead of reloading the list."""
+        if self._manager is None:
+            return
 
-            for card in self._cards:
-                await list_view.append(CollectionCardItem(card))
+        card = await self._manager.get_card(card_name)
+        list_view = self._list()
+        index = list_view.find_index(lambda c: c.card_name == card_name)
+        if card is None:
+            if index is not None:
+                list_view.remove_row(index)
+        elif index is not None:
+            list_view.update_row(index, card)
+        else:
+            # Keep the database's name ordering
+            names = [c.card_name for c in list_view.rows]
+            list_view.insert_row(bisect.bisect_left(names, card.card_name), card)
+        await self._update_stats()
 
     def action_select_card(self) -> None:
         """Select the highlighted card."""
-        list_view = self.query_one("#collection-list", ListView)
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, CollectionCardItem):
-                self.post_message(
-                    CollectionCardSelected(
-                        item.card_data.card_name,
-                        set_code=item.card_data.set_code,
-                        collector_number=item.card_data.collector_number,
-                    )
+        card = self._list().highlighted_row
+        if card is not None:
+            self.post_message(
+                CollectionCardSelected(
+                    card.card_name,
+                    set_code=card.set_code,
+                    collector_number=card.collector_number,
                 )
+            )
+
+    def on_virtual_list_selected(self, event: VirtualList.Selected) -> None:
+        """Open the card chosen with Enter or a click."""
+        event.stop()
+        self.action_select_card()
 
     def action_add_card(self) -> None:
         """Open add card modal."""
@@ -274,34 +213,29 @@ class CollectionListPanel(Vertical):
             else:
                 msg = f"Added {data.quantity}x {result.card.name}"
             self.notify(msg)
-            self.refresh_collection()
+            self.upsert_card(result.card.name)
         else:
             self.notify(result.error or "Failed to add card", severity="error")
 
     def action_remove_card(self) -> None:
         """Remove the selected card with confirmation."""
-        list_view = self.query_one("#collection-list", ListView)
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, CollectionCardItem):
-                card_data = item.card_data
-                # Show confirmation modal
-                modal = ConfirmDeleteModal(
-                    card_data.card_name,
-                    card_data.quantity,
-                    card_data.foil_quantity,
-                )
-                self.app.push_screen(modal, self._on_delete_confirmed)
+        card_data = self._list().highlighted_row
+        if card_data is not None:
+            # Show confirmation modal
+            modal = ConfirmDeleteModal(
+                card_data.card_name,
+                card_data.quantity,
+                card_data.foil_quantity,
+            )
+            self.app.push_screen(modal, self._on_delete_confirmed)
 
     def _on_delete_confirmed(self, confirmed: bool | None) -> None:
         """Handle delete confirmation result."""
         if not confirmed:
             return
-        list_view = self.query_one("#collection-list", ListView)
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, CollectionCardItem):
-                self._remove_card(item.card_data.card_name)
+        card_data = self._list().highlighted_row
+        if card_data is not None:
+            self._remove_card(card_data.card_name)
 
     @work
     async def _remove_card(self, card_name: str) -> None:
@@ -313,7 +247,11 @@ class CollectionListPanel(Vertical):
         if removed:
             self.notify(f"Removed {card_name} from collection")
             self.post_message(CardRemovedFromCollection(card_name))
-            self.refresh_collection()
+            list_view = self._list()
+            index = list_view.find_index(lambda c: c.card_name == card_name)
+            if index is not None:
+                list_view.remove_row(index)
+            await self._update_stats()
 
     def action_back(self) -> None:
         """Go back to dashboard."""
@@ -321,15 +259,12 @@ class CollectionListPanel(Vertical):
 
     def action_show_synergies(self) -> None:
         """Show synergies for the currently selected card."""
-        list_view = self.query_one("#collection-list", ListView)
-        if list_view.highlighted_child is None:
+        card_data = self._list().highlighted_row
+        if card_data is None:
             self.notify("Select a card first", severity="warning", timeout=2)
             return
 
-        item = list_view.highlighted_child
-        if isinstance(item, CollectionCardItem):
-            card_name = item.card_data.card_name
-            # Call find_synergies on the app
-            if hasattr(self.app, "find_synergies"):
-                self.add_class("hidden")  # Hide this panel
-                self.app.find_synergies(card_name)
+        # Call find_synergies on the app
+        if hasattr(self.app, "find_synergies"):
+            self.add_class("hidden")  # Hide this panel
+            self.app.find_synergies(card_data.card_name)
@@ -576,11 +576,11 @@ class PrintingSelectionModal(ModalScreen[dict[str, tuple[str, str]] | None]):
         """Load printings for each card."""
         for idx, (card_name, _) in enumerate(self._cards):
             try:
-                printings = await self._db.get_all_printings(card_name)  # type: ignore[attr-defined]
+                printings = await self._db.get_printing_rows(card_name)  # type: ignore[attr-defined]
                 options: list[tuple[str, str]] = []
                 for p in printings:
                     set_code = p.set_code or "???"
-                    number = p.collector_number or "?"
+                    number = p.number or "?"
                     set_name = p.set_name or set_code.upper()
                     label = f"{set_name} ({set_code.upper()}) #{number}"
                     value = f"{set_code}|{number}"
@@ -8,10 +8,12 @@ from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Static
 
+from ..collection_stats import CURVE_CAP
 from ..ui.theme import ui_colors
 
 if TYPE_CHECKING:
-    from ..collection_manager import CollectionCardWithData, CollectionStats
+    from ..collection_stats import CollectionAggregates
+    from ..collection_value import CollectionValue
 
 
 # Mana color display configuration
@@ -73,8 +75,7 @@ class CollectionStatsPanel(Vertical):
 
     def __init__(self, *, id: str | None = None) -> None:
         super().__init__(id=id)
-        self._stats: CollectionStats | None = None
-        self._cards: list[CollectionCardWithData] = []
+        self._stats: CollectionAggregates | None = None
 
     def compose(self) -> ComposeResult:
         # Collection Overview
@@ -173,10 +174,9 @@ class CollectionStatsPanel(Vertical):
             )
             yield Static("", id="collection-quick-stats")
 
-    def update_stats(self, stats: CollectionStats, cards: list[CollectionCardWithData]) -> None:
-        """Update the stats display with new data."""
+    def update_stats(self, stats: CollectionAggregates) -> None:
+        """Update the stats display from the collection aggregates."""
         self._stats = stats
-        self._cards = cards
         self._refresh_display()
 
     def _refresh_display(self) -> None:
@@ -184,53 +184,35 @@ class CollectionStatsPanel(Vertical):
         if self._stats is None:
             return
 
-        self._update_overview()
-        self._update_colors()
-        self._update_types()
-        self._update_curve()
-        self._update_availability()
-        self._update_rarity()
-        self._update_sets()
-        self._update_keywords()
-        self._update_legendaries()
-        self._update_artists()
-        self._update_quick_stats()
-
-    def _update_overview(self) -> None:
+        self._update_overview(self._stats)
+        self._update_colors(self._stats)
+        self._update_types(self._stats)
+        self._update_curve(self._stats)
+        self._update_availability(self._stats)
+        self._update_rarity(self._stats)
+        self._update_sets(self._stats)
+        self._update_keywords(self._stats)
+        self._update_legendaries(self._stats)
+        self._update_artists(self._stats)
+        self._update_quick_stats(self._stats)
+
+    def _update_overview(self, stats: CollectionAggregates) -> None:
         """Update the overview section."""
-        if self._stats is None:
-            return
-
-        stats = self._stats
         overview = self.query_one("#collection-overview", Static)
 
-        # Calculate in-deck usage
-        total_in_decks = sum(c.in_deck_count for c in self._cards)
-        total_available = sum(c.available for c in self._cards)
-
         lines = [
             f"[{ui_colors.GOLD}]{stats.unique_cards:,}[/] [dim]unique cards[/]",
             f"[{ui_colors.GOLD}]{stats.total_cards:,}[/] [dim]total copies[/]",
             f"[#b86fce]{stats.total_foils:,}[/] [dim]foils ✨[/]",
             "",
-            f"[#7ec850]{total_available:,}[/] [dim]available[/]",
-            f"[#e6c84a]{total_in_decks:,}[/] [dim]in decks[/]",
+            f"[#7ec850]{stats.available:,}[/] [dim]available[/]",
+            f"[#e6c84a]{stats.in_decks:,}[/] [dim]in decks[/]",
         ]
         overview.update("\n".join(lines))
 
-    def _update_colors(self) -> None:
+    def _update_colors(self, stats: CollectionAggregates) -> None:
         """Update the color distribution section."""
-        color_counts: dict[str, int] = dict.fromkeys(MANA_COLORS, 0)
-
-        for card_data in self._cards:
-            if card_data.card and card_data.card.colors:
-                qty = card_data.total_owned
-                for color in card_data.card.colors:
-                    if color in color_counts:
-                        color_counts[color] += qty
-            elif card_data.card:
-                # Colorless
-                color_counts["C"] += card_data.total_owned
+        color_counts = {color: stats.colors.get(color, 0) for color in MANA_COLORS}
 
         total = sum(color_counts.values()) or 1
         max_count = max(color_counts.values()) or 1
@@ -248,27 +230,13 @@ class CollectionStatsPanel(Vertical):
         colors_widget = self.query_one("#collection-colors", Static)
         colors_widget.update("\n".join(lines) if lines else "[dim]No cards[/]")
 
-    def _update_types(self) -> None:
+    def _update_types(self, stats: CollectionAggregates) -> None:
         """Update the card types section."""
-        type_counts: dict[str, int] = {}
-
-        for card_data in self._cards:
-            if card_data.card and card_data.card.type:
-                qty = card_data.total_owned
-                type_line = card_data.card.type
-                # Extract primary type
-                primary_type = "Other"
-                for t in TYPE_ICONS:
-                    if t in type_line:
-                        primary_type = t
-                        break
-                type_counts[primary_type] = type_counts.get(primary_type, 0) + qty
-
-        total = sum(type_counts.values()) or 1
+        total = sum(stats.types.values()) or 1
 
         lines = []
         for type_name, (icon, color) in TYPE_ICONS.items():
-            count = type_counts.get(type_name, 0)
+            count = stats.types.get(type_name, 0)
             if count == 0:
                 continue
             pct = count * 100 // total
@@ -277,51 +245,33 @@ class CollectionStatsPanel(Vertical):
         types_widget = self.query_one("#collection-types", Static)
         types_widget.update("\n".join(lines) if lines else "[dim]No cards[/]")
 
-    def _update_curve(self) -> None:
+    def _update_curve(self, stats: CollectionAggregates) -> None:
         """Update the mana curve section."""
-        cmc_counts: dict[int, int] = {}
-
-        for card_data in self._cards:
-            if card_data.card:
-                cmc = int(card_data.card.cmc) if card_data.card.cmc else 0
-                cmc = min(cmc, 7)  # Cap at 7+
-                qty = card_data.total_owned
-                cmc_counts[cmc] = cmc_counts.get(cmc, 0) + qty
-
-        if not cmc_counts:
+        if not stats.curve:
             curve_widget = self.query_one("#collection-curve", Static)
             curve_widget.update("[dim]No cards[/]")
             return
 
-        max_count = max(cmc_counts.values()) or 1
+        max_count = max(stats.curve.values()) or 1
 
         # Vertical bar chart
         lines = []
-        for cmc in range(8):
-            count = cmc_counts.get(cmc, 0)
+        for cmc in range(CURVE_CAP + 1):
+            count = stats.curve.get(cmc, 0)
             bar_len = count * 12 // max_count if max_count > 0 else 0
             bar = "█" * bar_len
-            label = f"{cmc}+" if cmc == 7 else str(cmc)
+            label = f"{cmc}+" if cmc == CURVE_CAP else str(cmc)
             lines.append(f"[dim]{label}[/] [{ui_colors.GOLD}]{bar:12}[/] {count:>3}")
 
         curve_widget = self.query_one("#collection-curve", Static)
         curve_widget.update("\n".join(lines))
 
-    def _update_availability(self) -> None:
+    def _update_availability(self, stats: CollectionAggregates) -> None:
         """Update the availability section."""
-        fully_available = 0
-        partially_used = 0
-        fully_used = 0
-
-        for card_data in self._cards:
-            if card_data.available == card_data.total_owned:
-                fully_available += 1
-            elif card_data.available > 0:
-                partially_used += 1
-            else:
-                fully_used += 1
-
-        total = len(self._cards) or 1
+        fully_available = stats.fully_available
+        partially_used = stats.partially_used
+        fully_used = stats.fully_used
+        total = stats.unique_cards or 1
 
         lines = [
             f"[#7ec850]●[/] Fully available: {fully_available} ({fully_available * 100 // total}%)",
@@ -332,7 +282,7 @@ class CollectionStatsPanel(Vertical):
         avail_widget = self.query_one("#collection-availability", Static)
         avail_widget.update("\n".join(lines))
 
-    def _update_rarity(self) -> None:
+    def _update_rarity(self, stats: CollectionAggregates) -> None:
         """Update the rarity breakdown section."""
         rarity_config = {
             "mythic": {"color": "#ff8c00", "symbol": "★"},
@@ -340,13 +290,7 @@ class CollectionStatsPanel(Vertical):
             "uncommon": {"color": "#c0c0c0", "symbol": "◇"},
             "common": {"color": "#666", "symbol": "●"},
         }
-        rarity_counts: dict[str, int] = {}
-
-        for card_data in self._cards:
-            if card_data.card and card_data.card.rarity:
-                rarity = card_data.card.rarity.lower()
-                qty = card_data.total_owned
-                rarity_counts[rarity] = rarity_counts.get(rarity, 0) + qty
+        rarity_counts = stats.rarities
 
         total = sum(rarity_counts.values()) or 1
 
@@ -364,15 +308,9 @@ class CollectionStatsPanel(Vertical):
         rarity_widget = self.query_one("#collection-rarity", Static)
         rarity_widget.update("\n".join(lines) if lines else "[dim]No cards[/]")
 
-    def _update_sets(self) -> None:
+    def _update_sets(self, stats: CollectionAggregates) -> None:
         """Update the sets represented section."""
-        set_counts: dict[str, int] = {}
-
-        for card_data in self._cards:
-            set_code = card_data.set_code or (card_data.card.set_code if card_data.card else None)
-            if set_code:
-                qty = card_data.total_owned
-                set_counts[set_code.upper()] = set_counts.get(set_code.upper(), 0) + qty
+        set_counts = stats.sets
 
         if not set_counts:
             sets_widget = self.query_one("#collection-sets", Static)
@@ -396,16 +334,9 @@ class CollectionStatsPanel(Vertical):
         sets_widget = self.query_one("#collection-sets", Static)
         sets_widget.update("\n".join(lines))
 
-    def _update_keywords(self) -> None:
+    def _update_keywords(self, stats: CollectionAggregates) -> None:
         """Update the top keywords section."""
-        keyword_counts: dict[str, int] = {}
-
-        for card_data in self._cards:
-            if card_data.card and card_data.card.keywords:
-                qty = card_data.total_owned
-                for kw in card_data.card.keywords:
-                    if kw:
-                        keyword_counts[kw] = keyword_counts.get(kw, 0) + qty
+        keyword_counts = stats.keywords
 
         if not keyword_counts:
             kw_widget = self.query_one("#collection-keywords", Static)
@@ -425,30 +356,10 @@ class CollectionStatsPanel(Vertical):
         kw_widget = self.query_one("#collection-keywords", Static)
         kw_widget.update("\n".join(lines))
 
-    def _update_legendaries(self) -> None:
+    def _update_legendaries(self, stats: CollectionAggregates) -> None:
         """Update the legendaries section."""
-        legendary_creatures = 0
-        legendary_other = 0
-        potential_commanders: list[tuple[str, str]] = []  # (name, colors)
-
-        for card_data in self._cards:
-            if not card_data.card:
-                continue
-
-            supertypes = card_data.card.supertypes or []
-            if "Legendary" not in supertypes:
-                continue
-
-            card_type = card_data.card.type or ""
-            colors = card_data.card.color_identity or card_data.card.colors or []
-            color_str = "".join(colors) if colors else "C"
-
-            if "Creature" in card_type:
-                legendary_creatures += card_data.total_owned
-                # Track as potential commander
-                potential_commanders.append((card_data.card_name, color_str))
-            else:
-                legendary_other += card_data.total_owned
+        legendary_creatures = stats.legendary_creatures
+        legendary_other = stats.legendary_other
 
         total_legendary = legendary_creatures + legendary_other
         widget = self.query_one("#collection-legendaries", Static)
@@ -464,21 +375,15 @@ class CollectionStatsPanel(Vertical):
         ]
 
         # Show potential commanders count
-        if potential_commanders:
+        if stats.potential_commanders:
             lines.append("")
-            lines.append(f"[dim]{len(potential_commanders)} potential commanders[/]")
+            lines.append(f"[dim]{stats.potential_commanders} potential commanders[/]")
 
         widget.update("\n".join(lines))
 
-    def _update_artists(self) -> None:
+    def _update_artists(self, stats: CollectionAggregates) -> None:
         """Update the top artists section."""
-        artist_counts: dict[str, int] = {}
-
-        for card_data in self._cards:
-            if card_data.card and card_data.card.artist:
-                artist = card_data.card.artist
-                qty = card_data.total_owned
-                artist_counts[artist] = artist_counts.get(artist, 0) + qty
+        artist_counts = stats.artists
 
         if not artist_counts:
             widget = self.query_one("#collection-artists", Static)
@@ -500,115 +405,71 @@ class CollectionStatsPanel(Vertical):
         widget = self.query_one("#collection-artists", Static)
         widget.update("\n".join(lines))
 
-    def _update_quick_stats(self) -> None:
+    def _update_quick_stats(self, stats: CollectionAggregates) -> None:
         """Update the quick stats section with averages."""
-        if not self._cards:
+        if not stats.unique_cards:
             widget = self.query_one("#collection-quick-stats", Static)
             widget.update("[dim]No cards[/]")
             return
 
-        # Calculate averages
-        total_cmc = 0.0
-        cmc_count = 0
-        nonland_count = 0
-
-        for card_data in self._cards:
-            if not card_data.card:
-                continue
-
-            card_type = card_data.card.type or ""
-
-            # Skip lands for CMC average
-            if "Land" not in card_type:
-                nonland_count += card_data.total_owned
-                if card_data.card.cmc is not None:
-                    total_cmc += card_data.card.cmc * card_data.total_owned
-                    cmc_count += card_data.total_owned
-
-        avg_cmc = total_cmc / cmc_count if cmc_count > 0 else 0
-
-        # Cards per unique
-        total_copies = sum(c.total_owned for c in self._cards)
-        avg_copies = total_copies / len(self._cards) if self._cards else 0
+        # Averages (lands are skipped for the CMC average)
+        cmc_count = stats.nonland_cmc_count
+        avg_cmc = stats.nonland_cmc_total / cmc_count if cmc_count > 0 else 0
+        avg_copies = stats.total_cards / stats.unique_cards
 
         lines = [
             f"[dim]Avg CMC:[/]     [{ui_colors.GOLD}]{avg_cmc:.2f}[/]",
             f"[dim]Avg copies:[/]  [{ui_colors.GOLD}]{avg_copies:.1f}[/]x",
-            f"[dim]Non-lands:[/]   [{ui_colors.GOLD}]{nonland_count}[/]",
+            f"[dim]Non-lands:[/]   [{ui_colors.GOLD}]{stats.nonland_cards}[/]",
         ]
 
         widget = self.query_one("#collection-quick-stats", Static)
         widget.update("\n".join(lines))
 
-    @staticmethod
-    def _price_key(card_name: str, set_code: str | None, collector_number: str | None) -> str:
-        """Generate a unique key for price lookup."""
-        if set_code and collector_number:
-            return f"{card_name}|{set_code.upper()}|{collector_number}"
-        return card_name
-
-    def update_value(
-        self,
-        price_data: dict[str, tuple[float | None, float | None]],
-        cards: list[CollectionCardWithData] | None = None,
-    ) -> None:
-        """Update collection value with price data.
-
-        Args:
-            price_data: Dict mapping price_key to (usd_price, usd_foil_price) in dollars.
-            cards: Optional cards list (uses self._cards if not provided).
-        """
-        cards_to_use = cards if cards is not None else self._cards
-        total_value = 0.0
-        card_values: list[tuple[str, float]] = []
-
-        for card_data in cards_to_use:
-            key = self._price_key(
-                card_data.card_name, card_data.set_code, card_data.collector_number
-            )
-            prices = price_data.get(key)
-            if not prices:
-                continue
-
-            usd_price, foil_price = prices
-            card_value = 0.0
-
-            # Regular copies
-            if usd_price and card_data.quantity > 0:
-                card_value += usd_price * card_data.quantity
-
-            # Foil copies
-            if card_data.foil_quantity > 0:
-                foil = foil_price if foil_price else usd_price
-                if foil:
-                    card_value += foil * card_data.foil_quantity
-
-            if card_value > 0:
-                total_value += card_value
-                card_values.append((card_data.card_name, card_value))
-
-        # Update value display
+    def update_value(self, value: CollectionValue) -> None:
+        """Update the collection value section from the valuation."""
         value_widget = self.query_one("#collection-value", Static)
 
-        if total_value == 0:
+        if not value.total:
             value_widget.update("[dim]No price data[/]")
             return
 
-        # Build display lines
-        lines = [
-            f"[bold {ui_colors.GOLD}]${total_value:,.2f}[/] [dim]USD[/]",
+        lines = [f"[bold {ui_colors.GOLD}]${value.total:,.2f}[/] [dim]USD[/]"]
+
+        # Breakdowns: rarities and colors in display order, then the top sets
+        rarities = [
+            f"{rarity[0].upper()} ${value.by_rarity[rarity]:,.0f}"
+            for rarity in ("mythic", "rare", "uncommon", "common")
+            if rarity in value.by_rarity
+        ]
+        colors = [
+            f"{color} ${value.by_color[color]:,.0f}"
+            for color in ("W", "U", "B", "R", "G", "M", "C")
+            if color in value.by_color
         ]
+        top_sets = sorted(
+            ((set_code, total) for set_code, total in value.by_set.items() if set_code),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:3]
+        if rarities:
+            lines.append(f"[dim]{'  '.join(rarities)}[/]")
+        if colors:
+            lines.append(f"[dim]{'  '.join(colors)}[/]")
+        if top_sets:
+            lines.append(
+                "[dim]Top sets:[/] "
+                + "  ".join(f"{set_code} ${total:,.0f}" for set_code, total in top_sets)
+            )
 
-        if card_values:
-            card_values.sort(key=lambda x: x[1], reverse=True)
-            top_cards = card_values[:10]
+        if value.top_cards:
             lines.append("")
             lines.append("[dim]Most Valuable Cards:[/]")
-            for name, value in top_cards:
+            for name, card_value in value.top_cards:
                 # Truncate long names
                 display_name = name[:16] + "…" if len(name) > 17 else name
                 lines.append(
-                    f"  [{ui_colors.TEXT_DIM}]{display_name:17}[/] [#7ec850]${value:.2f}[/]"
+                    f"  [{ui_colors.TEXT_DIM}]{display_name:17}[/] [#7ec850]${card_value:.2f}[/]"
                 )
 
         value_widget.update("\n".join(lines))
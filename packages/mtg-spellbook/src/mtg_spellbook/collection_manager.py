@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import json
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,11 +10,18 @@ from mtg_core.data.database import UserDatabase
 from mtg_core.data.models import Card
 from mtg_core.exceptions import CardNotFoundError
 
+from .collection_stats import CollectionStatsIndex
+from .collection_value import CollectionValuation
+
 if TYPE_CHECKING:
-    from mtg_core.data.database import UnifiedDatabase
+    from mtg_core.data.database import (
+        CollectionCardRow,
+        CollectionCursor,
+        CollectionFilter,
+        UnifiedDatabase,
+    )
 
-# Default cache location
-PRICE_CACHE_PATH = Path.home() / ".mtg-spellbook" / "price_cache.json"
+    from .deck_usage import DeckUsageIndex
 
 
 @dataclass
@@ -87,85 +92,20 @@ class ImportResult:
 class CollectionManager:
     """Manages collection operations with full card data."""
 
-    # Price cache TTL in seconds (1 hour - longer since it persists to disk)
-    PRICE_CACHE_TTL = 3600.0
-
     def __init__(
         self,
         user_db: UserDatabase,
         db: UnifiedDatabase,
         cache_path: Path | None = None,
+        deck_usage: DeckUsageIndex | None = None,
     ):
         self.user = user_db
         self.db = db
-        self._cache_path = cache_path or PRICE_CACHE_PATH
-        # Price cache: dict of price_key -> (usd, usd_foil)
-        self._price_cache: dict[str, tuple[float | None, float | None]] = {}
-        self._price_cache_time: float = 0.0
-        # Load from disk on init
-        self._load_cache_from_disk()
-
-    def _load_cache_from_disk(self) -> None:
-        """Load price cache from disk if it exists and is valid."""
-        if not self._cache_path.exists():
-            return
-
-        try:
-            with self._cache_path.open() as f:
-                data = json.load(f)
-
-            cache_time = data.get("timestamp", 0)
-            # Check if cache is still valid
-            if time.time() - cache_time > self.PRICE_CACHE_TTL:
-                # Cache is stale, delete it
-                self._cache_path.unlink(missing_ok=True)
-                return
-
-            # Load prices - JSON stores tuples as arrays, convert back
-            prices = data.get("prices", {})
-            self._price_cache = {k: (v[0], v[1]) for k, v in prices.items()}
-            self._price_cache_time = cache_time
-        except (json.JSONDecodeError, KeyError, OSError):
-            # Corrupted cache, delete it
-            self._cache_path.unlink(missing_ok=True)
-
-    def _save_cache_to_disk(self) -> None:
-        """Save price cache to disk."""
-        if not self._price_cache:
-            return
-
-        try:
-            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                "timestamp": self._price_cache_time,
-                "prices": self._price_cache,
-            }
-            with self._cache_path.open("w") as f:
-                json.dump(data, f)
-        except OSError:
-            pass  # Silently fail if we can't write cache
-
-    def invalidate_price_cache(self) -> None:
-        """Invalidate the price cache (call after adding cards or changing printings)."""
-        self._price_cache = {}
-        self._price_cache_time = 0.0
-        # Delete disk cache
-        self._cache_path.unlink(missing_ok=True)
-
-    def get_cached_prices(self) -> dict[str, tuple[float | None, float | None]] | None:
-        """Get cached prices if still valid, or None if cache is stale."""
-        if not self._price_cache:
-            return None
-        if time.time() - self._price_cache_time > self.PRICE_CACHE_TTL:
-            self.invalidate_price_cache()
-            return None
-        return self._price_cache
-
-    def set_cached_prices(self, prices: dict[str, tuple[float | None, float | None]]) -> None:
-        """Cache price data (in memory and on disk)."""
-        self._price_cache = prices
-        self._price_cache_time = time.time()
-        self._save_cache_to_disk()
+        # DeckManager's usage index; without one, deck usage is queried per call
+        self._deck_usage = deck_usage
+        self.stats = CollectionStatsIndex(user_db, db, deck_usage)
+        # Prices of owned cards, snapshotted to cache_path per card data version
+        self.valuation = CollectionValuation(self.stats, db, cache_path)
 
     async def add_card(
         self,
@@ -209,6 +149,17 @@ class CollectionManager:
                 error="Must provide card_name or set_code + collector_number",
             )
 
+        return await self._add_found_card(card, quantity, foil, set_code, collector_number)
+
+    async def _add_found_card(
+        self,
+        card: Card,
+        quantity: int,
+        foil: bool,
+        set_code: str | None,
+        collector_number: str | None,
+    ) -> AddToCollectionResult:
+        """Add an already looked-up card to the collection."""
         # Add to collection (uses canonical name from DB)
         foil_qty = quantity if foil else 0
         regular_qty = 0 if foil else quantity
@@ -225,6 +176,8 @@ class CollectionManager:
         collection_card = await self.user.get_collection_card(card.name)
         new_qty = collection_card.quantity if collection_card else 0
         new_foil = collection_card.foil_quantity if collection_card else 0
+        if collection_card is not None:
+            self.stats.card_saved(collection_card, card)
 
         return AddToCollectionResult(
             success=True,
@@ -236,6 +189,7 @@ class CollectionManager:
     async def remove_card(self, card_name: str) -> bool:
         """Remove a card entirely from the collection."""
         result: bool = await self.user.remove_from_collection(card_name)
+        self.stats.card_removed(card_name)
         return result
 
     async def set_quantity(
@@ -246,6 +200,7 @@ class CollectionManager:
     ) -> None:
         """Set the quantity of a card in the collection."""
         await self.user.set_collection_quantity(card_name, quantity, foil_quantity)
+        self.stats.card_quantity_set(card_name, quantity, foil_quantity)
 
     async def update_printing(
         self,
@@ -254,7 +209,10 @@ class CollectionManager:
         collector_number: str,
     ) -> bool:
         """Update the printing (set/number) for a card in the collection."""
-        return await self.user.update_collection_printing(card_name, set_code, collector_number)
+        updated = await self.user.update_collection_printing(card_name, set_code, collector_number)
+        if updated:
+            self.stats.card_printing_set(card_name, set_code, collector_number)
+        return updated
 
     async def apply_printing_selections(
         self,
@@ -281,7 +239,7 @@ class CollectionManager:
             return None
 
         card = await self.db.get_card_by_name(card_name, include_extras=True)
-        deck_usage = await self.user.get_card_deck_usage(card_name)
+        deck_usage = await self._get_deck_usage(card_name)
         in_deck_count = sum(qty for _, qty in deck_usage)
 
         return CollectionCardWithData(
@@ -307,16 +265,50 @@ class CollectionManager:
         offset = (page - 1) * page_size
         rows = await self.user.get_collection_cards(limit=page_size, offset=offset)
         total = await self.user.get_collection_count()
+        return await self._with_card_data(rows), total
+
+    async def query_collection(
+        self,
+        filters: CollectionFilter | None = None,
+        sort: str = "name",
+        after: CollectionCursor | None = None,
+        limit: int = 100,
+    ) -> tuple[list[CollectionCardWithData], CollectionCursor | None]:
+        """Get one filtered, sorted keyset page of the collection with card data.
+
+        Filtering, sorting and paging run in SQL (see UserDatabase.query_collection);
+        card data and deck usage are loaded for the page only.
+
+        Returns (cards, cursor); pass cursor as ``after`` for the next page.
+        """
+        rows, cursor = await self.user.query_collection(filters, sort, after, limit)
+        return await self._with_card_data(rows), cursor
 
+    async def count_collection(self, filters: CollectionFilter | None = None) -> int:
+        """Count the collection cards matching a filter."""
+        count: int = await self.user.count_collection(filters)
+        return count
+
+    async def get_collection_facets(self) -> dict[str, dict[str, int]]:
+        """Get card counts per type, color and availability filter."""
+        facets: dict[str, dict[str, int]] = await self.user.get_collection_facets()
+        return facets
+
+    async def _with_card_data(self, rows: list[CollectionCardRow]) -> list[CollectionCardWithData]:
+        """Attach card data and deck usage to collection rows, in two batch lookups."""
         if not rows:
-            return [], total
+            return []
 
         # Batch load card data
         card_names = [row.card_name for row in rows]
         cards_by_name = await self.db.get_cards_by_names(card_names)
 
-        # Batch load deck usage (single query instead of N+1)
-        deck_usage_by_card = await self.user.get_cards_deck_usage_batch(card_names)
+        # Batch load deck usage (from the usage index, or a single query)
+        if self._deck_usage is not None:
+            await self._deck_usage.ensure_loaded()
+            deck_usage_by_card = self._deck_usage.get_usage_many(card_names)
+        else:
+            deck_usage_by_card = await self.user.get_cards_deck_usage_batch(card_names)
 
         # Build result with usage data
         result = []
@@ -337,14 +329,18 @@ class CollectionManager:
                     deck_usage=deck_usage,
                 )
             )
-
-        return result, total
+        return result
 
     async def get_stats(self) -> CollectionStats:
-        """Get collection statistics."""
-        unique = await self.user.get_collection_count()
-        total = await self.user.get_collection_total_cards()
-        total_foils = await self.user.get_collection_foil_total()
+        """Get collection statistics, from the stats index once it is loaded."""
+        if self.stats.loaded:
+            aggregates = self.stats.aggregates
+            return CollectionStats(
+                unique_cards=aggregates.unique_cards,
+                total_cards=aggregates.total_cards,
+                total_foils=aggregates.total_foils,
+            )
+        unique, total, total_foils = await self.user.get_collection_totals()
 
         return CollectionStats(
             unique_cards=unique,
@@ -362,11 +358,19 @@ class CollectionManager:
         if collection_card:
             owned = collection_card.quantity + collection_card.foil_quantity
 
-        deck_usage = await self.user.get_card_deck_usage(card_name)
+        deck_usage = await self._get_deck_usage(card_name)
         in_decks = sum(qty for _, qty in deck_usage)
 
         return owned, in_decks, deck_usage
 
+    async def _get_deck_usage(self, card_name: str) -> list[tuple[str, int]]:
+        """Get [(deck_name, quantity), ...] for a card, from the usage index when shared."""
+        if self._deck_usage is None:
+            usage: list[tuple[str, int]] = await self.user.get_card_deck_usage(card_name)
+            return usage
+        await self._deck_usage.ensure_loaded()
+        return self._deck_usage.get_usage(card_name)
+
     async def import_from_text(self, text: str) -> ImportResult:
         """Import cards from text format with set context support.
 
@@ -397,39 +401,48 @@ class CollectionManager:
         # Parse all lines with set context support
         parsed_cards = parse_card_list(text)
 
+        # Look up every SET NUMBER printing in one pass (handles tokens too)
+        by_printing = await self.db.get_cards_by_set_and_numbers(
+            [
+                (parsed.set_code, parsed.collector_number)
+                for parsed in parsed_cards
+                if parsed.set_code and parsed.collector_number
+            ]
+        )
+
         for parsed in parsed_cards:
-            # If SET NUMBER format, look up the card
-            card_name = parsed.card_name
-            if parsed.set_code and parsed.collector_number and not card_name:
-                # Unified database handles both regular cards and tokens
-                looked_up_card = await self.db.get_card_by_set_and_number(
-                    parsed.set_code, parsed.collector_number
-                )
-                if looked_up_card:
-                    card_name = looked_up_card.name
-                else:
+            if parsed.set_code and parsed.collector_number:
+                card = by_printing.get((parsed.set_code.upper(), parsed.collector_number))
+                if card is None:
                     errors.append(
                         f"Card not found: {parsed.set_code.upper()} #{parsed.collector_number}"
                     )
                     continue
-
-            if not card_name:
+                result = await self._add_found_card(
+                    card,
+                    parsed.quantity,
+                    parsed.foil,
+                    parsed.set_code,
+                    parsed.collector_number,
+                )
+            elif parsed.card_name:
+                result = await self.add_card(
+                    parsed.card_name,
+                    parsed.quantity,
+                    foil=parsed.foil,
+                    set_code=parsed.set_code,
+                    collector_number=parsed.collector_number,
+                )
+            else:
                 # Should not happen since parse_card_list filters out unparseable lines
                 continue
 
-            result = await self.add_card(
-                card_name,
-                parsed.quantity,
-                foil=parsed.foil,
-                set_code=parsed.set_code,
-                collector_number=parsed.collector_number,
-            )
             if result.success and result.card:
                 added += 1
                 # Only check for multiple printings if user didn't specify a printing
                 if not parsed.set_code:
                     try:
-                        printings = await self.db.get_all_printings(result.card.name)
+                        printings = await self.db.get_printing_rows(result.card.name)
                         if len(printings) > 1:
                             cards_with_printings.append(
                                 ImportedCard(
@@ -442,7 +455,7 @@ class CollectionManager:
                     except Exception:
                         pass  # If we can't get printings, skip the selection step
             elif not result.success:
-                errors.append(result.error or f"Unknown error adding {card_name}")
+                errors.append(result.error or f"Unknown error adding {parsed.card_name}")
 
         return ImportResult(
             added_count=added,
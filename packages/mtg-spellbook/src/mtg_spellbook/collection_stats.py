@@ -0,0 +1,350 @@
+"""In-memory collection statistics, updated as the collection changes."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mtg_core.data.database import CollectionCardRow, UnifiedDatabase, UserDatabase
+    from mtg_core.data.models import Card
+
+    from .deck_usage import DeckUsageIndex
+
+# Primary card types, in the order a type line is matched against them
+PRIMARY_TYPES = (
+    "Creature",
+    "Instant",
+    "Sorcery",
+    "Artifact",
+    "Enchantment",
+    "Planeswalker",
+    "Land",
+)
+
+# Mana values at or above this are counted together in the curve
+CURVE_CAP = 7
+
+K = TypeVar("K")
+
+
+@dataclass
+class CollectionEntry:
+    """One collection card as counted in the statistics."""
+
+    card_name: str
+    quantity: int
+    foil_quantity: int
+    set_code: str | None
+    collector_number: str | None
+    card: Card | None
+    in_deck_count: int = 0
+
+    @property
+    def total_owned(self) -> int:
+        """Total cards owned (regular + foil)."""
+        return self.quantity + self.foil_quantity
+
+    @property
+    def available(self) -> int:
+        """Cards available (not in any deck)."""
+        return max(0, self.total_owned - self.in_deck_count)
+
+
+@dataclass
+class CollectionAggregates:
+    """Collection-wide counts. Copy counts weigh each card by the copies owned."""
+
+    unique_cards: int = 0
+    total_cards: int = 0
+    total_foils: int = 0
+
+    # Copies in and out of decks, and cards fully available / partly / fully in decks
+    in_decks: int = 0
+    available: int = 0
+    fully_available: int = 0
+    partially_used: int = 0
+    fully_used: int = 0
+
+    colors: dict[str, int] = field(default_factory=dict)  # "C" for colorless
+    types: dict[str, int] = field(default_factory=dict)  # PRIMARY_TYPES or "Other"
+    curve: dict[int, int] = field(default_factory=dict)  # Mana value, capped at CURVE_CAP
+    rarities: dict[str, int] = field(default_factory=dict)
+    sets: dict[str, int] = field(default_factory=dict)
+    keywords: dict[str, int] = field(default_factory=dict)
+    artists: dict[str, int] = field(default_factory=dict)
+
+    legendary_creatures: int = 0
+    legendary_other: int = 0
+    potential_commanders: int = 0  # Unique legendary creature cards
+
+    # Non-land copies, and the mana value sum/count of those that have one
+    nonland_cards: int = 0
+    nonland_cmc_total: float = 0.0
+    nonland_cmc_count: int = 0
+
+
+def _count(counts: dict[K, int], key: K, amount: int) -> None:
+    total = counts.get(key, 0) + amount
+    if total:
+        counts[key] = total
+    else:
+        counts.pop(key, None)
+
+
+def _primary_type(type_line: str) -> str:
+    return next((t for t in PRIMARY_TYPES if t in type_line), "Other")
+
+
+class CollectionStatsIndex:
+    """Collection statistics, loaded once and kept current by CollectionManager.
+
+    Each card's contribution to the aggregates is subtracted and re-added when
+    it changes, so the stats panel reads totals without iterating the
+    collection. CollectionManager writes each collection change through after
+    committing it, and deck usage changes arrive from the shared DeckUsageIndex.
+    Changes made to the user database by other processes are not seen until
+    reload(), which rebuilds everything (also the recovery path).
+
+    Listeners added with add_listener() are told which card's entry changed
+    (CollectionValuation keeps its value totals current this way).
+    """
+
+    def __init__(
+        self,
+        user: UserDatabase,
+        db: UnifiedDatabase,
+        deck_usage: DeckUsageIndex | None = None,
+    ) -> None:
+        self._user = user
+        self._db = db
+        self._deck_usage = deck_usage
+        self._entries: dict[str, CollectionEntry] = {}
+        self._aggregates = CollectionAggregates()
+        self._loaded = False
+        self._loading: asyncio.Lock | None = None
+        self._writes = 0
+        self._listeners: list[Callable[[str | None], None]] = []
+        if deck_usage is not None:
+            deck_usage.add_listener(self._deck_usage_changed)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._loaded
+
+    @property
+    def aggregates(self) -> CollectionAggregates:
+        """The current collection-wide counts (updated in place)."""
+        return self._aggregates
+
+    def entries(self) -> list[CollectionEntry]:
+        """Every collection card, in no particular order."""
+        return list(self._entries.values())
+
+    def get_entry(self, card_name: str) -> CollectionEntry | None:
+        """One collection card, or None if it is not in the collection."""
+        return self._entries.get(card_name)
+
+    def add_listener(self, listener: Callable[[str | None], None]) -> None:
+        """Call listener(card_name) when a card is saved or removed, listener(None) on reload()."""
+        self._listeners.append(listener)
+
+    async def ensure_loaded(self) -> None:
+        """Load the index on first use."""
+        if self._loaded:
+            return
+        if self._loading is None:
+            self._loading = asyncio.Lock()
+        async with self._loading:
+            if not self._loaded:
+                await self.reload()
+
+    async def reload(self) -> None:
+        """Rebuild the index from the database: the collection rows plus one card lookup."""
+        if self._deck_usage is not None:
+            await self._deck_usage.ensure_loaded()  # Before the loop: loading notifies
+        while True:
+            writes = self._writes
+            count = await self._user.get_collection_count()
+            rows = await self._user.get_collection_cards(limit=max(count, 1))
+            cards = await self._db.get_cards_by_names(
+                [row.card_name for row in rows], include_extras=True
+            )
+            in_decks = await self._deck_totals([row.card_name for row in rows])
+            if writes == self._writes:
+                break  # No collection or deck change landed mid-load
+
+        self._entries = {}
+        self._aggregates = CollectionAggregates()
+        for row in rows:
+            entry = self._entry(row, cards.get(row.card_name.lower()))
+            entry.in_deck_count = in_decks.get(row.card_name, 0)
+            self._entries[row.card_name] = entry
+            self._apply(entry, 1)
+        self._loaded = True
+        for listener in self._listeners:
+            listener(None)
+
+    async def _deck_totals(self, card_names: list[str]) -> dict[str, int]:
+        """Copies of each card used across all decks."""
+        if self._deck_usage is not None:
+            return {name: self._deck_usage.get_total(name) for name in card_names}
+        totals: dict[str, int] = {}
+        for _, card_name, _, quantity in await self._user.get_deck_card_quantities():
+            totals[card_name] = totals.get(card_name, 0) + quantity
+        return totals
+
+    @staticmethod
+    def _entry(row: CollectionCardRow, card: Card | None) -> CollectionEntry:
+        return CollectionEntry(
+            card_name=row.card_name,
+            quantity=row.quantity,
+            foil_quantity=row.foil_quantity,
+            set_code=row.set_code,
+            collector_number=row.collector_number,
+            card=card,
+        )
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Write-through updates
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def card_saved(self, row: CollectionCardRow, card: Card | None) -> None:
+        """Record a card's collection row after it was added or changed."""
+        self._writes += 1
+        if not self._loaded:
+            return
+        old = self._entries.get(row.card_name)
+        entry = self._entry(row, card if card is not None or old is None else old.card)
+        entry.in_deck_count = old.in_deck_count if old is not None else self._deck_total(row)
+        self._replace(row.card_name, entry)
+
+    def card_quantity_set(self, card_name: str, quantity: int, foil_quantity: int) -> None:
+        """Set a card's quantities; a total of 0 removes it, like the database."""
+        self._writes += 1
+        old = self._entries.get(card_name)
+        if not self._loaded or old is None:
+            return
+        if quantity + foil_quantity <= 0:
+            self._replace(card_name, None)
+            return
+        entry = CollectionEntry(
+            card_name=card_name,
+            quantity=quantity,
+            foil_quantity=foil_quantity,
+            set_code=old.set_code,
+            collector_number=old.collector_number,
+            card=old.card,
+            in_deck_count=old.in_deck_count,
+        )
+        self._replace(card_name, entry)
+
+    def card_printing_set(self, card_name: str, set_code: str, collector_number: str) -> None:
+        """Record a card's new printing."""
+        self._writes += 1
+        old = self._entries.get(card_name)
+        if not self._loaded or old is None:
+            return
+        entry = CollectionEntry(
+            card_name=card_name,
+            quantity=old.quantity,
+            foil_quantity=old.foil_quantity,
+            set_code=set_code,
+            collector_number=collector_number,
+            card=old.card,
+            in_deck_count=old.in_deck_count,
+        )
+        self._replace(card_name, entry)
+
+    def card_removed(self, card_name: str) -> None:
+        """Drop a card removed from the collection."""
+        self._writes += 1
+        if self._loaded:
+            self._replace(card_name, None)
+
+    def _deck_usage_changed(self, card_name: str | None) -> None:
+        """Refresh deck counts for one card, or all of them (None) after a usage reload."""
+        self._writes += 1
+        if not self._loaded or self._deck_usage is None:
+            return
+        names = list(self._entries) if card_name is None else [card_name]
+        for name in names:
+            old = self._entries.get(name)
+            if old is None:
+                continue
+            in_decks = self._deck_usage.get_total(name)
+            if in_decks != old.in_deck_count:
+                self._apply(old, -1)
+                old.in_deck_count = in_decks
+                self._apply(old, 1)
+
+    def _deck_total(self, row: CollectionCardRow) -> int:
+        if self._deck_usage is None or not self._deck_usage.loaded:
+            return 0
+        return self._deck_usage.get_total(row.card_name)
+
+    def _replace(self, card_name: str, entry: CollectionEntry | None) -> None:
+        old = self._entries.pop(card_name, None)
+        if old is not None:
+            self._apply(old, -1)
+        if entry is not None:
+            self._entries[card_name] = entry
+            self._apply(entry, 1)
+        for listener in self._listeners:
+            listener(card_name)
+
+    def _apply(self, entry: CollectionEntry, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) one card's contribution to the aggregates."""
+        stats = self._aggregates
+        owned = entry.total_owned * sign
+
+        stats.unique_cards += sign
+        stats.total_cards += owned
+        stats.total_foils += entry.foil_quantity * sign
+
+        available = entry.available
+        stats.in_decks += entry.in_deck_count * sign
+        stats.available += available * sign
+        if available == entry.total_owned:
+            stats.fully_available += sign
+        elif available > 0:
+            stats.partially_used += sign
+        else:
+            stats.fully_used += sign
+
+        card = entry.card
+        set_code = entry.set_code or (card.set_code if card else None)
+        if set_code:
+            _count(stats.sets, set_code.upper(), owned)
+        if card is None:
+            return
+
+        for color in card.colors or ["C"]:
+            _count(stats.colors, color, owned)
+        if card.type:
+            _count(stats.types, _primary_type(card.type), owned)
+        _count(stats.curve, min(int(card.cmc) if card.cmc else 0, CURVE_CAP), owned)
+        if card.rarity:
+            _count(stats.rarities, card.rarity.lower(), owned)
+        for keyword in card.keywords or []:
+            if keyword:
+                _count(stats.keywords, keyword, owned)
+        if card.artist:
+            _count(stats.artists, card.artist, owned)
+
+        card_type = card.type or ""
+        if "Legendary" in (card.supertypes or []):
+            if "Creature" in card_type:
+                stats.legendary_creatures += owned
+                stats.potential_commanders += sign
+            else:
+                stats.legendary_other += owned
+        if "Land" not in card_type:
+            stats.nonland_cards += owned
+            if card.cmc is not None:
+                stats.nonland_cmc_total += card.cmc * owned
+                stats.nonland_cmc_count += owned
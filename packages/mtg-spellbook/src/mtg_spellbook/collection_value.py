@@ -0,0 +1,323 @@
+"""Collection valuation from cached per-printing prices."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+    from mtg_core.data.database import CollectionCardRow, UnifiedDatabase
+
+    from .collection_stats import CollectionEntry, CollectionStatsIndex
+
+# Default snapshot location
+PRICE_SNAPSHOT_PATH = Path.home() / ".mtg-spellbook" / "price_cache.json"
+
+# Per-card array columns; the last three hold codes into CollectionValuation labels
+_COLUMNS = ("quantity", "foil_quantity", "usd", "usd_foil", "set", "rarity", "color")
+_LABELLED = ("set", "rarity", "color")
+
+# Cards listed as the most valuable
+TOP_CARDS = 10
+
+
+def price_key(card_name: str, set_code: str | None, collector_number: str | None) -> str:
+    """Key a card's price: its printing if set, else the card name."""
+    if set_code and collector_number:
+        return f"{card_name}|{set_code.upper()}|{collector_number}"
+    return card_name
+
+
+def _color_bucket(colors: list[str] | None) -> str:
+    """W/U/B/R/G for mono-colored cards, M for multicolor, C for colorless."""
+    if not colors:
+        return "C"
+    return colors[0] if len(colors) == 1 else "M"
+
+
+@dataclass
+class CollectionValue:
+    """Collection value in USD, with breakdowns. Cards without a price count as 0."""
+
+    total: float = 0.0
+    by_set: dict[str, float] = field(default_factory=dict)
+    by_rarity: dict[str, float] = field(default_factory=dict)
+    by_color: dict[str, float] = field(default_factory=dict)  # Keys as in _color_bucket
+    top_cards: list[tuple[str, float]] = field(default_factory=list)  # Most valuable first
+
+
+class CollectionValuation:
+    """Collection value, kept current as the collection stats index changes.
+
+    Prices of owned cards (their printing's when set, else the card's) are looked
+    up once and saved to a snapshot on disk keyed on the card database's data
+    version, so reopening the collection, or restarting, queries prices only for
+    cards not priced before until the card database is rebuilt.
+
+    Owned cards are held as numpy arrays: quantities, prices in cents and
+    set/rarity/color codes. The total is adjusted per card as the stats index
+    reports changes; breakdowns are vectorized sums over the arrays.
+    """
+
+    def __init__(
+        self,
+        stats: CollectionStatsIndex,
+        db: UnifiedDatabase,
+        snapshot_path: Path | None = None,
+    ) -> None:
+        self._stats = stats
+        self._db = db
+        self._snapshot_path = snapshot_path or PRICE_SNAPSHOT_PATH
+        self._data_version: str | None = None
+        # price key -> (usd, usd foil) in cents; None where the card database has none
+        self._prices: dict[str, tuple[int | None, int | None]] = {}
+        # price key -> (card name, set code, collector number) still to look up
+        self._unpriced: dict[str, tuple[str, str | None, str | None]] = {}
+        self._rows: dict[str, int] = {}  # card name -> array row
+        self._names: list[str] = []
+        self._keys: list[str] = []
+        self._columns: dict[str, np.ndarray[Any, Any]] = {}
+        self._labels: dict[str, dict[str, int]] = {column: {} for column in _LABELLED}
+        self._total = 0  # Cents
+        self._loaded = False
+        self._loading: asyncio.Lock | None = None
+        stats.add_listener(self._card_changed)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the owned-card arrays have been built."""
+        return self._loaded
+
+    @property
+    def total(self) -> float:
+        """Collection value in USD."""
+        return self._total / 100
+
+    async def ensure_loaded(self) -> None:
+        """Build the arrays on first use, then price any card not priced yet."""
+        if self._loading is None:
+            self._loading = asyncio.Lock()
+        async with self._loading:
+            await self._stats.ensure_loaded()
+            await self._check_data_version()
+            if not self._loaded:
+                self._rebuild()
+                self._loaded = True
+            await self._price_pending()
+
+    async def prefetch_prices(self, cards: Iterable[CollectionCardRow]) -> None:
+        """Price collection rows into the snapshot without building the arrays."""
+        if self._loading is None:
+            self._loading = asyncio.Lock()
+        async with self._loading:
+            await self._check_data_version()
+            for card in cards:
+                self._key_for(card.card_name, card.set_code, card.collector_number)
+            await self._price_pending()
+
+    def value(self) -> CollectionValue:
+        """The total and its breakdowns by set, rarity and color, plus the top cards."""
+        if not self._rows:
+            return CollectionValue()
+        values = self._values()
+        top = [
+            (self._names[row], values[row] / 100)
+            for row in values.argsort(kind="stable")[::-1][:TOP_CARDS]
+            if values[row] > 0
+        ]
+        return CollectionValue(
+            total=self.total,
+            by_set=self._sum_by("set", values),
+            by_rarity=self._sum_by("rarity", values),
+            by_color=self._sum_by("color", values),
+            top_cards=top,
+        )
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Prices
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def _check_data_version(self) -> None:
+        """Load the snapshot for the card database's data version, dropping stale prices."""
+        version = await self._db.get_data_version()
+        if version == self._data_version:
+            return
+        self._data_version = version
+        self._prices = self._read_snapshot(version)
+        self._unpriced = {}
+        if self._loaded:
+            self._rebuild()  # Re-read every card's price
+
+    def _key_for(self, card_name: str, set_code: str | None, collector_number: str | None) -> str:
+        """A card's price key, queued for lookup if it has no price yet."""
+        key = price_key(card_name, set_code, collector_number)
+        if key not in self._prices:
+            self._unpriced[key] = (card_name, set_code, collector_number)
+        return key
+
+    async def _price_pending(self) -> None:
+        """Look up every queued price in two batch queries and save the snapshot."""
+        if not self._unpriced:
+            return
+        pending, self._unpriced = self._unpriced, {}
+        printings = [(s, n) for _, s, n in pending.values() if s and n]
+        names = [name for name, s, n in pending.values() if not (s and n)]
+        by_printing = await self._db.get_prices_by_set_and_numbers(printings)
+        by_name = await self._db.get_prices_by_names(names)
+
+        for key, (name, set_code, number) in pending.items():
+            if set_code and number:
+                self._prices[key] = by_printing.get((set_code.upper(), number), (None, None))
+            else:
+                self._prices[key] = by_name.get(name.lower(), (None, None))
+
+        if self._rows:
+            for row, key in enumerate(self._keys):
+                if key in pending:
+                    usd, usd_foil = self._prices[key]
+                    self._columns["usd"][row] = usd or 0
+                    self._columns["usd_foil"][row] = usd_foil or 0
+            self._total = int(self._values().sum())
+        self._write_snapshot()
+
+    def _read_snapshot(self, version: str) -> dict[str, tuple[int | None, int | None]]:
+        """Prices saved for this data version, or none."""
+        try:
+            with self._snapshot_path.open() as f:
+                data = json.load(f)
+            if data.get("data_version") != version:
+                return {}
+            return {key: (value[0], value[1]) for key, value in data["prices"].items()}
+        except (json.JSONDecodeError, KeyError, TypeError, IndexError, AttributeError, OSError):
+            return {}
+
+    def _write_snapshot(self) -> None:
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._snapshot_path.open("w") as f:
+                json.dump({"data_version": self._data_version, "prices": self._prices}, f)
+        except OSError:
+            pass  # Prices are looked up again next time
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Owned-card arrays
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _card_changed(self, card_name: str | None) -> None:
+        """Stats index listener: update one card's row, or rebuild (None)."""
+        if not self._loaded:
+            return
+        if card_name is None:
+            self._rebuild()
+            return
+        entry = self._stats.get_entry(card_name)
+        row = self._rows.get(card_name)
+        if row is not None:
+            self._total -= self._row_value(row)
+            if entry is None:
+                self._remove_row(row)
+                return
+        else:
+            if entry is None:
+                return
+            row = self._append_row(card_name)
+        self._set_row(row, entry)
+        self._total += self._row_value(row)
+
+    def _rebuild(self) -> None:
+        import numpy as np
+
+        entries = self._stats.entries()
+        self._rows = {entry.card_name: row for row, entry in enumerate(entries)}
+        self._names = [entry.card_name for entry in entries]
+        self._keys = [""] * len(entries)
+        self._columns = {
+            column: np.zeros(max(len(entries), 16), dtype=np.int64) for column in _COLUMNS
+        }
+        for row, entry in enumerate(entries):
+            self._set_row(row, entry)
+        self._total = int(self._values().sum())
+
+    def _set_row(self, row: int, entry: CollectionEntry) -> None:
+        key = self._key_for(entry.card_name, entry.set_code, entry.collector_number)
+        usd, usd_foil = self._prices.get(key, (None, None))
+        card = entry.card
+        set_code = entry.set_code or (card.set_code if card else None)
+        self._keys[row] = key
+        columns = self._columns
+        columns["quantity"][row] = entry.quantity
+        columns["foil_quantity"][row] = entry.foil_quantity
+        columns["usd"][row] = usd or 0
+        columns["usd_foil"][row] = usd_foil or 0
+        columns["set"][row] = self._code("set", set_code.upper() if set_code else "")
+        columns["rarity"][row] = self._code(
+            "rarity", card.rarity.lower() if card and card.rarity else ""
+        )
+        columns["color"][row] = self._code("color", _color_bucket(card.colors) if card else "")
+
+    def _append_row(self, card_name: str) -> int:
+        import numpy as np
+
+        row = len(self._names)
+        capacity = len(self._columns["quantity"])
+        if row >= capacity:
+            for column, values in self._columns.items():
+                grown = np.zeros(capacity * 2, dtype=np.int64)
+                grown[:capacity] = values
+                self._columns[column] = grown
+        self._rows[card_name] = row
+        self._names.append(card_name)
+        self._keys.append("")
+        return row
+
+    def _remove_row(self, row: int) -> None:
+        """Drop a row by moving the last row into its place."""
+        last = len(self._names) - 1
+        del self._rows[self._names[row]]
+        if row != last:
+            for values in self._columns.values():
+                values[row] = values[last]
+            self._names[row] = self._names[last]
+            self._keys[row] = self._keys[last]
+            self._rows[self._names[row]] = row
+        for values in self._columns.values():
+            values[last] = 0
+        self._names.pop()
+        self._keys.pop()
+
+    def _code(self, column: str, label: str) -> int:
+        labels = self._labels[column]
+        return labels.setdefault(label, len(labels))
+
+    def _row_value(self, row: int) -> int:
+        """One card's value in cents; foils without a foil price use the regular price."""
+        c = self._columns
+        usd = int(c["usd"][row])
+        foil = int(c["usd_foil"][row]) or usd
+        return int(c["quantity"][row]) * usd + int(c["foil_quantity"][row]) * foil
+
+    def _values(self) -> np.ndarray[Any, Any]:
+        """Every card's value in cents (the _row_value() of each row)."""
+        import numpy as np
+
+        size = len(self._names)
+        c = {column: values[:size] for column, values in self._columns.items()}
+        foil = np.where(c["usd_foil"] > 0, c["usd_foil"], c["usd"])
+        values: np.ndarray[Any, Any] = c["quantity"] * c["usd"] + c["foil_quantity"] * foil
+        return values
+
+    def _sum_by(self, column: str, values: np.ndarray[Any, Any]) -> dict[str, float]:
+        """Value per label of a coded column, for labels with any value."""
+        import numpy as np
+
+        labels = self._labels[column]
+        codes = self._columns[column][: len(values)]
+        sums = np.bincount(codes, weights=values, minlength=len(labels))
+        return {label: float(sums[code]) / 100 for label, code in labels.items() if sums[code]}
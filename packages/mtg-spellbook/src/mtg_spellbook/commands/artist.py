@@ -39,7 +39,12 @@ class ArtistCommandsMixin:
             self, message: str, *, severity: str = "information", timeout: float = 3
         ) -> None: ...
 
+        def _prefetch_next_page(self) -> Any: ...
+
         async def _load_card_extras(self, card: Any, panel_id: str = "#card-panel") -> None: ...
+        async def _load_card_details(
+            self, items: list[Any], start_index: int
+        ) -> list[CardDetail]: ...
 
     @work
     async def show_artist(self, artist_name: str, select_card: str | None = None) -> None:
@@ -53,7 +58,6 @@ class ArtistCommandsMixin:
             return
 
         from mtg_core.tools import artists as artist_tools
-        from mtg_core.tools import cards as card_tools
 
         from ..pagination import PaginationState
         from ..widgets import ResultsList
@@ -107,25 +111,10 @@ class ArtistCommandsMixin:
         if select_page > 1:
             self._pagination.go_to_page(select_page)
 
-        # Load card details for current page using UUIDs (to get correct artist's version)
-        self._current_results = []
-        page_start = (self._pagination.current_page - 1) * ARTIST_PAGE_SIZE
-        for i, summary in enumerate(self._pagination.current_page_items):
-            global_idx = page_start + i
-            try:
-                uuid = self._artist_card_uuids.get(global_idx)
-                if uuid:
-                    # Use UUID to get the exact printing by this artist
-                    detail = await card_tools.get_card(self._db, uuid=uuid)
-                else:
-                    # Fallback to name lookup
-                    detail = await card_tools.get_card(self._db, name=summary.name)
-                self._current_results.append(detail)
-            except Exception:
-                logger.debug("Failed to load card detail for %s", summary.name, exc_info=True)
-
-        # Cache first page
-        self._pagination.cache_details(self._pagination.current_page, self._current_results)
+        # Load and cache the current page using UUIDs (to get correct artist's version)
+        self._current_results = await self._pagination.load_page(
+            self._pagination.current_page, self._load_card_details
+        )
 
         if not self._current_results:
             self._show_message(f"[yellow]Could not load cards for artist: {artist_name}[/]")
@@ -147,25 +136,21 @@ class ArtistCommandsMixin:
             self._update_menu_card_state()
 
         self._update_card_panel(self._current_card)
+        self._prefetch_next_page()
         await self._load_card_extras(self._current_card)
 
     def _display_artist_results(self) -> None:
-        """Display artist results for current page using unified CardResultItem."""
+        """Display artist results for current page using unified card result formatting."""
         from ..widgets import ResultsList
-        from ..widgets.card_result_item import CardResultItem
+        from ..widgets.card_result_item import format_card_result
 
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
-        for card in self._current_results:
-            # Use unified CardResultItem for consistent formatting
-            results_list.append(CardResultItem(card))
+        results_list.show([format_card_result(card) for card in self._current_results])
 
         self._update_pagination_header()
 
         if self._current_results:
             results_list.focus()
-            results_list.index = 0
 
     def _show_results_view(self) -> None:
         """Show results container and hide dashboard."""
@@ -65,8 +65,6 @@ class BlockCommandsMixin:
         if not self._db:
             return
 
-        from textual.widgets import Label, ListItem
-
         from ..widgets import ResultsList
 
         # Get recent sets (expansions and core sets only)
@@ -79,17 +77,15 @@ class BlockCommandsMixin:
             self._show_message("[yellow]No recent sets found[/]")
             return
 
-        results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
+        labels: list[str] = []
         for s in sets:
             type_display = (s.type or "").replace("_", " ").title()
-            label = (
+            labels.append(
                 f"[cyan]{s.code.upper()}[/] [bold]{s.name}[/]  "
                 f"[dim]{s.release_date or '?'}[/]  "
                 f"[dim]{type_display}[/]"
             )
-            results_list.append(ListItem(Label(label)))
+        self.query_one("#results-list", ResultsList).show_lines(labels)
 
         self._update_results_header(f"Recent Sets ({len(sets)})")
 
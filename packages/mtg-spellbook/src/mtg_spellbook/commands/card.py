@@ -35,6 +35,11 @@ class CardCommandsMixin:
         def _update_card_panel(self, card: Any) -> None: ...
         def _update_pagination_header(self) -> None: ...
         def _show_message(self, message: str) -> None: ...
+        def _prefetch_next_page(self) -> Any: ...
+
+        async def _load_card_details(
+            self, items: list[Any], start_index: int
+        ) -> list[CardDetail]: ...
 
     @work
     async def lookup_card(
@@ -131,24 +136,12 @@ class CardCommandsMixin:
             page_size=25,
         )
 
-        # Load first page
-        self._current_results = []
-        for summary in self._pagination.current_page_items:
-            try:
-                # Use uuid if available for exact printing, otherwise fall back to name
-                if summary.uuid:
-                    detail = await cards.get_card(self._db, uuid=summary.uuid)
-                else:
-                    detail = await cards.get_card(self._db, name=summary.name)
-                self._current_results.append(detail)
-            except CardNotFoundError:
-                pass
-
-        # Cache first page
-        self._pagination.cache_details(1, self._current_results)
+        # Load and cache first page (by uuid for exact printings, in one batch)
+        self._current_results = await self._pagination.load_page(1, self._load_card_details)
 
         self._update_results(self._current_results)
         self._update_pagination_header()
+        self._prefetch_next_page()
 
         if self._current_results:
             self._current_card = self._current_results[0]
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from textual.widgets import Static
 
 from ..ui.theme import ui_colors
-from ..widgets.card_result_item import CardResultItem
+from ..widgets.card_result_item import format_card_result
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import CardDetail
@@ -26,20 +26,13 @@ class CommandHelpersMixin:
         """Update the results list with enhanced formatting."""
         from ..widgets import ResultsList
 
+        # Highlight the first result, but don't auto-focus the results list -
+        # let user stay in search input
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
-        for card in results:
-            # Use unified CardResultItem for consistent formatting
-            results_list.append(CardResultItem(card))
+        results_list.show([format_card_result(card) for card in results])
 
         self._update_results_header(f"Results ({len(results)})")
 
-        # Set index to 0 so first item is highlighted when user navigates
-        # Don't auto-focus results list - let user stay in search input
-        if results:
-            results_list.index = 0
-
     def _update_results_header(self, text: str) -> None:
         """Update results header text with enhanced styling."""
         header = self.query_one("#results-header", Static)
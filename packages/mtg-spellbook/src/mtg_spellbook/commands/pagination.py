@@ -5,9 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from textual import work
-from textual.widgets import Label, ListItem, Static
+from textual.widgets import Static
 
-from mtg_core.exceptions import CardNotFoundError
 from mtg_core.tools import cards
 
 from ..formatting import prettify_mana
@@ -109,23 +108,10 @@ class PaginationCommandsMixin:
         ):
             await self._load_more_set_cards_async(self._pagination.current_page)
 
-        # Check cache first
-        cached = self._pagination.get_cached_details(self._pagination.current_page)
-        if cached:
-            self._current_results = cached
-            self._pagination.is_loading = False
-            self._display_current_page_results()
-            # Prefetch next page in background
-            self._prefetch_next_page()
-            return
-
-        # Load card details for current page
-        current_items = self._pagination.current_page_items
-        page_start = (self._pagination.current_page - 1) * self._pagination.page_size
-        details = await self._load_card_details(current_items, page_start)
-
-        # Cache and display
-        self._pagination.cache_details(self._pagination.current_page, details)
+        # Cached, prefetched, or loaded now
+        details = await self._pagination.load_page(
+            self._pagination.current_page, self._load_card_details
+        )
         self._current_results = details
         self._pagination.is_loading = False
         self._display_current_page_results()
@@ -157,24 +143,20 @@ class PaginationCommandsMixin:
         from ..widgets import ResultsList
 
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
-        for card in self._current_results:
-            label = self._format_result_line(card)
-            results_list.append(ListItem(Label(label)))
+        results_list.show(
+            [self._format_result_line(card) for card in self._current_results], row_height=1
+        )
 
         self._update_pagination_header()
 
         if self._current_results:
             results_list.focus()
-            results_list.index = 0
 
     def _display_synergy_results(self) -> None:
         """Display synergy results for current page with 10-segment score bar."""
         from ..widgets import ResultsList
 
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
 
         type_icons = {
             "keyword": "\U0001f511",
@@ -184,6 +166,7 @@ class PaginationCommandsMixin:
             "archetype": "\U0001f3db\ufe0f",
         }
 
+        rows: list[str] = []
         for card in self._current_results:
             info = self._synergy_info.get(card.name, {})
             score = info.get("score", 0)
@@ -224,13 +207,14 @@ class PaginationCommandsMixin:
             if reason:
                 lines.append(f"    [dim italic]{reason}[/]")
 
-            results_list.append(ListItem(Label("\n".join(lines))))
+            rows.append("\n".join(lines))
+
+        results_list.show(rows)
 
         self._update_pagination_header()
 
         if self._current_results:
             results_list.focus()
-            results_list.index = 0
 
     def _update_pagination_header(self) -> None:
         """Update the pagination header display."""
@@ -280,33 +264,36 @@ class PaginationCommandsMixin:
             header.update(text)
 
     async def _load_card_details(self, items: list[Any], start_index: int) -> list[CardDetail]:
-        """Load card details for a list of items.
+        """Load card details for a list of items in bulk.
+
+        Items are looked up by UUID (the exact printing) when they have one and by
+        name otherwise, with one batched query per kind rather than per item.
 
         Args:
             items: List of card summaries or items with name attribute
             start_index: Global index of first item (for artist UUID lookup)
 
         Returns:
-            List of loaded CardDetail objects
+            List of loaded CardDetail objects, in item order; cards not found are skipped
         """
-        details: list[CardDetail] = []
+        artist_uuids = getattr(self, "_artist_card_uuids", {}) if self._artist_mode else {}
+        keys: list[tuple[str | None, str]] = []
         for i, item in enumerate(items):
-            try:
-                # In artist mode, use UUID to get the correct artist's version
-                if self._artist_mode and hasattr(self, "_artist_card_uuids"):
-                    global_idx = start_index + i
-                    uuid = self._artist_card_uuids.get(global_idx)
-                    if uuid:
-                        detail = await cards.get_card(self._db, uuid=uuid)
-                        details.append(detail)
-                        continue
-
-                # Fallback: name-based lookup for search/synergy modes
-                name = item.name if hasattr(item, "name") else str(item)
-                detail = await cards.get_card(self._db, name=name)
+            # In artist mode, use UUID to get the correct artist's version
+            uuid = artist_uuids.get(start_index + i) or getattr(item, "uuid", None)
+            name = item.name if hasattr(item, "name") else str(item)
+            keys.append((uuid, name))
+
+        uuids = [uuid for uuid, _ in keys if uuid]
+        names = [name for uuid, name in keys if not uuid]
+        by_uuid = await cards.get_cards_by_uuids(self._db, uuids) if uuids else {}
+        by_name = await cards.get_cards_by_names(self._db, names) if names else {}
+
+        details: list[CardDetail] = []
+        for uuid, name in keys:
+            detail = by_uuid.get(uuid) if uuid else by_name.get(name.lower())
+            if detail is not None:
                 details.append(detail)
-            except CardNotFoundError:
-                continue  # Card not loadable, skip
         return details
 
     @work
@@ -314,22 +301,7 @@ class PaginationCommandsMixin:
         """Prefetch the next page in background for faster navigation."""
         if not self._pagination or not self._db:
             return
-
-        next_page = self._pagination.current_page + 1
-        if next_page > self._pagination.total_pages:
-            return
-
-        # Already cached?
-        if self._pagination.get_cached_details(next_page) is not None:
-            return
-
-        # Get items for next page
-        start = (next_page - 1) * self._pagination.page_size
-        end = start + self._pagination.page_size
-        next_items = self._pagination.all_items[start:end]
-
-        details = await self._load_card_details(next_items, start)
-        self._pagination.cache_details(next_page, details)
+        await self._pagination.prefetch(self._pagination.current_page + 1, self._load_card_details)
 
     def _format_result_line(self, card: Any) -> str:
         """Format a search result line with enhanced typography.
@@ -6,10 +6,8 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from textual import work
-from textual.widgets import Label, ListItem, Static
 
 from mtg_core.exceptions import SetNotFoundError
-from mtg_core.tools import cards as card_tools
 from mtg_core.tools import sets
 
 if TYPE_CHECKING:
@@ -48,7 +46,12 @@ class SetCommandsMixin:
         ) -> None: ...
         def run_worker(self, coro: Any) -> Any: ...
 
+        def _prefetch_next_page(self) -> Any: ...
+
         async def _load_card_extras(self, card: Any, panel_id: str = "#card-panel") -> None: ...
+        async def _load_card_details(
+            self, items: list[Any], start_index: int
+        ) -> list[CardDetail]: ...
 
     @work
     async def browse_sets(self, query: str = "") -> None:
@@ -62,12 +65,10 @@ class SetCommandsMixin:
 
         from ..widgets import ResultsList
 
-        results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
-        for s in result.sets[:50]:
-            label = f"[cyan]{s.code.upper()}[/] {s.name} [dim]({s.release_date or '?'})[/]"
-            results_list.append(ListItem(Label(label)))
+        self.query_one("#results-list", ResultsList).show_lines(
+            f"[cyan]{s.code.upper()}[/] {s.name} [dim]({s.release_date or '?'})[/]"
+            for s in result.sets[:50]
+        )
 
         self._update_results_header(f"Sets ({len(result.sets)})")
 
@@ -101,7 +102,7 @@ class SetCommandsMixin:
 
         # Search for first batch of cards in this set
         filters = SearchCardsInput(set_code=set_code, page_size=100)
-        cards, total = await self._db.search_cards(filters)
+        cards, total = await self._db.search_card_rows(filters)
 
         if not cards:
             self._show_message(f"[yellow]No cards found in set: {set_code.upper()}[/]")
@@ -150,20 +151,10 @@ class SetCommandsMixin:
         # Set total override so pagination shows correct total count
         self._pagination.total_override = total
 
-        # Load card details for current page
-        self._current_results = []
-        for summary in self._pagination.current_page_items:
-            try:
-                if summary.uuid:
-                    detail = await card_tools.get_card(self._db, uuid=summary.uuid)
-                else:
-                    detail = await card_tools.get_card(self._db, name=summary.name)
-                self._current_results.append(detail)
-            except Exception:
-                logger.debug("Failed to load card detail for %s", summary.name, exc_info=True)
-
-        # Cache first page
-        self._pagination.cache_details(self._pagination.current_page, self._current_results)
+        # Load and cache card details for current page
+        self._current_results = await self._pagination.load_page(
+            self._pagination.current_page, self._load_card_details
+        )
 
         if not self._current_results:
             self._show_message(f"[yellow]Could not load cards for set: {set_code.upper()}[/]")
@@ -180,24 +171,21 @@ class SetCommandsMixin:
             self._update_menu_card_state()
 
         self._update_card_panel(self._current_card)
+        self._prefetch_next_page()
         await self._load_card_extras(self._current_card)
 
     def _display_set_results(self) -> None:
         """Display set results for current page."""
         from ..widgets import ResultsList
-        from ..widgets.card_result_item import CardResultItem
+        from ..widgets.card_result_item import format_card_result
 
         results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
-        for card in self._current_results:
-            results_list.append(CardResultItem(card))
+        results_list.show([format_card_result(card) for card in self._current_results])
 
         self._update_pagination_header()
 
         if self._current_results:
             results_list.focus()
-            results_list.index = 0
 
     async def _load_more_set_cards_async(self, _target_page: int) -> None:
         """Load more cards for set browsing when paginating beyond loaded items.
@@ -221,7 +209,7 @@ class SetCommandsMixin:
             page_size=db_page_size,
             page=db_page,
         )
-        cards, _ = await self._db.search_cards(filters)
+        cards, _ = await self._db.search_card_rows(filters)
 
         if not cards:
             return
@@ -279,9 +267,6 @@ class SetCommandsMixin:
 
             from ..widgets import ResultsList
 
-            results_list = self.query_one("#results-list", ResultsList)
-            results_list.clear()
-
             lines = [
                 f"[bold]{result.name}[/] [{result.code.upper()}]",
                 "",
@@ -289,9 +274,7 @@ class SetCommandsMixin:
                 f"[bold]Released:[/] {result.release_date or 'Unknown'}",
                 f"[bold]Cards:[/] {result.total_set_size or 'Unknown'}",
             ]
-            from textual.widgets import ListItem
-
-            results_list.append(ListItem(Static("\n".join(lines))))
+            self.query_one("#results-list", ResultsList).show_lines(lines)
 
         except SetNotFoundError:
             self._show_message(f"[red]Set not found: {code}[/]")
@@ -306,9 +289,6 @@ class SetCommandsMixin:
 
         from ..widgets import ResultsList
 
-        results_list = self.query_one("#results-list", ResultsList)
-        results_list.clear()
-
         lines = [
             "[bold]📊 Database Statistics[/]",
             "",
@@ -316,9 +296,7 @@ class SetCommandsMixin:
             f"  [bold]Sets:[/]    [cyan]{stats.get('total_sets', '?'):,}[/]",
             f"  [bold]Version:[/] [dim]{stats.get('data_version', 'unknown')}[/]",
         ]
-        from textual.widgets import ListItem
-
-        results_list.append(ListItem(Static("\n".join(lines))))
+        self.query_one("#results-list", ResultsList).show_lines(lines)
 
     @work
     async def show_set_detail(self, set_code: str) -> None:
@@ -332,34 +310,33 @@ class SetCommandsMixin:
             # Get set info - returns a SetDetail response, need to get the Set model
             set_data = await self._db.get_set(set_code)
 
-            # Get all cards in set
-            cards = await self._db.get_cards_in_set(set_code)
+            # Get all cards in set, in collector number order
+            from mtg_core.data.models.responses import CardSummary
+
+            summaries: list[CardSummary] = [
+                CardSummary(
+                    uuid=row.uuid,
+                    name=row.name,
+                    mana_cost=row.mana_cost,
+                    cmc=row.cmc,
+                    type=row.type,
+                    colors=row.colors,
+                    color_identity=row.color_identity,
+                    rarity=row.rarity,
+                    set_code=row.set_code,
+                    collector_number=row.number,
+                    keywords=row.keywords,
+                    power=row.power,
+                    toughness=row.toughness,
+                )
+                async for rows in self._db.get_set_cards(set_code)
+                for row in rows
+            ]
 
-            if not cards:
+            if not summaries:
                 self._show_message(f"[yellow]No cards found in set: {set_code.upper()}[/]")
                 return
 
-            # Convert Card objects to CardSummary
-            summaries: list[CardSummary] = []
-            for card in cards:
-                from mtg_core.data.models.responses import CardSummary
-
-                summaries.append(
-                    CardSummary(
-                        name=card.name,
-                        mana_cost=card.mana_cost,
-                        cmc=card.cmc,
-                        type=card.type,
-                        colors=card.colors or [],
-                        color_identity=card.color_identity or [],
-                        rarity=card.rarity,
-                        set_code=card.set_code,
-                        keywords=card.keywords or [],
-                        power=card.power,
-                        toughness=card.toughness,
-                    )
-                )
-
             # Get set statistics
             db_stats = await self._db.get_set_stats(set_code)
 
@@ -370,6 +347,8 @@ class SetCommandsMixin:
                 color_distribution=db_stats.color_distribution,
                 mechanics=db_stats.mechanics,
                 avg_cmc=db_stats.avg_cmc,
+                type_distribution=db_stats.type_distribution,
+                total_value_usd=db_stats.total_value_usd,
             )
 
             # Mount and show the set detail view
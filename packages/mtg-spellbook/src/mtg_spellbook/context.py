@@ -79,10 +79,14 @@ class DatabaseContext:
         if self._collection_manager is None:
             db = await self.get_db()
             user = await self.get_user_db()
+            deck_manager = await self.get_deck_manager()
             if user is not None:
                 from mtg_spellbook.collection_manager import CollectionManager
 
-                self._collection_manager = CollectionManager(user, db)
+                # Share the deck manager's usage index so deck edits show up at once
+                self._collection_manager = CollectionManager(
+                    user, db, deck_usage=deck_manager.usage if deck_manager else None
+                )
         return self._collection_manager
 
     async def get_keywords(self) -> set[str]:
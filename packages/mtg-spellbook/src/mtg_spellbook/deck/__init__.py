@@ -16,9 +16,9 @@ from .editor_panel import (
     CardMovedToSideboard,
     CardQuantityChanged,
     CardRemoved,
-    DeckCardItem,
     DeckEditorPanel,
     SortOrder,
+    format_deck_card_row,
 )
 from .enhanced_stats import EnhancedDeckStats
 from .full_builder import FullDeckBuilder
@@ -38,7 +38,6 @@ __all__ = [
     "CardQuantityChanged",
     "CardRemoved",
     "ConfirmDeleteModal",
-    "DeckCardItem",
     "DeckCreated",
     "DeckEditorPanel",
     "DeckListItem",
@@ -52,4 +51,5 @@ __all__ = [
     "NewDeckModal",
     "QuickFilterBar",
     "SortOrder",
+    "format_deck_card_row",
 ]
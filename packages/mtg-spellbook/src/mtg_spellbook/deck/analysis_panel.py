@@ -3,22 +3,26 @@
 from __future__ import annotations
 
 import contextlib
-import re
-from collections import Counter
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 
+from mtg_core.tools.deck_analysis import DeckAnalyzer
+
 from ..ui.theme import rarity_colors, ui_colors
 
 if TYPE_CHECKING:
-    from mtg_core.tools.recommendations.spellbook_combos import SpellbookComboMatch
+    from mtg_core.tools.recommendations.spellbook_combos import (
+        SpellbookComboDetector,
+        SpellbookComboMatch,
+    )
 
-    from ..deck_manager import DeckWithCards
+    from ..deck_manager import DeckCardWithData, DeckWithCards
 
 
 # Mana colors
@@ -84,6 +88,31 @@ class DeckAnalysis:
     # Card rarities for display (card_name -> rarity)
     card_rarities: dict[str, str]
 
+    # Non-land copies per mana value (7 = 7+)
+    curve: dict[int, int] = field(default_factory=dict)
+
+
+def _load_combo_detector() -> SpellbookComboDetector | None:
+    """Get the shared Commander Spellbook detector, if its database is present."""
+    try:
+        from mtg_core.tools.recommendations.spellbook_combos import get_spellbook_detector
+
+        detector = get_spellbook_detector()
+    except Exception:
+        return None
+    return detector if detector.combo_count > 0 else None
+
+
+def _open_limited_stats() -> Any | None:
+    """Open the 17Lands stats database for this thread, if present."""
+    try:
+        from mtg_core.tools.recommendations.limited_stats import LimitedStatsDB
+
+        db = LimitedStatsDB()
+    except Exception:
+        return None
+    return db if db.is_available else None
+
 
 # Theme descriptions - short and practical
 THEME_DESCRIPTIONS: dict[str, str] = {
@@ -129,7 +158,9 @@ THEME_MATCHUPS: dict[str, tuple[list[str], list[str]]] = {
 class DeckAnalysisPanel(VerticalScroll):
     """Full deck analysis panel showing combos, themes, stats.
 
-    Uses a simple single-Static approach for reliable rendering.
+    Uses a simple single-Static approach for reliable rendering. Statistics come
+    from a DeckAnalyzer that is kept between updates, so re-analyzing an edited
+    deck only processes the cards that changed.
     """
 
     DEFAULT_CSS = """
@@ -176,6 +207,11 @@ class DeckAnalysisPanel(VerticalScroll):
         super().__init__(id=id)
         self._analysis: DeckAnalysis | None = None
         self._deck: DeckWithCards | None = None
+        self._analyzer = DeckAnalyzer()
+        self._analyzer.subscribe(self._on_analyzer_changed)
+        self._analyzer_lock = threading.Lock()
+        self._analyzed_deck_id: int | None = None
+        self._rarity_cache: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         # Create both widgets upfront - show/hide as needed
@@ -200,14 +236,19 @@ class DeckAnalysisPanel(VerticalScroll):
         self._deck = deck
 
         if deck is None or deck.mainboard_count == 0:
+            self._analysis = None
+            self._analyzed_deck_id = None
             self._show_empty()
             return
 
-        # Show loading state immediately
-        self._show_loading()
+        # Show loading state when switching decks; edits keep the current view
+        if deck.id != self._analyzed_deck_id or self._analysis is None:
+            self._analysis = None
+            self._show_loading()
 
-        # Run analysis in background
-        self._run_analysis(deck, collection_cards, prices)
+        # Run analysis in background on a snapshot; edits patch the live deck
+        # in place on this thread while the worker is reading
+        self._run_analysis(deck.id, deck.commander, deck.mainboard, collection_cards, prices)
 
     def _show_loading(self) -> None:
         """Show loading state while analysis runs."""
@@ -227,13 +268,15 @@ class DeckAnalysisPanel(VerticalScroll):
     @work(exclusive=True, group="deck_analysis", thread=True)
     def _run_analysis(
         self,
-        deck: DeckWithCards,
+        deck_id: int,
+        commander: str | None,
+        mainboard: list[DeckCardWithData],
         collection_cards: set[str] | None,
         prices: dict[str, float] | None,
     ) -> None:
         """Run deck analysis in background thread."""
         # Perform analysis (CPU-bound work) in thread
-        self._analysis = self._analyze_deck(deck, collection_cards, prices)
+        self._analysis = self._analyze_deck(deck_id, commander, mainboard, collection_cards, prices)
 
         # Schedule UI update on main thread
         self.app.call_from_thread(self._update_content)
@@ -679,16 +722,12 @@ class DeckAnalysisPanel(VerticalScroll):
 
         return "\n".join(lines)
 
-    def _build_curve_text(self, a: DeckAnalysis, deck: DeckWithCards) -> str:
+    def _build_curve_text(self, a: DeckAnalysis, _deck: DeckWithCards) -> str:
         """Build mana curve with visual vertical bar chart."""
         lines = [f"[bold {ui_colors.GOLD}]━━━ 📈 Mana Curve ━━━[/]", ""]
 
-        # Calculate curve
         curve: dict[int, int] = dict.fromkeys(range(8), 0)
-        for card in deck.mainboard:
-            if card.card and "Land" not in (card.card.type or ""):
-                cmc = min(int(card.card.cmc or 0), 7)
-                curve[cmc] += card.quantity
+        curve.update(a.curve)
 
         max_count = max(curve.values()) if curve.values() else 1
         bar_height = 6
@@ -916,216 +955,104 @@ class DeckAnalysisPanel(VerticalScroll):
 
     def _analyze_deck(
         self,
-        deck: DeckWithCards,
+        deck_id: int,
+        commander: str | None,
+        mainboard: list[DeckCardWithData],
         collection_cards: set[str] | None = None,
         prices: dict[str, float] | None = None,
     ) -> DeckAnalysis:
-        """Perform complete deck analysis."""
-        prices = prices or {}
-        collection_cards = collection_cards or set()
-
-        # Basic counts
-        card_count = deck.mainboard_count
-        land_count = 0
-        total_cmc: float = 0.0
-        spell_count = 0
-
-        # Type counts
-        creatures = 0
-        instants = 0
-        sorceries = 0
-        artifacts = 0
-        enchantments = 0
-        planeswalkers = 0
-        lands = 0
-
-        # Color counts
-        colors: dict[str, int] = {"W": 0, "U": 0, "B": 0, "R": 0, "G": 0}
-
-        # Health metrics
-        interaction_count = 0
-        draw_count = 0
-        ramp_count = 0
-
-        # Keywords
-        keyword_counter: Counter[str] = Counter()
-
-        # Tribe detection
-        tribe_counter: Counter[str] = Counter()
-
-        # Collection tracking
-        owned_count = 0
-        needed_count = 0
-
-        # Price tracking
-        total_price = 0.0
-        card_prices: list[tuple[str, float]] = []
-
-        # Process each card
-        for card_data in deck.mainboard:
-            card = card_data.card
-            qty = card_data.quantity
-
-            if not card:
-                continue
-
-            card_type = card.type or ""
-
-            # Type classification
-            if "Land" in card_type:
-                lands += qty
-                land_count += qty
-            else:
-                if card.cmc is not None:
-                    total_cmc += card.cmc * qty
-                    spell_count += qty
-
-            if "Creature" in card_type:
-                creatures += qty
-            if "Instant" in card_type:
-                instants += qty
-            if "Sorcery" in card_type:
-                sorceries += qty
-            if "Artifact" in card_type:
-                artifacts += qty
-            if "Enchantment" in card_type:
-                enchantments += qty
-            if "Planeswalker" in card_type:
-                planeswalkers += qty
-
-            # Color pips
-            if card.mana_cost:
-                for color in "WUBRG":
-                    colors[color] += card.mana_cost.count(f"{{{color}}}") * qty
-
-            # Keywords
-            if card.keywords:
-                for kw in card.keywords:
-                    keyword_counter[kw] += qty
-
-            # Tribe detection
-            if "Creature" in card_type and card.type and "—" in card.type:
-                subtypes = card.type.split("—")[1].strip().split()
-                for subtype in subtypes:
-                    if subtype not in ("Legendary", "Token", "Basic"):
-                        tribe_counter[subtype] += qty
-
-            # Health detection
-            text = (card.text or "").lower()
-
-            # Interaction
-            if any(
-                word in text
-                for word in [
-                    "destroy",
-                    "exile",
-                    "counter",
-                    "damage",
-                    "return",
-                    "-1/-1",
-                    "sacrifice",
-                ]
-            ):
-                interaction_count += qty
-
-            # Draw
-            if any(word in text for word in ["draw", "scry", "look at"]):
-                draw_count += qty
-
-            # Ramp
-            if any(
-                word in text
-                for word in [
-                    "add {",
-                    "add one mana",
-                    "search your library for a",
-                    "mana of any",
-                ]
-            ):
-                ramp_count += qty
-
-            # Collection status
-            if card_data.card_name in collection_cards:
-                owned_count += qty
-            else:
-                needed_count += qty
-
-            # Price
-            price = prices.get(card_data.card_name, 0)
-            if price > 0:
-                total_price += price * qty
-                card_prices.append((card_data.card_name, price))
+        """Apply the deck's changes to the analyzer and snapshot the result.
 
-        # Calculate averages
-        avg_cmc = total_cmc / spell_count if spell_count > 0 else 0
+        ``mainboard`` must be a copy owned by the caller, not the live deck's
+        card list, since this runs in the analysis worker. Switching decks
+        reloads the analyzer; re-analyzing the same deck only re-processes the
+        cards whose quantities changed. ``prices=None`` keeps the prices from
+        the previous run.
+        """
+        with self._analyzer_lock:
+            analyzer = self._analyzer
+            if deck_id != self._analyzed_deck_id:
+                analyzer.clear()
+                analyzer.combo_detector = _load_combo_detector()
+                self._analyzed_deck_id = deck_id
+
+            limited_stats = _open_limited_stats()
+            analyzer.limited_stats = limited_stats
+            try:
+                with analyzer.batch():
+                    analyzer.set_commander(commander)
+                    analyzer.set_owned(collection_cards)
+                    if prices is not None:
+                        analyzer.set_prices(prices)
+                    analyzer.sync(mainboard)
+            finally:
+                analyzer.limited_stats = None
+                if limited_stats is not None:
+                    limited_stats.close()
+
+            analysis = self._analysis
+            if analysis is None:
+                # Nothing changed since the last run, but nothing is shown yet
+                analysis = self._analysis = self._snapshot(analyzer)
+            return analysis
+
+    def _on_analyzer_changed(self, analyzer: DeckAnalyzer) -> None:
+        """Snapshot the analyzer after a change (runs in the analysis worker)."""
+        self._analysis = self._snapshot(analyzer)
+
+    def _snapshot(self, a: DeckAnalyzer) -> DeckAnalysis:
+        """Build display data from the analyzer's running aggregates."""
+        creatures = a.type_count("Creature")
+        instants = a.type_count("Instant")
+        sorceries = a.type_count("Sorcery")
+        pips = a.pips
 
-        # Archetype detection
         archetype, confidence = self._detect_archetype(
-            creatures, instants, sorceries, lands, avg_cmc, card_count
+            creatures, instants, sorceries, a.land_count, a.avg_cmc, a.card_count
         )
 
-        # Theme detection
-        themes = self._detect_themes(deck)
-
-        # Card synergy detection
-        synergy_pairs = self._detect_synergies(deck)
-
-        # Dominant tribe
-        dominant_tribe = tribe_counter.most_common(1)[0][0] if tribe_counter else None
-        if dominant_tribe and tribe_counter[dominant_tribe] < 8:
-            dominant_tribe = None
-
-        # Top keywords
-        top_keywords = keyword_counter.most_common(10)
-
-        # Build card rarities dict from deck cards
-        card_rarities: dict[str, str] = {}
-        for card_data in deck.mainboard:
-            if card_data.card and card_data.card.rarity:
-                card_rarities[card_data.card_name] = card_data.card.rarity
-
-        # Get combos
-        combos = self._detect_combos(deck)
+        # Complete combos first, then the best-scoring near misses
+        combos = a.combos(limit=10)
+        for match in combos:
+            match._score = a.combo_score(match.combo.id)  # type: ignore[attr-defined]
 
         # Look up rarities for any missing combo cards not in the deck
+        card_rarities = a.card_rarities()
         self._fill_missing_rarities(combos, card_rarities)
 
-        # 17Lands data
-        tier_counts, top_cards = self._get_17lands_data(deck)
-
-        # Most expensive cards
-        card_prices.sort(key=lambda x: -x[1])
-        expensive_cards = card_prices[:5]
+        curve: dict[int, int] = dict.fromkeys(range(8), 0)
+        curve.update(a.curve)
 
         return DeckAnalysis(
-            card_count=card_count,
-            land_count=land_count,
-            avg_cmc=avg_cmc,
-            colors={c: v for c, v in colors.items() if v > 0},
+            card_count=a.card_count,
+            land_count=a.land_count,
+            avg_cmc=a.avg_cmc,
+            colors={c: pips[c] for c in "WUBRG" if pips.get(c, 0) > 0},
             creatures=creatures,
             instants=instants,
             sorceries=sorceries,
-            artifacts=artifacts,
-            enchantments=enchantments,
-            planeswalkers=planeswalkers,
-            lands=lands,
-            interaction_count=interaction_count,
-            draw_count=draw_count,
-            ramp_count=ramp_count,
+            artifacts=a.type_count("Artifact"),
+            enchantments=a.type_count("Enchantment"),
+            planeswalkers=a.type_count("Planeswalker"),
+            lands=a.land_count,
+            interaction_count=a.flag_count("interaction"),
+            draw_count=a.flag_count("draw"),
+            ramp_count=a.flag_count("ramp"),
             archetype=archetype,
             archetype_confidence=confidence,
-            dominant_themes=themes,
-            dominant_tribe=dominant_tribe,
-            keywords=top_keywords,
-            synergy_pairs=synergy_pairs,
+            dominant_themes=a.dominant_themes(),
+            dominant_tribe=a.dominant_tribe(),
+            keywords=a.top_keywords(10),
+            synergy_pairs=a.synergy_pairs(12),
             combos=combos,
-            tier_counts=tier_counts,
-            top_cards=top_cards,
-            owned_count=owned_count,
-            needed_count=needed_count,
-            total_price=total_price,
-            expensive_cards=expensive_cards,
+            tier_counts=a.tier_counts,
+            top_cards=a.top_tier_cards(5),
+            owned_count=a.owned_count,
+            needed_count=a.needed_count,
+            total_price=a.total_price,
+            expensive_cards=a.expensive_cards(5),
             card_rarities=card_rarities,
+            curve=curve,
         )
 
     def _detect_archetype(
@@ -1157,158 +1084,14 @@ class DeckAnalysisPanel(VerticalScroll):
         else:
             return "Mixed", 40
 
-    def _detect_themes(self, deck: DeckWithCards) -> list[tuple[str, int]]:
-        """Detect deck themes from card text, returning theme and card count."""
-        themes: Counter[str] = Counter()
-        theme_patterns = {
-            "Tokens": r"create.*token|token.*creature|populate",
-            "Graveyard": r"graveyard|return.*from.*graveyard|mill|flashback|unearth",
-            "Counters": r"\+1/\+1 counter|proliferate|counter.*creature",
-            "Sacrifice": r"sacrifice|when.*dies|whenever.*dies|aristocrat",
-            "Lifegain": r"gain.*life|lifelink|whenever you gain life",
-            "Artifacts": r"artifact.*enters|for each artifact|metalcraft|affinity",
-            "Enchantments": r"enchantment.*enters|constellation|whenever.*enchantment",
-            "Spellslinger": r"whenever you cast.*instant|whenever you cast.*sorcery|prowess|magecraft",
-            "Blink": r"exile.*return|flicker|enters the battlefield",
-            "Landfall": r"land.*enters|landfall|play.*additional land",
-            "Reanimator": r"return.*graveyard.*battlefield|reanimate|unearth",
-            "Voltron": r"equipment|aura|attach|equipped creature|enchanted creature",
-        }
-
-        for card_data in deck.mainboard:
-            if not card_data.card or not card_data.card.text:
-                continue
-            text = card_data.card.text.lower()
-            for theme, pattern in theme_patterns.items():
-                if re.search(pattern, text, re.IGNORECASE):
-                    themes[theme] += card_data.quantity
-
-        # Return themes with at least 4 cards, as (theme, count) tuples
-        return [(theme, count) for theme, count in themes.most_common(4) if count >= 4]
-
-    def _detect_synergies(self, deck: DeckWithCards) -> list[tuple[str, str, str]]:
-        """Detect card-to-card synergies using mtg_core and 17Lands data."""
-        synergies: list[tuple[str, str, str]] = []
-        seen_pairs: set[tuple[str, str]] = set()
-
-        def add_pair(card1: str, card2: str, reason: str) -> None:
-            """Add a synergy pair if not already seen."""
-            pair = (min(card1, card2), max(card1, card2))
-            if pair not in seen_pairs and card1 != card2:
-                seen_pairs.add(pair)
-                synergies.append((card1, card2, reason))
-
-        # 1. Check 17Lands synergy data first (data-driven synergies)
-        try:
-            from mtg_core.tools.recommendations.limited_stats import LimitedStatsDB
-
-            db = LimitedStatsDB()
-            if db.is_available:
-                card_names = {c.card_name for c in deck.mainboard}
-
-                # Query synergy pairs that have both cards in the deck
-                for card_data in deck.mainboard:
-                    pairs = db.get_synergy_pairs(card_data.card_name)
-                    for pair in pairs:
-                        if (
-                            pair.card_b in card_names
-                            and pair.synergy_lift
-                            and pair.synergy_lift > 0.02
-                        ):
-                            lift_pct = int(pair.synergy_lift * 100)
-                            add_pair(
-                                pair.card_a,
-                                pair.card_b,
-                                f"Gameplay: +{lift_pct}% WR together",
-                            )
-        except (ImportError, AttributeError, Exception):
-            pass  # get_synergy_pairs may not exist yet
-
-        # 2. Pattern-based synergies from mtg_core
-        try:
-            from mtg_core.tools.synergy import ABILITY_SYNERGIES, KEYWORD_SYNERGIES
-        except ImportError:
-            return synergies[:12]
-
-        # Build card index: card_name -> text_lower
-        card_index: dict[str, str] = {}
-        for card_data in deck.mainboard:
-            if card_data.card and card_data.card.text:
-                card_index[card_data.card_name] = card_data.card.text.lower()
-
-        # Check each card for ability synergies
-        for card_data in deck.mainboard:
-            if not card_data.card or not card_data.card.text:
-                continue
-
-            card_name = card_data.card_name
-            card_text = card_data.card.text.lower()
-
-            # Check ability patterns
-            for pattern, search_terms in ABILITY_SYNERGIES.items():
-                if re.search(pattern, card_text, re.IGNORECASE):
-                    for search_term, reason in search_terms:
-                        for other_name, other_text in card_index.items():
-                            if other_name != card_name and re.search(
-                                search_term, other_text, re.IGNORECASE
-                            ):
-                                add_pair(card_name, other_name, reason)
-
-            # Check keyword synergies
-            if card_data.card.keywords:
-                for keyword in card_data.card.keywords:
-                    if keyword in KEYWORD_SYNERGIES:
-                        for search_term, reason in KEYWORD_SYNERGIES[keyword]:
-                            for other_name, other_text in card_index.items():
-                                if other_name != card_name and re.search(
-                                    search_term, other_text, re.IGNORECASE
-                                ):
-                                    add_pair(card_name, other_name, f"{keyword}: {reason}")
-
-        return synergies[:12]
-
-    def _detect_combos(self, deck: DeckWithCards) -> list[SpellbookComboMatch]:
-        """Detect complete and near-complete combos in the deck.
-
-        Shows combos the user has or is close to completing (missing 1-2 cards).
-        This helps with deck building by suggesting what cards to add.
-        """
-        try:
-            from mtg_core.tools.recommendations.spellbook_combos import (
-                get_spellbook_detector,
-            )
-
-            detector = get_spellbook_detector()
-            card_names = [c.card_name for c in deck.mainboard]
-
-            # Include commander if present
-            if deck.commander:
-                card_names.append(deck.commander)
-
-            # Find combos missing 0-2 pieces (complete + near-complete)
-            # min_present=1 so 2-card combos show when you have 1 piece
-            matches, _ = detector.find_missing_pieces(
-                card_names,
-                max_missing=2,  # Show combos missing up to 2 cards
-                min_present=1,  # Include 2-card combos where you have 1 piece
-            )
-
-            # Score each combo and sort by: missing_count first, then score
-            # This way complete combos come first, but within each tier
-            # the best combos (by score) are shown
-            for match in matches:
-                match._score = detector.get_combo_score(match.combo)  # type: ignore[attr-defined]
-
-            matches.sort(key=lambda m: (m.missing_count, -getattr(m, "_score", 0)))
-
-            return matches[:10]  # Return top 10
-        except (ImportError, Exception):
-            return []
-
     def _fill_missing_rarities(
         self, matches: list[SpellbookComboMatch], card_rarities: dict[str, str]
     ) -> None:
-        """Look up rarities for missing combo cards from the card database."""
+        """Look up rarities for missing combo cards from the card database.
+
+        Results (including misses, cached as "") are kept across runs so an
+        edit only queries names it has not seen before.
+        """
         import sqlite3
 
         from mtg_core.config import get_settings
@@ -1317,8 +1100,13 @@ class DeckAnalysisPanel(VerticalScroll):
         missing_names: set[str] = set()
         for match in matches:
             for card_name in match.missing_cards:
-                if card_name not in card_rarities:
+                if card_name in card_rarities:
+                    continue
+                cached = self._rarity_cache.get(card_name)
+                if cached is None:
                     missing_names.add(card_name)
+                elif cached:
+                    card_rarities[card_name] = cached
 
         if not missing_names:
             return
@@ -1339,31 +1127,10 @@ class DeckAnalysisPanel(VerticalScroll):
                 GROUP BY name
             """
             cursor = conn.execute(query, list(missing_names))
+            self._rarity_cache.update(dict.fromkeys(missing_names, ""))
             for name, rarity in cursor:
                 card_rarities[name] = rarity
+                self._rarity_cache[name] = rarity
             conn.close()
         except Exception:
             pass  # Fail silently, cards will just use default color
-
-    def _get_17lands_data(
-        self, deck: DeckWithCards
-    ) -> tuple[dict[str, int], list[tuple[str, str, float | None]]]:
-        """Get 17Lands tier data for deck cards."""
-        tier_counts: dict[str, int] = {}
-        top_cards: list[tuple[str, str, float | None]] = []
-
-        try:
-            from mtg_core.data.database.limited_stats import LimitedStatsDB
-
-            db = LimitedStatsDB()
-            for card_data in deck.mainboard:
-                stats = db.get_card_stats(card_data.card_name)
-                if stats and stats.tier:
-                    tier = stats.tier.upper()
-                    tier_counts[tier] = tier_counts.get(tier, 0) + card_data.quantity
-                    if tier in ("S", "A") and len(top_cards) < 5:
-                        top_cards.append((card_data.card_name, tier, stats.gih_wr))
-        except (ImportError, Exception):
-            pass
-
-        return tier_counts, top_cards
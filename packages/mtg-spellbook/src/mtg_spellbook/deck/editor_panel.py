@@ -10,15 +10,17 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
-from textual.widgets import ListItem, ListView, Static
+from textual.widgets import Static
 
 from ..formatting import prettify_mana
+from ..ui.formatters import CardFormatters
 from ..ui.theme import ui_colors
+from ..widgets.virtual_list import VirtualList
 from .messages import DeckSelected
 from .stats_panel import DeckStatsPanel
 
 if TYPE_CHECKING:
-    from ..deck_manager import DeckCardWithData, DeckManager, DeckWithCards
+    from ..deck_manager import DeckCardWithData, DeckChange, DeckManager, DeckWithCards
 
 
 class SortOrder(Enum):
@@ -29,67 +31,32 @@ class SortOrder(Enum):
     TYPE = "type"
 
 
-class DeckCardItem(ListItem):
-    """A single card in the deck editor.
+def format_deck_card_row(card: DeckCardWithData) -> str:
+    """Format a deck card as a row: quantity, name and mana, then its type.
 
     Uses shared CardFormatters for consistent styling with search results.
     """
+    data = card.card
+    mana = prettify_mana(data.mana_cost) if data and data.mana_cost else ""
+    card_type = data.type if data else None
+    qty_color = ui_colors.GOLD if card.quantity > 1 else "white"
+    rarity_color = CardFormatters.get_rarity_color(data.rarity if data else None)
+    type_icon = CardFormatters.get_type_icon(card_type or "")
+    type_color = CardFormatters.get_type_color(card_type or "")
 
-    def __init__(
-        self,
-        card_name: str,
-        quantity: int,
-        mana_cost: str | None = None,
-        card_type: str | None = None,
-        cmc: float = 0,
-        is_sideboard: bool = False,
-        set_code: str | None = None,
-        collector_number: str | None = None,
-        rarity: str | None = None,
-        is_owned: bool | None = None,  # None = unknown, True = owned, False = needed
-    ) -> None:
-        super().__init__()
-        self.card_name = card_name
-        self.quantity = quantity
-        self.mana_cost = mana_cost
-        self.card_type = card_type
-        self.cmc = cmc
-        self.is_sideboard = is_sideboard
-        self.set_code = set_code
-        self.collector_number = collector_number
-        self.rarity = rarity
-        self.is_owned = is_owned
-
-    def compose(self) -> ComposeResult:
-        from ..ui.formatters import CardFormatters
-
-        mana = prettify_mana(self.mana_cost) if self.mana_cost else ""
-        qty_color = ui_colors.GOLD if self.quantity > 1 else "white"
-        rarity_color = CardFormatters.get_rarity_color(self.rarity)
-        type_icon = CardFormatters.get_type_icon(self.card_type or "")
-        type_color = CardFormatters.get_type_color(self.card_type or "")
+    # Line 1: quantity + name + mana (colored by rarity)
+    line1 = f"[{qty_color}]{card.quantity}x[/] [bold {rarity_color}]{card.card_name}[/]  {mana}"
 
-        # Ownership indicator
-        if self.is_owned is True:
-            owned_indicator = "[green]✓[/] "
-        elif self.is_owned is False:
-            owned_indicator = "[yellow]⚠[/] "
-        else:
-            owned_indicator = ""
+    # Line 2: type icon + type (compact, optional)
+    line2_parts = []
+    if type_icon:
+        line2_parts.append(f"[{type_color}]{type_icon}[/]")
+    if card_type:
+        type_str = card_type if len(card_type) <= 20 else card_type[:17] + "..."
+        line2_parts.append(f"[dim]{type_str}[/]")
+    line2 = "   " + "  ".join(line2_parts) if line2_parts else ""
 
-        # Line 1: owned indicator + quantity + name + mana (colored by rarity)
-        line1 = f"{owned_indicator}[{qty_color}]{self.quantity}x[/] [bold {rarity_color}]{self.card_name}[/]  {mana}"
-
-        # Line 2: type icon + type (compact, optional)
-        line2_parts = []
-        if type_icon:
-            line2_parts.append(f"[{type_color}]{type_icon}[/]")
-        if self.card_type:
-            type_str = self.card_type if len(self.card_type) <= 20 else self.card_type[:17] + "..."
-            line2_parts.append(f"[dim]{type_str}[/]")
-        line2 = "   " + "  ".join(line2_parts) if line2_parts else ""
-
-        yield Static(f"{line1}\n{line2}" if line2 else line1)
+    return f"{line1}\n{line2}" if line2 else line1
 
 
 class CardQuantityChanged(Message):
@@ -189,21 +156,14 @@ class DeckEditorPanel(Vertical):
         scrollbar-color-hover: #e6c84a;
     }
 
-    #mainboard-list > ListItem, #sideboard-list > ListItem {
+    #mainboard-list > .virtual-list--row, #sideboard-list > .virtual-list--row {
         padding: 0 1;
-        height: auto;
-        border-bottom: solid #1a1a1a;
         background: #121212;
     }
 
-    #mainboard-list > ListItem:hover, #sideboard-list > ListItem:hover {
-        background: #1a1a2e;
-        border-left: solid #5a5a6e;
-    }
-
-    #mainboard-list > ListItem.-highlight, #sideboard-list > ListItem.-highlight {
+    #mainboard-list > .virtual-list--row-highlighted,
+    #sideboard-list > .virtual-list--row-highlighted {
         background: #2a2a4e;
-        border-left: heavy #c9a227;
     }
 
     #deck-stats-container {
@@ -241,12 +201,12 @@ class DeckEditorPanel(Vertical):
                     f"[{ui_colors.GOLD_DIM}]Mainboard[/] [dim](sorted by name)[/]",
                     id="mainboard-header",
                 )
-                yield ListView(id="mainboard-list")
+                yield VirtualList(format_deck_card_row, row_height=2, id="mainboard-list")
                 yield Static(
                     f"[{ui_colors.GOLD_DIM}]Sideboard[/]",
                     id="sideboard-header",
                 )
-                yield ListView(id="sideboard-list")
+                yield VirtualList(format_deck_card_row, row_height=2, id="sideboard-list")
             with Vertical(id="deck-stats-container"):
                 yield DeckStatsPanel(id="deck-stats-panel")
         # Enhanced footer with color-coded shortcuts
@@ -273,33 +233,41 @@ class DeckEditorPanel(Vertical):
         self._deck = deck
         self._refresh_display()
 
-    def _refresh_display(self) -> None:
-        """Refresh the entire display."""
-        deck = self._deck
-        header = self.query_one("#deck-editor-header", Static)
-        mainboard = self.query_one("#mainboard-list", ListView)
-        sideboard = self.query_one("#sideboard-list", ListView)
-        stats_panel = self.query_one("#deck-stats-panel", DeckStatsPanel)
+    def apply_change(self, change: DeckChange) -> None:
+        """Show a deck edit by patching only the changed card's rows.
 
-        mainboard.clear()
-        sideboard.clear()
+        Quantity changes update the card's row in place and removals drop it;
+        a card new to a board needs its sorted position, so that rebuilds the
+        lists (from the patched deck, without reloading it).
+        """
+        deck = self._deck
+        if deck is None or change.deck_id != deck.id:
+            return
+        deck.apply_change(change)
 
-        if deck is None:
-            header.update("[bold]No deck loaded[/]")
-            stats_panel.update_stats(None)
-            # Add empty state message
-            mainboard.append(
-                ListItem(
-                    Static(
-                        f"\n[dim]No deck selected.\n\nPress [{ui_colors.GOLD}]Backspace[/] to return to deck list.[/]"
-                    )
-                )
+        for is_sideboard, entry in change.boards.items():
+            list_view: VirtualList[DeckCardWithData] = self.query_one(
+                "#sideboard-list" if is_sideboard else "#mainboard-list", VirtualList
             )
-            return
+            index = list_view.find_index(lambda row: row.card_name == change.card_name)
+            if index is None:
+                if entry is not None:
+                    self._refresh_display()
+                    return
+            elif entry is None:
+                list_view.remove_row(index)
+            else:
+                list_view.update_row(index, entry)
+
+        self._update_headers(deck)
+        self.query_one("#deck-stats-panel", DeckStatsPanel).update_stats(deck)
 
-        # Update header
+    def _update_headers(self, deck: DeckWithCards) -> None:
+        """Update the deck, mainboard and sideboard headers."""
         format_str = f" ({deck.format})" if deck.format else ""
-        header.update(f"[bold {ui_colors.GOLD_DIM}]{deck.name}[/]{format_str}")
+        self.query_one("#deck-editor-header", Static).update(
+            f"[bold {ui_colors.GOLD_DIM}]{deck.name}[/]{format_str}"
+        )
 
         # Update sort indicator with prominent display
         sort_arrows = {"name": "▲ A-Z", "cmc": "▲ CMC", "type": "▲ Type"}
@@ -315,25 +283,31 @@ class DeckEditorPanel(Vertical):
             f"[{ui_colors.GOLD_DIM}]Sideboard[/] [{ui_colors.GOLD}]{deck.sideboard_count}[/]"
         )
 
-        # Sort and populate mainboard
-        sorted_main = self._sort_cards(deck.mainboard)
-        if sorted_main:
-            for card in sorted_main:
-                mainboard.append(self._create_card_item(card, is_sideboard=False))
-        else:
-            # Add empty mainboard message
-            mainboard.append(
-                ListItem(
-                    Static(
-                        f"\n[dim]Deck is empty.\n\nAdd cards with [{ui_colors.GOLD}]Ctrl+E[/] from search.[/]"
-                    )
-                )
-            )
+    def _refresh_display(self) -> None:
+        """Refresh the entire display."""
+        deck = self._deck
+        header = self.query_one("#deck-editor-header", Static)
+        mainboard: VirtualList[DeckCardWithData] = self.query_one("#mainboard-list", VirtualList)
+        sideboard: VirtualList[DeckCardWithData] = self.query_one("#sideboard-list", VirtualList)
+        stats_panel = self.query_one("#deck-stats-panel", DeckStatsPanel)
+
+        if deck is None:
+            header.update("[bold]No deck loaded[/]")
+            stats_panel.update_stats(None)
+            # Empty state message
+            mainboard.empty_text = f"\n[dim]No deck selected.\n\nPress [{ui_colors.GOLD}]Backspace[/] to return to deck list.[/]"
+            mainboard.clear()
+            sideboard.clear()
+            return
 
-        # Sort and populate sideboard
-        sorted_side = self._sort_cards(deck.sideboard)
-        for card in sorted_side:
-            sideboard.append(self._create_card_item(card, is_sideboard=True))
+        self._update_headers(deck)
+
+        # Sort and populate both boards; the mainboard shows a hint when empty
+        mainboard.empty_text = (
+            f"\n[dim]Deck is empty.\n\nAdd cards with [{ui_colors.GOLD}]Ctrl+E[/] from search.[/]"
+        )
+        mainboard.set_rows(self._sort_cards(deck.mainboard), index=None)
+        sideboard.set_rows(self._sort_cards(deck.sideboard), index=None)
 
         # Update stats
         stats_panel.update_stats(deck)
@@ -374,70 +348,40 @@ class DeckEditorPanel(Vertical):
         # Fallback for any future SortOrder values
         return list(cards)
 
-    def _create_card_item(self, card: DeckCardWithData, is_sideboard: bool) -> DeckCardItem:
-        """Create a DeckCardItem from card data."""
-        mana_cost = card.card.mana_cost if card.card else None
-        card_type = card.card.type if card.card else None
-        cmc = card.card.cmc or 0 if card.card else 0
-        rarity = card.card.rarity if card.card else None
-        return DeckCardItem(
-            card_name=card.card_name,
-            quantity=card.quantity,
-            mana_cost=mana_cost,
-            card_type=card_type,
-            cmc=cmc,
-            is_sideboard=is_sideboard,
-            set_code=card.set_code,
-            collector_number=card.collector_number,
-            rarity=rarity,
-        )
-
-    def _get_selected_card(self) -> tuple[DeckCardItem | None, bool]:
+    def _get_selected_card(self) -> tuple[DeckCardWithData | None, bool]:
         """Get the currently selected card and whether it's in sideboard."""
-        mainboard = self.query_one("#mainboard-list", ListView)
-        sideboard = self.query_one("#sideboard-list", ListView)
-
-        if (
-            self._active_list == "mainboard"
-            and mainboard.highlighted_child
-            and isinstance(mainboard.highlighted_child, DeckCardItem)
-        ):
-            return mainboard.highlighted_child, False
-        if (
-            self._active_list == "sideboard"
-            and sideboard.highlighted_child
-            and isinstance(sideboard.highlighted_child, DeckCardItem)
-        ):
-            return sideboard.highlighted_child, True
-
-        return None, False
+        is_sideboard = self._active_list == "sideboard"
+        list_view: VirtualList[DeckCardWithData] = self.query_one(
+            f"#{self._active_list}-list", VirtualList
+        )
+        return list_view.highlighted_row, is_sideboard
 
     def action_nav_up(self) -> None:
         """Navigate up in the active list."""
         list_id = f"#{self._active_list}-list"
-        self.query_one(list_id, ListView).action_cursor_up()
+        self.query_one(list_id, VirtualList).action_cursor_up()
 
     def action_nav_down(self) -> None:
         """Navigate down in the active list."""
         list_id = f"#{self._active_list}-list"
-        self.query_one(list_id, ListView).action_cursor_down()
+        self.query_one(list_id, VirtualList).action_cursor_down()
 
     def action_focus_mainboard(self) -> None:
         """Focus the mainboard list."""
         self._active_list = "mainboard"
-        self.query_one("#mainboard-list", ListView).focus()
+        self.query_one("#mainboard-list", VirtualList).focus()
 
     def action_focus_sideboard(self) -> None:
         """Focus the sideboard list."""
         self._active_list = "sideboard"
-        self.query_one("#sideboard-list", ListView).focus()
+        self.query_one("#sideboard-list", VirtualList).focus()
 
-    @on(ListView.Highlighted)
-    def on_list_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted)
+    def on_list_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Track which list is active."""
-        if event.list_view.id == "mainboard-list":
+        if event.virtual_list.id == "mainboard-list":
             self._active_list = "mainboard"
-        elif event.list_view.id == "sideboard-list":
+        elif event.virtual_list.id == "sideboard-list":
             self._active_list = "sideboard"
 
     def action_cycle_sort(self) -> None:
@@ -487,12 +431,10 @@ class DeckEditorPanel(Vertical):
         async def do_change() -> None:
             assert self._deck_manager is not None
             assert self._deck is not None
-            await self._deck_manager.set_quantity(
+            change = await self._deck_manager.set_quantity(
                 self._deck.id, card_name, new_quantity, is_sideboard
             )
-            # Reload deck data
-            updated = await self._deck_manager.get_deck(self._deck.id)
-            self.update_deck(updated)
+            self.apply_change(change)
             self.post_message(CardQuantityChanged(card_name, new_quantity, is_sideboard))
 
         self.app.call_later(do_change)
@@ -511,10 +453,9 @@ class DeckEditorPanel(Vertical):
         async def do_remove() -> None:
             assert self._deck_manager is not None
             assert self._deck is not None
-            await self._deck_manager.remove_card(self._deck.id, card_name, is_sideboard)
-            # Reload deck data
-            updated = await self._deck_manager.get_deck(self._deck.id)
-            self.update_deck(updated)
+            change = await self._deck_manager.remove_card(self._deck.id, card_name, is_sideboard)
+            if change:
+                self.apply_change(change)
             self.app.notify(f"Removed {card_name}")
             self.post_message(CardRemoved(card_name, is_sideboard))
 
@@ -535,12 +476,10 @@ class DeckEditorPanel(Vertical):
             assert self._deck_manager is not None
             assert self._deck is not None
             if to_sideboard:
-                await self._deck_manager.move_to_sideboard(self._deck.id, card_name)
+                change = await self._deck_manager.move_to_sideboard(self._deck.id, card_name)
             else:
-                await self._deck_manager.move_to_mainboard(self._deck.id, card_name)
-            # Reload deck data
-            updated = await self._deck_manager.get_deck(self._deck.id)
-            self.update_deck(updated)
+                change = await self._deck_manager.move_to_mainboard(self._deck.id, card_name)
+            self.apply_change(change)
             location = "sideboard" if to_sideboard else "mainboard"
             self.app.notify(f"Moved {card_name} to {location}")
             self.post_message(CardMovedToSideboard(card_name, to_sideboard))
@@ -8,6 +8,8 @@ from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Static
 
+from mtg_core.tools.deck_analysis import DeckAnalyzer, FlagRule, text_rule
+
 from ..ui.theme import ui_colors
 
 if TYPE_CHECKING:
@@ -24,6 +26,13 @@ MANA_CONFIG = {
     "C": {"symbol": "{C}", "color": "#95A5A6", "name": "Colorless", "icon": "C"},
 }
 
+# Health heuristics counted by the analyzer
+ENHANCED_FLAG_RULES: dict[str, FlagRule] = {
+    "interaction": text_rule("destroy", "exile", "counter", "return target", "damage to"),
+    "draw": text_rule("draw a card", "draw cards", "draws a card", "draw two", "draw three"),
+    "mana_sources": text_rule("add {", "add one mana", "for mana", nonland_only=True),
+}
+
 
 class EnhancedDeckStats(Vertical):
     """Beautiful, comprehensive deck statistics panel.
@@ -87,6 +96,11 @@ class EnhancedDeckStats(Vertical):
     def __init__(self, *, id: str | None = None) -> None:
         super().__init__(id=id)
         self._deck: DeckWithCards | None = None
+        self._analyzer = DeckAnalyzer(flag_rules=ENHANCED_FLAG_RULES)
+        self._analyzer.subscribe(self._on_analyzer_changed)
+        self._analyzed_deck_id: int | None = None
+        self._synced_deck: DeckWithCards | None = None
+        self._renders = 0
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -98,7 +112,27 @@ class EnhancedDeckStats(Vertical):
         """Update all statistics from deck data."""
         self._deck = deck
 
-        # Remove old content and rebuild
+        if deck is None or deck.mainboard_count == 0:
+            self._analyzed_deck_id = None
+            self._synced_deck = None
+            self._show_stats(None)
+            return
+
+        # Changed cards re-render through the subscription; otherwise render here
+        renders = self._renders
+        self._synced_deck = None
+        self._analyzed(deck)
+        if self._renders == renders:
+            self._show_stats(deck)
+
+    def _on_analyzer_changed(self, _analyzer: DeckAnalyzer) -> None:
+        """Re-render after the analyzer applied a change."""
+        if self._deck is not None and self._deck.mainboard_count > 0:
+            self._show_stats(self._deck)
+
+    def _show_stats(self, deck: DeckWithCards | None) -> None:
+        """Remove old content and rebuild."""
+        self._renders += 1
         self.remove_children()
 
         if deck is None or deck.mainboard_count == 0:
@@ -503,102 +537,49 @@ class EnhancedDeckStats(Vertical):
 
         return score, grade, issues
 
+    def _analyzed(self, deck: DeckWithCards) -> DeckAnalyzer:
+        """The analyzer brought up to date with ``deck``'s mainboard."""
+        if deck is not self._synced_deck:
+            if deck.id != self._analyzed_deck_id:
+                self._analyzer.clear()
+                self._analyzed_deck_id = deck.id
+            # Set first: listeners re-enter the helpers during the sync
+            self._synced_deck = deck
+            self._analyzer.sync(deck.mainboard)
+        return self._analyzer
+
     def _calculate_avg_cmc(self, deck: DeckWithCards) -> float:
         """Calculate average CMC of non-land cards."""
-        total_cmc = 0.0
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.type and "Land" not in card.card.type:
-                total_cmc += (card.card.cmc or 0) * card.quantity
-                count += card.quantity
-        return total_cmc / count if count > 0 else 0
+        return self._analyzed(deck).avg_cmc
 
     def _calculate_curve(self, deck: DeckWithCards) -> dict[int, int]:
         """Calculate mana curve distribution."""
-        curve: dict[int, int] = {}
-        for card in deck.mainboard:
-            if card.card and card.card.type and "Land" not in card.card.type:
-                cmc = min(7, int(card.card.cmc or 0))
-                curve[cmc] = curve.get(cmc, 0) + card.quantity
-        return curve
+        return self._analyzed(deck).curve
 
     def _calculate_colors(self, deck: DeckWithCards) -> dict[str, int]:
         """Calculate color distribution from mana costs."""
-        colors: dict[str, int] = {"W": 0, "U": 0, "B": 0, "R": 0, "G": 0, "C": 0}
-        for card in deck.mainboard:
-            if card.card and card.card.mana_cost:
-                mana = card.card.mana_cost
-                for color in colors:
-                    count = mana.count(f"{{{color}}}")
-                    colors[color] += count * card.quantity
-        return colors
+        pips = self._analyzed(deck).pips
+        return {color: pips.get(color, 0) for color in ("W", "U", "B", "R", "G", "C")}
 
     def _calculate_types(self, deck: DeckWithCards) -> dict[str, int]:
         """Calculate card type distribution."""
-        types: dict[str, int] = {}
-        type_priority = [
-            "Creature",
-            "Instant",
-            "Sorcery",
-            "Artifact",
-            "Enchantment",
-            "Planeswalker",
-            "Land",
-        ]
-
-        for card in deck.mainboard:
-            if card.card and card.card.type:
-                card_type = "Other"
-                for t in type_priority:
-                    if t in card.card.type:
-                        card_type = t
-                        break
-                types[card_type] = types.get(card_type, 0) + card.quantity
-
-        return types
+        return self._analyzed(deck).primary_types
 
     def _count_type(self, deck: DeckWithCards, type_name: str) -> int:
         """Count cards of a specific type."""
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.type and type_name in card.card.type:
-                count += card.quantity
-        return count
+        return self._analyzed(deck).type_count(type_name)
 
     def _count_mana_sources(self, deck: DeckWithCards) -> int:
         """Count non-land mana sources."""
-        count = 0
-        mana_keywords = ["add {", "add one mana", "for mana"]
-        for card in deck.mainboard:
-            if card.card and card.card.text and card.card.type:
-                if "Land" in card.card.type:
-                    continue
-                text = card.card.text.lower()
-                if any(kw in text for kw in mana_keywords):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("mana_sources")
 
     def _count_interaction(self, deck: DeckWithCards) -> int:
         """Count removal and interaction."""
-        count = 0
-        keywords = ["destroy", "exile", "counter", "return target", "damage to"]
-        for card in deck.mainboard:
-            if card.card and card.card.text:
-                text = card.card.text.lower()
-                if any(kw in text for kw in keywords):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("interaction")
 
     def _count_card_draw(self, deck: DeckWithCards) -> int:
         """Count card draw effects."""
-        count = 0
-        keywords = ["draw a card", "draw cards", "draws a card", "draw two", "draw three"]
-        for card in deck.mainboard:
-            if card.card and card.card.text:
-                text = card.card.text.lower()
-                if any(kw in text for kw in keywords):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("draw")
 
     def _analyze_lands(self, deck: DeckWithCards) -> dict[str, int]:
         """Analyze land types in deck."""
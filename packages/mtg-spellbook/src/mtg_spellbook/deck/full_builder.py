@@ -10,46 +10,21 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.events import Key
 from textual.screen import Screen
-from textual.widgets import Input, Label, ListItem, ListView, Static
+from textual.widgets import Input, Static
 
 from ..search import parse_search_query
 from ..ui.theme import ui_colors
 from ..widgets import CardPanel
-from .editor_panel import DeckCardItem, DeckEditorPanel
+from ..widgets.card_result_item import format_card_result
+from ..widgets.virtual_list import VirtualList
+from .editor_panel import DeckEditorPanel
 from .quick_filter_bar import QuickFilterBar
 
 if TYPE_CHECKING:
     from mtg_core.data.database import DeckSummary, UnifiedDatabase
     from mtg_core.data.models.responses import CardSummary
 
-    from ..deck_manager import DeckManager, DeckWithCards
-
-
-class SearchResultItem(ListItem):
-    """A card in the search results list.
-
-    Uses shared CardResultItem formatting for consistency with main search.
-    """
-
-    DEFAULT_CSS = """
-    SearchResultItem {
-        height: auto;
-        min-height: 3;
-    }
-
-    SearchResultItem Static {
-        width: 100%;
-    }
-    """
-
-    def __init__(self, card: CardSummary) -> None:
-        super().__init__()
-        self.card = card
-
-    def compose(self) -> ComposeResult:
-        from ..widgets.card_result_item import CardResultFormatter
-
-        yield Static(CardResultFormatter.format(self.card))
+    from ..deck_manager import DeckCardWithData, DeckManager, DeckWithCards
 
 
 class FullDeckBuilder(Screen[None]):
@@ -130,21 +105,13 @@ class FullDeckBuilder(Screen[None]):
         scrollbar-color-hover: #e6c84a;
     }
 
-    #search-results > ListItem {
+    #search-results > .virtual-list--row {
         padding: 0 1;
-        height: auto;
-        border-bottom: solid #1a1a1a;
         background: #121212;
     }
 
-    #search-results > ListItem:hover {
-        background: #1a1a2e;
-        border-left: solid #5a5a6e;
-    }
-
-    #search-results > ListItem.-highlight {
+    #search-results > .virtual-list--row-highlighted {
         background: #2a2a4e;
-        border-left: heavy #c9a227;
     }
 
     #search-footer {
@@ -218,7 +185,7 @@ class FullDeckBuilder(Screen[None]):
                         id="builder-search-input",
                     )
                 yield QuickFilterBar(id="quick-filter-bar")
-                yield ListView(id="search-results")
+                yield VirtualList(format_card_result, row_height=2, id="search-results")
                 yield Static(
                     f"[{ui_colors.GOLD}]Space[/] +1  [{ui_colors.GOLD}]1-4[/] +N",
                     id="search-footer",
@@ -282,8 +249,8 @@ class FullDeckBuilder(Screen[None]):
         # Select first item in mainboard list
         editor = self.query_one("#builder-deck-editor", DeckEditorPanel)
         try:
-            mainboard_list = editor.query_one("#mainboard-list", ListView)
-            if mainboard_list.children:
+            mainboard_list = editor.query_one("#mainboard-list", VirtualList)
+            if mainboard_list.row_count:
                 mainboard_list.index = 0
         except Exception:
             pass
@@ -306,14 +273,14 @@ class FullDeckBuilder(Screen[None]):
             editor = self.query_one("#builder-deck-editor", DeckEditorPanel)
             # Focus the mainboard list in the editor
             try:
-                mainboard = editor.query_one("#mainboard-list", ListView)
+                mainboard = editor.query_one("#mainboard-list", VirtualList)
                 mainboard.focus()
             except Exception:
                 editor.focus()
         else:
             self._active_pane = "search"
-            results = self.query_one("#search-results", ListView)
-            if results.children:
+            results = self.query_one("#search-results", VirtualList)
+            if results.row_count:
                 results.focus()
             else:
                 self.query_one("#builder-search-input", Input).focus()
@@ -416,16 +383,13 @@ class FullDeckBuilder(Screen[None]):
 
     def _update_search_results(self) -> None:
         """Update the search results list."""
-        results_list = self.query_one("#search-results", ListView)
-        results_list.clear()
+        results_list = self.query_one("#search-results", VirtualList)
+        results_list.empty_text = "[dim]No results. Try a different search.[/]"
+        results_list.set_rows(self._search_results, index=None)
 
         if not self._search_results:
-            results_list.append(ListItem(Label("[dim]No results. Try a different search.[/]")))
             return
 
-        for card in self._search_results:
-            results_list.append(SearchResultItem(card))
-
         # Update header with count
         header = self.query_one("#search-header", Static)
         header.update(
@@ -436,7 +400,8 @@ class FullDeckBuilder(Screen[None]):
     def _clear_results(self) -> None:
         """Clear search results."""
         self._search_results = []
-        results_list = self.query_one("#search-results", ListView)
+        results_list = self.query_one("#search-results", VirtualList)
+        results_list.empty_text = ""
         results_list.clear()
         header = self.query_one("#search-header", Static)
         header.update(f"[bold {ui_colors.GOLD_DIM}]Search & Browse[/]")
@@ -444,16 +409,14 @@ class FullDeckBuilder(Screen[None]):
     def on_key(self, event: Key) -> None:
         """Handle key events for quick-add shortcuts."""
         # Only handle when search results are focused
-        results_list = self.query_one("#search-results", ListView)
+        results_list: VirtualList[CardSummary] = self.query_one("#search-results", VirtualList)
         if not results_list.has_focus:
             return
 
-        highlighted = results_list.highlighted_child
-        if not highlighted or not isinstance(highlighted, SearchResultItem):
+        card = results_list.highlighted_row
+        if card is None:
             return
 
-        card = highlighted.card
-
         # Space = add 1x to mainboard
         if event.key == "space":
             self._quick_add(
@@ -516,8 +479,12 @@ class FullDeckBuilder(Screen[None]):
                 f"[{ui_colors.GOLD}]+{quantity}x[/] {card_name} ({location})",
                 timeout=2,
             )
-            # Refresh deck display
-            await self._refresh_deck()
+            # Patch the editor with the change instead of reloading the deck
+            if result.change:
+                editor = self.query_one("#builder-deck-editor", DeckEditorPanel)
+                editor.apply_change(result.change)
+            else:
+                await self._refresh_deck()
         else:
             self.notify(result.error or "Failed to add card", severity="error")
 
@@ -538,23 +505,22 @@ class FullDeckBuilder(Screen[None]):
         if query:
             self._do_search(query)
 
-    @on(ListView.Highlighted, "#search-results")
-    def on_search_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#search-results")
+    def on_search_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Update card preview when search result is highlighted."""
-        if isinstance(event.item, SearchResultItem):
-            card = event.item.card
-            self._load_card_preview(card)
+        card: CardSummary = event.row
+        self._load_card_preview(card)
 
-    @on(ListView.Highlighted, "#mainboard-list")
-    @on(ListView.Highlighted, "#sideboard-list")
-    def on_deck_card_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#mainboard-list")
+    @on(VirtualList.Highlighted, "#sideboard-list")
+    def on_deck_card_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Update card preview when deck card is highlighted."""
-        if isinstance(event.item, DeckCardItem):
-            self._load_card_by_name(
-                event.item.card_name,
-                set_code=event.item.set_code,
-                collector_number=event.item.collector_number,
-            )
+        card: DeckCardWithData = event.row
+        self._load_card_by_name(
+            card.card_name,
+            set_code=card.set_code,
+            collector_number=card.collector_number,
+        )
 
     @work
     async def _load_card_by_name(
@@ -16,14 +16,17 @@ from textual.reactive import reactive
 from textual.widgets import Input, ListItem, ListView, Static
 
 from ..collection.card_preview import CollectionCardPreview
+from ..formatting import prettify_mana
 from ..recommendations.messages import AddCardToDeck
 from ..screens import BaseScreen
+from ..ui.formatters import CardFormatters
 from ..ui.theme import ui_colors
-from ..widgets.card_result_item import CardResultItem
+from ..widgets.card_result_item import format_card_result
 from ..widgets.recommendation_detail import (
     RecommendationDetailCollapse,
     RecommendationDetailView,
 )
+from ..widgets.virtual_list import VirtualList
 from .analysis_panel import DeckAnalysisPanel
 from .editor_panel import SortOrder
 from .list_panel import DeckListItem
@@ -33,12 +36,13 @@ from .modals import ConfirmDeleteModal, NewDeckModal
 if TYPE_CHECKING:
     from mtg_core.data.database import UnifiedDatabase
     from mtg_core.data.database.user import DeckSummary
+    from mtg_core.data.models import Card
     from mtg_core.data.models.responses import CardSummary
     from mtg_core.tools.recommendations import HybridRecommender
     from mtg_core.tools.recommendations.hybrid import ScoredRecommendation
 
     from ..collection_manager import CollectionManager
-    from ..deck_manager import DeckCardWithData, DeckManager, DeckWithCards
+    from ..deck_manager import DeckCardWithData, DeckChange, DeckManager, DeckWithCards
 
 
 class ViewMode(Enum):
@@ -78,84 +82,46 @@ class DeckCardAdapter:
         self.collector_number = card_data.collector_number
 
 
-class DeckCardResultItem(ListItem):
-    """Card item for deck list showing quantity and ownership.
+def format_deck_card(card: DeckCardAdapter) -> str:
+    """Format a deck card as a two-line row showing quantity and ownership."""
+    # Ownership indicator
+    if card.is_owned is True:
+        owned_indicator = "[green]✓[/] "
+    elif card.is_owned is False:
+        owned_indicator = "[yellow]⚠[/] "
+    else:
+        owned_indicator = ""
 
-    Similar to CardResultItem but with deck-specific display.
-    """
+    # Quantity
+    qty_color = ui_colors.GOLD if card.quantity > 1 else "white"
+    qty_str = f"[{qty_color}]{card.quantity}x[/] "
 
-    DEFAULT_CSS = """
-    DeckCardResultItem {
-        height: auto;
-        min-height: 3;
-        padding: 0 1;
-        background: #121218;
-    }
+    # Get formatting helpers
+    rarity_color = CardFormatters.get_rarity_color(card.rarity)
+    rarity_symbol = CardFormatters.get_rarity_symbol(card.rarity)
+    type_icon = CardFormatters.get_type_icon(card.type or "")
+    type_color = CardFormatters.get_type_color(card.type or "")
 
-    DeckCardResultItem:hover {
-        background: #1a1a2e;
-    }
+    # Mana cost
+    mana = prettify_mana(card.mana_cost or "")
 
-    DeckCardResultItem.-highlight {
-        background: #2a2a4e;
-    }
-    """
-
-    def __init__(self, card: DeckCardAdapter) -> None:
-        super().__init__()
-        self.card = card
-        self.card_name = card.name  # For event handlers
-
-    def compose(self) -> ComposeResult:
-        from textual.widgets import Label
+    # Build Line 1: owned + qty + rarity symbol + name + mana
+    line1 = f"{owned_indicator}{qty_str}[{rarity_color}]{rarity_symbol}[/] [bold {rarity_color}]{card.name}[/]"
+    if mana:
+        line1 += f"  {mana}"
 
-        yield Label(self._format_card())
+    # Build Line 2: type icon + type + set
+    line2_parts = []
+    if type_icon:
+        line2_parts.append(f"[{type_color}]{type_icon}[/]")
+    if card.type:
+        line2_parts.append(f"[dim]{card.type}[/]")
+    if card.set_code:
+        line2_parts.append(f"[dim]{card.set_code.upper()}[/]")
 
-    def _format_card(self) -> str:
-        """Format the card for display."""
-        from ..formatting import prettify_mana
-        from ..ui.formatters import CardFormatters
+    line2 = "      " + "  ".join(line2_parts) if line2_parts else "      "
 
-        card = self.card
-
-        # Ownership indicator
-        if card.is_owned is True:
-            owned_indicator = "[green]✓[/] "
-        elif card.is_owned is False:
-            owned_indicator = "[yellow]⚠[/] "
-        else:
-            owned_indicator = ""
-
-        # Quantity
-        qty_color = ui_colors.GOLD if card.quantity > 1 else "white"
-        qty_str = f"[{qty_color}]{card.quantity}x[/] "
-
-        # Get formatting helpers
-        rarity_color = CardFormatters.get_rarity_color(card.rarity)
-        rarity_symbol = CardFormatters.get_rarity_symbol(card.rarity)
-        type_icon = CardFormatters.get_type_icon(card.type or "")
-        type_color = CardFormatters.get_type_color(card.type or "")
-
-        # Mana cost
-        mana = prettify_mana(card.mana_cost or "")
-
-        # Build Line 1: owned + qty + rarity symbol + name + mana
-        line1 = f"{owned_indicator}{qty_str}[{rarity_color}]{rarity_symbol}[/] [bold {rarity_color}]{card.name}[/]"
-        if mana:
-            line1 += f"  {mana}"
-
-        # Build Line 2: type icon + type + set
-        line2_parts = []
-        if type_icon:
-            line2_parts.append(f"[{type_color}]{type_icon}[/]")
-        if card.type:
-            line2_parts.append(f"[dim]{card.type}[/]")
-        if card.set_code:
-            line2_parts.append(f"[dim]{card.set_code.upper()}[/]")
-
-        line2 = "      " + "  ".join(line2_parts) if line2_parts else "      "
-
-        return f"{line1}\n{line2}"
+    return f"{line1}\n{line2}"
 
 
 class FullDeckScreen(BaseScreen[None]):
@@ -308,18 +274,10 @@ class FullDeckScreen(BaseScreen[None]):
         scrollbar-color: #c9a227;
     }
 
-    #mainboard-list > ListItem, #sideboard-list > ListItem, #search-results-list > ListItem {
-        padding: 0 1;
-        height: auto;
-    }
-
-    #mainboard-list > ListItem:hover, #sideboard-list > ListItem:hover, #search-results-list > ListItem:hover {
-        background: #1a1a2e;
-    }
-
-    #mainboard-list > ListItem.-highlight, #sideboard-list > ListItem.-highlight, #search-results-list > ListItem.-highlight {
+    #mainboard-list > .virtual-list--row-highlighted,
+    #sideboard-list > .virtual-list--row-highlighted,
+    #search-results-list > .virtual-list--row-highlighted {
         background: #2a2a4e;
-        border-left: heavy #c9a227;
     }
 
     #sideboard-header {
@@ -400,6 +358,7 @@ class FullDeckScreen(BaseScreen[None]):
         self._collection_manager = collection_manager
         self._collection_cards: set[str] = set()
         self._current_deck: DeckWithCards | None = None
+        self._deck_prices: dict[str, float] = {}
         self._decks: list[DeckSummary] = []
         self._search_results: list[CardSummary] = []
         self._card_sort_order: SortOrder = SortOrder.NAME
@@ -438,12 +397,12 @@ class FullDeckScreen(BaseScreen[None]):
                             "[dim]Select a deck from the list[/]",
                             id="deck-content-header",
                         )
-                        yield ListView(id="mainboard-list")
+                        yield VirtualList(format_deck_card, row_height=2, id="mainboard-list")
                         yield Static(
                             f"[{ui_colors.GOLD_DIM}]Sideboard[/]",
                             id="sideboard-header",
                         )
-                        yield ListView(id="sideboard-list")
+                        yield VirtualList(format_deck_card, row_height=2, id="sideboard-list")
 
                     # Search results (hidden by default)
                     with Vertical(id="search-results-container"):
@@ -451,7 +410,9 @@ class FullDeckScreen(BaseScreen[None]):
                             f"[{ui_colors.GOLD_DIM}]Search Results[/]",
                             id="search-results-header",
                         )
-                        yield ListView(id="search-results-list")
+                        yield VirtualList(
+                            format_card_result, row_height=2, id="search-results-list"
+                        )
                         # Recommendation detail view (inside container so it's visible)
                         yield RecommendationDetailView(id="recommendation-detail")
 
@@ -574,9 +535,17 @@ class FullDeckScreen(BaseScreen[None]):
 
         # Fetch prices from Scryfall
         prices = await self._fetch_deck_prices(deck)
+        self._deck_prices = prices
 
         self._refresh_deck_display(prices=prices)
 
+    def _with_price(self, card: Card | None) -> dict[str, float] | None:
+        """Deck prices including a newly added card's price (None if unchanged)."""
+        if card is None or not card.price_usd or card.name in self._deck_prices:
+            return None
+        self._deck_prices = {**self._deck_prices, card.name: card.price_usd / 100}
+        return self._deck_prices
+
     async def _fetch_deck_prices(self, deck: DeckWithCards | None) -> dict[str, float]:
         """Fetch prices for all cards in the deck."""
         if deck is None or self._db is None:
@@ -602,80 +571,50 @@ class FullDeckScreen(BaseScreen[None]):
 
         try:
             header = self.query_one("#deck-content-header", Static)
-            mainboard = self.query_one("#mainboard-list", ListView)
-            sideboard = self.query_one("#sideboard-list", ListView)
-            side_header = self.query_one("#sideboard-header", Static)
-
-            mainboard.clear()
-            sideboard.clear()
+            mainboard: VirtualList[DeckCardAdapter] = self.query_one("#mainboard-list", VirtualList)
+            sideboard: VirtualList[DeckCardAdapter] = self.query_one("#sideboard-list", VirtualList)
 
             if deck is None:
+                mainboard.clear()
+                sideboard.clear()
                 header.update("[dim]Select a deck from the list[/]")
                 return
 
-            # Update header with ownership counts if available
-            format_str = f" ({deck.format})" if deck.format else ""
-            sort_label = {"name": "A-Z", "cmc": "CMC", "type": "Type"}[self._card_sort_order.value]
-
-            # Count owned/needed for header
-            owned_count = 0
-            needed_count = 0
-            if self._collection_cards:
-                for card in deck.mainboard:
-                    if card.card_name in self._collection_cards:
-                        owned_count += 1
-                    else:
-                        needed_count += 1
-
-            if self._collection_cards and needed_count > 0:
-                header.update(
-                    f"[bold {ui_colors.GOLD}]{deck.name}[/]{format_str}  "
-                    f"[green]✓{owned_count}[/] [yellow]⚠{needed_count}[/]  "
-                    f"[dim]Sort:[/] [{ui_colors.GOLD}]{sort_label}[/]"
-                )
-            else:
-                header.update(
-                    f"[bold {ui_colors.GOLD}]{deck.name}[/]{format_str}  "
-                    f"[dim]Mainboard[/] [{ui_colors.GOLD}]{deck.mainboard_count}[/]  "
-                    f"[dim]Sort:[/] [{ui_colors.GOLD}]{sort_label}[/]"
-                )
+            self._update_deck_headers(deck)
 
             # Split mainboard into owned/needed (owned first)
             sorted_main = self._sort_cards(deck.mainboard)
-            owned_main = []
-            needed_main = []
-
             if self._collection_cards:
-                for card in sorted_main:
-                    if card.card_name in self._collection_cards:
-                        owned_main.append(card)
-                    else:
-                        needed_main.append(card)
-
-                # Populate with owned first, then needed
-                for card in owned_main:
-                    mainboard.append(
-                        self._create_card_item(card, is_sideboard=False, is_owned=True)
-                    )
-                for card in needed_main:
-                    mainboard.append(
-                        self._create_card_item(card, is_sideboard=False, is_owned=False)
-                    )
+                main_rows = [
+                    DeckCardAdapter(card, is_owned=True)
+                    for card in sorted_main
+                    if card.card_name in self._collection_cards
+                ]
+                main_rows += [
+                    DeckCardAdapter(card, is_owned=False)
+                    for card in sorted_main
+                    if card.card_name not in self._collection_cards
+                ]
             else:
                 # No collection data - show all without ownership info
-                for card in sorted_main:
-                    mainboard.append(self._create_card_item(card, is_sideboard=False))
-
-            # Update sideboard header and list
-            side_header.update(
-                f"[{ui_colors.GOLD_DIM}]Sideboard[/] [{ui_colors.GOLD}]{deck.sideboard_count}[/]"
+                main_rows = [DeckCardAdapter(card) for card in sorted_main]
+            mainboard.set_rows(main_rows, index=None)
+
+            # Update sideboard list
+            sideboard.set_rows(
+                (
+                    DeckCardAdapter(
+                        card,
+                        is_owned=(
+                            card.card_name in self._collection_cards
+                            if self._collection_cards
+                            else None
+                        ),
+                    )
+                    for card in self._sort_cards(deck.sideboard)
+                ),
+                index=None,
             )
-            sorted_side = self._sort_cards(deck.sideboard)
-            for card in sorted_side:
-                is_owned = (
-                    card.card_name in self._collection_cards if self._collection_cards else None
-                )
-                sideboard.append(self._create_card_item(card, is_sideboard=True, is_owned=is_owned))
 
             # Update analysis panel
             self._update_analysis_panel(prices)
@@ -689,13 +628,81 @@ class FullDeckScreen(BaseScreen[None]):
         except NoMatches:
             pass
 
+    def _update_deck_headers(self, deck: DeckWithCards) -> None:
+        """Update the deck header (with ownership counts if available) and sideboard header."""
+        header = self.query_one("#deck-content-header", Static)
+        format_str = f" ({deck.format})" if deck.format else ""
+        sort_label = {"name": "A-Z", "cmc": "CMC", "type": "Type"}[self._card_sort_order.value]
+
+        # Count owned/needed for header
+        owned_count = 0
+        needed_count = 0
+        if self._collection_cards:
+            for card in deck.mainboard:
+                if card.card_name in self._collection_cards:
+                    owned_count += 1
+                else:
+                    needed_count += 1
+
+        if self._collection_cards and needed_count > 0:
+            header.update(
+                f"[bold {ui_colors.GOLD}]{deck.name}[/]{format_str}  "
+                f"[green]✓{owned_count}[/] [yellow]⚠{needed_count}[/]  "
+                f"[dim]Sort:[/] [{ui_colors.GOLD}]{sort_label}[/]"
+            )
+        else:
+            header.update(
+                f"[bold {ui_colors.GOLD}]{deck.name}[/]{format_str}  "
+                f"[dim]Mainboard[/] [{ui_colors.GOLD}]{deck.mainboard_count}[/]  "
+                f"[dim]Sort:[/] [{ui_colors.GOLD}]{sort_label}[/]"
+            )
+
+        self.query_one("#sideboard-header", Static).update(
+            f"[{ui_colors.GOLD_DIM}]Sideboard[/] [{ui_colors.GOLD}]{deck.sideboard_count}[/]"
+        )
+
+    async def _apply_deck_change(
+        self, change: DeckChange, prices: dict[str, float] | None = None
+    ) -> None:
+        """Show a deck edit by patching only the changed card's rows.
+
+        Quantity changes update the card's row in place and removals drop it;
+        a card new to a board needs its sorted (owned-first) position, so that
+        rebuilds the lists from the patched deck, without reloading it.
+        """
+        deck = self._current_deck
+        if deck is None or change.deck_id != deck.id:
+            return
+        deck.apply_change(change)
+
+        try:
+            for is_sideboard, entry in change.boards.items():
+                list_view: VirtualList[DeckCardAdapter] = self.query_one(
+                    "#sideboard-list" if is_sideboard else "#mainboard-list", VirtualList
+                )
+                index = list_view.find_index(lambda row: row.name == change.card_name)
+                if index is None:
+                    if entry is not None:
+                        self._refresh_deck_display(prices=prices)
+                        return
+                elif entry is None:
+                    list_view.remove_row(index)
+                else:
+                    is_owned = list_view.rows[index].is_owned
+                    list_view.update_row(index, DeckCardAdapter(entry, is_owned=is_owned))
+
+            self._update_deck_headers(deck)
+        except NoMatches:
+            return
+        self._update_analysis_panel(prices)
+
     def _clear_deck_display(self) -> None:
         """Clear deck display when no deck selected."""
         try:
             header = self.query_one("#deck-content-header", Static)
             header.update("[dim]Select a deck from the list[/]")
-            self.query_one("#mainboard-list", ListView).clear()
-            self.query_one("#sideboard-list", ListView).clear()
+            self.query_one("#mainboard-list", VirtualList).clear()
+            self.query_one("#sideboard-list", VirtualList).clear()
             # Clear analysis panel
             self.query_one("#deck-analysis-panel", DeckAnalysisPanel).update_analysis(None)
         except NoMatches:
@@ -763,16 +770,6 @@ class FullDeckScreen(BaseScreen[None]):
             return sorted(cards, key=type_key)
         return list(cards)
 
-    def _create_card_item(
-        self,
-        card: DeckCardWithData,
-        is_sideboard: bool,  # noqa: ARG002
-        is_owned: bool | None = None,
-    ) -> DeckCardResultItem:
-        """Create a DeckCardResultItem from card data."""
-        adapter = DeckCardAdapter(card, is_owned=is_owned)
-        return DeckCardResultItem(adapter)
-
     def _update_preview_from_deck_card(self, card_name: str) -> None:
         """Update preview pane from a deck card."""
         if not self._current_deck:
@@ -813,17 +810,10 @@ class FullDeckScreen(BaseScreen[None]):
                 deck_usage=[],  # Will be populated below
             )
 
-            # Get deck usage for this card
+            # Get deck usage for this card (in-memory index, no deck reloads)
             deck_usage = []
             if self._deck_manager:
-                decks = await self._deck_manager.list_decks()
-                for deck in decks:
-                    full_deck = await self._deck_manager.get_deck(deck.id)
-                    if full_deck:
-                        for card in full_deck.cards:
-                            if card.card_name == deck_card.card_name:
-                                deck_usage.append((full_deck.name, card.quantity))
-                                break
+                deck_usage = await self._deck_manager.get_card_usage(deck_card.card_name)
 
             preview.update_card(fake_collection_card, deck_usage)
 
@@ -880,43 +870,38 @@ class FullDeckScreen(BaseScreen[None]):
         elif widget.id == "search-results-list":
             self._active_list = "search"
 
-    @on(ListView.Highlighted, "#mainboard-list")
-    def on_mainboard_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#mainboard-list")
+    def on_mainboard_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Track active list and update preview."""
         self._active_list = "mainboard"
-        if event.item and isinstance(event.item, DeckCardResultItem):
-            self._show_card_preview()
-            self._update_preview_from_deck_card(event.item.card_name)
+        self._show_card_preview()
+        self._update_preview_from_deck_card(event.row.name)
 
-    @on(ListView.Highlighted, "#sideboard-list")
-    def on_sideboard_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#sideboard-list")
+    def on_sideboard_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Track active list and update preview."""
         self._active_list = "sideboard"
-        if event.item and isinstance(event.item, DeckCardResultItem):
-            self._show_card_preview()
-            self._update_preview_from_deck_card(event.item.card_name)
+        self._show_card_preview()
+        self._update_preview_from_deck_card(event.row.name)
 
-    @on(ListView.Highlighted, "#search-results-list")
-    def on_search_highlighted(self, event: ListView.Highlighted) -> None:
+    @on(VirtualList.Highlighted, "#search-results-list")
+    def on_search_highlighted(self, event: VirtualList.Highlighted) -> None:
         """Track active list and update preview."""
         self._active_list = "search"
-        if event.item and isinstance(event.item, CardResultItem):
-            self._update_preview_from_search(event.item.card)
+        self._update_preview_from_search(event.row)
 
-    @on(ListView.Selected, "#search-results-list")
-    def on_search_selected(self, event: ListView.Selected) -> None:
+    @on(VirtualList.Selected, "#search-results-list")
+    def on_search_selected(self, event: VirtualList.Selected) -> None:
         """Handle click on search result - show recommendation detail if available."""
         self._active_list = "search"
-        if event.item and isinstance(event.item, CardResultItem):
-            card_name = event.item.card.name
-            # If we have recommendation details, show the explainer
-            rec = self._recommendation_details.get(card_name)
-            if rec:
-                try:
-                    detail_view = self.query_one("#recommendation-detail", RecommendationDetailView)
-                    detail_view.show_recommendation(rec)
-                except NoMatches:
-                    pass
+        # If we have recommendation details, show the explainer
+        rec = self._recommendation_details.get(event.row.name)
+        if rec:
+            try:
+                detail_view = self.query_one("#recommendation-detail", RecommendationDetailView)
+                detail_view.show_recommendation(rec)
+            except NoMatches:
+                pass
 
     @on(Input.Changed, "#deck-search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
@@ -952,17 +937,15 @@ class FullDeckScreen(BaseScreen[None]):
     def _update_search_results(self) -> None:
         """Update search results list."""
         try:
-            results_list = self.query_one("#search-results-list", ListView)
+            results_list = self.query_one("#search-results-list", VirtualList)
             results_header = self.query_one("#search-results-header", Static)
-            results_list.clear()
 
             count = len(self._search_results)
             results_header.update(
                 f"[{ui_colors.GOLD_DIM}]Search Results[/] [{ui_colors.GOLD}]{count}[/]"
             )
 
-            for card in self._search_results:
-                results_list.append(CardResultItem(card))
+            results_list.set_rows(self._search_results, index=None)
 
         except NoMatches:
             pass
@@ -1022,10 +1005,10 @@ class FullDeckScreen(BaseScreen[None]):
             # If search input is focused, go to appropriate list
             if focused == search_input:
                 if self.current_view == ViewMode.CARD_SEARCH:
-                    self.query_one("#search-results-list", ListView).focus()
+                    self.query_one("#search-results-list", VirtualList).focus()
                     self._active_list = "search"
                 elif self._current_deck:
-                    self.query_one("#mainboard-list", ListView).focus()
+                    self.query_one("#mainboard-list", VirtualList).focus()
                     self._active_list = "mainboard"
                 else:
                     self.query_one("#deck-list", ListView).focus()
@@ -1039,7 +1022,7 @@ class FullDeckScreen(BaseScreen[None]):
 
             # From mainboard, go to sideboard
             if self._active_list == "mainboard":
-                self.query_one("#sideboard-list", ListView).focus()
+                self.query_one("#sideboard-list", VirtualList).focus()
                 self._active_list = "sideboard"
                 return
 
@@ -1080,7 +1063,7 @@ class FullDeckScreen(BaseScreen[None]):
 
             # From sideboard, go back to mainboard
             if self._active_list == "sideboard":
-                self.query_one("#mainboard-list", ListView).focus()
+                self.query_one("#mainboard-list", VirtualList).focus()
                 self._active_list = "mainboard"
                 return
 
@@ -1092,10 +1075,10 @@ class FullDeckScreen(BaseScreen[None]):
             # From deck list, go to sideboard (or search in search mode)
             if self._active_list == "deck-list":
                 if self.current_view == ViewMode.CARD_SEARCH:
-                    self.query_one("#search-results-list", ListView).focus()
+                    self.query_one("#search-results-list", VirtualList).focus()
                     self._active_list = "search"
                 elif self._current_deck:
-                    self.query_one("#sideboard-list", ListView).focus()
+                    self.query_one("#sideboard-list", VirtualList).focus()
                     self._active_list = "sideboard"
                 else:
                     search_input.focus()
@@ -1118,7 +1101,9 @@ class FullDeckScreen(BaseScreen[None]):
         }
         list_id = list_map.get(self._active_list, "#mainboard-list")
         with contextlib.suppress(NoMatches):
-            self.query_one(list_id, ListView).action_cursor_up()
+            list_view = self.query_one(list_id)
+            if isinstance(list_view, (ListView, VirtualList)):
+                list_view.action_cursor_up()
 
     def action_nav_down(self) -> None:
         """Navigate down in active list."""
@@ -1130,7 +1115,9 @@ class FullDeckScreen(BaseScreen[None]):
         }
         list_id = list_map.get(self._active_list, "#mainboard-list")
         with contextlib.suppress(NoMatches):
-            self.query_one(list_id, ListView).action_cursor_down()
+            list_view = self.query_one(list_id)
+            if isinstance(list_view, (ListView, VirtualList)):
+                list_view.action_cursor_down()
 
     def action_cycle_sort(self) -> None:
         """Cycle sort order."""
@@ -1206,24 +1193,25 @@ class FullDeckScreen(BaseScreen[None]):
         if not self._current_deck or not self._db:
             return
 
-        from mtg_core.tools.recommendations import HybridRecommender
+        from mtg_core.tools.recommendations import get_hybrid_recommender
 
         from ..recommendations import RecommendationScreen
 
-        # Initialize recommender lazily
-        if self._recommender is None:
+        # Initialize the shared recommender lazily (the card daemon's when attached)
+        recommender = get_hybrid_recommender()
+        if not recommender.is_initialized:
             if self._recommender_initializing:
                 self.notify("Recommendations loading, please wait...", timeout=2)
                 return
             self._recommender_initializing = True
             self.notify("Initializing recommendations (first time may take ~2s)...", timeout=3)
-            self._recommender = HybridRecommender()
-            init_time = await self._recommender.initialize(self._db)
+            init_time = await recommender.initialize(self._db)
             self._recommender_initializing = False
             self.notify(
-                f"Recommender ready ({init_time:.1f}s, {self._recommender.card_count:,} cards)",
+                f"Recommender ready ({init_time:.1f}s, {recommender.card_count:,} cards)",
                 timeout=2,
             )
+        self._recommender = recommender
 
         # Load collection card names if we have a collection manager
         if self._collection_manager and not self._collection_cards:
@@ -1252,7 +1240,9 @@ class FullDeckScreen(BaseScreen[None]):
         if not self._current_deck:
             return
         result = await self._deck_manager.add_card(self._current_deck.id, card_name, quantity)
-        if result.success:
+        if result.success and result.change:
+            await self._apply_deck_change(result.change, prices=self._with_price(result.card))
+        elif result.success:
             # Reload the current deck to reflect the change
             self._load_deck(self._current_deck.id)
         else:
@@ -1265,22 +1255,23 @@ class FullDeckScreen(BaseScreen[None]):
             return
 
         from mtg_core.data.models.responses import CardSummary
-        from mtg_core.tools.recommendations import HybridRecommender
+        from mtg_core.tools.recommendations import get_hybrid_recommender
 
-        # Initialize recommender lazily
-        if self._recommender is None:
+        # Initialize the shared recommender lazily (the card daemon's when attached)
+        recommender = get_hybrid_recommender()
+        if not recommender.is_initialized:
             if self._recommender_initializing:
                 self.notify("Recommendations loading, please wait...", timeout=2)
                 return
             self._recommender_initializing = True
             self.notify("Initializing recommendations (first time may take ~2s)...", timeout=3)
-            self._recommender = HybridRecommender()
-            init_time = await self._recommender.initialize(self._db)
+            init_time = await recommender.initialize(self._db)
             self._recommender_initializing = False
             self.notify(
-                f"Recommender ready ({init_time:.1f}s, {self._recommender.card_count:,} cards)",
+                f"Recommender ready ({init_time:.1f}s, {recommender.card_count:,} cards)",
                 timeout=2,
             )
+        self._recommender = recommender
 
         # Convert deck cards to dicts for the hybrid recommender
         deck_card_dicts: list[dict[str, object]] = []
@@ -1331,10 +1322,10 @@ class FullDeckScreen(BaseScreen[None]):
     def _focus_search_results(self) -> None:
         """Focus the search results list and select first item."""
         try:
-            results_list = self.query_one("#search-results-list", ListView)
+            results_list = self.query_one("#search-results-list", VirtualList)
             results_list.focus()
             # Select first item if available
-            if results_list.children:
+            if results_list.row_count:
                 results_list.index = 0
             self._active_list = "search"
         except NoMatches:
@@ -1343,9 +1334,8 @@ class FullDeckScreen(BaseScreen[None]):
     def _update_recommendations_display(self, recommendations: list[ScoredRecommendation]) -> None:
         """Update search results to show recommendations with synergy reasons."""
         try:
-            results_list = self.query_one("#search-results-list", ListView)
+            results_list = self.query_one("#search-results-list", VirtualList)
             results_header = self.query_one("#search-results-header", Static)
-            results_list.clear()
 
             # Build header with detected themes if available
             header_parts = [f"[{ui_colors.GOLD_DIM}]✨ Recommendations[/]"]
@@ -1369,27 +1359,24 @@ class FullDeckScreen(BaseScreen[None]):
             results_header.update("".join(header_parts))
 
             # Add cards with synergy info in tooltip style
-            for card in self._search_results:
-                results_list.append(CardResultItem(card))
+            results_list.set_rows(self._search_results, index=None)
 
         except NoMatches:
             pass
 
-    def _get_selected_deck_card(self) -> tuple[DeckCardResultItem | None, bool]:
+    def _get_selected_deck_card(self) -> tuple[DeckCardAdapter | None, bool]:
         """Get selected card from mainboard or sideboard."""
         try:
             if self._active_list == "mainboard":
-                mainboard = self.query_one("#mainboard-list", ListView)
-                if mainboard.highlighted_child and isinstance(
-                    mainboard.highlighted_child, DeckCardResultItem
-                ):
-                    return mainboard.highlighted_child, False
+                mainboard: VirtualList[DeckCardAdapter] = self.query_one(
+                    "#mainboard-list", VirtualList
+                )
+                return mainboard.highlighted_row, False
             elif self._active_list == "sideboard":
-                sideboard = self.query_one("#sideboard-list", ListView)
-                if sideboard.highlighted_child and isinstance(
-                    sideboard.highlighted_child, DeckCardResultItem
-                ):
-                    return sideboard.highlighted_child, True
+                sideboard: VirtualList[DeckCardAdapter] = self.query_one(
+                    "#sideboard-list", VirtualList
+                )
+                return sideboard.highlighted_row, True
         except NoMatches:
             pass
         return None, False
@@ -1398,13 +1385,13 @@ class FullDeckScreen(BaseScreen[None]):
         """Increase quantity of selected card."""
         card, is_sideboard = self._get_selected_deck_card()
         if card and self._current_deck:
-            self._change_quantity(card.card_name, card.card.quantity + 1, is_sideboard)
+            self._change_quantity(card.name, card.quantity + 1, is_sideboard)
 
     def action_decrease_qty(self) -> None:
         """Decrease quantity of selected card."""
         card, is_sideboard = self._get_selected_deck_card()
-        if card and self._current_deck and card.card.quantity > 1:
-            self._change_quantity(card.card_name, card.card.quantity - 1, is_sideboard)
+        if card and self._current_deck and card.quantity > 1:
+            self._change_quantity(card.name, card.quantity - 1, is_sideboard)
 
     @work
     async def _change_quantity(self, card_name: str, new_qty: int, is_sideboard: bool) -> None:
@@ -1412,12 +1399,10 @@ class FullDeckScreen(BaseScreen[None]):
         if not self._current_deck:
             return
 
-        await self._deck_manager.set_quantity(
+        change = await self._deck_manager.set_quantity(
             self._current_deck.id, card_name, new_qty, is_sideboard
         )
-        deck = await self._deck_manager.get_deck(self._current_deck.id)
-        self._current_deck = deck
-        self._refresh_deck_display()
+        await self._apply_deck_change(change)
         location = "sideboard" if is_sideboard else "mainboard"
         self.notify(f"{card_name}: {new_qty}x ({location})", timeout=1)
 
@@ -1425,7 +1410,7 @@ class FullDeckScreen(BaseScreen[None]):
         """Remove selected card from deck."""
         card, is_sideboard = self._get_selected_deck_card()
         if card and self._current_deck:
-            self._remove_card(card.card_name, is_sideboard)
+            self._remove_card(card.name, is_sideboard)
 
     @work
     async def _remove_card(self, card_name: str, is_sideboard: bool) -> None:
@@ -1433,17 +1418,18 @@ class FullDeckScreen(BaseScreen[None]):
         if not self._current_deck:
             return
 
-        await self._deck_manager.remove_card(self._current_deck.id, card_name, is_sideboard)
-        deck = await self._deck_manager.get_deck(self._current_deck.id)
-        self._current_deck = deck
-        self._refresh_deck_display()
+        change = await self._deck_manager.remove_card(
+            self._current_deck.id, card_name, is_sideboard
+        )
+        if change:
+            await self._apply_deck_change(change)
         self.notify(f"Removed {card_name}", timeout=1)
 
     def action_toggle_sideboard(self) -> None:
         """Move selected card to/from sideboard."""
         card, is_sideboard = self._get_selected_deck_card()
         if card and self._current_deck:
-            self._move_card(card.card_name, not is_sideboard)
+            self._move_card(card.name, not is_sideboard)
 
     @work
     async def _move_card(self, card_name: str, to_sideboard: bool) -> None:
@@ -1452,13 +1438,10 @@ class FullDeckScreen(BaseScreen[None]):
             return
 
         if to_sideboard:
-            await self._deck_manager.move_to_sideboard(self._current_deck.id, card_name)
+            change = await self._deck_manager.move_to_sideboard(self._current_deck.id, card_name)
         else:
-            await self._deck_manager.move_to_mainboard(self._current_deck.id, card_name)
-
-        deck = await self._deck_manager.get_deck(self._current_deck.id)
-        self._current_deck = deck
-        self._refresh_deck_display()
+            change = await self._deck_manager.move_to_mainboard(self._current_deck.id, card_name)
+        await self._apply_deck_change(change)
         location = "sideboard" if to_sideboard else "mainboard"
         self.notify(f"Moved {card_name} to {location}", timeout=1)
 
@@ -1468,11 +1451,11 @@ class FullDeckScreen(BaseScreen[None]):
             return
 
         try:
-            results_list = self.query_one("#search-results-list", ListView)
-            if results_list.highlighted_child and isinstance(
-                results_list.highlighted_child, CardResultItem
-            ):
-                card = results_list.highlighted_child.card
+            results_list: VirtualList[CardSummary] = self.query_one(
+                "#search-results-list", VirtualList
+            )
+            card = results_list.highlighted_row
+            if card is not None:
                 self._add_card_to_deck(card.name, quantity)
         except NoMatches:
             pass
@@ -1487,9 +1470,12 @@ class FullDeckScreen(BaseScreen[None]):
             self._current_deck.id, card_name, quantity, sideboard=False
         )
         if result.success:
-            deck = await self._deck_manager.get_deck(self._current_deck.id)
-            self._current_deck = deck
-            self._refresh_deck_display()
+            if result.change:
+                await self._apply_deck_change(result.change, prices=self._with_price(result.card))
+            else:
+                deck = await self._deck_manager.get_deck(self._current_deck.id)
+                self._current_deck = deck
+                self._refresh_deck_display()
             self.notify(f"Added {quantity}x {card_name}", timeout=1)
             if self._current_deck:
                 self.post_message(CardAddedToDeck(card_name, self._current_deck.name, quantity))
@@ -1539,12 +1525,14 @@ class FullDeckScreen(BaseScreen[None]):
             return
 
         try:
-            results_list = self.query_one("#search-results-list", ListView)
-            highlighted = results_list.highlighted_child
-            if highlighted is None or not isinstance(highlighted, CardResultItem):
+            results_list: VirtualList[CardSummary] = self.query_one(
+                "#search-results-list", VirtualList
+            )
+            highlighted = results_list.highlighted_row
+            if highlighted is None:
                 return
 
-            card_name = highlighted.card.name
+            card_name = highlighted.name
             rec = self._recommendation_details.get(card_name)
             if rec:
                 detail_view = self.query_one("#recommendation-detail", RecommendationDetailView)
@@ -1586,16 +1574,15 @@ class FullDeckScreen(BaseScreen[None]):
 
         # Get selected card from search results
         try:
-            results_list = self.query_one("#search-results-list", ListView)
-            highlighted = results_list.highlighted_child
+            results_list: VirtualList[CardSummary] = self.query_one(
+                "#search-results-list", VirtualList
+            )
+            highlighted = results_list.highlighted_row
             if highlighted is None:
                 self.notify("No item highlighted", timeout=1)
                 return
-            if not isinstance(highlighted, CardResultItem):
-                self.notify(f"Wrong item type: {type(highlighted)}", timeout=1)
-                return
 
-            card_name = highlighted.card.name
+            card_name = highlighted.name
             rec = self._recommendation_details.get(card_name)
             if rec:
                 detail_view = self.query_one("#recommendation-detail", RecommendationDetailView)
@@ -1608,8 +1595,5 @@ class FullDeckScreen(BaseScreen[None]):
     @on(RecommendationDetailCollapse)
     def on_recommendation_detail_collapse(self, _event: RecommendationDetailCollapse) -> None:
         """Handle recommendation detail collapse - refocus the list."""
-        try:
-            results_list = self.query_one("#search-results-list", ListView)
-            results_list.focus()
-        except NoMatches:
-            pass
+        with contextlib.suppress(NoMatches):
+            self.query_one("#search-results-list", VirtualList).focus()
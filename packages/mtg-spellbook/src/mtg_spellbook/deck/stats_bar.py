@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
+from mtg_core.tools.deck_analysis import DeckAnalyzer, FlagRule, text_rule
+
 from ..ui.theme import ui_colors
 
 if TYPE_CHECKING:
@@ -24,6 +25,27 @@ MANA = {
     "C": "#95A5A6",
 }
 
+# Health heuristics for the bar (stricter than the analysis panel's defaults)
+STATS_BAR_FLAG_RULES: dict[str, FlagRule] = {
+    "interaction": text_rule(
+        "destroy",
+        "exile",
+        "counter target",
+        "return target",
+        patterns=[r"deals\s+\d+\s+damage\s+to"],
+    ),
+    "draw": text_rule("draw a card", "draw cards", "draws a card", "draw two", "draw three"),
+    "ramp": text_rule(
+        "add {",
+        "add one mana",
+        "add two mana",
+        "search your library for a basic land",
+        "search your library for a land",
+        patterns=[r"put\s+.+\s+land.+onto the battlefield"],
+        nonland_only=True,
+    ),
+}
+
 
 class DeckStatsBar(Vertical):
     """Wide horizontal stats bar with graphs and analysis.
@@ -126,6 +148,11 @@ class DeckStatsBar(Vertical):
         super().__init__(id=id)
         self._deck: DeckWithCards | None = None
         self._prices: dict[str, float] = {}  # card_name -> price_usd
+        self._analyzer = DeckAnalyzer(flag_rules=STATS_BAR_FLAG_RULES)
+        self._analyzer.subscribe(self._on_analyzer_changed)
+        self._analyzed_deck_id: int | None = None
+        self._synced_deck: DeckWithCards | None = None
+        self._renders = 0
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -150,6 +177,27 @@ class DeckStatsBar(Vertical):
         if prices:
             self._prices = prices
 
+        if deck is None or deck.mainboard_count == 0:
+            self._analyzed_deck_id = None
+            self._synced_deck = None
+            self._show_columns(None)
+            return
+
+        # Changed cards re-render through the subscription; otherwise render here
+        renders = self._renders
+        self._synced_deck = None
+        self._analyzed(deck)
+        if self._renders == renders:
+            self._show_columns(deck)
+
+    def _on_analyzer_changed(self, _analyzer: DeckAnalyzer) -> None:
+        """Re-render after the analyzer applied a change."""
+        if self._deck is not None and self._deck.mainboard_count > 0:
+            self._show_columns(self._deck)
+
+    def _show_columns(self, deck: DeckWithCards | None) -> None:
+        """Rebuild the stat columns for a deck (or the empty state)."""
+        self._renders += 1
         try:
             content = self.query_one("#stats-bar-content", Horizontal)
             content.remove_children()
@@ -374,116 +422,55 @@ class DeckStatsBar(Vertical):
         col.compose_add_child(Static("\n".join(lines), classes="stats-value"))
         return col
 
+    def _analyzed(self, deck: DeckWithCards) -> DeckAnalyzer:
+        """The analyzer brought up to date with ``deck``'s mainboard."""
+        if deck is not self._synced_deck:
+            if deck.id != self._analyzed_deck_id:
+                self._analyzer.clear()
+                self._analyzed_deck_id = deck.id
+            # Set first: listeners re-enter the helpers during the sync
+            self._synced_deck = deck
+            self._analyzer.sync(deck.mainboard)
+        return self._analyzer
+
     def _calc_curve(self, deck: DeckWithCards) -> dict[int, int]:
         """Calculate mana curve (non-land spells)."""
-        curve: dict[int, int] = {}
-        for card in deck.mainboard:
-            if card.card and card.card.type and "Land" not in card.card.type:
-                cmc = min(7, int(card.card.cmc or 0))
-                curve[cmc] = curve.get(cmc, 0) + card.quantity
-        return curve
+        return self._analyzed(deck).curve
 
     def _calc_avg_cmc(self, deck: DeckWithCards) -> float:
         """Calculate average CMC of non-land cards."""
-        total, count = 0.0, 0
-        for card in deck.mainboard:
-            if card.card and card.card.type and "Land" not in card.card.type:
-                total += (card.card.cmc or 0) * card.quantity
-                count += card.quantity
-        return total / count if count > 0 else 0
+        return self._analyzed(deck).avg_cmc
 
     def _calc_colors(self, deck: DeckWithCards) -> dict[str, int]:
         """Calculate color pip distribution from mana costs."""
-        colors: dict[str, int] = {}
-        for card in deck.mainboard:
-            if card.card and card.card.mana_cost:
-                for c in "WUBRG":
-                    colors[c] = (
-                        colors.get(c, 0) + card.card.mana_cost.count(f"{{{c}}}") * card.quantity
-                    )
-        return colors
+        pips = self._analyzed(deck).pips
+        return {c: pips.get(c, 0) for c in "WUBRG"}
 
     def _calc_types(self, deck: DeckWithCards) -> dict[str, int]:
-        """Calculate type distribution."""
-        types: dict[str, int] = {}
-        priority = [
-            "Creature",
-            "Instant",
-            "Sorcery",
-            "Artifact",
-            "Enchantment",
-            "Planeswalker",
-            "Land",
-        ]
-        for card in deck.mainboard:
-            if card.card and card.card.type:
-                for t in priority:
-                    if t in card.card.type:
-                        types[t] = types.get(t, 0) + card.quantity
-                        break
+        """Calculate type distribution (each card counted under its first type)."""
+        types = self._analyzed(deck).primary_types
+        types.pop("Other", None)
         return types
 
     def _count_keywords(self, deck: DeckWithCards) -> dict[str, int]:
         """Count keywords across all cards."""
-        keywords: dict[str, int] = {}
-        for card in deck.mainboard:
-            if card.card and card.card.keywords:
-                for kw in card.card.keywords:
-                    keywords[kw] = keywords.get(kw, 0) + card.quantity
-        return keywords
+        return self._analyzed(deck).keywords
 
     def _count_type(self, deck: DeckWithCards, type_name: str) -> int:
         """Count cards of a specific type."""
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.type and type_name in card.card.type:
-                count += card.quantity
-        return count
+        return self._analyzed(deck).type_count(type_name)
 
     def _count_interaction(self, deck: DeckWithCards) -> int:
         """Count removal and interaction spells."""
-        literal_patterns = ["destroy", "exile", "counter target", "return target"]
-        regex_patterns = [re.compile(r"deals\s+\d+\s+damage\s+to")]
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.text:
-                text = card.card.text.lower()
-                if any(p in text for p in literal_patterns) or any(
-                    r.search(text) for r in regex_patterns
-                ):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("interaction")
 
     def _count_draw(self, deck: DeckWithCards) -> int:
         """Count card draw effects."""
-        patterns = ["draw a card", "draw cards", "draws a card", "draw two", "draw three"]
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.text:
-                text = card.card.text.lower()
-                if any(p in text for p in patterns):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("draw")
 
     def _count_ramp(self, deck: DeckWithCards) -> int:
         """Count mana ramp effects."""
-        literal_patterns = [
-            "add {",
-            "add one mana",
-            "add two mana",
-            "search your library for a basic land",
-            "search your library for a land",
-        ]
-        regex_patterns = [re.compile(r"put\s+.+\s+land.+onto the battlefield")]
-        count = 0
-        for card in deck.mainboard:
-            if card.card and card.card.type and "Land" not in card.card.type and card.card.text:
-                text = card.card.text.lower()
-                if any(p in text for p in literal_patterns) or any(
-                    r.search(text) for r in regex_patterns
-                ):
-                    count += card.quantity
-        return count
+        return self._analyzed(deck).flag_count("ramp")
 
     def _detect_archetype(self, deck: DeckWithCards) -> tuple[str, int]:
         """Detect deck archetype based on card composition."""
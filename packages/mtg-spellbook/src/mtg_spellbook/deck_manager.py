@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, cast
 
 from mtg_core.data.database import DeckCardRow, DeckSummary, UserDatabase
@@ -15,7 +16,11 @@ from mtg_core.data.models import (
 )
 from mtg_core.tools import deck as deck_tools
 
+from .deck_usage import DeckUsageIndex
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from mtg_core.data.database import UnifiedDatabase
     from mtg_core.data.models import (
         ColorAnalysisResult,
@@ -34,6 +39,7 @@ class AddCardResult:
     card: Card | None = None
     error: str | None = None
     new_quantity: int = 0
+    change: DeckChange | None = None
 
 
 @dataclass
@@ -79,6 +85,44 @@ class DeckWithCards:
         """Total cards in sideboard."""
         return sum(c.quantity for c in self.sideboard)
 
+    def apply_change(self, change: DeckChange) -> None:
+        """Patch this deck's entries for a changed card.
+
+        Entries are replaced, appended or dropped to match the change, so
+        applying the same change twice is harmless. Entries without card data
+        keep the card data already loaded for that name.
+        """
+        name = change.card_name
+        loaded = next((c.card for c in self.cards if c.card_name == name and c.card), None)
+        for is_sideboard, entry in change.boards.items():
+            index = next(
+                (
+                    i
+                    for i, c in enumerate(self.cards)
+                    if c.card_name == name and c.is_sideboard == is_sideboard
+                ),
+                None,
+            )
+            if entry is not None and entry.card is None and loaded is not None:
+                entry = replace(entry, card=loaded)
+            if entry is None:
+                if index is not None:
+                    del self.cards[index]
+            elif index is None:
+                self.cards.append(entry)
+            else:
+                self.cards[index] = entry
+
+
+@dataclass
+class DeckChange:
+    """A card edit applied to a deck: the card's entry on each board it touched."""
+
+    deck_id: int
+    card_name: str
+    # is_sideboard -> the entry after the edit (None: the card left that board)
+    boards: dict[bool, DeckCardWithData | None] = field(default_factory=dict)
+
 
 @dataclass
 class FullDeckAnalysis:
@@ -101,6 +145,9 @@ class DeckManager:
     ):
         self.user = user_db
         self.db = db
+        self.usage = DeckUsageIndex(user_db)
+        # Decks handed out by get_deck() that views still hold, patched on every edit
+        self._decks: weakref.WeakValueDictionary[int, DeckWithCards] = weakref.WeakValueDictionary()
 
     async def create_deck(
         self,
@@ -111,6 +158,7 @@ class DeckManager:
     ) -> int:
         """Create a new deck."""
         result: int = await self.user.create_deck(name, format, commander, description)
+        self.usage.deck_saved(result, name)
         return result
 
     async def list_decks(self) -> list[DeckSummary]:
@@ -119,7 +167,13 @@ class DeckManager:
         return result
 
     async def get_deck(self, deck_id: int) -> DeckWithCards | None:
-        """Get a deck with all card data loaded."""
+        """Get a deck with all card data loaded.
+
+        The deck is always read from the database, but a deck object already
+        handed out for this id is refreshed in place and returned, so every view
+        holding it shares the same data. Edits made through this manager patch
+        that object directly instead of reloading it.
+        """
         deck = await self.user.get_deck(deck_id)
         if deck is None:
             return None
@@ -127,17 +181,29 @@ class DeckManager:
         card_rows = await self.user.get_deck_cards(deck_id)
         cards = await self._load_card_data(card_rows)
 
-        return DeckWithCards(
+        cached = self._decks.get(deck_id)
+        if cached is not None:
+            cached.name = deck.name
+            cached.format = deck.format
+            cached.commander = deck.commander
+            cached.cards[:] = cards
+            return cached
+
+        loaded = DeckWithCards(
             id=deck.id,
             name=deck.name,
             format=deck.format,
             commander=deck.commander,
             cards=cards,
         )
+        self._decks[deck_id] = loaded
+        return loaded
 
     async def delete_deck(self, deck_id: int) -> bool:
         """Delete a deck."""
         result: bool = await self.user.delete_deck(deck_id)
+        self.usage.deck_deleted(deck_id)
+        self._decks.pop(deck_id, None)
         return result
 
     async def update_deck(
@@ -149,6 +215,13 @@ class DeckManager:
     ) -> None:
         """Update deck metadata."""
         await self.user.update_deck(deck_id, name=name, format=format, commander=commander)
+        if name is not None:
+            self.usage.deck_saved(deck_id, name)
+        cached = self._decks.get(deck_id)
+        if cached is not None:
+            cached.name = name if name is not None else cached.name
+            cached.format = format if format is not None else cached.format
+            cached.commander = commander if commander is not None else cached.commander
 
     async def add_card(
         self,
@@ -170,7 +243,7 @@ class DeckManager:
             )
 
         # Add to deck (uses canonical name from DB)
-        await self.user.add_card(
+        row = await self.user.add_card(
             deck_id,
             card.name,
             quantity,
@@ -178,20 +251,101 @@ class DeckManager:
             set_code=set_code,
             collector_number=collector_number,
         )
+        self.usage.card_added(deck_id, card.name, quantity, sideboard)
+        change = self._apply(deck_id, card.name, {sideboard: row}, card)
 
-        # Get new total quantity
-        new_qty = await self.user.get_deck_card_count(deck_id, card.name)
+        # New total across both boards, from the usage index
+        await self.usage.ensure_loaded()
 
         return AddCardResult(
             success=True,
             card=card,
-            new_quantity=new_qty,
+            new_quantity=self.usage.get_deck_quantity(deck_id, card.name),
+            change=change,
         )
 
-    async def remove_card(self, deck_id: int, card_name: str, sideboard: bool = False) -> bool:
-        """Remove a card from a deck."""
-        result: bool = await self.user.remove_card(deck_id, card_name, sideboard)
-        return result
+    async def add_cards_bulk(
+        self,
+        deck_id: int,
+        cards: Sequence[tuple[str, int, bool]],
+    ) -> list[AddCardResult]:
+        """Add many (card_name, quantity, sideboard) entries to a deck at once.
+
+        Names are resolved with one batched lookup (falling back to add_card()'s
+        lookup only for names the batch misses) and written in a single
+        transaction. Returns one result per entry, in order; new_quantity is
+        the card's total in the deck after the whole batch.
+        """
+        if not cards:
+            return []
+        found = await self.db.get_cards_by_names(
+            list({name for name, _, _ in cards}), include_extras=False
+        )
+        resolved: list[Card | None] = []
+        for name, _, _ in cards:
+            card = found.get(name.lower())
+            if card is None:
+                try:
+                    card = await self.db.get_card_by_name(name, include_extras=False)
+                except Exception:
+                    card = None
+                else:
+                    found[name.lower()] = card
+            resolved.append(card)
+
+        entries = [
+            (card.name, quantity, sideboard)
+            for card, (_, quantity, sideboard) in zip(resolved, cards, strict=True)
+            if card is not None
+        ]
+        rows = await self.user.add_cards(deck_id, entries)
+        for card_name, quantity, sideboard in entries:
+            self.usage.card_added(deck_id, card_name, quantity, sideboard)
+        by_card = {card.name.lower(): card for card in resolved if card is not None}
+        changes = {
+            (row.card_name, row.is_sideboard): self._apply(
+                deck_id, row.card_name, {row.is_sideboard: row}, by_card[row.card_name.lower()]
+            )
+            for row in rows
+        }
+        await self.usage.ensure_loaded()
+
+        results: list[AddCardResult] = []
+        for card, (name, _, sideboard) in zip(resolved, cards, strict=True):
+            if card is None:
+                results.append(AddCardResult(success=False, error=f"Card not found: {name}"))
+                continue
+            results.append(
+                AddCardResult(
+                    success=True,
+                    card=card,
+                    new_quantity=self.usage.get_deck_quantity(deck_id, card.name),
+                    change=changes[(card.name, sideboard)],
+                )
+            )
+        return results
+
+    async def create_deck_with_cards(
+        self,
+        name: str,
+        cards: Sequence[tuple[str, int, bool]],
+        format: str | None = None,
+        commander: str | None = None,
+        description: str | None = None,
+    ) -> tuple[int, list[AddCardResult]]:
+        """Create a deck and add_cards_bulk() its cards. Returns (deck_id, results)."""
+        deck_id = await self.create_deck(name, format, commander, description)
+        return deck_id, await self.add_cards_bulk(deck_id, cards)
+
+    async def remove_card(
+        self, deck_id: int, card_name: str, sideboard: bool = False
+    ) -> DeckChange | None:
+        """Remove a card from a deck. Returns the change, or None if it was not there."""
+        removed = await self.user.remove_card(deck_id, card_name, sideboard)
+        self.usage.card_set(deck_id, card_name, 0, sideboard)
+        if not removed:
+            return None
+        return self._apply(deck_id, card_name, {sideboard: None})
 
     async def set_quantity(
         self,
@@ -199,17 +353,55 @@ class DeckManager:
         card_name: str,
         quantity: int,
         sideboard: bool = False,
-    ) -> None:
-        """Set the quantity of a card."""
-        await self.user.set_quantity(deck_id, card_name, quantity, sideboard)
-
-    async def move_to_sideboard(self, deck_id: int, card_name: str) -> None:
+    ) -> DeckChange:
+        """Set the quantity of a card (0 removes it)."""
+        row = await self.user.set_quantity(deck_id, card_name, quantity, sideboard)
+        self.usage.card_set(deck_id, card_name, quantity, sideboard)
+        if row is None and quantity > 0:
+            return DeckChange(deck_id, card_name)  # Not on that board: nothing changed
+        return self._apply(deck_id, card_name, {sideboard: row})
+
+    async def move_to_sideboard(self, deck_id: int, card_name: str) -> DeckChange:
         """Move a card to sideboard."""
-        await self.user.move_to_sideboard(deck_id, card_name)
+        row = await self.user.move_to_sideboard(deck_id, card_name)
+        self.usage.card_moved(deck_id, card_name, to_sideboard=True)
+        return self._apply(deck_id, card_name, {False: None, True: row} if row else {})
 
-    async def move_to_mainboard(self, deck_id: int, card_name: str) -> None:
+    async def move_to_mainboard(self, deck_id: int, card_name: str) -> DeckChange:
         """Move a card to mainboard."""
-        await self.user.move_to_mainboard(deck_id, card_name)
+        row = await self.user.move_to_mainboard(deck_id, card_name)
+        self.usage.card_moved(deck_id, card_name, to_sideboard=False)
+        return self._apply(deck_id, card_name, {True: None, False: row} if row else {})
+
+    def _apply(
+        self,
+        deck_id: int,
+        card_name: str,
+        rows: dict[bool, DeckCardRow | None],
+        card: Card | None = None,
+    ) -> DeckChange:
+        """Build the change for rows returned by a write and patch the cached deck."""
+        boards: dict[bool, DeckCardWithData | None] = {
+            is_sideboard: (
+                DeckCardWithData(
+                    card_name=row.card_name,
+                    quantity=row.quantity,
+                    is_sideboard=row.is_sideboard,
+                    is_commander=row.is_commander,
+                    set_code=row.set_code,
+                    collector_number=row.collector_number,
+                    card=card,
+                )
+                if row is not None
+                else None
+            )
+            for is_sideboard, row in rows.items()
+        }
+        change = DeckChange(deck_id, card_name, boards)
+        cached = self._decks.get(deck_id)
+        if cached is not None:
+            cached.apply_change(change)
+        return change
 
     async def validate_deck(self, deck_id: int) -> DeckValidationResult:
         """Validate a deck."""
@@ -285,6 +477,11 @@ class DeckManager:
             price=price,
         )
 
+    async def get_card_usage(self, card_name: str) -> list[tuple[str, int]]:
+        """Get the decks using a card as [(deck_name, quantity), ...], from the usage index."""
+        await self.usage.ensure_loaded()
+        return self.usage.get_usage(card_name)
+
     async def find_decks_with_card(self, card_name: str) -> list[DeckSummary]:
         """Find all decks containing a card."""
         result: list[DeckSummary] = await self.user.find_decks_with_card(card_name)
@@ -301,8 +498,8 @@ class DeckManager:
 
         Returns (deck_id, list of errors/warnings).
         """
-        deck_id = await self.create_deck(deck_name, format)
         errors: list[str] = []
+        cards: list[tuple[str, int, bool]] = []
         in_sideboard = False
 
         for line in text.strip().split("\n"):
@@ -334,7 +531,10 @@ class DeckManager:
             if "(" in card_name and card_name.endswith(")"):
                 card_name = card_name[: card_name.rfind("(")].strip()
 
-            result = await self.add_card(deck_id, card_name, quantity, in_sideboard)
+            cards.append((card_name, quantity, in_sideboard))
+
+        deck_id, results = await self.create_deck_with_cards(deck_name, cards, format)
+        for (card_name, _, _), result in zip(cards, results, strict=True):
             if not result.success:
                 errors.append(result.error or f"Unknown error adding {card_name}")
 
@@ -0,0 +1,164 @@
+"""In-memory index of which decks use each card."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mtg_core.data.database import UserDatabase
+
+
+class DeckUsageIndex:
+    """Card -> deck usage, loaded once and kept current by DeckManager.
+
+    Answers the "which decks use this card" lookups made on every cursor move in
+    the deck and collection screens without querying SQLite. DeckManager writes
+    each deck change through to the index after committing it; changes made to
+    the user database by other processes are not seen until reload().
+
+    Quantities are kept per board (mainboard/sideboard) so moves and per-board
+    quantity changes apply exactly; lookups report the total per deck.
+
+    Listeners added with add_listener() are told which card's total changed, so
+    indexes derived from deck usage (CollectionStatsIndex) stay current too.
+    """
+
+    def __init__(self, user: UserDatabase) -> None:
+        self._user = user
+        self._deck_names: dict[int, str] = {}
+        # card name -> (deck id, is_sideboard) -> quantity
+        self._usage: dict[str, dict[tuple[int, bool], int]] = {}
+        self._loaded = False
+        self._loading: asyncio.Lock | None = None
+        self._writes = 0
+        self._listeners: list[Callable[[str | None], None]] = []
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._loaded
+
+    async def ensure_loaded(self) -> None:
+        """Load the index on first use."""
+        if self._loaded:
+            return
+        if self._loading is None:
+            self._loading = asyncio.Lock()
+        async with self._loading:
+            if not self._loaded:
+                await self.reload()
+
+    async def reload(self) -> None:
+        """Rebuild the index from the database (two queries)."""
+        while True:
+            writes = self._writes
+            decks = await self._user.list_decks()
+            quantities = await self._user.get_deck_card_quantities()
+            if writes == self._writes:
+                break  # No deck change landed mid-load
+
+        self._deck_names = {deck.id: deck.name for deck in decks}
+        self._usage = {}
+        for deck_id, card_name, is_sideboard, quantity in quantities:
+            self._usage.setdefault(card_name, {})[(deck_id, is_sideboard)] = quantity
+        self._loaded = True
+        self._notify(None)
+
+    def add_listener(self, listener: Callable[[str | None], None]) -> None:
+        """Call listener(card_name) when a card's total changes, listener(None) on reload()."""
+        self._listeners.append(listener)
+
+    def _notify(self, card_name: str | None) -> None:
+        for listener in self._listeners:
+            listener(card_name)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Lookups
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def get_usage(self, card_name: str) -> list[tuple[str, int]]:
+        """Decks using a card and how many copies, as [(deck_name, quantity), ...].
+
+        Sorted by deck name, like UserDatabase.get_card_deck_usage().
+        """
+        boards = self._usage.get(card_name)
+        if not boards:
+            return []
+        per_deck: dict[int, int] = {}
+        for (deck_id, _), quantity in boards.items():
+            per_deck[deck_id] = per_deck.get(deck_id, 0) + quantity
+        return sorted(
+            (self._deck_names.get(deck_id, ""), quantity) for deck_id, quantity in per_deck.items()
+        )
+
+    def get_usage_many(self, card_names: list[str]) -> dict[str, list[tuple[str, int]]]:
+        """get_usage() for several cards, like UserDatabase.get_cards_deck_usage_batch()."""
+        return {name: self.get_usage(name) for name in card_names}
+
+    def get_deck_quantity(self, deck_id: int, card_name: str) -> int:
+        """Copies of a card in one deck, mainboard and sideboard together."""
+        boards = self._usage.get(card_name, {})
+        return boards.get((deck_id, False), 0) + boards.get((deck_id, True), 0)
+
+    def get_total(self, card_name: str) -> int:
+        """Total copies of a card used across all decks."""
+        return sum(self._usage.get(card_name, {}).values())
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Write-through updates
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def deck_saved(self, deck_id: int, name: str) -> None:
+        """Record a created or renamed deck."""
+        self._writes += 1
+        self._deck_names[deck_id] = name
+
+    def deck_deleted(self, deck_id: int) -> None:
+        """Drop a deck and all its cards."""
+        self._writes += 1
+        self._deck_names.pop(deck_id, None)
+        for card_name in list(self._usage):
+            boards = self._usage[card_name]
+            keys = [key for key in boards if key[0] == deck_id]
+            if not keys:
+                continue
+            for key in keys:
+                del boards[key]
+            if not boards:
+                del self._usage[card_name]
+            self._notify(card_name)
+
+    def card_added(self, deck_id: int, card_name: str, quantity: int, sideboard: bool) -> None:
+        """Add copies of a card to a deck board."""
+        self._writes += 1
+        boards = self._usage.setdefault(card_name, {})
+        boards[(deck_id, sideboard)] = boards.get((deck_id, sideboard), 0) + quantity
+        self._notify(card_name)
+
+    def card_set(self, deck_id: int, card_name: str, quantity: int, sideboard: bool) -> None:
+        """Set the copies of a card already on a deck board; 0 removes it."""
+        self._writes += 1
+        boards = self._usage.get(card_name)
+        key = (deck_id, sideboard)
+        if boards is None or key not in boards:
+            return  # Like the UPDATE, setting a card the board lacks is a no-op
+        if quantity > 0:
+            boards[key] = quantity
+        else:
+            del boards[key]
+            if not boards:
+                del self._usage[card_name]
+        self._notify(card_name)
+
+    def card_moved(self, deck_id: int, card_name: str, to_sideboard: bool) -> None:
+        """Move all copies of a card to the other board, merging with any there."""
+        self._writes += 1
+        boards = self._usage.get(card_name)
+        if not boards:
+            return
+        moved = boards.pop((deck_id, not to_sideboard), 0)
+        if moved:
+            boards[(deck_id, to_sideboard)] = boards.get((deck_id, to_sideboard), 0) + moved
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import CardDetail, CardSummary
 
+# Loads details for a page: (page items, global index of the first item) -> details
+PageLoader = Callable[[list[Any], int], Awaitable[list["CardDetail"]]]
+
 
 @dataclass
 class PaginationState:
@@ -21,6 +26,9 @@ class PaginationState:
     source_type: str = "search"  # "search" or "synergy"
     source_query: str = ""  # Original query for context
     total_override: int | None = None  # Override total for lazy loading
+    _pending: dict[int, asyncio.Task[list[CardDetail]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @property
     def total_items(self) -> int:
@@ -61,9 +69,16 @@ class PaginationState:
     @property
     def current_page_items(self) -> list[Any]:
         """Get items for current page (summaries)."""
-        start = (self.current_page - 1) * self.page_size
-        end = start + self.page_size
-        return self.all_items[start:end]
+        return self.page_items(self.current_page)
+
+    def page_start(self, page: int) -> int:
+        """0-based index of the first item on a page."""
+        return (page - 1) * self.page_size
+
+    def page_items(self, page: int) -> list[Any]:
+        """Get the loaded items (summaries) for a page."""
+        start = self.page_start(page)
+        return self.all_items[start : start + self.page_size]
 
     @property
     def loaded_items_count(self) -> int:
@@ -88,8 +103,49 @@ class PaginationState:
         self.page_cache[page] = details
 
     def clear_cache(self) -> None:
-        """Clear the page cache."""
+        """Clear the page cache, cancelling any prefetch in flight."""
         self.page_cache.clear()
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+
+    async def load_page(self, page: int, load: PageLoader) -> list[CardDetail]:
+        """Get card details for a page: cached, from a prefetch in flight, or loaded now."""
+        cached = self.get_cached_details(page)
+        if cached:
+            return cached
+
+        pending = self._pending.get(page)
+        if pending is not None:
+            # Wait without propagating the prefetch's own failure or cancellation
+            await asyncio.wait({pending})
+            if not pending.cancelled() and pending.exception() is None:
+                return pending.result()
+
+        details = await load(self.page_items(page), self.page_start(page))
+        self.cache_details(page, details)
+        return details
+
+    async def prefetch(self, page: int, load: PageLoader) -> None:
+        """Load a page's details into the cache ahead of it being shown.
+
+        Does nothing for pages out of range, already cached or being fetched,
+        or whose items are not loaded yet. While the fetch runs, load_page()
+        for the same page waits for it instead of fetching the page again.
+        """
+        if not 1 <= page <= self.total_pages or page in self.page_cache or page in self._pending:
+            return
+        items = self.page_items(page)
+        if not items:
+            return
+
+        task = asyncio.ensure_future(load(items, self.page_start(page)))
+        self._pending[page] = task
+        try:
+            self.cache_details(page, await task)
+        finally:
+            if self._pending.get(page) is task:
+                del self._pending[page]
 
     def go_to_page(self, page: int) -> bool:
         """Navigate to a specific page. Returns True if page changed."""
@@ -13,6 +13,8 @@ from textual.css.query import NoMatches
 from textual.reactive import reactive
 from textual.widgets import Input, ListItem, ListView, Static
 
+from mtg_core.data.models.responses import CardSummary
+from mtg_core.exceptions import SetNotFoundError
 from mtg_core.tools import sets
 
 from ..ui.theme import ui_colors
@@ -20,14 +22,42 @@ from ..widgets.set_detail import SetCardList, SetCardPreviewPanel, SetInfoPanel,
 from .base import BaseScreen
 
 if TYPE_CHECKING:
-    from mtg_core.data.database import UnifiedDatabase
+    from mtg_core.data.database import CardSummaryRow, UnifiedDatabase
     from mtg_core.data.models import Set
-    from mtg_core.data.models.responses import CardSummary, SetSummary
+    from mtg_core.data.models.responses import SetSummary
 
 # Debounce delay for search input (milliseconds)
 SEARCH_DEBOUNCE_MS = 150
 
 
+def _search_tokens(set_data: SetSummary) -> tuple[str, ...]:
+    """Lowercase strings a search word may be a prefix of: code, full name, name words."""
+    name = set_data.name.lower()
+    words = (word.strip(":,.'\"()") for word in name.split())
+    return (set_data.code.lower(), name, *(word for word in words if word))
+
+
+def _row_to_summary(row: CardSummaryRow) -> CardSummary:
+    """Convert a set card row to the summary the card list shows."""
+    return CardSummary(
+        uuid=row.uuid,
+        name=row.name,
+        mana_cost=row.mana_cost,
+        cmc=row.cmc,
+        type=row.type,
+        colors=row.colors,
+        rarity=row.rarity,
+        set_code=row.set_code,
+        collector_number=row.number,
+        keywords=row.keywords,
+        power=row.power,
+        toughness=row.toughness,
+        image=row.image_normal,
+        image_small=row.image_small,
+        price_usd=row.get_price_usd(),
+    )
+
+
 class SetListItem(ListItem):
     """List item representing a set."""
 
@@ -227,6 +257,7 @@ class SetsScreen(BaseScreen[None]):
         super().__init__()
         self._db = db
         self._sets: list[SetSummary] = []
+        self._search_index: list[tuple[SetSummary, tuple[str, ...]]] = []
         self._filtered_sets: list[SetSummary] = []
         self._search_debounce_task: asyncio.Task[None] | None = None
         self._refresh_task: asyncio.Task[None] | None = None
@@ -342,6 +373,7 @@ class SetsScreen(BaseScreen[None]):
         # Get all sets
         result = await sets.get_sets(self._db, name=None)
         self._sets = result.sets
+        self._search_index = [(s, _search_tokens(s)) for s in self._sets]
         self._filtered_sets = self._sets
         self.total_count = len(self._sets)
         self.filtered_count = len(self._sets)
@@ -382,21 +414,24 @@ class SetsScreen(BaseScreen[None]):
             pass
 
     def _filter_sets(self, query: str) -> list[SetSummary]:
-        """Filter sets by search query and artist series toggle."""
-        sets = self._sets
+        """Filter sets by search query and artist series toggle.
+
+        Every word of the query must be a prefix of the set's code, its name
+        or one of its name words ("lim al" finds Limited Edition Alpha).
+        """
+        index = self._search_index
 
         # Filter to artist series if enabled (sets starting with 'A')
         if self.show_artist_series_only:
-            sets = [s for s in sets if s.code.upper().startswith("A")]
+            index = [(s, tokens) for s, tokens in index if s.code.upper().startswith("A")]
 
         # Then apply search query
-        if query:
-            query_lower = query.lower()
-            sets = [
-                s for s in sets if query_lower in s.name.lower() or query_lower in s.code.lower()
-            ]
-
-        return sets
+        words = query.lower().split()
+        return [
+            s
+            for s, tokens in index
+            if all(any(token.startswith(word) for token in tokens) for word in words)
+        ]
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes with debouncing."""
@@ -460,61 +495,37 @@ class SetsScreen(BaseScreen[None]):
         self.current_filter = None
         self._filter_index = 0
 
-        # Get set data
-        set_data = await self._db.get_set(set_code)
-
-        if not set_data:
+        # Set list, stats and card order all come from the set index
+        try:
+            set_data = await self._db.get_set(set_code)
+        except SetNotFoundError:
             self.notify(f"Could not load set: {set_code}", severity="warning")
             return
 
-        # Get cards via search_cards with set_code filter
-        from mtg_core.data.models.inputs import SearchCardsInput
-        from mtg_core.data.models.responses import CardSummary
-
-        filters = SearchCardsInput(set_code=set_code)
-        cards, _total = await self._db.search_cards(filters)
-
-        if not cards:
+        set_stats = await self._db.get_set_stats(set_code)
+        if not set_stats.total_cards:
             self.notify(f"No cards found in set: {set_code}", severity="warning")
             return
 
-        # Convert to CardSummary
-        summaries: list[CardSummary] = []
-        for card in cards:
-            summary = CardSummary(
-                uuid=card.uuid,
-                name=card.name,
-                mana_cost=card.mana_cost,
-                type=card.type,
-                colors=card.colors or [],
-                rarity=card.rarity,
-                set_code=card.set_code,
-                collector_number=card.number,  # Card model uses 'number' not 'collector_number'
-            )
-            summaries.append(summary)
-
-        # Calculate stats
-        rarity_counts = {"mythic": 0, "rare": 0, "uncommon": 0, "common": 0}
-        type_counts: dict[str, int] = {}
-
-        for card in cards:
-            if card.rarity:
-                rarity = card.rarity.lower()
-                if rarity in rarity_counts:
-                    rarity_counts[rarity] += 1
-            if card.type:
-                main_type = card.type.split()[0]
-                type_counts[main_type] = type_counts.get(main_type, 0) + 1
-
         stats = SetStats(
-            total_cards=len(cards),
-            rarity_distribution=rarity_counts,
-            color_distribution={},
+            total_cards=set_stats.total_cards,
+            rarity_distribution=set_stats.rarity_distribution,
+            color_distribution=set_stats.color_distribution,
+            mechanics=set_stats.mechanics,
+            avg_cmc=set_stats.avg_cmc,
+            type_distribution=set_stats.type_distribution,
+            total_value_usd=set_stats.total_value_usd,
         )
 
-        # Update detail pane
-        await self._show_set_detail(set_data, summaries, stats)
+        # Show the stats at once, then stream cards in collector number order
+        await self._show_set_detail(set_data, [], stats)
         self._update_header()
+        try:
+            card_list = self.query_one("#set-card-list", SetCardList)
+        except NoMatches:
+            return
+        async for rows in self._db.get_set_cards(set_code):
+            await card_list.append_cards([_row_to_summary(row) for row in rows])
 
     async def _show_set_detail(
         self, set_data: Set, cards: list[CardSummary], stats: SetStats
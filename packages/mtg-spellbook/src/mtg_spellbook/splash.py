@@ -7,7 +7,6 @@ import json
 import random
 import sqlite3
 import tempfile
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -364,37 +363,9 @@ class SplashScreen(App[bool]):
                 if not cards:
                     return
 
-                # Build list of (set_code, collector_number) for price lookup
-                printings: list[tuple[str, str]] = []
-                for card in cards:
-                    if card.set_code and card.collector_number:
-                        printings.append((card.set_code, card.collector_number))
-
-                if not printings:
-                    return
-
-                # Fetch prices
-                prices = await unified_db.get_prices_by_set_and_numbers(printings)
-
-                # Build price cache dict
-                price_cache: dict[str, tuple[float | None, float | None]] = {}
-                for card in cards:
-                    if card.set_code and card.collector_number:
-                        key = (card.set_code.upper(), card.collector_number)
-                        if key in prices:
-                            usd, usd_foil = prices[key]
-                            # Convert cents to dollars
-                            usd_dollars = usd / 100.0 if usd else None
-                            usd_foil_dollars = usd_foil / 100.0 if usd_foil else None
-                            cache_key = (
-                                f"{card.card_name}|{card.set_code.upper()}|{card.collector_number}"
-                            )
-                            price_cache[cache_key] = (usd_dollars, usd_foil_dollars)
-
-                if price_cache:
-                    # Save to disk using CollectionManager's format
-                    manager = CollectionManager(user_db, unified_db)
-                    manager.set_cached_prices(price_cache)
+                # Price the cards into the snapshot the collection screen values from
+                manager = CollectionManager(user_db, unified_db)
+                await manager.valuation.prefetch_prices(cards)
 
             finally:
                 await user_db.close()
@@ -1036,6 +1007,11 @@ class SplashScreen(App[bool]):
         scryfall_updated_at: str | None = None,
     ) -> tuple[int, int, int]:
         """Build the unified database (runs in thread)."""
+        from mtg_core.data.database.meta import write_build_meta
+        from mtg_core.data.database.oracle import build_oracle_cards
+        from mtg_core.data.database.set_index import build_set_index
+        from mtg_core.tools.synergy.index import build_synergy_terms
+
         output_path.unlink(missing_ok=True)
 
         conn = sqlite3.connect(output_path, isolation_level=None)
@@ -1068,6 +1044,12 @@ class SplashScreen(App[bool]):
                 self._supplement_from_mtgjson_setlist(cursor, mtgjson_path)
                 cursor.execute("COMMIT")
 
+            cursor.execute("BEGIN IMMEDIATE")
+            build_oracle_cards(cursor)
+            build_synergy_terms(cursor)
+            build_set_index(cursor)
+            cursor.execute("COMMIT")
+
             cursor.execute("BEGIN IMMEDIATE")
             self._create_indexes(cursor)
             cursor.execute("COMMIT")
@@ -1077,25 +1059,7 @@ class SplashScreen(App[bool]):
             cursor.execute("COMMIT")
 
             cursor.execute("BEGIN IMMEDIATE")
-            cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("schema_version", "1"))
-            cursor.execute(
-                "INSERT INTO meta (key, value) VALUES (?, ?)",
-                ("created_at", datetime.now().isoformat()),
-            )
-            cursor.execute(
-                "INSERT INTO meta (key, value) VALUES (?, ?)", ("card_count", str(card_count))
-            )
-            cursor.execute(
-                "INSERT INTO meta (key, value) VALUES (?, ?)", ("set_count", str(set_count))
-            )
-            cursor.execute(
-                "INSERT INTO meta (key, value) VALUES (?, ?)", ("ruling_count", str(ruling_count))
-            )
-            if scryfall_updated_at:
-                cursor.execute(
-                    "INSERT INTO meta (key, value) VALUES (?, ?)",
-                    ("scryfall_updated_at", scryfall_updated_at),
-                )
+            write_build_meta(cursor, 3, scryfall_updated_at)
             cursor.execute("COMMIT")
 
             cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
@@ -0,0 +1,64 @@
+"""Startup timing for ``mtg-spellbook --profile-startup``.
+
+Records how long the heavy imports and each launch stage take, from process
+start to the dashboard being usable and the secondary data (keywords, deck and
+collection managers) arriving. Disabled unless the flag is given, in which case
+the app quits once startup completes and the breakdown is printed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Collects (stage, seconds) timings for one app launch."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._origin = time.perf_counter()
+        self._imports: list[tuple[str, float]] = []
+        self._stages: list[tuple[str, float, float]] = []  # (name, started, seconds)
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._origin = time.perf_counter()
+
+    def import_module(self, name: str) -> None:
+        """Import a module, timing it when profiling."""
+        start = time.perf_counter()
+        importlib.import_module(name)
+        if self.enabled:
+            self._imports.append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a launch stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self._stages.append((name, start - self._origin, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (e.g. "dashboard visible")."""
+        if self.enabled:
+            self._stages.append((name, time.perf_counter() - self._origin, 0.0))
+
+    def report(self) -> str:
+        """Format the timing breakdown."""
+        lines = ["Startup profile", "", "Imports:"]
+        for name, seconds in self._imports:
+            lines.append(f"  {name:<40} {seconds * 1000:8.1f} ms")
+        lines += ["", "Stages (offset from start, duration):"]
+        for name, started, seconds in self._stages:
+            duration = f"{seconds * 1000:8.1f} ms" if seconds else ""
+            lines.append(f"  {name:<40} +{started * 1000:8.1f} ms {duration}")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler()
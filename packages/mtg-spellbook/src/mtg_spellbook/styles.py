@@ -64,28 +64,13 @@ MTGSpellbook {
     scrollbar-color-active: #fff8dc;
 }
 
-/* Enhanced list items with better hover */
-#results-list > ListItem {
+#results-list > .virtual-list--row {
     padding: 0 1;
-    height: auto;
-    border-bottom: solid #1a1a1a;
     background: #121212;
 }
 
-#results-list > ListItem:hover {
-    background: #1a1a2e;
-    border-left: solid #5a5a6e;
-}
-
-#results-list > ListItem.-highlight {
+#results-list > .virtual-list--row-highlighted {
     background: #2a2a4e;
-    border-left: heavy #c9a227;
-}
-
-/* Enhanced highlight on hover */
-#results-list > ListItem.-highlight:hover {
-    background: #2e2e58;
-    border-left: heavy #e6c84a;
 }
 
 /* ─── Card Panel: Enhanced Display ─── */
@@ -543,6 +528,12 @@ ListView:focus ListItem.-highlight {
     padding: 0 1;
 }
 
+/* Spacers standing in for unmounted tiles in the virtualized filmstrip */
+.filmstrip-spacer {
+    width: 0;
+    height: 100%;
+}
+
 /* Filmstrip thumbnail card - image + set/rarity + price */
 .shop-card {
     width: 18;
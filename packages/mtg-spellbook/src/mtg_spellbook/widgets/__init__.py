@@ -13,6 +13,7 @@ This package provides the UI components:
 - ArtistBrowser: Browse all artists alphabetically with search
 - BlockBrowser: Browse MTG blocks and storylines with tree view
 - SetDetailView: Set exploration with info, card list, and preview
+- VirtualList: Virtual-scrolling list over a plain row model
 """
 
 from .art_navigator import HAS_IMAGE_SUPPORT, EnhancedArtNavigator
@@ -65,6 +66,7 @@ from .synergy import (
     TypeIndex,
 )
 from .synergy_panel import SynergyPanel
+from .virtual_list import VirtualList
 
 __all__ = [
     "HAS_IMAGE_SUPPORT",
@@ -112,4 +114,5 @@ __all__ = [
     "SynergySelected",
     "TypeIndex",
     "ViewArtwork",
+    "VirtualList",
 ]
@@ -5,7 +5,7 @@ This package provides multi-mode artwork viewing:
 - ViewModeToggle: Mode selection toggle
 - FocusView: Immersive single-card view
 - CompareView: Side-by-side printing comparison
-- PrintingsGrid: Shop-style grid layout (4 cards per row)
+- PrintingsGrid: Virtualized filmstrip of printing thumbnails
 - ShopCard: Shop-style card display with set/rarity/price
 - PreviewPanel: Enlarged preview with metadata
 """
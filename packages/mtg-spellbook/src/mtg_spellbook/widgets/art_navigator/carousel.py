@@ -13,7 +13,7 @@ from textual.widgets import Static
 
 from ...ui.theme import rarity_colors, ui_colors
 from .card_slot import CardSlot
-from .image_loader import load_image_from_url
+from .image_loader import ImageTier, load_card_image
 from .messages import ArtistSelected
 
 if TYPE_CHECKING:
@@ -295,7 +295,9 @@ class PrintingsCarousel(Vertical, can_focus=True):
             try:
                 slot = self.query_one(f"#{slot_id}", CardSlot)
                 if slot.printing and slot.printing.image and slot.image_widget:
-                    await load_image_from_url(slot.printing.image, slot.image_widget)
+                    await load_card_image(
+                        slot.printing.image, slot.image_widget, tier=ImageTier.CARD
+                    )
             except Exception:
                 pass
 
@@ -12,7 +12,7 @@ from textual.widgets import Static
 
 from ...ui.theme import get_price_color, rarity_colors, ui_colors
 from . import HAS_IMAGE_SUPPORT, TImage
-from .image_loader import load_image_from_url
+from .image_loader import ImageTier, load_card_image
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import PrintingInfo
@@ -117,7 +117,7 @@ class CompareSlot(Vertical):
 
         try:
             img_widget = self.query_one(f"#compare-image-{self.slot_number}", TImage)
-            await load_image_from_url(image_url, img_widget, use_large=True)
+            await load_card_image(image_url, img_widget, tier=ImageTier.CARD)
         except NoMatches:
             pass
 
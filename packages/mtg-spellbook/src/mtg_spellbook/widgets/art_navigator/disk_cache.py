@@ -0,0 +1,315 @@
+"""SQLite-indexed disk cache for card images.
+
+Replaces the old ``cache_metadata.json`` file, which was re-parsed and rewritten
+on every hit. The index lives in a small SQLite database next to the image files:
+
+- Reads never take the index lock. A disk hit opens the file and records the
+  access time in an in-memory buffer that is flushed in one batch.
+- Writes go to a temp file and are renamed into place, so concurrent readers
+  never see a partial image.
+- Eviction removes the least recently used entries in bounded batches down to
+  a low-water mark, using an index on ``last_access`` instead of sorting.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "cache_index.sqlite"
+LEGACY_METADATA_FILENAME = "cache_metadata.json"
+
+# Extensions checked on read: WebP (current format), then PNG (legacy)
+_EXTENSIONS = (".webp", ".png")
+
+# Access times are flushed once this many are pending or this many seconds pass
+_FLUSH_BATCH = 256
+_FLUSH_INTERVAL = 5.0
+
+# Eviction trims down to this fraction of the size limit, a batch at a time
+_EVICT_LOW_WATER = 0.9
+_EVICT_BATCH = 64
+
+
+def url_hash(url: str) -> str:
+    """Get the cache file stem for a URL."""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+class ImageDiskCache:
+    """Persistent image cache with an SQLite index and batched access tracking."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+        *,
+        flush_batch: int = _FLUSH_BATCH,
+        flush_interval: float = _FLUSH_INTERVAL,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._flush_batch = flush_batch
+        self._flush_interval = flush_interval
+
+        # Guards the index connection and the running totals
+        self._index_lock = threading.Lock()
+        # Guards only the pending access-time buffer (held for a dict update)
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, float] = {}
+        self._last_flush = time.monotonic()
+
+        self._conn: sqlite3.Connection | None = None
+        self._total_bytes = 0
+        self._file_count = 0
+
+    # -- Index management --------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index (must be called with the index lock held)."""
+        if self._conn is not None:
+            return self._conn
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.cache_dir / INDEX_FILENAME,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT,
+                ext TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._conn = conn
+
+        self._import_legacy_metadata(conn)
+        row = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        self._file_count, self._total_bytes = row[0], row[1]
+        return conn
+
+    def _import_legacy_metadata(self, conn: sqlite3.Connection) -> None:
+        """Move entries from the old JSON metadata file into the index, once."""
+        legacy = self.cache_dir / LEGACY_METADATA_FILENAME
+        if not legacy.exists():
+            return
+
+        try:
+            files: dict[str, Any] = json.loads(legacy.read_text()).get("files", {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            files = {}
+
+        rows = []
+        for stem, info in files.items():
+            for ext in _EXTENSIONS:
+                if (self.cache_dir / f"{stem}{ext}").exists():
+                    rows.append(
+                        (
+                            stem,
+                            info.get("url"),
+                            ext,
+                            info.get("size", 0),
+                            info.get("last_access", 0),
+                        )
+                    )
+                    break
+
+        conn.execute("BEGIN")
+        conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+        conn.execute("COMMIT")
+        legacy.unlink(missing_ok=True)
+        logger.info("Migrated %d image cache entries to %s", len(rows), INDEX_FILENAME)
+
+    def _flush_locked(self) -> None:
+        """Write pending access times to the index (index lock held)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        conn = self._connect()
+        conn.execute("BEGIN")
+        conn.executemany(
+            "UPDATE entries SET last_access = ? WHERE url_hash = ?",
+            [(ts, stem) for stem, ts in pending.items()],
+        )
+        conn.execute("COMMIT")
+
+    def flush(self) -> None:
+        """Persist buffered access times."""
+        with self._index_lock, contextlib.suppress(sqlite3.Error, OSError):
+            self._flush_locked()
+
+    def _evict_locked(self) -> None:
+        """Evict LRU entries in batches until under the low-water mark."""
+        target = int(self.max_bytes * _EVICT_LOW_WATER)
+        conn = self._connect()
+        # Pending hits must land first so recently viewed images are kept
+        self._flush_locked()
+
+        while self._total_bytes > target:
+            victims = conn.execute(
+                "SELECT url_hash, ext, size FROM entries ORDER BY last_access LIMIT ?",
+                (_EVICT_BATCH,),
+            ).fetchall()
+            if not victims:
+                break
+
+            removed = []
+            for stem, ext, size in victims:
+                if self._total_bytes <= target:
+                    break
+                with contextlib.suppress(OSError):
+                    (self.cache_dir / f"{stem}{ext}").unlink(missing_ok=True)
+                self._total_bytes -= size
+                self._file_count -= 1
+                removed.append((stem,))
+
+            conn.execute("BEGIN")
+            conn.executemany("DELETE FROM entries WHERE url_hash = ?", removed)
+            conn.execute("COMMIT")
+
+        self._total_bytes = max(0, self._total_bytes)
+
+    # -- Public API ---------------------------------------------------------
+
+    def get(self, url: str) -> Image.Image | None:
+        """Load an image from disk, recording the access without blocking on the index."""
+        stem = url_hash(url)
+        for ext in _EXTENSIONS:
+            path = self.cache_dir / f"{stem}{ext}"
+            if not path.exists():
+                continue
+            try:
+                img = Image.open(path)
+                img.load()
+            except (OSError, UnidentifiedImageError):
+                path.unlink(missing_ok=True)  # Corrupted cache file
+                self._forget(stem, ext)
+                continue
+
+            self._record_access(stem)
+            return img
+        return None
+
+    def _forget(self, stem: str, ext: str) -> None:
+        """Drop the index entry of a removed file and take it off the totals."""
+        with self._pending_lock:
+            self._pending.pop(stem, None)
+        with self._index_lock, contextlib.suppress(sqlite3.Error, OSError):
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT size FROM entries WHERE url_hash = ? AND ext = ?", (stem, ext)
+            ).fetchone()
+            if row is None:
+                return
+            conn.execute("DELETE FROM entries WHERE url_hash = ?", (stem,))
+            self._total_bytes = max(0, self._total_bytes - row[0])
+            self._file_count = max(0, self._file_count - 1)
+
+    def _record_access(self, stem: str) -> None:
+        """Buffer an access time and opportunistically flush the batch."""
+        with self._pending_lock:
+            self._pending[stem] = time.time()
+            due = (
+                len(self._pending) >= self._flush_batch
+                or time.monotonic() - self._last_flush >= self._flush_interval
+            )
+        # Never wait for the index on the read path; a writer will flush later
+        if due and self._index_lock.acquire(blocking=False):
+            try:
+                with contextlib.suppress(sqlite3.Error, OSError):
+                    self._flush_locked()
+            finally:
+                self._index_lock.release()
+
+    def put(self, url: str, img: Image.Image, quality: int = 95) -> None:
+        """Save an image as WebP and evict if over the size limit."""
+        stem = url_hash(url)
+        path = self.cache_dir / f"{stem}.webp"
+        tmp_path = self.cache_dir / f"{stem}.{threading.get_ident()}.tmp"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            img.save(tmp_path, "WEBP", quality=quality)
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except (OSError, ValueError):
+            return  # Disk cache is best-effort (ValueError: mode WebP can't store)
+        finally:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)  # Left behind if save or replace failed
+
+        with self._index_lock:
+            try:
+                conn = self._connect()
+                old = conn.execute(
+                    "SELECT size FROM entries WHERE url_hash = ?", (stem,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (stem, url, ".webp", size, time.time()),
+                )
+                if old is None:
+                    self._file_count += 1
+                    self._total_bytes += size
+                else:
+                    self._total_bytes += size - old[0]
+
+                if self._total_bytes > self.max_bytes:
+                    self._evict_locked()
+            except sqlite3.Error:
+                pass  # Disk cache is best-effort
+
+    def clear(self) -> None:
+        """Remove all cached images and reset the index."""
+        with self._index_lock:
+            with self._pending_lock:
+                self._pending.clear()
+            if self.cache_dir.exists():
+                for ext in _EXTENSIONS:
+                    for f in self.cache_dir.glob(f"*{ext}"):
+                        f.unlink(missing_ok=True)
+                (self.cache_dir / LEGACY_METADATA_FILENAME).unlink(missing_ok=True)
+            with contextlib.suppress(sqlite3.Error, OSError):
+                self._connect().execute("DELETE FROM entries")
+            self._total_bytes = 0
+            self._file_count = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get file count and total bytes from the running totals."""
+        with self._index_lock:
+            with contextlib.suppress(sqlite3.Error, OSError):
+                self._connect()
+            return {"files": self._file_count, "bytes": self._total_bytes}
+
+    def close(self) -> None:
+        """Flush pending access times and close the index."""
+        with self._index_lock:
+            if self._conn is None:
+                return
+            with contextlib.suppress(sqlite3.Error, OSError):
+                self._flush_locked()
+            self._conn.close()
+            self._conn = None
@@ -410,9 +410,9 @@ class EnhancedArtNavigator(Vertical, can_focus=True):
 
         # Already in Gallery - release focus to results list
         try:
-            from textual.widgets import ListView
+            from ..results_list import ResultsList
 
-            results_list = self.app.query_one("#results-list", ListView)
+            results_list = self.app.query_one("#results-list", ResultsList)
             results_list.focus()
         except (LookupError, AttributeError):
             pass
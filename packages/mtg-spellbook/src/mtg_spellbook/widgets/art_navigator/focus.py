@@ -18,7 +18,7 @@ from textual.widgets import Static
 from ...formatting import prettify_mana
 from ...ui.theme import card_type_colors, get_price_color, rarity_colors, ui_colors
 from . import HAS_IMAGE_SUPPORT, TImage
-from .image_loader import load_image_from_url
+from .image_loader import ImageTier, load_card_image
 from .messages import ArtistSelected
 
 if TYPE_CHECKING:
@@ -447,8 +447,7 @@ class FocusView(Vertical, can_focus=True):
 
         try:
             img_widget = self.query_one("#focus-image", TImage)
-            use_large = not self.show_art_crop
-            await load_image_from_url(image_url, img_widget, use_large=use_large)
+            await load_card_image(image_url, img_widget, tier=ImageTier.LARGE)
         except NoMatches:
             pass
 
@@ -1,17 +1,27 @@
-"""Filmstrip layout for printings gallery - horizontal scrolling thumbnails."""
+"""Filmstrip layout for printings gallery - horizontal scrolling thumbnails.
+
+The filmstrip is virtualized: only the tiles in view plus a small overscan are
+mounted, and they are recycled as the strip scrolls. Spacers on either side give
+the strip its full scroll width, and filters/sorts run on the plain printings
+list without touching the DOM.
+"""
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, HorizontalScroll
+from textual.widgets import Static
 
 from .shop_card import ShopCard
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from textual import events
+
     from mtg_core.data.models.responses import PrintingInfo
 
 SORT_LABELS = {
@@ -20,6 +30,13 @@ SORT_LABELS = {
     "rarity": "[R] Rarity",
 }
 
+# Horizontal cells per tile (.shop-card width 18 + right margin 1)
+TILE_WIDTH = 19
+# Tiles kept mounted beyond each edge of the viewport
+OVERSCAN = 2
+# Tiles assumed visible before the first layout gives us a width
+_DEFAULT_VISIBLE = 6
+
 
 class PrintingsGrid(HorizontalScroll, can_focus=True):
     """Horizontal filmstrip of card thumbnails for all printings."""
@@ -33,7 +50,13 @@ class PrintingsGrid(HorizontalScroll, can_focus=True):
         super().__init__(id=id, classes=classes)
         self._printings: list[PrintingInfo] = []
         self._filtered_printings: list[PrintingInfo] = []
-        self._cards: list[ShopCard] = []
+        # Recycled tile pool; the tile for printing index k is _tiles[k % pool size]
+        self._tiles: list[ShopCard] = []
+        self._pool_lock = asyncio.Lock()
+        self._window_start: int = 0
+        # Pool index of the leftmost tile in the DOM, or None if the order is unknown
+        self._dom_offset: int | None = None
+        self._first_visible: int = 0
         self._selected_index: int = 0
         self._on_select: Callable[[int, PrintingInfo], None] | None = None
         self._card_name: str = ""
@@ -45,7 +68,9 @@ class PrintingsGrid(HorizontalScroll, can_focus=True):
 
     def compose(self) -> ComposeResult:
         """Build filmstrip with horizontal card container."""
-        yield Horizontal(id="filmstrip-container", classes="filmstrip-container")
+        with Horizontal(id="filmstrip-container", classes="filmstrip-container"):
+            yield Static(id="filmstrip-spacer-left", classes="filmstrip-spacer")
+            yield Static(id="filmstrip-spacer-right", classes="filmstrip-spacer")
 
     def set_on_select(self, callback: Callable[[int, PrintingInfo], None]) -> None:
         """Set callback for when a printing is selected."""
@@ -70,51 +95,149 @@ class PrintingsGrid(HorizontalScroll, can_focus=True):
             self._filter_set = None
             self._filter_rarity = None
 
-        # Apply sort and filters
+        # Apply sort and filters on the plain list; tiles are bound afterwards
         self._filtered_printings = self._apply_filters_and_sort(printings, sort_order)
         self._selected_index = 0
-
-        # Get the container
+        self.scroll_to(x=0, animate=False, immediate=True)
+
+        async with self._pool_lock:
+            await self._ensure_pool()
+            if current_generation != self._load_generation:
+                return
+            self._bind_window()
+
+        if self._filtered_printings and self._on_select:
+            self._on_select(0, self._filtered_printings[0])
+
+    def _visible_count(self) -> int:
+        """Number of tiles that fit in the viewport, counting partial tiles."""
+        width = self.scrollable_content_region.width
+        if width <= 0:
+            return _DEFAULT_VISIBLE
+        return width // TILE_WIDTH + 2
+
+    def _pool_size(self) -> int:
+        """Number of tiles needed for the viewport plus overscan."""
+        return min(len(self._filtered_printings), self._visible_count() + 2 * OVERSCAN)
+
+    async def _ensure_pool(self) -> None:
+        """Grow or shrink the tile pool to match the viewport (pool lock held)."""
+        needed = self._pool_size()
         container = self.query_one("#filmstrip-container", Horizontal)
 
-        # Remove old cards
-        if self._cards:
-            await container.query(".shop-card").remove()
-            self._cards.clear()
-
-        if current_generation != self._load_generation:
+        if len(self._tiles) > needed:
+            surplus = self._tiles[needed:]
+            del self._tiles[needed:]
+            await container.remove_children(surplus)
+        elif len(self._tiles) < needed:
+            new_tiles = [
+                ShopCard(
+                    self._filtered_printings[i],
+                    autoload=False,
+                    id=f"shop-slot-{i}",
+                    classes="shop-card",
+                )
+                for i in range(len(self._tiles), needed)
+            ]
+            self._tiles.extend(new_tiles)
+            await container.mount_all(new_tiles, before="#filmstrip-spacer-right")
+        else:
             return
+        self._dom_offset = None
 
-        # Create all shop cards (batch preparation)
-        cards_to_mount: list[ShopCard] = []
-        for idx, printing in enumerate(self._filtered_printings):
-            if printing.uuid:
-                unique_id = f"g{current_generation}-{printing.uuid}"
+    def _bind_window(self, scroll_x: float | None = None) -> None:
+        """Bind pooled tiles to the printings around a scroll position.
+
+        Defaults to the current scroll position; callers scrolling to a new
+        target pass it explicitly, since the scroll itself is clamped until the
+        next layout settles the strip's virtual width.
+        """
+        total = len(self._filtered_printings)
+        size = len(self._tiles)
+        container = self.query_one("#filmstrip-container", Horizontal)
+        left = container.query_one("#filmstrip-spacer-left", Static)
+        right = container.query_one("#filmstrip-spacer-right", Static)
+
+        visible = self._visible_count()
+        if scroll_x is None:
+            scroll_x = self.scroll_x
+        self._first_visible = max(0, int(scroll_x) - 1) // TILE_WIDTH
+        start = max(0, min(self._first_visible - OVERSCAN, total - size))
+        self._window_start = start
+
+        for index in range(start, start + size):
+            printing = self._filtered_printings[index]
+            tile = self._tiles[index % size]
+            tile.set_printing(printing)
+            tile.set_selected(index == self._selected_index)
+            tile.set_class(self._compare_key(printing) in self._compare_marked, "in-compare")
+
+        left.styles.width = start * TILE_WIDTH
+        right.styles.width = (total - start - size) * TILE_WIDTH
+        if size:
+            self._rotate_tiles(container, start % size)
+
+        # Only tiles actually in view fetch thumbnails; overscan waits its turn
+        for index in range(self._first_visible, min(self._first_visible + visible, start + size)):
+            self._tiles[index % size].load_thumbnail()
+
+    def _rotate_tiles(self, container: Horizontal, offset: int) -> None:
+        """Rotate the tile ring in the DOM so ``_tiles[offset]`` comes first.
+
+        Only the tiles that wrap around are moved, so scrolling by one tile
+        moves a single widget.
+        """
+        size = len(self._tiles)
+        if self._dom_offset is None:
+            right = container.query_one("#filmstrip-spacer-right", Static)
+            for i in range(size):
+                container.move_child(self._tiles[(offset + i) % size], before=right)
+        else:
+            shift = (offset - self._dom_offset) % size
+            if shift == 0:
+                return
+            if shift <= size // 2:
+                # Leftmost tiles wrap to the right end
+                last = self._tiles[(self._dom_offset - 1) % size]
+                for i in range(shift):
+                    tile = self._tiles[(self._dom_offset + i) % size]
+                    container.move_child(tile, after=last)
+                    last = tile
             else:
-                unique_id = f"g{current_generation}-{printing.set_code or 'unk'}-{printing.collector_number or idx}"
-            card = ShopCard(
-                printing,
-                id=f"shop-{unique_id}",
-                classes="shop-card",
-            )
-            cards_to_mount.append(card)
-            self._cards.append(card)
+                # Rightmost tiles wrap to the left end
+                first = self._tiles[self._dom_offset]
+                for i in range(size - shift):
+                    container.move_child(self._tiles[(offset + i) % size], before=first)
+        self._dom_offset = offset
+
+    def _tile_for(self, index: int) -> ShopCard | None:
+        """Get the tile currently bound to a printing index, if mounted."""
+        size = len(self._tiles)
+        if size and self._window_start <= index < self._window_start + size:
+            return self._tiles[index % size]
+        return None
 
-        if current_generation != self._load_generation:
-            self._cards.clear()
-            return
+    @staticmethod
+    def _compare_key(printing: PrintingInfo) -> tuple[str, str]:
+        return (printing.set_code or "", printing.collector_number or "")
 
-        # Batch mount all cards into the container
-        if cards_to_mount:
-            await container.mount_all(cards_to_mount)
+    def watch_scroll_x(self, old_value: float, new_value: float) -> None:
+        """Rebind tiles when scrolling brings a new tile into view."""
+        super().watch_scroll_x(old_value, new_value)
+        first = max(0, int(new_value) - 1) // TILE_WIDTH
+        if self._tiles and first != self._first_visible and not self._pool_lock.locked():
+            self._bind_window()
 
-        if current_generation != self._load_generation:
+    async def on_resize(self, event: events.Resize) -> None:  # noqa: ARG002
+        """Resize the tile pool when the viewport width changes."""
+        if not self._filtered_printings or len(self._tiles) == self._pool_size():
             return
-
-        if self._cards and self._filtered_printings:
-            self._cards[0].set_selected(True)
-            if self._on_select:
-                self._on_select(0, self._filtered_printings[0])
+        generation = self._load_generation
+        async with self._pool_lock:
+            if generation != self._load_generation:
+                return
+            await self._ensure_pool()
+            self._bind_window()
 
     def _apply_filters_and_sort(
         self, printings: list[PrintingInfo], sort_order: str
@@ -198,12 +321,22 @@ class PrintingsGrid(HorizontalScroll, can_focus=True):
         if not (0 <= index < len(self._filtered_printings)):
             return
 
-        if 0 <= self._selected_index < len(self._cards):
-            self._cards[self._selected_index].set_selected(False)
-
+        old_tile = self._tile_for(self._selected_index)
+        if old_tile is not None:
+            old_tile.set_selected(False)
         self._selected_index = index
-        self._cards[index].set_selected(True)
-        self._cards[index].scroll_visible()
+
+        # Scroll just far enough to bring the tile into view
+        tile_x = 1 + index * TILE_WIDTH
+        width = self.scrollable_content_region.width
+        target_x = self.scroll_target_x
+        if tile_x < target_x:
+            target_x = tile_x - 1
+        elif width and tile_x + TILE_WIDTH > target_x + width:
+            target_x = tile_x + TILE_WIDTH - width
+        if not self._pool_lock.locked():
+            self._bind_window(target_x)
+        self.call_after_refresh(self.scroll_to, x=target_x, animate=False)
 
         if self._on_select:
             self._on_select(index, self._filtered_printings[index])
@@ -230,19 +363,18 @@ class PrintingsGrid(HorizontalScroll, can_focus=True):
 
     def mark_in_compare(self, printing: PrintingInfo) -> None:
         """Mark a printing as added to comparison."""
-        key = (printing.set_code or "", printing.collector_number or "")
+        key = self._compare_key(printing)
         self._compare_marked.add(key)
 
-        for i, p in enumerate(self._filtered_printings):
-            p_key = (p.set_code or "", p.collector_number or "")
-            if p_key == key and i < len(self._cards):
-                self._cards[i].add_class("in-compare")
+        for tile in self._tiles:
+            if self._compare_key(tile.printing) == key:
+                tile.add_class("in-compare")
 
     def clear_compare_marks(self) -> None:
         """Clear all comparison marks."""
         self._compare_marked.clear()
-        for card in self._cards:
-            card.remove_class("in-compare")
+        for tile in self._tiles:
+            tile.remove_class("in-compare")
 
     @property
     def current_index(self) -> int:
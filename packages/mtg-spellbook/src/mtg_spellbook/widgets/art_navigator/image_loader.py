@@ -3,12 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import hashlib
-import json
 import threading
-import time
 from collections import OrderedDict
+from enum import Enum
 from io import BytesIO
 from pathlib import Path
 from typing import Any
@@ -18,11 +15,14 @@ from PIL import Image, UnidentifiedImageError
 
 from mtg_core.config import get_settings
 
+from .disk_cache import ImageDiskCache
+
 # Memory cache: fast LRU for recently accessed images
 _memory_cache: OrderedDict[str, Image.Image] = OrderedDict()
 _memory_cache_lock = asyncio.Lock()
 
-# Disk cache lock: protects metadata read/write operations across threads
+# Disk cache: SQLite-indexed, opened lazily; the lock only guards creation
+_disk_cache: ImageDiskCache | None = None
 _disk_cache_lock = threading.Lock()
 
 # Shared httpx client for connection pooling (reused across all image loads)
@@ -62,128 +62,46 @@ def _get_cache_dir() -> Path:
     return get_settings().image_cache_dir
 
 
-def _get_metadata_file() -> Path:
-    """Get metadata file path."""
-    return _get_cache_dir() / "cache_metadata.json"
-
-
 def _get_cache_settings() -> tuple[int, int]:
     """Get cache settings from config."""
     settings = get_settings()
     return settings.image_cache_max_mb, settings.image_memory_cache_count
 
 
-def _get_cache_path(url: str, extension: str = ".webp") -> Path:
-    """Get disk cache path for a URL."""
-    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
-    return _get_cache_dir() / f"{url_hash}{extension}"
-
-
-def _load_metadata() -> dict[str, Any]:
-    """Load cache metadata from disk."""
-    metadata_file = _get_metadata_file()
-    if metadata_file.exists():
-        try:
-            data: dict[str, Any] = json.loads(metadata_file.read_text())
-            return data
-        except (json.JSONDecodeError, OSError):
-            pass  # Corrupted or inaccessible metadata, use defaults
-    return {"files": {}, "total_bytes": 0}
-
-
-def _save_metadata(metadata: dict[str, Any]) -> None:
-    """Save cache metadata to disk."""
-    try:
-        cache_dir = _get_cache_dir()
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        _get_metadata_file().write_text(json.dumps(metadata, indent=2))
-    except OSError:
-        pass  # Disk cache is best-effort
-
-
-def _evict_lru_files(metadata: dict[str, Any], max_bytes: int) -> dict[str, Any]:
-    """Evict oldest files until under the size limit."""
-    files = metadata.get("files", {})
-    total = metadata.get("total_bytes", 0)
+def _get_disk_cache() -> ImageDiskCache:
+    """Get the shared disk cache, reopening it if the configured directory changed."""
+    global _disk_cache
     cache_dir = _get_cache_dir()
+    max_mb, _ = _get_cache_settings()
+    with _disk_cache_lock:
+        if _disk_cache is None or _disk_cache.cache_dir != cache_dir:
+            if _disk_cache is not None:
+                _disk_cache.close()
+            _disk_cache = ImageDiskCache(cache_dir, max_mb * 1024 * 1024)
+        return _disk_cache
 
-    # Sort by last_access time (oldest first)
-    sorted_files = sorted(files.items(), key=lambda x: x[1].get("last_access", 0))
-
-    for url_hash, info in sorted_files:
-        if total <= max_bytes:
-            break
-        # Remove the file (try both extensions for backwards compatibility)
-        for ext in (".webp", ".png"):
-            file_path = cache_dir / f"{url_hash}{ext}"
-            if file_path.exists():
-                with contextlib.suppress(OSError):
-                    file_path.unlink()
-                break
-        total -= info.get("size", 0)
-        del files[url_hash]
 
-    metadata["files"] = files
-    metadata["total_bytes"] = max(0, total)
-    return metadata
+def _load_from_disk(url: str) -> Image.Image | None:
+    """Load image from disk cache (access time is recorded in a batched buffer)."""
+    return _get_disk_cache().get(url)
 
 
-def _load_from_disk(url: str) -> Image.Image | None:
-    """Load image from disk cache and update access time."""
-    with _disk_cache_lock:
-        # Try WebP first (new format), then PNG (legacy)
-        for ext in (".webp", ".png"):
-            cache_path = _get_cache_path(url, ext)
-            if cache_path.exists():
-                try:
-                    img = Image.open(cache_path)
-                    # Update access time in metadata
-                    url_hash = cache_path.stem
-                    metadata = _load_metadata()
-                    if url_hash in metadata.get("files", {}):
-                        metadata["files"][url_hash]["last_access"] = time.time()
-                        _save_metadata(metadata)
-                    return img
-                except (OSError, UnidentifiedImageError):
-                    cache_path.unlink(missing_ok=True)  # Corrupted cache file
-        return None
-
-
-def _save_to_disk(url: str, img: Image.Image) -> None:
+def _save_to_disk(url: str, img: Image.Image, quality: int = 95) -> None:
     """Save image to disk cache with LRU management.
 
-    Uses WebP format at quality 95 for ~79% size reduction vs PNG
-    with near-lossless quality.
+    Uses WebP format (quality 95 by default) for ~79% size reduction vs PNG
+    with near-lossless quality. Smaller tiers are stored at lower quality.
     """
+    _get_disk_cache().put(url, img, quality=quality)
+
+
+def close_disk_cache() -> None:
+    """Flush pending access times and close the disk cache index (call on app shutdown)."""
+    global _disk_cache
     with _disk_cache_lock:
-        try:
-            cache_dir = _get_cache_dir()
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_path = _get_cache_path(url, ".webp")
-            img.save(cache_path, "WEBP", quality=95)
-
-            # Update metadata
-            file_size = cache_path.stat().st_size
-            url_hash = cache_path.stem
-            metadata = _load_metadata()
-
-            # Add new file entry
-            metadata["files"][url_hash] = {
-                "url": url,
-                "size": file_size,
-                "last_access": time.time(),
-            }
-            metadata["total_bytes"] = metadata.get("total_bytes", 0) + file_size
-
-            # Check if we need to evict
-            max_mb, _ = _get_cache_settings()
-            max_bytes = max_mb * 1024 * 1024
-            if metadata["total_bytes"] > max_bytes:
-                metadata = _evict_lru_files(metadata, max_bytes)
-
-            _save_metadata(metadata)
-        except OSError:
-            pass  # Disk cache is best-effort
+        if _disk_cache is not None:
+            _disk_cache.close()
+            _disk_cache = None
 
 
 async def _add_to_memory_cache(url: str, img: Image.Image) -> None:
@@ -200,17 +118,8 @@ async def _add_to_memory_cache(url: str, img: Image.Image) -> None:
 
 
 def _clear_disk_cache() -> None:
-    """Clear disk cache files and metadata (called from thread)."""
-    with _disk_cache_lock:
-        cache_dir = _get_cache_dir()
-        metadata_file = _get_metadata_file()
-        if cache_dir.exists():
-            # Clear both WebP (new) and PNG (legacy) files
-            for pattern in ("*.webp", "*.png"):
-                for f in cache_dir.glob(pattern):
-                    f.unlink(missing_ok=True)
-            if metadata_file.exists():
-                metadata_file.unlink(missing_ok=True)
+    """Clear disk cache files and index (called from thread)."""
+    _get_disk_cache().clear()
 
 
 async def clear_image_cache() -> None:
@@ -223,102 +132,167 @@ async def clear_image_cache() -> None:
 
 def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics for debugging/display."""
-    metadata = _load_metadata()
+    disk = _get_disk_cache().stats()
     max_mb, max_memory = _get_cache_settings()
     return {
-        "disk_files": len(metadata.get("files", {})),
-        "disk_bytes": metadata.get("total_bytes", 0),
-        "disk_mb": round(metadata.get("total_bytes", 0) / 1024 / 1024, 2),
+        "disk_files": disk["files"],
+        "disk_bytes": disk["bytes"],
+        "disk_mb": round(disk["bytes"] / 1024 / 1024, 2),
         "disk_limit_mb": max_mb,
         "memory_count": len(_memory_cache),
         "memory_limit": max_memory,
     }
 
 
-async def load_image_from_url(
+class ImageTier(Enum):
+    """Display size tiers for card images.
+
+    Each tier has its own cache entry. A smaller tier is derived from any cached
+    larger tier instead of being refetched, and a network fetch only downloads
+    the Scryfall variant the tier actually needs.
+    """
+
+    THUMB = ("small", 146, 204, 85)  # Grid tiles (Scryfall small size)
+    CARD = ("normal", 488, 680, 90)  # Carousel and compare slots
+    LARGE = ("large", 672, 936, 95)  # Focus view and preview panels
+
+    def __init__(self, variant: str, max_width: int, max_height: int, quality: int) -> None:
+        self.variant = variant
+        self.max_width = max_width
+        self.max_height = max_height
+        self.quality = quality
+
+    def larger(self) -> list[ImageTier]:
+        """Tiers a cached image could be derived from, smallest first."""
+        tiers = list(ImageTier)
+        return tiers[tiers.index(self) + 1 :]
+
+
+# Scryfall size variants that appear as a path segment in image URLs
+_SIZE_VARIANTS = ("small", "normal", "large", "png")
+
+
+def _variant_url(url: str, variant: str) -> str:
+    """Rewrite a Scryfall image URL to another size variant.
+
+    URLs without a size segment (art crops, non-Scryfall hosts) are returned unchanged.
+    """
+    for current in _SIZE_VARIANTS:
+        segment = f"/{current}/"
+        if segment in url:
+            return url.replace(segment, f"/{variant}/", 1)
+    return url
+
+
+def _tier_key(url: str, tier: ImageTier) -> str:
+    """Cache key for an image at a tier.
+
+    The large tier keeps the plain large URL so existing cache entries stay valid.
+    """
+    large_url = _variant_url(url, ImageTier.LARGE.variant)
+    if tier is ImageTier.LARGE:
+        return large_url
+    return f"{large_url}#{tier.name.lower()}"
+
+
+async def _get_cached_image(key: str) -> Image.Image | None:
+    """Look up an image in the memory cache, then the disk cache (promoting hits)."""
+    async with _memory_cache_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)  # LRU update
+            return _memory_cache[key]
+
+    # Run disk access in a thread to avoid blocking the event loop
+    disk_image = await asyncio.to_thread(_load_from_disk, key)
+    if disk_image is not None:
+        await _add_to_memory_cache(key, disk_image)
+    return disk_image
+
+
+async def _fetch_image(url: str, timeout: float) -> Image.Image:
+    """Download and decode an image using the shared HTTP client."""
+    client = await _get_http_client()
+    response = await client.get(url, timeout=timeout)
+    response.raise_for_status()
+
+    pil_image: Image.Image = Image.open(BytesIO(response.content))
+
+    # Convert to RGB for consistent color handling
+    if pil_image.mode not in ("RGB", "L"):
+        pil_image = pil_image.convert("RGB")
+    return pil_image
+
+
+async def _store_image(key: str, img: Image.Image, quality: int = 95) -> None:
+    """Cache in memory (LRU) and on disk (persistent)."""
+    await _add_to_memory_cache(key, img)
+    # Run disk save in thread to avoid blocking event loop during WebP encoding
+    await asyncio.to_thread(_save_to_disk, key, img, quality)
+
+
+async def get_card_image(
+    url: str,
+    tier: ImageTier = ImageTier.LARGE,
+    *,
+    timeout: float = 15.0,
+) -> Image.Image:
+    """Get a card image sized for a display tier.
+
+    Resolution order: the tier's own cache entry, a cached larger tier
+    (downscaled locally), then the network using the tier's Scryfall variant.
+
+    Raises:
+        httpx.HTTPError, UnidentifiedImageError, OSError: If the image cannot be fetched.
+    """
+    key = _tier_key(url, tier)
+    cached = await _get_cached_image(key)
+    if cached is not None:
+        return cached
+
+    source: Image.Image | None = None
+    for larger in tier.larger():
+        source = await _get_cached_image(_tier_key(url, larger))
+        if source is not None:
+            break
+
+    if source is None:
+        source = await _fetch_image(_variant_url(url, tier.variant), timeout)
+
+    # Pre-resize with LANCZOS for high-quality downscaling
+    img = _prepare_image_for_display(source, tier.max_width, tier.max_height)
+    await _store_image(key, img, tier.quality)
+    return img
+
+
+async def load_card_image(
     url: str,
     target_widget: Any,
     *,
-    use_large: bool = True,
+    tier: ImageTier = ImageTier.LARGE,
     timeout: float = 15.0,
-    max_width: int = 672,
-    max_height: int = 936,
 ) -> bool:
-    """Load image from URL into a Textual Image widget.
-
-    Pre-processes the image with high-quality LANCZOS resampling to prevent
-    banding artifacts that occur when textual_image uses NEAREST neighbor
-    interpolation internally.
+    """Load a card image at a display tier into a Textual Image widget.
 
     Args:
-        url: The image URL to fetch.
+        url: Any Scryfall size variant of the image URL (or an art crop URL).
         target_widget: The Textual Image widget to update.
-        use_large: If True, replace "normal" with "large" in URL.
+        tier: The size tier the widget renders at.
         timeout: Request timeout in seconds.
-        max_width: Maximum width for pre-processing (default: Scryfall large card width).
-        max_height: Maximum height for pre-processing (default: Scryfall large card height).
 
     Returns:
         True if successful, False otherwise.
     """
+    # Show loading state if widget supports it
+    if hasattr(target_widget, "loading"):
+        target_widget.loading = True
     try:
-        # Show loading state if widget supports it
-        if hasattr(target_widget, "loading"):
-            target_widget.loading = True
-
-        if use_large and "normal" in url:
-            url = url.replace("normal", "large")
-
-        # Check memory cache first (fastest, thread-safe)
-        async with _memory_cache_lock:
-            if url in _memory_cache:
-                _memory_cache.move_to_end(url)  # LRU update
-                target_widget.image = _memory_cache[url]
-                if hasattr(target_widget, "loading"):
-                    target_widget.loading = False
-                return True
-
-        # Check disk cache (persistent across sessions) - run in thread to avoid blocking
-        disk_image = await asyncio.to_thread(_load_from_disk, url)
-        if disk_image is not None:
-            await _add_to_memory_cache(url, disk_image)  # Promote to memory
-            target_widget.image = disk_image
-            if hasattr(target_widget, "loading"):
-                target_widget.loading = False
-            return True
-
-        # Fetch from network using shared client
-        client = await _get_http_client()
-        response = await client.get(url, timeout=timeout)
-        response.raise_for_status()
-        image_data = response.content
-
-        pil_image: Image.Image = Image.open(BytesIO(image_data))
-
-        # Convert to RGB for consistent color handling
-        if pil_image.mode not in ("RGB", "L"):
-            pil_image = pil_image.convert("RGB")
-
-        # Pre-resize with LANCZOS for high-quality downscaling
-        # This prevents banding artifacts from textual_image's NEAREST neighbor resize
-        pil_image = _prepare_image_for_display(pil_image, max_width, max_height)
-
-        # Cache in memory (LRU) and on disk (persistent)
-        await _add_to_memory_cache(url, pil_image)
-        # Run disk save in thread to avoid blocking event loop during WebP encoding
-        await asyncio.to_thread(_save_to_disk, url, pil_image)
-
-        target_widget.image = pil_image
-
-        if hasattr(target_widget, "loading"):
-            target_widget.loading = False
-
+        target_widget.image = await get_card_image(url, tier, timeout=timeout)
         return True
-
     except (httpx.HTTPError, UnidentifiedImageError, OSError):
+        return False
+    finally:
         if hasattr(target_widget, "loading"):
             target_widget.loading = False
-        return False
 
 
 def _prepare_image_for_display(
@@ -11,7 +11,7 @@ from textual.css.query import NoMatches
 from textual.widgets import Static
 
 from . import HAS_IMAGE_SUPPORT, TImage
-from .image_loader import load_image_from_url
+from .image_loader import ImageTier, load_card_image
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import PrintingInfo
@@ -65,7 +65,7 @@ class PreviewPanel(Vertical):
 
         try:
             img_widget = self.query_one("#preview-image", TImage)
-            await load_image_from_url(image_url, img_widget, use_large=True)
+            await load_card_image(image_url, img_widget, tier=ImageTier.LARGE)
         except NoMatches:
             pass
 
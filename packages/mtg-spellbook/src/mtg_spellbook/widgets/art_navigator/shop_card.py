@@ -12,89 +12,100 @@ from textual.widgets import Static
 
 from ...ui.theme import get_price_color, get_rarity_style, ui_colors
 from . import HAS_IMAGE_SUPPORT, TImage
-from .image_loader import load_image_from_url
+from .image_loader import ImageTier, load_card_image
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import PrintingInfo
 
 
-def _get_small_url(image_url: str | None) -> str | None:
-    """Convert normal image URL to small thumbnail URL."""
-    if not image_url:
-        return None
-    # Scryfall URL pattern: /normal/ -> /small/
-    return image_url.replace("/normal/", "/small/")
-
-
 class ShopCard(Vertical, can_focus=True):
-    """Card display with thumbnail image and info below."""
+    """Card display with thumbnail image and info below.
+
+    Tiles can be rebound to a different printing with ``set_printing`` so the
+    virtualized filmstrip can recycle them while scrolling.
+    """
 
     def __init__(
         self,
         printing: PrintingInfo,
         *,
+        autoload: bool = True,
         id: str | None = None,
         classes: str | None = None,
     ) -> None:
         super().__init__(id=id, classes=classes)
         self.printing = printing
         self.selected = False
-        self._image_loaded = False
+        self._autoload = autoload
+        self._load_requested = False
 
     def compose(self) -> ComposeResult:
         """Build compact filmstrip card: thumbnail + set/rarity + price."""
-        p = self.printing
-
         # Thumbnail image area
         if HAS_IMAGE_SUPPORT:
             yield TImage(id=f"{self.id}-thumb", classes="shop-card-thumb")
         else:
             yield Static("[dim]IMG[/]", classes="shop-card-thumb-placeholder")
 
-        # Set code + rarity icon on same line (e.g., "PIP ★")
+        yield Static(self._set_text(), classes="shop-card-set")
+        yield Static(self._price_text(), classes="shop-card-price")
+
+    def _set_text(self) -> str:
+        """Set code + rarity icon on same line (e.g., "PIP ★")."""
+        p = self.printing
         set_code = p.set_code.upper() if p.set_code else "???"
         rarity_icon, rarity_color = get_rarity_style(p.rarity or "common")
-        yield Static(
-            f"[{ui_colors.GOLD}]{set_code}[/][{rarity_color}]{rarity_icon}[/]",
-            classes="shop-card-set",
-        )
-
-        # Price
-        if p.price_usd is not None:
-            price_text = f"${p.price_usd:.2f}"
-            price_color = get_price_color(p.price_usd)
-            yield Static(
-                f"[{price_color}]{price_text}[/]",
-                classes="shop-card-price",
-            )
-        else:
-            yield Static("[dim]--[/]", classes="shop-card-price")
+        return f"[{ui_colors.GOLD}]{set_code}[/][{rarity_color}]{rarity_icon}[/]"
+
+    def _price_text(self) -> str:
+        """Colored price, or a dim placeholder when unknown."""
+        p = self.printing
+        if p.price_usd is None:
+            return "[dim]--[/]"
+        return f"[{get_price_color(p.price_usd)}]${p.price_usd:.2f}[/]"
 
     def on_mount(self) -> None:
         """Load thumbnail when mounted."""
-        if HAS_IMAGE_SUPPORT and not self._image_loaded:
+        if self._autoload:
+            self.load_thumbnail()
+
+    def set_printing(self, printing: PrintingInfo) -> None:
+        """Rebind this tile to another printing, dropping the old thumbnail.
+
+        A thumbnail load still in flight for the old printing is cancelled, so
+        it cannot land on the rebound tile.
+        """
+        if printing is self.printing:
+            return
+        self.workers.cancel_group(self, "shop-card-thumb")
+        self.printing = printing
+        self._load_requested = False
+        try:
+            self.query_one(".shop-card-set", Static).update(self._set_text())
+            self.query_one(".shop-card-price", Static).update(self._price_text())
+            if HAS_IMAGE_SUPPORT:
+                self.query_one(f"#{self.id}-thumb", TImage).image = None
+        except NoMatches:
+            pass
+
+    def load_thumbnail(self) -> None:
+        """Start loading the thumbnail once per bound printing."""
+        if HAS_IMAGE_SUPPORT and self.printing.image and not self._load_requested:
+            self._load_requested = True
             self._load_thumbnail()
 
-    @work
+    @work(exclusive=True, group="shop-card-thumb")
     async def _load_thumbnail(self) -> None:
-        """Load the thumbnail image."""
+        """Load the thumbnail image (``set_printing`` cancels any load in flight)."""
         if not HAS_IMAGE_SUPPORT:
             return
 
-        small_url = _get_small_url(self.printing.image)
-        if not small_url:
+        if not self.printing.image:
             return
 
         try:
             thumb_widget = self.query_one(f"#{self.id}-thumb", TImage)
-            await load_image_from_url(
-                small_url,
-                thumb_widget,
-                use_large=False,
-                max_width=146,  # Scryfall small size
-                max_height=204,
-            )
-            self._image_loaded = True
+            await load_card_image(self.printing.image, thumb_widget, tier=ImageTier.THUMB)
         except NoMatches:
             pass
 
@@ -30,6 +30,55 @@ class CardLike(Protocol):
 CardT = TypeVar("CardT", bound=CardLike)
 
 
+def format_card_result(card: CardLike) -> str:
+    """Format a card as the two-line result markup used by lists and dropdowns."""
+    # Get display name (flavor_name if present, otherwise name)
+    display_name = card.flavor_name if card.flavor_name else card.name
+    has_flavor = card.flavor_name is not None and card.flavor_name != card.name
+
+    # Get formatting helpers
+    rarity_color = CardFormatters.get_rarity_color(card.rarity)
+    rarity_symbol = CardFormatters.get_rarity_symbol(card.rarity)
+    type_icon = CardFormatters.get_type_icon(card.type or "")
+    type_color = CardFormatters.get_type_color(card.type or "")
+
+    # Mana cost
+    mana = prettify_mana(card.mana_cost or "")
+
+    # Set code
+    set_code = (card.set_code or "").upper()
+
+    # Card type (truncate if too long)
+    card_type = card.type or ""
+
+    # Build Line 1: rarity symbol + display name + mana
+    line1 = f"[{rarity_color}]{rarity_symbol}[/] [bold {rarity_color}]{display_name}[/]"
+    if mana:
+        line1 += f"  {mana}"
+
+    # Build Line 2: original name (if flavor) + type icon + type + set
+    line2_parts = []
+
+    # If there's a flavor name, show original name first
+    if has_flavor:
+        line2_parts.append(f"[dim]{card.name}[/]")
+
+    # Type info
+    if type_icon:
+        line2_parts.append(f"[{type_color}]{type_icon}[/]")
+    if card_type:
+        line2_parts.append(f"[dim]{card_type}[/]")
+
+    # Set code
+    if set_code:
+        line2_parts.append(f"[dim]{set_code}[/]")
+
+    # Always include line2 for consistent height (even if empty)
+    line2 = "   " + "  ".join(line2_parts) if line2_parts else "   "
+
+    return f"{line1}\n{line2}"
+
+
 class CardResultItem(ListItem, Generic[CardT]):
     """Unified card result item for search results and dropdowns.
 
@@ -73,53 +122,7 @@ class CardResultItem(ListItem, Generic[CardT]):
 
     def _format_card(self) -> str:
         """Format the card for display."""
-        card = self.card
-
-        # Get display name (flavor_name if present, otherwise name)
-        display_name = card.flavor_name if card.flavor_name else card.name
-        has_flavor = card.flavor_name is not None and card.flavor_name != card.name
-
-        # Get formatting helpers
-        rarity_color = CardFormatters.get_rarity_color(card.rarity)
-        rarity_symbol = CardFormatters.get_rarity_symbol(card.rarity)
-        type_icon = CardFormatters.get_type_icon(card.type or "")
-        type_color = CardFormatters.get_type_color(card.type or "")
-
-        # Mana cost
-        mana = prettify_mana(card.mana_cost or "")
-
-        # Set code
-        set_code = (card.set_code or "").upper()
-
-        # Card type (truncate if too long)
-        card_type = card.type or ""
-
-        # Build Line 1: rarity symbol + display name + mana
-        line1 = f"[{rarity_color}]{rarity_symbol}[/] [bold {rarity_color}]{display_name}[/]"
-        if mana:
-            line1 += f"  {mana}"
-
-        # Build Line 2: original name (if flavor) + type icon + type + set
-        line2_parts = []
-
-        # If there's a flavor name, show original name first
-        if has_flavor:
-            line2_parts.append(f"[dim]{card.name}[/]")
-
-        # Type info
-        if type_icon:
-            line2_parts.append(f"[{type_color}]{type_icon}[/]")
-        if card_type:
-            line2_parts.append(f"[dim]{card_type}[/]")
-
-        # Set code
-        if set_code:
-            line2_parts.append(f"[dim]{set_code}[/]")
-
-        # Always include line2 for consistent height (even if empty)
-        line2 = "   " + "  ".join(line2_parts) if line2_parts else "   "
-
-        return f"{line1}\n{line2}"
+        return format_card_result(self.card)
 
 
 class CardResultFormatter:
@@ -131,5 +134,4 @@ class CardResultFormatter:
 
         Use this when you need the formatted string without the ListItem wrapper.
         """
-        item = CardResultItem(card)
-        return item._format_card()
+        return format_card_result(card)
@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
-from textual.widgets import ListView
+from collections.abc import Iterable
 
+from .virtual_list import VirtualList
 
-class ResultsList(ListView):
-    """List of search results with keyboard navigation."""
 
-    pass
+def _markup(row: str) -> str:
+    return row
+
+
+class ResultsList(VirtualList[str]):
+    """List of search results with keyboard navigation.
+
+    Rows are markup strings formatted by the command that fills the list: two
+    lines per card result, or one line per row for messages, set lists and
+    detail text. Only the rows in view are rendered.
+    """
+
+    def __init__(self, *, id: str | None = None, classes: str | None = None) -> None:
+        super().__init__(_markup, row_height=2, id=id, classes=classes)
+
+    def show(self, rows: Iterable[str], *, row_height: int = 2, index: int | None = 0) -> None:
+        """Replace the rows, each ``row_height`` lines tall, and move the cursor."""
+        self.row_height = row_height
+        self.set_rows(rows, index=index)
+
+    def show_lines(self, lines: Iterable[str]) -> None:
+        """Show plain one-line rows (messages, set lists, details) with nothing highlighted."""
+        self.show(lines, row_height=1, index=None)
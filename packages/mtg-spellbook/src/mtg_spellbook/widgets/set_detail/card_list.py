@@ -113,7 +113,7 @@ class SetCardList(VerticalScroll):
 
     async def load_cards(self, cards: list[CardSummary]) -> None:
         """Load and display cards."""
-        self._all_cards = cards
+        self._all_cards = list(cards)
         self._apply_filters()
         await self._rebuild_list()
 
@@ -122,6 +122,33 @@ class SetCardList(VerticalScroll):
             self.selected_index = 0
             self._notify_selection()
 
+    async def append_cards(self, cards: list[CardSummary]) -> None:
+        """Append a batch of cards (a set streaming in), keeping filters and highlight."""
+        self._all_cards.extend(cards)
+        matching = self._matching(cards)
+        if not matching:
+            return
+
+        start = len(self._filtered_cards)
+        self._filtered_cards.extend(matching)
+        try:
+            empty_msg = self.query_one("#card-list-empty", Static)
+            list_view = self.query_one("#card-list-view", ListView)
+        except NoMatches:
+            return
+
+        empty_msg.display = False
+        list_view.display = True
+        await list_view.extend(
+            CardListItem(card, id=f"card-item-{start + i}") for i, card in enumerate(matching)
+        )
+
+        # Select the first card once the first batch arrives
+        if start == 0:
+            list_view.index = 0
+            self.selected_index = 0
+            self._notify_selection()
+
     def filter_cards(
         self,
         rarity: str | None = None,
@@ -147,19 +174,17 @@ class SetCardList(VerticalScroll):
 
     def _apply_filters(self) -> None:
         """Apply current filters to card list."""
-        self._filtered_cards = self._all_cards.copy()
+        self._filtered_cards = self._matching(self._all_cards)
 
+    def _matching(self, cards: list[CardSummary]) -> list[CardSummary]:
+        """The cards passing the current filters."""
         if self.filter_rarity:
-            self._filtered_cards = [
-                c
-                for c in self._filtered_cards
-                if (c.rarity or "").lower() == self.filter_rarity.lower()
-            ]
+            cards = [c for c in cards if (c.rarity or "").lower() == self.filter_rarity.lower()]
 
         if self.filter_color:
-            self._filtered_cards = [
-                c for c in self._filtered_cards if self.filter_color.upper() in (c.colors or [])
-            ]
+            cards = [c for c in cards if self.filter_color.upper() in (c.colors or [])]
+
+        return list(cards)
 
     async def _rebuild_list(self) -> None:
         """Rebuild the list view with filtered cards."""
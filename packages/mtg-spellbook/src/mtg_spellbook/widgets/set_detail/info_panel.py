@@ -25,12 +25,16 @@ class SetStats:
         color_distribution: dict[str, int] | None = None,
         mechanics: list[str] | None = None,
         avg_cmc: float | None = None,
+        type_distribution: dict[str, int] | None = None,
+        total_value_usd: float | None = None,
     ) -> None:
         self.total_cards = total_cards
         self.rarity_distribution = rarity_distribution or {}
         self.color_distribution = color_distribution or {}
         self.mechanics = mechanics or []
         self.avg_cmc = avg_cmc
+        self.type_distribution = type_distribution or {}
+        self.total_value_usd = total_value_usd
 
 
 class SetInfoPanel(VerticalScroll):
@@ -133,6 +137,24 @@ class SetInfoPanel(VerticalScroll):
                     lines.append(f"  [{color}]{rarity.title()}:[/] {count}")
             lines.append("")
 
+        # Type distribution, most common first
+        if self._stats and self._stats.type_distribution:
+            lines.append(f"[bold {ui_colors.GOLD_DIM}]Card Types[/]")
+            for card_type, count in sorted(
+                self._stats.type_distribution.items(), key=lambda item: -item[1]
+            ):
+                lines.append(f"  [{ui_colors.TEXT_DIM}]{card_type}:[/] {count}")
+            lines.append("")
+
+        if self._stats and self._stats.avg_cmc is not None:
+            lines.append(f"[{ui_colors.TEXT_DIM}]Avg. Mana Value:[/] {self._stats.avg_cmc:.2f}")
+        if self._stats and self._stats.total_value_usd:
+            lines.append(
+                f"[{ui_colors.TEXT_DIM}]Set Value:[/] [green]${self._stats.total_value_usd:,.2f}[/]"
+            )
+        if self._stats and (self._stats.avg_cmc is not None or self._stats.total_value_usd):
+            lines.append("")
+
         # Mechanics
         if self._stats and self._stats.mechanics:
             lines.append(f"[bold {ui_colors.GOLD_DIM}]Mechanics[/]")
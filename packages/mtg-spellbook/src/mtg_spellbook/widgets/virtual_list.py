@@ -0,0 +1,398 @@
+"""Virtual-scrolling list over a plain row model.
+
+``VirtualList`` renders rows through Textual's line API: only the lines in view
+are formatted, so a list of 20k rows costs the same to show as a list of 20.
+Rows are plain objects; a formatter turns a row into markup when it scrolls
+into view. Edits touch the row model directly (``update_row``, ``insert_row``,
+``remove_row``) instead of rebuilding widgets.
+
+Long result sets can be loaded a window at a time: set ``has_more`` (through
+``set_rows``/``append_rows``) and the list posts ``MoreRowsNeeded`` when the
+cursor or viewport comes within a screen of the last loaded row; the owner
+answers with ``append_rows``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, ClassVar, Generic, TypeVar
+
+from textual import events
+from textual.binding import Binding, BindingType
+from textual.cache import LRUCache
+from textual.content import Content
+from textual.geometry import Region, Size
+from textual.markup import MarkupError
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.visual import Padding, Visual
+
+RowT = TypeVar("RowT")
+
+# Rendered rows kept between frames (a few screens' worth)
+_RENDER_CACHE_SIZE = 256
+
+
+class VirtualList(ScrollView, Generic[RowT], can_focus=True):
+    """Keyboard-navigable list that renders only the rows in view.
+
+    Every row is ``row_height`` lines tall; formatted markup with fewer lines is
+    padded and longer markup is cropped.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+    ]
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "virtual-list--row",
+        "virtual-list--row-highlighted",
+        "virtual-list--empty",
+    }
+
+    DEFAULT_CSS = """
+    VirtualList {
+        height: 1fr;
+        overflow-x: hidden;
+        background: #121218;
+    }
+
+    VirtualList > .virtual-list--row {
+        padding: 0 1;
+    }
+
+    VirtualList > .virtual-list--row-highlighted {
+        background: #2a2a4e;
+    }
+
+    VirtualList > .virtual-list--empty {
+        color: #666;
+        padding: 0 1;
+    }
+    """
+
+    index: reactive[int | None] = reactive(None, init=False, always_update=True)
+
+    class Highlighted(Message):
+        """Posted when the highlighted row changes."""
+
+        def __init__(self, virtual_list: VirtualList[Any], index: int, row: Any) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.index = index
+            self.row = row
+
+        @property
+        def control(self) -> VirtualList[Any]:
+            return self.virtual_list
+
+    class Selected(Message):
+        """Posted when a row is chosen with Enter or a click."""
+
+        def __init__(self, virtual_list: VirtualList[Any], index: int, row: Any) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+            self.index = index
+            self.row = row
+
+        @property
+        def control(self) -> VirtualList[Any]:
+            return self.virtual_list
+
+    class MoreRowsNeeded(Message):
+        """Posted when the cursor or viewport nears the last row and more can be loaded."""
+
+        def __init__(self, virtual_list: VirtualList[Any]) -> None:
+            super().__init__()
+            self.virtual_list = virtual_list
+
+        @property
+        def control(self) -> VirtualList[Any]:
+            return self.virtual_list
+
+    def __init__(
+        self,
+        format_row: Callable[[RowT], str],
+        *,
+        row_height: int = 1,
+        empty_text: str = "",
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(id=id, classes=classes)
+        self._format_row = format_row
+        self.row_height = row_height
+        self.empty_text = empty_text
+        self._rows: list[RowT] = []
+        self._row_cache: LRUCache[tuple[int, bool], list[Strip]] = LRUCache(_RENDER_CACHE_SIZE)
+        # More rows exist past the loaded ones (see MoreRowsNeeded)
+        self.has_more = False
+        self._more_requested = False
+
+    # -- Row model ----------------------------------------------------------
+
+    @property
+    def rows(self) -> Sequence[RowT]:
+        """The rows in display order (read-only view)."""
+        return self._rows
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows."""
+        return len(self._rows)
+
+    @property
+    def highlighted_row(self) -> RowT | None:
+        """The row under the cursor, if any."""
+        if self.index is None or not self._rows:
+            return None
+        return self._rows[self.index]
+
+    def set_rows(
+        self, rows: Iterable[RowT], *, index: int | None = 0, has_more: bool = False
+    ) -> None:
+        """Replace all rows and move the cursor (``None`` leaves no highlight).
+
+        ``has_more`` marks the rows as the first window of a longer list.
+        """
+        self._rows = list(rows)
+        self.has_more = has_more
+        self._more_requested = False
+        self._rows_changed()
+        if index is None or not self._rows:
+            self.set_reactive(VirtualList.index, None)
+            self.scroll_to(y=0, animate=False, immediate=True)
+        else:
+            self.index = index
+        self._check_more()
+
+    def append_rows(self, rows: Iterable[RowT], *, has_more: bool = False) -> None:
+        """Add the next window of rows after the loaded ones, keeping the cursor."""
+        self._rows.extend(rows)
+        self.has_more = has_more
+        self._more_requested = False
+        self._rows_changed()
+        if self.index is None and self._rows:
+            self.index = 0
+        self._check_more()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.set_rows([], index=None)
+
+    def update_row(self, index: int, row: RowT | None = None) -> None:
+        """Re-render one row, optionally replacing it."""
+        if not 0 <= index < len(self._rows):
+            return
+        if row is not None:
+            self._rows[index] = row
+        self._row_cache.discard((index, False))
+        self._row_cache.discard((index, True))
+        self._refresh_row(index)
+
+    def insert_row(self, index: int, row: RowT) -> None:
+        """Insert a row, keeping the cursor on the same row."""
+        index = max(0, min(index, len(self._rows)))
+        self._rows.insert(index, row)
+        self._rows_changed()
+        if self.index is None:
+            self.index = index
+        elif index <= self.index:
+            self.set_reactive(VirtualList.index, self.index + 1)
+
+    def remove_row(self, index: int) -> None:
+        """Remove a row; the cursor stays in place or moves up at the end."""
+        if not 0 <= index < len(self._rows):
+            return
+        del self._rows[index]
+        self._rows_changed()
+        if not self._rows:
+            self.set_reactive(VirtualList.index, None)
+        elif self.index is not None:
+            if index < self.index:
+                self.set_reactive(VirtualList.index, self.index - 1)
+            elif index == self.index:
+                # The highlighted row changed under the cursor; announce it
+                self.index = min(self.index, len(self._rows) - 1)
+
+    def find_index(self, predicate: Callable[[RowT], bool]) -> int | None:
+        """Index of the first row matching ``predicate``."""
+        for i, row in enumerate(self._rows):
+            if predicate(row):
+                return i
+        return None
+
+    def _rows_changed(self) -> None:
+        """Reset caches and scroll extent after the row list changed shape."""
+        self._row_cache.clear()
+        self._update_virtual_size()
+        self.refresh()
+
+    def _check_more(self) -> None:
+        """Ask for more rows once the cursor or viewport is within a screen of the end."""
+        if not self.has_more or self._more_requested:
+            return
+        last_visible = (
+            self.scroll_offset.y + self.scrollable_content_region.height
+        ) // self.row_height
+        if max(last_visible, self.index or 0) >= len(self._rows) - self._page_rows():
+            self._more_requested = True
+            self.post_message(self.MoreRowsNeeded(self))
+
+    def _update_virtual_size(self) -> None:
+        self.virtual_size = Size(
+            self.scrollable_content_region.width, len(self._rows) * self.row_height
+        )
+
+    # -- Cursor ---------------------------------------------------------------
+
+    def validate_index(self, index: int | None) -> int | None:
+        """Clamp the cursor to the rows."""
+        if index is None or not self._rows:
+            return None
+        return max(0, min(index, len(self._rows) - 1))
+
+    def watch_index(self, old_index: int | None, new_index: int | None) -> None:
+        """Repaint the old and new cursor rows and announce the highlight."""
+        if old_index is not None:
+            self._refresh_row(old_index)
+        if new_index is None:
+            return
+        self._refresh_row(new_index)
+        self.scroll_to_index(new_index)
+        self.post_message(self.Highlighted(self, new_index, self._rows[new_index]))
+        self._check_more()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Scroll, asking for more rows near the end."""
+        super().watch_scroll_y(old_value, new_value)
+        self._check_more()
+
+    def scroll_to_index(self, index: int) -> None:
+        """Scroll just far enough to show a row."""
+        self.scroll_to_region(
+            Region(0, index * self.row_height, 1, self.row_height),
+            animate=False,
+            force=True,
+            immediate=True,
+        )
+
+    def _page_rows(self) -> int:
+        return max(1, self.scrollable_content_region.height // self.row_height)
+
+    def action_cursor_up(self) -> None:
+        """Move the cursor up one row."""
+        if self._rows:
+            self.index = 0 if self.index is None else self.index - 1
+
+    def action_cursor_down(self) -> None:
+        """Move the cursor down one row."""
+        if self._rows:
+            self.index = 0 if self.index is None else self.index + 1
+
+    def action_page_up(self) -> None:
+        """Move the cursor up one screen."""
+        if self._rows:
+            self.index = (self.index or 0) - self._page_rows()
+
+    def action_page_down(self) -> None:
+        """Move the cursor down one screen."""
+        if self._rows:
+            self.index = (self.index or 0) + self._page_rows()
+
+    def action_first(self) -> None:
+        """Jump to the first row."""
+        if self._rows:
+            self.index = 0
+
+    def action_last(self) -> None:
+        """Jump to the last row."""
+        if self._rows:
+            self.index = len(self._rows) - 1
+
+    def action_select_cursor(self) -> None:
+        """Choose the highlighted row."""
+        if self.index is not None and self._rows:
+            self.post_message(self.Selected(self, self.index, self._rows[self.index]))
+
+    def on_click(self, event: events.Click) -> None:
+        """Highlight and choose the clicked row."""
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        index = (offset.y + self.scroll_offset.y) // self.row_height
+        if 0 <= index < len(self._rows):
+            self.focus()
+            self.index = index
+            self.post_message(self.Selected(self, index, self._rows[index]))
+
+    # -- Rendering ----------------------------------------------------------
+
+    def on_resize(self, _event: events.Resize) -> None:
+        """Re-render at the new width."""
+        self._row_cache.clear()
+        self._update_virtual_size()
+        self._check_more()
+
+    def _refresh_row(self, index: int) -> None:
+        """Repaint a row if it is on screen."""
+        y = index * self.row_height - self.scroll_offset.y
+        self.refresh(Region(0, y, self.size.width, self.row_height))
+
+    def _render_row(self, index: int) -> list[Strip]:
+        """Render a row to ``row_height`` strips, cached per highlight state."""
+        highlighted = index == self.index
+        cache_key = (index, highlighted)
+        strips = self._row_cache.get(cache_key)
+        if strips is not None:
+            return strips
+
+        component_classes = ["virtual-list--row"]
+        if highlighted:
+            component_classes.append("virtual-list--row-highlighted")
+        style = self.get_visual_style(*component_classes)
+        width = self.scrollable_content_region.width
+
+        markup = self._format_row(self._rows[index])
+        try:
+            content = Content.from_markup(markup)
+        except MarkupError:
+            content = Content(markup)
+        visual: Visual = content
+        padding = self.get_component_styles("virtual-list--row").padding
+        if padding:
+            visual = Padding(visual, padding)
+
+        strips = Visual.to_strips(self, visual, width, None, style)[: self.row_height]
+        strips += [Strip.blank(width, style.rich_style)] * (self.row_height - len(strips))
+        strips = [strip.extend_cell_length(width, style.rich_style) for strip in strips]
+        self._row_cache[cache_key] = strips
+        return strips
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line of the viewport."""
+        width = self.scrollable_content_region.width
+        line = self.scroll_offset.y + y
+        row_index, offset = divmod(line, self.row_height)
+
+        if row_index < len(self._rows):
+            return self._render_row(row_index)[offset]
+
+        if not self._rows and line == 0 and self.empty_text:
+            style = self.get_visual_style("virtual-list--empty")
+            visual = Padding(
+                Content.from_markup(self.empty_text),
+                self.get_component_styles("virtual-list--empty").padding,
+            )
+            strips = Visual.to_strips(self, visual, width, 1, style)
+            return strips[0].extend_cell_length(width, style.rich_style)
+
+        return Strip.blank(width, self.get_visual_style("virtual-list--row").rich_style)
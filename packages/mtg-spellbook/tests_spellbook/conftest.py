@@ -228,11 +228,17 @@ def mock_mtg_database(sample_card: Card, sample_search_results: list[Any]) -> Un
     # These return Card objects (not CardDetail) - they get converted by _card_to_detail
     mock_db.get_card_by_name = AsyncMock(return_value=sample_card)
     mock_db.get_card_by_uuid = AsyncMock(return_value=sample_card)
+    mock_db.get_cards_by_uuids = AsyncMock(
+        side_effect=lambda uuids, **_: dict.fromkeys(uuids, sample_card)
+    )
     mock_db.get_random_card = AsyncMock(return_value=sample_card)
 
     mock_db.search_cards = AsyncMock(
         return_value=(sample_search_results, len(sample_search_results))
     )
+    mock_db.search_card_rows = AsyncMock(
+        return_value=(sample_search_results, len(sample_search_results))
+    )
     mock_db.get_database_stats = AsyncMock(return_value={"unique_cards": 25000, "total_sets": 500})
     mock_db.get_all_keywords = AsyncMock(
         return_value={"Flying", "First Strike", "Trample", "Haste"}
@@ -21,10 +21,10 @@ class TestImageLoading:
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_with_valid_url(self, mock_image: Image.Image) -> None:
-        """Test load_image_from_url handles valid URL."""
+        """Test load_card_image handles valid URL."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         # Clear caches to ensure fresh request
@@ -61,7 +61,7 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            result = await load_image_from_url("https://example.com/test.jpg", mock_widget)
+            result = await load_card_image("https://example.com/test.jpg", mock_widget)
 
             assert result is True
             assert mock_widget.loading is False
@@ -69,10 +69,10 @@ class TestImageLoading:
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_with_404_error(self) -> None:
-        """Test load_image_from_url handles 404 gracefully."""
+        """Test load_card_image handles 404 gracefully."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         await clear_image_cache()
@@ -100,17 +100,17 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            result = await load_image_from_url("https://example.com/missing.jpg", mock_widget)
+            result = await load_card_image("https://example.com/missing.jpg", mock_widget)
 
             assert result is False
             assert mock_widget.loading is False
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_with_timeout(self) -> None:
-        """Test load_image_from_url handles timeout."""
+        """Test load_card_image handles timeout."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         await clear_image_cache()
@@ -138,19 +138,17 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            result = await load_image_from_url(
-                "https://example.com/slow.jpg", mock_widget, timeout=1.0
-            )
+            result = await load_card_image("https://example.com/slow.jpg", mock_widget, timeout=1.0)
 
             assert result is False
             assert mock_widget.loading is False
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_sets_loading_state(self, mock_image: Image.Image) -> None:
-        """Test load_image_from_url sets and clears loading state."""
+        """Test load_card_image sets and clears loading state."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         await clear_image_cache()
@@ -200,17 +198,17 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            await load_image_from_url("https://example.com/test.jpg", mock_widget)
+            await load_card_image("https://example.com/test.jpg", mock_widget)
 
             # Should set loading=True, then loading=False (verify order)
             assert loading_states == [True, False], f"Expected [True, False], got {loading_states}"
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_converts_rgba_to_rgb(self) -> None:
-        """Test load_image_from_url converts RGBA images to RGB."""
+        """Test load_card_image converts RGBA images to RGB."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         await clear_image_cache()
@@ -248,7 +246,7 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            result = await load_image_from_url("https://example.com/rgba.png", mock_widget)
+            result = await load_card_image("https://example.com/rgba.png", mock_widget)
 
             assert result is True
             # Image should be converted to RGB
@@ -256,10 +254,11 @@ class TestImageLoading:
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
     async def test_load_image_replaces_normal_with_large(self, mock_image: Image.Image) -> None:
-        """Test load_image_from_url replaces 'normal' with 'large' in URL."""
+        """Test load_card_image fetches the 'large' variant for the large tier."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
+            ImageTier,
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         # Clear caches to ensure fresh request
@@ -298,8 +297,8 @@ class TestImageLoading:
                 return_value=None,
             ),
         ):
-            await load_image_from_url(
-                "https://example.com/normal/test.jpg", mock_widget, use_large=True
+            await load_card_image(
+                "https://example.com/normal/test.jpg", mock_widget, tier=ImageTier.LARGE
             )
 
             # Check that URL was modified
@@ -308,13 +307,12 @@ class TestImageLoading:
             assert "normal" not in called_url
 
     @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
-    async def test_load_image_does_not_replace_when_use_large_false(
-        self, mock_image: Image.Image
-    ) -> None:
-        """Test load_image_from_url keeps original URL when use_large=False."""
+    async def test_load_image_keeps_normal_for_card_tier(self, mock_image: Image.Image) -> None:
+        """Test load_card_image keeps the 'normal' URL for the card tier."""
         from mtg_spellbook.widgets.art_navigator.image_loader import (
+            ImageTier,
             clear_image_cache,
-            load_image_from_url,
+            load_card_image,
         )
 
         await clear_image_cache()
@@ -353,7 +351,7 @@ class TestImageLoading:
             ),
         ):
             original_url = "https://example.com/normal/test.jpg"
-            await load_image_from_url(original_url, mock_widget, use_large=False)
+            await load_card_image(original_url, mock_widget, tier=ImageTier.CARD)
 
             # Check that URL was NOT modified
             assert called_url == original_url
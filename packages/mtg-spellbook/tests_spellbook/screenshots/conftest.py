@@ -190,6 +190,11 @@ def mock_database_for_snapshots() -> Iterator[None]:
             new_callable=AsyncMock,
             return_value=(mock_results, len(mock_results)),
         ),
+        patch(
+            "mtg_core.data.database.UnifiedDatabase.search_card_rows",
+            new_callable=AsyncMock,
+            return_value=(mock_results, len(mock_results)),
+        ),
         patch(
             "mtg_core.data.database.UnifiedDatabase.get_card_by_name",
             new_callable=AsyncMock,
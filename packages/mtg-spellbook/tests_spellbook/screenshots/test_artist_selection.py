@@ -9,9 +9,9 @@ from __future__ import annotations
 import asyncio
 
 import pytest
-from textual.widgets import ListView
 
 from mtg_spellbook.app import MTGSpellbook
+from mtg_spellbook.widgets import ResultsList
 
 
 class TestArtistSelection:
@@ -85,10 +85,10 @@ class TestArtistSelection:
             )
 
             # Results list should have items (artist's cards)
-            results_list = pilot.app.query_one("#results-list", ListView)
+            results_list = pilot.app.query_one("#results-list", ResultsList)
             # Give a bit more time for results to populate
             await asyncio.sleep(0.5)
-            assert len(results_list.children) > 0, (
+            assert results_list.row_count > 0, (
                 "Results list should have cards from the selected artist"
             )
 
@@ -9,10 +9,9 @@ from __future__ import annotations
 import asyncio
 
 import pytest
-from textual.widgets import ListView
 
 from mtg_spellbook.app import MTGSpellbook
-from mtg_spellbook.widgets import CardPanel
+from mtg_spellbook.widgets import CardPanel, ResultsList
 
 
 class TestDashboardSearch:
@@ -80,8 +79,8 @@ class TestDashboardSearch:
             )
 
             # Verify results list has the card
-            results_list = pilot.app.query_one("#results-list", ListView)
-            assert len(results_list.children) > 0, "Results list should have the selected card"
+            results_list = pilot.app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0, "Results list should have the selected card"
 
             # Verify card panel has content - check region has height
             card_panel = pilot.app.query_one("#card-panel", CardPanel)
@@ -125,8 +124,8 @@ class TestDashboardSearch:
             )
 
             # Results list should have items
-            results_list = pilot.app.query_one("#results-list", ListView)
-            assert len(results_list.children) > 0, (
+            results_list = pilot.app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0, (
                 "Results list should have search results for 'goblin'"
             )
 
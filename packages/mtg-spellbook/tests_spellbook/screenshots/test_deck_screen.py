@@ -15,6 +15,7 @@ from textual.widgets import Input, ListView, Static
 
 from mtg_spellbook.app import MTGSpellbook
 from mtg_spellbook.deck.full_screen import FullDeckScreen
+from mtg_spellbook.widgets import VirtualList
 
 from .conftest import MENU_DECKS, navigate_via_menu
 
@@ -50,9 +51,10 @@ class TestDeckScreenFunctional:
             inputs = list(pilot.app.query(Input))
             assert len(inputs) >= 1, "Deck screen should have search input"
 
-            list_views = list(pilot.app.query(ListView))
-            assert len(list_views) >= 3, (
-                "Deck screen should have deck list, mainboard, and sideboard"
+            assert pilot.app.screen.query("#deck-list").only_one(ListView)
+            card_lists = list(pilot.app.screen.query(VirtualList))
+            assert len(card_lists) >= 3, (
+                "Deck screen should have mainboard, sideboard and search result lists"
             )
 
     @pytest.mark.asyncio
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from textual.app import App
 
 from mtg_core.data.models.responses import PrintingInfo
+from mtg_spellbook.styles import APP_CSS
+from mtg_spellbook.widgets.art_navigator import HAS_IMAGE_SUPPORT, shop_card
 from mtg_spellbook.widgets.art_navigator.compare import CompareSlot, CompareView, SummaryBar
 from mtg_spellbook.widgets.art_navigator.enhanced import EnhancedArtNavigator
 from mtg_spellbook.widgets.art_navigator.focus import FocusView
-from mtg_spellbook.widgets.art_navigator.grid import PrintingsGrid
+from mtg_spellbook.widgets.art_navigator.grid import (
+    OVERSCAN,
+    TILE_WIDTH,
+    PrintingsGrid,
+)
 from mtg_spellbook.widgets.art_navigator.preview import PreviewPanel
 from mtg_spellbook.widgets.art_navigator.shop_card import ShopCard
 from mtg_spellbook.widgets.art_navigator.thumbnail import ThumbnailCard
 from mtg_spellbook.widgets.art_navigator.view_toggle import ViewMode, ViewModeToggle
 
 
+class FilmstripApp(App[None]):
+    """App with the real stylesheet, so the filmstrip gets its scroll width."""
+
+    CSS = APP_CSS
+
+
 # Test fixtures
 @pytest.fixture
 def sample_printing() -> PrintingInfo:
@@ -442,6 +456,95 @@ class TestPrintingsGrid:
             assert callback_count == 2
             assert callback_index == 1
 
+    @pytest.mark.asyncio
+    async def test_large_printing_list_mounts_only_a_window(self) -> None:
+        """Test that hundreds of printings mount only the visible tiles plus overscan."""
+        many_printings = [
+            PrintingInfo(uuid=f"uuid-{i}", set_code=f"s{i:03d}", price_usd=float(i))
+            for i in range(500)
+        ]
+        grid = PrintingsGrid(classes="printings-filmstrip")
+
+        async with FilmstripApp().run_test() as pilot:
+            await pilot.app.mount(grid)
+            await grid.load_printings("Test Card", many_printings)
+            await pilot.pause()
+
+            assert grid.virtual_size.width >= 500 * TILE_WIDTH
+            cards = list(grid.query(ShopCard))
+            assert 0 < len(cards) <= grid._visible_count() + 2 * OVERSCAN
+            assert grid.total_count == 500
+
+    @pytest.mark.asyncio
+    async def test_navigation_recycles_tiles(self) -> None:
+        """Test that navigating past the window rebinds tiles instead of mounting more."""
+        many_printings = [
+            PrintingInfo(uuid=f"uuid-{i}", set_code=f"s{i:03d}", price_usd=float(i))
+            for i in range(100)
+        ]
+        grid = PrintingsGrid(classes="printings-filmstrip")
+
+        async with FilmstripApp().run_test() as pilot:
+            await pilot.app.mount(grid)
+            await grid.load_printings("Test Card", many_printings)
+            await pilot.pause()
+            pool_size = len(grid.query(ShopCard))
+
+            for _ in range(40):
+                grid.navigate("right")
+            await pilot.pause()
+
+            assert len(grid.query(ShopCard)) == pool_size
+            tile = grid._tile_for(40)
+            assert tile is not None
+            assert tile.printing == grid._filtered_printings[40]
+            assert tile.has_class("selected")
+            assert sum(card.has_class("selected") for card in grid.query(ShopCard)) == 1
+            assert grid.scroll_x > 0
+
+    @pytest.mark.asyncio
+    async def test_filter_shrinks_tile_pool(self, sample_printings: list[PrintingInfo]) -> None:
+        """Test that filtering rebinds the pool to the filtered list."""
+        grid = PrintingsGrid()
+
+        async with App().run_test() as pilot:
+            await pilot.app.mount(grid)
+            await grid.load_printings("Test Card", sample_printings)
+            await grid.set_filter(set_code="KHM")
+
+            cards = list(grid.query(ShopCard))
+            assert [card.printing.set_code for card in cards] == ["khm"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HAS_IMAGE_SUPPORT, reason="Image support not available")
+    async def test_rebind_cancels_pending_thumbnail(
+        self, sample_printings: list[PrintingInfo], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a tile rebound mid-load never shows the old printing's thumbnail."""
+        release = asyncio.Event()
+        loaded: list[str] = []
+
+        async def slow_load(url: str, _widget: object, **_kwargs: object) -> bool:
+            await release.wait()
+            loaded.append(url)
+            return True
+
+        monkeypatch.setattr(shop_card, "load_card_image", slow_load)
+        tile = ShopCard(sample_printings[0], autoload=False, id="tile")
+
+        async with App().run_test() as pilot:
+            await pilot.app.mount(tile)
+            tile.load_thumbnail()
+            await pilot.pause()
+
+            # Overscan tiles are rebound without starting a new load
+            tile.set_printing(sample_printings[1])
+            release.set()
+            await pilot.pause()
+
+            assert loaded == []
+            assert tile.printing == sample_printings[1]
+
 
 # PreviewPanel Tests
 class TestPreviewPanel:
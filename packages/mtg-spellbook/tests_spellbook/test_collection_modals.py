@@ -8,6 +8,13 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Checkbox, Input
 
+from mtg_spellbook.collection.deck_suggestions_screen import (
+    CollectionCardInfo as SuggestionCardInfo,
+)
+from mtg_spellbook.collection.deck_suggestions_screen import (
+    DeckSuggestionsScreen,
+    SuggestionListItem,
+)
 from mtg_spellbook.collection.modals import (
     AddToCollectionModal,
     AddToCollectionResult,
@@ -470,7 +477,7 @@ class TestPrintingSelectionModal:
         ]
 
         mock_db = AsyncMock()
-        mock_db.get_all_printings = AsyncMock(return_value=[])
+        mock_db.get_printing_rows = AsyncMock(return_value=[])
 
         class TestApp(App[None]):
             def compose(self) -> ComposeResult:
@@ -492,7 +499,7 @@ class TestPrintingSelectionModal:
         result = "should-be-none"
 
         mock_db = AsyncMock()
-        mock_db.get_all_printings = AsyncMock(return_value=[])
+        mock_db.get_printing_rows = AsyncMock(return_value=[])
 
         class TestApp(App[None]):
             def compose(self) -> ComposeResult:
@@ -608,6 +615,63 @@ class TestDeckSuggestionsModal:
             assert pilot.app.screen == modal
 
 
+class TestDeckSuggestionsScreen:
+    """Tests for DeckSuggestionsScreen."""
+
+    @staticmethod
+    def _cards() -> list[SuggestionCardInfo]:
+        return [
+            SuggestionCardInfo(
+                name=f"Legend {i}",
+                type_line="Legendary Creature — Elf",
+                color_identity=["G"],
+            )
+            for i in range(3)
+        ] + [
+            SuggestionCardInfo(name=f"Elf {i}", type_line="Creature — Elf", color_identity=["G"])
+            for i in range(20)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_loads_suggestions_in_background(self) -> None:
+        """Suggestions arrive from the worker and are listed best first."""
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                return []
+
+        async with TestApp().run_test() as pilot:
+            screen = DeckSuggestionsScreen(self._cards())
+            pilot.app.push_screen(screen)
+            await pilot.pause()
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+
+            items = screen.query(SuggestionListItem)
+            assert [item.suggestion for item in items] == screen._suggestions
+            assert screen._suggestions[0].name == "Elf Tribal"
+            assert screen._selected_suggestion == screen._suggestions[0]
+
+    @pytest.mark.asyncio
+    async def test_ignores_results_for_previous_format(self) -> None:
+        """A late result for a format the user switched away from is dropped."""
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                return []
+
+        async with TestApp().run_test() as pilot:
+            screen = DeckSuggestionsScreen(self._cards())
+            pilot.app.push_screen(screen)
+            await pilot.pause()
+            await pilot.app.workers.wait_for_complete()
+            shown = screen._suggestions
+
+            screen._show_suggestions("standard", [], True)
+
+            assert screen._suggestions == shown
+
+
 class TestCollectionCardInfo:
     """Tests for CollectionCardInfo dataclass."""
 
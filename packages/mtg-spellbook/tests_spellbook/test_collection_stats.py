@@ -0,0 +1,199 @@
+"""Tests for the in-memory collection statistics index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mtg_core.data.database import UserDatabase
+from mtg_core.data.models import Card
+from mtg_spellbook.collection_manager import CollectionManager
+from mtg_spellbook.collection_stats import CollectionStatsIndex
+from mtg_spellbook.deck_manager import DeckManager
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+CARDS = {
+    card.name.lower(): card
+    for card in [
+        Card(
+            name="Lightning Bolt",
+            colors=["R"],
+            type="Instant",
+            cmc=1,
+            rarity="common",
+            set_code="M11",
+            artist="Christopher Moeller",
+        ),
+        Card(
+            name="Isamaru, Hound of Konda",
+            colors=["W"],
+            type="Legendary Creature — Dog",
+            supertypes=["Legendary"],
+            cmc=1,
+            rarity="rare",
+            set_code="CHK",
+        ),
+        Card(
+            name="Sol Ring",
+            colors=[],
+            type="Artifact",
+            cmc=1,
+            rarity="uncommon",
+            set_code="C21",
+        ),
+        Card(
+            name="Craterhoof Behemoth",
+            colors=["G"],
+            type="Creature — Beast",
+            cmc=8,
+            rarity="mythic",
+            set_code="AVR",
+            keywords=["Haste"],
+        ),
+        Card(name="Forest", colors=[], type="Basic Land — Forest", cmc=0, rarity="common"),
+    ]
+}
+
+
+@pytest.fixture
+async def user_db(tmp_path: Path) -> AsyncIterator[UserDatabase]:
+    """Temporary user database."""
+    db = UserDatabase(tmp_path / "user.sqlite")
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def card_db() -> MagicMock:
+    """Card database knowing CARDS; other names are not found."""
+
+    async def get_card_by_name(name: str, **_kwargs: object) -> Card:
+        return CARDS[name.lower()]
+
+    async def get_cards_by_names(names: list[str], **_kwargs: object) -> dict[str, Card]:
+        return {name.lower(): CARDS[name.lower()] for name in names if name.lower() in CARDS}
+
+    db = MagicMock()
+    db.get_card_by_name = AsyncMock(side_effect=get_card_by_name)
+    db.get_cards_by_names = AsyncMock(side_effect=get_cards_by_names)
+    return db
+
+
+@pytest.fixture
+def managers(user_db: UserDatabase, card_db: MagicMock) -> tuple[CollectionManager, DeckManager]:
+    """Collection and deck managers sharing one deck usage index."""
+    deck_manager = DeckManager(user_db, card_db)
+    manager = CollectionManager(user_db, card_db, deck_usage=deck_manager.usage)
+    return manager, deck_manager
+
+
+async def _assert_matches_rebuild(manager: CollectionManager) -> None:
+    rebuilt = CollectionStatsIndex(manager.user, manager.db)
+    await rebuilt.reload()
+    assert manager.stats.aggregates == rebuilt.aggregates
+
+
+class TestCollectionStatsIndex:
+    """Tests for CollectionStatsIndex kept current by CollectionManager."""
+
+    async def test_counts(self, user_db: UserDatabase, card_db: MagicMock) -> None:
+        await user_db.add_to_collection("Lightning Bolt", quantity=4, set_code="2xm")
+        await user_db.add_to_collection("Isamaru, Hound of Konda", quantity=1, foil_quantity=1)
+        await user_db.add_to_collection("Sol Ring", quantity=2)
+        await user_db.add_to_collection("Craterhoof Behemoth", quantity=1)
+        await user_db.add_to_collection("Forest", quantity=10)
+        await user_db.add_to_collection("Unknown Card", quantity=1)
+        deck_id = await user_db.create_deck("Burn")
+        await user_db.add_card(deck_id, "Lightning Bolt", 4)
+        await user_db.add_card(deck_id, "Sol Ring", 1)
+        manager = CollectionManager(user_db, card_db)
+
+        await manager.stats.ensure_loaded()
+        stats = manager.stats.aggregates
+
+        assert (stats.unique_cards, stats.total_cards, stats.total_foils) == (6, 20, 1)
+        assert (stats.in_decks, stats.available) == (5, 15)
+        assert (stats.fully_available, stats.partially_used, stats.fully_used) == (4, 1, 1)
+        assert stats.colors == {"R": 4, "W": 2, "C": 12, "G": 1}
+        assert stats.types == {"Instant": 4, "Creature": 3, "Artifact": 2, "Land": 10}
+        assert stats.curve == {0: 10, 1: 8, 7: 1}
+        assert stats.rarities == {"common": 14, "rare": 2, "uncommon": 2, "mythic": 1}
+        assert stats.sets == {"2XM": 4, "CHK": 2, "C21": 2, "AVR": 1}
+        assert stats.keywords == {"Haste": 1}
+        assert stats.artists == {"Christopher Moeller": 4}
+        assert (stats.legendary_creatures, stats.legendary_other) == (2, 0)
+        assert stats.potential_commanders == 1
+        assert (stats.nonland_cards, stats.nonland_cmc_total, stats.nonland_cmc_count) == (
+            9,
+            16.0,
+            9,
+        )
+        assert (await manager.get_stats()).total_cards == 20
+
+    async def test_collection_changes_write_through(
+        self, managers: tuple[CollectionManager, DeckManager]
+    ) -> None:
+        manager, _ = managers
+        await manager.add_card("Lightning Bolt", 2)
+        await manager.stats.ensure_loaded()  # Load after the first change
+
+        await manager.add_card("Lightning Bolt", 2, foil=True)
+        await manager.add_card("Sol Ring", 1)
+        await manager.add_card("Forest", 20)
+        await _assert_matches_rebuild(manager)
+
+        await manager.set_quantity("Forest", 12, 1)
+        await manager.update_printing("Sol Ring", "cmr", "472")
+        await manager.remove_card("Lightning Bolt")
+        await _assert_matches_rebuild(manager)
+
+        await manager.set_quantity("Sol Ring", 0)
+        await manager.remove_card("Craterhoof Behemoth")  # Not in the collection
+        await _assert_matches_rebuild(manager)
+        assert manager.stats.aggregates.unique_cards == 1
+
+    async def test_deck_changes_update_availability(
+        self, managers: tuple[CollectionManager, DeckManager]
+    ) -> None:
+        manager, deck_manager = managers
+        await manager.add_card("Lightning Bolt", 4)
+        await manager.add_card("Sol Ring", 1)
+        await manager.stats.ensure_loaded()
+        stats = manager.stats.aggregates
+
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 2)
+        await deck_manager.add_card(deck_id, "Sol Ring", 1)
+        assert (stats.in_decks, stats.partially_used, stats.fully_used) == (3, 1, 1)
+        await _assert_matches_rebuild(manager)
+
+        await deck_manager.set_quantity(deck_id, "Lightning Bolt", 4)
+        await deck_manager.move_to_sideboard(deck_id, "Sol Ring")
+        await _assert_matches_rebuild(manager)
+
+        await deck_manager.delete_deck(deck_id)
+        assert (stats.in_decks, stats.available, stats.fully_available) == (0, 5, 2)
+        await _assert_matches_rebuild(manager)
+
+    async def test_reload_sees_outside_changes(
+        self, managers: tuple[CollectionManager, DeckManager]
+    ) -> None:
+        manager, _ = managers
+        await manager.add_card("Lightning Bolt", 4)
+        await manager.stats.ensure_loaded()
+
+        await manager.user.add_to_collection("Sol Ring", 1)  # Bypasses the manager
+        assert manager.stats.aggregates.unique_cards == 1
+        await manager.stats.reload()
+
+        assert manager.stats.aggregates.unique_cards == 2
+        assert sorted(entry.card_name for entry in manager.stats.entries()) == [
+            "Lightning Bolt",
+            "Sol Ring",
+        ]
@@ -0,0 +1,182 @@
+"""Tests for the collection valuation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mtg_core.data.database import UserDatabase
+from mtg_core.data.models import Card
+from mtg_spellbook.collection_manager import CollectionManager
+from mtg_spellbook.collection_value import CollectionValuation
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+CARDS = {
+    card.name.lower(): card
+    for card in [
+        Card(name="Lightning Bolt", colors=["R"], rarity="common", set_code="M11"),
+        Card(name="Sol Ring", colors=[], rarity="uncommon", set_code="C21"),
+        Card(name="Craterhoof Behemoth", colors=["G"], rarity="mythic", set_code="AVR"),
+        Card(name="Figure of Destiny", colors=["R", "W"], rarity="rare", set_code="EVE"),
+    ]
+}
+
+# Prices in cents, as the card database returns them
+PRINTING_PRICES = {("2XM", "117"): (150, 800), ("CMR", "472"): (200, None)}
+NAME_PRICES = {
+    "lightning bolt": (100, 300),
+    "sol ring": (120, None),
+    "craterhoof behemoth": (4000, 9000),
+}
+
+
+@pytest.fixture
+async def user_db(tmp_path: Path) -> AsyncIterator[UserDatabase]:
+    """Temporary user database."""
+    db = UserDatabase(tmp_path / "user.sqlite")
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def card_db() -> MagicMock:
+    """Card database knowing CARDS and their prices; every printing is a Sol Ring."""
+
+    async def get_cards_by_names(names: list[str], **_kwargs: object) -> dict[str, Card]:
+        return {name.lower(): CARDS[name.lower()] for name in names if name.lower() in CARDS}
+
+    async def get_prices_by_set_and_numbers(
+        printings: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], tuple[int | None, int | None]]:
+        return {
+            (s.upper(), n): PRINTING_PRICES[(s.upper(), n)]
+            for s, n in printings
+            if (s.upper(), n) in PRINTING_PRICES
+        }
+
+    async def get_prices_by_names(names: list[str]) -> dict[str, tuple[int | None, int | None]]:
+        return {
+            name.lower(): NAME_PRICES[name.lower()] for name in names if name.lower() in NAME_PRICES
+        }
+
+    db = MagicMock()
+    db.get_card_by_name = AsyncMock(side_effect=lambda name, **_: CARDS[name.lower()])
+    db.get_cards_by_names = AsyncMock(side_effect=get_cards_by_names)
+    db.get_card_by_set_and_number = AsyncMock(return_value=CARDS["sol ring"])
+    db.get_prices_by_set_and_numbers = AsyncMock(side_effect=get_prices_by_set_and_numbers)
+    db.get_prices_by_names = AsyncMock(side_effect=get_prices_by_names)
+    db.get_data_version = AsyncMock(return_value="v1")
+    return db
+
+
+@pytest.fixture
+def manager(user_db: UserDatabase, card_db: MagicMock, tmp_path: Path) -> CollectionManager:
+    """Collection manager snapshotting prices under tmp_path."""
+    return CollectionManager(user_db, card_db, cache_path=tmp_path / "prices.json")
+
+
+async def _assert_matches_fresh(manager: CollectionManager, tmp_path: Path) -> None:
+    fresh = CollectionValuation(manager.stats, manager.db, tmp_path / "fresh.json")
+    await fresh.ensure_loaded()
+    value, expected = manager.valuation.value(), fresh.value()
+    assert value.total == pytest.approx(expected.total)
+    assert value.by_set == pytest.approx(expected.by_set)
+    assert value.by_rarity == pytest.approx(expected.by_rarity)
+    assert value.by_color == pytest.approx(expected.by_color)
+
+
+class TestCollectionValuation:
+    """Tests for CollectionValuation kept current through CollectionManager."""
+
+    async def test_value_and_breakdowns(self, manager: CollectionManager) -> None:
+        await manager.user.add_to_collection(
+            "Lightning Bolt", quantity=2, foil_quantity=1, set_code="2xm", collector_number="117"
+        )
+        await manager.user.add_to_collection("Sol Ring", quantity=1, foil_quantity=1)
+        await manager.user.add_to_collection("Craterhoof Behemoth", quantity=1)
+        await manager.user.add_to_collection("Figure of Destiny", quantity=3)  # No price
+
+        await manager.valuation.ensure_loaded()
+        value = manager.valuation.value()
+
+        # Bolt 2 x 1.50 + 8.00 foil; Sol Ring 1.20 + 1.20 (no foil price); Craterhoof 40.00
+        assert value.total == pytest.approx(53.40)
+        assert value.by_rarity == pytest.approx({"common": 11.0, "uncommon": 2.4, "mythic": 40.0})
+        assert value.by_color == pytest.approx({"R": 11.0, "C": 2.4, "G": 40.0})
+        assert value.by_set == pytest.approx({"2XM": 11.0, "C21": 2.4, "AVR": 40.0})
+        assert [name for name, _ in value.top_cards] == [
+            "Craterhoof Behemoth",
+            "Lightning Bolt",
+            "Sol Ring",
+        ]
+
+    async def test_changes_update_value(
+        self, manager: CollectionManager, card_db: MagicMock, tmp_path: Path
+    ) -> None:
+        await manager.add_card("Lightning Bolt", 4)
+        await manager.add_card("Sol Ring", 1)
+        await manager.valuation.ensure_loaded()
+        assert manager.valuation.total == pytest.approx(5.20)
+
+        await manager.set_quantity("Lightning Bolt", 2, 1)
+        await manager.valuation.ensure_loaded()
+        assert manager.valuation.total == pytest.approx(2 * 1.00 + 3.00 + 1.20)
+        card_db.get_prices_by_names.assert_awaited_once()  # Quantities need no lookup
+
+        await manager.add_card("Craterhoof Behemoth", 1)
+        await manager.remove_card("Sol Ring")
+        await manager.update_printing("Lightning Bolt", "2xm", "117")
+        await manager.valuation.ensure_loaded()  # Prices the new card and printing
+        assert manager.valuation.total == pytest.approx(2 * 1.50 + 8.00 + 40.00)
+        await _assert_matches_fresh(manager, tmp_path)
+
+        await manager.add_card("Sol Ring", 2, set_code="cmr", collector_number="472")
+        await manager.add_card("Figure of Destiny", 1)
+        await manager.remove_card("Lightning Bolt")  # Not the last row
+        await manager.valuation.ensure_loaded()
+        assert manager.valuation.total == pytest.approx(4.00 + 40.00)
+        await _assert_matches_fresh(manager, tmp_path)
+
+    async def test_reopen_reads_snapshot(
+        self, user_db: UserDatabase, card_db: MagicMock, tmp_path: Path
+    ) -> None:
+        await user_db.add_to_collection("Lightning Bolt", quantity=4)
+        await user_db.add_to_collection(
+            "Sol Ring", quantity=1, set_code="cmr", collector_number="472"
+        )
+        snapshot = tmp_path / "prices.json"
+        first = CollectionManager(user_db, card_db, cache_path=snapshot)
+        await first.valuation.ensure_loaded()
+        card_db.get_prices_by_names.reset_mock()
+        card_db.get_prices_by_set_and_numbers.reset_mock()
+
+        reopened = CollectionManager(user_db, card_db, cache_path=snapshot)
+        await reopened.valuation.ensure_loaded()
+        assert reopened.valuation.total == pytest.approx(6.00)
+        card_db.get_prices_by_names.assert_not_awaited()
+        card_db.get_prices_by_set_and_numbers.assert_not_awaited()
+
+        card_db.get_data_version.return_value = "v2"  # Card database rebuilt
+        await reopened.valuation.ensure_loaded()
+        assert reopened.valuation.total == pytest.approx(6.00)
+        card_db.get_prices_by_names.assert_awaited_once()
+        card_db.get_prices_by_set_and_numbers.assert_awaited_once()
+
+    async def test_prefetch_prices(
+        self, manager: CollectionManager, card_db: MagicMock, tmp_path: Path
+    ) -> None:
+        await manager.user.add_to_collection("Lightning Bolt", quantity=1)
+        rows = await manager.user.get_collection_cards()
+        await manager.valuation.prefetch_prices(rows)
+        assert not manager.valuation.loaded
+
+        reopened = CollectionManager(manager.user, card_db, cache_path=tmp_path / "prices.json")
+        await reopened.valuation.ensure_loaded()
+        assert reopened.valuation.total == pytest.approx(1.00)
+        card_db.get_prices_by_names.assert_awaited_once()
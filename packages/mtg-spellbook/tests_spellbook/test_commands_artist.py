@@ -13,6 +13,12 @@ from mtg_core.data.models.responses import (
     CardSummary,
     Prices,
 )
+from mtg_spellbook.widgets import ResultsList
+
+
+def _details_by_uuid(detail: CardDetail) -> AsyncMock:
+    """Mock cards.get_cards_by_uuids, returning ``detail`` for every uuid."""
+    return AsyncMock(side_effect=lambda _db, uuids: dict.fromkeys(uuids, detail))
 
 
 @pytest.fixture
@@ -112,7 +118,8 @@ class TestArtistCommands:
                     "mtg_core.tools.artists.get_artist_cards", AsyncMock(return_value=artist_result)
                 )
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_artist_detail)
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_artist_detail),
                 )
 
                 app.show_artist("Test Artist")
@@ -157,7 +164,8 @@ class TestArtistCommands:
                     "mtg_core.tools.artists.get_artist_cards", AsyncMock(return_value=artist_result)
                 )
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_artist_detail)
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_artist_detail),
                 )
 
                 app.show_artist("Test Artist", select_card="Specific Card")
@@ -315,8 +323,8 @@ class TestArtistCommands:
             app._display_artist_results()
             await pilot.pause()
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) == 5
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count == 5
 
     @pytest.mark.asyncio
     async def test_show_artist_pagination(
@@ -341,7 +349,8 @@ class TestArtistCommands:
                     "mtg_core.tools.artists.get_artist_cards", AsyncMock(return_value=artist_result)
                 )
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_artist_detail)
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_artist_detail),
                 )
 
                 app.show_artist("Test Artist")
@@ -391,7 +400,8 @@ class TestArtistCommandsIntegration:
                     "mtg_core.tools.artists.get_artist_cards", AsyncMock(return_value=artist_result)
                 )
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_artist_detail)
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_artist_detail),
                 )
 
                 # Show artist
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from mtg_core.data.models.responses import BlockSummary, SetSummary
+from mtg_spellbook.widgets import ResultsList
 
 
 @pytest.fixture
@@ -108,8 +109,8 @@ class TestBlockCommands:
             app.show_recent_sets(limit=10)
             await pilot.pause(0.2)
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) > 0
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0
 
     @pytest.mark.asyncio
     async def test_show_recent_sets_custom_limit(
@@ -124,8 +125,8 @@ class TestBlockCommands:
             app.show_recent_sets(limit=5)
             await pilot.pause(0.2)
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) <= 5
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count <= 5
 
     @pytest.mark.asyncio
     async def test_show_recent_sets_empty(self, mock_app_with_database) -> None:
@@ -154,8 +155,8 @@ class TestBlockCommands:
             app.show_recent_sets()
             await pilot.pause(0.2)
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) == 3
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count == 3
 
     @pytest.mark.asyncio
     async def test_update_results_header(self, mock_app_with_database) -> None:
@@ -213,5 +214,5 @@ class TestBlockCommandsEdgeCases:
             await pilot.pause(0.2)
 
             # Verify type is formatted (draft_innovation -> Draft Innovation)
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) > 0
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0
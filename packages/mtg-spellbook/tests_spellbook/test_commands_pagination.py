@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
 from mtg_core.data.models.responses import CardDetail, CardSummary, Prices
 from mtg_spellbook.pagination import PaginationState
+from mtg_spellbook.widgets import ResultsList
+
+
+def _details_by_uuid(detail: CardDetail) -> AsyncMock:
+    """Mock cards.get_cards_by_uuids, returning ``detail`` for every uuid."""
+    return AsyncMock(side_effect=lambda _db, uuids: dict.fromkeys(uuids, detail))
 
 
 @pytest.fixture
@@ -209,7 +217,8 @@ class TestPaginationCommands:
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_card_details[0])
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_card_details[0]),
                 )
                 # _load_current_page is decorated with @work, so it returns a Worker
                 worker = app._load_current_page()
@@ -241,8 +250,8 @@ class TestPaginationCommands:
             app._display_search_results()
             await pilot.pause()
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) == len(sample_card_details)
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count == len(sample_card_details)
 
     @pytest.mark.asyncio
     async def test_display_synergy_results(
@@ -276,8 +285,8 @@ class TestPaginationCommands:
             app._display_synergy_results()
             await pilot.pause()
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) == 3
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count == 3
 
     @pytest.mark.asyncio
     async def test_update_pagination_header_single_page(self, mock_app_with_database) -> None:
@@ -366,7 +375,8 @@ class TestPaginationCommands:
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_card_details[0])
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_card_details[0]),
                 )
                 details = await app._load_card_details(sample_paginated_cards[:5], 0)
                 assert len(details) > 0
@@ -387,7 +397,8 @@ class TestPaginationCommands:
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_card_details[0])
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_card_details[0]),
                 )
                 details = await app._load_card_details(sample_paginated_cards[:2], 0)
                 assert len(details) > 0
@@ -409,7 +420,8 @@ class TestPaginationCommands:
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr(
-                    "mtg_core.tools.cards.get_card", AsyncMock(return_value=sample_card_details[0])
+                    "mtg_core.tools.cards.get_cards_by_uuids",
+                    _details_by_uuid(sample_card_details[0]),
                 )
                 # _prefetch_next_page is decorated with @work, so it returns a Worker
                 worker = app._prefetch_next_page()
@@ -481,3 +493,94 @@ class TestPaginationCommands:
             price = app._get_card_price(card)
 
             assert "$" in price or price == ""
+
+
+class TestPaginationPrefetch:
+    """Tests for PaginationState page loading and prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_load_page_waits_for_prefetch(
+        self, sample_paginated_cards: list[CardSummary], sample_card_details: list[CardDetail]
+    ) -> None:
+        """Flipping to a page being prefetched reuses that fetch."""
+        state = PaginationState.from_summaries(sample_paginated_cards, page_size=10)
+        release = asyncio.Event()
+        calls: list[int] = []
+
+        async def load(items: list[Any], start: int) -> list[CardDetail]:
+            calls.append(start)
+            await release.wait()
+            return sample_card_details[: len(items)]
+
+        prefetch = asyncio.create_task(state.prefetch(2, load))
+        await asyncio.sleep(0)
+        page = asyncio.create_task(state.load_page(2, load))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await page == sample_card_details
+        await prefetch
+        assert calls == [10]
+        assert state.get_cached_details(2) == sample_card_details
+
+    @pytest.mark.asyncio
+    async def test_load_page_after_cancelled_prefetch(
+        self, sample_paginated_cards: list[CardSummary], sample_card_details: list[CardDetail]
+    ) -> None:
+        """A cancelled prefetch falls back to loading the page directly."""
+        state = PaginationState.from_summaries(sample_paginated_cards, page_size=10)
+        calls: list[int] = []
+
+        async def slow(_items: list[Any], _start: int) -> list[CardDetail]:
+            await asyncio.sleep(10)
+            return []
+
+        async def load(_items: list[Any], start: int) -> list[CardDetail]:
+            calls.append(start)
+            return sample_card_details[:2]
+
+        prefetch = asyncio.create_task(state.prefetch(3, slow))
+        await asyncio.sleep(0)
+        page = asyncio.create_task(state.load_page(3, load))
+        await asyncio.sleep(0)
+        prefetch.cancel()
+
+        assert await page == sample_card_details[:2]
+        assert calls == [20]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_cached_and_out_of_range(
+        self, sample_paginated_cards: list[CardSummary]
+    ) -> None:
+        """Prefetch does nothing for cached pages or pages past the end."""
+        state = PaginationState.from_summaries(sample_paginated_cards, page_size=50)
+        state.cache_details(2, [])
+        load = AsyncMock(return_value=[])
+
+        await state.prefetch(2, load)
+        await state.prefetch(3, load)
+
+        load.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_card_details_batches_lookups(
+        self,
+        mock_app_with_database,
+        sample_paginated_cards: list[CardSummary],
+        sample_card_details: list[CardDetail],
+    ) -> None:
+        """A page is loaded with one bulk lookup, keeping item order."""
+        app = mock_app_with_database()
+
+        async with app.run_test():
+            app._artist_mode = False
+            by_uuid = {card.uuid: card for card in sample_card_details if card.uuid != "uuid-3"}
+            bulk = AsyncMock(return_value=by_uuid)
+
+            with pytest.MonkeyPatch.context() as m:
+                m.setattr("mtg_core.tools.cards.get_cards_by_uuids", bulk)
+                details = await app._load_card_details(sample_paginated_cards[:5], 0)
+
+            bulk.assert_awaited_once()
+            assert bulk.await_args_list[0].args[1] == [f"uuid-{i}" for i in range(5)]
+            assert [d.name for d in details] == ["Card 0", "Card 1", "Card 2", "Card 4"]
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import json
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from textual.widgets import Static
 
+from mtg_core.data.database import CardSummaryRow
 from mtg_core.data.models import Set
-from mtg_core.data.models.card import Card
 from mtg_core.data.models.responses import (
     CardDetail,
     CardSummary,
@@ -20,6 +22,48 @@ from mtg_core.data.models.responses import (
 from mtg_core.data.models.responses import (
     SetStats as SetStatsData,
 )
+from mtg_spellbook.widgets import ResultsList
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+
+def _details_by_uuid(detail: CardDetail) -> AsyncMock:
+    """Mock cards.get_cards_by_uuids, returning ``detail`` for every uuid."""
+    return AsyncMock(side_effect=lambda _db, uuids: dict.fromkeys(uuids, detail))
+
+
+def _set_cards(cards: list[CardDetail]) -> Callable[..., AsyncIterator[list[CardSummaryRow]]]:
+    """Mock UnifiedDatabase.get_set_cards, streaming ``cards`` as one batch."""
+    rows = [
+        CardSummaryRow(
+            uuid=card.uuid or "",
+            name=card.name,
+            flavor_name=None,
+            mana_cost=card.mana_cost,
+            cmc=card.cmc,
+            type=card.type,
+            colors_json=json.dumps(card.colors),
+            color_identity_json=json.dumps(card.color_identity),
+            rarity=card.rarity,
+            set_code=card.set_code,
+            number=card.number,
+            keywords_json=json.dumps(card.keywords),
+            power=card.power,
+            toughness=card.toughness,
+            image_normal=None,
+            image_small=None,
+            price_usd=None,
+            purchase_tcgplayer=None,
+        )
+        for card in cards
+    ]
+
+    async def get_set_cards(_code: str, **_kwargs: object) -> AsyncIterator[list[CardSummaryRow]]:
+        if rows:
+            yield rows
+
+    return get_set_cards
 
 
 @pytest.fixture
@@ -116,8 +160,8 @@ class TestSetCommands:
                 app.browse_sets("")
                 await pilot.pause()
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) > 0
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0
 
     @pytest.mark.asyncio
     async def test_browse_sets_with_query(
@@ -148,12 +192,13 @@ class TestSetCommands:
 
         async with app.run_test() as pilot:
             app._db.get_set = AsyncMock(return_value=sample_set_model)
-            app._db.search_cards = AsyncMock(return_value=(sample_set_cards, len(sample_set_cards)))
+            app._db.search_card_rows = AsyncMock(
+                return_value=(sample_set_cards, len(sample_set_cards))
+            )
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr(
-                    "mtg_core.tools.cards.get_card",
-                    AsyncMock(return_value=sample_set_cards[0]),
+                    "mtg_core.tools.cards.get_cards_by_uuids", _details_by_uuid(sample_set_cards[0])
                 )
                 app.explore_set("lea")
                 await pilot.pause(0.3)
@@ -170,7 +215,7 @@ class TestSetCommands:
 
         async with app.run_test() as pilot:
             app._db.get_set = AsyncMock(return_value=sample_set_model)
-            app._db.search_cards = AsyncMock(return_value=([], 0))
+            app._db.search_card_rows = AsyncMock(return_value=([], 0))
 
             app.explore_set("lea")
             await pilot.pause(0.2)
@@ -186,8 +231,8 @@ class TestSetCommands:
                 app.show_set("lea")
                 await pilot.pause(0.2)
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) > 0
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0
 
     @pytest.mark.asyncio
     async def test_show_set_not_found(self, mock_app_with_database) -> None:
@@ -222,8 +267,8 @@ class TestSetCommands:
             app.show_stats()
             await pilot.pause(0.2)
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) > 0
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count > 0
 
     @pytest.mark.asyncio
     async def test_show_set_detail(
@@ -241,28 +286,7 @@ class TestSetCommands:
             )
 
             app._db.get_set = AsyncMock(return_value=sample_set_model)
-            app._db.get_cards_in_set = AsyncMock(
-                return_value=[
-                    Card(
-                        uuid=card.uuid,
-                        name=card.name,
-                        manaCost=card.mana_cost,
-                        manaValue=card.cmc,
-                        type=card.type,
-                        types=["Artifact"] if "Artifact" in card.type else ["Instant"],
-                        colors=card.colors,
-                        colorIdentity=card.color_identity,
-                        rarity=card.rarity,
-                        setCode=card.set_code or "LEA",
-                        number=card.number or "1",
-                        artist=card.artist or "Unknown",
-                        keywords=card.keywords,
-                        power=None,
-                        toughness=None,
-                    )
-                    for card in sample_set_cards
-                ]
-            )
+            app._db.get_set_cards = _set_cards(sample_set_cards)
             app._db.get_set_stats = AsyncMock(return_value=stats)
 
             app.show_set_detail("lea")
@@ -277,7 +301,7 @@ class TestSetCommands:
 
         async with app.run_test() as pilot:
             app._db.get_set = AsyncMock(return_value=sample_set_model)
-            app._db.get_cards_in_set = AsyncMock(return_value=[])
+            app._db.get_set_cards = _set_cards([])
 
             app.show_set_detail("lea")
             await pilot.pause(0.2)
@@ -296,8 +320,8 @@ class TestSetCommands:
             app._display_set_results()
             await pilot.pause()
 
-            results_list = app.query_one("#results-list")
-            assert len(results_list.children) == len(sample_set_cards)
+            results_list = app.query_one("#results-list", ResultsList)
+            assert results_list.row_count == len(sample_set_cards)
 
     @pytest.mark.asyncio
     async def test_load_more_set_cards(
@@ -329,7 +353,7 @@ class TestSetCommands:
             )
 
             # Mock returns sample_set_cards (2 cards) - test expects at least this many
-            app._db.search_cards = AsyncMock(return_value=(sample_set_cards, 4))
+            app._db.search_card_rows = AsyncMock(return_value=(sample_set_cards, 4))
 
             await app._load_more_set_cards_async(2)
 
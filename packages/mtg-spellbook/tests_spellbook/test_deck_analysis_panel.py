@@ -0,0 +1,103 @@
+"""Tests for DeckAnalysisPanel's incremental analysis."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from mtg_core.data.models.card import Card
+from mtg_spellbook.deck.analysis_panel import DeckAnalysis, DeckAnalysisPanel
+from mtg_spellbook.deck_manager import DeckCardWithData, DeckWithCards
+
+
+def _row(name: str, quantity: int, card: Card) -> DeckCardWithData:
+    return DeckCardWithData(
+        card_name=name,
+        quantity=quantity,
+        is_sideboard=False,
+        is_commander=False,
+        set_code=None,
+        collector_number=None,
+        card=card,
+    )
+
+
+def _deck(deck_id: int = 1, bolts: int = 4) -> DeckWithCards:
+    mountain = Card(name="Mountain", type="Basic Land — Mountain", text="{T}: Add {R}.")
+    bolt = Card(
+        name="Lightning Bolt",
+        type="Instant",
+        manaCost="{R}",
+        manaValue=1,
+        text="Lightning Bolt deals 3 damage to any target.",
+        rarity="common",
+    )
+    goblin = Card(
+        name="Goblin Guide",
+        type="Creature — Goblin Scout",
+        manaCost="{R}",
+        manaValue=1,
+        text="Haste",
+        keywords=["Haste"],
+        rarity="rare",
+    )
+    return DeckWithCards(
+        id=deck_id,
+        name="Burn",
+        format="modern",
+        commander=None,
+        cards=[
+            _row("Mountain", 20, mountain),
+            _row("Lightning Bolt", bolts, bolt),
+            _row("Goblin Guide", 4, goblin),
+        ],
+    )
+
+
+def _analyze(
+    panel: DeckAnalysisPanel, deck: DeckWithCards, prices: dict[str, float] | None = None
+) -> DeckAnalysis:
+    return panel._analyze_deck(deck.id, deck.commander, deck.mainboard, prices=prices)
+
+
+class TestDeckAnalysisPanel:
+    """Tests for analysis snapshots built from the shared analyzer."""
+
+    def test_analysis_counts(self) -> None:
+        panel = DeckAnalysisPanel()
+        a = _analyze(panel, _deck(), prices={"Lightning Bolt": 2.0})
+
+        assert a.card_count == 28
+        assert a.lands == 20
+        assert a.instants == 4
+        assert a.creatures == 4
+        assert a.colors == {"R": 8}
+        assert a.curve[1] == 8
+        assert a.keywords == [("Haste", 4)]
+        assert a.total_price == 8.0
+        assert a.card_rarities["Goblin Guide"] == "rare"
+
+    def test_edit_applies_delta_and_keeps_prices(self) -> None:
+        panel = DeckAnalysisPanel()
+        first = _analyze(panel, _deck(), prices={"Lightning Bolt": 2.0})
+
+        second = _analyze(panel, _deck(bolts=1))
+
+        assert second is not first
+        assert second.card_count == 25
+        assert second.interaction_count == first.interaction_count - 3
+        assert second.total_price == 2.0
+
+    def test_unchanged_deck_reuses_snapshot(self) -> None:
+        panel = DeckAnalysisPanel()
+        first = _analyze(panel, _deck())
+        assert _analyze(panel, _deck()) is first
+
+    def test_switching_decks_reloads(self) -> None:
+        panel = DeckAnalysisPanel()
+        _analyze(panel, _deck())
+        other = replace(_deck(deck_id=2), cards=_deck().cards[:1])
+
+        a = _analyze(panel, other)
+
+        assert a.card_count == 20
+        assert a.instants == 0
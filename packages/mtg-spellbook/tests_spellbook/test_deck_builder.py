@@ -14,6 +14,7 @@ from mtg_spellbook.deck.editor_panel import DeckEditorPanel
 from mtg_spellbook.deck.list_panel import DeckListPanel
 from mtg_spellbook.deck.messages import DeckSelected
 from mtg_spellbook.deck.modals import AddToDeckModal, ConfirmDeleteModal, NewDeckModal
+from mtg_spellbook.widgets import VirtualList
 
 if TYPE_CHECKING:
     from mtg_core.data.database import DeckSummary
@@ -607,8 +608,8 @@ class TestDeckEditorPanel:
             assert "Test Commander Deck" in str(header.render())
 
             # Verify mainboard has cards
-            mainboard = editor.query_one("#mainboard-list")
-            assert len(mainboard.children) > 0
+            mainboard = editor.query_one("#mainboard-list", VirtualList)
+            assert mainboard.row_count > 0
 
     @pytest.mark.asyncio
     async def test_display_empty_deck(self) -> None:
@@ -0,0 +1,214 @@
+"""Tests for DeckManager edits applied as deltas to loaded decks and bulk adds."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mtg_core.data.database import UserDatabase
+from mtg_spellbook.deck_manager import DeckCardWithData, DeckChange, DeckManager
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+@pytest.fixture
+async def user_db(tmp_path: Path) -> AsyncIterator[UserDatabase]:
+    """Temporary user database."""
+    db = UserDatabase(tmp_path / "user.sqlite")
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def deck_manager(user_db: UserDatabase) -> DeckManager:
+    """DeckManager whose card lookups return a card with the requested name.
+
+    Names starting with "Unknown" are not found.
+    """
+
+    def card(name: str) -> MagicMock:
+        found = MagicMock()
+        found.name = name
+        return found
+
+    async def get_card_by_name(name: str, **_kwargs: object) -> MagicMock:
+        if name.startswith("Unknown"):
+            raise LookupError(name)
+        return card(name)
+
+    async def get_cards_by_names(names: list[str], **_kwargs: object) -> dict[str, MagicMock]:
+        return {name.lower(): card(name) for name in names if not name.startswith("Unknown")}
+
+    db = MagicMock()
+    db.get_card_by_name = AsyncMock(side_effect=get_card_by_name)
+    db.get_cards_by_names = AsyncMock(side_effect=get_cards_by_names)
+    return DeckManager(user_db, db)
+
+
+def _contents(cards: list[DeckCardWithData]) -> list[tuple[str, bool, int]]:
+    return sorted((c.card_name, c.is_sideboard, c.quantity) for c in cards)
+
+
+class TestDeckChanges:
+    """Tests for edits patching a loaded deck instead of reloading it."""
+
+    async def test_edits_patch_loaded_deck(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+        get_cards_by_names = cast("AsyncMock", deck_manager.db.get_cards_by_names)
+        get_cards_by_names.reset_mock()
+
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 4)
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 1, sideboard=True)
+        await deck_manager.add_card(deck_id, "Shock", 2)
+        await deck_manager.set_quantity(deck_id, "Shock", 3)
+        await deck_manager.move_to_sideboard(deck_id, "Lightning Bolt")
+        await deck_manager.remove_card(deck_id, "Shock")
+
+        get_cards_by_names.assert_not_awaited()
+        assert _contents(deck.cards) == [("Lightning Bolt", True, 5)]
+        assert deck.cards[0].card is not None
+
+        reloaded = await deck_manager.get_deck(deck_id)
+        assert reloaded is deck
+        assert _contents(reloaded.cards) == [("Lightning Bolt", True, 5)]
+
+    async def test_add_card_returns_change_and_total(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 1, sideboard=True)
+
+        result = await deck_manager.add_card(deck_id, "Lightning Bolt", 3)
+
+        assert result.success
+        assert result.new_quantity == 4
+        assert result.change is not None
+        entry = result.change.boards[False]
+        assert entry is not None
+        assert (entry.card_name, entry.quantity) == ("Lightning Bolt", 3)
+        deck_manager.user.get_deck_card_count = AsyncMock()  # type: ignore[method-assign]
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 1)
+        deck_manager.user.get_deck_card_count.assert_not_awaited()
+
+    async def test_move_changes_both_boards(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 4)
+
+        change = await deck_manager.move_to_sideboard(deck_id, "Lightning Bolt")
+
+        assert change.boards[False] is None
+        moved = change.boards[True]
+        assert moved is not None
+        assert (moved.is_sideboard, moved.quantity) == (True, 4)
+
+    async def test_noop_edits(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+
+        assert await deck_manager.remove_card(deck_id, "Shock") is None
+        assert (await deck_manager.set_quantity(deck_id, "Shock", 2)).boards == {}
+        assert (await deck_manager.move_to_mainboard(deck_id, "Shock")).boards == {}
+
+    async def test_apply_change_is_idempotent(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 4)
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+
+        change = await deck_manager.set_quantity(deck_id, "Lightning Bolt", 2)
+        deck.apply_change(change)
+        deck.apply_change(change)
+
+        assert _contents(deck.cards) == [("Lightning Bolt", False, 2)]
+        assert deck.cards[0].card is not None  # Card data kept from the loaded entry
+
+    async def test_apply_change_removes_entry(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 4)
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+
+        deck.apply_change(DeckChange(deck_id, "Lightning Bolt", {False: None}))
+
+        assert deck.cards == []
+
+    async def test_rename_updates_loaded_deck(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+
+        await deck_manager.update_deck(deck_id, name="Zoo", format="modern")
+
+        assert (deck.name, deck.format) == ("Zoo", "modern")
+
+
+class TestBulkAdd:
+    """Tests for adding many cards in one batch."""
+
+    async def test_create_deck_with_cards(self, deck_manager: DeckManager) -> None:
+        get_card_by_name = cast("AsyncMock", deck_manager.db.get_card_by_name)
+
+        deck_id, results = await deck_manager.create_deck_with_cards(
+            "Burn",
+            [
+                ("Lightning Bolt", 1, False),
+                ("Unknown Card", 1, False),
+                ("Mountain", 20, False),
+                ("Lightning Bolt", 3, False),
+                ("Smash to Smithereens", 2, True),
+            ],
+            format="modern",
+        )
+
+        assert [(r.success, r.new_quantity) for r in results] == [
+            (True, 4),
+            (False, 0),
+            (True, 20),
+            (True, 4),
+            (True, 2),
+        ]
+        assert results[1].error == "Card not found: Unknown Card"
+        cast("AsyncMock", deck_manager.db.get_cards_by_names).assert_awaited_once()
+        get_card_by_name.assert_awaited_once()  # Only the name the batch missed
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+        assert deck.format == "modern"
+        assert _contents(deck.cards) == [
+            ("Lightning Bolt", False, 4),
+            ("Mountain", False, 20),
+            ("Smash to Smithereens", True, 2),
+        ]
+        assert await deck_manager.get_card_usage("Mountain") == [("Burn", 20)]
+
+    async def test_add_cards_bulk_patches_loaded_deck(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 2)
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+
+        results = await deck_manager.add_cards_bulk(
+            deck_id, [("Lightning Bolt", 2, False), ("Shock", 4, False)]
+        )
+
+        assert _contents(deck.cards) == [("Lightning Bolt", False, 4), ("Shock", False, 4)]
+        change = results[0].change
+        assert change is not None
+        entry = change.boards[False]
+        assert entry is not None
+        assert entry.quantity == 4
+        assert await deck_manager.add_cards_bulk(deck_id, []) == []
+
+    async def test_import_from_text(self, deck_manager: DeckManager) -> None:
+        deck_id, errors = await deck_manager.import_from_text(
+            "4 Lightning Bolt\n2x Unknown Card\nbad\n\nSideboard\n3 Pyroblast (ICE)",
+            "Burn",
+        )
+
+        assert errors == ["Could not parse: bad", "Card not found: Unknown Card"]
+        deck = await deck_manager.get_deck(deck_id)
+        assert deck is not None
+        assert _contents(deck.cards) == [("Lightning Bolt", False, 4), ("Pyroblast", True, 3)]
@@ -532,3 +532,32 @@ class TestDeckStatsBarWidget:
 
             creatures = stats_bar._count_type(sample_deck_with_variety, "Creature")
             assert creatures >= 0
+
+    @pytest.mark.asyncio
+    async def test_edited_deck_updates_incrementally(
+        self, sample_deck_with_variety: DeckWithCards
+    ) -> None:
+        """Re-analyzing an edited copy of the deck applies only the change."""
+        from dataclasses import replace
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield DeckStatsBar(id="stats-bar")
+
+        async with TestApp().run_test() as pilot:
+            stats_bar = pilot.app.query_one("#stats-bar", DeckStatsBar)
+            stats_bar.update_stats(sample_deck_with_variety)
+            draw_before = stats_bar._count_draw(sample_deck_with_variety)
+
+            edited = replace(
+                sample_deck_with_variety,
+                cards=[
+                    replace(c, quantity=c.quantity + 2) if c.card_name == "Harmonize" else c
+                    for c in sample_deck_with_variety.cards
+                ],
+            )
+            stats_bar.update_stats(edited)
+
+            assert stats_bar._count_draw(edited) == draw_before + 2
+            assert stats_bar._analyzer.card_count == edited.mainboard_count
+            assert stats_bar.query("#stats-curve")
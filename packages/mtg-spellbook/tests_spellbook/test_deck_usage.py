@@ -0,0 +1,141 @@
+"""Tests for the in-memory deck usage index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mtg_core.data.database import UserDatabase
+from mtg_spellbook.collection_manager import CollectionManager
+from mtg_spellbook.deck_manager import DeckManager
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+@pytest.fixture
+async def user_db(tmp_path: Path) -> AsyncIterator[UserDatabase]:
+    """Temporary user database."""
+    db = UserDatabase(tmp_path / "user.sqlite")
+    await db.connect()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def deck_manager(user_db: UserDatabase) -> DeckManager:
+    """DeckManager whose card lookups return the requested name."""
+
+    async def get_card_by_name(name: str, **_kwargs: object) -> MagicMock:
+        card = MagicMock()
+        card.name = name
+        return card
+
+    db = MagicMock()
+    db.get_card_by_name = AsyncMock(side_effect=get_card_by_name)
+    return DeckManager(user_db, db)
+
+
+async def _assert_matches_sql(manager: DeckManager, card_names: list[str]) -> None:
+    for name in card_names:
+        assert await manager.get_card_usage(name) == await manager.user.get_card_deck_usage(name)
+
+
+class TestDeckUsageIndex:
+    """Tests for DeckUsageIndex kept current by DeckManager."""
+
+    async def test_loads_existing_decks(self, user_db: UserDatabase) -> None:
+        deck_id = await user_db.create_deck("Burn")
+        await user_db.add_card(deck_id, "Lightning Bolt", 4)
+        await user_db.add_card(deck_id, "Lightning Bolt", 2, sideboard=True)
+        manager = DeckManager(user_db, MagicMock())
+
+        assert not manager.usage.loaded
+        assert await manager.get_card_usage("Lightning Bolt") == [("Burn", 6)]
+        assert manager.usage.loaded
+        assert manager.usage.get_total("Lightning Bolt") == 6
+
+    async def test_card_changes_write_through(self, deck_manager: DeckManager) -> None:
+        names = ["Lightning Bolt", "Sol Ring"]
+        await deck_manager.get_card_usage("Sol Ring")  # Load before any change
+        burn = await deck_manager.create_deck("Burn")
+        ramp = await deck_manager.create_deck("Ramp")
+
+        await deck_manager.add_card(burn, "Lightning Bolt", 4)
+        await deck_manager.add_card(ramp, "Lightning Bolt", 1)
+        await deck_manager.add_card(ramp, "Sol Ring", 1, sideboard=True)
+        await _assert_matches_sql(deck_manager, names)
+
+        await deck_manager.set_quantity(burn, "Lightning Bolt", 3)
+        await deck_manager.move_to_mainboard(ramp, "Sol Ring")
+        await _assert_matches_sql(deck_manager, names)
+
+        await deck_manager.add_card(burn, "Lightning Bolt", 1, sideboard=True)
+        await deck_manager.move_to_sideboard(burn, "Lightning Bolt")
+        await _assert_matches_sql(deck_manager, names)
+        assert await deck_manager.get_card_usage("Lightning Bolt") == [("Burn", 4), ("Ramp", 1)]
+
+        await deck_manager.remove_card(ramp, "Lightning Bolt")
+        await deck_manager.set_quantity(ramp, "Sol Ring", 0)
+        await _assert_matches_sql(deck_manager, names)
+        assert await deck_manager.get_card_usage("Sol Ring") == []
+
+    async def test_set_quantity_of_missing_card_is_noop(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.get_card_usage("Sol Ring")
+
+        await deck_manager.set_quantity(deck_id, "Sol Ring", 2)
+
+        assert await deck_manager.get_card_usage("Sol Ring") == []
+        await _assert_matches_sql(deck_manager, ["Sol Ring"])
+
+    async def test_deck_rename_and_delete(self, deck_manager: DeckManager) -> None:
+        burn = await deck_manager.create_deck("Burn")
+        ramp = await deck_manager.create_deck("Ramp")
+        await deck_manager.add_card(burn, "Lightning Bolt", 4)
+        await deck_manager.add_card(ramp, "Lightning Bolt", 1)
+        await deck_manager.get_card_usage("Lightning Bolt")
+
+        await deck_manager.update_deck(burn, name="Zoo")
+        assert await deck_manager.get_card_usage("Lightning Bolt") == [("Ramp", 1), ("Zoo", 4)]
+
+        await deck_manager.delete_deck(ramp)
+        assert await deck_manager.get_card_usage("Lightning Bolt") == [("Zoo", 4)]
+        await _assert_matches_sql(deck_manager, ["Lightning Bolt"])
+
+    async def test_reload_sees_outside_changes(self, deck_manager: DeckManager) -> None:
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.get_card_usage("Lightning Bolt")
+        await deck_manager.user.add_card(deck_id, "Lightning Bolt", 4)  # Bypasses the manager
+
+        assert await deck_manager.get_card_usage("Lightning Bolt") == []
+        await deck_manager.usage.reload()
+        assert await deck_manager.get_card_usage("Lightning Bolt") == [("Burn", 4)]
+
+
+class TestCollectionManagerDeckUsage:
+    """Tests for CollectionManager reading deck usage from the shared index."""
+
+    async def test_availability_uses_index(
+        self, deck_manager: DeckManager, user_db: UserDatabase, tmp_path: Path
+    ) -> None:
+        collection = CollectionManager(
+            user_db,
+            deck_manager.db,
+            cache_path=tmp_path / "prices.json",
+            deck_usage=deck_manager.usage,
+        )
+        await user_db.add_to_collection("Lightning Bolt", quantity=8)
+        deck_id = await deck_manager.create_deck("Burn")
+        await deck_manager.add_card(deck_id, "Lightning Bolt", 4)
+
+        user_db.get_card_deck_usage = AsyncMock()  # type: ignore[method-assign]
+        assert await collection.get_card_availability("Lightning Bolt") == (
+            8,
+            4,
+            [("Burn", 4)],
+        )
+        user_db.get_card_deck_usage.assert_not_awaited()
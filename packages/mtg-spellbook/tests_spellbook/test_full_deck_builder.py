@@ -6,10 +6,11 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from textual.widgets import Input, ListView
+from textual.widgets import Input
 
-from mtg_spellbook.deck.full_builder import FullDeckBuilder, SearchResultItem
+from mtg_spellbook.deck.full_builder import FullDeckBuilder
 from mtg_spellbook.deck.quick_filter_bar import QuickFilterBar
+from mtg_spellbook.widgets import VirtualList
 
 if TYPE_CHECKING:
     from mtg_core.data.models.responses import CardSummary
@@ -112,6 +113,7 @@ def mock_mtg_database(sample_card_summary: CardSummary) -> Any:
     """Mock MTGDatabase for testing."""
     mock_db = AsyncMock()
     mock_db.search_cards = AsyncMock(return_value=([sample_card_summary], 1))
+    mock_db.search_card_rows = AsyncMock(return_value=([sample_card_summary], 1))
     return mock_db
 
 
@@ -144,7 +146,7 @@ class TestFullDeckBuilderLayout:
             # Verify key components exist
             assert builder.query_one("#builder-search-input", Input) is not None
             assert builder.query_one("#quick-filter-bar", QuickFilterBar) is not None
-            assert builder.query_one("#search-results", ListView) is not None
+            assert builder.query_one("#search-results", VirtualList) is not None
             assert builder.query_one("#builder-deck-editor") is not None
 
     @pytest.mark.asyncio
@@ -362,9 +364,8 @@ class TestFullDeckBuilderSearch:
             await pilot.pause()
 
             # Verify results are shown
-            results_list = builder.query_one("#search-results", ListView)
-            assert len(results_list.children) == 1
-            assert isinstance(results_list.children[0], SearchResultItem)
+            results_list = builder.query_one("#search-results", VirtualList)
+            assert list(results_list.rows) == [sample_card_summary]
 
 
 class TestFullDeckBuilderQuickAdd:
@@ -400,7 +401,7 @@ class TestFullDeckBuilderQuickAdd:
             await pilot.pause()
 
             # Focus and highlight the search results
-            results_list = builder.query_one("#search-results", ListView)
+            results_list = builder.query_one("#search-results", VirtualList)
             results_list.focus()
             results_list.index = 0
             await pilot.pause()
@@ -445,7 +446,7 @@ class TestFullDeckBuilderQuickAdd:
             await pilot.pause()
 
             # Focus and highlight the search results
-            results_list = builder.query_one("#search-results", ListView)
+            results_list = builder.query_one("#search-results", VirtualList)
             results_list.focus()
             results_list.index = 0
             await pilot.pause()
@@ -490,7 +491,7 @@ class TestFullDeckBuilderQuickAdd:
             await pilot.pause()
 
             # Focus and highlight the search results
-            results_list = builder.query_one("#search-results", ListView)
+            results_list = builder.query_one("#search-results", VirtualList)
             results_list.focus()
             results_list.index = 0
             await pilot.pause()
@@ -506,6 +507,103 @@ class TestFullDeckBuilderQuickAdd:
             )
 
 
+class TestFullDeckBuilderDeckChanges:
+    """Tests for applying deck edits to the editor without reloading the deck."""
+
+    @pytest.mark.asyncio
+    async def test_quick_add_patches_editor(
+        self,
+        sample_deck_with_cards: Any,
+        mock_deck_manager: Any,
+        mock_mtg_database: Any,
+    ) -> None:
+        """A quick add with a change updates the existing row in place."""
+        from dataclasses import replace
+
+        from textual.app import App, ComposeResult
+
+        from mtg_spellbook.deck_manager import AddCardResult, DeckChange
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                return []
+
+        bolt = sample_deck_with_cards.cards[0]
+        mock_deck_manager.add_card = AsyncMock(
+            return_value=AddCardResult(
+                success=True,
+                new_quantity=5,
+                change=DeckChange(1, "Lightning Bolt", {False: replace(bolt, quantity=5)}),
+            )
+        )
+
+        async with TestApp().run_test() as pilot:
+            builder = FullDeckBuilder(
+                deck=sample_deck_with_cards,
+                deck_manager=mock_deck_manager,
+                db=mock_mtg_database,
+            )
+            pilot.app.push_screen(builder)
+            await pilot.pause()
+            mainboard = builder.query_one("#mainboard-list", VirtualList)
+            assert mainboard.row_count == 1
+            mock_deck_manager.get_deck.reset_mock()
+
+            builder._quick_add("Lightning Bolt", 1, sideboard=False)
+            await pilot.pause()
+            await pilot.pause()
+
+            mock_deck_manager.get_deck.assert_not_awaited()
+            assert mainboard.row_count == 1
+            assert mainboard.rows[0].quantity == 5
+            assert sample_deck_with_cards.mainboard_count == 5
+
+    @pytest.mark.asyncio
+    async def test_new_card_rebuilds_lists(
+        self,
+        sample_deck_with_cards: Any,
+        mock_deck_manager: Any,
+        mock_mtg_database: Any,
+    ) -> None:
+        """A card new to a board is inserted by rebuilding the lists from the patched deck."""
+        from dataclasses import replace
+
+        from textual.app import App, ComposeResult
+
+        from mtg_spellbook.deck.editor_panel import DeckEditorPanel
+        from mtg_spellbook.deck_manager import DeckChange
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                return []
+
+        bolt = sample_deck_with_cards.cards[0]
+        async with TestApp().run_test() as pilot:
+            builder = FullDeckBuilder(
+                deck=sample_deck_with_cards,
+                deck_manager=mock_deck_manager,
+                db=mock_mtg_database,
+            )
+            pilot.app.push_screen(builder)
+            await pilot.pause()
+            editor = builder.query_one("#builder-deck-editor", DeckEditorPanel)
+
+            editor.apply_change(
+                DeckChange(
+                    1,
+                    "Lightning Bolt",
+                    {False: None, True: replace(bolt, is_sideboard=True, card=None)},
+                )
+            )
+            await pilot.pause()
+
+            assert builder.query_one("#mainboard-list", VirtualList).row_count == 0
+            side_rows = builder.query_one("#sideboard-list", VirtualList).rows
+            assert [(r.card_name, r.quantity) for r in side_rows] == [("Lightning Bolt", 4)]
+            # The moved entry keeps the card data loaded for the mainboard copy
+            assert sample_deck_with_cards.cards[0].card is bolt.card
+
+
 class TestFullDeckBuilderValidation:
     """Tests for deck validation in FullDeckBuilder."""
 
@@ -591,27 +689,26 @@ class TestFullDeckBuilderFilterIntegration:
                 # Note: May be called multiple times due to input and filter changes
 
 
-class TestSearchResultItem:
-    """Tests for SearchResultItem widget."""
+class TestSearchResultRows:
+    """Tests for how search results render in the builder's VirtualList."""
 
     @pytest.mark.asyncio
-    async def test_search_result_item_displays_card_info(
+    async def test_search_result_row_displays_card_info(
         self, sample_card_summary: CardSummary
     ) -> None:
-        """Test that SearchResultItem displays card name and mana cost."""
+        """Test that a search result row shows the card name."""
         from textual.app import App, ComposeResult
-        from textual.widgets import ListView
+
+        from mtg_spellbook.widgets.card_result_item import format_card_result
 
         class TestApp(App[None]):
             def compose(self) -> ComposeResult:
-                yield ListView(id="test-list")
+                yield VirtualList(format_card_result, row_height=2, id="test-list")
 
         async with TestApp().run_test() as pilot:
-            test_list = pilot.app.query_one("#test-list", ListView)
-            item = SearchResultItem(sample_card_summary)
-            test_list.append(item)
+            test_list = pilot.app.query_one("#test-list", VirtualList)
+            test_list.set_rows([sample_card_summary])
             await pilot.pause()
 
-            # The item should render with card name
-            assert item.card.name == "Lightning Bolt"
-            assert item.card.mana_cost == "{R}"
+            assert test_list.highlighted_row is sample_card_summary
+            assert "Lightning Bolt" in test_list.render_line(0).text
@@ -0,0 +1,102 @@
+"""Tests for the full-screen deck editor's card lists."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from textual.app import App
+
+from mtg_core.data.models.card import Card
+from mtg_spellbook.deck.full_screen import DeckCardAdapter, FullDeckScreen
+from mtg_spellbook.deck_manager import DeckCardWithData, DeckChange, DeckWithCards
+from mtg_spellbook.widgets import VirtualList
+
+
+def _row(name: str, quantity: int, *, sideboard: bool = False) -> DeckCardWithData:
+    return DeckCardWithData(
+        card_name=name,
+        quantity=quantity,
+        is_sideboard=sideboard,
+        is_commander=False,
+        set_code="m11",
+        collector_number="1",
+        card=Card(name=name, type="Instant", manaCost="{R}"),
+    )
+
+
+def _deck() -> DeckWithCards:
+    return DeckWithCards(
+        id=1,
+        name="Burn",
+        format="modern",
+        commander=None,
+        cards=[
+            _row("Shock", 4),
+            _row("Lightning Bolt", 4),
+            _row("Lava Spike", 2),
+            _row("Smash to Smithereens", 2, sideboard=True),
+        ],
+    )
+
+
+class DeckScreenApp(App[None]):
+    def __init__(self, manager: Any) -> None:
+        super().__init__()
+        self.manager = manager
+
+    def on_mount(self) -> None:
+        self.push_screen(FullDeckScreen(self.manager))
+
+
+@pytest.fixture
+def manager() -> Any:
+    manager = AsyncMock()
+    manager.list_decks = AsyncMock(return_value=[])
+    manager.get_deck = AsyncMock(side_effect=lambda _deck_id: _deck())
+    return manager
+
+
+class TestFullDeckScreenLists:
+    """The mainboard and sideboard are VirtualLists patched row by row on edits."""
+
+    @pytest.mark.asyncio
+    async def test_edits_patch_rows(self, manager: Any) -> None:
+        app = DeckScreenApp(manager)
+
+        async with app.run_test(size=(160, 50)) as pilot:
+            screen = app.screen
+            assert isinstance(screen, FullDeckScreen)
+            screen.current_deck_id = 1
+            await pilot.pause(0.2)
+
+            mainboard: VirtualList[DeckCardAdapter] = screen.query_one(
+                "#mainboard-list", VirtualList
+            )
+            sideboard: VirtualList[DeckCardAdapter] = screen.query_one(
+                "#sideboard-list", VirtualList
+            )
+            assert [row.name for row in mainboard.rows] == ["Lava Spike", "Lightning Bolt", "Shock"]
+            assert [row.name for row in sideboard.rows] == ["Smash to Smithereens"]
+
+            mainboard.focus()
+            mainboard.index = 1
+            await pilot.pause()
+            manager.set_quantity = AsyncMock(
+                return_value=DeckChange(1, "Lightning Bolt", {False: _row("Lightning Bolt", 3)})
+            )
+            await pilot.press("minus")
+            await pilot.pause(0.2)
+            manager.set_quantity.assert_awaited_once_with(1, "Lightning Bolt", 3, False)
+            assert mainboard.row_count == 3
+            assert mainboard.rows[1].quantity == 3
+
+            manager.remove_card = AsyncMock(
+                return_value=DeckChange(1, "Lightning Bolt", {False: None})
+            )
+            await pilot.press("delete")
+            await pilot.pause(0.2)
+            assert [row.name for row in mainboard.rows] == ["Lava Spike", "Shock"]
+            assert screen._current_deck is not None
+            assert screen._current_deck.mainboard_count == 6
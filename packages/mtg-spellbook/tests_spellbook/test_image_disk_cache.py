@@ -0,0 +1,186 @@
+"""Tests for the SQLite-indexed image disk cache."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+from PIL import Image
+
+from mtg_spellbook.widgets.art_navigator.disk_cache import (
+    INDEX_FILENAME,
+    LEGACY_METADATA_FILENAME,
+    ImageDiskCache,
+    url_hash,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def image() -> Image.Image:
+    """Small solid-color test image."""
+    return Image.new("RGB", (32, 44), color=(200, 40, 40))
+
+
+@pytest.fixture
+def disk_cache(tmp_path: Path) -> Iterator[ImageDiskCache]:
+    """Disk cache in a temp directory with a generous size limit."""
+    cache = ImageDiskCache(tmp_path / "images", max_bytes=10 * 1024 * 1024)
+    yield cache
+    cache.close()
+
+
+def _index_rows(cache_dir: Path) -> dict[str, float]:
+    conn = sqlite3.connect(cache_dir / INDEX_FILENAME)
+    try:
+        return dict(conn.execute("SELECT url_hash, last_access FROM entries").fetchall())
+    finally:
+        conn.close()
+
+
+class TestImageDiskCache:
+    """Tests for ImageDiskCache."""
+
+    def test_put_then_get(self, disk_cache: ImageDiskCache, image: Image.Image) -> None:
+        """Saved images are readable and counted in the stats."""
+        disk_cache.put("https://example.com/a.jpg", image)
+
+        loaded = disk_cache.get("https://example.com/a.jpg")
+        assert loaded is not None
+        assert loaded.size == image.size
+        stats = disk_cache.stats()
+        assert stats["files"] == 1
+        assert stats["bytes"] > 0
+
+    def test_get_missing_returns_none(self, disk_cache: ImageDiskCache) -> None:
+        """Unknown URLs are cache misses."""
+        assert disk_cache.get("https://example.com/missing.jpg") is None
+
+    def test_hits_are_buffered_not_written(self, tmp_path: Path, image: Image.Image) -> None:
+        """Disk hits do not touch the index until a flush."""
+        cache = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024, flush_interval=3600)
+        cache.put("https://example.com/a.jpg", image)
+        before = _index_rows(tmp_path)[url_hash("https://example.com/a.jpg")]
+
+        cache.get("https://example.com/a.jpg")
+        assert _index_rows(tmp_path)[url_hash("https://example.com/a.jpg")] == before
+
+        cache.flush()
+        assert _index_rows(tmp_path)[url_hash("https://example.com/a.jpg")] >= before
+        cache.close()
+
+    def test_flush_after_batch_size(self, tmp_path: Path, image: Image.Image) -> None:
+        """Reaching the batch size flushes access times without an explicit call."""
+        cache = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024, flush_batch=2)
+        urls = [f"https://example.com/{i}.jpg" for i in range(2)]
+        for url in urls:
+            cache.put(url, image)
+        assert cache._pending == {}
+
+        for url in urls:
+            cache.get(url)
+        assert cache._pending == {}
+        cache.close()
+
+    def test_eviction_keeps_recently_used(self, tmp_path: Path, image: Image.Image) -> None:
+        """Eviction removes least recently used entries and keeps recent hits."""
+        cache = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        cache.put("https://example.com/0.jpg", image)
+        entry_size = cache.stats()["bytes"]
+        cache.max_bytes = entry_size * 3
+
+        cache.put("https://example.com/1.jpg", image)
+        cache.put("https://example.com/2.jpg", image)
+        cache.get("https://example.com/0.jpg")
+        cache.put("https://example.com/3.jpg", image)
+
+        assert cache.get("https://example.com/0.jpg") is not None
+        assert cache.get("https://example.com/1.jpg") is None
+        assert cache.stats()["bytes"] <= cache.max_bytes
+        cache.close()
+
+    def test_totals_survive_reopen(self, tmp_path: Path, image: Image.Image) -> None:
+        """Running totals are rebuilt from the index on reopen."""
+        cache = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        cache.put("https://example.com/a.jpg", image)
+        cache.put("https://example.com/b.jpg", image)
+        stats = cache.stats()
+        cache.close()
+
+        reopened = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        assert reopened.stats() == stats
+        reopened.close()
+
+    def test_clear(self, disk_cache: ImageDiskCache, image: Image.Image) -> None:
+        """Clearing removes files and resets the totals."""
+        disk_cache.put("https://example.com/a.jpg", image)
+        disk_cache.clear()
+
+        assert disk_cache.get("https://example.com/a.jpg") is None
+        assert disk_cache.stats() == {"files": 0, "bytes": 0}
+
+    def test_imports_legacy_metadata(self, tmp_path: Path, image: Image.Image) -> None:
+        """Entries from the old JSON metadata file are migrated into the index."""
+        stem = url_hash("https://example.com/legacy.jpg")
+        image.save(tmp_path / f"{stem}.png", "PNG")
+        size = (tmp_path / f"{stem}.png").stat().st_size
+        (tmp_path / LEGACY_METADATA_FILENAME).write_text(
+            json.dumps(
+                {
+                    "files": {
+                        stem: {"url": "legacy", "size": size, "last_access": 1.0},
+                        "gone": {"url": "gone", "size": 99, "last_access": 1.0},
+                    },
+                    "total_bytes": size + 99,
+                }
+            )
+        )
+
+        cache = ImageDiskCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        assert cache.stats() == {"files": 1, "bytes": size}
+        assert not (tmp_path / LEGACY_METADATA_FILENAME).exists()
+        assert cache.get("https://example.com/legacy.jpg") is not None
+        cache.close()
+
+    def test_corrupted_file_is_removed(self, disk_cache: ImageDiskCache) -> None:
+        """Unreadable cache files are deleted and treated as misses."""
+        disk_cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = disk_cache.cache_dir / f"{url_hash('https://example.com/bad.jpg')}.webp"
+        path.write_bytes(b"not an image")
+
+        assert disk_cache.get("https://example.com/bad.jpg") is None
+        assert not path.exists()
+
+    def test_corrupted_file_leaves_index(
+        self, disk_cache: ImageDiskCache, image: Image.Image
+    ) -> None:
+        """Dropping a corrupted file also drops its entry from the index and totals."""
+        disk_cache.put("https://example.com/a.jpg", image)
+        disk_cache.put("https://example.com/b.jpg", image)
+        size = disk_cache.stats()["bytes"] // 2
+        path = disk_cache.cache_dir / f"{url_hash('https://example.com/a.jpg')}.webp"
+        path.write_bytes(b"not an image")
+
+        assert disk_cache.get("https://example.com/a.jpg") is None
+        assert disk_cache.stats() == {"files": 1, "bytes": size}
+        assert list(_index_rows(disk_cache.cache_dir)) == [url_hash("https://example.com/b.jpg")]
+
+    def test_failed_save_leaves_no_temp_file(
+        self, disk_cache: ImageDiskCache, image: Image.Image, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A save that fails part way is swallowed and its temp file removed."""
+
+        def failing_save(path: Path, *_args: object, **_kwargs: object) -> None:
+            path.write_bytes(b"partial")
+            raise ValueError("unsupported mode")
+
+        monkeypatch.setattr(image, "save", failing_save)
+        disk_cache.put("https://example.com/a.jpg", image)
+
+        assert list(disk_cache.cache_dir.iterdir()) == []
+        assert disk_cache.stats() == {"files": 0, "bytes": 0}
@@ -0,0 +1,163 @@
+"""Tests for tiered card image loading in the art navigator."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+import mtg_spellbook.widgets.art_navigator.image_loader as image_loader
+from mtg_core.config import Settings
+from mtg_spellbook.widgets.art_navigator.image_loader import (
+    ImageTier,
+    _tier_key,
+    _variant_url,
+    get_card_image,
+    load_card_image,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+CARD_URL = "https://cards.scryfall.io/normal/front/a/b/abc.jpg?1700000000"
+
+
+@pytest.fixture
+async def isolated_cache(tmp_path: Path) -> AsyncIterator[None]:
+    """Point the image caches at a temp directory and start empty."""
+    import mtg_core.config as config_module
+
+    original = config_module._settings
+    config_module._settings = Settings(image_cache_dir=tmp_path / "images")
+    image_loader._memory_cache.clear()
+    yield
+    image_loader.close_disk_cache()
+    image_loader._memory_cache.clear()
+    config_module._settings = original
+
+
+def _mock_client(size: tuple[int, int], requested: list[str]) -> MagicMock:
+    """HTTP client returning a PNG of the given size and recording URLs."""
+    buffer = BytesIO()
+    Image.new("RGB", size, color=(10, 20, 30)).save(buffer, format="PNG")
+    response = MagicMock()
+    response.content = buffer.getvalue()
+    response.raise_for_status = MagicMock()
+
+    client = MagicMock()
+
+    async def get(url: str, timeout: float | None = None) -> MagicMock:  # noqa: ARG001
+        requested.append(url)
+        return response
+
+    client.get = get
+    return client
+
+
+class TestUrlVariants:
+    """Tests for Scryfall URL rewriting."""
+
+    def test_rewrites_size_segment(self) -> None:
+        assert _variant_url(CARD_URL, "small") == CARD_URL.replace("/normal/", "/small/")
+        assert _variant_url(CARD_URL, "large") == CARD_URL.replace("/normal/", "/large/")
+
+    def test_leaves_art_crop_unchanged(self) -> None:
+        url = "https://cards.scryfall.io/art_crop/front/a/b/abc.jpg"
+        assert _variant_url(url, "large") == url
+
+    def test_tier_keys_share_a_base(self) -> None:
+        small = CARD_URL.replace("/normal/", "/small/")
+        assert _tier_key(CARD_URL, ImageTier.THUMB) == _tier_key(small, ImageTier.THUMB)
+        assert _tier_key(CARD_URL, ImageTier.LARGE) == _variant_url(CARD_URL, "large")
+        assert len({_tier_key(CARD_URL, tier) for tier in ImageTier}) == len(ImageTier)
+
+    def test_larger_tiers(self) -> None:
+        assert ImageTier.THUMB.larger() == [ImageTier.CARD, ImageTier.LARGE]
+        assert ImageTier.LARGE.larger() == []
+
+
+@pytest.mark.usefixtures("isolated_cache")
+class TestTieredLoading:
+    """Tests for get_card_image and load_card_image."""
+
+    async def test_thumb_fetches_small_variant(self) -> None:
+        requested: list[str] = []
+        client = _mock_client((146, 204), requested)
+
+        async def get_client() -> MagicMock:
+            return client
+
+        with patch.object(image_loader, "_get_http_client", get_client):
+            img = await get_card_image(CARD_URL, ImageTier.THUMB)
+
+        assert requested == [CARD_URL.replace("/normal/", "/small/")]
+        assert img.size == (146, 204)
+
+    async def test_thumb_derived_from_cached_large(self) -> None:
+        requested: list[str] = []
+        client = _mock_client((672, 936), requested)
+
+        async def get_client() -> MagicMock:
+            return client
+
+        with patch.object(image_loader, "_get_http_client", get_client):
+            await get_card_image(CARD_URL, ImageTier.LARGE)
+            thumb = await get_card_image(CARD_URL, ImageTier.THUMB)
+
+        assert len(requested) == 1
+        assert thumb.width <= ImageTier.THUMB.max_width
+        assert thumb.height <= ImageTier.THUMB.max_height
+
+    async def test_derived_from_disk_after_memory_eviction(self) -> None:
+        requested: list[str] = []
+        client = _mock_client((672, 936), requested)
+
+        async def get_client() -> MagicMock:
+            return client
+
+        with patch.object(image_loader, "_get_http_client", get_client):
+            await get_card_image(CARD_URL, ImageTier.LARGE)
+            image_loader._memory_cache.clear()
+            await get_card_image(CARD_URL, ImageTier.CARD)
+
+        assert len(requested) == 1
+
+    async def test_load_card_image_sets_widget(self) -> None:
+        requested: list[str] = []
+        client = _mock_client((146, 204), requested)
+        widget = MagicMock()
+        widget.loading = False
+
+        async def get_client() -> MagicMock:
+            return client
+
+        with patch.object(image_loader, "_get_http_client", get_client):
+            result = await load_card_image(CARD_URL, widget, tier=ImageTier.THUMB)
+
+        assert result is True
+        assert widget.image.size == (146, 204)
+        assert widget.loading is False
+
+    async def test_load_card_image_failure(self) -> None:
+        import httpx
+
+        widget = MagicMock()
+        client = MagicMock()
+
+        async def failing_get(url: str, timeout: float | None = None) -> None:  # noqa: ARG001
+            raise httpx.ConnectError("offline")
+
+        client.get = failing_get
+
+        async def get_client() -> MagicMock:
+            return client
+
+        with patch.object(image_loader, "_get_http_client", get_client):
+            result = await load_card_image(CARD_URL, widget, tier=ImageTier.CARD)
+
+        assert result is False
+        assert widget.loading is False
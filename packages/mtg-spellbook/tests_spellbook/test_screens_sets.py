@@ -2,15 +2,61 @@
 
 from __future__ import annotations
 
+import json
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
 from textual.widgets import Input
 
+from mtg_core.data.database import CardSummaryRow
 from mtg_core.data.models import Set
-from mtg_core.data.models.responses import CardDetail, Prices, SetsResponse, SetSummary
+from mtg_core.data.models.responses import (
+    CardDetail,
+    Prices,
+    SetsResponse,
+    SetStats,
+    SetSummary,
+)
 from mtg_spellbook.app import MTGSpellbook
-from mtg_spellbook.screens.sets import SetsScreen
+from mtg_spellbook.screens.sets import SetsScreen, _search_tokens
+from mtg_spellbook.widgets.set_detail import SetCardList
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+
+def _set_cards(cards: list[CardDetail]) -> Callable[..., AsyncIterator[list[CardSummaryRow]]]:
+    """Mock UnifiedDatabase.get_set_cards, streaming ``cards`` one per batch."""
+    rows = [
+        CardSummaryRow(
+            uuid=card.uuid or "",
+            name=card.name,
+            flavor_name=None,
+            mana_cost=card.mana_cost,
+            cmc=card.cmc,
+            type=card.type,
+            colors_json=json.dumps(card.colors),
+            color_identity_json=json.dumps(card.color_identity),
+            rarity=card.rarity,
+            set_code=card.set_code,
+            number=card.number,
+            keywords_json=json.dumps(card.keywords),
+            power=card.power,
+            toughness=card.toughness,
+            image_normal=None,
+            image_small=None,
+            price_usd=None,
+            purchase_tcgplayer=None,
+        )
+        for card in cards
+    ]
+
+    async def get_set_cards(_code: str, **_kwargs: object) -> AsyncIterator[list[CardSummaryRow]]:
+        for row in rows:
+            yield [row]
+
+    return get_set_cards
 
 
 @pytest.fixture
@@ -128,6 +174,23 @@ class TestSetsScreen:
                 search_input.value = "alpha"
                 await pilot.pause(0.3)
 
+                assert screen.filtered_count == 1
+
+    def test_prefix_search(self, sample_sets_list: list[SetSummary]) -> None:
+        """Query words match prefixes of the set code, name and name words."""
+        screen = SetsScreen(db=None)
+        screen._search_index = [(s, _search_tokens(s)) for s in sample_sets_list]
+
+        def codes(query: str) -> list[str]:
+            return [s.code for s in screen._filter_sets(query)]
+
+        assert codes("le") == ["lea", "leb"]
+        assert codes("lim al") == ["lea"]
+        assert codes("MACH") == ["mom"]
+        assert codes("phyrexia: all") == ["one"]
+        assert codes("lpha") == []  # Prefixes only
+        assert len(codes("")) == len(sample_sets_list)
+
     @pytest.mark.asyncio
     async def test_select_set(
         self,
@@ -143,9 +206,10 @@ class TestSetsScreen:
             result = SetsResponse(sets=sample_sets_list)
 
             mock_mtg_database.get_set = AsyncMock(return_value=sample_set_model)
-            mock_mtg_database.search_cards = AsyncMock(
-                return_value=(sample_set_cards, len(sample_set_cards))
+            mock_mtg_database.get_set_stats = AsyncMock(
+                return_value=SetStats(set_code="lea", total_cards=len(sample_set_cards))
             )
+            mock_mtg_database.get_set_cards = _set_cards(sample_set_cards)
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr("mtg_core.tools.sets.get_sets", AsyncMock(return_value=result))
@@ -156,6 +220,10 @@ class TestSetsScreen:
                 screen.action_select()
                 await pilot.pause(0.3)
 
+                card_list = screen.query_one("#set-card-list", SetCardList)
+                assert [c.name for c in card_list._all_cards] == ["Black Lotus", "Lightning Bolt"]
+                assert card_list.get_current_card() is not None
+
     @pytest.mark.asyncio
     async def test_focus_search(
         self, mock_mtg_database, sample_sets_list: list[SetSummary]
@@ -193,9 +261,10 @@ class TestSetsScreen:
             result = SetsResponse(sets=sample_sets_list)
 
             mock_mtg_database.get_set = AsyncMock(return_value=sample_set_model)
-            mock_mtg_database.search_cards = AsyncMock(
-                return_value=(sample_set_cards, len(sample_set_cards))
+            mock_mtg_database.get_set_stats = AsyncMock(
+                return_value=SetStats(set_code="lea", total_cards=len(sample_set_cards))
             )
+            mock_mtg_database.get_set_cards = _set_cards(sample_set_cards)
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr("mtg_core.tools.sets.get_sets", AsyncMock(return_value=result))
@@ -469,9 +538,10 @@ class TestSetsScreenEdgeCases:
             result = SetsResponse(sets=sample_sets_list)
 
             mock_mtg_database.get_set = AsyncMock(return_value=sample_set_model)
-            mock_mtg_database.search_cards = AsyncMock(
-                return_value=(sample_set_cards, len(sample_set_cards))
+            mock_mtg_database.get_set_stats = AsyncMock(
+                return_value=SetStats(set_code="lea", total_cards=len(sample_set_cards))
             )
+            mock_mtg_database.get_set_cards = _set_cards(sample_set_cards)
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr("mtg_core.tools.sets.get_sets", AsyncMock(return_value=result))
@@ -504,9 +574,10 @@ class TestSetsScreenEdgeCases:
             result = SetsResponse(sets=sample_sets_list)
 
             mock_mtg_database.get_set = AsyncMock(return_value=sample_set_model)
-            mock_mtg_database.search_cards = AsyncMock(
-                return_value=(sample_set_cards, len(sample_set_cards))
+            mock_mtg_database.get_set_stats = AsyncMock(
+                return_value=SetStats(set_code="lea", total_cards=len(sample_set_cards))
             )
+            mock_mtg_database.get_set_cards = _set_cards(sample_set_cards)
 
             with pytest.MonkeyPatch.context() as m:
                 m.setattr("mtg_core.tools.sets.get_sets", AsyncMock(return_value=result))
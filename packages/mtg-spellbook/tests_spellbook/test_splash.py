@@ -0,0 +1,63 @@
+"""Tests for the database the splash screen builds on first run."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from mtg_spellbook.splash import SplashScreen
+
+
+def _scryfall_card(name: str, number: str, rarity: str = "common") -> dict[str, Any]:
+    return {
+        "id": f"m19-{number}",
+        "oracle_id": f"oracle-{name}",
+        "name": name,
+        "layout": "normal",
+        "cmc": 1.0,
+        "colors": ["R"],
+        "type_line": "Instant",
+        "oracle_text": f"{name} deals 3 damage to any target.",
+        "set": "m19",
+        "set_name": "Core Set 2019",
+        "rarity": rarity,
+        "collector_number": number,
+        "released_at": "2018-07-13",
+        "prices": {"usd": "0.25"},
+    }
+
+
+def _write_json(path: Path, data: Any) -> Path:
+    path.write_text(json.dumps(data))
+    return path
+
+
+class TestBuildUnifiedDatabase:
+    """The in-app build produces the same ingest-time indexes as create_mtg_db."""
+
+    def test_builds_set_index(self, tmp_path: Path) -> None:
+        cards = [_scryfall_card("Shock", "156"), _scryfall_card("Lightning Bolt", "2", "uncommon")]
+        sets = [{"code": "m19", "name": "Core Set 2019", "released_at": "2018-07-13"}]
+        output = tmp_path / "mtg.sqlite"
+
+        counts = SplashScreen()._build_unified_db_sync(
+            output,
+            _write_json(tmp_path / "cards.json", cards),
+            _write_json(tmp_path / "sets.json", sets),
+            _write_json(tmp_path / "rulings.json", []),
+        )
+
+        assert counts == (2, 1, 0)
+        with sqlite3.connect(output) as conn:
+            numbers = conn.execute(
+                "SELECT collector_number FROM set_cards c JOIN cards USING (id)"
+                " WHERE c.set_code = 'm19' ORDER BY c.position"
+            ).fetchall()
+            stats = conn.execute(
+                "SELECT card_count FROM set_stats WHERE set_code = 'm19'"
+            ).fetchone()
+        conn.close()
+        assert numbers == [("2",), ("156",)]
+        assert stats == (2,)
@@ -0,0 +1,33 @@
+"""Tests for the --profile-startup timing breakdown."""
+
+from __future__ import annotations
+
+from mtg_spellbook.startup import StartupProfiler
+
+
+class TestStartupProfiler:
+    """StartupProfiler records imports and stages only when enabled."""
+
+    def test_disabled_records_nothing(self) -> None:
+        profiler = StartupProfiler()
+        profiler.import_module("json")
+        with profiler.stage("open database"):
+            pass
+        profiler.mark("dashboard ready")
+
+        assert "json" not in profiler.report()
+        assert "open database" not in profiler.report()
+
+    def test_report_lists_imports_and_stages(self) -> None:
+        profiler = StartupProfiler()
+        profiler.enable()
+        profiler.import_module("json")
+        with profiler.stage("open database"):
+            pass
+        profiler.mark("dashboard ready")
+
+        report = profiler.report()
+        assert "json" in report
+        assert "open database" in report
+        assert "dashboard ready" in report
+        assert report.index("open database") < report.index("dashboard ready")
@@ -0,0 +1,246 @@
+"""Tests for the VirtualList widget."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from textual.app import App, ComposeResult
+
+from mtg_spellbook.widgets.results_list import ResultsList
+from mtg_spellbook.widgets.virtual_list import VirtualList
+
+
+@dataclass
+class Row:
+    name: str
+    qty: int = 1
+
+
+class CountingFormatter:
+    """Row formatter that records which rows were rendered."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, row: Row) -> str:
+        self.calls.append(row.name)
+        return f"{row.qty}x {row.name}\n[dim]second line[/]"
+
+
+class VirtualListApp(App[None]):
+    """Host app that records highlight messages."""
+
+    def __init__(self, formatter: CountingFormatter) -> None:
+        super().__init__()
+        self.formatter = formatter
+        self.highlighted: list[int] = []
+
+    def compose(self) -> ComposeResult:
+        yield VirtualList(self.formatter, row_height=2, empty_text="Nothing here", id="rows")
+
+    def on_virtual_list_highlighted(self, event: VirtualList.Highlighted) -> None:
+        self.highlighted.append(event.index)
+
+
+def _rows(count: int) -> list[Row]:
+    return [Row(f"Card {i:05d}") for i in range(count)]
+
+
+class TestVirtualList:
+    """Tests for rendering, navigation and incremental edits."""
+
+    @pytest.mark.asyncio
+    async def test_large_list_formats_only_visible_rows(self) -> None:
+        """Setting 20k rows formats only what fits on screen."""
+        formatter = CountingFormatter()
+        app = VirtualListApp(formatter)
+
+        async with app.run_test(size=(60, 20)) as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(_rows(20_000))
+            await pilot.pause()
+
+            assert vlist.row_count == 20_000
+            assert vlist.virtual_size.height == 40_000
+            assert 0 < len(set(formatter.calls)) <= 20
+
+    @pytest.mark.asyncio
+    async def test_jump_to_end_and_back(self) -> None:
+        """End/Home jump anywhere without walking through the rows."""
+        formatter = CountingFormatter()
+        app = VirtualListApp(formatter)
+
+        async with app.run_test(size=(60, 20)) as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(_rows(5_000))
+            vlist.focus()
+            await pilot.pause()
+
+            await pilot.press("end")
+            await pilot.pause()
+            assert vlist.index == 4_999
+            assert vlist.scroll_offset.y > 0
+            assert "Card 04999" in formatter.calls
+
+            await pilot.press("home")
+            await pilot.pause()
+            assert vlist.index == 0
+            assert vlist.scroll_offset.y == 0
+            assert app.highlighted[-3:] == [0, 4_999, 0]
+
+    @pytest.mark.asyncio
+    async def test_cursor_keys_move_highlight(self) -> None:
+        """Up/down move the cursor and clamp at the ends."""
+        app = VirtualListApp(CountingFormatter())
+
+        async with app.run_test() as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(_rows(3))
+            vlist.focus()
+
+            await pilot.press("down", "down", "down")
+            assert vlist.index == 2
+            await pilot.press("up")
+            assert vlist.index == 1
+            assert vlist.highlighted_row == Row("Card 00001")
+
+    @pytest.mark.asyncio
+    async def test_update_row_rerenders_only_that_row(self) -> None:
+        """Editing one row reformats it without touching the others."""
+        formatter = CountingFormatter()
+        app = VirtualListApp(formatter)
+
+        async with app.run_test() as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(_rows(10))
+            await pilot.pause()
+            formatter.calls.clear()
+
+            vlist.update_row(3, Row("Card 00003", qty=4))
+            await pilot.pause()
+
+            assert formatter.calls == ["Card 00003"]
+            assert vlist.rows[3].qty == 4
+
+    @pytest.mark.asyncio
+    async def test_insert_and_remove_keep_cursor_on_row(self) -> None:
+        """Edits above the cursor keep the same row highlighted."""
+        app = VirtualListApp(CountingFormatter())
+
+        async with app.run_test():
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(_rows(5), index=2)
+
+            vlist.insert_row(0, Row("New"))
+            assert vlist.highlighted_row == Row("Card 00002")
+
+            vlist.remove_row(0)
+            assert vlist.highlighted_row == Row("Card 00002")
+
+            vlist.remove_row(2)
+            assert vlist.index == 2
+            assert vlist.highlighted_row == Row("Card 00003")
+
+    @pytest.mark.asyncio
+    async def test_empty_list_shows_placeholder(self) -> None:
+        """An empty list renders its empty text and has no highlight."""
+        app = VirtualListApp(CountingFormatter())
+
+        async with app.run_test() as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows([])
+            await pilot.pause()
+
+            assert vlist.index is None
+            assert vlist.highlighted_row is None
+            assert "Nothing here" in vlist.render_line(0).text
+
+
+class PagedListApp(VirtualListApp):
+    """Host app that serves rows 100 at a time when the list asks for more."""
+
+    def __init__(self, formatter: CountingFormatter, total: int) -> None:
+        super().__init__(formatter)
+        self.source = _rows(total)
+        self.requests = 0
+
+    def on_virtual_list_more_rows_needed(self, event: VirtualList.MoreRowsNeeded) -> None:
+        self.requests += 1
+        loaded = event.virtual_list.row_count
+        window = self.source[loaded : loaded + 100]
+        event.virtual_list.append_rows(window, has_more=loaded + 100 < len(self.source))
+
+
+class TestVirtualListPaging:
+    """Tests for loading rows a window at a time."""
+
+    @pytest.mark.asyncio
+    async def test_loads_next_window_only_near_end(self) -> None:
+        """More rows are requested when the cursor nears the last loaded row."""
+        app = PagedListApp(CountingFormatter(), total=250)
+
+        async with app.run_test(size=(60, 20)) as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(app.source[:100], has_more=True)
+            vlist.focus()
+            await pilot.pause()
+            assert (app.requests, vlist.row_count) == (0, 100)
+
+            vlist.index = 95
+            await pilot.pause()
+            assert (app.requests, vlist.row_count) == (1, 200)
+            assert vlist.index == 95
+            assert vlist.highlighted_row == Row("Card 00095")
+
+            await pilot.press("end")
+            await pilot.pause()
+            await pilot.press("end")
+            await pilot.pause()
+            assert (app.requests, vlist.row_count) == (2, 250)
+            assert not vlist.has_more
+            assert vlist.index == 249
+
+    @pytest.mark.asyncio
+    async def test_set_rows_resets_paging(self) -> None:
+        """Replacing the rows starts a new paged list."""
+        app = PagedListApp(CountingFormatter(), total=250)
+
+        async with app.run_test(size=(60, 20)) as pilot:
+            vlist = app.query_one("#rows", VirtualList)
+            vlist.set_rows(app.source[:5], has_more=True)  # Less than a screen: load at once
+            await pilot.pause()
+            assert app.requests == 1
+            assert vlist.row_count == 105
+
+            vlist.set_rows(app.source[:100])
+            await pilot.pause()
+            vlist.index = 99
+            await pilot.pause()
+            assert app.requests == 1
+
+
+class ResultsListApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield ResultsList(id="results")
+
+
+class TestResultsList:
+    """Tests for the search results list built on VirtualList."""
+
+    @pytest.mark.asyncio
+    async def test_card_rows_and_plain_lines(self) -> None:
+        """Card results are two lines and highlighted; plain lines are one line."""
+        app = ResultsListApp()
+
+        async with app.run_test(size=(60, 20)) as pilot:
+            results = app.query_one("#results", ResultsList)
+            results.show(["[bold]Shock[/]\n   Instant", "[bold]Opt[/]\n   Instant"])
+            await pilot.pause()
+            assert (results.row_count, results.virtual_size.height) == (2, 4)
+            assert results.index == 0
+
+            results.show_lines(["Set details", "", "Cards: 280"])
+            await pilot.pause()
+            assert (results.row_count, results.virtual_size.height) == (3, 3)
+            assert results.index is None